@@ -0,0 +1,49 @@
+//! Code Mode runs from a cold runtime and from the warm pool.
+
+use yarr::{ServiceConfig, ServiceKind, YarrClient, YarrConfig, YarrService};
+
+use super::service;
+use crate::harness::{BatchSize, Harness};
+
+pub fn bench(h: &mut Harness) {
+    let runtime = tokio::runtime::Runtime::new().expect("tokio runtime");
+    let code = "async () => 1";
+
+    let mut group = h.benchmark_group("codemode");
+    group.sample_size(20);
+    // A fresh service has an empty warm pool, so every run prepares its runtime
+    // (preamble evaluation included) inline.
+    group.bench_function("run/cold_start", |b| {
+        b.iter_batched(
+            codemode_service,
+            |service| runtime.block_on(service.codemode(code)),
+            BatchSize::PerIteration,
+        )
+    });
+    let warm = codemode_service();
+    group.bench_function("run/warm_pool", |b| {
+        b.iter(|| runtime.block_on(warm.codemode(code)))
+    });
+    group.finish();
+}
+
+fn codemode_service() -> YarrService {
+    let config = YarrConfig {
+        services: [
+            ServiceKind::Sonarr,
+            ServiceKind::Radarr,
+            ServiceKind::Prowlarr,
+            ServiceKind::Overseerr,
+            ServiceKind::Plex,
+            ServiceKind::Jellyfin,
+        ]
+        .into_iter()
+        .map(|kind| ServiceConfig {
+            base_url: "http://localhost:1".into(),
+            ..service(kind)
+        })
+        .collect(),
+    };
+    let client = YarrClient::new(&config).expect("client builds");
+    YarrService::new(client, config)
+}
@@ -0,0 +1,39 @@
+//! JSON log file throughput, rotation and compression included.
+
+use std::hint::black_box;
+
+use serde_json::json;
+use yarr::bench::LogWriter;
+
+use crate::harness::{Harness, Throughput};
+
+pub fn bench(h: &mut Harness) {
+    // Below the ring's event bound, so nothing is dropped.
+    const EVENTS: u64 = 5_000;
+    let line = format!(
+        "{}\n",
+        json!({
+            "timestamp": "2026-05-13T14:32:01.123456Z",
+            "level": "DEBUG",
+            "fields": {"message": "upstream request", "service": "sonarr", "status": 200, "elapsed_ms": 12},
+            "target": "yarr::yarr::transport",
+            "span": {"name": "codemode", "run_id": "6f1c2a"},
+        })
+    );
+    let home = tempfile::tempdir().expect("tempdir");
+    let writer = LogWriter::open(home.path().join("bench.log")).expect("log writer");
+
+    let mut group = h.benchmark_group("logging");
+    group.throughput(Throughput::Elements(EVENTS));
+    // Emitting and waiting until the batch is on disk; rotation and background
+    // compression kick in every few iterations.
+    group.bench_function("file_writer/5k_events", |b| {
+        b.iter(|| {
+            for _ in 0..EVENTS {
+                writer.event(black_box(line.as_bytes()));
+            }
+            writer.wait_written();
+        })
+    });
+    group.finish();
+}
@@ -0,0 +1,21 @@
+//! The benchmark groups of `benches/hot_paths.rs`, one module each, and the
+//! fixtures they share.
+
+use yarr::{ServiceConfig, ServiceKind};
+
+pub mod codemode;
+pub mod logging;
+pub mod operations;
+pub mod responses;
+pub mod startup;
+pub mod transport;
+
+fn service(kind: ServiceKind) -> ServiceConfig {
+    ServiceConfig {
+        name: kind.as_str().into(),
+        kind,
+        base_url: "http://media.local:8989/prefix".into(),
+        api_key: Some("0123456789abcdef0123456789abcdef".into()),
+        ..ServiceConfig::default()
+    }
+}
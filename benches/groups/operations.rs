@@ -0,0 +1,39 @@
+//! Parameter serialization for generated operations.
+
+use std::hint::black_box;
+
+use serde_json::{Map, Value, json};
+use yarr::ServiceKind;
+use yarr::bench::prepare_parameters;
+use yarr::openapi::{ParameterStyle, operations_for_kind};
+
+use crate::harness::Harness;
+
+pub fn bench(h: &mut Harness) {
+    let widest = operations_for_kind(ServiceKind::Jellyfin)
+        .iter()
+        .max_by_key(|spec| spec.parameters.len())
+        .expect("jellyfin has generated operations");
+    let args = operation_args(widest.parameters);
+
+    let mut group = h.benchmark_group("openapi");
+    group.bench_function("prepare_parameters/jellyfin_widest", |b| {
+        b.iter(|| prepare_parameters(widest, black_box(&args)))
+    });
+    group.finish();
+}
+
+/// Argument values for every parameter of `params`, shaped for each one's style.
+fn operation_args(params: &[yarr::openapi::ParameterSpec]) -> Map<String, Value> {
+    params
+        .iter()
+        .map(|parameter| {
+            let value = match parameter.style {
+                ParameterStyle::DeepObject => json!({"key": "value"}),
+                _ if parameter.schema_json()["type"] == "array" => json!(["a", "b", "c"]),
+                _ => json!("value"),
+            };
+            (parameter.name.to_owned(), value)
+        })
+        .collect()
+}
@@ -0,0 +1,176 @@
+//! Decoding and shaping of large upstream responses and MCP envelopes.
+
+use std::hint::black_box;
+
+use serde_json::{Value, json};
+use yarr::ServiceKind;
+use yarr::bench::{body_preview, decode_success, fit_response, serialize_with_limit, slim};
+
+use super::service;
+use crate::harness::{BatchSize, Harness, Throughput};
+
+pub fn bench(h: &mut Harness) {
+    let sonarr = service(ServiceKind::Sonarr);
+    let series_bytes = sonarr_series(5 * 1024 * 1024);
+    let series: Value = serde_json::from_slice(&series_bytes).unwrap();
+    let plex = plex_library(5_000);
+
+    let mut group = h.benchmark_group("response_5mb");
+    group.throughput(Throughput::Bytes(series_bytes.len() as u64));
+    group.bench_function("decode_success/sonarr_series", |b| {
+        b.iter_batched(
+            || series_bytes.clone(),
+            |bytes| decode_success(&sonarr, "application/json; charset=utf-8", bytes),
+            BatchSize::LargeInput,
+        )
+    });
+    group.bench_function("slim/sonarr_series", |b| {
+        b.iter_batched(
+            || series.clone(),
+            |value| slim(value, &["id", "title", "status", "monitored", "statistics"]),
+            BatchSize::LargeInput,
+        )
+    });
+    group.finish();
+
+    let mut group = h.benchmark_group("response");
+    let error_body = format!(
+        "{{\"message\":\"Unauthorized\",\"apiKey\":\"secret\",\"detail\":\"{}\"}}?apikey=secret&token=t",
+        "x".repeat(64 * 1024)
+    );
+    group.bench_function("body_preview/64kb", |b| {
+        b.iter(|| body_preview(black_box(&error_body)))
+    });
+    group.bench_function("serialize_with_limit/small", |b| {
+        let small = json!({"version": "4.0.0", "branch": "main", "isDocker": true});
+        b.iter(|| serialize_with_limit(black_box(&small)))
+    });
+    group.bench_function("serialize_with_limit/plex_library_truncated", |b| {
+        b.iter(|| serialize_with_limit(black_box(&plex)))
+    });
+    let envelope = json!({
+        "result": plex,
+        "calls": (0..200).map(|i| json!({
+            "action": "op",
+            "service": "plex",
+            "ok": i % 7 != 0,
+            "elapsed_ms": i,
+        })).collect::<Vec<_>>(),
+        "logs": (0..500).map(|i| format!("log line {i}: {}", "detail ".repeat(20))).collect::<Vec<_>>(),
+    });
+    group.bench_function("fit_response/plex_envelope", |b| {
+        b.iter_batched(
+            || envelope.clone(),
+            |mut response| {
+                fit_response(&mut response);
+                response
+            },
+            BatchSize::LargeInput,
+        )
+    });
+    group.finish();
+}
+
+/// A Sonarr `/api/v3/series` response of at least `target_bytes` serialized.
+fn sonarr_series(target_bytes: usize) -> Vec<u8> {
+    let mut series = Vec::new();
+    let mut size = 2;
+    let mut id = 0;
+    while size < target_bytes {
+        id += 1;
+        let row = json!({
+            "id": id,
+            "title": format!("Series {id}"),
+            "sortTitle": format!("series {id}"),
+            "status": if id % 3 == 0 { "ended" } else { "continuing" },
+            "ended": id % 3 == 0,
+            "overview": "A long-running drama about a family, a town, and the secrets \
+                         they keep from one another across several decades. ".repeat(3),
+            "network": "HBO",
+            "airTime": "21:00",
+            "images": [
+                {"coverType": "banner", "url": format!("/MediaCover/{id}/banner.jpg"), "remoteUrl": format!("https://artworks.thetvdb.com/banners/{id}/banner.jpg")},
+                {"coverType": "poster", "url": format!("/MediaCover/{id}/poster.jpg"), "remoteUrl": format!("https://artworks.thetvdb.com/banners/{id}/poster.jpg")},
+                {"coverType": "fanart", "url": format!("/MediaCover/{id}/fanart.jpg"), "remoteUrl": format!("https://artworks.thetvdb.com/banners/{id}/fanart.jpg")},
+            ],
+            "seasons": (1..=6).map(|season| json!({
+                "seasonNumber": season,
+                "monitored": true,
+                "statistics": {
+                    "episodeFileCount": 10,
+                    "episodeCount": 10,
+                    "totalEpisodeCount": 10,
+                    "sizeOnDisk": 21_474_836_480_u64,
+                    "percentOfEpisodes": 100.0,
+                },
+            })).collect::<Vec<_>>(),
+            "year": 2000 + id % 25,
+            "path": format!("/tv/Series {id}"),
+            "qualityProfileId": 1,
+            "seasonFolder": true,
+            "monitored": true,
+            "runtime": 55,
+            "tvdbId": 70_000 + id,
+            "imdbId": format!("tt{:07}", id),
+            "seriesType": "standard",
+            "cleanTitle": format!("series{id}"),
+            "titleSlug": format!("series-{id}"),
+            "genres": ["Drama", "Mystery", "Thriller"],
+            "tags": [1, 4],
+            "added": "2021-04-18T12:34:56Z",
+            "ratings": {"votes": 12_345, "value": 8.4},
+            "statistics": {
+                "seasonCount": 6,
+                "episodeFileCount": 60,
+                "episodeCount": 60,
+                "sizeOnDisk": 128_849_018_880_u64,
+                "percentOfEpisodes": 100.0,
+            },
+        });
+        size += serde_json::to_vec(&row).unwrap().len() + 1;
+        series.push(row);
+    }
+    serde_json::to_vec(&series).unwrap()
+}
+
+/// A Plex `/library/sections/{id}/all` response with `items` movies.
+fn plex_library(items: usize) -> Value {
+    let metadata = (0..items)
+        .map(|id| {
+            json!({
+                "ratingKey": id.to_string(),
+                "key": format!("/library/metadata/{id}"),
+                "guid": format!("plex://movie/{id:024x}"),
+                "type": "movie",
+                "title": format!("Movie {id}"),
+                "contentRating": "PG-13",
+                "summary": "An unlikely hero is pulled into an adventure far bigger than they imagined.",
+                "year": 1980 + id % 45,
+                "duration": 7_200_000,
+                "addedAt": 1_650_000_000 + id,
+                "updatedAt": 1_700_000_000 + id,
+                "thumb": format!("/library/metadata/{id}/thumb/1700000000"),
+                "Media": [{
+                    "id": id,
+                    "videoResolution": "1080",
+                    "container": "mkv",
+                    "Part": [{
+                        "id": id,
+                        "file": format!("/movies/Movie {id} ({})/Movie {id}.mkv", 1980 + id % 45),
+                        "size": 8_589_934_592_u64,
+                    }],
+                }],
+                "Genre": [{"tag": "Adventure"}, {"tag": "Comedy"}],
+                "Director": [{"tag": "A. Director"}],
+            })
+        })
+        .collect::<Vec<_>>();
+    json!({
+        "MediaContainer": {
+            "size": items,
+            "librarySectionID": 1,
+            "librarySectionTitle": "Movies",
+            "Metadata": metadata,
+        }
+    })
+}
@@ -0,0 +1,88 @@
+//! What a session pays to start with every service kind configured.
+
+use rmcp::ServiceExt;
+use rmcp::transport::TokioChildProcess;
+use yarr::{ServiceConfig, ServiceKind, YarrClient, YarrConfig, YarrService};
+
+use super::service;
+use crate::harness::{BatchSize, Harness};
+
+pub fn bench(h: &mut Harness) {
+    let runtime = tokio::runtime::Runtime::new().expect("tokio runtime");
+    let config = fleet_config();
+
+    let mut group = h.benchmark_group("startup");
+    // What a stdio session pays before it can answer `initialize`. The Code Mode
+    // preamble, discovery catalog and type declarations are deferred to first use.
+    group.bench_function("service_new/all_kinds", |b| {
+        b.iter_batched(
+            || config.clone(),
+            |config| {
+                let client = YarrClient::new(&config).expect("client builds");
+                YarrService::new(client, config)
+            },
+            BatchSize::SmallInput,
+        )
+    });
+    // The deferred cost, paid once by the first search of a session.
+    group.bench_function("codemode_catalog/all_kinds", |b| {
+        b.iter_batched(
+            || {
+                let config = config.clone();
+                YarrService::new(YarrClient::new(&config).expect("client builds"), config)
+            },
+            |service| runtime.block_on(service.codemode("async () => codemode.search(\"queue\")")),
+            BatchSize::PerIteration,
+        )
+    });
+
+    group.sample_size(10);
+    let home = tempfile::tempdir().expect("tempdir");
+    group.bench_function("stdio_initialize/all_kinds", |b| {
+        b.iter(|| {
+            runtime.block_on(async {
+                let transport =
+                    TokioChildProcess::new(stdio_command(home.path())).expect("spawn yarr mcp");
+                let client = ().serve(transport).await.expect("initialize");
+                client.cancel().await.expect("shutdown");
+            })
+        })
+    });
+    group.finish();
+}
+
+/// Every kind configured once, as a full fleet would be.
+fn fleet_config() -> YarrConfig {
+    YarrConfig {
+        services: ServiceKind::ALL
+            .into_iter()
+            .map(|kind| ServiceConfig {
+                base_url: "http://localhost:1".into(),
+                ..service(kind)
+            })
+            .collect(),
+    }
+}
+
+/// `yarr mcp` over stdio with [`fleet_config`]'s services set through the
+/// environment, the way an MCP client spawns it per session.
+fn stdio_command(home: &std::path::Path) -> tokio::process::Command {
+    let mut cmd = tokio::process::Command::new(env!("CARGO_BIN_EXE_yarr"));
+    cmd.arg("mcp")
+        .env_clear()
+        .env("HOME", home)
+        .env("YARR_HOME", home)
+        .env("PATH", std::env::var("PATH").unwrap_or_default())
+        .stderr(std::process::Stdio::null());
+    let names: Vec<&str> = ServiceKind::ALL.iter().map(|kind| kind.as_str()).collect();
+    cmd.env("YARR_SERVICES", names.join(","));
+    for name in names {
+        let prefix = format!("YARR_{}", name.to_ascii_uppercase());
+        cmd.env(format!("{prefix}_KIND"), name)
+            .env(format!("{prefix}_URL"), "http://localhost:1")
+            .env(format!("{prefix}_API_KEY"), "0123456789abcdef")
+            .env(format!("{prefix}_USERNAME"), "yarr")
+            .env(format!("{prefix}_PASSWORD"), "yarr");
+    }
+    cmd
+}
@@ -0,0 +1,61 @@
+//! URL building for header- and query-authenticated services and the widest
+//! generated operation.
+
+use std::hint::black_box;
+
+use yarr::ServiceKind;
+use yarr::bench::{build_operation_url, build_url, query_get};
+use yarr::openapi::{ParameterLocation, operations_for_kind};
+
+use super::service;
+use crate::harness::Harness;
+
+pub fn bench(h: &mut Harness) {
+    let sonarr = service(ServiceKind::Sonarr);
+    let sabnzbd = service(ServiceKind::Sabnzbd);
+    let tautulli = service(ServiceKind::Tautulli);
+    let jellyfin = service(ServiceKind::Jellyfin);
+
+    let mut group = h.benchmark_group("transport");
+    group.bench_function("build_url/header_auth", |b| {
+        b.iter(|| {
+            build_url(
+                &sonarr,
+                black_box("/api/v3/series?includeSeasonImages=true"),
+            )
+        })
+    });
+    group.bench_function("build_url/query_auth", |b| {
+        b.iter(|| build_url(&sabnzbd, black_box("/api?mode=queue&start=0&limit=50")))
+    });
+    group.bench_function("query_get", |b| {
+        let params = [
+            ("cmd", "get_history"),
+            ("length", "100"),
+            ("order_column", "date"),
+            ("search", "foo&bar baz"),
+        ];
+        b.iter(|| query_get(&tautulli, "/api/v2", black_box(&params)))
+    });
+
+    let widest = operations_for_kind(ServiceKind::Jellyfin)
+        .iter()
+        .max_by_key(|spec| spec.parameters.len())
+        .expect("jellyfin has generated operations");
+    let path_args = widest
+        .parameters
+        .iter()
+        .filter(|parameter| parameter.location == ParameterLocation::Path)
+        .map(|parameter| (parameter.name, format!("{}-value", parameter.name)))
+        .collect::<Vec<_>>();
+    let query = widest
+        .parameters
+        .iter()
+        .filter(|parameter| parameter.location == ParameterLocation::Query)
+        .map(|parameter| (parameter.name, "value with spaces&symbols".to_owned()))
+        .collect::<Vec<_>>();
+    group.bench_function("build_operation_url", |b| {
+        b.iter(|| build_operation_url(&jellyfin, widest.path, black_box(&path_args), &query))
+    });
+    group.finish();
+}
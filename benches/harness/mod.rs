@@ -0,0 +1,332 @@
+//! A small std-only timing harness for `benches/hot_paths.rs`.
+//!
+//! Shaped like Criterion's API (groups, `iter`, `iter_batched`, throughput),
+//! without its dependency tree. Each benchmark is warmed up, then timed over
+//! `sample_size` samples; the report is the median time per iteration with
+//! the 10th/90th percentile samples beside it.
+//!
+//! Arguments after `--`:
+//!
+//! ```text
+//! <filter>                  run only benchmarks whose id contains <filter>
+//! --save-baseline <name>    write medians to target/bench-baselines/<name>.json
+//! --machine <note>          describe the machine in a saved baseline
+//! --baseline <name>         compare medians against a saved baseline
+//! --no-baseline             skip the default comparison
+//! ```
+//!
+//! A `<name>` containing `/` or ending in `.json` is used as a path as is, so
+//! a baseline can also be read from or written to a file outside `target/`.
+//!
+//! Without `--baseline` or `--save-baseline`, a run compares against the
+//! reference baseline committed at [`REFERENCE_BASELINE`] when that file
+//! exists. A baseline records the machine it was taken on next to the
+//! medians, and the comparison prints it, since numbers from another machine
+//! only show the direction of a change.
+
+use std::collections::BTreeMap;
+use std::hint::black_box;
+use std::path::{Path, PathBuf};
+use std::time::{Duration, Instant};
+
+const WARM_UP: Duration = Duration::from_millis(500);
+const MEASUREMENT: Duration = Duration::from_secs(3);
+const DEFAULT_SAMPLES: usize = 50;
+/// Changes within this fraction of the baseline are reported as noise.
+const NOISE: f64 = 0.05;
+/// The reference baseline a run compares against by default, relative to the
+/// package root.
+const REFERENCE_BASELINE: &str = "benches/baseline.json";
+
+/// What one iteration processes, for a throughput column.
+#[derive(Debug, Clone, Copy)]
+pub enum Throughput {
+    Bytes(u64),
+    Elements(u64),
+}
+
+/// How many inputs `iter_batched` prepares before timing them.
+#[derive(Debug, Clone, Copy)]
+pub enum BatchSize {
+    SmallInput,
+    LargeInput,
+    PerIteration,
+}
+
+impl BatchSize {
+    fn limit(self) -> u64 {
+        match self {
+            BatchSize::SmallInput => 1_000,
+            BatchSize::LargeInput => 10,
+            BatchSize::PerIteration => 1,
+        }
+    }
+}
+
+pub struct Harness {
+    filter: Option<String>,
+    save: Option<PathBuf>,
+    machine: Option<String>,
+    baseline: Option<BTreeMap<String, f64>>,
+    results: BTreeMap<String, f64>,
+}
+
+impl Harness {
+    pub fn from_args() -> Self {
+        let mut filter = None;
+        let mut save = None;
+        let mut machine = None;
+        let mut compare = None;
+        let mut reference = true;
+        let mut args = std::env::args().skip(1);
+        while let Some(arg) = args.next() {
+            match arg.as_str() {
+                "--save-baseline" => save = Some(baseline_path(&args.next().expect("name"))),
+                "--machine" => machine = Some(args.next().expect("machine note")),
+                "--baseline" => compare = Some(baseline_path(&args.next().expect("name"))),
+                "--no-baseline" => reference = false,
+                // `cargo bench` passes `--bench` to every harness-less target.
+                "--bench" => {}
+                _ if arg.starts_with('-') => {}
+                _ => filter = Some(arg),
+            }
+        }
+        if compare.is_none() && save.is_none() && reference {
+            let path = Path::new(env!("CARGO_MANIFEST_DIR")).join(REFERENCE_BASELINE);
+            compare = path.exists().then_some(path);
+        }
+        Self {
+            filter,
+            save,
+            machine,
+            baseline: compare.as_deref().map(load_baseline),
+            results: BTreeMap::new(),
+        }
+    }
+
+    pub fn benchmark_group(&mut self, name: &str) -> Group<'_> {
+        Group {
+            harness: self,
+            name: name.to_owned(),
+            samples: DEFAULT_SAMPLES,
+            throughput: None,
+        }
+    }
+
+    /// Write the saved baseline, if one was asked for.
+    pub fn finish(self) {
+        if let Some(path) = self.save {
+            if let Some(parent) = path.parent() {
+                std::fs::create_dir_all(parent).expect("baseline directory");
+            }
+            let baseline = serde_json::json!({
+                "machine": self.machine.unwrap_or_else(this_machine),
+                "medians_ns": self.results,
+            });
+            let json = serde_json::to_string_pretty(&baseline).expect("results serialize");
+            std::fs::write(&path, json + "\n").expect("baseline written");
+            println!("saved baseline {}", path.display());
+        }
+    }
+}
+
+/// Read a baseline and print what it is compared from. Baselines saved before
+/// the machine note was added are a bare map of medians.
+fn load_baseline(path: &Path) -> BTreeMap<String, f64> {
+    let text =
+        std::fs::read_to_string(path).unwrap_or_else(|error| panic!("{}: {error}", path.display()));
+    let mut value: serde_json::Value = serde_json::from_str(&text).expect("baseline is JSON");
+    let machine = value["machine"]
+        .as_str()
+        .unwrap_or("an unnoted machine")
+        .to_owned();
+    let medians = match value.get_mut("medians_ns") {
+        Some(medians) => medians.take(),
+        None => value,
+    };
+    println!(
+        "comparing against {} (recorded on {machine})",
+        path.display()
+    );
+    serde_json::from_value(medians).expect("baseline medians are numbers")
+}
+
+/// A default machine note: OS, architecture, and available parallelism. Pass
+/// `--machine` to name the CPU as well.
+fn this_machine() -> String {
+    let threads = std::thread::available_parallelism().map_or(0, usize::from);
+    format!(
+        "{} {}, {threads} threads",
+        std::env::consts::OS,
+        std::env::consts::ARCH
+    )
+}
+
+fn baseline_path(name: &str) -> PathBuf {
+    if name.contains('/') || name.ends_with(".json") {
+        return PathBuf::from(name);
+    }
+    let target = std::env::var_os("CARGO_TARGET_DIR").unwrap_or_else(|| "target".into());
+    PathBuf::from(target)
+        .join("bench-baselines")
+        .join(format!("{name}.json"))
+}
+
+pub struct Group<'a> {
+    harness: &'a mut Harness,
+    name: String,
+    samples: usize,
+    throughput: Option<Throughput>,
+}
+
+impl Group<'_> {
+    pub fn sample_size(&mut self, samples: usize) {
+        self.samples = samples.max(2);
+    }
+
+    pub fn throughput(&mut self, throughput: Throughput) {
+        self.throughput = Some(throughput);
+    }
+
+    pub fn bench_function(&mut self, name: &str, run: impl FnMut(&mut Bencher)) {
+        let id = format!("{}/{name}", self.name);
+        if let Some(filter) = &self.harness.filter
+            && !id.contains(filter.as_str())
+        {
+            return;
+        }
+        let median = measure(self.samples, run);
+        let mut line = format!("{id:<56} time: {}", median.report());
+        if let Some(throughput) = self.throughput {
+            line.push_str(&format!("  thrpt: {}", rate(throughput, median.median)));
+        }
+        if let Some(before) = self.harness.baseline.as_ref().and_then(|b| b.get(&id)) {
+            line.push_str(&format!("  change: {}", change(*before, median.median)));
+        }
+        println!("{line}");
+        self.harness.results.insert(id, median.median);
+    }
+
+    pub fn finish(self) {}
+}
+
+/// Runs the routine under test and accumulates the time spent in it.
+pub struct Bencher {
+    iterations: u64,
+    elapsed: Duration,
+}
+
+impl Bencher {
+    pub fn iter<O>(&mut self, mut routine: impl FnMut() -> O) {
+        let start = Instant::now();
+        for _ in 0..self.iterations {
+            black_box(routine());
+        }
+        self.elapsed = start.elapsed();
+    }
+
+    /// Like [`Bencher::iter`], with a fresh input from `setup` per call.
+    /// Setup and dropping the outputs stay outside the timed region.
+    pub fn iter_batched<I, O>(
+        &mut self,
+        mut setup: impl FnMut() -> I,
+        mut routine: impl FnMut(I) -> O,
+        size: BatchSize,
+    ) {
+        let mut elapsed = Duration::ZERO;
+        let mut remaining = self.iterations;
+        while remaining > 0 {
+            let batch = remaining.min(size.limit());
+            let inputs: Vec<I> = (0..batch).map(|_| setup()).collect();
+            let mut outputs = Vec::with_capacity(inputs.len());
+            let start = Instant::now();
+            for input in inputs {
+                outputs.push(black_box(routine(input)));
+            }
+            elapsed += start.elapsed();
+            drop(outputs);
+            remaining -= batch;
+        }
+        self.elapsed = elapsed;
+    }
+}
+
+struct Summary {
+    median: f64,
+    low: f64,
+    high: f64,
+}
+
+impl Summary {
+    fn report(&self) -> String {
+        format!(
+            "{} [p10 {}, p90 {}]",
+            duration(self.median),
+            duration(self.low),
+            duration(self.high)
+        )
+    }
+}
+
+/// Nanoseconds per iteration: warm up while estimating one iteration's cost,
+/// then size the samples to fill the measurement window.
+fn measure(samples: usize, mut run: impl FnMut(&mut Bencher)) -> Summary {
+    let mut bencher = Bencher {
+        iterations: 1,
+        elapsed: Duration::ZERO,
+    };
+    let mut spent = Duration::ZERO;
+    let mut iterations = 0;
+    while spent < WARM_UP {
+        run(&mut bencher);
+        spent += bencher.elapsed;
+        iterations += bencher.iterations;
+        bencher.iterations *= 2;
+    }
+    let per_iteration = spent.as_nanos() as f64 / iterations as f64;
+    let per_sample = MEASUREMENT.as_nanos() as f64 / samples as f64;
+    bencher.iterations = ((per_sample / per_iteration) as u64).max(1);
+
+    let mut times: Vec<f64> = (0..samples)
+        .map(|_| {
+            run(&mut bencher);
+            bencher.elapsed.as_nanos() as f64 / bencher.iterations as f64
+        })
+        .collect();
+    times.sort_by(f64::total_cmp);
+    let at = |fraction: f64| times[((times.len() - 1) as f64 * fraction).round() as usize];
+    Summary {
+        median: at(0.5),
+        low: at(0.1),
+        high: at(0.9),
+    }
+}
+
+fn duration(nanos: f64) -> String {
+    match nanos {
+        n if n < 1e3 => format!("{n:.1} ns"),
+        n if n < 1e6 => format!("{:.2} us", n / 1e3),
+        n if n < 1e9 => format!("{:.2} ms", n / 1e6),
+        n => format!("{:.2} s", n / 1e9),
+    }
+}
+
+fn rate(throughput: Throughput, nanos: f64) -> String {
+    let per_second = 1e9 / nanos;
+    match throughput {
+        Throughput::Bytes(bytes) => {
+            format!("{:.1} MiB/s", bytes as f64 * per_second / (1024.0 * 1024.0))
+        }
+        Throughput::Elements(elements) => format!("{:.0} elem/s", elements as f64 * per_second),
+    }
+}
+
+fn change(before: f64, after: f64) -> String {
+    let delta = after / before - 1.0;
+    let verdict = match delta {
+        d if d > NOISE => "regressed",
+        d if d < -NOISE => "improved",
+        _ => "within noise",
+    };
+    format!("{:+.1}% ({verdict})", delta * 100.0)
+}
@@ -0,0 +1,32 @@
+//! Micro-benchmarks for the upstream transport and MCP response hot paths, log
+//! throughput and `yarr mcp` startup, timed by the std-only harness in
+//! `benches/harness/`.
+//!
+//! ```text
+//! cargo bench --bench hot_paths                              # run everything
+//! cargo bench --bench hot_paths -- --save-baseline main      # record a baseline
+//! cargo bench --bench hot_paths -- --baseline main           # compare against it
+//! ```
+//!
+//! A plain run compares against `benches/baseline.json` when it exists.
+//!
+//! Fixtures are synthesized to realistic sizes (a ~5 MB Sonarr series list, a
+//! large Plex library section, the widest generated Jellyfin operation) so the
+//! numbers track what a real fleet pushes through these functions. See
+//! `docs/TESTING.md` for the baseline workflow.
+
+mod groups;
+mod harness;
+
+use harness::Harness;
+
+fn main() {
+    let mut harness = Harness::from_args();
+    groups::transport::bench(&mut harness);
+    groups::responses::bench(&mut harness);
+    groups::operations::bench(&mut harness);
+    groups::codemode::bench(&mut harness);
+    groups::logging::bench(&mut harness);
+    groups::startup::bench(&mut harness);
+    harness.finish();
+}
@@ -2,12 +2,22 @@
 """Check files for non-ASCII characters.
 
 Use --fix to replace common smart punctuation with ASCII equivalents.
+
+A clean file costs one regex scan of the whole buffer; only files that contain
+a disallowed character are walked line by line to report positions. Files are
+checked across a process pool (--jobs), and --cache skips files whose exact
+contents already passed under the current rules.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 SUBSTITUTIONS: dict[int, str] = {
@@ -52,6 +62,24 @@ ALLOWED_UNICODE_CODEPOINTS: set[int] = {
 }
 
 
+# Everything except tab, newline, carriage return, printable ASCII and the
+# allowlist.
+DISALLOWED = re.compile(
+    "[^\t\n\r\x20-\x7e"
+    + "".join(re.escape(chr(codepoint)) for codepoint in sorted(ALLOWED_UNICODE_CODEPOINTS))
+    + "]"
+)
+
+# Cache entries are only valid for the rules that produced them.
+RULES_DIGEST = hashlib.sha256(DISALLOWED.pattern.encode("utf-8")).hexdigest()
+
+# Below this many files per worker, process start-up costs more than it saves.
+FILES_PER_WORKER = 32
+
+# Content digests known clean, handed to pool workers once at start-up.
+_clean_digests: frozenset[str] = frozenset()
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Check files for non-ASCII characters.")
     parser.add_argument(
@@ -59,54 +87,139 @@ def main() -> int:
         action="store_true",
         help="Rewrite files, replacing common non-ASCII characters with ASCII equivalents.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=available_cpus(),
+        help="Worker processes (default: usable CPUs; 1 checks in-process).",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="JSON file of content digests that passed; unchanged files are skipped.",
+    )
     parser.add_argument("files", nargs="+", help="Files to check.")
     args = parser.parse_args()
 
+    clean = load_cache(args.cache) if args.cache else frozenset()
+    jobs = min(args.jobs, len(args.files) // FILES_PER_WORKER)
+    if jobs > 1:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_set_clean_digests, initargs=(clean,)
+        ) as pool:
+            results = list(
+                pool.map(
+                    check_file,
+                    args.files,
+                    [args.fix] * len(args.files),
+                    chunksize=FILES_PER_WORKER,
+                )
+            )
+    else:
+        _set_clean_digests(clean)
+        results = [check_file(filename, args.fix) for filename in args.files]
+
     has_errors = False
-    for filename in args.files:
-        has_errors |= lint_utf8_ascii(Path(filename), fix=args.fix)
+    passed: set[str] = set()
+    for failed, report, digest in results:
+        sys.stdout.write(report)
+        has_errors |= failed
+        if digest is not None:
+            passed.add(digest)
+    if args.cache:
+        save_cache(args.cache, passed)
     return 1 if has_errors else 0
 
 
+def available_cpus() -> int:
+    """CPUs this process may run on, which can be fewer than the host has."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def _set_clean_digests(digests: frozenset[str]) -> None:
+    global _clean_digests
+    _clean_digests = digests
+
+
+def load_cache(path: Path) -> frozenset[str]:
+    """Return the clean digests in `path`, or none if it is missing, unreadable
+    or written under different rules."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return frozenset()
+    if not isinstance(data, dict) or data.get("rules") != RULES_DIGEST:
+        return frozenset()
+    return frozenset(data.get("clean", []))
+
+
+def save_cache(path: Path, digests: set[str]) -> None:
+    """Record this run's clean digests; files no longer checked drop out."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"rules": RULES_DIGEST, "clean": sorted(digests)}), encoding="utf-8"
+    )
+    tmp.replace(path)
+
+
 def lint_utf8_ascii(filename: Path, fix: bool) -> bool:
     """Return True if an error was printed."""
+    failed, report, _ = check_file(str(filename), fix)
+    sys.stdout.write(report)
+    return failed
+
+
+def check_file(filename: str, fix: bool) -> tuple[bool, str, str | None]:
+    """Lint one file. Returns whether it failed, the report to print, and the
+    content digest when the file passed."""
+    path = Path(filename)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if digest in _clean_digests:
+        return False, "", digest
     try:
-        raw = filename.read_bytes()
         text = raw.decode("utf-8")
     except UnicodeDecodeError as exc:
-        print(f"{filename}: UTF-8 decoding error:")
-        print(f"  byte offset: {exc.start}")
-        print(f"  reason: {exc.reason}")
         partial = raw[: exc.start]
         line = partial.count(b"\n") + 1
         col = exc.start - (partial.rfind(b"\n") if b"\n" in partial else -1)
-        print(f"  location: line {line}, column {col}")
-        return True
-
+        return (
+            True,
+            f"{filename}: UTF-8 decoding error:\n"
+            f"  byte offset: {exc.start}\n"
+            f"  reason: {exc.reason}\n"
+            f"  location: line {line}, column {col}\n",
+            None,
+        )
+    if DISALLOWED.search(text) is None:
+        return False, "", digest
+    return True, report_errors(path, text, fix), None
+
+
+def report_errors(filename: Path, text: str, fix: bool) -> str:
+    """Report every disallowed character with its position, fixing if asked."""
     errors: list[tuple[int, int, str, int]] = []
     for lineno, line in enumerate(text.splitlines(keepends=True), 1):
-        for colno, char in enumerate(line, 1):
-            codepoint = ord(char)
-            if char in ("\n", "\r", "\t"):
-                continue
-            if not (0x20 <= codepoint <= 0x7E) and codepoint not in ALLOWED_UNICODE_CODEPOINTS:
-                errors.append((lineno, colno, char, codepoint))
-
-    if errors:
-        print(f"{filename}:")
-        for lineno, colno, char, codepoint in errors:
-            safe_char = repr(char)[1:-1]
-            print(
-                f"  line {lineno}, column {colno}: U+{codepoint:04X} ({safe_char})"
-            )
+        for match in DISALLOWED.finditer(line):
+            char = match.group()
+            errors.append((lineno, match.start() + 1, char, ord(char)))
+
+    lines = [f"{filename}:"]
+    for lineno, colno, char, codepoint in errors:
+        safe_char = repr(char)[1:-1]
+        lines.append(f"  line {lineno}, column {colno}: U+{codepoint:04X} ({safe_char})")
 
-    if errors and fix:
+    if fix:
         new_contents = "".join(SUBSTITUTIONS.get(ord(char), char) for char in text)
         replacements = sum(1 for char in text if ord(char) in SUBSTITUTIONS)
         filename.write_text(new_contents, encoding="utf-8")
-        print(f"  fixed {replacements} replaceable character(s)")
+        lines.append(f"  fixed {replacements} replaceable character(s)")
 
-    return bool(errors)
+    return "\n".join(lines) + "\n"
 
 
 if __name__ == "__main__":
@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
-"""Fail if changed git blobs exceed the configured size budget."""
+"""Fail if changed git blobs exceed the configured size budget.
+
+Sizes and binary flags come from one `git diff --raw --numstat -z` and one
+`git cat-file --batch-check` session, however many paths changed.
+`--all-history` audits every blob reachable from any ref instead, streaming
+`git rev-list --objects --all` straight into `git cat-file --batch-check`.
+"""
 
 from __future__ import annotations
 
@@ -14,6 +20,12 @@ from pathlib import Path
 
 DEFAULT_MAX_BYTES = 500 * 1024
 
+# Git's own binary heuristic: a NUL byte within the first 8000 bytes.
+BINARY_SNIFF_BYTES = 8000
+
+# Mode of a submodule entry; its object lives in another repository.
+GITLINK_MODE = "160000"
+
 
 @dataclass(frozen=True)
 class ChangedBlob:
@@ -21,10 +33,14 @@ class ChangedBlob:
     size_bytes: int
     is_allowlisted: bool
     is_binary: bool
+    # Set only by the history audit, where one path has many versions.
+    object_id: str = ""
 
 
-def run_git(*args: str) -> str:
-    result = subprocess.run(["git", *args], check=True, capture_output=True, text=True)
+def run_git(*args: str, stdin: str | None = None) -> str:
+    result = subprocess.run(
+        ["git", *args], input=stdin, check=True, capture_output=True, text=True
+    )
     return result.stdout
 
 
@@ -53,63 +69,160 @@ def is_allowlisted(path: str, patterns: list[str]) -> bool:
     return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
 
 
-def get_changed_paths(base: str, head: str) -> list[str]:
+def get_changes(base: str, head: str) -> list[tuple[str, str, bool]]:
+    """(path, head object id, is binary) for every added or modified path."""
     output = run_git(
         "diff",
-        "--name-only",
+        "--raw",
+        "--numstat",
+        "--no-abbrev",
         "--diff-filter=AM",
         "--no-renames",
         "-z",
         base,
         head,
     )
-    return [path for path in output.split("\0") if path]
-
-
-def is_binary_change(base: str, head: str, path: str) -> bool:
+    # `--raw` records come first as `:<modes> <ids> <status>` then the path;
+    # `--numstat` records follow as `added<TAB>deleted<TAB>path`, with `-`
+    # counts for binary files.
+    object_ids: dict[str, str] = {}
+    binary: dict[str, bool] = {}
+    fields = iter(output.split("\0"))
+    for field in fields:
+        if field.startswith(":"):
+            _, mode, _, object_id, _ = field.split(" ")
+            path = next(fields)
+            if mode != GITLINK_MODE:
+                object_ids[path] = object_id
+        elif field:
+            added, deleted, path = field.split("\t", 2)
+            binary[path] = added == "-" and deleted == "-"
+    return [(path, object_id, binary.get(path, False)) for path, object_id in object_ids.items()]
+
+
+def blob_sizes(object_ids: list[str]) -> dict[str, int]:
+    """Sizes of `object_ids` from one `git cat-file --batch-check` session."""
+    if not object_ids:
+        return {}
     output = run_git(
-        "diff",
-        "--numstat",
-        "--diff-filter=AM",
-        "--no-renames",
-        base,
-        head,
-        "--",
-        path,
-    ).strip()
-    if not output:
-        return False
-
-    added, deleted, _ = output.split("\t", 2)
-    return added == "-" and deleted == "-"
+        "cat-file",
+        "--batch-check=%(objectname) %(objectsize)",
+        stdin="".join(f"{object_id}\n" for object_id in object_ids),
+    )
+    sizes: dict[str, int] = {}
+    for line in output.splitlines():
+        object_id, size = line.split(" ")
+        sizes[object_id] = int(size)
+    return sizes
 
 
-def blob_size(commit: str, path: str) -> int:
-    return int(run_git("cat-file", "-s", f"{commit}:{path}").strip())
+def collect_changed_blobs(base: str, head: str, allowlist: list[str]) -> list[ChangedBlob]:
+    changes = get_changes(base, head)
+    sizes = blob_sizes([object_id for _, object_id, _ in changes])
+    return [
+        ChangedBlob(
+            path=path,
+            size_bytes=sizes[object_id],
+            is_allowlisted=is_allowlisted(path, allowlist),
+            is_binary=is_binary,
+        )
+        for path, object_id, is_binary in changes
+    ]
 
 
-def collect_changed_blobs(base: str, head: str, allowlist: list[str]) -> list[ChangedBlob]:
-    blobs: list[ChangedBlob] = []
-    for path in get_changed_paths(base, head):
-        blobs.append(
-            ChangedBlob(
-                path=path,
-                size_bytes=blob_size(head, path),
-                is_allowlisted=is_allowlisted(path, allowlist),
-                is_binary=is_binary_change(base, head, path),
-            )
+def collect_history_blobs(max_bytes: int, allowlist: list[str]) -> tuple[int, list[ChangedBlob]]:
+    """Count every blob reachable from any ref and return those over `max_bytes`,
+    largest first. Each blob is reported under the first path that reached it."""
+    rev_list_cmd = ["git", "rev-list", "--objects", "--all"]
+    cat_file_cmd = [
+        "git",
+        "cat-file",
+        "--batch-check=%(objecttype) %(objectname) %(objectsize) %(rest)",
+    ]
+    rev_list = subprocess.Popen(rev_list_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    cat_file = subprocess.Popen(
+        cat_file_cmd,
+        stdin=rev_list.stdout,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert rev_list.stdout is not None and cat_file.stdout is not None
+    # cat-file owns the pipe now; rev-list sees SIGPIPE if it exits early.
+    rev_list.stdout.close()
+
+    count = 0
+    oversized: list[tuple[str, str, int]] = []
+    for line in cat_file.stdout:
+        object_type, object_id, size, path = line.rstrip("\n").split(" ", 3)
+        if object_type != "blob":
+            continue
+        count += 1
+        if int(size) > max_bytes:
+            oversized.append((path, object_id, int(size)))
+
+    for process, cmd in ((cat_file, cat_file_cmd), (rev_list, rev_list_cmd)):
+        _, stderr = process.communicate()
+        if process.returncode != 0:
+            stderr = stderr.decode() if isinstance(stderr, bytes) else stderr
+            raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr)
+
+    binary = binary_blobs([object_id for _, object_id, _ in oversized])
+    blobs = [
+        ChangedBlob(
+            path=path,
+            size_bytes=size,
+            is_allowlisted=is_allowlisted(path, allowlist),
+            is_binary=object_id in binary,
+            object_id=object_id,
         )
-    return blobs
+        for path, object_id, size in oversized
+    ]
+    blobs.sort(key=lambda blob: (-blob.size_bytes, blob.path))
+    return count, blobs
+
+
+def binary_blobs(object_ids: list[str]) -> set[str]:
+    """Which of `object_ids` look binary to git, read in one `git cat-file
+    --batch` session. Only used for the few blobs over the limit."""
+    if not object_ids:
+        return set()
+    result = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        input="".join(f"{object_id}\n" for object_id in object_ids).encode(),
+        check=True,
+        capture_output=True,
+    )
+    # Each object is `<id> <type> <size>\n<content>\n`.
+    output = result.stdout
+    binary: set[str] = set()
+    offset = 0
+    while offset < len(output):
+        header_end = output.index(b"\n", offset)
+        object_id, _, size = output[offset:header_end].decode().split(" ")
+        start = header_end + 1
+        if b"\0" in output[start : start + min(int(size), BINARY_SNIFF_BYTES)]:
+            binary.add(object_id)
+        offset = start + int(size) + 1
+    return binary
 
 
 def format_kib(size_bytes: int) -> str:
     return f"{size_bytes / 1024:.1f} KiB"
 
 
+def describe(blob: ChangedBlob) -> str:
+    if blob.object_id:
+        return f"{blob.path} @ {blob.object_id[:12]}"
+    return blob.path
+
+
 def write_step_summary(
     max_bytes: int,
     blobs: list[ChangedBlob],
     violations: list[ChangedBlob],
+    checked: str,
+    empty: str,
 ) -> None:
     summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
     if not summary_path:
@@ -119,7 +232,7 @@ def write_step_summary(
         "## Blob Size Policy",
         "",
         f"Default max: `{max_bytes}` bytes ({format_kib(max_bytes)})",
-        f"Changed files checked: `{len(blobs)}`",
+        checked,
         f"Violations: `{len(violations)}`",
         "",
     ]
@@ -132,10 +245,10 @@ def write_step_summary(
                 status = "blocked"
             kind = "binary" if blob.is_binary else "non-binary"
             lines.append(
-                f"| `{blob.path}` | {kind} | `{blob.size_bytes}` bytes ({format_kib(blob.size_bytes)}) | {status} |"
+                f"| `{describe(blob)}` | {kind} | `{blob.size_bytes}` bytes ({format_kib(blob.size_bytes)}) | {status} |"
             )
     else:
-        lines.append("No changed files were detected.")
+        lines.append(empty)
 
     lines.append("")
     Path(summary_path).write_text("\n".join(lines), encoding="utf-8")
@@ -151,6 +264,12 @@ def main() -> int:
         help="Base git revision to diff against. Default: origin/main, main, then HEAD~1.",
     )
     parser.add_argument("--head", default="HEAD", help="Head git revision to inspect.")
+    parser.add_argument(
+        "--all-history",
+        action="store_true",
+        help="Audit every blob reachable from any ref instead of a diff; "
+        "--base and --head are ignored and only blobs over the limit are listed.",
+    )
     parser.add_argument(
         "--max-bytes",
         type=int,
@@ -167,7 +286,11 @@ def main() -> int:
 
     try:
         allowlist = load_allowlist(args.allowlist)
-        blobs = collect_changed_blobs(args.base, args.head, allowlist)
+        if args.all_history:
+            checked, blobs = collect_history_blobs(args.max_bytes, allowlist)
+        else:
+            blobs = collect_changed_blobs(args.base, args.head, allowlist)
+            checked = len(blobs)
     except subprocess.CalledProcessError as exc:
         print(f"git command failed: {' '.join(exc.cmd)}", file=sys.stderr)
         print(exc.stderr, file=sys.stderr)
@@ -177,26 +300,44 @@ def main() -> int:
         blob for blob in blobs if blob.size_bytes > args.max_bytes and not blob.is_allowlisted
     ]
 
-    write_step_summary(args.max_bytes, blobs, violations)
-
-    if not blobs:
-        print("No changed files were detected.")
-        return 0
+    if args.all_history:
+        write_step_summary(
+            args.max_bytes,
+            blobs,
+            violations,
+            f"History blobs audited: `{checked}`",
+            "No blob in history exceeds the limit.",
+        )
+        print(
+            f"Audited {checked} blob(s) across all history against the "
+            f"{args.max_bytes}-byte limit; {len(blobs)} exceed it."
+        )
+    else:
+        write_step_summary(
+            args.max_bytes,
+            blobs,
+            violations,
+            f"Changed files checked: `{checked}`",
+            "No changed files were detected.",
+        )
+        if not blobs:
+            print("No changed files were detected.")
+            return 0
+        print(f"Checked {checked} changed file(s) against the {args.max_bytes}-byte limit.")
 
-    print(f"Checked {len(blobs)} changed file(s) against the {args.max_bytes}-byte limit.")
     for blob in blobs:
         status = "allowlisted" if blob.is_allowlisted else "ok"
         if blob in violations:
             status = "blocked"
         kind = "binary" if blob.is_binary else "non-binary"
         print(
-            f"- {blob.path}: {blob.size_bytes} bytes ({format_kib(blob.size_bytes)}) [{kind}, {status}]"
+            f"- {describe(blob)}: {blob.size_bytes} bytes ({format_kib(blob.size_bytes)}) [{kind}, {status}]"
         )
 
     if violations:
         print("\nFile(s) exceed the configured limit:")
         for blob in violations:
-            print(f"- {blob.path}: {blob.size_bytes} bytes > {args.max_bytes} bytes")
+            print(f"- {describe(blob)}: {blob.size_bytes} bytes > {args.max_bytes} bytes")
         print(
             "\nIf this is a real checked-in asset, add its repo-relative path or glob "
             "to scripts/blob-size-allowlist.txt. Otherwise, shrink it or keep it out of git."
@@ -76,9 +76,11 @@ def action_description(action: str) -> str:
         "api_post": "Proxy a credentialed POST request to an allowed upstream API prefix.",
         "api_put": "Proxy a credentialed PUT request to an allowed upstream API prefix.",
         "api_delete": "Proxy a credentialed DELETE request to an allowed upstream API prefix.",
+        "fleet_status": "Probe every configured service's status endpoint concurrently; returns each service's `ok`, `latency_ms`, and `error`.",
         "help": "Return the in-tool action reference. Public; no scope required.",
         "codemode": "Run a JavaScript async arrow function that orchestrates yarr actions (the single `yarr` tool); returns { result, calls, logs }.",
         "op": "Invoke a generated OpenAPI operation by name on a spec-backed service (sonarr/radarr/prowlarr/overseerr/jellyfin/plex).",
+        "op_batch": "Invoke many generated OpenAPI operations against one service in one call; all items are validated first, then run with bounded concurrency.",
         "snippet_list": "List saved Code Mode snippets.",
         "snippet_save": "Save a Code Mode snippet by name for later reuse.",
         "snippet_run": "Run a saved Code Mode snippet by name, optionally with input.",
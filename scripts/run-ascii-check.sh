@@ -5,12 +5,18 @@
 # Usage:
 #   scripts/run-ascii-check.sh          # check mode (default)
 #   scripts/run-ascii-check.sh --fix    # rewrite smart punctuation to ASCII
+#
+# Set ASCIICHECK_CACHE to a file path to skip files whose contents already
+# passed on an earlier run.
 set -euo pipefail
 
 args=()
 if [[ "${1:-}" == "--fix" ]]; then
     args+=("--fix")
 fi
+if [[ -n "${ASCIICHECK_CACHE:-}" ]]; then
+    args+=("--cache" "$ASCIICHECK_CACHE")
+fi
 
 mapfile -t files < <(
     git ls-files '*.md' '*.rs' '*.toml' '*.json' '*.yml' '*.yaml' '*.sh' '*.py' \
@@ -28,7 +28,7 @@ pub use help::rest_help;
 #[cfg(test)]
 pub use model::DENY_SCOPE;
 pub use model::{
-    ActionSpec, ActionTransport, READ_SCOPE, ValidationError, WRITE_SCOPE, YarrAction,
+    ActionSpec, ActionTransport, OpBatchItem, READ_SCOPE, ValidationError, WRITE_SCOPE, YarrAction,
     is_validation_error, scopes_satisfy,
 };
 #[allow(unused_imports)]
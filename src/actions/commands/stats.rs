@@ -23,10 +23,10 @@
 use serde_json::Value;
 
 use crate::actions::model::{READ_SCOPE, WRITE_SCOPE};
-use crate::actions::parse::{optional_i64, optional_string, string_arg};
+use crate::actions::parse::{bool_arg, optional_i64, optional_string, string_arg};
 use crate::actions::registry::{
     CommandDescriptor, CommandFuture,
-    ParamType::{Integer, String as StringParam},
+    ParamType::{Boolean, Integer, String as StringParam},
 };
 use crate::app::YarrService;
 use crate::capability::Capability;
@@ -63,6 +63,26 @@ pub const STATS_COMMANDS: &[CommandDescriptor] = &[
         ],
         handler: handle_history,
     },
+    CommandDescriptor {
+        name: "stats_history_summary",
+        capability: Capability::Stats,
+        description: "Tautulli watch-history aggregates (plays, per-user counts, top \
+             titles, media types) from the local history index, synced incrementally \
+             first. Optional --days (window), --user, --top (ranking rows), --local \
+             (skip the sync).",
+        required_scope: READ_SCOPE,
+        required_params: &["service"],
+        optional_params: &["days", "user", "top", "local"],
+        destructive: false,
+        mutates: false,
+        typed_params: &[
+            ("days", Integer),
+            ("user", StringParam),
+            ("top", Integer),
+            ("local", Boolean),
+        ],
+        handler: handle_history_summary,
+    },
     CommandDescriptor {
         name: "stats_users",
         capability: Capability::Stats,
@@ -148,6 +168,18 @@ fn handle_history<'a>(svc: &'a YarrService, args: &'a Value) -> CommandFuture<'a
     })
 }
 
+fn handle_history_summary<'a>(svc: &'a YarrService, args: &'a Value) -> CommandFuture<'a> {
+    Box::pin(async move {
+        let service = string_arg(args, "service")?;
+        let days = optional_i64(args, "days")?;
+        let user = optional_string(args, "user")?;
+        let top = optional_i64(args, "top")?;
+        let local = bool_arg(args, "local")?;
+        svc.stats_history_summary(&service, days, user.as_deref(), top, !local)
+            .await
+    })
+}
+
 fn handle_users<'a>(svc: &'a YarrService, args: &'a Value) -> CommandFuture<'a> {
     Box::pin(async move {
         let service = string_arg(args, "service")?;
@@ -8,6 +8,7 @@ use serde_json::json;
 const ALL_COMMANDS: &[&str] = &[
     "stats_activity",
     "stats_history",
+    "stats_history_summary",
     "stats_users",
     "stats_libraries",
     "stats_refresh_libraries",
@@ -18,6 +19,7 @@ const ALL_COMMANDS: &[&str] = &[
 const READ_COMMANDS: &[&str] = &[
     "stats_activity",
     "stats_history",
+    "stats_history_summary",
     "stats_users",
     "stats_libraries",
 ];
@@ -68,6 +68,20 @@ pub const TRACE_COMMANDS: &[CommandDescriptor] = &[
         &[("page", Integer), ("page_size", Integer)],
         handle_history,
     ),
+    read(
+        "trace_history_summary",
+        "Tracearr session-history aggregates (plays, per-user counts, top titles, \
+         media types) from the local history index, synced incrementally first; \
+         optional days/user/top, local=true skips the sync.",
+        &["days", "user", "top", "local"],
+        &[
+            ("days", Integer),
+            ("user", StringParam),
+            ("top", Integer),
+            ("local", Boolean),
+        ],
+        handle_history_summary,
+    ),
     CommandDescriptor {
         name: "trace_terminate_stream",
         capability: Capability::Trace,
@@ -172,6 +186,19 @@ fn handle_history<'a>(svc: &'a YarrService, args: &'a Value) -> CommandFuture<'a
     })
 }
 
+fn handle_history_summary<'a>(svc: &'a YarrService, args: &'a Value) -> CommandFuture<'a> {
+    Box::pin(async move {
+        svc.trace_history_summary(
+            &string_arg(args, "service")?,
+            optional_i64(args, "days")?,
+            optional_string(args, "user")?.as_deref(),
+            optional_i64(args, "top")?,
+            !bool_arg(args, "local")?,
+        )
+        .await
+    })
+}
+
 fn handle_terminate<'a>(svc: &'a YarrService, args: &'a Value) -> CommandFuture<'a> {
     Box::pin(async move {
         svc.trace_terminate_stream(
@@ -3,7 +3,7 @@ use crate::actions::curated_command;
 
 #[test]
 fn trace_commands_are_registered_to_trace_capability() {
-    assert_eq!(TRACE_COMMANDS.len(), 9);
+    assert_eq!(TRACE_COMMANDS.len(), 10);
     for command in TRACE_COMMANDS {
         assert_eq!(command.capability, Capability::Trace);
         assert_eq!(curated_command(command.name).unwrap().name, command.name);
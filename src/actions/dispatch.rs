@@ -14,6 +14,7 @@ use super::help::help_text;
 use super::model::{ValidationError, YarrAction};
 use super::registry::{action_allowed_for_kind, curated_command, valid_actions_for_kind};
 use crate::app::YarrService;
+use crate::yarr::Projection;
 
 /// Validate that `action` (by name) may run against the service named `service_name`.
 ///
@@ -52,10 +53,12 @@ pub fn validate_action_for_service(
 /// a service (`help`) return `None`.
 fn target_service(action: &YarrAction) -> Option<&str> {
     match action {
-        // Infra actions that don't address a single service: `help` and `codemode`
-        // (the script reaches services per-call via the baked-in `<service>.<verb>`
+        // Infra actions that don't address a single service: `help`,
+        // `fleet_status` (every service at once), and `codemode` (the script
+        // reaches services per-call via the baked-in `<service>.<verb>`
         // callables).
         YarrAction::Help
+        | YarrAction::FleetStatus
         | YarrAction::CodeMode { .. }
         | YarrAction::SnippetList
         | YarrAction::SnippetSave { .. }
@@ -66,7 +69,8 @@ fn target_service(action: &YarrAction) -> Option<&str> {
         | YarrAction::ApiPost { service, .. }
         | YarrAction::ApiPut { service, .. }
         | YarrAction::ApiDelete { service, .. }
-        | YarrAction::Op { service, .. } => Some(service),
+        | YarrAction::Op { service, .. }
+        | YarrAction::OpBatch { service, .. } => Some(service),
         // Curated commands all carry `service` in their raw params (validated at
         // parse time), so the action×kind guard can resolve the kind for them too.
         YarrAction::Curated { params, .. } => params
@@ -77,6 +81,11 @@ fn target_service(action: &YarrAction) -> Option<&str> {
     }
 }
 
+/// Turn a parsed `fields` list into a response projection.
+fn projection(fields: Option<&[String]>) -> Option<Projection> {
+    fields.map(Projection::fields)
+}
+
 pub async fn execute_service_action(service: &YarrService, action: &YarrAction) -> Result<Value> {
     // Shared action×kind guard: runs for every action that targets a service,
     // on both the CLI and MCP paths. No-op for generic/infra actions.
@@ -88,7 +97,12 @@ pub async fn execute_service_action(service: &YarrService, action: &YarrAction)
         YarrAction::ApiGet {
             service: name,
             path,
-        } => service.api_get(name, path).await,
+            fields,
+        } => {
+            service
+                .api_get(name, path, projection(fields.as_deref()))
+                .await
+        }
         // L2-perf: `action` is borrowed (`&YarrAction`) so the passthrough
         // `body` cannot be moved out without changing this shared dispatch
         // signature (the CLI and MCP shims both pass `&action`). This is a single
@@ -113,13 +127,43 @@ pub async fn execute_service_action(service: &YarrService, action: &YarrAction)
         // command renders the structured [`rest_help`] payload directly and does
         // not route through here.)
         YarrAction::Help => Ok(serde_json::json!({ "help": help_text() })),
+        YarrAction::FleetStatus => service.fleet_status().await,
         // Generated OpenAPI operation: dispatch to the shared executor, which builds
         // the upstream request from the generated OperationSpec table.
         YarrAction::Op {
             service: name,
             op,
             args,
-        } => service.execute_operation(name, op, args).await,
+            fields,
+            all_pages: false,
+        } => {
+            service
+                .execute_operation(name, op, args, projection(fields.as_deref()))
+                .await
+        }
+        // Every page of a paged list: project each record, keep the envelope.
+        YarrAction::Op {
+            service: name,
+            op,
+            args,
+            fields,
+            all_pages: true,
+        } => {
+            let projection =
+                projection(fields.as_deref()).map(|projection| projection.at(&["records"]));
+            service
+                .execute_operation_pages(name, op, args, projection)
+                .await
+        }
+        YarrAction::OpBatch {
+            service: name,
+            items,
+            stop_on_error,
+        } => {
+            service
+                .execute_operation_batch(name, items, *stop_on_error)
+                .await
+        }
         // Code Mode runs a JS script that calls back into this same dispatch path;
         // all logic lives in the app layer.
         YarrAction::CodeMode { code } => service.codemode(code).await,
@@ -23,6 +23,7 @@ pub fn rest_help() -> Value {
         "usage": "Use the yarr MCP tool or CLI commands such as `yarr sonarr get --path /api/v3/system/status`.",
         "examples": {
             "service_status": {"action": "service_status", "service": "sonarr"},
+            "fleet_status": {"action": "fleet_status"},
             "api_get": {"action": "api_get", "service": "radarr", "path": "/api/v3/system/status"},
             "api_post": {"action": "api_post", "service": "overseerr", "path": "/api/v1/request", "body": {}},
             "api_put": {"action": "api_put", "service": "sonarr", "path": "/api/v3/series/editor", "body": {}},
@@ -50,6 +51,15 @@ fn generic_description(action: &str) -> &'static str {
         "api_delete" => {
             "DELETE a safe relative path. Requires `service` and `path`; optional `body`. Query params go in `path`. Direct trusted CLI calls run immediately. DESTRUCTIVE — on MCP the connected client must confirm via elicitation before it runs; clients without elicitation fail closed."
         }
+        "fleet_status" => {
+            "probe every configured service's status endpoint concurrently and return each one's `ok`, `latency_ms`, and `error`. No params."
+        }
+        "op" => {
+            "invoke a generated OpenAPI operation. Requires `service` and `op`; optional `args` (path/query params plus `body`) and `fields`. With `all_pages`, a paged list operation (`page`/`pageSize`/`totalRecords`/`records`) is read to the end, up to 50000 records, and `fields` applies to each record."
+        }
+        "op_batch" => {
+            "run up to 500 generated operations against one service in one call. Requires `service` and `items` (`[{op, args}]`, args as for `op`); optional `stop_on_error` skips items not yet started after the first failure. Every item is validated before any runs; returns per-item `status` and `error`. A batch containing a generated DELETE is DESTRUCTIVE and is confirmed once via MCP elicitation."
+        }
         "help" => "return this help text.",
         _ => "",
     }
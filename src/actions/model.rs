@@ -72,9 +72,12 @@ pub enum YarrAction {
     ServiceStatus {
         service: String,
     },
+    /// `fields` optionally projects the response while it is parsed (see
+    /// [`crate::yarr::Projection`]).
     ApiGet {
         service: String,
         path: String,
+        fields: Option<Vec<String>>,
     },
     ApiPost {
         service: String,
@@ -92,6 +95,9 @@ pub enum YarrAction {
         body: Option<Value>,
     },
     Help,
+    /// Every configured service's status and latency in one call, probed
+    /// concurrently (see [`crate::app::fleet`]). Infra action (no `service`).
+    FleetStatus,
     /// Code Mode: run a JavaScript async arrow function that calls yarr actions
     /// via `callTool` or the per-service `<service>.<verb>()` / `api.<service>`
     /// callables. Carries the raw user `code`; the engine + the async dispatch
@@ -123,11 +129,26 @@ pub enum YarrAction {
     /// names the generated `OperationSpec` (`crate::openapi`), and `args` carries
     /// path params, query params, and (for body ops) `args.body`. The whole
     /// generated surface dispatches through this one variant — no per-op code.
-    /// Requires `yarr:write`.
+    /// `fields` projects a JSON response like [`Self::ApiGet`]. With
+    /// `all_pages`, a paged operation is read to the end (see
+    /// `YarrService::execute_operation_pages`) and `fields` applies to each
+    /// record. Requires `yarr:write`.
     Op {
         service: String,
         op: String,
         args: Value,
+        fields: Option<Vec<String>>,
+        all_pages: bool,
+    },
+    /// Many generated operations against one service in a single call. Every
+    /// item is validated before any runs; they then execute with bounded
+    /// concurrency (see `YarrService::execute_operation_batch`). With
+    /// `stop_on_error`, items not yet started after the first failure are
+    /// skipped. Requires `yarr:write`.
+    OpBatch {
+        service: String,
+        items: Vec<OpBatchItem>,
+        stop_on_error: bool,
     },
     /// A curated, capability-scoped command resolved from the registry's
     /// descriptor table (e.g. `quality_profiles`, `list`). Carries the registry
@@ -140,6 +161,14 @@ pub enum YarrAction {
     },
 }
 
+/// One `op_batch` entry: a generated operation name and its args (path/query
+/// params and optional `body`, exactly as for [`YarrAction::Op`]).
+#[derive(Debug, Clone, PartialEq)]
+pub struct OpBatchItem {
+    pub op: String,
+    pub args: Value,
+}
+
 impl YarrAction {
     pub fn name(&self) -> &'static str {
         match self {
@@ -149,12 +178,14 @@ impl YarrAction {
             Self::ApiPut { .. } => "api_put",
             Self::ApiDelete { .. } => "api_delete",
             Self::Help => "help",
+            Self::FleetStatus => "fleet_status",
             Self::CodeMode { .. } => "codemode",
             Self::SnippetList => "snippet_list",
             Self::SnippetSave { .. } => "snippet_save",
             Self::SnippetRun { .. } => "snippet_run",
             Self::SnippetDelete { .. } => "snippet_delete",
             Self::Op { .. } => "op",
+            Self::OpBatch { .. } => "op_batch",
             Self::Curated { name, .. } => name,
         }
     }
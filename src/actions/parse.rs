@@ -4,7 +4,7 @@
 use anyhow::Result;
 use serde_json::{Value, json};
 
-use super::model::{ActionTransport, ValidationError, YarrAction};
+use super::model::{ActionTransport, OpBatchItem, ValidationError, YarrAction};
 use super::registry::{action_spec, curated_command};
 
 // ── shared param extractors (reused by curated command handlers too) ────────────
@@ -48,6 +48,34 @@ pub fn optional_string(args: &Value, field: &str) -> Result<Option<String>> {
     }
 }
 
+/// Optional array of non-blank strings. Absent, null, or empty means `None`;
+/// any other shape (or a non-string element) is rejected.
+pub fn optional_string_list(args: &Value, field: &str) -> Result<Option<Vec<String>>> {
+    let items = match args.get(field) {
+        None | Some(Value::Null) => return Ok(None),
+        Some(Value::Array(items)) => items,
+        Some(_) => {
+            return Err(ValidationError::WrongType {
+                field: field.into(),
+            }
+            .into());
+        }
+    };
+    let list = items
+        .iter()
+        .map(|item| {
+            item.as_str()
+                .map(str::trim)
+                .filter(|value| !value.is_empty())
+                .map(str::to_owned)
+                .ok_or_else(|| ValidationError::WrongType {
+                    field: field.into(),
+                })
+        })
+        .collect::<Result<Vec<_>, _>>()?;
+    Ok((!list.is_empty()).then_some(list))
+}
+
 /// Boolean field, defaulting to `false` only when absent/null. Present values of
 /// another JSON type are rejected rather than silently coerced.
 pub fn bool_arg(args: &Value, field: &str) -> Result<bool> {
@@ -97,6 +125,67 @@ pub fn require_present(args: &Value, field: &str) -> Result<()> {
     }
 }
 
+/// Most items one `op_batch` call may carry. Large enough for a season-sized
+/// bulk edit; beyond it, split the work across calls.
+pub const OP_BATCH_MAX_ITEMS: usize = 500;
+
+/// The `items` array of an `op_batch` call: 1..=[`OP_BATCH_MAX_ITEMS`] objects,
+/// each with a non-blank string `op` and an optional `args` object (default
+/// `{}`). Errors name the offending element, e.g. `items[3].op`.
+fn op_batch_items(params: &Value) -> Result<Vec<OpBatchItem>> {
+    let items = match params.get("items") {
+        None | Some(Value::Null) => {
+            return Err(ValidationError::MissingField {
+                field: "items".into(),
+            }
+            .into());
+        }
+        Some(Value::Array(items)) if items.is_empty() => {
+            return Err(ValidationError::MissingField {
+                field: "items".into(),
+            }
+            .into());
+        }
+        Some(Value::Array(items)) => items,
+        Some(_) => {
+            return Err(ValidationError::WrongType {
+                field: "items".into(),
+            }
+            .into());
+        }
+    };
+    anyhow::ensure!(
+        items.len() <= OP_BATCH_MAX_ITEMS,
+        "`items` holds {} entries; op_batch accepts at most {OP_BATCH_MAX_ITEMS}",
+        items.len()
+    );
+    items
+        .iter()
+        .enumerate()
+        .map(|(index, item)| {
+            let field = |name: &str| format!("items[{index}].{name}");
+            let op = match item.get("op") {
+                Some(Value::String(op)) if !op.trim().is_empty() => op.trim().to_owned(),
+                Some(Value::String(_)) | None | Some(Value::Null) => {
+                    return Err(ValidationError::MissingField { field: field("op") }.into());
+                }
+                Some(_) => return Err(ValidationError::WrongType { field: field("op") }.into()),
+            };
+            let args = match item.get("args") {
+                None | Some(Value::Null) => json!({}),
+                Some(args @ Value::Object(_)) => args.clone(),
+                Some(_) => {
+                    return Err(ValidationError::WrongType {
+                        field: field("args"),
+                    }
+                    .into());
+                }
+            };
+            Ok(OpBatchItem { op, args })
+        })
+        .collect()
+}
+
 /// Coerce a JSON value to an `i64` from a number or a numeric string.
 fn value_to_i64(value: &Value) -> Option<i64> {
     value
@@ -139,6 +228,7 @@ impl YarrAction {
             "api_get" => Ok(Self::ApiGet {
                 service: string_arg(params, "service")?,
                 path: string_arg(params, "path")?,
+                fields: optional_string_list(params, "fields")?,
             }),
             "api_post" => Ok(Self::ApiPost {
                 service: string_arg(params, "service")?,
@@ -156,6 +246,7 @@ impl YarrAction {
                 body: params.get("body").cloned(),
             }),
             "help" => Ok(Self::Help),
+            "fleet_status" => Ok(Self::FleetStatus),
             "codemode" => Ok(Self::CodeMode {
                 code: string_arg(params, "code")?,
             }),
@@ -176,6 +267,13 @@ impl YarrAction {
                 service: string_arg(params, "service")?,
                 op: string_arg(params, "op")?,
                 args: params.get("args").cloned().unwrap_or_else(|| json!({})),
+                fields: optional_string_list(params, "fields")?,
+                all_pages: bool_arg(params, "all_pages")?,
+            }),
+            "op_batch" => Ok(Self::OpBatch {
+                service: string_arg(params, "service")?,
+                items: op_batch_items(params)?,
+                stop_on_error: bool_arg(params, "stop_on_error")?,
             }),
             // Curated commands are not enum variants: resolve the action name in
             // the registry's descriptor table. The handler extracts its own
@@ -36,6 +36,10 @@ fn parses_mcp_actions() {
         YarrAction::from_mcp_args(&json!({"action": "help"})).unwrap(),
         YarrAction::Help
     );
+    assert_eq!(
+        YarrAction::from_rest("fleet_status", &json!({})).unwrap(),
+        YarrAction::FleetStatus
+    );
     assert_eq!(
         YarrAction::from_mcp_args(&json!({
             "action": "api_get",
@@ -46,8 +50,36 @@ fn parses_mcp_actions() {
         YarrAction::ApiGet {
             service: "sonarr".into(),
             path: "/api/v3/system/status".into(),
+            fields: None,
+        }
+    );
+}
+
+#[test]
+fn parses_api_get_field_projection() {
+    assert_eq!(
+        YarrAction::from_mcp_args(&json!({
+            "action": "api_get",
+            "service": "sonarr",
+            "path": "/api/v3/series",
+            "fields": ["id", " title "]
+        }))
+        .unwrap(),
+        YarrAction::ApiGet {
+            service: "sonarr".into(),
+            path: "/api/v3/series".into(),
+            fields: Some(vec!["id".into(), "title".into()]),
         }
     );
+    assert!(
+        YarrAction::from_mcp_args(&json!({
+            "action": "api_get",
+            "service": "sonarr",
+            "path": "/api/v3/series",
+            "fields": "id"
+        }))
+        .is_err()
+    );
 }
 
 #[test]
@@ -81,6 +113,84 @@ fn parses_put_and_delete_actions() {
     );
 }
 
+#[test]
+fn parses_op_all_pages() {
+    assert_eq!(
+        YarrAction::from_mcp_args(&json!({
+            "action": "op",
+            "service": "sonarr",
+            "op": "get_history",
+            "fields": ["id"],
+            "all_pages": true,
+        }))
+        .unwrap(),
+        YarrAction::Op {
+            service: "sonarr".into(),
+            op: "get_history".into(),
+            args: json!({}),
+            fields: Some(vec!["id".into()]),
+            all_pages: true,
+        }
+    );
+    assert!(
+        YarrAction::from_mcp_args(&json!({
+            "action": "op",
+            "service": "sonarr",
+            "op": "get_history",
+            "all_pages": "yes",
+        }))
+        .unwrap_err()
+        .to_string()
+        .contains("all_pages")
+    );
+}
+
+#[test]
+fn parses_op_batch_items() {
+    assert_eq!(
+        YarrAction::from_mcp_args(&json!({
+            "action": "op_batch",
+            "service": "sonarr",
+            "items": [
+                {"op": " get_series_by_id ", "args": {"id": 1}},
+                {"op": "get_system_status"}
+            ],
+            "stop_on_error": true
+        }))
+        .unwrap(),
+        YarrAction::OpBatch {
+            service: "sonarr".into(),
+            items: vec![
+                crate::actions::OpBatchItem {
+                    op: "get_series_by_id".into(),
+                    args: json!({"id": 1}),
+                },
+                crate::actions::OpBatchItem {
+                    op: "get_system_status".into(),
+                    args: json!({}),
+                },
+            ],
+            stop_on_error: true,
+        }
+    );
+
+    let batch = |items: serde_json::Value| {
+        YarrAction::from_mcp_args(
+            &json!({"action": "op_batch", "service": "sonarr", "items": items}),
+        )
+        .unwrap_err()
+        .to_string()
+    };
+    assert!(batch(json!([])).contains("`items` is required"));
+    assert!(batch(json!({"op": "x"})).contains("`items` has the wrong type"));
+    assert!(batch(json!([{"op": "x"}, {"args": {}}])).contains("`items[1].op` is required"));
+    assert!(
+        batch(json!([{"op": "x", "args": [1]}])).contains("`items[0].args` has the wrong type")
+    );
+    let too_many = vec![json!({"op": "x"}); OP_BATCH_MAX_ITEMS + 1];
+    assert!(batch(json!(too_many)).contains("at most 500"));
+}
+
 #[test]
 fn rejects_missing_required_fields() {
     let error = YarrAction::from_mcp_args(&json!({"action": "api_get"})).unwrap_err();
@@ -33,7 +33,7 @@ pub const ACTION_SPECS: &[ActionSpec] = &[
         required_scope: Some(WRITE_SCOPE),
         transport: ActionTransport::Any,
         required_params: &["service", "path"],
-        optional_params: &[],
+        optional_params: &["fields"],
         mutates: false,
         destructive: false,
     },
@@ -67,6 +67,18 @@ pub const ACTION_SPECS: &[ActionSpec] = &[
         mutates: true,
         destructive: true,
     },
+    // Fleet-wide status sweep: the `service_status` probe for every configured
+    // service at once, so an agent doesn't issue one call per service.
+    ActionSpec {
+        name: "fleet_status",
+        description: "Probe every configured service's status endpoint concurrently.",
+        required_scope: Some(READ_SCOPE),
+        transport: ActionTransport::Any,
+        required_params: &[],
+        optional_params: &[],
+        mutates: false,
+        destructive: false,
+    },
     ActionSpec {
         name: "help",
         description: "Return registry-derived action help.",
@@ -106,7 +118,21 @@ pub const ACTION_SPECS: &[ActionSpec] = &[
         required_scope: Some(WRITE_SCOPE),
         transport: ActionTransport::McpOnly,
         required_params: &["service", "op"],
-        optional_params: &["args"],
+        optional_params: &["args", "fields", "all_pages"],
+        mutates: true,
+        destructive: false,
+    },
+    // Many generated operations against one service in one call: validated up
+    // front, then run with bounded concurrency. Same scope and destructive policy
+    // as `op` — a batch containing a generated DELETE gets the MCP elicitation
+    // prompt once for the whole batch (see `is_destructive_op_call`).
+    ActionSpec {
+        name: "op_batch",
+        description: "Dispatch a batch of generated OpenAPI operations against one service.",
+        required_scope: Some(WRITE_SCOPE),
+        transport: ActionTransport::McpOnly,
+        required_params: &["service", "items"],
+        optional_params: &["stop_on_error"],
         mutates: true,
         destructive: false,
     },
@@ -27,9 +27,11 @@ fn action_metadata_matches_yarr_surface() {
             "api_post",
             "api_put",
             "api_delete",
+            "fleet_status",
             "help",
             "codemode",
             "op",
+            "op_batch",
             "snippet_list",
             "snippet_save",
             "snippet_run",
@@ -41,6 +43,7 @@ fn action_metadata_matches_yarr_surface() {
     assert_eq!(required_scope_for_action("api_put"), Some(WRITE_SCOPE));
     assert_eq!(required_scope_for_action("api_delete"), Some(WRITE_SCOPE));
     assert_eq!(required_scope_for_action("help"), None);
+    assert_eq!(required_scope_for_action("fleet_status"), Some(READ_SCOPE));
     assert_eq!(required_scope_for_action("codemode"), Some(WRITE_SCOPE));
     // `codemode` is MCP-only (and CLI via the infra path), so it is excluded from
     // the REST action surface.
@@ -52,6 +55,7 @@ fn action_metadata_matches_yarr_surface() {
             "api_post",
             "api_put",
             "api_delete",
+            "fleet_status",
             "help"
         ]
     );
@@ -60,6 +64,7 @@ fn action_metadata_matches_yarr_surface() {
         vec![
             "codemode",
             "op",
+            "op_batch",
             "snippet_list",
             "snippet_save",
             "snippet_run",
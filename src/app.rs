@@ -5,11 +5,13 @@ use serde_json::Value;
 
 use crate::{
     config::{ServiceConfig, ServiceKind, YarrConfig},
-    yarr::{YarrClient, validate_safe_path},
+    yarr::{Projection, YarrClient, validate_safe_path},
 };
 
 pub mod codemode;
 pub mod download;
+pub mod fleet;
+mod history;
 pub mod openapi_ops;
 pub mod stats;
 pub mod subtitles;
@@ -36,11 +38,19 @@ pub struct YarrService {
     /// path) because this struct's own `pub mod codemode;` (this file, above)
     /// would otherwise shadow the top-level engine module of the same name.
     semantic_cache: std::sync::Arc<crate::codemode::SemanticCache>,
-    codemode_preamble: std::sync::Arc<str>,
-    codemode_catalog: std::sync::Arc<[crate::codemode::catalog::CatalogEntry]>,
+    codemode_preamble: crate::codemode::Preamble,
+    /// Pre-initialized QuickJS runtimes, sized to `codemode_slots`.
+    codemode_pool: std::sync::Arc<crate::codemode::WarmPool>,
     codemode_slots: std::sync::Arc<tokio::sync::Semaphore>,
     codemode_queue_timeout: std::time::Duration,
     codemode_execution_timeout: std::time::Duration,
+    /// Global artifact quota ledger and retention sweep for the data dir,
+    /// shared across clones. See [`codemode::ArtifactJanitor`].
+    artifact_janitor: std::sync::Arc<codemode::ArtifactJanitor>,
+    /// Loaded watch-history indexes behind the `*_history_summary` actions,
+    /// shared across clones so each index file is read once per process. See
+    /// [`history`].
+    history_indexes: std::sync::Arc<history::HistoryIndexes>,
 }
 
 impl YarrService {
@@ -50,26 +60,38 @@ impl YarrService {
             .iter()
             .map(|service| (service.name.clone(), service.kind))
             .collect::<Vec<_>>();
+        let codemode_preamble = crate::codemode::Preamble::new(&configured);
         Self {
             client,
             services: config.services,
             data_dir: None,
             semantic_cache: std::sync::Arc::new(crate::codemode::SemanticCache::new()),
-            codemode_preamble: crate::codemode::build_preamble(&configured).into(),
-            codemode_catalog: crate::codemode::catalog::build_catalog(&configured).into(),
+            codemode_pool: std::sync::Arc::new(crate::codemode::WarmPool::new(
+                codemode_preamble.clone(),
+                crate::codemode::CODEMODE_MAX_CONCURRENT,
+            )),
+            codemode_preamble,
             codemode_slots: std::sync::Arc::new(tokio::sync::Semaphore::new(
                 crate::codemode::CODEMODE_MAX_CONCURRENT,
             )),
             codemode_queue_timeout: crate::codemode::CODEMODE_QUEUE_TIMEOUT,
             codemode_execution_timeout: crate::codemode::CODEMODE_TIMEOUT,
+            artifact_janitor: std::sync::Arc::default(),
+            history_indexes: std::sync::Arc::default(),
         }
     }
 
     /// Enable Code Mode `writeArtifact` by setting the artifacts root (typically
-    /// the resolved data dir). Builder so the `new(client, config)` signature and
+    /// the resolved data dir), which also persists semantic-search catalog
+    /// embeddings across processes. Builder so the `new(client, config)` signature and
     /// its call sites stay unchanged.
     pub fn with_data_dir(mut self, root: std::path::PathBuf) -> Self {
+        self.semantic_cache = std::sync::Arc::new(
+            crate::codemode::SemanticCache::new()
+                .with_store_dir(root.join(crate::codemode::CODEMODE_EMBEDDINGS_SUBDIR)),
+        );
         self.data_dir = Some(root);
+        self.artifact_janitor = std::sync::Arc::default();
         self
     }
 
@@ -83,6 +105,10 @@ impl YarrService {
     ) -> Self {
         self.codemode_slots =
             std::sync::Arc::new(tokio::sync::Semaphore::new(max_concurrent.max(1)));
+        self.codemode_pool = std::sync::Arc::new(crate::codemode::WarmPool::new(
+            self.codemode_preamble.clone(),
+            max_concurrent.max(1),
+        ));
         self.codemode_queue_timeout = queue_timeout;
         self.codemode_execution_timeout = execution_timeout;
         self
@@ -99,14 +125,24 @@ impl YarrService {
         &self.semantic_cache
     }
 
-    pub(crate) fn codemode_preamble(&self) -> std::sync::Arc<str> {
-        self.codemode_preamble.clone()
+    fn artifact_janitor(&self) -> &std::sync::Arc<codemode::ArtifactJanitor> {
+        &self.artifact_janitor
+    }
+
+    fn history_indexes(&self) -> &history::HistoryIndexes {
+        &self.history_indexes
+    }
+
+    pub(crate) fn codemode_pool(&self) -> std::sync::Arc<crate::codemode::WarmPool> {
+        self.codemode_pool.clone()
     }
 
+    /// The Code Mode discovery catalog, built on first use (see
+    /// [`crate::codemode::Preamble`]).
     pub(crate) fn codemode_catalog(
         &self,
     ) -> std::sync::Arc<[crate::codemode::catalog::CatalogEntry]> {
-        self.codemode_catalog.clone()
+        self.codemode_preamble.index().catalog()
     }
 
     /// Configured `(name, kind)` pairs, in declaration order. Drives the Code Mode
@@ -134,9 +170,24 @@ impl YarrService {
             .await
     }
 
-    pub async fn api_get(&self, service: &str, path: &str) -> Result<Value> {
+    /// GET passthrough. With a `projection`, only the selected fields are
+    /// parsed out of the response (see [`Projection`]).
+    pub async fn api_get(
+        &self,
+        service: &str,
+        path: &str,
+        projection: Option<Projection>,
+    ) -> Result<Value> {
         validate_safe_path(path)?;
-        self.client.get_json(self.service(service)?, path).await
+        let service = self.service(service)?;
+        match projection {
+            Some(projection) => {
+                self.client
+                    .get_json_projected(service, path, &projection)
+                    .await
+            }
+            None => self.client.get_json(service, path).await,
+        }
     }
 
     /// POST passthrough. Mutating but NOT destructive, so it runs immediately —
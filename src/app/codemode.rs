@@ -1,19 +1,21 @@
 //! Code Mode orchestration (business layer).
 //!
-//! Bridges the synchronous JS engine ([`crate::codemode`]) to yarr's async
-//! action dispatch. The engine runs on a blocking thread; each `callTool` becomes
-//! a [`ToolRequest`] sent over a channel to the async loop here, which dispatches
-//! it through the shared [`crate::actions::execute_service_action`] path and sends the result
-//! back. MCP callers install a guard that reauthorizes every inner action and
+//! Bridges the JS engine ([`crate::codemode`]) to yarr's async action dispatch.
+//! The engine runs on a blocking thread; each `callTool` becomes a
+//! [`ToolRequest`] sent over a channel to the async loop here, which dispatches
+//! it concurrently (bounded per run and per upstream service) through the shared
+//! [`crate::actions::execute_service_action`] path and posts the result back to
+//! the engine's completion channel. MCP callers install a guard that reauthorizes every inner action and
 //! requires fail-closed elicitation for destructive calls; direct trusted CLI
 //! execution has no peer elicitation channel.
 
 use std::pin::Pin;
-use std::sync::Mutex;
 use std::sync::atomic::{AtomicU64, Ordering};
 use std::time::Instant;
 
 use anyhow::Result;
+use futures_util::StreamExt;
+use futures_util::stream::FuturesUnordered;
 use serde_json::{Value, json};
 use tokio::sync::{mpsc, oneshot};
 
@@ -21,15 +23,14 @@ use crate::actions::YarrAction;
 use crate::app::YarrService;
 use crate::codemode::{
     self, CODEMODE_ARTIFACTS_SUBDIR, CODEMODE_MAX_ARTIFACT_TOTAL_BYTES, CODEMODE_MAX_ARTIFACTS,
-    CODEMODE_MAX_CODE_BYTES, CODEMODE_MEMORY_LIMIT, CODEMODE_STACK_LIMIT, EngineLimits,
-    EngineOutcome,
+    CODEMODE_MAX_CODE_BYTES, CODEMODE_MAX_PARALLEL_CALLS, CODEMODE_MAX_PARALLEL_CALLS_PER_SERVICE,
+    CODEMODE_MEMORY_LIMIT, CODEMODE_STACK_LIMIT, EngineLimits, EngineOutcome, ToolBridge,
 };
 
 /// Process-global monotonic sequence appended to each run-id. Two concurrent runs
 /// in the same process could compute the same nanosecond timestamp; the sequence
 /// guarantees their run-ids (and thus artifacts dirs) are always distinct.
 static CODEMODE_RUN_SEQ: AtomicU64 = AtomicU64::new(0);
-static ARTIFACT_WRITE_LOCK: Mutex<()> = Mutex::new(());
 
 #[path = "codemode_artifacts.rs"]
 mod artifacts;
@@ -40,8 +41,11 @@ mod runtime;
 #[path = "codemode_snippets.rs"]
 mod snippets;
 
-use artifacts::{prune_artifact_runs, write_codemode_artifact};
-use runtime::{ActiveRunMetric, ArtifactRequest, EmbedRequest, ToolRequest};
+pub(super) use artifacts::ArtifactJanitor;
+use artifacts::write_codemode_artifact;
+use runtime::{
+    ActiveRunMetric, ArtifactRequest, CallSlots, EmbedRequest, ToolRequest, record_phase,
+};
 
 /// MCP-supplied defense-in-depth policy for every action emitted by a Code
 /// Mode script. CLI runs use no guard and retain their local-trust behavior.
@@ -76,6 +80,7 @@ impl YarrService {
     /// (for `snippet_run`); `in_snippet` is true when running a saved snippet, which
     /// refuses a further `snippet_run` so snippets can't recurse into snippets
     /// (the only nesting bound needed — max depth is 2).
+    #[tracing::instrument(name = "codemode.run", level = "debug", skip_all, fields(in_snippet))]
     async fn run_script(
         &self,
         code: &str,
@@ -93,18 +98,21 @@ impl YarrService {
             );
         }
 
-        let _permit = tokio::time::timeout(
+        let queued = Instant::now();
+        let permit = tokio::time::timeout(
             self.codemode_queue_timeout,
             self.codemode_slots.clone().acquire_owned(),
         )
-        .await
-        .map_err(|_| anyhow::anyhow!("codemode is busy; retry after the queue clears"))?
-        .map_err(|_| anyhow::anyhow!("codemode execution pool is unavailable"))?;
+        .await;
+        record_phase("queue_wait", queued.elapsed());
+        let _permit = permit
+            .map_err(|_| anyhow::anyhow!("codemode is busy; retry after the queue clears"))?
+            .map_err(|_| anyhow::anyhow!("codemode execution pool is unavailable"))?;
         let mut active_metric = ActiveRunMetric::begin();
         axum_prometheus::metrics::counter!("yarr_codemode_runs_total", "outcome" => "started")
             .increment(1);
 
-        let preamble = self.codemode_preamble();
+        let pool = self.codemode_pool();
         let code = code.to_owned();
         let (req_tx, mut req_rx) = mpsc::channel::<ToolRequest>(8);
         let (art_tx, mut art_rx) = mpsc::channel::<ArtifactRequest>(8);
@@ -119,7 +127,10 @@ impl YarrService {
         // Per-run artifacts dir, computed host-side (the engine never reads a clock).
         // `None` when no artifacts root is configured → `writeArtifact` errors.
         let run = self.data_dir().map(|root| {
-            prune_artifact_runs(root);
+            self.artifact_janitor().schedule(
+                root.join(CODEMODE_ARTIFACTS_SUBDIR),
+                self.codemode_execution_timeout,
+            );
             let nanos = std::time::SystemTime::now()
                 .duration_since(std::time::UNIX_EPOCH)
                 .map(|d| d.as_nanos())
@@ -130,30 +141,34 @@ impl YarrService {
             (run_id, dir)
         });
 
-        // The engine runs on a blocking thread; `on_call`/`on_write` block it on a
-        // channel round-trip to the async loop below (never the reverse, so no
-        // deadlock).
+        // The engine runs on a blocking thread. `callTool` submissions are
+        // fire-and-forget sends to the async loop below, which replies on the
+        // engine's completion channel; `on_write`/`on_embed` block it on a
+        // channel round-trip (never the reverse, so no deadlock).
+        let run_span = tracing::Span::current();
         let handle = tokio::task::spawn_blocking(move || {
-            let on_call: codemode::ToolCaller = Box::new(move |id: &str, params_json: &str| {
-                let (reply_tx, reply_rx) = oneshot::channel();
-                req_tx
-                    .blocking_send(ToolRequest {
-                        id: id.to_owned(),
-                        params_json: params_json.to_owned(),
-                        reply: reply_tx,
-                    })
-                    .map_err(|_| "codemode dispatcher unavailable".to_string())?;
-                reply_rx
-                    .blocking_recv()
-                    .map_err(|_| "codemode dispatch was dropped".to_string())?
-            });
+            let _span = run_span.entered();
+            let (done_tx, completions) = std::sync::mpsc::channel();
+            let on_call = ToolBridge {
+                submit: Box::new(move |ticket: u32, id: &str, params_json: &str| {
+                    req_tx
+                        .blocking_send(ToolRequest {
+                            ticket,
+                            id: id.to_owned(),
+                            params_json: params_json.to_owned(),
+                            reply: done_tx.clone(),
+                        })
+                        .map_err(|_| "codemode dispatcher unavailable".to_string())
+                }),
+                completions,
+            };
             let on_write: codemode::ArtifactWriter =
-                Box::new(move |path: &str, content: &str, options_json: &str| {
+                Box::new(move |path: &str, content: String, options_json: &str| {
                     let (reply_tx, reply_rx) = oneshot::channel();
                     art_tx
                         .blocking_send(ArtifactRequest {
                             path: path.to_owned(),
-                            content: content.to_owned(),
+                            content,
                             options_json: options_json.to_owned(),
                             reply: reply_tx,
                         })
@@ -177,9 +192,10 @@ impl YarrService {
                     .blocking_recv()
                     .map_err(|_| "codemode embed request was dropped".to_string())?
             });
-            codemode::run(
+            let (prepared, _start) = pool.checkout()?;
+            codemode::run_prepared(
+                prepared,
                 &code,
-                &preamble,
                 &limits,
                 on_call,
                 on_write,
@@ -188,12 +204,27 @@ impl YarrService {
             )
         });
 
-        // Drive ALL THREE channels until each is drained to `None`. The engine drops
-        // all three senders together when it finishes, but buffered messages must
-        // still be received — so we keep selecting (with per-branch `done` guards,
-        // never breaking on the first `None`) until all are exhausted. Guarding the
-        // branches also avoids busy-spinning on a closed receiver.
-        let mut calls: Vec<Value> = Vec::new();
+        // Replace the runtime this run consumes off the request path, so the
+        // next run starts warm.
+        let refill = self.codemode_pool();
+        tokio::task::spawn_blocking(move || {
+            if let Err(error) = refill.refill() {
+                tracing::warn!(%error, "codemode warm pool refill failed");
+            }
+        });
+
+        // Drive ALL THREE channels until each is drained to `None`, plus every
+        // in-flight call. The engine drops all three senders together when it
+        // finishes, but buffered messages must still be received — so we keep
+        // selecting (with per-branch `done` guards, never breaking on the first
+        // `None`) until all are exhausted. Guarding the branches also avoids
+        // busy-spinning on a closed receiver.
+        let mut calls: Vec<(u32, Value)> = Vec::new();
+        let mut slots = CallSlots::new(
+            CODEMODE_MAX_PARALLEL_CALLS,
+            CODEMODE_MAX_PARALLEL_CALLS_PER_SERVICE,
+        );
+        let mut in_flight = FuturesUnordered::new();
         let mut artifacts: Vec<Value> = Vec::new();
         let mut written = 0usize;
         let mut written_bytes = 0usize;
@@ -204,36 +235,25 @@ impl YarrService {
             tokio::select! {
                 maybe = req_rx.recv(), if !req_done => match maybe {
                     Some(req) => {
-                        let started = Instant::now();
-                        let outcome = tokio::time::timeout_at(
+                        let permits = slots.for_call(&req.params_json);
+                        in_flight.push(self.codemode_call(
+                            req,
+                            permits,
+                            in_snippet,
+                            guard.clone(),
                             tokio_deadline,
-                            self.codemode_dispatch(
-                                &req.id,
-                                &req.params_json,
-                                in_snippet,
-                                guard.clone(),
-                            ),
-                        )
-                        .await
-                        .unwrap_or_else(|_| Err("codemode absolute deadline exceeded".to_string()));
-                        let elapsed_ms = started.elapsed().as_millis();
-                        let ok = outcome.is_ok();
-                        let error = outcome.as_ref().err().cloned();
-                        // Record whether the script actually received the result: a
-                        // failed send means the engine already abandoned this call
-                        // (deadline fired mid-flight), so `ok` describes the action
-                        // but the script never saw it — surface that, never hide it.
-                        let delivered = req.reply.send(outcome).is_ok();
-                        calls.push(json!({
-                            "action": req.id, "ok": ok, "error": error,
-                            "delivered": delivered, "elapsed_ms": elapsed_ms,
-                        }));
+                        ));
                     }
                     None => req_done = true,
                 },
+                // Calls the script stopped awaiting still run to completion
+                // (they may be writes); the loop only ends once all are done.
+                Some(call) = in_flight.next(), if !in_flight.is_empty() => calls.push(call),
                 maybe = art_rx.recv(), if !art_done => match maybe {
                     Some(art) => {
-                        let next_total = written_bytes.saturating_add(art.content.len());
+                        let ArtifactRequest { path, content, options_json, reply } = art;
+                        let bytes = content.len();
+                        let next_total = written_bytes.saturating_add(bytes);
                         let outcome = if written >= CODEMODE_MAX_ARTIFACTS {
                             Err(format!(
                                 "writeArtifact limit reached ({CODEMODE_MAX_ARTIFACTS} artifacts per run)"
@@ -243,20 +263,24 @@ impl YarrService {
                                 "writeArtifact aggregate limit exceeded ({CODEMODE_MAX_ARTIFACT_TOTAL_BYTES} bytes per run)"
                             ))
                         } else {
+                            // The content moves into the writer; only the small
+                            // path is kept back for the audit entry.
                             let run = run.clone();
-                            let path = art.path.clone();
-                            let content = art.content.clone();
-                            let options = art.options_json.clone();
-                            match tokio::time::timeout_at(
+                            let target = path.clone();
+                            let writing = Instant::now();
+                            let span = tracing::debug_span!("codemode.artifact_write");
+                            let write = tokio::time::timeout_at(
                                 tokio_deadline,
                                 tokio::task::spawn_blocking(move || {
+                                    let _span = span.entered();
                                     write_codemode_artifact(
-                                        run.as_ref(), &path, &content, &options,
+                                        run.as_ref(), &target, content, &options_json,
                                     )
                                 }),
                             )
-                            .await
-                            {
+                            .await;
+                            record_phase("artifact_write", writing.elapsed());
+                            match write {
                                 Ok(Ok(result)) => result,
                                 Ok(Err(error)) => Err(format!("artifact writer failed: {error}")),
                                 Err(_) => Err("codemode absolute deadline exceeded".to_string()),
@@ -269,22 +293,22 @@ impl YarrService {
                                 "yarr_artifact_bytes_total",
                                 "outcome" => "written"
                             )
-                            .increment(art.content.len() as u64);
+                            .increment(bytes as u64);
                         } else {
                             axum_prometheus::metrics::counter!(
                                 "yarr_artifact_bytes_total",
                                 "outcome" => "error"
                             )
-                            .increment(art.content.len() as u64);
+                            .increment(bytes as u64);
                         }
                         let ok = outcome.is_ok();
                         let error = outcome.as_ref().err().cloned();
                         // The file is already written + counted; if the receipt can't
                         // be delivered (receiver dropped), record `delivered:false` so
                         // the response doesn't claim a write the script never saw.
-                        let delivered = art.reply.send(outcome).is_ok();
+                        let delivered = reply.send(outcome).is_ok();
                         artifacts.push(json!({
-                            "path": art.path, "ok": ok, "error": error, "delivered": delivered,
+                            "path": path, "ok": ok, "error": error, "delivered": delivered,
                         }));
                     }
                     None => art_done = true,
@@ -314,6 +338,9 @@ impl YarrService {
             .map_err(|e| anyhow::anyhow!("{e}"))?;
         active_metric.complete();
 
+        // Completion order is nondeterministic; keep the audit log in call order.
+        calls.sort_unstable_by_key(|(ticket, _)| *ticket);
+        let calls: Vec<Value> = calls.into_iter().map(|(_, call)| call).collect();
         let mut response = json!({
             "result": outcome.result,
             "calls": calls,
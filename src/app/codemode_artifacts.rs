@@ -1,22 +1,150 @@
 //! Code Mode artifact persistence, quotas, and retention.
+//!
+//! Runs never share a directory, and a run's writes are already serialized by
+//! its own dispatch loop. The global quota is answered by a ledger file under
+//! the artifact root that counts the retained bytes of every process writing
+//! there. This matters in stdio mode, where each client session is its own
+//! `yarr mcp` process on the shared data dir. A write reserves its bytes in
+//! the ledger before it starts and, once it lands, gives back the size of any
+//! file it replaced; a failed write gives back the whole reservation. The
+//! ledger is locked only for each read-modify-write of the count, never across
+//! the write itself.
+//!
+//! Retention is a background sweep started from run admission at most once
+//! per [`CODEMODE_ARTIFACT_SWEEP_INTERVAL`]; it re-anchors the ledger to what
+//! is actually on disk. Until then the count can drift by the writes in flight
+//! at a bad moment: a reservation made while a sweep walks the root is
+//! dropped by the re-anchor, and a process killed mid-write leaves its
+//! reservation counted. The lock is advisory, so the quota only holds between
+//! yarr processes on a filesystem that honours it.
 
 use std::{
+    io::{Read as _, Seek as _, Write as _},
     path::{Path, PathBuf},
-    sync::atomic::Ordering,
+    sync::{
+        Arc, Mutex,
+        atomic::{AtomicBool, Ordering},
+    },
+    time::{Duration, Instant},
 };
 
+use fs2::FileExt as _;
 use serde_json::{Value, json};
 
-use super::{ARTIFACT_WRITE_LOCK, CODEMODE_RUN_SEQ};
+use super::CODEMODE_RUN_SEQ;
 use crate::codemode::{
     self, CODEMODE_ARTIFACT_GLOBAL_BYTES, CODEMODE_ARTIFACT_MIN_FREE_BYTES,
-    CODEMODE_ARTIFACT_RETENTION, CODEMODE_ARTIFACTS_SUBDIR, CODEMODE_MAX_ARTIFACT_BYTES,
+    CODEMODE_ARTIFACT_RETENTION, CODEMODE_ARTIFACT_SWEEP_INTERVAL,
+    CODEMODE_ARTIFACT_SWEEP_TARGET_BYTES, CODEMODE_MAX_ARTIFACT_BYTES,
 };
 
+/// The retained-bytes ledger, at the top of the artifact root.
+pub(super) const LEDGER_FILE: &str = ".retained-bytes";
+
+/// Retention sweep scheduling for one artifact root, shared by every clone of
+/// a [`crate::app::YarrService`].
+#[derive(Default)]
+pub(crate) struct ArtifactJanitor {
+    /// When this process last started a sweep.
+    last_sweep: Mutex<Option<Instant>>,
+    /// Set while a sweep runs, so admissions never start a second one.
+    sweeping: AtomicBool,
+}
+
+impl ArtifactJanitor {
+    fn last_sweep(&self) -> std::sync::MutexGuard<'_, Option<Instant>> {
+        self.last_sweep
+            .lock()
+            .unwrap_or_else(std::sync::PoisonError::into_inner)
+    }
+
+    /// Start a retention sweep of `root` on a blocking thread when one is due.
+    /// Run directories modified within `min_idle` may still be written to, so
+    /// the size budget never evicts them.
+    pub(crate) fn schedule(self: &Arc<Self>, root: PathBuf, min_idle: Duration) {
+        let due = self
+            .last_sweep()
+            .is_none_or(|at| at.elapsed() >= CODEMODE_ARTIFACT_SWEEP_INTERVAL);
+        if !due || self.sweeping.swap(true, Ordering::AcqRel) {
+            return;
+        }
+        let janitor = self.clone();
+        tokio::task::spawn_blocking(move || {
+            janitor.sweep(&root, min_idle, CODEMODE_ARTIFACT_SWEEP_TARGET_BYTES);
+            janitor.sweeping.store(false, Ordering::Release);
+        });
+    }
+
+    fn sweep(&self, root: &Path, min_idle: Duration, target: u64) {
+        *self.last_sweep() = Some(Instant::now());
+        let retained = sweep_runs(root, min_idle, target);
+        if let Err(error) = update_ledger(root, |_| Ok(retained)) {
+            tracing::warn!(%error, "artifact sweep could not re-anchor the quota ledger");
+        }
+        axum_prometheus::metrics::gauge!("yarr_artifact_retained_bytes").set(retained as f64);
+    }
+}
+
+/// Read-modify-write the ledger count under an exclusive lock. A ledger that
+/// is missing or unreadable is seeded from the bytes on disk.
+fn update_ledger(
+    root: &Path,
+    update: impl FnOnce(u64) -> Result<u64, String>,
+) -> Result<(), String> {
+    std::fs::create_dir_all(root)
+        .map_err(|error| format!("writeArtifact could not create artifact root: {error}"))?;
+    let mut ledger = std::fs::OpenOptions::new()
+        .read(true)
+        .write(true)
+        .create(true)
+        .truncate(false)
+        .open(root.join(LEDGER_FILE))
+        .and_then(|file| file.lock_exclusive().map(|()| file))
+        .map_err(|error| format!("writeArtifact could not open the quota ledger: {error}"))?;
+    let mut text = String::new();
+    let retained = match ledger.read_to_string(&mut text) {
+        Ok(_) => text.trim().parse().ok(),
+        Err(_) => None,
+    }
+    .unwrap_or_else(|| directory_bytes(root));
+    let retained = update(retained)?;
+    // Closing the file releases the lock.
+    ledger
+        .rewind()
+        .and_then(|()| ledger.set_len(0))
+        .and_then(|()| write!(ledger, "{retained}"))
+        .map_err(|error| format!("writeArtifact could not update the quota ledger: {error}"))
+}
+
+/// Claim `bytes` of the global quota for a write about to start.
+fn reserve(root: &Path, bytes: u64) -> Result<(), String> {
+    update_ledger(root, |retained| {
+        let retained = retained.saturating_add(bytes);
+        if retained > CODEMODE_ARTIFACT_GLOBAL_BYTES {
+            return Err(format!(
+                "writeArtifact global quota exceeded ({CODEMODE_ARTIFACT_GLOBAL_BYTES} retained bytes)"
+            ));
+        }
+        Ok(retained)
+    })
+}
+
+/// Give back what a finished write does not retain: the file it replaced when
+/// it landed, the whole reservation when it failed.
+fn settle(root: &Path, reserved: u64, replaced: u64, committed: bool) {
+    let release = if committed { replaced } else { reserved };
+    if release == 0 {
+        return;
+    }
+    if let Err(error) = update_ledger(root, |retained| Ok(retained.saturating_sub(release))) {
+        tracing::warn!(%error, "writeArtifact could not settle its quota reservation");
+    }
+}
+
 pub(super) fn write_codemode_artifact(
     run: Option<&(String, PathBuf)>,
     path: &str,
-    content: &str,
+    content: String,
     options_json: &str,
 ) -> Result<String, String> {
     let (_, dir) = run.ok_or_else(|| {
@@ -36,17 +164,28 @@ pub(super) fn write_codemode_artifact(
         options.get("contentType").and_then(Value::as_str),
     );
 
-    let _guard = ARTIFACT_WRITE_LOCK
-        .lock()
-        .unwrap_or_else(std::sync::PoisonError::into_inner);
     let root = dir
         .parent()
         .ok_or_else(|| "writeArtifact run directory has no artifact root".to_owned())?;
-    if directory_bytes(root).saturating_add(content.len() as u64) > CODEMODE_ARTIFACT_GLOBAL_BYTES {
-        return Err(format!(
-            "writeArtifact global quota exceeded ({CODEMODE_ARTIFACT_GLOBAL_BYTES} retained bytes)"
-        ));
-    }
+    let bytes = content.len() as u64;
+    let replaced = std::fs::metadata(&full)
+        .ok()
+        .filter(std::fs::Metadata::is_file)
+        .map_or(0, |metadata| metadata.len());
+    reserve(root, bytes)?;
+    let result = persist(root, &full, content.as_bytes());
+    settle(root, bytes, replaced, result.is_ok());
+    result?;
+    Ok(json!({
+        "path": relative.to_string_lossy(),
+        "bytes": content.len(),
+        "contentType": content_type,
+    })
+    .to_string())
+}
+
+/// Write `content` to `full` through a synced temporary file and a rename.
+fn persist(root: &Path, full: &Path, content: &[u8]) -> Result<(), String> {
     std::fs::create_dir_all(root)
         .map_err(|error| format!("writeArtifact could not create artifact root: {error}"))?;
     let available = fs2::available_space(root)
@@ -69,22 +208,16 @@ pub(super) fn write_codemode_artifact(
             .write(true)
             .open(&temporary)
             .map_err(|error| format!("writeArtifact could not create temporary file: {error}"))?;
-        file.write_all(content.as_bytes())
+        file.write_all(content)
             .and_then(|()| file.sync_all())
             .map_err(|error| format!("writeArtifact could not persist temporary file: {error}"))?;
-        std::fs::rename(&temporary, &full)
+        std::fs::rename(&temporary, full)
             .map_err(|error| format!("writeArtifact could not commit file: {error}"))
     })();
     if result.is_err() {
         let _ = std::fs::remove_file(&temporary);
     }
-    result?;
-    Ok(json!({
-        "path": relative.to_string_lossy(),
-        "bytes": content.len(),
-        "contentType": content_type,
-    })
-    .to_string())
+    result
 }
 
 fn directory_bytes(root: &Path) -> u64 {
@@ -106,22 +239,54 @@ fn directory_bytes(root: &Path) -> u64 {
     total
 }
 
-pub(super) fn prune_artifact_runs(data_dir: &Path) {
-    let root = data_dir.join(CODEMODE_ARTIFACTS_SUBDIR);
+/// Remove run directories older than [`CODEMODE_ARTIFACT_RETENTION`], then the
+/// oldest idle ones until at most `target` bytes remain. Returns the bytes left
+/// under `root`.
+pub(super) fn sweep_runs(root: &Path, min_idle: Duration, target: u64) -> u64 {
     let Ok(entries) = std::fs::read_dir(root) else {
-        return;
+        return 0;
     };
     let now = std::time::SystemTime::now();
+    let mut retained = 0_u64;
+    let mut runs = Vec::new();
     for entry in entries.flatten() {
+        let Ok(metadata) = entry.metadata() else {
+            continue;
+        };
         let path = entry.path();
-        let expired = entry
-            .metadata()
+        if !metadata.is_dir() {
+            if metadata.is_file() {
+                retained = retained.saturating_add(metadata.len());
+            }
+            continue;
+        }
+        let age = metadata
+            .modified()
             .ok()
-            .and_then(|metadata| metadata.modified().ok())
             .and_then(|modified| now.duration_since(modified).ok())
-            .is_some_and(|age| age > CODEMODE_ARTIFACT_RETENTION);
-        if expired && path.is_dir() {
-            let _ = std::fs::remove_dir_all(path);
+            .unwrap_or_default();
+        if age > CODEMODE_ARTIFACT_RETENTION && std::fs::remove_dir_all(&path).is_ok() {
+            record_prune("age");
+            continue;
         }
+        let bytes = directory_bytes(&path);
+        retained = retained.saturating_add(bytes);
+        runs.push((age, path, bytes));
     }
+    runs.sort_unstable_by(|a, b| b.0.cmp(&a.0));
+    for (age, path, bytes) in runs {
+        if retained <= target || age < min_idle {
+            break;
+        }
+        if std::fs::remove_dir_all(&path).is_ok() {
+            retained = retained.saturating_sub(bytes);
+            record_prune("size");
+        }
+    }
+    retained
+}
+
+fn record_prune(reason: &'static str) {
+    axum_prometheus::metrics::counter!("yarr_artifact_runs_pruned_total", "reason" => reason)
+        .increment(1);
 }
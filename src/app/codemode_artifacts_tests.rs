@@ -1,3 +1,7 @@
+use std::time::Duration;
+
+use super::super::artifacts::{LEDGER_FILE, sweep_runs, write_codemode_artifact};
+use crate::codemode::{CODEMODE_ARTIFACT_GLOBAL_BYTES, CODEMODE_ARTIFACT_RETENTION};
 use crate::testing::loopback_state;
 
 #[tokio::test]
@@ -70,3 +74,82 @@ async fn enforces_aggregate_bytes_per_run() {
     let out = service.codemode(r#"async () => { const chunk = "x".repeat(8 * 1024 * 1024); await writeArtifact("one.bin", chunk); await writeArtifact("two.bin", chunk); try { await writeArtifact("three.bin", "x"); } catch (error) { return error.message; } }"#).await.unwrap();
     assert!(out["result"].as_str().unwrap().contains("aggregate"));
 }
+
+#[test]
+fn the_global_quota_counts_what_other_processes_left_in_the_ledger() {
+    let tmp = tempfile::tempdir().unwrap();
+    let root = tmp.path();
+    let run = ("run".to_owned(), root.join("run"));
+    // Another process already retains all but 10 bytes of the quota.
+    let others = CODEMODE_ARTIFACT_GLOBAL_BYTES - 10;
+    std::fs::write(root.join(LEDGER_FILE), others.to_string()).unwrap();
+
+    let error = write_codemode_artifact(Some(&run), "a.txt", "x".repeat(11), "{}").unwrap_err();
+    assert!(error.contains("global quota"), "{error}");
+    write_codemode_artifact(Some(&run), "a.txt", "x".repeat(10), "{}").unwrap();
+    assert!(write_codemode_artifact(Some(&run), "b.txt", "x".into(), "{}").is_err());
+}
+
+#[test]
+fn an_overwritten_artifact_is_counted_once() {
+    let tmp = tempfile::tempdir().unwrap();
+    let root = tmp.path();
+    let run = ("run".to_owned(), root.join("run"));
+    for content in ["first", "second!"] {
+        write_codemode_artifact(Some(&run), "out.txt", content.into(), "{}").unwrap();
+    }
+    let ledger = std::fs::read_to_string(root.join(LEDGER_FILE)).unwrap();
+    assert_eq!(ledger, "7");
+}
+
+fn run_dir(root: &std::path::Path, name: &str, bytes: usize, age: Duration) {
+    let dir = root.join(name);
+    std::fs::create_dir_all(&dir).unwrap();
+    std::fs::write(dir.join("out.csv"), vec![b'x'; bytes]).unwrap();
+    std::fs::File::open(&dir)
+        .unwrap()
+        .set_modified(std::time::SystemTime::now() - age)
+        .unwrap();
+}
+
+#[test]
+fn sweeps_drop_expired_runs_then_the_oldest_idle_ones_over_budget() {
+    let tmp = tempfile::tempdir().unwrap();
+    let root = tmp.path();
+    let hour = Duration::from_secs(60 * 60);
+    run_dir(root, "expired", 10, CODEMODE_ARTIFACT_RETENTION + hour);
+    run_dir(root, "oldest", 10, 3 * hour);
+    run_dir(root, "older", 10, 2 * hour);
+    run_dir(root, "active", 10, Duration::ZERO);
+
+    let retained = sweep_runs(root, hour, 25);
+
+    assert_eq!(retained, 20);
+    assert!(!root.join("expired").exists());
+    assert!(!root.join("oldest").exists());
+    assert!(root.join("older").exists());
+
+    // Runs that may still be writing survive even over budget.
+    let retained = sweep_runs(root, hour, 0);
+    assert_eq!(retained, 10);
+    assert!(root.join("active").exists());
+}
+
+#[tokio::test]
+async fn run_admission_sweeps_expired_runs_in_the_background() {
+    let tmp = tempfile::tempdir().unwrap();
+    let root = tmp.path().join("codemode/artifacts");
+    run_dir(&root, "stale", 1, CODEMODE_ARTIFACT_RETENTION * 2);
+    let service = loopback_state()
+        .service
+        .with_data_dir(tmp.path().to_path_buf());
+    service.codemode("async () => 1").await.unwrap();
+
+    for _ in 0..100 {
+        if !root.join("stale").exists() {
+            return;
+        }
+        tokio::time::sleep(Duration::from_millis(20)).await;
+    }
+    panic!("the stale run directory was never swept");
+}
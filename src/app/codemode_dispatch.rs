@@ -1,14 +1,72 @@
 //! Dispatch and semantic-search bridges for Code Mode scripts.
 
-use serde_json::{Map, Value};
+use std::time::Instant;
+
+use serde_json::{Map, Value, json};
+use tracing::Instrument;
 
 use super::CodeModeCallGuard;
+use super::runtime::{CallPermits, ToolRequest, record_phase};
+use crate::codemode::ToolCompletion;
 use crate::{
     actions::{YarrAction, execute_service_action},
     app::YarrService,
 };
 
 impl YarrService {
+    /// Run one submitted `callTool` under its admission permits and the run's
+    /// absolute deadline, deliver the result to the engine, and return the
+    /// call's `(ticket, audit entry)`. Many of these run concurrently per script.
+    pub(super) async fn codemode_call(
+        &self,
+        req: ToolRequest,
+        permits: CallPermits,
+        in_snippet: bool,
+        guard: Option<std::sync::Arc<dyn CodeModeCallGuard>>,
+        deadline: tokio::time::Instant,
+    ) -> (u32, Value) {
+        let started = Instant::now();
+        let span = tracing::debug_span!("codemode.call", action = %req.id, ticket = req.ticket);
+        let outcome = tokio::time::timeout_at(deadline, async {
+            // Service slot first: a call queued behind its own upstream must not
+            // hold a run-wide slot that another service's call could use.
+            let _service = match permits.service.as_ref() {
+                Some(slot) => Some(slot.acquire().await),
+                None => None,
+            };
+            let _run = permits.run.acquire().await;
+            record_phase("call_wait", started.elapsed());
+            let dispatched = Instant::now();
+            let result = self
+                .codemode_dispatch(&req.id, &req.params_json, in_snippet, guard)
+                .await;
+            record_phase("dispatch", dispatched.elapsed());
+            result
+        })
+        .instrument(span)
+        .await
+        .unwrap_or_else(|_| Err("codemode absolute deadline exceeded".to_string()));
+        let elapsed_ms = started.elapsed().as_millis();
+        let ok = outcome.is_ok();
+        let error = outcome.as_ref().err().cloned();
+        // Record whether the script could still receive the result: a failed
+        // send means the engine already finished (deadline, or the script never
+        // awaited this call), so `ok` describes the action but the script never
+        // saw it — surface that, never hide it.
+        let delivered = req
+            .reply
+            .send(ToolCompletion {
+                ticket: req.ticket,
+                result: outcome,
+            })
+            .is_ok();
+        let entry = json!({
+            "action": req.id, "ok": ok, "error": error,
+            "delivered": delivered, "elapsed_ms": elapsed_ms,
+        });
+        (req.ticket, entry)
+    }
+
     pub(super) async fn codemode_dispatch(
         &self,
         id: &str,
@@ -1,7 +1,21 @@
-//! Per-run metrics and channel request envelopes for Code Mode.
+//! Per-run metrics, channel request envelopes, and tool-call admission for
+//! Code Mode.
+
+use std::collections::HashMap;
+use std::sync::Arc;
+use std::time::Duration;
 
 use anyhow::Result;
-use tokio::sync::oneshot;
+use tokio::sync::{Semaphore, oneshot};
+
+use crate::codemode::ToolCompletion;
+
+/// Record one host-side phase of a run into `yarr_codemode_phase_seconds`.
+/// `runtime_init` and `preamble_eval` come from the warm pool instead.
+pub(super) fn record_phase(phase: &'static str, elapsed: Duration) {
+    axum_prometheus::metrics::histogram!("yarr_codemode_phase_seconds", "phase" => phase)
+        .record(elapsed.as_secs_f64());
+}
 
 pub(super) struct ActiveRunMetric {
     completed: bool,
@@ -30,10 +44,61 @@ impl Drop for ActiveRunMetric {
     }
 }
 
+/// One `callTool` submission. The reply goes back on the engine's completion
+/// channel tagged with `ticket`, so calls may finish in any order.
 pub(super) struct ToolRequest {
+    pub(super) ticket: u32,
     pub(super) id: String,
     pub(super) params_json: String,
-    pub(super) reply: oneshot::Sender<Result<String, String>>,
+    pub(super) reply: std::sync::mpsc::Sender<ToolCompletion>,
+}
+
+/// Permits one tool call must hold while it runs: its upstream service's slot
+/// (when the params name a service) and a run-wide slot.
+pub(super) struct CallPermits {
+    pub(super) service: Option<Arc<Semaphore>>,
+    pub(super) run: Arc<Semaphore>,
+}
+
+/// Per-run admission for concurrent tool calls: a run-wide cap plus a cap per
+/// upstream service, so one `Promise.all` fan-out cannot flood a single
+/// upstream or hold every slot while other services sit idle.
+pub(super) struct CallSlots {
+    run: Arc<Semaphore>,
+    per_service: usize,
+    services: HashMap<String, Arc<Semaphore>>,
+}
+
+impl CallSlots {
+    pub(super) fn new(run_limit: usize, per_service: usize) -> Self {
+        Self {
+            run: Arc::new(Semaphore::new(run_limit)),
+            per_service,
+            services: HashMap::new(),
+        }
+    }
+
+    pub(super) fn for_call(&mut self, params_json: &str) -> CallPermits {
+        #[derive(serde::Deserialize)]
+        struct ServiceParam {
+            service: Option<String>,
+        }
+        let service = serde_json::from_str::<ServiceParam>(params_json)
+            .ok()
+            .and_then(|params| params.service)
+            .map(|name| {
+                let per_service = self.per_service;
+                Arc::clone(
+                    self.services
+                        .entry(name.trim().to_ascii_lowercase())
+                        .or_insert_with(|| Arc::new(Semaphore::new(per_service))),
+                )
+            });
+        CallPermits {
+            service,
+            run: Arc::clone(&self.run),
+        }
+    }
 }
 
 pub(super) struct ArtifactRequest {
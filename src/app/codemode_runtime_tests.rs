@@ -54,3 +54,48 @@ async fn oversized_result_becomes_a_parseable_marker() {
     assert!(out["result"]["preview"].as_str().unwrap().len() <= 1024);
     assert!(out["result"]["original_bytes"].as_u64().unwrap() > 0);
 }
+
+#[tokio::test]
+async fn concurrent_calls_are_audited_in_call_order() {
+    let out = loopback_state()
+        .service
+        .codemode(
+            r#"async () => {
+                const calls = [callTool("help", {}), callTool("no_such_action", {}), callTool("help", {})];
+                return (await Promise.allSettled(calls)).map((r) => r.status);
+            }"#,
+        )
+        .await
+        .unwrap();
+    assert_eq!(
+        out["result"],
+        serde_json::json!(["fulfilled", "rejected", "fulfilled"])
+    );
+    let actions: Vec<&str> = out["calls"]
+        .as_array()
+        .unwrap()
+        .iter()
+        .map(|call| call["action"].as_str().unwrap())
+        .collect();
+    assert_eq!(actions, ["help", "no_such_action", "help"]);
+}
+
+#[test]
+fn call_slots_share_one_semaphore_per_service() {
+    let mut slots = super::super::runtime::CallSlots::new(4, 2);
+    let first = slots.for_call(r#"{"service":"Sonarr","id":1}"#);
+    let second = slots.for_call(r#"{"service":"sonarr"}"#);
+    let other = slots.for_call(r#"{"service":"radarr"}"#);
+    let none = slots.for_call("{}");
+    assert!(std::sync::Arc::ptr_eq(
+        first.service.as_ref().unwrap(),
+        second.service.as_ref().unwrap()
+    ));
+    assert!(!std::sync::Arc::ptr_eq(
+        first.service.as_ref().unwrap(),
+        other.service.as_ref().unwrap()
+    ));
+    assert!(none.service.is_none());
+    assert_eq!(first.service.unwrap().available_permits(), 2);
+    assert!(std::sync::Arc::ptr_eq(&first.run, &none.run));
+}
@@ -43,7 +43,7 @@ impl YarrService {
     /// List the active downloads, slimmed. READ.
     ///
     /// Dispatches by `query_api`: SABnzbd (`?mode=queue`) vs qBittorrent
-    /// (`/api/v2/torrents/info`).
+    /// (incremental `/api/v2/sync/maindata`).
     pub async fn download_queue(&self, service: &str) -> Result<Value> {
         let config = self.download_context(service)?;
         if config.kind.descriptor().query_api() {
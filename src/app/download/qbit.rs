@@ -17,7 +17,6 @@ use serde_json::{Value, json};
 
 use crate::app::YarrService;
 use crate::config::ServiceConfig;
-use crate::yarr::slim;
 
 /// Envelope for a qBittorrent bulk mutation (`stop`/`start`/`delete`).
 ///
@@ -56,12 +55,11 @@ pub(super) fn qbit_path(config: &ServiceConfig, suffix: &str) -> String {
     format!("{}{}", config.kind.descriptor().api_prefix, suffix)
 }
 
-/// GET `/api/v2/torrents/info` → active torrents, slimmed to [`TORRENT_FIELDS`].
+/// Every torrent, slimmed to [`TORRENT_FIELDS`], from the session's
+/// `/api/v2/sync/maindata` table: the first read is a full snapshot, later
+/// reads transfer only the rows changed since.
 pub(super) async fn queue(svc: &YarrService, config: &ServiceConfig) -> Result<Value> {
-    let path = qbit_path(config, "/torrents/info");
-    let url = crate::yarr::build_url(config, &path)?;
-    let raw = svc.client_ref().send_get(config, url, None).await?;
-    Ok(slim(raw, TORRENT_FIELDS))
+    svc.client_ref().qbit_torrents(config, TORRENT_FIELDS).await
 }
 
 /// POST `/api/v2/torrents/add` (form field `urls`) → add a download by URL/magnet.
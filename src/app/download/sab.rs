@@ -15,7 +15,7 @@ use serde_json::{Value, json};
 
 use crate::app::YarrService;
 use crate::config::ServiceConfig;
-use crate::yarr::slim;
+use crate::yarr::Projection;
 
 /// Base path for SABnzbd's query API.
 const SAB_API: &str = "/api";
@@ -34,17 +34,23 @@ const QUEUE_FIELDS: &[&str] = &[
     "priority",
 ];
 
-/// GET `/api?mode=queue&output=json` → unwrap `queue.slots`, slimmed.
+/// GET `/api?mode=queue&output=json` → unwrap `queue.slots`, projected to
+/// [`QUEUE_FIELDS`].
 pub(super) async fn queue(svc: &YarrService, config: &ServiceConfig) -> Result<Value> {
     let url = crate::yarr::query_get(config, SAB_API, &[("mode", "queue")])?;
-    let raw = svc.client_ref().send_get(config, url, None).await?;
-    // SABnzbd wraps the active queue under `{ "queue": { "slots": [...] } }`.
+    // SABnzbd wraps the active queue under `{ "queue": { "slots": [...] } }`;
+    // the slots are projected while the body is parsed.
+    let projection = Projection::fields(QUEUE_FIELDS.iter().copied()).at(&["queue", "slots"]);
+    let mut raw = svc
+        .client_ref()
+        .send_get_projected(config, url, &projection)
+        .await?;
     let slots = raw
-        .get("queue")
-        .and_then(|q| q.get("slots"))
-        .cloned()
+        .get_mut("queue")
+        .and_then(|q| q.get_mut("slots"))
+        .map(Value::take)
         .unwrap_or(Value::Array(Vec::new()));
-    Ok(json!({ "slots": slim(slots, QUEUE_FIELDS) }))
+    Ok(json!({ "slots": slots }))
 }
 
 /// GET `/api?mode=addurl&name=URL` → queue a new download from a URL/magnet/NZB.
@@ -0,0 +1,105 @@
+//! Fleet health: every configured service's status endpoint, probed at once.
+//!
+//! Probes run concurrently — at most [`fleet_concurrency`] in flight — and each
+//! one is cut off at [`fleet_probe_timeout`], so a hung upstream costs its own
+//! deadline instead of stalling the whole sweep. Backs both the `fleet_status`
+//! action and `yarr doctor`'s connectivity section.
+
+use std::time::{Duration, Instant};
+
+use anyhow::Result;
+use futures_util::StreamExt;
+use futures_util::stream;
+use serde::Serialize;
+use serde_json::{Value, json};
+
+use crate::app::YarrService;
+use crate::config::ServiceConfig;
+
+/// One service's probe result, in the shape `fleet_status` returns.
+#[derive(Debug, Clone, PartialEq, Serialize)]
+pub struct FleetProbe {
+    pub service: String,
+    pub kind: &'static str,
+    pub ok: bool,
+    /// Wall time of the status call, or the deadline when it timed out.
+    pub latency_ms: u64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<String>,
+}
+
+/// Probes in flight at once. Defaults to 8; override with
+/// `YARR_FLEET_CONCURRENCY`. 0 or an unparseable value falls back to 8.
+fn fleet_concurrency() -> usize {
+    std::env::var("YARR_FLEET_CONCURRENCY")
+        .ok()
+        .and_then(|raw| raw.trim().parse::<usize>().ok())
+        .filter(|workers| *workers > 0)
+        .unwrap_or(8)
+}
+
+/// Per-probe deadline. Defaults to 10s — a third of the 30s upstream timeout,
+/// so a sweep reports a dead service quickly. Override with
+/// `YARR_FLEET_PROBE_TIMEOUT_SECS`; 0 or an unparseable value falls back to 10s.
+fn fleet_probe_timeout() -> Duration {
+    std::env::var("YARR_FLEET_PROBE_TIMEOUT_SECS")
+        .ok()
+        .and_then(|raw| raw.trim().parse::<u64>().ok())
+        .filter(|secs| *secs > 0)
+        .map(Duration::from_secs)
+        .unwrap_or_else(|| Duration::from_secs(10))
+}
+
+impl YarrService {
+    /// `fleet_status`: every configured service's status and latency in one
+    /// call. Never fails as a whole — an unreachable service is a row with
+    /// `ok: false` and its `error`.
+    pub async fn fleet_status(&self) -> Result<Value> {
+        let services = self.fleet_probes().await;
+        let healthy = services.iter().filter(|probe| probe.ok).count();
+        Ok(json!({
+            "total": services.len(),
+            "healthy": healthy,
+            "services": services,
+        }))
+    }
+
+    /// Probe every configured service with the env-configured worker count and
+    /// deadline. Results are in configured order.
+    pub async fn fleet_probes(&self) -> Vec<FleetProbe> {
+        self.probe_fleet(fleet_concurrency(), fleet_probe_timeout())
+            .await
+    }
+
+    async fn probe_fleet(&self, concurrency: usize, deadline: Duration) -> Vec<FleetProbe> {
+        // `buffered` keeps up to `concurrency` probes running and yields them in
+        // input order, so no re-sort is needed.
+        stream::iter(&self.services)
+            .map(|service| self.probe(service, deadline))
+            .buffered(concurrency.max(1))
+            .collect()
+            .await
+    }
+
+    async fn probe(&self, service: &ServiceConfig, deadline: Duration) -> FleetProbe {
+        let start = Instant::now();
+        let outcome = tokio::time::timeout(deadline, self.service_status(&service.name)).await;
+        let latency_ms = start.elapsed().as_millis() as u64;
+        let error = match outcome {
+            Ok(Ok(_)) => None,
+            Ok(Err(error)) => Some(error.to_string()),
+            Err(_) => Some(format!("no response within {} ms", deadline.as_millis())),
+        };
+        FleetProbe {
+            service: service.name.clone(),
+            kind: service.kind.as_str(),
+            ok: error.is_none(),
+            latency_ms,
+            error,
+        }
+    }
+}
+
+#[cfg(test)]
+#[path = "fleet_tests.rs"]
+mod tests;
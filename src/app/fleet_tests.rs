@@ -0,0 +1,98 @@
+use std::time::{Duration, Instant};
+
+use serde_json::json;
+
+use crate::app::YarrService;
+use crate::config::{ServiceConfig, ServiceKind, YarrConfig};
+use crate::yarr::YarrClient;
+
+/// A Sonarr-shaped upstream whose status endpoint answers after `delay`.
+async fn slow_upstream(delay: Duration) -> String {
+    let app = axum::Router::new().route(
+        "/api/v3/system/status",
+        axum::routing::get(move || async move {
+            tokio::time::sleep(delay).await;
+            axum::Json(json!({"version": "4.0.0"}))
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    format!("http://{address}")
+}
+
+fn fleet(base_urls: &[(&str, &str)]) -> YarrService {
+    let services = base_urls
+        .iter()
+        .map(|(name, base_url)| ServiceConfig {
+            name: (*name).into(),
+            kind: ServiceKind::Sonarr,
+            base_url: (*base_url).into(),
+            api_key: Some("secret".into()),
+            ..ServiceConfig::default()
+        })
+        .collect();
+    let config = YarrConfig { services };
+    let client = YarrClient::new(&config).unwrap();
+    YarrService::new(client, config)
+}
+
+#[tokio::test]
+async fn probes_run_concurrently_and_keep_configured_order() {
+    let slow = slow_upstream(Duration::from_millis(300)).await;
+    let fast = slow_upstream(Duration::ZERO).await;
+    let service = fleet(&[
+        ("a", slow.as_str()),
+        ("b", fast.as_str()),
+        ("c", slow.as_str()),
+        ("d", slow.as_str()),
+    ]);
+
+    let start = Instant::now();
+    let probes = service.probe_fleet(8, Duration::from_secs(5)).await;
+
+    // Sequential probing would take ~900 ms; concurrent takes ~one slow probe.
+    assert!(
+        start.elapsed() < Duration::from_millis(800),
+        "{:?}",
+        start.elapsed()
+    );
+    let names: Vec<_> = probes.iter().map(|probe| probe.service.as_str()).collect();
+    assert_eq!(names, ["a", "b", "c", "d"]);
+    assert!(
+        probes
+            .iter()
+            .all(|probe| probe.ok && probe.kind == "sonarr")
+    );
+}
+
+#[tokio::test]
+async fn a_hung_service_is_cut_off_at_the_deadline() {
+    let hung = slow_upstream(Duration::from_secs(30)).await;
+    let fast = slow_upstream(Duration::ZERO).await;
+    let service = fleet(&[("hung", hung.as_str()), ("fast", fast.as_str())]);
+
+    let start = Instant::now();
+    let probes = service.probe_fleet(1, Duration::from_millis(100)).await;
+
+    assert!(start.elapsed() < Duration::from_secs(5));
+    assert!(!probes[0].ok);
+    assert!(probes[0].error.as_deref().unwrap().contains("100 ms"));
+    assert!(probes[0].latency_ms >= 100);
+    assert!(probes[1].ok, "{:?}", probes[1].error);
+}
+
+#[tokio::test]
+async fn fleet_status_reports_every_service_without_failing() {
+    let fast = slow_upstream(Duration::ZERO).await;
+    let service = fleet(&[("up", fast.as_str()), ("down", "http://127.0.0.1:1")]);
+
+    let status = service.fleet_status().await.unwrap();
+
+    assert_eq!(status["total"], 2);
+    assert_eq!(status["healthy"], 1);
+    assert_eq!(status["services"][0]["service"], "up");
+    assert!(status["services"][0].get("error").is_none());
+    assert_eq!(status["services"][1]["ok"], false);
+    assert!(status["services"][1]["error"].is_string());
+}
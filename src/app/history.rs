@@ -0,0 +1,437 @@
+//! Local watch-history index behind `stats_history_summary` and
+//! `trace_history_summary`.
+//!
+//! Tautulli and Tracearr both page history slowly once it grows. Without an
+//! index, every aggregate question ("what did X watch this month", "top titles
+//! this week") re-pages all of it. Instead, each history service gets an
+//! append-only JSON Lines file, `{data_dir}/history/{service}.jsonl`, holding
+//! one [`HistoryRecord`] per finished play. A summary syncs the index first and
+//! then aggregates the local rows only.
+//!
+//! A sync pages the upstream newest-first. It stops at the first page that
+//! reaches [`SYNC_OVERLAP_SECS`] before the newest indexed play, so after the
+//! first sync a call usually fetches a single page. The overlap is needed
+//! because both upstreams date a play by when it started but only list it
+//! finished once it stops, so a long play can land behind plays already
+//! indexed. Plays are keyed by their upstream id, so re-reading the overlap
+//! never duplicates rows. Plays still in progress are skipped until a later
+//! sync sees them finished.
+//!
+//! A first sync reads at most [`MAX_SYNC_ROWS`] rows. Older history is left
+//! out, and the summary reports `truncated` when that happened; a
+//! `{service}.truncated` marker next to the index keeps that known across
+//! restarts. Later syncs are not capped: stopping one short of the overlap
+//! would leave a gap below the newest play that no later sync reads back to.
+
+use std::collections::{HashMap, HashSet};
+use std::future::Future;
+use std::io::Write;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, PoisonError};
+use std::time::{Duration, Instant};
+
+use anyhow::{Context, Result};
+use serde::{Deserialize, Serialize};
+use serde_json::{Value, json};
+
+use crate::app::YarrService;
+use crate::config::ServiceConfig;
+
+mod summary;
+
+use summary::summarize;
+
+/// Subdirectory of the data dir holding one index file per history service.
+const HISTORY_SUBDIR: &str = "history";
+
+/// How far before the newest indexed play a sync keeps reading.
+const SYNC_OVERLAP_SECS: i64 = 24 * 60 * 60;
+
+/// Most upstream rows a first sync reads.
+const MAX_SYNC_ROWS: usize = 20_000;
+
+/// A summary within this long of the last sync answers from the index as is.
+const SYNC_FRESH_FOR: Duration = Duration::from_secs(60);
+
+const DEFAULT_TOP: usize = 10;
+const MAX_TOP: usize = 100;
+
+/// One finished play as stored in the index.
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
+pub(super) struct HistoryRecord {
+    /// Upstream play id (Tautulli `row_id`, Tracearr session `id`).
+    pub(super) id: String,
+    /// Play start, Unix seconds.
+    pub(super) at: i64,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub(super) user: Option<String>,
+    /// Show title for episodes, otherwise the item title.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub(super) title: Option<String>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub(super) media_type: Option<String>,
+    /// Time actually played, in seconds.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub(super) duration_secs: Option<i64>,
+}
+
+/// Reads one upstream row into a record plus whether the play has finished.
+/// `None` for a row without an id or start time.
+pub(super) type RowParser = fn(&Value) -> Option<(HistoryRecord, bool)>;
+
+/// One upstream history page, newest first.
+pub(super) struct HistoryPage {
+    /// The finished plays on the page.
+    records: Vec<HistoryRecord>,
+    /// Start of the oldest row on the page, finished or not.
+    oldest: Option<i64>,
+    /// The page was short, so there is nothing older to read.
+    last: bool,
+}
+
+impl HistoryPage {
+    pub(super) fn new(rows: &[Value], page_size: usize, parse: RowParser) -> Self {
+        let mut records = Vec::with_capacity(rows.len());
+        let mut oldest: Option<i64> = None;
+        for (record, finished) in rows.iter().filter_map(parse) {
+            oldest = Some(oldest.map_or(record.at, |at| at.min(record.at)));
+            if finished {
+                records.push(record);
+            }
+        }
+        Self {
+            records,
+            oldest,
+            last: rows.len() < page_size,
+        }
+    }
+}
+
+/// What a summary aggregates over, as given by the caller.
+pub(super) struct SummaryQuery<'a> {
+    /// Only plays started in the last `days` days; every indexed play if unset.
+    pub(super) days: Option<i64>,
+    /// Only plays by this user (case-insensitive).
+    pub(super) user: Option<&'a str>,
+    /// Rows kept in each ranking.
+    pub(super) top: Option<i64>,
+    /// Sync with the upstream before answering. `false` answers from the
+    /// index alone.
+    pub(super) sync: bool,
+}
+
+/// The history index of one service, loaded in memory.
+pub(super) struct HistoryIndex {
+    path: PathBuf,
+    records: Vec<HistoryRecord>,
+    ids: HashSet<String>,
+    /// Start of the newest indexed play.
+    newest: Option<i64>,
+    /// The file does not end in a newline (an append was cut short), so the
+    /// next append starts a fresh line first.
+    torn: bool,
+    synced: Option<Instant>,
+    /// The first sync stopped at [`MAX_SYNC_ROWS`]; kept on disk as the
+    /// [`truncation_marker`].
+    truncated: bool,
+}
+
+impl HistoryIndex {
+    /// Load the index at `path`; a missing file is an empty index. Unreadable
+    /// lines, such as a torn last append, are skipped. Blocks on the file.
+    pub(super) fn open(path: PathBuf) -> Result<Self> {
+        let text = match std::fs::read_to_string(&path) {
+            Ok(text) => text,
+            Err(error) if error.kind() == std::io::ErrorKind::NotFound => String::new(),
+            Err(error) => {
+                return Err(error)
+                    .with_context(|| format!("failed to read history index {}", path.display()));
+            }
+        };
+        let mut index = Self {
+            torn: !text.is_empty() && !text.ends_with('\n'),
+            records: Vec::new(),
+            ids: HashSet::new(),
+            newest: None,
+            synced: None,
+            truncated: truncation_marker(&path).exists(),
+            path,
+        };
+        for line in text.lines().filter(|line| !line.trim().is_empty()) {
+            match serde_json::from_str::<HistoryRecord>(line) {
+                Ok(record) => index.insert(record),
+                Err(error) => tracing::warn!(
+                    path = %index.path.display(),
+                    error = %error,
+                    "skipping unreadable history index line"
+                ),
+            }
+        }
+        Ok(index)
+    }
+
+    /// Index `record` unless its id is already indexed.
+    fn insert(&mut self, record: HistoryRecord) {
+        if self.ids.insert(record.id.clone()) {
+            self.newest = Some(self.newest.map_or(record.at, |at| at.max(record.at)));
+            self.records.push(record);
+        }
+    }
+
+    /// Append the records not indexed yet in a single write, oldest first, on
+    /// the blocking pool. Returns how many were appended.
+    pub(super) async fn append(&mut self, records: Vec<HistoryRecord>) -> Result<usize> {
+        let mut seen = HashSet::new();
+        let mut fresh: Vec<HistoryRecord> = records
+            .into_iter()
+            .filter(|record| !self.ids.contains(&record.id) && seen.insert(record.id.clone()))
+            .collect();
+        if fresh.is_empty() {
+            return Ok(0);
+        }
+        fresh.sort_by_key(|record| record.at);
+
+        let mut buf = Vec::new();
+        if self.torn {
+            buf.push(b'\n');
+        }
+        for record in &fresh {
+            serde_json::to_writer(&mut buf, record)?;
+            buf.push(b'\n');
+        }
+        let path = self.path.clone();
+        tokio::task::spawn_blocking(move || append_lines(&path, &buf))
+            .await
+            .context("history index write task failed")??;
+        self.torn = false;
+
+        let appended = fresh.len();
+        for record in fresh {
+            self.insert(record);
+        }
+        Ok(appended)
+    }
+
+    /// Record on disk that the index stops short of the upstream's oldest play.
+    async fn mark_truncated(&mut self) -> Result<()> {
+        let marker = truncation_marker(&self.path);
+        tokio::task::spawn_blocking(move || {
+            if let Some(parent) = marker.parent() {
+                std::fs::create_dir_all(parent)
+                    .with_context(|| format!("failed to create {}", parent.display()))?;
+            }
+            std::fs::write(&marker, b"")
+                .with_context(|| format!("failed to write {}", marker.display()))
+        })
+        .await
+        .context("history index write task failed")??;
+        self.truncated = true;
+        Ok(())
+    }
+
+    /// Read new plays from the upstream, page by page via `fetch(page)`
+    /// (0-based), and append them. Everything is appended at the end, so a
+    /// sync that fails part way leaves the index as it was instead of with a
+    /// gap below its newest play.
+    async fn sync<F, Fut>(&mut self, mut fetch: F) -> Result<usize>
+    where
+        F: FnMut(usize) -> Fut,
+        Fut: Future<Output = Result<HistoryPage>>,
+    {
+        let stop_before = self.newest.map(|newest| newest - SYNC_OVERLAP_SECS);
+        let mut fetched = Vec::new();
+        let mut truncated = false;
+        let mut page = 0;
+        loop {
+            let HistoryPage {
+                records,
+                oldest,
+                last,
+            } = fetch(page).await?;
+            fetched.extend(records);
+            let caught_up =
+                matches!((stop_before, oldest), (Some(stop), Some(oldest)) if oldest < stop);
+            if last || caught_up || oldest.is_none() {
+                break;
+            }
+            if stop_before.is_none() && fetched.len() >= MAX_SYNC_ROWS {
+                truncated = true;
+                break;
+            }
+            page += 1;
+        }
+        let appended = self.append(fetched).await?;
+        if truncated && !self.truncated {
+            self.mark_truncated().await?;
+        }
+        self.synced = Some(Instant::now());
+        Ok(appended)
+    }
+}
+
+/// Loaded indexes, one slot per index file, shared by every clone of the
+/// service. A slot's lock is held for a whole summary, so concurrent
+/// summaries for one service never sync twice or interleave appends.
+#[derive(Default)]
+pub(super) struct HistoryIndexes {
+    slots: Mutex<HashMap<PathBuf, Arc<tokio::sync::Mutex<Option<HistoryIndex>>>>>,
+}
+
+impl HistoryIndexes {
+    fn slot(&self, path: &Path) -> Arc<tokio::sync::Mutex<Option<HistoryIndex>>> {
+        let mut slots = self.slots.lock().unwrap_or_else(PoisonError::into_inner);
+        Arc::clone(slots.entry(path.to_path_buf()).or_default())
+    }
+}
+
+impl YarrService {
+    /// Sync `service`'s history index through `fetch` (see
+    /// [`HistoryIndex::sync`]) unless `query.sync` is off or the index was
+    /// synced moments ago, then aggregate it.
+    pub(super) async fn history_summary<F, Fut>(
+        &self,
+        service: &ServiceConfig,
+        query: SummaryQuery<'_>,
+        fetch: F,
+    ) -> Result<Value>
+    where
+        F: FnMut(usize) -> Fut,
+        Fut: Future<Output = Result<HistoryPage>>,
+    {
+        if query.days.is_some_and(|days| days < 1) {
+            anyhow::bail!("days must be at least 1");
+        }
+        let root = self.data_dir().ok_or_else(|| {
+            anyhow::anyhow!("history summaries are unavailable: no data dir is configured")
+        })?;
+        let path = root
+            .join(HISTORY_SUBDIR)
+            .join(index_file_name(&service.name));
+
+        let slot = self.history_indexes().slot(&path);
+        let mut loaded = slot.lock().await;
+        if loaded.is_none() {
+            let open = path.clone();
+            let index = tokio::task::spawn_blocking(move || HistoryIndex::open(open))
+                .await
+                .context("history index load task failed")??;
+            *loaded = Some(index);
+        }
+        let index = loaded.as_mut().expect("history index loaded above");
+
+        let mut appended = 0;
+        let stale = !index
+            .synced
+            .is_some_and(|synced| synced.elapsed() < SYNC_FRESH_FOR);
+        let synced = query.sync && stale;
+        if synced {
+            let outcome = if index.newest.is_some() {
+                "delta"
+            } else {
+                "full"
+            };
+            let result = index.sync(fetch).await;
+            record_sync(service, if result.is_ok() { outcome } else { "error" });
+            appended = result?;
+        }
+
+        let since = query
+            .days
+            .map(|days| chrono::Utc::now().timestamp() - days.saturating_mul(24 * 60 * 60));
+        let top = query
+            .top
+            .map_or(DEFAULT_TOP, |top| usize::try_from(top).unwrap_or(1))
+            .clamp(1, MAX_TOP);
+        let user = query.user.map(str::trim).filter(|user| !user.is_empty());
+
+        let mut summary = summarize(&index.records, since, user, top);
+        let oldest = index.records.iter().map(|record| record.at).min();
+        summary["service"] = json!(service.name);
+        summary["index"] = json!({
+            "rows": index.records.len(),
+            "oldest": oldest.and_then(timestamp),
+            "newest": index.newest.and_then(timestamp),
+            "synced": synced,
+            "appended": appended,
+            "truncated": index.truncated,
+        });
+        summary["window"] = json!({
+            "since": since.and_then(timestamp),
+            "user": user,
+        });
+        Ok(summary)
+    }
+}
+
+/// A string field of an upstream row; blank strings count as missing.
+pub(super) fn text(row: &Value, key: &str) -> Option<String> {
+    row.get(key)
+        .and_then(Value::as_str)
+        .map(str::trim)
+        .filter(|value| !value.is_empty())
+        .map(str::to_owned)
+}
+
+/// An integer field of an upstream row, sent either as a number or a numeric
+/// string.
+pub(super) fn int(row: &Value, key: &str) -> Option<i64> {
+    match row.get(key)? {
+        Value::Number(number) => number.as_i64(),
+        Value::String(text) => text.trim().parse().ok(),
+        _ => None,
+    }
+}
+
+/// Append `buf` to the index file at `path`, creating the file and its
+/// directory first if needed.
+fn append_lines(path: &Path, buf: &[u8]) -> Result<()> {
+    if let Some(parent) = path.parent() {
+        std::fs::create_dir_all(parent)
+            .with_context(|| format!("failed to create {}", parent.display()))?;
+    }
+    std::fs::OpenOptions::new()
+        .create(true)
+        .append(true)
+        .open(path)
+        .and_then(|mut file| file.write_all(buf))
+        .with_context(|| format!("failed to append to {}", path.display()))
+}
+
+/// The marker file kept next to the index at `path` once its first sync was
+/// cut short at [`MAX_SYNC_ROWS`].
+fn truncation_marker(path: &Path) -> PathBuf {
+    path.with_extension("truncated")
+}
+
+/// Index file name for a service; anything but ASCII alphanumerics, `-` and
+/// `_` becomes `_`, so a service name can never point outside the directory.
+fn index_file_name(service: &str) -> String {
+    let stem: String = service
+        .chars()
+        .map(|c| {
+            if c.is_ascii_alphanumeric() || c == '-' || c == '_' {
+                c
+            } else {
+                '_'
+            }
+        })
+        .collect();
+    format!("{stem}.jsonl")
+}
+
+fn timestamp(secs: i64) -> Option<String> {
+    chrono::DateTime::from_timestamp(secs, 0).map(|at| at.to_rfc3339())
+}
+
+fn record_sync(service: &ServiceConfig, outcome: &'static str) {
+    axum_prometheus::metrics::counter!(
+        "yarr_history_sync_total",
+        "service" => service.name.clone(),
+        "outcome" => outcome
+    )
+    .increment(1);
+}
+
+#[cfg(test)]
+#[path = "history_tests.rs"]
+mod tests;
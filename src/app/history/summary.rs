@@ -0,0 +1,80 @@
+//! Aggregation of indexed plays into a history summary.
+
+use std::collections::{BTreeMap, HashMap};
+
+use serde_json::{Map, Value, json};
+
+use super::HistoryRecord;
+
+/// Aggregate the plays started at or after `since` (if set), by `user` (if
+/// set): totals, then per-user and per-title rankings cut to `top` rows, and
+/// play counts per media type.
+pub(super) fn summarize(
+    records: &[HistoryRecord],
+    since: Option<i64>,
+    user: Option<&str>,
+    top: usize,
+) -> Value {
+    let mut plays = 0_u64;
+    let mut duration_secs = 0_i64;
+    let mut users: HashMap<&str, (u64, i64)> = HashMap::new();
+    let mut titles: HashMap<&str, (u64, i64)> = HashMap::new();
+    let mut media_types: BTreeMap<&str, u64> = BTreeMap::new();
+    let matching = records
+        .iter()
+        .filter(|record| since.is_none_or(|since| record.at >= since))
+        .filter(|record| {
+            user.is_none_or(|user| {
+                record
+                    .user
+                    .as_deref()
+                    .is_some_and(|name| name.eq_ignore_ascii_case(user))
+            })
+        });
+    for record in matching {
+        let secs = record.duration_secs.unwrap_or(0).max(0);
+        plays += 1;
+        duration_secs += secs;
+        for (counts, key) in [(&mut users, &record.user), (&mut titles, &record.title)] {
+            let entry = counts
+                .entry(key.as_deref().unwrap_or("unknown"))
+                .or_default();
+            entry.0 += 1;
+            entry.1 += secs;
+        }
+        *media_types
+            .entry(record.media_type.as_deref().unwrap_or("unknown"))
+            .or_default() += 1;
+    }
+    json!({
+        "plays": plays,
+        "duration_secs": duration_secs,
+        "users": ranked(users, "user", top),
+        "top_titles": ranked(titles, "title", top),
+        "media_types": media_types,
+    })
+}
+
+/// Rows of `{key, plays, duration_secs}`, most plays first.
+fn ranked(counts: HashMap<&str, (u64, i64)>, key: &str, top: usize) -> Value {
+    let mut rows: Vec<_> = counts.into_iter().collect();
+    rows.sort_by(|(a, (a_plays, a_secs)), (b, (b_plays, b_secs))| {
+        b_plays.cmp(a_plays).then(b_secs.cmp(a_secs)).then(a.cmp(b))
+    });
+    rows.truncate(top);
+    Value::Array(
+        rows.into_iter()
+            .map(|(name, (plays, secs))| {
+                let mut row = Map::new();
+                row.insert(key.to_owned(), json!(name));
+                row.insert("plays".to_owned(), json!(plays));
+                row.insert("duration_secs".to_owned(), json!(secs));
+                Value::Object(row)
+            })
+            .collect(),
+    )
+}
+
+#[cfg(test)]
+#[path = "summary_tests.rs"]
+mod tests;
@@ -0,0 +1,46 @@
+use serde_json::json;
+
+use super::summarize;
+use crate::app::history::HistoryRecord;
+
+fn record(id: &str, at: i64, user: &str, title: &str, secs: i64) -> HistoryRecord {
+    HistoryRecord {
+        id: id.into(),
+        at,
+        user: Some(user.into()),
+        title: Some(title.into()),
+        media_type: Some("movie".into()),
+        duration_secs: Some(secs),
+    }
+}
+
+#[test]
+fn summaries_filter_by_window_and_user_and_rank_by_plays() {
+    let records = [
+        record("1", 100, "ann", "Old", 999),
+        record("2", 1_000, "ann", "Show", 60),
+        record("3", 1_100, "Bob", "Show", 30),
+        record("4", 1_200, "bob", "Film", 90),
+        record("5", 1_300, "bob", "Show", 30),
+    ];
+
+    let all = summarize(&records, Some(1_000), None, 10);
+    assert_eq!(all["plays"], 4);
+    assert_eq!(all["duration_secs"], 210);
+    assert_eq!(
+        all["top_titles"],
+        json!([
+            {"title": "Show", "plays": 3, "duration_secs": 120},
+            {"title": "Film", "plays": 1, "duration_secs": 90},
+        ])
+    );
+    assert_eq!(all["users"][0]["user"], "bob");
+    assert_eq!(all["media_types"], json!({"movie": 4}));
+
+    let bob = summarize(&records, None, Some("BOB"), 1);
+    assert_eq!(bob["plays"], 3);
+    assert_eq!(
+        bob["top_titles"],
+        json!([{"title": "Show", "plays": 2, "duration_secs": 60}])
+    );
+}
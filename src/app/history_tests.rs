@@ -0,0 +1,298 @@
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
+
+use axum::extract::Query;
+use serde_json::{Value, json};
+
+use super::{HistoryIndex, HistoryPage, HistoryRecord, MAX_SYNC_ROWS, SYNC_OVERLAP_SECS};
+use crate::app::YarrService;
+use crate::config::{ServiceConfig, ServiceKind, YarrConfig};
+use crate::yarr::YarrClient;
+
+fn record(id: &str, at: i64, user: &str, title: &str, secs: i64) -> HistoryRecord {
+    HistoryRecord {
+        id: id.into(),
+        at,
+        user: Some(user.into()),
+        title: Some(title.into()),
+        media_type: Some("movie".into()),
+        duration_secs: Some(secs),
+    }
+}
+
+fn parse(row: &Value) -> Option<(HistoryRecord, bool)> {
+    let record = serde_json::from_value(row.clone()).ok()?;
+    Some((record, row["finished"] != false))
+}
+
+fn row(id: &str, at: i64) -> Value {
+    serde_json::to_value(record(id, at, "ann", "Title", 5)).unwrap()
+}
+
+fn history_page(rows: Vec<HistoryRecord>, page_size: usize) -> HistoryPage {
+    let rows: Vec<Value> = rows
+        .into_iter()
+        .map(|row| serde_json::to_value(row).unwrap())
+        .collect();
+    HistoryPage::new(&rows, page_size, parse)
+}
+
+#[tokio::test]
+async fn appends_are_deduplicated_and_survive_a_reopen() {
+    let tmp = tempfile::tempdir().unwrap();
+    let path = tmp.path().join("history").join("tautulli.jsonl");
+    let mut index = HistoryIndex::open(path.clone()).unwrap();
+
+    let appended = index
+        .append(vec![
+            record("2", 200, "ann", "B", 60),
+            record("1", 100, "bob", "A", 30),
+            record("2", 200, "ann", "B", 60),
+        ])
+        .await
+        .unwrap();
+    assert_eq!(appended, 2);
+    assert_eq!(
+        index
+            .append(vec![record("1", 100, "bob", "A", 30)])
+            .await
+            .unwrap(),
+        0
+    );
+
+    // Written oldest first, one record per line.
+    let text = std::fs::read_to_string(&path).unwrap();
+    let ids: Vec<String> = text
+        .lines()
+        .map(|line| serde_json::from_str::<HistoryRecord>(line).unwrap().id)
+        .collect();
+    assert_eq!(ids, ["1", "2"]);
+
+    let reopened = HistoryIndex::open(path).unwrap();
+    assert_eq!(reopened.records, index.records);
+    assert_eq!(reopened.newest, Some(200));
+}
+
+#[tokio::test]
+async fn a_torn_last_line_is_skipped_and_the_next_append_starts_a_new_line() {
+    let tmp = tempfile::tempdir().unwrap();
+    let path = tmp.path().join("tracearr.jsonl");
+    let kept = serde_json::to_string(&record("1", 100, "ann", "A", 30)).unwrap();
+    std::fs::write(&path, format!("{kept}\n{{\"id\":\"2\",\"at\"")).unwrap();
+
+    let mut index = HistoryIndex::open(path.clone()).unwrap();
+    assert_eq!(index.records.len(), 1);
+    index
+        .append(vec![record("3", 300, "ann", "C", 10)])
+        .await
+        .unwrap();
+
+    let reopened = HistoryIndex::open(path).unwrap();
+    let ids: Vec<&str> = reopened
+        .records
+        .iter()
+        .map(|record| record.id.as_str())
+        .collect();
+    assert_eq!(ids, ["1", "3"]);
+}
+
+#[tokio::test]
+async fn a_sync_reads_back_through_the_overlap_and_skips_running_plays() {
+    let tmp = tempfile::tempdir().unwrap();
+    let mut index = HistoryIndex::open(tmp.path().join("tautulli.jsonl")).unwrap();
+    let newest = 10 * SYNC_OVERLAP_SECS;
+    index
+        .append(vec![record("old", newest, "ann", "A", 1)])
+        .await
+        .unwrap();
+
+    let requested = Arc::new(Mutex::new(Vec::new()));
+    let seen = requested.clone();
+    let appended = index
+        .sync(move |page| {
+            seen.lock().unwrap().push(page);
+            let mut running = row("live", newest + 50);
+            running["finished"] = json!(false);
+            let rows = match page {
+                // A full page, newest first, with one play still running.
+                0 => vec![running, row("new", newest + 20), row("old", newest)],
+                // Still inside the overlap: a long play that stopped late.
+                1 => vec![
+                    row("late", newest - 60),
+                    row("x", newest - 100),
+                    row("y", newest - 200),
+                ],
+                // Past the overlap: the last page read.
+                _ => vec![
+                    row("z", newest - 2 * SYNC_OVERLAP_SECS),
+                    row("w", newest - 3 * SYNC_OVERLAP_SECS),
+                    row("v", newest - 4 * SYNC_OVERLAP_SECS),
+                ],
+            };
+            async move { Ok(HistoryPage::new(&rows, 3, parse)) }
+        })
+        .await
+        .unwrap();
+
+    assert_eq!(*requested.lock().unwrap(), [0, 1, 2]);
+    // "live" waits for a later sync; "old" was already indexed.
+    assert_eq!(appended, 7);
+    assert!(!index.ids.contains("live"));
+    assert!(!index.truncated);
+}
+
+#[tokio::test]
+async fn a_first_sync_stops_at_the_row_cap_and_remembers_it() {
+    let tmp = tempfile::tempdir().unwrap();
+    let path = tmp.path().join("tracearr.jsonl");
+    let mut index = HistoryIndex::open(path.clone()).unwrap();
+    let page_size = 1_000;
+
+    let appended = index
+        .sync(|page| {
+            let rows = (0..page_size)
+                .map(|n| {
+                    let id = page * page_size + n;
+                    record(&id.to_string(), -(id as i64), "ann", "A", 1)
+                })
+                .collect();
+            async move { Ok(history_page(rows, page_size)) }
+        })
+        .await
+        .unwrap();
+
+    assert_eq!(appended, MAX_SYNC_ROWS);
+    assert!(index.truncated);
+    // A restart still knows older history was left out.
+    assert!(HistoryIndex::open(path).unwrap().truncated);
+}
+
+#[tokio::test]
+async fn a_delta_sync_is_not_cut_off_at_the_row_cap() {
+    let tmp = tempfile::tempdir().unwrap();
+    let mut index = HistoryIndex::open(tmp.path().join("tracearr.jsonl")).unwrap();
+    index
+        .append(vec![record("old", 0, "ann", "A", 1)])
+        .await
+        .unwrap();
+    let page_size = 1_000;
+    let pages = MAX_SYNC_ROWS / page_size + 2;
+
+    let appended = index
+        .sync(|page| {
+            // Every play is newer than the indexed one; the last page is short.
+            let count = if page + 1 < pages { page_size } else { 10 };
+            let rows = (0..count)
+                .map(|n| {
+                    let id = page * page_size + n;
+                    record(&id.to_string(), 1_000_000 - id as i64, "ann", "A", 1)
+                })
+                .collect();
+            async move { Ok(history_page(rows, page_size)) }
+        })
+        .await
+        .unwrap();
+
+    assert_eq!(appended, (pages - 1) * page_size + 10);
+    assert!(!index.truncated);
+}
+
+/// A Tracearr stand-in serving `total` finished sessions newest first, 100 per
+/// page. Records every page it is asked for.
+async fn tracearr(total: i64, pages: Arc<Mutex<Vec<String>>>) -> ServiceConfig {
+    let app = axum::Router::new().route(
+        "/api/v1/public/history",
+        axum::routing::get(move |Query(query): Query<HashMap<String, String>>| {
+            let pages = pages.clone();
+            async move {
+                let page: i64 = query["page"].parse().unwrap();
+                let size: i64 = query["pageSize"].parse().unwrap();
+                pages.lock().unwrap().push(page.to_string());
+                let data: Vec<Value> = ((page - 1) * size..(page * size).min(total))
+                    .map(|n| {
+                        let at = chrono::DateTime::from_timestamp(1_700_000_000 - n * 3_600, 0)
+                            .unwrap()
+                            .to_rfc3339();
+                        json!({
+                            "id": format!("s{n}"),
+                            "startedAt": at,
+                            "stoppedAt": at,
+                            "mediaType": "episode",
+                            "showTitle": "Show",
+                            "mediaTitle": format!("Episode {n}"),
+                            "durationMs": 60_000,
+                            "user": {"username": "ann"},
+                        })
+                    })
+                    .collect();
+                axum::Json(json!({"data": data, "meta": {"total": total, "page": page}}))
+            }
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    ServiceConfig {
+        name: "tracearr".into(),
+        kind: ServiceKind::Tracearr,
+        base_url: format!("http://{address}"),
+        api_key: Some("secret".into()),
+        ..ServiceConfig::default()
+    }
+}
+
+fn service(config: ServiceConfig) -> YarrService {
+    let config = YarrConfig {
+        services: vec![config],
+    };
+    let client = YarrClient::new(&config).unwrap();
+    YarrService::new(client, config)
+}
+
+#[tokio::test]
+async fn summaries_sync_once_then_answer_from_the_index() {
+    let tmp = tempfile::tempdir().unwrap();
+    let pages = Arc::new(Mutex::new(Vec::new()));
+    let svc = service(tracearr(150, pages.clone()).await).with_data_dir(tmp.path().to_path_buf());
+
+    let first = svc
+        .trace_history_summary("tracearr", None, None, None, true)
+        .await
+        .unwrap();
+    assert_eq!(first["plays"], 150);
+    assert_eq!(first["index"]["synced"], true);
+    assert_eq!(first["index"]["appended"], 150);
+    assert_eq!(
+        first["top_titles"],
+        json!([{"title": "Show", "plays": 150, "duration_secs": 9_000}])
+    );
+    assert_eq!(*pages.lock().unwrap(), ["1", "2"]);
+
+    // Within the freshness window nothing is fetched.
+    let second = svc
+        .trace_history_summary("tracearr", None, Some("ann"), Some(1), true)
+        .await
+        .unwrap();
+    assert_eq!(second["index"]["synced"], false);
+    assert_eq!(second["plays"], 150);
+    assert_eq!(pages.lock().unwrap().len(), 2);
+    assert!(tmp.path().join("history").join("tracearr.jsonl").exists());
+}
+
+#[tokio::test]
+async fn summaries_need_a_data_dir_and_a_positive_window() {
+    let svc = service(tracearr(0, Arc::default()).await);
+    let error = svc
+        .trace_history_summary("tracearr", None, None, None, false)
+        .await
+        .unwrap_err();
+    assert!(format!("{error:#}").contains("no data dir"), "{error:#}");
+
+    let tmp = tempfile::tempdir().unwrap();
+    let svc = svc.with_data_dir(tmp.path().to_path_buf());
+    let error = svc
+        .trace_history_summary("tracearr", Some(0), None, None, false)
+        .await
+        .unwrap_err();
+    assert!(format!("{error:#}").contains("days"), "{error:#}");
+}
@@ -5,9 +5,11 @@ use serde_json::Value;
 
 use crate::app::YarrService;
 use crate::openapi::{self, OperationSpec};
-use crate::yarr::{OpenApiRequest, helpers::build_operation_url};
+use crate::yarr::{OpenApiRequest, Projection, helpers::build_operation_url};
 
+mod batch;
 mod body;
+mod pages;
 mod parameters;
 
 use body::{encode_request_body, select_response};
@@ -16,7 +18,14 @@ use parameters::prepare_parameters;
 impl YarrService {
     /// Execute a supported generated operation. Unsupported operations are absent
     /// from `find_operation` and exposed through the generated omission table.
-    pub async fn execute_operation(&self, service: &str, op: &str, args: &Value) -> Result<Value> {
+    /// `projection` applies to JSON responses only.
+    pub async fn execute_operation(
+        &self,
+        service: &str,
+        op: &str,
+        args: &Value,
+        projection: Option<Projection>,
+    ) -> Result<Value> {
         let config = self.service(service)?;
         let spec = openapi::find_operation(config.kind, op).ok_or_else(|| {
             anyhow!(
@@ -24,7 +33,8 @@ impl YarrService {
                 config.kind.as_str()
             )
         })?;
-        self.execute_operation_spec(config, spec, args).await
+        self.execute_operation_spec(config, spec, args, projection.as_ref())
+            .await
     }
 
     async fn execute_operation_spec(
@@ -32,6 +42,7 @@ impl YarrService {
         config: &crate::config::ServiceConfig,
         spec: &OperationSpec,
         args: &Value,
+        projection: Option<&Projection>,
     ) -> Result<Value> {
         let object = args
             .as_object()
@@ -64,11 +75,24 @@ impl YarrService {
                 accept: Some(response.media_type),
                 expected_encoding: response.encoding,
                 expected_media_type: response.media_type,
+                projection,
             })
             .await
     }
 }
 
+/// Serialize `args` for `spec` and count the encoded pairs — the parameter half
+/// of [`YarrService::execute_operation`], exposed for the `benches/` suite
+/// through `crate::bench`.
+#[cfg(any(test, feature = "test-support"))]
+pub(crate) fn encoded_parameter_count(
+    spec: &OperationSpec,
+    args: &serde_json::Map<String, Value>,
+) -> Result<usize> {
+    let encoded = prepare_parameters(spec, args)?;
+    Ok(encoded.path.len() + encoded.query.len() + encoded.headers.len())
+}
+
 // Focused compatibility helpers retained for existing unit tests.
 #[cfg(test)]
 fn serialize_parameter(
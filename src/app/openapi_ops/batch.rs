@@ -0,0 +1,153 @@
+//! `op_batch`: many generated operations against one service in one call.
+//!
+//! The whole batch is validated before anything is sent — an unknown op, a
+//! non-object `args`, or a parameter `prepare_parameters` rejects fails the call
+//! with the offending item's index and nothing runs. Valid batches then execute
+//! at most [`OP_BATCH_CONCURRENCY`] at a time over the shared client and report
+//! one compact row per item instead of every upstream body.
+
+use std::sync::atomic::{AtomicBool, Ordering};
+
+use anyhow::{Result, anyhow, bail};
+use futures_util::StreamExt;
+use futures_util::stream;
+use serde::Serialize;
+use serde_json::{Value, json};
+
+use super::parameters::prepare_parameters;
+use crate::actions::OpBatchItem;
+use crate::app::YarrService;
+use crate::config::ServiceConfig;
+use crate::openapi::{self, OperationSpec};
+use crate::token_limit::{MAX_RESPONSE_BYTES, serialized_len_within};
+
+/// Operations in flight at once. Deliberately below the fleet probe width:
+/// these are writes against one upstream, usually a single SQLite-backed *arr.
+const OP_BATCH_CONCURRENCY: usize = 4;
+
+/// Longest per-item error kept in the result, in characters.
+const MAX_ITEM_ERROR_CHARS: usize = 200;
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize)]
+#[serde(rename_all = "lowercase")]
+enum ItemStatus {
+    Ok,
+    Error,
+    /// Not started because an earlier item failed under `stop_on_error`.
+    Skipped,
+}
+
+#[derive(Debug, Serialize)]
+struct ItemResult {
+    index: usize,
+    op: String,
+    status: ItemStatus,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    error: Option<String>,
+}
+
+impl YarrService {
+    /// Run every item of an `op_batch` against `service`. Fails as a whole only
+    /// when validation rejects an item; upstream failures are per-item rows.
+    pub async fn execute_operation_batch(
+        &self,
+        service: &str,
+        items: &[OpBatchItem],
+        stop_on_error: bool,
+    ) -> Result<Value> {
+        let config = self.service(service)?;
+        let specs = items
+            .iter()
+            .enumerate()
+            .map(|(index, item)| {
+                validate_item(config, item)
+                    .map_err(|error| anyhow!("items[{index}] (`{}`): {error:#}", item.op))
+            })
+            .collect::<Result<Vec<_>>>()?;
+
+        let stopped = AtomicBool::new(false);
+        let stopped = &stopped;
+        let results: Vec<ItemResult> = stream::iter(items.iter().zip(specs).enumerate())
+            .map(|(index, (item, spec))| async move {
+                let row = |status, error| ItemResult {
+                    index,
+                    op: item.op.clone(),
+                    status,
+                    error,
+                };
+                if stopped.load(Ordering::Acquire) {
+                    return row(ItemStatus::Skipped, None);
+                }
+                match self
+                    .execute_operation_spec(config, spec, &item.args, None)
+                    .await
+                {
+                    Ok(_) => row(ItemStatus::Ok, None),
+                    Err(error) => {
+                        if stop_on_error {
+                            stopped.store(true, Ordering::Release);
+                        }
+                        row(ItemStatus::Error, Some(clip(&format!("{error:#}"))))
+                    }
+                }
+            })
+            .buffered(OP_BATCH_CONCURRENCY)
+            .collect()
+            .await;
+
+        Ok(batch_summary(results))
+    }
+}
+
+/// Resolve `item`'s operation and check its args the way the executor will,
+/// without building a request.
+fn validate_item(config: &ServiceConfig, item: &OpBatchItem) -> Result<&'static OperationSpec> {
+    let Some(spec) = openapi::find_operation(config.kind, &item.op) else {
+        bail!("unknown or unsupported {} operation", config.kind.as_str());
+    };
+    let Some(args) = item.args.as_object() else {
+        bail!("args must be an object");
+    };
+    if args.contains_key("multipartFixture") {
+        bail!("multipartFixture is not supported; submit multipartFileBase64 and fileName");
+    }
+    prepare_parameters(spec, args)?;
+    Ok(spec)
+}
+
+/// Counts plus one row per item. If the rows would not fit the response budget,
+/// the `ok` rows are dropped (their count remains) so every failure stays
+/// visible instead of the whole payload being truncated.
+fn batch_summary(mut results: Vec<ItemResult>) -> Value {
+    let count = |status: ItemStatus| results.iter().filter(|row| row.status == status).count();
+    let (succeeded, failed, skipped) = (
+        count(ItemStatus::Ok),
+        count(ItemStatus::Error),
+        count(ItemStatus::Skipped),
+    );
+    let mut summary = json!({
+        "total": results.len(),
+        "succeeded": succeeded,
+        "failed": failed,
+        "skipped": skipped,
+        "items": &results,
+    });
+    if serialized_len_within(&summary, MAX_RESPONSE_BYTES).is_none() {
+        results.retain(|row| row.status != ItemStatus::Ok);
+        summary["items"] = json!(results);
+        summary["ok_items_omitted"] = json!(true);
+    }
+    summary
+}
+
+/// `error` cut to [`MAX_ITEM_ERROR_CHARS`] characters, marked with `…` when cut.
+fn clip(error: &str) -> String {
+    match error.char_indices().nth(MAX_ITEM_ERROR_CHARS) {
+        Some((end, _)) => format!("{}…", &error[..end]),
+        None => error.to_owned(),
+    }
+}
+
+#[cfg(test)]
+#[path = "batch_tests.rs"]
+mod tests;
@@ -0,0 +1,167 @@
+use std::sync::Arc;
+use std::sync::atomic::{AtomicUsize, Ordering};
+
+use axum::extract::Path;
+use axum::http::StatusCode;
+use serde_json::json;
+
+use super::clip;
+use crate::actions::OpBatchItem;
+use crate::app::YarrService;
+use crate::config::{ServiceConfig, ServiceKind, YarrConfig};
+use crate::yarr::YarrClient;
+
+/// A Sonarr-shaped upstream whose `/series/{id}` answers 500 for id 2 and
+/// counts every request it sees.
+async fn upstream(hits: Arc<AtomicUsize>) -> YarrService {
+    let app = axum::Router::new().route(
+        "/api/v3/series/{id}",
+        axum::routing::get(move |Path(id): Path<u64>| {
+            let hits = hits.clone();
+            async move {
+                hits.fetch_add(1, Ordering::SeqCst);
+                if id == 2 {
+                    return Err(StatusCode::INTERNAL_SERVER_ERROR);
+                }
+                Ok(axum::Json(json!({"id": id, "title": "Series"})))
+            }
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+
+    let config = YarrConfig {
+        services: vec![ServiceConfig {
+            name: "sonarr".into(),
+            kind: ServiceKind::Sonarr,
+            base_url: format!("http://{address}"),
+            api_key: Some("secret".into()),
+            ..ServiceConfig::default()
+        }],
+    };
+    let client = YarrClient::new(&config).unwrap();
+    YarrService::new(client, config)
+}
+
+fn series(ids: &[u64]) -> Vec<OpBatchItem> {
+    ids.iter()
+        .map(|id| OpBatchItem {
+            op: "get_series_by_id".into(),
+            args: json!({"id": id}),
+        })
+        .collect()
+}
+
+#[tokio::test]
+async fn runs_every_item_and_reports_per_item_status() {
+    let hits = Arc::new(AtomicUsize::new(0));
+    let service = upstream(hits.clone()).await;
+
+    let result = service
+        .execute_operation_batch("sonarr", &series(&[1, 2, 3, 4, 5]), false)
+        .await
+        .unwrap();
+
+    assert_eq!(hits.load(Ordering::SeqCst), 5);
+    assert_eq!(result["total"], 5);
+    assert_eq!(result["succeeded"], 4);
+    assert_eq!(result["failed"], 1);
+    assert_eq!(result["skipped"], 0);
+    let statuses: Vec<_> = result["items"]
+        .as_array()
+        .unwrap()
+        .iter()
+        .map(|row| row["status"].as_str().unwrap())
+        .collect();
+    assert_eq!(statuses, ["ok", "error", "ok", "ok", "ok"]);
+    assert_eq!(result["items"][1]["index"], 1);
+    assert!(result["items"][1]["error"].is_string());
+    assert!(result["items"][0].get("error").is_none());
+}
+
+#[tokio::test]
+async fn stop_on_error_skips_items_not_yet_started() {
+    let hits = Arc::new(AtomicUsize::new(0));
+    let service = upstream(hits.clone()).await;
+    let ids: Vec<u64> = (2..40).collect();
+
+    let result = service
+        .execute_operation_batch("sonarr", &series(&ids), true)
+        .await
+        .unwrap();
+
+    // Item 0 fails; only the window already in flight may still run.
+    assert_eq!(result["items"][0]["status"], "error");
+    assert!(hits.load(Ordering::SeqCst) < ids.len());
+    assert!(result["skipped"].as_u64().unwrap() > 0);
+    assert_eq!(result["items"][ids.len() - 1]["status"], "skipped");
+}
+
+#[tokio::test]
+async fn an_invalid_item_fails_the_batch_before_anything_runs() {
+    let hits = Arc::new(AtomicUsize::new(0));
+    let service = upstream(hits.clone()).await;
+    let mut items = series(&[1, 3]);
+    items.push(OpBatchItem {
+        op: "get_series_by_id".into(),
+        args: json!({}),
+    });
+
+    let error = service
+        .execute_operation_batch("sonarr", &items, false)
+        .await
+        .unwrap_err()
+        .to_string();
+
+    assert!(
+        error.starts_with("items[2] (`get_series_by_id`)"),
+        "{error}"
+    );
+    assert!(error.contains("requires path parameter `id`"), "{error}");
+    assert_eq!(hits.load(Ordering::SeqCst), 0);
+
+    items[2].op = "no_such_op".into();
+    let error = service
+        .execute_operation_batch("sonarr", &items, false)
+        .await
+        .unwrap_err()
+        .to_string();
+    assert!(
+        error.contains("unknown or unsupported sonarr operation"),
+        "{error}"
+    );
+}
+
+#[test]
+fn ok_rows_are_dropped_when_the_batch_outgrows_the_budget() {
+    let rows = (0..2_000)
+        .map(|index| super::ItemResult {
+            index,
+            op: "put_episode_monitor".into(),
+            status: if index == 7 {
+                super::ItemStatus::Error
+            } else {
+                super::ItemStatus::Ok
+            },
+            error: (index == 7).then(|| "HTTP 500".into()),
+        })
+        .collect();
+
+    let summary = super::batch_summary(rows);
+
+    assert_eq!(summary["succeeded"], 1_999);
+    assert_eq!(summary["ok_items_omitted"], true);
+    assert_eq!(
+        summary["items"],
+        json!([{"index": 7, "op": "put_episode_monitor", "status": "error", "error": "HTTP 500"}])
+    );
+}
+
+#[test]
+fn clip_keeps_short_errors_and_cuts_long_ones_on_a_char_boundary() {
+    assert_eq!(clip("HTTP 404"), "HTTP 404");
+    let clipped = clip(&"\u{e9}".repeat(300));
+    assert_eq!(clipped.chars().count(), 201);
+    assert!(clipped.ends_with('…'));
+}
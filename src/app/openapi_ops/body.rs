@@ -89,7 +89,7 @@ pub(super) fn encode_request_body(
             .map(Some),
         BodyEncoding::FormUrlEncoded => Ok(Some(EncodedRequestBody::Form(form_pairs(
             required_object_body(spec, args)?,
-            representation.encoding_metadata,
+            representation.encoding_metadata_json(),
         )?))),
         BodyEncoding::Multipart => Ok(Some(EncodedRequestBody::Multipart(multipart_fields(
             spec,
@@ -122,9 +122,8 @@ fn required_object_body<'a>(
 
 fn form_pairs(
     body: &serde_json::Map<String, Value>,
-    encoding_metadata: &str,
+    metadata: &Value,
 ) -> Result<Vec<(String, String)>> {
-    let metadata: Value = serde_json::from_str(encoding_metadata).unwrap_or(Value::Null);
     let mut output = Vec::new();
     for (name, value) in body {
         let encoding = metadata.get(name);
@@ -167,7 +166,7 @@ fn multipart_fields(
             .get("multipartField")
             .and_then(Value::as_str)
             .map(str::to_string)
-            .or_else(|| binary_property_name(representation.schema))
+            .or_else(|| binary_property_name(representation.schema_json()))
             .unwrap_or_else(|| "file".to_string());
         fields.push(MultipartField::File {
             file_name: args
@@ -179,7 +178,7 @@ fn multipart_fields(
                 .get("multipartMediaType")
                 .and_then(Value::as_str)
                 .map(str::to_string)
-                .or_else(|| property_media_type(representation.encoding_metadata, &name))
+                .or_else(|| property_media_type(representation.encoding_metadata_json(), &name))
                 .unwrap_or_else(|| "application/octet-stream".to_string()),
             name,
             bytes: decode_base64_arg(spec, args, "multipartFileBase64")?,
@@ -212,8 +211,7 @@ fn decode_base64_arg(
     Ok(bytes)
 }
 
-fn binary_property_name(schema: &str) -> Option<String> {
-    let schema: Value = serde_json::from_str(schema).ok()?;
+fn binary_property_name(schema: &Value) -> Option<String> {
     schema
         .get("properties")?
         .as_object()?
@@ -223,9 +221,8 @@ fn binary_property_name(schema: &str) -> Option<String> {
         })
 }
 
-fn property_media_type(metadata: &str, field: &str) -> Option<String> {
-    serde_json::from_str::<Value>(metadata)
-        .ok()?
+fn property_media_type(metadata: &Value, field: &str) -> Option<String> {
+    metadata
         .get(field)?
         .get("contentType")?
         .as_str()
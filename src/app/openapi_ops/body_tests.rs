@@ -2,9 +2,6 @@ use super::*;
 
 #[test]
 fn binary_property_discovery_uses_schema_format() {
-    assert_eq!(
-        binary_property_name(r#"{"properties":{"archive":{"type":"string","format":"binary"}}}"#)
-            .as_deref(),
-        Some("archive")
-    );
+    let schema = serde_json::json!({"properties":{"archive":{"type":"string","format":"binary"}}});
+    assert_eq!(binary_property_name(&schema).as_deref(), Some("archive"));
 }
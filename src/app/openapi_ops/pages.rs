@@ -0,0 +1,145 @@
+//! `op` with `all_pages`: every page of a paged *arr list in one call.
+//!
+//! Sonarr/Radarr/Prowlarr paged endpoints (history, queue, wanted/missing,
+//! blocklist) answer `{page, pageSize, totalRecords, records}`. The first page
+//! is read as requested; once it reports `totalRecords`, the remaining pages
+//! are read [`PAGE_CONCURRENCY`] at a time and their `records` appended in page
+//! order. A response without that envelope is returned unchanged. Pages come
+//! from a live list, so a row added mid-read can shift one record across a
+//! page boundary.
+
+use anyhow::{Context, Result, anyhow, ensure};
+use futures_util::StreamExt;
+use futures_util::stream;
+use serde_json::{Value, json};
+
+use crate::app::YarrService;
+use crate::openapi::{self, OperationSpec};
+use crate::yarr::Projection;
+
+/// Pages in flight at once after the first. Matches `op_batch`: one upstream,
+/// usually a single SQLite-backed *arr.
+const PAGE_CONCURRENCY: usize = 4;
+
+/// `pageSize` sent when the caller gives none; the *arr default is 10.
+const DEFAULT_PAGE_SIZE: u64 = 250;
+
+/// Most records one read gathers. Pages past it are not requested, records
+/// past it on the last page read are dropped, and either marks the result
+/// `truncated`.
+const MAX_PAGED_RECORDS: u64 = 50_000;
+
+impl YarrService {
+    /// Execute a paged generated operation and gather every page. `projection`
+    /// applies to each page; callers put it under `records` so the paging
+    /// envelope survives. The result is the first page's envelope with all
+    /// `records`, plus `pages` (pages read) and `truncated`.
+    pub async fn execute_operation_pages(
+        &self,
+        service: &str,
+        op: &str,
+        args: &Value,
+        projection: Option<Projection>,
+    ) -> Result<Value> {
+        let config = self.service(service)?;
+        let spec = openapi::find_operation(config.kind, op).ok_or_else(|| {
+            anyhow!(
+                "unknown or unsupported {} operation `{op}`",
+                config.kind.as_str()
+            )
+        })?;
+        ensure!(
+            takes(spec, "page"),
+            "operation `{op}` has no `page` parameter; all_pages applies to paged list operations"
+        );
+        let mut args = args
+            .as_object()
+            .cloned()
+            .ok_or_else(|| anyhow!("operation `{op}` args must be an object"))?;
+        let first_page = match args.get("page") {
+            None | Some(Value::Null) => 1,
+            Some(page) => page
+                .as_u64()
+                .filter(|page| *page > 0)
+                .ok_or_else(|| anyhow!("operation `{op}` `page` must be a positive integer"))?,
+        };
+        args.insert("page".into(), json!(first_page));
+        if takes(spec, "pageSize") && !args.contains_key("pageSize") {
+            args.insert("pageSize".into(), json!(DEFAULT_PAGE_SIZE));
+        }
+
+        let first = self
+            .execute_operation_spec(
+                config,
+                spec,
+                &Value::Object(args.clone()),
+                projection.as_ref(),
+            )
+            .await?;
+        let Some((page_size, total)) = envelope(&first) else {
+            return Ok(first);
+        };
+        let last_page = total.div_ceil(page_size);
+        let cap_page = (first_page - 1).saturating_add(MAX_PAGED_RECORDS.div_ceil(page_size));
+        let through = last_page.min(cap_page);
+
+        let args = &args;
+        let projection = projection.as_ref();
+        let rest: Vec<Result<Value>> = stream::iter(first_page + 1..=through)
+            .map(|page| async move {
+                let mut args = args.clone();
+                args.insert("page".into(), json!(page));
+                self.execute_operation_spec(config, spec, &Value::Object(args), projection)
+                    .await
+                    .with_context(|| format!("operation `{op}` page {page}"))
+            })
+            .buffered(PAGE_CONCURRENCY)
+            .collect()
+            .await;
+        let rest = rest.into_iter().collect::<Result<Vec<_>>>()?;
+
+        let pages = 1 + rest.len();
+        Ok(merge(first, rest, pages, through < last_page))
+    }
+}
+
+fn takes(spec: &OperationSpec, name: &str) -> bool {
+    spec.query_params.contains(&name)
+}
+
+/// `(pageSize, totalRecords)` of a paged response with a `records` array.
+fn envelope(response: &Value) -> Option<(u64, u64)> {
+    response.get("records")?.as_array()?;
+    let page_size = response
+        .get("pageSize")?
+        .as_u64()
+        .filter(|size| *size > 0)?;
+    let total = response.get("totalRecords")?.as_u64()?;
+    Some((page_size, total))
+}
+
+fn merge(first: Value, rest: Vec<Value>, pages: usize, truncated: bool) -> Value {
+    let Value::Object(mut out) = first else {
+        return first;
+    };
+    let mut records = match out.remove("records") {
+        Some(Value::Array(records)) => records,
+        _ => Vec::new(),
+    };
+    for mut page in rest {
+        if let Some(Value::Array(more)) = page.get_mut("records").map(Value::take) {
+            records.extend(more);
+        }
+    }
+    let cap = usize::try_from(MAX_PAGED_RECORDS).unwrap_or(usize::MAX);
+    let truncated = truncated || records.len() > cap;
+    records.truncate(cap);
+    out.insert("records".into(), Value::Array(records));
+    out.insert("pages".into(), json!(pages));
+    out.insert("truncated".into(), json!(truncated));
+    Value::Object(out)
+}
+
+#[cfg(test)]
+#[path = "pages_tests.rs"]
+mod tests;
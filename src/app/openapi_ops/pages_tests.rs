@@ -0,0 +1,145 @@
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
+
+use axum::extract::Query;
+use axum::http::StatusCode;
+use serde_json::{Value, json};
+
+use crate::app::YarrService;
+use crate::config::{ServiceConfig, ServiceKind, YarrConfig};
+use crate::yarr::{Projection, YarrClient};
+
+/// A Sonarr-shaped `/history` with `total` records, ids `0..total` in order.
+/// Records every `(page, pageSize)` it is asked for; page 3 fails when
+/// `fail_third` is set.
+async fn upstream(total: u64, fail_third: bool, seen: Arc<Mutex<Vec<(u64, u64)>>>) -> YarrService {
+    let app = axum::Router::new().route(
+        "/api/v3/history",
+        axum::routing::get(move |Query(query): Query<HashMap<String, String>>| {
+            let seen = seen.clone();
+            async move {
+                let page: u64 = query["page"].parse().unwrap();
+                let size: u64 = query["pageSize"].parse().unwrap();
+                seen.lock().unwrap().push((page, size));
+                if fail_third && page == 3 {
+                    return Err(StatusCode::INTERNAL_SERVER_ERROR);
+                }
+                let records: Vec<Value> = ((page - 1) * size..(page * size).min(total))
+                    .map(|id| json!({"id": id, "eventType": "grabbed"}))
+                    .collect();
+                Ok(axum::Json(json!({
+                    "page": page,
+                    "pageSize": size,
+                    "sortKey": "date",
+                    "totalRecords": total,
+                    "records": records,
+                })))
+            }
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+
+    let config = YarrConfig {
+        services: vec![ServiceConfig {
+            name: "sonarr".into(),
+            kind: ServiceKind::Sonarr,
+            base_url: format!("http://{address}"),
+            api_key: Some("secret".into()),
+            ..ServiceConfig::default()
+        }],
+    };
+    let client = YarrClient::new(&config).unwrap();
+    YarrService::new(client, config)
+}
+
+fn ids(result: &Value) -> Vec<u64> {
+    result["records"]
+        .as_array()
+        .unwrap()
+        .iter()
+        .map(|record| record["id"].as_u64().unwrap())
+        .collect()
+}
+
+#[tokio::test]
+async fn reads_every_page_in_order_with_a_large_default_page_size() {
+    let seen = Arc::new(Mutex::new(Vec::new()));
+    let service = upstream(620, false, seen.clone()).await;
+
+    let result = service
+        .execute_operation_pages("sonarr", "get_history", &json!({}), None)
+        .await
+        .unwrap();
+
+    assert_eq!(ids(&result), (0..620).collect::<Vec<_>>());
+    assert_eq!(result["totalRecords"], 620);
+    assert_eq!(result["sortKey"], "date");
+    assert_eq!(result["pages"], 3);
+    assert_eq!(result["truncated"], false);
+    let mut seen = seen.lock().unwrap().clone();
+    seen.sort_unstable();
+    assert_eq!(seen, [(1, 250), (2, 250), (3, 250)]);
+}
+
+#[tokio::test]
+async fn starts_at_the_requested_page_and_projects_each_record() {
+    let seen = Arc::new(Mutex::new(Vec::new()));
+    let service = upstream(25, false, seen.clone()).await;
+
+    let result = service
+        .execute_operation_pages(
+            "sonarr",
+            "get_history",
+            &json!({"page": 2, "pageSize": 10}),
+            Some(Projection::fields(["id"]).at(&["records"])),
+        )
+        .await
+        .unwrap();
+
+    assert_eq!(ids(&result), (10..25).collect::<Vec<_>>());
+    assert_eq!(result["records"][0], json!({"id": 10}));
+    assert_eq!(result["pages"], 2);
+    assert_eq!(seen.lock().unwrap().len(), 2);
+}
+
+#[tokio::test]
+async fn records_cut_at_the_cap_mark_the_read_truncated() {
+    // 300 does not divide the cap: the last page allowed is also the upstream's
+    // last, and only the cut at 50000 records leaves anything out.
+    let service = upstream(50_100, false, Arc::default()).await;
+
+    let result = service
+        .execute_operation_pages("sonarr", "get_history", &json!({"pageSize": 300}), None)
+        .await
+        .unwrap();
+
+    assert_eq!(result["pages"], 167);
+    assert_eq!(ids(&result).len(), 50_000);
+    assert_eq!(result["truncated"], true);
+}
+
+#[tokio::test]
+async fn a_failed_page_fails_the_read_and_names_the_page() {
+    let service = upstream(620, true, Arc::default()).await;
+
+    let error = service
+        .execute_operation_pages("sonarr", "get_history", &json!({}), None)
+        .await
+        .unwrap_err();
+
+    assert!(format!("{error:#}").contains("page 3"), "{error:#}");
+}
+
+#[tokio::test]
+async fn operations_without_a_page_parameter_are_refused() {
+    let service = upstream(0, false, Arc::default()).await;
+
+    let error = service
+        .execute_operation_pages("sonarr", "get_series", &json!({}), None)
+        .await
+        .unwrap_err();
+
+    assert!(error.to_string().contains("`page`"), "{error:#}");
+}
@@ -92,7 +92,7 @@ async fn execute_operation_requires_each_path_param_before_dispatch() {
     // fail at param resolution with a clear message BEFORE any network call.
     let service = loopback_state().service;
     let err = service
-        .execute_operation("sonarr", "get_series_by_id", &json!({}))
+        .execute_operation("sonarr", "get_series_by_id", &json!({}), None)
         .await
         .expect_err("missing path param must error before HTTP");
     let msg = err.to_string();
@@ -106,7 +106,7 @@ async fn execute_operation_requires_each_path_param_before_dispatch() {
 async fn execute_operation_rejects_unknown_op() {
     let service = loopback_state().service;
     let err = service
-        .execute_operation("sonarr", "no_such_op", &json!({}))
+        .execute_operation("sonarr", "no_such_op", &json!({}), None)
         .await
         .expect_err("unknown op must error");
     assert!(err.to_string().contains("unknown"), "got: {err}");
@@ -123,6 +123,7 @@ async fn production_runtime_rejects_repo_relative_multipart_fixture() {
             "sonarr",
             "post_system_backup_restore_upload",
             &json!({"multipartFixture":"fixture.zip"}),
+            None,
         )
         .await
         .unwrap_err();
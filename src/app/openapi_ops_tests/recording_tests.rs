@@ -45,12 +45,12 @@ async fn required_query_header_cookie_and_style_explode_are_recorded() {
         JSON_RESPONSE,
     );
     let error = service
-        .execute_operation_spec(&config, &spec, &json!({}))
+        .execute_operation_spec(&config, &spec, &json!({}), None)
         .await
         .unwrap_err();
     assert!(error.to_string().contains("requires query parameter `ids`"));
     assert!(requests.try_recv().is_err());
-    service.execute_operation_spec(&config, &spec, &json!({"ids":[1,2],"filter":{"state":"ready"},"X-Modes":["full","safe"],"session":"a b"})).await.unwrap();
+    service.execute_operation_spec(&config, &spec, &json!({"ids":[1,2],"filter":{"state":"ready"},"X-Modes":["full","safe"],"session":"a b"}), None).await.unwrap();
     let request = requests.recv().await.unwrap();
     assert!(request.uri.contains("ids=1%2C2"));
     assert!(request.uri.contains("filter%5Bstate%5D=ready"));
@@ -103,7 +103,7 @@ async fn form_multipart_text_and_binary_requests_are_recorded() {
             JSON_RESPONSE,
         );
         service
-            .execute_operation_spec(&config, &spec, &args)
+            .execute_operation_spec(&config, &spec, &args, None)
             .await
             .unwrap();
     }
@@ -134,7 +134,7 @@ async fn form_multipart_text_and_binary_requests_are_recorded() {
         }),
         JSON_RESPONSE,
     );
-    service.execute_operation_spec(&config, &spec, &json!({"body":{"note":"hello"},"multipartFileBase64":base64::engine::general_purpose::STANDARD.encode([1,2,3]),"fileName":"fixture.zip"})).await.unwrap();
+    service.execute_operation_spec(&config, &spec, &json!({"body":{"note":"hello"},"multipartFileBase64":base64::engine::general_purpose::STANDARD.encode([1,2,3]),"fileName":"fixture.zip"}), None).await.unwrap();
     let multipart = requests.recv().await.unwrap();
     let body = String::from_utf8_lossy(&multipart.body);
     assert!(body.contains("name=\"archive\"; filename=\"fixture.zip\""));
@@ -162,7 +162,7 @@ async fn text_and_binary_response_bytes_are_preserved() {
         );
         let spec = operation(HttpMethod::Get, path, &[], None, response);
         let value = service
-            .execute_operation_spec(&config, &spec, &json!({}))
+            .execute_operation_spec(&config, &spec, &json!({}), None)
             .await
             .unwrap();
         if encoding == BodyEncoding::Text {
@@ -13,8 +13,13 @@
 //!      double key, and the key never appears in `cmd`/path strings, which Tautulli
 //!      logs to its access log);
 //!   3. unwraps the envelope (`unwrap_tautulli`) — surfacing the upstream
-//!      `message` as an error when `result != "success"` — and slims the payload to
-//!      the fields agents need (AN-6 context budget).
+//!      `message` as an error when `result != "success"`. Read commands project
+//!      their rows to the fields agents need (AN-6 context budget) while the body
+//!      is parsed, so large histories are never held whole.
+//!
+//! `stats_history_summary` answers aggregate questions from the local history
+//! index (see [`super::history`]), paging `get_history` only for plays newer
+//! than the index.
 //!
 //! Read commands slim bulky analytics payloads. Write commands expose useful
 //! Tautulli maintenance operations; all of them (including the destructive
@@ -25,9 +30,10 @@ use anyhow::Result;
 use serde_json::{Value, json};
 
 use crate::app::YarrService;
+use crate::app::history::{HistoryPage, HistoryRecord, SummaryQuery, int, text};
 use crate::capability::Capability;
 use crate::config::ServiceConfig;
-use crate::yarr::{query_get, slim};
+use crate::yarr::{Projection, query_get, slim};
 
 /// Tautulli's single API base path. `cmd=` selects the command; auth (`apikey`)
 /// is injected by `query_get`, never appended here.
@@ -57,6 +63,23 @@ const HISTORY_FIELDS: &[&str] = &[
     "percent_complete",
 ];
 
+/// Fields read from a `history` row for the local history index.
+const INDEX_FIELDS: &[&str] = &[
+    "row_id",
+    "date",
+    "started",
+    "state",
+    "user",
+    "friendly_name",
+    "full_title",
+    "grandparent_title",
+    "media_type",
+    "play_duration",
+];
+
+/// `get_history` page length used when syncing the history index.
+const INDEX_PAGE_ROWS: usize = 1000;
+
 /// Fields kept for a slimmed `user` row (from `get_users`).
 const USER_FIELDS: &[&str] = &["user_id", "username", "plays"];
 
@@ -92,6 +115,36 @@ fn unwrap_tautulli(value: Value) -> Result<Value> {
     Ok(response.get("data").cloned().unwrap_or(Value::Null))
 }
 
+/// Read one ungrouped `get_history` row for the history index. A row with a
+/// `state` is a play still in progress.
+fn index_record(row: &Value) -> Option<(HistoryRecord, bool)> {
+    let media_type = text(row, "media_type");
+    let show = match media_type.as_deref() {
+        Some("episode") => text(row, "grandparent_title"),
+        _ => None,
+    };
+    let record = HistoryRecord {
+        id: int(row, "row_id")?.to_string(),
+        at: int(row, "date").or_else(|| int(row, "started"))?,
+        user: text(row, "user").or_else(|| text(row, "friendly_name")),
+        title: show.or_else(|| text(row, "full_title")),
+        media_type,
+        duration_secs: int(row, "play_duration"),
+    };
+    let finished = row.get("state").is_none_or(Value::is_null);
+    Some((record, finished))
+}
+
+/// Projection for the rows at `response.data[.under...]` of Tautulli's envelope.
+/// The `result`/`message` siblings stay whole so `unwrap_tautulli` still sees them.
+fn tautulli_rows(under: &[&str], fields: &[&str]) -> Projection {
+    let path: Vec<&str> = ["response", "data"]
+        .into_iter()
+        .chain(under.iter().copied())
+        .collect();
+    Projection::fields(fields.iter().copied()).at(&path)
+}
+
 impl YarrService {
     /// Resolve a Stats service and verify its capability. Central helper so every
     /// stats method shares one capability-checked resolution path; a non-tautulli
@@ -102,17 +155,22 @@ impl YarrService {
 
     /// Run a Tautulli `cmd=NAME` GET with the given extra params, returning the
     /// unwrapped `response.data`. `apikey` is injected by `query_get`; never pass
-    /// it in `extra`.
+    /// it in `extra`. `rows` (see [`tautulli_rows`]) is applied while parsing.
     async fn stats_cmd(
         &self,
         config: &ServiceConfig,
         command: &str,
         extra: &[(&str, &str)],
+        rows: Option<&Projection>,
     ) -> Result<Value> {
         let mut params: Vec<(&str, &str)> = vec![("cmd", command)];
         params.extend_from_slice(extra);
         let url = query_get(config, TAUTULLI_API, &params)?;
-        let raw = self.client_ref().send_get(config, url, None).await?;
+        let client = self.client_ref();
+        let raw = match rows {
+            Some(rows) => client.send_get_projected(config, url, rows).await?,
+            None => client.send_get(config, url, None).await?,
+        };
         unwrap_tautulli(raw)
     }
 
@@ -120,15 +178,18 @@ impl YarrService {
     /// per-stream essentials (`SESSION_FIELDS`). READ.
     pub async fn stats_activity(&self, service: &str) -> Result<Value> {
         let config = self.stats_context(service)?;
-        let data = self.stats_cmd(config, "get_activity", &[]).await?;
+        let rows = tautulli_rows(&["sessions"], SESSION_FIELDS);
+        let mut data = self
+            .stats_cmd(config, "get_activity", &[], Some(&rows))
+            .await?;
         let stream_count = data.get("stream_count").cloned().unwrap_or(json!(0));
         let sessions = data
-            .get("sessions")
-            .cloned()
+            .get_mut("sessions")
+            .map(Value::take)
             .unwrap_or(Value::Array(Vec::new()));
         Ok(json!({
             "stream_count": stream_count,
-            "sessions": slim(sessions, SESSION_FIELDS),
+            "sessions": sessions,
         }))
     }
 
@@ -156,26 +217,72 @@ impl YarrService {
         if let Some(u) = user {
             extra.push(("user", u));
         }
-        let data = self.stats_cmd(config, "get_history", &extra).await?;
-        // Tautulli wraps history rows under `data.data`; slim that array in place
-        // and keep the rest of the pagination envelope (recordsTotal, etc.).
-        let slimmed = match data {
-            Value::Object(mut map) => {
-                if let Some(rows) = map.remove("data") {
-                    map.insert("data".into(), slim(rows, HISTORY_FIELDS));
-                }
-                Value::Object(map)
-            }
-            other => slim(other, HISTORY_FIELDS),
+        // Tautulli wraps history rows under `data.data`; project that array in
+        // flight and keep the rest of the pagination envelope (recordsTotal, etc.).
+        let rows = tautulli_rows(&["data"], HISTORY_FIELDS);
+        let data = self
+            .stats_cmd(config, "get_history", &extra, Some(&rows))
+            .await?;
+        // A bare row array (no envelope) passes the projection untouched.
+        Ok(if data.is_object() {
+            data
+        } else {
+            slim(data, HISTORY_FIELDS)
+        })
+    }
+
+    /// Aggregate watch history (plays, per-user counts, top titles, media
+    /// types) from the local history index, syncing it first unless
+    /// `query.sync` is off. See [`super::history`]. READ.
+    pub async fn stats_history_summary(
+        &self,
+        service: &str,
+        days: Option<i64>,
+        user: Option<&str>,
+        top: Option<i64>,
+        sync: bool,
+    ) -> Result<Value> {
+        let config = self.stats_context(service)?;
+        let query = SummaryQuery {
+            days,
+            user,
+            top,
+            sync,
         };
-        Ok(slimmed)
+        self.history_summary(config, query, move |page| {
+            self.stats_history_page(config, page)
+        })
+        .await
+    }
+
+    /// GET one newest-first page of ungrouped `get_history` rows for the
+    /// history index. `page` is 0-based.
+    async fn stats_history_page(&self, config: &ServiceConfig, page: usize) -> Result<HistoryPage> {
+        let start = (page * INDEX_PAGE_ROWS).to_string();
+        let length = INDEX_PAGE_ROWS.to_string();
+        let extra = [
+            ("start", start.as_str()),
+            ("length", length.as_str()),
+            ("grouping", "0"),
+            ("order_column", "date"),
+            ("order_dir", "desc"),
+        ];
+        let rows = tautulli_rows(&["data"], INDEX_FIELDS);
+        let data = self
+            .stats_cmd(config, "get_history", &extra, Some(&rows))
+            .await?;
+        let rows = data
+            .get("data")
+            .and_then(Value::as_array)
+            .map_or(&[][..], Vec::as_slice);
+        Ok(HistoryPage::new(rows, INDEX_PAGE_ROWS, index_record))
     }
 
     /// GET `?cmd=get_users` → user list, slimmed to `USER_FIELDS`. READ.
     pub async fn stats_users(&self, service: &str) -> Result<Value> {
         let config = self.stats_context(service)?;
-        let data = self.stats_cmd(config, "get_users", &[]).await?;
-        Ok(slim(data, USER_FIELDS))
+        let rows = tautulli_rows(&[], USER_FIELDS);
+        self.stats_cmd(config, "get_users", &[], Some(&rows)).await
     }
 
     /// GET `?cmd=get_library_names` → library inventory, slimmed to
@@ -187,8 +294,9 @@ impl YarrService {
     /// can see configured Plex libraries.
     pub async fn stats_libraries(&self, service: &str) -> Result<Value> {
         let config = self.stats_context(service)?;
-        let data = self.stats_cmd(config, "get_library_names", &[]).await?;
-        Ok(slim(data, LIBRARY_FIELDS))
+        let rows = tautulli_rows(&[], LIBRARY_FIELDS);
+        self.stats_cmd(config, "get_library_names", &[], Some(&rows))
+            .await
     }
 
     /// GET `?cmd=refresh_libraries_list` asks Tautulli to refresh its Plex
@@ -197,7 +305,7 @@ impl YarrService {
     pub async fn stats_refresh_libraries(&self, service: &str) -> Result<Value> {
         let config = self.stats_context(service)?;
         let data = self
-            .stats_cmd(config, "refresh_libraries_list", &[])
+            .stats_cmd(config, "refresh_libraries_list", &[], None)
             .await?;
         Ok(json!({ "submitted": true, "refreshed": data.as_bool().unwrap_or(false) }))
     }
@@ -206,7 +314,9 @@ impl YarrService {
     /// Mutating but not destructive — runs immediately, no confirm gate.
     pub async fn stats_refresh_users(&self, service: &str) -> Result<Value> {
         let config = self.stats_context(service)?;
-        let data = self.stats_cmd(config, "refresh_users_list", &[]).await?;
+        let data = self
+            .stats_cmd(config, "refresh_users_list", &[], None)
+            .await?;
         Ok(json!({ "submitted": true, "refreshed": data.as_bool().unwrap_or(false) }))
     }
 
@@ -215,7 +325,9 @@ impl YarrService {
     /// before dispatch reaches here.
     pub async fn stats_delete_image_cache(&self, service: &str) -> Result<Value> {
         let config = self.stats_context(service)?;
-        let data = self.stats_cmd(config, "delete_image_cache", &[]).await?;
+        let data = self
+            .stats_cmd(config, "delete_image_cache", &[], None)
+            .await?;
         Ok(json!({ "submitted": true, "cleared": data.as_object().is_some() || data.is_null() }))
     }
 }
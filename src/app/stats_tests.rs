@@ -4,7 +4,8 @@ use crate::yarr::{YarrClient, query_get, slim};
 use serde_json::json;
 
 use super::{
-    HISTORY_FIELDS, LIBRARY_FIELDS, SESSION_FIELDS, TAUTULLI_API, USER_FIELDS, unwrap_tautulli,
+    HISTORY_FIELDS, LIBRARY_FIELDS, SESSION_FIELDS, TAUTULLI_API, USER_FIELDS, index_record,
+    unwrap_tautulli,
 };
 
 fn service_with(kinds: &[(&str, ServiceKind)]) -> YarrService {
@@ -252,3 +253,40 @@ async fn refresh_and_delete_image_cache_reject_non_stats_kind() {
         assert!(err.to_string().contains("Stats"), "got: {err}");
     }
 }
+
+// ── history index rows ───────────────────────────────────────────────────────────
+
+#[test]
+fn index_records_group_episodes_by_show_and_skip_active_plays() {
+    let (record, finished) = index_record(&json!({
+        "row_id": 42,
+        "date": 1_700_000_000,
+        "state": null,
+        "user": "ann",
+        "full_title": "Show - Pilot",
+        "grandparent_title": "Show",
+        "media_type": "episode",
+        "play_duration": "1200",
+    }))
+    .expect("row parses");
+    assert!(finished);
+    assert_eq!(record.id, "42");
+    assert_eq!(record.at, 1_700_000_000);
+    assert_eq!(record.title.as_deref(), Some("Show"));
+    assert_eq!(record.duration_secs, Some(1200));
+
+    let (movie, playing) = index_record(&json!({
+        "row_id": 43,
+        "started": 1_700_000_100,
+        "state": "playing",
+        "friendly_name": "Bob",
+        "full_title": "Film",
+        "media_type": "movie",
+    }))
+    .expect("row parses");
+    assert!(!playing);
+    assert_eq!(movie.user.as_deref(), Some("Bob"));
+    assert_eq!(movie.title.as_deref(), Some("Film"));
+
+    assert!(index_record(&json!({"date": 1})).is_none());
+}
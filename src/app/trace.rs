@@ -1,13 +1,22 @@
 //! Tracearr public API capability.
+//!
+//! `trace_history_summary` answers aggregate questions from the local history
+//! index (see [`super::history`]), paging `/history` only for sessions newer
+//! than the index.
 
 use anyhow::Result;
 use serde_json::{Value, json};
 
 use crate::app::YarrService;
+use crate::app::history::{HistoryPage, HistoryRecord, SummaryQuery, int, text};
 use crate::capability::Capability;
 use crate::config::ServiceConfig;
 use crate::yarr::helpers::build_operation_url;
 
+/// `/history` page size used when syncing the history index (Tracearr's
+/// maximum).
+const INDEX_PAGE_ROWS: usize = 100;
+
 impl YarrService {
     fn trace_context<'a>(&'a self, service: &str) -> Result<&'a ServiceConfig> {
         self.service_of_capability(service, Capability::Trace)
@@ -87,6 +96,47 @@ impl YarrService {
         .await
     }
 
+    /// Aggregate session history (plays, per-user counts, top titles, media
+    /// types) from the local history index, syncing it first unless `sync` is
+    /// off. See [`super::history`].
+    pub async fn trace_history_summary(
+        &self,
+        service: &str,
+        days: Option<i64>,
+        user: Option<&str>,
+        top: Option<i64>,
+        sync: bool,
+    ) -> Result<Value> {
+        let config = self.trace_context(service)?;
+        let query = SummaryQuery {
+            days,
+            user,
+            top,
+            sync,
+        };
+        self.history_summary(config, query, move |page| {
+            self.trace_history_page(&config.name, page)
+        })
+        .await
+    }
+
+    /// GET one page of `/history` for the history index. Tracearr lists
+    /// sessions newest first; `page` is 0-based.
+    async fn trace_history_page(&self, service: &str, page: usize) -> Result<HistoryPage> {
+        let value = self
+            .trace_get(
+                service,
+                "/api/v1/public/history",
+                paging_query(Some(page as i64 + 1), Some(INDEX_PAGE_ROWS as i64)),
+            )
+            .await?;
+        let rows = value
+            .get("data")
+            .and_then(Value::as_array)
+            .map_or(&[][..], Vec::as_slice);
+        Ok(HistoryPage::new(rows, INDEX_PAGE_ROWS, index_record))
+    }
+
     /// DESTRUCTIVE — on MCP the connected client is elicited for confirmation
     /// before dispatch reaches here.
     pub async fn trace_terminate_stream(
@@ -131,6 +181,31 @@ impl YarrService {
     }
 }
 
+/// Read one `/history` session for the history index. A session without
+/// `stoppedAt` is still in progress.
+fn index_record(row: &Value) -> Option<(HistoryRecord, bool)> {
+    let started_at = text(row, "startedAt")?;
+    let media_type = text(row, "mediaType");
+    let show = match media_type.as_deref() {
+        Some("episode") => text(row, "showTitle"),
+        _ => None,
+    };
+    let record = HistoryRecord {
+        id: text(row, "id")?,
+        at: chrono::DateTime::parse_from_rfc3339(&started_at)
+            .ok()?
+            .timestamp(),
+        user: row.get("user").and_then(|user| text(user, "username")),
+        title: show.or_else(|| text(row, "mediaTitle")),
+        media_type,
+        duration_secs: int(row, "durationMs").map(|ms| ms / 1000),
+    };
+    let finished = row
+        .get("stoppedAt")
+        .is_some_and(|stopped| !stopped.is_null());
+    Some((record, finished))
+}
+
 fn optional_query(name: &'static str, value: Option<&str>) -> Vec<(&'static str, String)> {
     value
         .filter(|v| !v.trim().is_empty())
@@ -1,4 +1,6 @@
-use super::{optional_query, paging_query};
+use serde_json::json;
+
+use super::{index_record, optional_query, paging_query};
 
 #[test]
 fn optional_query_omits_empty_values() {
@@ -17,3 +19,30 @@ fn paging_query_uses_tracearr_page_size_wire_name() {
         vec![("page", "2".to_string()), ("pageSize", "50".to_string())]
     );
 }
+
+#[test]
+fn index_records_read_iso_start_times_and_skip_running_sessions() {
+    let session = json!({
+        "id": "s1",
+        "startedAt": "2024-01-15T12:00:00.000Z",
+        "stoppedAt": "2024-01-15T12:45:00.000Z",
+        "mediaType": "episode",
+        "showTitle": "Show",
+        "mediaTitle": "Pilot",
+        "durationMs": 2_700_000,
+        "user": {"username": "ann"},
+    });
+    let (record, finished) = index_record(&session).expect("session parses");
+    assert!(finished);
+    assert_eq!(record.at, 1_705_320_000);
+    assert_eq!(record.title.as_deref(), Some("Show"));
+    assert_eq!(record.user.as_deref(), Some("ann"));
+    assert_eq!(record.duration_secs, Some(2_700));
+
+    let mut running = session.clone();
+    running["stoppedAt"] = json!(null);
+    assert!(!index_record(&running).expect("session parses").1);
+
+    running["startedAt"] = json!("yesterday");
+    assert!(index_record(&running).is_none());
+}
@@ -34,7 +34,7 @@ fn service_of_capability_matches_and_rejects() {
 #[tokio::test]
 async fn unknown_service_is_actionable() {
     let error = service()
-        .api_get("missing", "/api/v3/system/status")
+        .api_get("missing", "/api/v3/system/status", None)
         .await
         .unwrap_err();
     assert!(error.to_string().contains("unknown yarr service"));
@@ -15,7 +15,7 @@
 //!
 //! yarr help                     JSON action reference
 //! yarr doctor [--json]          Pre-flight checks
-//! yarr watch [--url URL] [--interval N] [--once]
+//! yarr watch [--url URL] [--interval N] [--once] [--source SERVICE:FEED[@SECS]]...
 //! yarr setup check|repair|install|plugin-hook
 //! yarr [serve] | yarr mcp    Run modes (intercepted in main.rs)
 //! ```
@@ -49,7 +49,7 @@ pub use commands::capability_verb_tables;
 pub use doctor::run_doctor;
 pub use setup::{SetupCommand, apply_plugin_options, run_setup};
 pub use usage::usage;
-pub use watch::run_watch;
+pub use watch::{run_watch, run_watch_sources};
 
 /// Parse CLI arguments from `std::env::args()`.
 ///
@@ -95,7 +95,7 @@ pub async fn run(cmd: Command, cfg: &YarrConfig) -> Result<()> {
         Command::Get {
             service: name,
             path,
-        } => service.api_get(name, path).await?,
+        } => service.api_get(name, path, None).await?,
         Command::Post {
             service: name,
             path,
@@ -116,7 +116,18 @@ pub async fn run(cmd: Command, cfg: &YarrConfig) -> Result<()> {
             service: name,
             op,
             args,
-        } => service.execute_operation(name, op, args).await?,
+            all_pages: false,
+        } => service.execute_operation(name, op, args, None).await?,
+        Command::Op {
+            service: name,
+            op,
+            args,
+            all_pages: true,
+        } => {
+            service
+                .execute_operation_pages(name, op, args, None)
+                .await?
+        }
         Command::Help => rest_help(),
         // Code Mode runs through the SAME shared dispatch path as the MCP
         // `codemode` action, so CLI↔MCP behaviour is identical.
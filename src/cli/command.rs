@@ -53,7 +53,7 @@ pub enum Command {
         path: String,
         body: Option<serde_json::Value>,
     },
-    /// `yarr <service> op <name> [--args JSON]` — invoke a generated OpenAPI
+    /// `yarr <service> op <name> [--args JSON] [--all-pages]` — invoke a generated OpenAPI
     /// operation directly (the spec-backed kinds' surface). Mirrors the
     /// in-Code-Mode `<service>.<op>(args)` callable but reachable from the CLI —
     /// runs immediately, including destructive DELETE ops.
@@ -61,6 +61,8 @@ pub enum Command {
         service: String,
         op: String,
         args: serde_json::Value,
+        /// `--all-pages`: read a paged list operation to the end.
+        all_pages: bool,
     },
     /// `yarr help` — structured JSON action reference.
     Help,
@@ -93,7 +95,8 @@ pub enum Command {
         /// Output JSON instead of human-readable text.
         json: bool,
     },
-    /// `yarr watch [--url URL] [--interval N] [--once]` — poll a health endpoint.
+    /// `yarr watch [--url URL] [--interval N] [--once] [--source SPEC]...` — poll a
+    /// health endpoint and/or upstream feeds.
     ///
     /// Dispatched in `main.rs::run_cli` (needs the MCP port for the default URL).
     Watch {
@@ -103,6 +106,9 @@ pub enum Command {
         interval: u64,
         /// Probe once and exit non-zero unless the endpoint returns 2xx.
         once: bool,
+        /// Upstream feeds to follow (`--source`). When set, the health
+        /// endpoint is polled only if `url` is given.
+        sources: Vec<super::watch::WatchSource>,
     },
     /// `yarr setup ...` — plugin setup wizard. Dispatched in `main.rs::run_cli`.
     Setup(SetupCommand),
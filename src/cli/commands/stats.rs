@@ -25,6 +25,7 @@ use crate::config::ServiceKind;
 pub const VERBS: &[(&str, &str)] = &[
     ("activity", "stats_activity"),
     ("history", "stats_history"),
+    ("history-summary", "stats_history_summary"),
     ("users", "stats_users"),
     ("libraries", "stats_libraries"),
     ("refresh-libraries", "stats_refresh_libraries"),
@@ -48,6 +49,7 @@ pub fn parse(kind: ServiceKind, verb: &str, rest: &[String]) -> Result<Option<Co
     // verb→action mapping.
     match verb {
         "history" => parse_history(kind, action, rest).map(Some),
+        "history-summary" => parse_history_summary(kind, action, rest).map(Some),
         // No-flag verbs: reads (activity, users, libraries) and the
         // maintenance writes (refresh-libraries, refresh-users,
         // delete-image-cache) all run immediately with no extra flags.
@@ -97,6 +99,43 @@ fn parse_history(kind: ServiceKind, action: &'static str, rest: &[String]) -> Re
     })
 }
 
+/// `tautulli history-summary [--days N] [--user NAME] [--top N] [--local]` →
+/// `stats_history_summary`.
+fn parse_history_summary(
+    kind: ServiceKind,
+    action: &'static str,
+    rest: &[String],
+) -> Result<Command> {
+    let mut params = base_params(kind);
+
+    let mut i = 0;
+    while i < rest.len() {
+        match rest[i].as_str() {
+            flag @ ("--days" | "--user" | "--top") => {
+                let value = take_value(rest, &mut i, flag)?;
+                let key = &flag[2..];
+                if params.insert(key.into(), json!(value)).is_some() {
+                    return Err(anyhow!("history-summary received duplicate {flag}"));
+                }
+            }
+            "--local" => {
+                params.insert("local".into(), json!(true));
+            }
+            other => {
+                return Err(anyhow!(
+                    "history-summary does not accept argument `{other}`"
+                ));
+            }
+        }
+        i += 1;
+    }
+
+    Ok(Command::Curated {
+        action,
+        params: Value::Object(params),
+    })
+}
+
 /// Initial params map carrying the positional service.
 fn base_params(kind: ServiceKind) -> Map<String, Value> {
     let mut params = Map::new();
@@ -62,6 +62,28 @@ fn tautulli_history_parses_user_filter() {
     );
 }
 
+#[test]
+fn tautulli_history_summary_parses_window_and_local() {
+    let cmd = parse_args_from([
+        "tautulli",
+        "history-summary",
+        "--days",
+        "7",
+        "--top",
+        "5",
+        "--local",
+    ])
+    .unwrap()
+    .unwrap();
+    assert_eq!(
+        cmd,
+        Command::Curated {
+            action: "stats_history_summary",
+            params: json!({ "service": "tautulli", "days": "7", "top": "5", "local": true }),
+        }
+    );
+}
+
 #[test]
 fn tautulli_write_verbs_run_immediately() {
     for (verb, action) in [
@@ -17,6 +17,7 @@ pub const VERBS: &[(&str, &str)] = &[
     ("users", "trace_users"),
     ("violations", "trace_violations"),
     ("history", "trace_history"),
+    ("history-summary", "trace_history_summary"),
     ("terminate-stream", "trace_terminate_stream"),
 ];
 
@@ -33,6 +34,7 @@ pub fn parse(kind: ServiceKind, verb: &str, rest: &[String]) -> Result<Option<Co
         }
         "streams" => parse_streams(kind, action, rest).map(Some),
         "users" | "violations" | "history" => parse_paged(kind, action, verb, rest).map(Some),
+        "history-summary" => parse_history_summary(kind, action, rest).map(Some),
         "terminate-stream" => parse_terminate(kind, action, rest).map(Some),
         _ => parse_simple(kind, action, verb, rest).map(Some),
     }
@@ -122,6 +124,35 @@ fn parse_paged(
     })
 }
 
+fn parse_history_summary(
+    kind: ServiceKind,
+    action: &'static str,
+    rest: &[String],
+) -> Result<Command> {
+    let mut params = base_params(kind);
+    let mut i = 0;
+    while i < rest.len() {
+        match rest[i].as_str() {
+            flag @ ("--days" | "--user" | "--top") => {
+                params.insert(flag[2..].into(), json!(take_value(rest, &mut i, flag)?));
+            }
+            "--local" => {
+                params.insert("local".into(), json!(true));
+            }
+            other => {
+                return Err(anyhow!(
+                    "history-summary does not accept argument `{other}`"
+                ));
+            }
+        }
+        i += 1;
+    }
+    Ok(Command::Curated {
+        action,
+        params: Value::Object(params),
+    })
+}
+
 fn parse_terminate(kind: ServiceKind, action: &'static str, rest: &[String]) -> Result<Command> {
     let mut params = base_params(kind);
     let mut i = 0;
@@ -32,3 +32,18 @@ fn streams_summary_flag_maps_to_boolean_param() {
     assert_eq!(action, "trace_streams");
     assert_eq!(params["summary"], true);
 }
+
+#[test]
+fn history_summary_parses_window_user_and_local() {
+    let args = ["--days", "30", "--user", "ann", "--local"].map(String::from);
+    let cmd = parse(ServiceKind::Tracearr, "history-summary", &args)
+        .unwrap()
+        .unwrap();
+    let Command::Curated { action, params } = cmd else {
+        panic!("expected curated command");
+    };
+    assert_eq!(action, "trace_history_summary");
+    assert_eq!(params["days"], "30");
+    assert_eq!(params["user"], "ann");
+    assert_eq!(params["local"], true);
+}
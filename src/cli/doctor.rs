@@ -21,7 +21,7 @@ mod checks;
 
 use checks::{
     check_auth_config, check_binary_in_path, check_config_file, check_dir_writable,
-    check_port_available, check_required_var, check_service_url, check_upstream,
+    check_port_available, check_required_var, check_service_url, check_upstreams,
 };
 
 use anyhow::{Result, bail};
@@ -73,14 +73,13 @@ pub async fn run_doctor(config: &Config, json: bool) -> Result<()> {
     // ── 4. Upstream connectivity ──────────────────────────────────────────────
     //
     // If no services are configured, the required-var check above already
-    // flagged it. Otherwise use the service-specific status endpoint.
+    // flagged it. Otherwise use the service-specific status endpoint, probing
+    // every service at once so a slow upstream costs its own deadline only.
     if !config.yarr.services.is_empty() {
         match YarrClient::new(&config.yarr) {
             Ok(client) => {
                 let service = YarrService::new(client, config.yarr.clone());
-                for configured in &config.yarr.services {
-                    checks.push(check_upstream(&service, &configured.name).await);
-                }
+                checks.extend(check_upstreams(&service).await);
             }
             Err(error) => checks.push(DoctorCheck::fail(
                 "connectivity",
@@ -2,7 +2,7 @@
 //!
 //! Each `check_*` function is self-contained: it validates one aspect of the
 //! environment and returns a `DoctorCheck`. No side effects other than network
-//! calls in `check_upstream`.
+//! calls in `check_upstreams`.
 //!
 //! # Adding checks
 //! Add new `check_*` functions here, then call them from `run_doctor` in the
@@ -14,10 +14,9 @@ mod tests;
 
 use std::net::TcpListener;
 use std::path::{Path, PathBuf};
-use std::time::Instant;
 
 use crate::{
-    app::YarrService,
+    app::{YarrService, fleet::FleetProbe},
     config::Config,
     server::{AuthPolicyKind, resolve_auth_policy_kind},
 };
@@ -225,22 +224,32 @@ fn redact(s: &str) -> String {
 
 // ── Upstream connectivity ─────────────────────────────────────────────────────
 
-/// Check that one configured upstream service is reachable through the normal
+/// Check that every configured upstream service is reachable through the normal
 /// Yarr client path, including service-specific status endpoint and auth.
-pub async fn check_upstream(service: &YarrService, service_name: &str) -> DoctorCheck {
-    let start = Instant::now();
-    match service.service_status(service_name).await {
-        Ok(_) => {
-            let elapsed = start.elapsed().as_millis() as u64;
-            DoctorCheck::pass_with_latency(
-                "connectivity",
-                format!("Upstream reachable: {service_name}"),
-                format!("service_status succeeded ({elapsed} ms)"),
-                elapsed,
-            )
-        }
-        Err(error) => {
-            let elapsed = start.elapsed().as_millis() as u64;
+///
+/// Probes run concurrently with a per-probe deadline (see
+/// [`crate::app::fleet`]), so one hung service no longer holds up the rest.
+/// Returns one check per service, in configured order.
+pub async fn check_upstreams(service: &YarrService) -> Vec<DoctorCheck> {
+    service
+        .fleet_probes()
+        .await
+        .into_iter()
+        .map(upstream_check)
+        .collect()
+}
+
+fn upstream_check(probe: FleetProbe) -> DoctorCheck {
+    let service_name = probe.service;
+    let elapsed = probe.latency_ms;
+    match probe.error {
+        None => DoctorCheck::pass_with_latency(
+            "connectivity",
+            format!("Upstream reachable: {service_name}"),
+            format!("service_status succeeded ({elapsed} ms)"),
+            elapsed,
+        ),
+        Some(error) => {
             let env_name = service_name
                 .chars()
                 .map(|ch| {
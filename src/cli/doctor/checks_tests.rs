@@ -8,7 +8,7 @@
 //! ```
 //!
 //! Tests cover the pure and near-pure check functions. Async network checks
-//! (`check_upstream`) and filesystem-heavy checks are covered with minimal
+//! (`check_upstreams`) and filesystem-heavy checks are covered with minimal
 //! scaffolding.
 
 use super::*;
@@ -269,9 +269,12 @@ async fn upstream_passes_for_local_service_status_endpoint() {
     };
     let client = YarrClient::new(&config).unwrap();
     let service = YarrService::new(client, config);
-    let check = check_upstream(&service, "sonarr").await;
+    let checks = check_upstreams(&service).await;
     handle.join().unwrap();
 
+    assert_eq!(checks.len(), 1);
+    let check = &checks[0];
+
     assert!(check.ok, "local service_status response should pass");
     assert_eq!(check.category, "connectivity");
 }
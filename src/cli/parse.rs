@@ -136,40 +136,49 @@ pub fn parse_passthrough_flags(
     Ok(PassthroughFlags { path, body })
 }
 
-/// Parse `watch` flags: `[--url URL] [--interval N] [--once]`.
-pub fn parse_watch_flags(args: &[String]) -> Result<(Option<String>, Option<String>, bool)> {
-    let mut url = None;
-    let mut interval = None;
-    let mut once = false;
+/// Raw `watch` flags; values are validated by the router.
+#[derive(Debug, Default)]
+pub struct WatchFlags {
+    pub url: Option<String>,
+    pub interval: Option<String>,
+    pub once: bool,
+    /// Every `--source SPEC`, in order.
+    pub sources: Vec<String>,
+}
+
+/// Parse `watch` flags: `[--url URL] [--interval N] [--once] [--source SPEC]...`.
+pub fn parse_watch_flags(args: &[String]) -> Result<WatchFlags> {
+    let mut flags = WatchFlags::default();
     let mut index = 0;
     while index < args.len() {
         let flag = args[index].as_str();
         if flag == "--once" {
-            if once {
+            if flags.once {
                 return Err(anyhow!("watch received duplicate --once"));
             }
-            once = true;
+            flags.once = true;
             index += 1;
             continue;
         }
-        let target = match flag {
-            "--url" => &mut url,
-            "--interval" => &mut interval,
+        let slot = match flag {
+            "--url" => Some(&mut flags.url),
+            "--interval" => Some(&mut flags.interval),
+            "--source" => None,
             _ => return Err(anyhow!("watch does not accept argument `{flag}`")),
         };
-        if target.is_some() {
-            return Err(anyhow!("watch received duplicate {flag}"));
-        }
-        let Some(value) = args.get(index + 1) else {
+        let Some(value) = args.get(index + 1).filter(|value| !value.starts_with("--")) else {
             return Err(anyhow!("watch requires a value after {flag}"));
         };
-        if value.starts_with("--") {
-            return Err(anyhow!("watch requires a value after {flag}"));
+        match slot {
+            Some(slot) if slot.is_some() => {
+                return Err(anyhow!("watch received duplicate {flag}"));
+            }
+            Some(slot) => *slot = Some(value.clone()),
+            None => flags.sources.push(value.clone()),
         }
-        *target = Some(value.clone());
         index += 2;
     }
-    Ok((url, interval, once))
+    Ok(flags)
 }
 
 // ── shared selector parser (parse-only) ─────────────────────────────────────────
@@ -111,7 +111,7 @@ fn passthrough_no_longer_recognizes_confirm_or_yes() {
 
 #[test]
 fn watch_flags_parsed() {
-    let (url, interval, once) = parse_watch_flags(&[
+    let flags = parse_watch_flags(&[
         "--url".into(),
         "http://x".into(),
         "--interval".into(),
@@ -119,9 +119,23 @@ fn watch_flags_parsed() {
         "--once".into(),
     ])
     .unwrap();
-    assert_eq!(url.as_deref(), Some("http://x"));
-    assert_eq!(interval.as_deref(), Some("5"));
-    assert!(once);
+    assert_eq!(flags.url.as_deref(), Some("http://x"));
+    assert_eq!(flags.interval.as_deref(), Some("5"));
+    assert!(flags.once);
+    assert!(flags.sources.is_empty());
+}
+
+#[test]
+fn watch_sources_repeat_in_order() {
+    let flags = parse_watch_flags(&[
+        "--source".into(),
+        "sonarr:queue".into(),
+        "--source".into(),
+        "plex:sessions@5".into(),
+    ])
+    .unwrap();
+    assert_eq!(flags.sources, ["sonarr:queue", "plex:sessions@5"]);
+    assert!(parse_watch_flags(&["--source".into()]).is_err());
 }
 
 #[test]
@@ -244,7 +244,7 @@ pub fn parse_capability_command(
                 body: flags.body,
             })
         }
-        // `op <name> [--args JSON]` — invoke a generated operation for a
+        // `op <name> [--args JSON] [--all-pages]` — invoke a generated operation for a
         // spec-backed kind directly (the test-harness / operator path). Runs
         // immediately, including DELETE ops.
         "op" => parse_op_command(service, rest),
@@ -257,8 +257,8 @@ pub fn parse_capability_command(
     }
 }
 
-/// Parse `op <name> [--args JSON]`. The first positional is the operation
-/// name; `--args` carries a JSON object of path/query params + `body`.
+/// Parse `op <name> [--args JSON] [--all-pages]`. The first positional is the
+/// operation name; `--args` carries a JSON object of path/query params + `body`.
 fn parse_op_command(service: String, rest: &[String]) -> Result<Command> {
     let [op, flags @ ..] = rest else {
         return Err(anyhow!(
@@ -266,6 +266,7 @@ fn parse_op_command(service: String, rest: &[String]) -> Result<Command> {
         ));
     };
     let mut args = serde_json::Value::Object(serde_json::Map::new());
+    let mut all_pages = false;
     let mut iter = flags.iter();
     while let Some(flag) = iter.next() {
         match flag.as_str() {
@@ -279,13 +280,19 @@ fn parse_op_command(service: String, rest: &[String]) -> Result<Command> {
                     return Err(anyhow!("op --args must be a JSON object"));
                 }
             }
-            other => return Err(anyhow!("unknown op flag `{other}` (use --args)")),
+            "--all-pages" => all_pages = true,
+            other => {
+                return Err(anyhow!(
+                    "unknown op flag `{other}` (use --args or --all-pages)"
+                ));
+            }
         }
     }
     Ok(Command::Op {
         service,
         op: op.clone(),
         args,
+        all_pages,
     })
 }
 
@@ -16,8 +16,8 @@ pub(super) fn parse_infra_command(verb: &str, rest: &[String]) -> Result<Command
             json: parse_bool_flag(rest, "doctor", "--json")?,
         }),
         "watch" => {
-            let (url, interval_arg, once) = parse_watch_flags(rest)?;
-            let interval = interval_arg.map_or(Ok(10), |v| {
+            let flags = parse_watch_flags(rest)?;
+            let interval = flags.interval.map_or(Ok(10), |v| {
                 v.parse().map_err(|_| {
                     anyhow!("watch --interval must be a positive integer number of seconds")
                 })
@@ -27,10 +27,21 @@ pub(super) fn parse_infra_command(verb: &str, rest: &[String]) -> Result<Command
                     "watch --interval must be a positive integer number of seconds"
                 ));
             }
+            let sources = flags
+                .sources
+                .iter()
+                .map(|spec| spec.parse())
+                .collect::<Result<Vec<_>>>()?;
+            if flags.once && !sources.is_empty() {
+                return Err(anyhow!(
+                    "watch --once probes health only and cannot be combined with --source"
+                ));
+            }
             Ok(Command::Watch {
-                url,
+                url: flags.url,
                 interval,
-                once,
+                once: flags.once,
+                sources,
             })
         }
         "setup" => parse_setup_command(rest),
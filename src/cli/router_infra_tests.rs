@@ -21,6 +21,25 @@ fn doctor_and_watch_infra_flags_are_parsed() {
     assert!(parse_infra_command("watch", &args(&["--interval", "0"])).is_err());
 }
 
+#[test]
+fn watch_sources_are_parsed_and_once_stays_health_only() {
+    let command = parse_infra_command(
+        "watch",
+        &args(&["--source", "sonarr:queue@30", "--source", "plex:sessions"]),
+    )
+    .unwrap();
+    let Command::Watch { url, sources, .. } = command else {
+        panic!("expected a watch command");
+    };
+    assert!(url.is_none());
+    assert_eq!(sources.len(), 2);
+    assert_eq!(sources[0].interval, Some(30));
+    assert_eq!(sources[1].service, "plex");
+
+    assert!(parse_infra_command("watch", &args(&["--source", "sonarr"])).is_err());
+    assert!(parse_infra_command("watch", &args(&["--source", "sonarr:queue", "--once"])).is_err());
+}
+
 #[test]
 fn snippet_infra_requires_a_name_and_valid_json_input() {
     assert!(parse_infra_command("snippet", &args(&["delete"])).is_err());
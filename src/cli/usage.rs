@@ -37,6 +37,9 @@ fn build_usage() -> String {
     out.push_str(
         "  yarr watch [--url URL] [--interval N] [--once]  Poll server health; --once exits non-zero unless healthy\n",
     );
+    out.push_str(
+        "  yarr watch --source SERVICE:FEED[@SECS]...  Follow queue/imports/sessions changes; repeat for more sources\n",
+    );
     out.push_str("  yarr setup check               Check plugin setup without mutating appdata\n");
     out.push_str("  yarr setup repair              Create missing appdata/env setup files\n");
     out.push_str("  yarr setup plugin-hook [--no-repair]  Plugin hook JSON contract\n\n");
@@ -11,11 +11,20 @@
 //!
 //! Only state *changes* produce output, so Claude isn't spammed while the
 //! server is stable. The initial state always emits one line.
+//!
+//! With `--source SERVICE:FEED[@SECS]` the watch also follows upstream feeds
+//! (download queues, imports, playback sessions) concurrently; see
+//! [`sources`] and, for how each upstream is read, [`feeds`].
 
 use std::time::{Duration, Instant};
 
 use anyhow::Result;
 
+mod feeds;
+mod sources;
+
+pub use sources::{Feed, WatchSource, run_watch_sources};
+
 /// Server reachability state.
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 enum ServerState {
@@ -0,0 +1,273 @@
+//! Per-feed reads for `yarr watch --source`: where each upstream lists its
+//! queue or sessions, how that listing reduces to keyed [`Item`]s, and the
+//! cursor the *arr import feed reads `history/since` from.
+
+use std::collections::{BTreeMap, BTreeSet};
+
+use anyhow::Result;
+use chrono::{DateTime, Utc};
+use serde_json::Value;
+
+use crate::config::{ServiceConfig, ServiceKind};
+use crate::yarr::{Conditional, Validators, YarrClient, build_url, query_get};
+
+/// Queue rows read per poll. Larger queues are watched through their first
+/// page.
+const QUEUE_PAGE_SIZE: &str = "1000";
+/// Jellyfin sessions idle for longer than this are not listed.
+const JELLYFIN_ACTIVE_SECS: &str = "960";
+/// `downloadFolderImported` as the paged `history` endpoint filters on it;
+/// `history/since` takes the name instead.
+const IMPORT_EVENT_TYPE: &str = "3";
+
+/// One feed item, reduced to what an event line shows.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub(super) struct Item {
+    pub(super) label: String,
+    pub(super) state: String,
+}
+
+/// Feed items keyed by their upstream id.
+pub(super) type Snapshot = BTreeMap<String, Item>;
+
+/// The current queue or session listing of `service`, or `None` when the
+/// upstream reports it unchanged since the read `validators` came from.
+pub(super) async fn read_listing(
+    client: &YarrClient,
+    service: &ServiceConfig,
+    validators: &mut Validators,
+) -> Result<Option<Snapshot>> {
+    let (url, accept) = match service.kind {
+        // qBittorrent's own delta protocol: only changed rows cross the wire.
+        ServiceKind::Qbittorrent => {
+            let rows = client
+                .qbit_torrents(service, &["hash", "name", "state"])
+                .await?;
+            return Ok(Some(qbittorrent_queue(&rows)));
+        }
+        ServiceKind::Sabnzbd => (query_get(service, "/api", &[("mode", "queue")])?, None),
+        ServiceKind::Plex => (
+            build_url(service, "/status/sessions")?,
+            Some("application/json"),
+        ),
+        ServiceKind::Jellyfin => (
+            query_get(
+                service,
+                "/Sessions",
+                &[("activeWithinSeconds", JELLYFIN_ACTIVE_SECS)],
+            )?,
+            None,
+        ),
+        _ => (
+            query_get(
+                service,
+                "/api/v3/queue",
+                &[("page", "1"), ("pageSize", QUEUE_PAGE_SIZE)],
+            )?,
+            None,
+        ),
+    };
+    let value = match client
+        .send_get_if_modified(service, url, validators, accept)
+        .await?
+    {
+        Conditional::NotModified => return Ok(None),
+        Conditional::Modified {
+            value,
+            validators: next,
+        } => {
+            *validators = next;
+            value
+        }
+    };
+    Ok(Some(match service.kind {
+        ServiceKind::Sabnzbd => sabnzbd_queue(&value),
+        ServiceKind::Plex => plex_sessions(&value),
+        ServiceKind::Jellyfin => jellyfin_sessions(&value),
+        _ => arr_queue(&value),
+    }))
+}
+
+/// The import feed cursor: the newest import date seen, and the ids seen at
+/// exactly that date (`history/since` includes its bound).
+#[derive(Debug, Default)]
+pub(super) struct ImportCursor {
+    since: Option<DateTime<Utc>>,
+    seen_at_since: BTreeSet<String>,
+}
+
+impl ImportCursor {
+    /// The titles of the imports not reported yet. The first read only places
+    /// the cursor and returns `None`.
+    pub(super) async fn read(
+        &mut self,
+        client: &YarrClient,
+        service: &ServiceConfig,
+    ) -> Result<Option<Vec<String>>> {
+        let Some(since) = self.since else {
+            // Imports that finished before the watch began are not news. The
+            // cursor starts at the newest one by the upstream's clock, so a
+            // skew between the two clocks neither hides nor repeats imports.
+            let url = query_get(
+                service,
+                "/api/v3/history",
+                &[
+                    ("page", "1"),
+                    ("pageSize", "1"),
+                    ("sortKey", "date"),
+                    ("sortDirection", "descending"),
+                    ("eventType", IMPORT_EVENT_TYPE),
+                ],
+            )?;
+            let history = client.send_get(service, url, None).await?;
+            self.seed(&history);
+            return Ok(None);
+        };
+        let date = since.to_rfc3339_opts(chrono::SecondsFormat::Millis, true);
+        let url = query_get(
+            service,
+            "/api/v3/history/since",
+            &[("date", &date), ("eventType", "downloadFolderImported")],
+        )?;
+        let records = client.send_get(service, url, None).await?;
+        Ok(Some(self.advance(&records)))
+    }
+
+    /// Start at the newest record of a `history` page. An upstream without one
+    /// starts from the epoch: every import is new.
+    fn seed(&mut self, history: &Value) {
+        match rows(&history["records"]).first().and_then(import_key) {
+            Some((date, id)) => {
+                self.since = Some(date);
+                self.seen_at_since = BTreeSet::from([id]);
+            }
+            None => {
+                self.since = Some(DateTime::UNIX_EPOCH);
+                self.seen_at_since.clear();
+            }
+        }
+    }
+
+    /// The titles of the records of a `history/since` read not reported yet,
+    /// oldest first, moving the cursor past them.
+    fn advance(&mut self, records: &Value) -> Vec<String> {
+        let mut imports: Vec<(DateTime<Utc>, String, String)> = rows(records)
+            .iter()
+            .filter_map(|record| {
+                let (date, id) = import_key(record)?;
+                Some((date, id, text(record, "sourceTitle").unwrap_or_default()))
+            })
+            .collect();
+        imports.sort();
+        let mut titles = Vec::new();
+        for (date, id, title) in imports {
+            match self.since {
+                Some(since) if date < since => continue,
+                Some(since) if date == since => {
+                    if !self.seen_at_since.insert(id) {
+                        continue;
+                    }
+                }
+                _ => {
+                    self.since = Some(date);
+                    self.seen_at_since = BTreeSet::from([id]);
+                }
+            }
+            titles.push(title);
+        }
+        titles
+    }
+}
+
+/// Sonarr/Radarr `/api/v3/queue` page.
+fn arr_queue(value: &Value) -> Snapshot {
+    snapshot(rows(&value["records"]), |record| {
+        let state = text(record, "trackedDownloadState").or_else(|| text(record, "status"))?;
+        Some((id(&record["id"])?, text(record, "title")?, state))
+    })
+}
+
+/// SABnzbd `mode=queue`.
+fn sabnzbd_queue(value: &Value) -> Snapshot {
+    snapshot(rows(&value["queue"]["slots"]), |slot| {
+        Some((
+            text(slot, "nzo_id")?,
+            text(slot, "filename")?,
+            text(slot, "status")?,
+        ))
+    })
+}
+
+/// The synced qBittorrent torrent table.
+fn qbittorrent_queue(rows_value: &Value) -> Snapshot {
+    snapshot(rows(rows_value), |row| {
+        Some((text(row, "hash")?, text(row, "name")?, text(row, "state")?))
+    })
+}
+
+/// Plex `/status/sessions`.
+fn plex_sessions(value: &Value) -> Snapshot {
+    snapshot(rows(&value["MediaContainer"]["Metadata"]), |session| {
+        let key = text(&session["Session"], "id").or_else(|| text(session, "sessionKey"))?;
+        let title = match text(session, "grandparentTitle") {
+            Some(show) => format!("{show} - {}", text(session, "title")?),
+            None => text(session, "title")?,
+        };
+        let user = text(&session["User"], "title").unwrap_or_else(|| "?".into());
+        let state = text(&session["Player"], "state").unwrap_or_else(|| "playing".into());
+        Some((key, format!("{user}: {title}"), state))
+    })
+}
+
+/// Jellyfin `/Sessions`; only sessions with something playing.
+fn jellyfin_sessions(value: &Value) -> Snapshot {
+    snapshot(rows(value), |session| {
+        let item = session.get("NowPlayingItem")?;
+        let title = match text(item, "SeriesName") {
+            Some(show) => format!("{show} - {}", text(item, "Name")?),
+            None => text(item, "Name")?,
+        };
+        let user = text(session, "UserName").unwrap_or_else(|| "?".into());
+        let paused = session["PlayState"]["IsPaused"].as_bool().unwrap_or(false);
+        let state = if paused { "paused" } else { "playing" };
+        Some((
+            text(session, "Id")?,
+            format!("{user}: {title}"),
+            state.into(),
+        ))
+    })
+}
+
+fn snapshot(rows: &[Value], item: impl Fn(&Value) -> Option<(String, String, String)>) -> Snapshot {
+    rows.iter()
+        .filter_map(item)
+        .map(|(key, label, state)| (key, Item { label, state }))
+        .collect()
+}
+
+fn rows(value: &Value) -> &[Value] {
+    value.as_array().map(Vec::as_slice).unwrap_or_default()
+}
+
+fn text(value: &Value, field: &str) -> Option<String> {
+    value.get(field)?.as_str().map(str::to_owned)
+}
+
+/// The date and id that place a history record on the import cursor.
+fn import_key(record: &Value) -> Option<(DateTime<Utc>, String)> {
+    let date = DateTime::parse_from_rfc3339(record.get("date")?.as_str()?).ok()?;
+    Some((date.with_timezone(&Utc), id(record.get("id")?)?))
+}
+
+/// A numeric or string id as a map key.
+fn id(value: &Value) -> Option<String> {
+    match value {
+        Value::Number(number) => Some(number.to_string()),
+        Value::String(text) => Some(text.clone()),
+        _ => None,
+    }
+}
+
+#[cfg(test)]
+#[path = "feeds_tests.rs"]
+mod tests;
@@ -0,0 +1,84 @@
+use serde_json::json;
+
+use super::*;
+
+fn item(label: &str, state: &str) -> Item {
+    Item {
+        label: label.into(),
+        state: state.into(),
+    }
+}
+
+#[test]
+fn listings_reduce_each_upstream_to_keyed_items() {
+    let arr = arr_queue(&json!({"records": [
+        {"id": 7, "title": "Show.S01E01", "status": "downloading", "trackedDownloadState": "importPending", "sizeleft": 10},
+        {"id": 8, "title": "Film", "status": "queued"},
+    ]}));
+    assert_eq!(arr["7"], item("Show.S01E01", "importPending"));
+    assert_eq!(arr["8"], item("Film", "queued"));
+
+    let sab = sabnzbd_queue(&json!({"queue": {"slots": [
+        {"nzo_id": "SAB_1", "filename": "Show", "status": "Downloading", "percentage": "40"},
+    ]}}));
+    assert_eq!(sab["SAB_1"], item("Show", "Downloading"));
+
+    let plex = plex_sessions(&json!({"MediaContainer": {"Metadata": [{
+        "sessionKey": "12",
+        "grandparentTitle": "The Show",
+        "title": "Pilot",
+        "User": {"title": "ann"},
+        "Player": {"state": "paused"},
+        "Session": {"id": "abc"},
+    }]}}));
+    assert_eq!(plex["abc"], item("ann: The Show - Pilot", "paused"));
+
+    let jellyfin = jellyfin_sessions(&json!([
+        {"Id": "idle", "UserName": "bob"},
+        {"Id": "s1", "UserName": "bob", "NowPlayingItem": {"Name": "Film"}, "PlayState": {"IsPaused": false}},
+    ]));
+    assert_eq!(jellyfin.len(), 1);
+    assert_eq!(jellyfin["s1"], item("bob: Film", "playing"));
+}
+
+#[test]
+fn imports_are_reported_once_and_never_before_the_cursor() {
+    let mut cursor = ImportCursor::default();
+    cursor.since = Some("2026-01-01T00:00:00Z".parse().unwrap());
+    let records = json!([
+        {"id": 2, "date": "2026-01-01T00:05:00Z", "sourceTitle": "Second"},
+        {"id": 1, "date": "2026-01-01T00:01:00Z", "sourceTitle": "First"},
+        {"id": 0, "date": "2025-12-31T23:00:00Z", "sourceTitle": "Old"},
+    ]);
+    assert_eq!(cursor.advance(&records), ["First", "Second"]);
+
+    // `history/since` repeats the record at its bound.
+    let again = json!([
+        {"id": 2, "date": "2026-01-01T00:05:00Z", "sourceTitle": "Second"},
+        {"id": 3, "date": "2026-01-01T00:05:00Z", "sourceTitle": "Third"},
+    ]);
+    assert_eq!(cursor.advance(&again), ["Third"]);
+    assert!(cursor.advance(&again).is_empty());
+}
+
+#[test]
+fn the_import_cursor_starts_at_the_newest_upstream_import() {
+    let mut cursor = ImportCursor::default();
+    cursor.seed(&json!({
+        "page": 1,
+        "pageSize": 1,
+        "records": [{"id": 7, "date": "2026-01-01T00:05:00Z", "sourceTitle": "Seen"}],
+    }));
+    let records = json!([
+        {"id": 7, "date": "2026-01-01T00:05:00Z", "sourceTitle": "Seen"},
+        {"id": 8, "date": "2026-01-01T00:05:00Z", "sourceTitle": "Same second"},
+        {"id": 9, "date": "2026-01-01T00:06:00Z", "sourceTitle": "Later"},
+    ]);
+    assert_eq!(cursor.advance(&records), ["Same second", "Later"]);
+
+    // Nothing imported yet: the first import ever is news, whatever its date.
+    let mut empty = ImportCursor::default();
+    empty.seed(&json!({"page": 1, "pageSize": 1, "records": []}));
+    let first = json!([{"id": 1, "date": "2020-01-01T00:00:00Z", "sourceTitle": "First"}]);
+    assert_eq!(empty.advance(&first), ["First"]);
+}
@@ -0,0 +1,294 @@
+//! Upstream sources for `yarr watch --source SERVICE:FEED[@SECS]`.
+//!
+//! Each source polls one configured service on its own interval and keeps the
+//! last snapshot of its feed in memory. Only differences reach stdout, one
+//! compact line per item:
+//!
+//! ```text
+//! [sonarr] QUEUE+ The.Show.S01E02.1080p (downloading)
+//! [sonarr] QUEUE~ The.Show.S01E02.1080p: downloading → importPending
+//! [sonarr] QUEUE- The.Show.S01E02.1080p
+//! [sonarr] IMPORTED The.Show.S01E02.1080p
+//! [plex] SESSION+ ann: The Show - Pilot (playing)
+//! ```
+//!
+//! The first read of a feed only reports its size. Reads are as cheap as each
+//! upstream allows: listings are conditional GETs (a `304` skips the diff
+//! entirely), the *arr import feed reads `history/since` from the newest
+//! import seen, and qBittorrent uses the incremental `sync/maindata` table.
+//! Progress counters are not compared, so a re-read that only moved a
+//! percentage emits nothing. How each upstream is read lives in [`feeds`];
+//! this module runs the sources and diffs their listings.
+//!
+//! [`feeds`]: super::feeds
+
+use std::str::FromStr;
+use std::time::Duration;
+
+use anyhow::{Result, anyhow};
+
+use super::feeds::{ImportCursor, Snapshot, read_listing};
+use crate::config::{ServiceConfig, ServiceKind, YarrConfig};
+use crate::yarr::{Validators, YarrClient};
+
+/// What a source watches.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum Feed {
+    /// Download queue items: sonarr, radarr, sabnzbd, qbittorrent.
+    Queue,
+    /// Completed imports: sonarr, radarr.
+    Imports,
+    /// Playback sessions: plex, jellyfin.
+    Sessions,
+}
+
+impl Feed {
+    fn as_str(self) -> &'static str {
+        match self {
+            Feed::Queue => "queue",
+            Feed::Imports => "imports",
+            Feed::Sessions => "sessions",
+        }
+    }
+
+    fn kinds(self) -> &'static [ServiceKind] {
+        match self {
+            Feed::Queue => &[
+                ServiceKind::Sonarr,
+                ServiceKind::Radarr,
+                ServiceKind::Sabnzbd,
+                ServiceKind::Qbittorrent,
+            ],
+            Feed::Imports => &[ServiceKind::Sonarr, ServiceKind::Radarr],
+            Feed::Sessions => &[ServiceKind::Plex, ServiceKind::Jellyfin],
+        }
+    }
+
+    /// The event tag, e.g. `QUEUE` in `QUEUE+`.
+    fn tag(self) -> &'static str {
+        match self {
+            Feed::Queue => "QUEUE",
+            Feed::Imports => "IMPORTED",
+            Feed::Sessions => "SESSION",
+        }
+    }
+}
+
+impl FromStr for Feed {
+    type Err = anyhow::Error;
+
+    fn from_str(value: &str) -> Result<Self> {
+        match value {
+            "queue" => Ok(Feed::Queue),
+            "imports" => Ok(Feed::Imports),
+            "sessions" => Ok(Feed::Sessions),
+            other => Err(anyhow!(
+                "unknown watch feed `{other}` (use queue, imports, or sessions)"
+            )),
+        }
+    }
+}
+
+/// One `--source SERVICE:FEED[@SECS]` target. The service name is resolved
+/// against the config when the watch starts.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct WatchSource {
+    pub service: String,
+    pub feed: Feed,
+    /// Poll interval in seconds; `None` uses `--interval`.
+    pub interval: Option<u64>,
+}
+
+impl FromStr for WatchSource {
+    type Err = anyhow::Error;
+
+    fn from_str(spec: &str) -> Result<Self> {
+        let usage = || anyhow!("watch --source must look like SERVICE:FEED[@SECS], got `{spec}`");
+        let (target, interval) = match spec.split_once('@') {
+            Some((target, secs)) => {
+                let secs: u64 = secs.parse().map_err(|_| usage())?;
+                if secs == 0 {
+                    return Err(anyhow!("watch --source interval must be at least 1 second"));
+                }
+                (target, Some(secs))
+            }
+            None => (spec, None),
+        };
+        let (service, feed) = target.split_once(':').ok_or_else(usage)?;
+        if service.is_empty() {
+            return Err(usage());
+        }
+        Ok(Self {
+            service: service.to_owned(),
+            feed: feed.parse()?,
+            interval,
+        })
+    }
+}
+
+/// Run every source (and the health watch when `health_url` is set) until one
+/// of them fails to start. Sources poll concurrently, each on its own
+/// interval.
+pub async fn run_watch_sources(
+    config: &YarrConfig,
+    health_url: Option<String>,
+    interval_secs: u64,
+    sources: Vec<WatchSource>,
+) -> Result<()> {
+    let mut pollers = Vec::with_capacity(sources.len());
+    for source in sources {
+        let service = config
+            .services
+            .iter()
+            .find(|service| service.name.eq_ignore_ascii_case(&source.service))
+            .ok_or_else(|| anyhow!("watch --source: no configured service `{}`", source.service))?;
+        if !source.feed.kinds().contains(&service.kind) {
+            return Err(anyhow!(
+                "watch --source: {} ({}) has no {} feed",
+                service.name,
+                service.kind.as_str(),
+                source.feed.as_str()
+            ));
+        }
+        let interval = Duration::from_secs(source.interval.unwrap_or(interval_secs));
+        pollers.push((Poller::new(service.clone(), source.feed), interval));
+    }
+    let client = YarrClient::new(config)?;
+
+    let mut tasks = tokio::task::JoinSet::new();
+    if let Some(url) = health_url {
+        tasks.spawn(async move { super::run_watch(&url, interval_secs, false).await });
+    }
+    for (poller, interval) in pollers {
+        let client = client.clone();
+        eprintln!(
+            "[yarr watch] polling {} {} every {}s",
+            poller.service.name,
+            poller.feed.as_str(),
+            interval.as_secs()
+        );
+        tasks.spawn(async move { poller.run(client, interval).await });
+    }
+    while let Some(finished) = tasks.join_next().await {
+        finished??;
+    }
+    Ok(())
+}
+
+/// The polling state of one source.
+struct Poller {
+    service: ServiceConfig,
+    feed: Feed,
+    /// Validators of the last listing read.
+    validators: Validators,
+    /// The last listing; `None` until the first successful read.
+    snapshot: Option<Snapshot>,
+    /// Where the import feed reads from next.
+    imports: ImportCursor,
+    /// The last read failed; the next success reports the recovery.
+    failing: bool,
+}
+
+impl Poller {
+    fn new(service: ServiceConfig, feed: Feed) -> Self {
+        Self {
+            service,
+            feed,
+            validators: Validators::default(),
+            snapshot: None,
+            imports: ImportCursor::default(),
+            failing: false,
+        }
+    }
+
+    /// Poll forever, printing each change as it is seen.
+    async fn run(mut self, client: YarrClient, interval: Duration) -> Result<()> {
+        loop {
+            for line in self.tick(&client).await {
+                println!("{line}");
+            }
+            tokio::time::sleep(interval).await;
+        }
+    }
+
+    /// Poll once and return the lines to emit. A failure is reported once,
+    /// when the source goes from readable to unreadable.
+    async fn tick(&mut self, client: &YarrClient) -> Vec<String> {
+        let name = self.service.name.clone();
+        let feed = self.feed.as_str();
+        let result = match self.feed {
+            Feed::Imports => self.poll_imports(client).await,
+            Feed::Queue | Feed::Sessions => self.poll_listing(client).await,
+        };
+        match result {
+            Ok(mut lines) => {
+                if std::mem::take(&mut self.failing) {
+                    lines.insert(0, format!("[{name}] {feed} readable again"));
+                }
+                lines
+            }
+            Err(error) if !self.failing => {
+                self.failing = true;
+                vec![format!("[{name}] {feed} UNAVAILABLE — {error:#}")]
+            }
+            Err(_) => Vec::new(),
+        }
+    }
+
+    async fn poll_listing(&mut self, client: &YarrClient) -> Result<Vec<String>> {
+        let Some(current) = read_listing(client, &self.service, &mut self.validators).await? else {
+            return Ok(Vec::new());
+        };
+        let lines = match &self.snapshot {
+            Some(previous) => diff(&self.service.name, self.feed, previous, &current),
+            None => vec![format!(
+                "[{}] watching {} — {} item(s)",
+                self.service.name,
+                self.feed.as_str(),
+                current.len()
+            )],
+        };
+        self.snapshot = Some(current);
+        Ok(lines)
+    }
+
+    async fn poll_imports(&mut self, client: &YarrClient) -> Result<Vec<String>> {
+        let name = &self.service.name;
+        Ok(match self.imports.read(client, &self.service).await? {
+            None => vec![format!("[{name}] watching imports")],
+            Some(titles) => titles
+                .into_iter()
+                .map(|title| format!("[{name}] {} {title}", Feed::Imports.tag()))
+                .collect(),
+        })
+    }
+}
+
+/// One line per added, removed or re-stated item between two listings.
+fn diff(service: &str, feed: Feed, previous: &Snapshot, current: &Snapshot) -> Vec<String> {
+    let tag = feed.tag();
+    let mut lines = Vec::new();
+    for (key, item) in current {
+        match previous.get(key) {
+            None => lines.push(format!(
+                "[{service}] {tag}+ {} ({})",
+                item.label, item.state
+            )),
+            Some(before) if before.state != item.state => lines.push(format!(
+                "[{service}] {tag}~ {}: {} → {}",
+                item.label, before.state, item.state
+            )),
+            Some(_) => {}
+        }
+    }
+    for (key, item) in previous {
+        if !current.contains_key(key) {
+            lines.push(format!("[{service}] {tag}- {}", item.label));
+        }
+    }
+    lines
+}
+
+#[cfg(test)]
+#[path = "sources_tests.rs"]
+mod tests;
@@ -0,0 +1,170 @@
+use std::sync::{Arc, Mutex};
+
+use axum::http::{HeaderMap, StatusCode, header};
+use axum::response::IntoResponse;
+use serde_json::{Value, json};
+
+use super::*;
+use crate::cli::watch::feeds::Item;
+
+#[test]
+fn source_specs_name_a_service_a_feed_and_an_optional_interval() {
+    assert_eq!(
+        "sonarr:queue@30".parse::<WatchSource>().unwrap(),
+        WatchSource {
+            service: "sonarr".into(),
+            feed: Feed::Queue,
+            interval: Some(30),
+        }
+    );
+    assert_eq!(
+        "plex:sessions".parse::<WatchSource>().unwrap().interval,
+        None
+    );
+    for bad in [
+        "sonarr",
+        ":queue",
+        "sonarr:grabs",
+        "sonarr:queue@0",
+        "sonarr:queue@x",
+    ] {
+        assert!(bad.parse::<WatchSource>().is_err(), "{bad}");
+    }
+}
+
+fn item(label: &str, state: &str) -> Item {
+    Item {
+        label: label.into(),
+        state: state.into(),
+    }
+}
+
+#[test]
+fn diffs_report_added_restated_and_removed_items_only() {
+    let previous = Snapshot::from([
+        ("1".into(), item("Kept", "downloading")),
+        ("2".into(), item("Moved", "downloading")),
+        ("3".into(), item("Gone", "completed")),
+    ]);
+    let current = Snapshot::from([
+        ("1".into(), item("Kept", "downloading")),
+        ("2".into(), item("Moved", "importPending")),
+        ("4".into(), item("New", "queued")),
+    ]);
+
+    assert_eq!(
+        diff("sonarr", Feed::Queue, &previous, &current),
+        [
+            "[sonarr] QUEUE~ Moved: downloading → importPending",
+            "[sonarr] QUEUE+ New (queued)",
+            "[sonarr] QUEUE- Gone",
+        ]
+    );
+    assert!(diff("sonarr", Feed::Queue, &current, &current).is_empty());
+}
+
+fn service(kind: ServiceKind, base_url: String) -> ServiceConfig {
+    ServiceConfig {
+        name: kind.as_str().into(),
+        kind,
+        base_url,
+        api_key: Some("secret".into()),
+        ..ServiceConfig::default()
+    }
+}
+
+/// A Sonarr stand-in whose queue is `queue`, tagged with an `ETag` derived
+/// from its contents and answering 304 when the tag is sent back.
+async fn sonarr(queue: Arc<Mutex<Value>>, not_modified: Arc<Mutex<usize>>) -> ServiceConfig {
+    let app = axum::Router::new().route(
+        "/api/v3/queue",
+        axum::routing::get(move |headers: HeaderMap| {
+            let queue = queue.clone();
+            let not_modified = not_modified.clone();
+            async move {
+                let body = queue.lock().unwrap().clone();
+                let tag = format!("\"{}\"", body.to_string().len());
+                let sent = headers
+                    .get(header::IF_NONE_MATCH)
+                    .and_then(|value| value.to_str().ok());
+                if sent == Some(tag.as_str()) {
+                    *not_modified.lock().unwrap() += 1;
+                    return StatusCode::NOT_MODIFIED.into_response();
+                }
+                ([(header::ETAG, tag)], axum::Json(body)).into_response()
+            }
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    service(ServiceKind::Sonarr, format!("http://{address}"))
+}
+
+#[tokio::test]
+async fn a_queue_poller_emits_only_changes_and_skips_unmodified_reads() {
+    let queue = Arc::new(Mutex::new(json!({"records": [
+        {"id": 1, "title": "Show.S01E01", "status": "downloading"},
+    ]})));
+    let not_modified = Arc::new(Mutex::new(0));
+    let config = YarrConfig {
+        services: vec![sonarr(queue.clone(), not_modified.clone()).await],
+    };
+    let client = YarrClient::new(&config).unwrap();
+    let mut poller = Poller::new(config.services[0].clone(), Feed::Queue);
+
+    assert_eq!(
+        poller.tick(&client).await,
+        ["[sonarr] watching queue — 1 item(s)"]
+    );
+    assert!(poller.tick(&client).await.is_empty());
+    assert_eq!(*not_modified.lock().unwrap(), 1);
+
+    *queue.lock().unwrap() = json!({"records": [
+        {"id": 1, "title": "Show.S01E01", "status": "completed"},
+        {"id": 2, "title": "Show.S01E02", "status": "queued"},
+    ]});
+    assert_eq!(
+        poller.tick(&client).await,
+        [
+            "[sonarr] QUEUE~ Show.S01E01: downloading → completed",
+            "[sonarr] QUEUE+ Show.S01E02 (queued)",
+        ]
+    );
+}
+
+#[tokio::test]
+async fn an_unreadable_source_is_reported_once() {
+    let mut poller = Poller::new(
+        service(ServiceKind::Radarr, "http://127.0.0.1:1".into()),
+        Feed::Queue,
+    );
+    let client = YarrClient::new(&YarrConfig::default()).unwrap();
+
+    let first = poller.tick(&client).await;
+    assert_eq!(first.len(), 1);
+    assert!(
+        first[0].starts_with("[radarr] queue UNAVAILABLE"),
+        "{first:?}"
+    );
+    assert!(poller.tick(&client).await.is_empty());
+}
+
+#[tokio::test]
+async fn sources_must_name_a_configured_service_with_that_feed() {
+    let config = YarrConfig {
+        services: vec![service(ServiceKind::Plex, "http://localhost:1".into())],
+    };
+    let error = run_watch_sources(&config, None, 10, vec!["radarr:queue".parse().unwrap()])
+        .await
+        .unwrap_err();
+    assert!(
+        error.to_string().contains("no configured service"),
+        "{error}"
+    );
+
+    let error = run_watch_sources(&config, None, 10, vec!["plex:queue".parse().unwrap()])
+        .await
+        .unwrap_err();
+    assert!(error.to_string().contains("has no queue feed"), "{error}");
+}
@@ -11,10 +11,10 @@
 //!   * **Engine.** Lab runs QuickJS-via-`javy` inside a `wasmtime` subprocess.
 //!     yarr embeds QuickJS in-process via [`rquickjs`] — same engine semantics,
 //!     no subprocess/wasm runtime, which fits a single binary. The engine runs on
-//!     a blocking thread; `callTool` is a *synchronous* native function that blocks
-//!     on a channel round-trip to the async dispatcher (see [`crate::app`]), so the
-//!     JS `async`/`await` sugar is driven purely by the microtask pump — no async
-//!     JS runtime is needed.
+//!     a blocking thread; `callTool` submits to the async dispatcher (see
+//!     [`crate::app`]) and returns a pending promise, and the engine pumps the
+//!     microtask queue as completions arrive — so `Promise.all` fan-outs run
+//!     concurrently upstream while JS stays single-threaded.
 //!   * **Safety.** Memory and stack are capped, and a wall-clock deadline aborts
 //!     runaway scripts via a QuickJS interrupt handler. MCP requests reauthorize
 //!     every inner action and fail closed if a destructive call cannot elicit
@@ -22,23 +22,34 @@
 //!
 //! Module layout:
 //!   [`engine`] — the rquickjs execution harness (pure; takes an opaque tool
-//!     caller). [`proxy`] — generates the JS preamble (`callTool`, `console`, the
+//!     bridge). [`bridge`] — the async `callTool` submission/completion types.
+//!     [`pool`] — warm, single-use runtimes with the preamble pre-evaluated. [`proxy`] — generates the JS preamble (`callTool`, `console`, the
 //!     per-service `<service>.<verb>()` callables, and the `api.<service>` client)
-//!     from the configured services.
+//!     from the configured services. [`search`] — the host-side index behind
+//!     `codemode.search`/`codemode.describe`.
 
 pub mod artifact;
+pub mod bridge;
 pub mod catalog;
 pub mod dts;
 pub mod engine;
+pub mod pool;
 pub mod proxy;
+pub mod search;
 pub mod semantic;
 pub mod store;
 pub mod truncate;
 
 use std::time::Duration;
 
-pub use engine::{ArtifactWriter, EmbedCaller, EngineLimits, EngineOutcome, ToolCaller, run};
-pub use proxy::build_preamble;
+pub use bridge::{ToolBridge, ToolCaller, ToolCompletion, ToolSubmitter};
+pub use engine::{
+    ArtifactWriter, EmbedCaller, EngineLimits, EngineOutcome, PrepareTimings, Prepared, prepare,
+    run, run_prepared,
+};
+pub use pool::{StartKind, WarmPool};
+pub use proxy::{Preamble, build_preamble};
+pub use search::SearchIndex;
 pub use semantic::{SemanticCache, semantic_scores, tei_url};
 
 /// Wall-clock budget for a single Code Mode execution (matches lab's default).
@@ -47,6 +58,10 @@ pub const CODEMODE_TIMEOUT: Duration = Duration::from_secs(30);
 pub const CODEMODE_MAX_CONCURRENT: usize = 4;
 /// Maximum time a Code Mode request waits for an execution slot.
 pub const CODEMODE_QUEUE_TIMEOUT: Duration = Duration::from_millis(500);
+/// Maximum tool calls one Code Mode run keeps in flight at once.
+pub const CODEMODE_MAX_PARALLEL_CALLS: usize = 16;
+/// Maximum in-flight tool calls one run sends to a single upstream service.
+pub const CODEMODE_MAX_PARALLEL_CALLS_PER_SERVICE: usize = 8;
 /// QuickJS heap cap (matches lab's 64 MiB).
 pub const CODEMODE_MEMORY_LIMIT: usize = 64 * 1024 * 1024;
 /// QuickJS native stack cap.
@@ -67,8 +82,18 @@ pub const CODEMODE_MAX_ARTIFACT_TOTAL_BYTES: usize = 16 * 1024 * 1024;
 pub const CODEMODE_ARTIFACT_GLOBAL_BYTES: u64 = 1024 * 1024 * 1024;
 /// Free disk space preserved when accepting a new artifact.
 pub const CODEMODE_ARTIFACT_MIN_FREE_BYTES: u64 = 64 * 1024 * 1024;
-/// Completed run directories older than this are removed at run admission.
+/// Completed run directories older than this are removed by the retention sweep.
 pub const CODEMODE_ARTIFACT_RETENTION: Duration = Duration::from_secs(7 * 24 * 60 * 60);
+/// Minimum time between retention sweeps; run admission starts one in the
+/// background when this much time has passed since the last.
+pub const CODEMODE_ARTIFACT_SWEEP_INTERVAL: Duration = Duration::from_secs(10 * 60);
+/// A sweep evicts the oldest idle runs until at most this many bytes remain,
+/// keeping headroom below [`CODEMODE_ARTIFACT_GLOBAL_BYTES`].
+pub const CODEMODE_ARTIFACT_SWEEP_TARGET_BYTES: u64 = CODEMODE_ARTIFACT_GLOBAL_BYTES / 4 * 3;
+
+/// Persisted semantic-search catalog embeddings live under
+/// `<data_dir>/<CODEMODE_EMBEDDINGS_SUBDIR>/<hash>.f32`.
+pub const CODEMODE_EMBEDDINGS_SUBDIR: &str = "codemode/embeddings";
 
 /// Saved snippets live under `<data_dir>/<CODEMODE_SNIPPETS_SUBDIR>/<name>.{js,json}`.
 pub const CODEMODE_SNIPPETS_SUBDIR: &str = "codemode/snippets";
@@ -0,0 +1,58 @@
+//! The `callTool` bridge between the QuickJS engine and the host.
+//!
+//! JS `callTool` hands `(ticket, action, params_json)` to a [`ToolSubmitter`]
+//! and returns a pending promise; the host answers later with a
+//! [`ToolCompletion`] on the bridge's receiver, in any order. A plain
+//! synchronous [`ToolCaller`] converts into a bridge whose calls complete
+//! immediately.
+
+use std::sync::mpsc::Receiver;
+
+/// Synchronous bridge from JS `callTool` to the host. Given `(action, params_json)`
+/// it returns either a result JSON string (`Ok`) or an error message (`Err`,
+/// rejected into JS as an `Error`). Converts into a [`ToolBridge`] whose calls
+/// complete immediately, in submission order — used by tests and any host that
+/// has no concurrent dispatcher.
+///
+/// Owned and `'static` because rquickjs stores the native bridge in the JS context
+/// (it cannot borrow the caller's stack).
+pub type ToolCaller = Box<dyn Fn(&str, &str) -> Result<String, String> + Send>;
+
+/// Non-blocking submission half of a [`ToolBridge`]: hands `(ticket, action,
+/// params_json)` to the host and returns at once. `Err` (e.g. the dispatcher is
+/// gone) is thrown synchronously from `callTool`.
+pub type ToolSubmitter = Box<dyn Fn(u32, &str, &str) -> Result<(), String> + Send>;
+
+/// Result of one submitted call, keyed by the ticket the engine assigned.
+pub struct ToolCompletion {
+    pub ticket: u32,
+    pub result: Result<String, String>,
+}
+
+/// Asynchronous bridge from JS `callTool` to the host: submissions go out through
+/// `submit`, results come back (in any order) on `completions`.
+pub struct ToolBridge {
+    pub submit: ToolSubmitter,
+    pub completions: Receiver<ToolCompletion>,
+}
+
+impl From<ToolCaller> for ToolBridge {
+    fn from(caller: ToolCaller) -> Self {
+        let (done_tx, completions) = std::sync::mpsc::channel();
+        Self {
+            submit: Box::new(move |ticket, id, params_json| {
+                done_tx
+                    .send(ToolCompletion {
+                        ticket,
+                        result: caller(id, params_json),
+                    })
+                    .map_err(|_| "codemode dispatcher unavailable".to_string())
+            }),
+            completions,
+        }
+    }
+}
+
+#[cfg(test)]
+#[path = "bridge_tests.rs"]
+mod tests;
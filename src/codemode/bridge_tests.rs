@@ -0,0 +1,117 @@
+//! Async bridge tests — drive `engine::run` with bridges whose calls complete
+//! on other threads, in any order.
+
+use std::time::{Duration, Instant};
+
+use super::{ToolBridge, ToolCompletion};
+use crate::codemode::Preamble;
+use crate::codemode::engine::{ArtifactWriter, EmbedCaller, EngineLimits, run};
+
+fn limits(ttl: Duration) -> EngineLimits {
+    EngineLimits {
+        memory_bytes: 64 * 1024 * 1024,
+        stack_bytes: 512 * 1024,
+        deadline: Instant::now() + ttl,
+    }
+}
+
+fn no_write() -> ArtifactWriter {
+    Box::new(|_path, _content, _opts| Err("artifacts disabled in this test".to_string()))
+}
+
+fn no_embed() -> EmbedCaller {
+    Box::new(|_query| Ok("{}".to_string()))
+}
+
+/// A bridge whose calls each complete on their own thread after `delay(ticket)`.
+fn threaded_bridge(delay: impl Fn(u32) -> Duration + Send + Sync + 'static) -> ToolBridge {
+    let (done_tx, completions) = std::sync::mpsc::channel();
+    let delay = std::sync::Arc::new(delay);
+    ToolBridge {
+        submit: Box::new(move |ticket, id, _params_json| {
+            let done_tx = done_tx.clone();
+            let delay = std::sync::Arc::clone(&delay);
+            let id = id.to_owned();
+            std::thread::spawn(move || {
+                std::thread::sleep(delay(ticket));
+                let _ = done_tx.send(ToolCompletion {
+                    ticket,
+                    result: Ok(format!(r#"{{"ticket":{ticket},"id":"{id}"}}"#)),
+                });
+            });
+            Ok(())
+        }),
+        completions,
+    }
+}
+
+#[test]
+fn promise_all_fan_out_runs_calls_concurrently() {
+    let code = r#"
+        async () => {
+            const ids = Array.from({ length: 20 }, (_, i) => "call" + i);
+            const out = await Promise.all(ids.map((id) => callTool(id, {})));
+            return out.map((r) => r.id);
+        }
+    "#;
+    let started = Instant::now();
+    let out = run(
+        code,
+        &Preamble::new(&[]),
+        &limits(Duration::from_secs(5)),
+        threaded_bridge(|_| Duration::from_millis(150)),
+        no_write(),
+        no_embed(),
+        None,
+    )
+    .unwrap();
+    // Serial execution would take 20 x 150ms; concurrent is one round-trip.
+    assert!(started.elapsed() < Duration::from_millis(1500));
+    let expected: Vec<String> = (0..20).map(|i| format!("call{i}")).collect();
+    assert_eq!(out.result, serde_json::json!(expected));
+}
+
+#[test]
+fn out_of_order_completions_settle_the_matching_promise() {
+    let code = r#"
+        async () => {
+            const slow = callTool("slow", {});
+            const fast = callTool("fast", {});
+            const order = [];
+            await Promise.all([
+                slow.then((r) => order.push(r.id)),
+                fast.then((r) => order.push(r.id)),
+            ]);
+            return order;
+        }
+    "#;
+    let out = run(
+        code,
+        &Preamble::new(&[]),
+        &limits(Duration::from_secs(5)),
+        threaded_bridge(|ticket| Duration::from_millis(if ticket == 1 { 200 } else { 10 })),
+        no_write(),
+        no_embed(),
+        None,
+    )
+    .unwrap();
+    assert_eq!(out.result, serde_json::json!(["fast", "slow"]));
+}
+
+#[test]
+fn unawaited_call_does_not_hold_the_script_open() {
+    let code = r#"async () => { callTool("fire_and_forget", {}); return "done"; }"#;
+    let started = Instant::now();
+    let out = run(
+        code,
+        &Preamble::new(&[]),
+        &limits(Duration::from_secs(5)),
+        threaded_bridge(|_| Duration::from_secs(2)),
+        no_write(),
+        no_embed(),
+        None,
+    )
+    .unwrap();
+    assert_eq!(out.result, serde_json::json!("done"));
+    assert!(started.elapsed() < Duration::from_secs(1));
+}
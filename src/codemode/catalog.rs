@@ -9,9 +9,9 @@
 //! self-contained callable, so it never enumerates services or passes a `service`
 //! param.
 //!
-//! The catalog is serialized once and injected as `globalThis.__codemodeCatalog`;
-//! the pure-JS `codemode.search`/`codemode.describe` helpers (see [`super::proxy`])
-//! read it with zero host round-trips. The raw passthrough client is documented by
+//! The catalog is built once per configured fleet and indexed host-side by
+//! [`super::search`], which backs the in-sandbox `codemode.search` and
+//! `codemode.describe` helpers. The raw passthrough client is documented by
 //! four service-agnostic `api.<service>.{get,post,put,delete}` entries.
 
 use serde::Serialize;
@@ -313,7 +313,7 @@ fn generic_api_entries() -> Vec<CatalogEntry> {
 fn generic_description(name: &str) -> &'static str {
     match name {
         "service_status" => "Call the service's default status endpoint.",
-        "api_get" => "Raw GET passthrough: api.<service>.get(path).",
+        "api_get" => "Raw GET passthrough: api.<service>.get(path, { fields }?).",
         "api_post" => "Raw POST passthrough (runs immediately): api.<service>.post(path, body).",
         "api_put" => "Raw PUT passthrough (runs immediately): api.<service>.put(path, body).",
         "api_delete" => {
@@ -12,6 +12,7 @@
 //! derives are for.
 
 use std::collections::BTreeMap;
+use std::sync::OnceLock;
 
 use serde::Serialize;
 use serde_json::Value;
@@ -111,14 +112,21 @@ pub fn type_entries() -> Vec<TypeEntry> {
     out
 }
 
+/// [`type_entries`], generated once per process. The `schemars` walk does not
+/// depend on the config, so it is only paid when a doc-based kind is configured
+/// and its types are first asked for.
+fn model_type_entries() -> &'static [TypeEntry] {
+    static ENTRIES: OnceLock<Vec<TypeEntry>> = OnceLock::new();
+    ENTRIES.get_or_init(type_entries)
+}
+
 /// Build the discoverable type catalog for the CONFIGURED services, merging two
 /// sources: generated TypeScript interfaces (from the vendored OpenAPI specs) for
 /// the spec-backed kinds, and the hand-modeled `schemars` types ([`type_entries`])
 /// for the doc-based kinds. Entries are qualified by the configured service NAME so
 /// `codemode.describe("<service>.<Type>")` lines up with the callable namespace.
-pub fn type_catalog_json_for(services: &[(String, crate::config::ServiceKind)]) -> String {
+pub fn type_entries_for(services: &[(String, crate::config::ServiceKind)]) -> Vec<TypeEntry> {
     let mut out: Vec<TypeEntry> = Vec::new();
-    let model_entries = type_entries();
     for (name, kind) in services {
         if crate::openapi::is_generated(*kind) {
             for t in crate::openapi::types_for_kind(*kind) {
@@ -135,7 +143,10 @@ pub fn type_catalog_json_for(services: &[(String, crate::config::ServiceKind)])
             // Doc-based kind: reuse the schemars-derived entries for this kind,
             // re-qualified by the configured service name.
             let kind_str = kind.as_str();
-            for entry in model_entries.iter().filter(|e| e.service == kind_str) {
+            for entry in model_type_entries()
+                .iter()
+                .filter(|e| e.service == kind_str)
+            {
                 out.push(TypeEntry {
                     name: format!("{name}.{}", entry.type_name),
                     service: entry.service,
@@ -146,7 +157,12 @@ pub fn type_catalog_json_for(services: &[(String, crate::config::ServiceKind)])
         }
     }
     out.sort_by(|a, b| a.name.cmp(&b.name));
-    serde_json::to_string(&out).unwrap_or_else(|_| "[]".to_string())
+    out
+}
+
+/// [`type_entries_for`] serialized to a JSON array string.
+pub fn type_catalog_json_for(services: &[(String, crate::config::ServiceKind)]) -> String {
+    serde_json::to_string(&type_entries_for(services)).unwrap_or_else(|_| "[]".to_string())
 }
 
 /// A single TS declaration for one schema node: an `interface` for an object, a
@@ -1,43 +1,44 @@
 //! The rquickjs execution harness.
 //!
-//! Pure with respect to yarr's domain: it takes the user code, a JS preamble,
-//! resource limits, and an opaque [`ToolCaller`] callback. The engine knows
-//! nothing about actions, services, or tokio — the caller wires `on_call` to the
-//! async dispatcher (typically via a blocking channel round-trip).
+//! Pure with respect to yarr's domain: it takes the user code, a [`Preamble`]
+//! (JS plus the discovery index behind `codemode.search`), resource limits, and
+//! an opaque [`ToolBridge`]. The engine knows nothing about
+//! actions, services, or tokio — the caller wires the bridge to the async
+//! dispatcher (typically a channel to a concurrent dispatch loop).
 //!
 //! Execution model: the preamble's `__yarrRun(entry)` kicks off
 //! `Promise.resolve().then(() => entry())`, stores the JSON-stringified result on
-//! `globalThis.__yarrResult`, and sets `globalThis.__yarrDone`. Because the
-//! only async operation (`callTool`) is a *synchronous* blocking native call,
-//! draining the microtask queue settles the whole chain — no async JS runtime is
-//! required.
+//! `globalThis.__yarrResult`, and sets `globalThis.__yarrDone`. `callTool` is
+//! asynchronous: it submits `(ticket, action, params_json)` through the bridge
+//! and returns a pending promise. The engine drains the microtask queue, then
+//! blocks for the next [`ToolCompletion`], settles its promise via
+//! `__yarrSettle`, and drains again — so `Promise.all` fan-outs have every call
+//! in flight at once while the JS itself stays single-threaded.
 
-use std::time::Instant;
+use std::sync::Arc;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::mpsc::RecvTimeoutError;
+use std::time::{Duration, Instant};
 
 use rquickjs::{CatchResultExt, Context, Function, Runtime};
 
-/// Synchronous bridge from JS `callTool` to the host. Given `(action, params_json)`
-/// it returns either a result JSON string (`Ok`) or an error message (`Err`, thrown
-/// into JS as an `Error`). The engine treats it as opaque; the real implementation
-/// blocks on a channel round-trip to the async dispatcher.
-///
-/// Owned and `'static` because rquickjs stores the native bridge in the JS context
-/// (it cannot borrow the caller's stack); the real caller boxes a closure that
-/// captures a channel sender (which is `Send`).
-pub type ToolCaller = Box<dyn Fn(&str, &str) -> Result<String, String> + Send>;
+use super::bridge::{ToolBridge, ToolCompletion};
+use super::proxy::Preamble;
+use super::search::SearchIndex;
 
 /// Synchronous bridge for `writeArtifact(path, content, options_json)`: returns a
 /// receipt JSON string (`Ok`) or an error message (`Err`, thrown into JS). Same
-/// ownership rationale as [`ToolCaller`]; the real impl blocks on a channel
-/// round-trip to the async writer.
-pub type ArtifactWriter = Box<dyn Fn(&str, &str, &str) -> Result<String, String> + Send>;
+/// ownership rationale as [`ToolCaller`](super::ToolCaller); the real impl blocks on a channel
+/// round-trip to the async writer. `content` is handed over by value so an
+/// export of several MiB is moved to the writer rather than copied.
+pub type ArtifactWriter = Box<dyn Fn(&str, String, &str) -> Result<String, String> + Send>;
 
 /// Synchronous bridge for the internal `codemode.search()` semantic-scoring
 /// hook: given the query string, returns a JSON object string
 /// (`{"path": similarity, ...}`) — always `Ok`, never `Err`, since semantic
 /// search fails open (an empty `{}` object is a completely normal, expected
 /// result, not a bridge failure). The `Result` wrapper exists only for
-/// consistency with [`ToolCaller`]/[`ArtifactWriter`]'s shape; the real impl
+/// consistency with [`ToolCaller`](super::ToolCaller)/[`ArtifactWriter`]'s shape; the real impl
 /// never actually returns `Err`. Unlike those two, this is NOT exposed to user
 /// scripts as a callable — only the generated `codemode.search` preamble code
 /// calls it.
@@ -60,39 +61,148 @@ pub struct EngineOutcome {
     pub logs: Vec<String>,
 }
 
+/// A fresh runtime + context with the preamble already evaluated, ready to
+/// serve exactly one [`run_prepared`] call. Never reused afterwards, so no
+/// script state can leak into another run.
+pub struct Prepared {
+    rt: Runtime,
+    ctx: Context,
+    timings: PrepareTimings,
+}
+
+impl Prepared {
+    /// How long [`prepare`] took to build this runtime.
+    pub fn timings(&self) -> PrepareTimings {
+        self.timings
+    }
+}
+
+/// Time [`prepare`] spent in each of its two phases.
+#[derive(Debug, Clone, Copy)]
+pub struct PrepareTimings {
+    /// Creating the runtime and the full context.
+    pub runtime_init: Duration,
+    /// Installing the discovery natives and evaluating the preamble JS.
+    pub preamble_eval: Duration,
+}
+
+/// Build a runtime with the given heap/stack caps, install the discovery
+/// natives, and evaluate the preamble JS in a fresh full context. This is the
+/// expensive, script-independent part of a run (parsing the runtime and
+/// namespaces), so it can happen ahead of time on another thread.
+pub fn prepare(
+    preamble: &Preamble,
+    memory_bytes: usize,
+    stack_bytes: usize,
+) -> Result<Prepared, String> {
+    let started = Instant::now();
+    let rt = Runtime::new().map_err(|e| format!("codemode: runtime init failed: {e}"))?;
+    rt.set_memory_limit(memory_bytes);
+    rt.set_max_stack_size(stack_bytes);
+    let ctx = Context::full(&rt).map_err(|e| format!("codemode: context init failed: {e}"))?;
+    let initialized = Instant::now();
+    ctx.with(|ctx| {
+        install_discovery(&ctx, preamble.index())
+            .map_err(|e| format!("codemode: failed to install discovery bridge: {e}"))?;
+        ctx.eval::<(), _>(preamble.js())
+            .catch(&ctx)
+            .map_err(|e| format!("codemode: preamble error: {e}"))
+    })?;
+    let timings = PrepareTimings {
+        runtime_init: initialized - started,
+        preamble_eval: initialized.elapsed(),
+    };
+    Ok(Prepared { rt, ctx, timings })
+}
+
+/// Register `__yarrSearch(query, limit, semantic_json)` and
+/// `__yarrDescribe(name)`, the internal natives behind `codemode.search` and
+/// `codemode.describe`. Both return JSON strings; the index is shared, read-only
+/// state, so binding it before any script runs leaks nothing between runs.
+fn install_discovery(ctx: &rquickjs::Ctx<'_>, index: &Arc<SearchIndex>) -> rquickjs::Result<()> {
+    let searched = Arc::clone(index);
+    let search = Function::new(
+        ctx.clone(),
+        move |cx: rquickjs::Ctx<'_>,
+              query: String,
+              limit: f64,
+              semantic_json: String|
+              -> rquickjs::Result<String> {
+            let semantic = serde_json::from_str(&semantic_json).map_err(|e| {
+                rquickjs::Exception::throw_message(&cx, &format!("invalid semantic scores: {e}"))
+            })?;
+            // `as` saturates: a fractional limit truncates and `Infinity` keeps
+            // everything, matching the `Array.prototype.slice` it replaces.
+            Ok(searched
+                .search(&query, limit as usize, &semantic)
+                .to_string())
+        },
+    )?;
+    ctx.globals().set("__yarrSearch", search)?;
+    let described = Arc::clone(index);
+    let describe = Function::new(ctx.clone(), move |name: String| {
+        described.describe(&name).to_string()
+    })?;
+    ctx.globals().set("__yarrDescribe", describe)
+}
+
 /// Run `user_code` (an async-arrow-function expression, or any expression that
-/// evaluates to a function or value) after evaluating `preamble`. Returns the
+/// evaluates to a function or value) after preparing `preamble`. Returns the
 /// decoded result + captured logs, or an error string (timeout, JS exception, or
 /// a thrown tool error).
 pub fn run(
     user_code: &str,
-    preamble: &str,
+    preamble: &Preamble,
     limits: &EngineLimits,
-    on_call: ToolCaller,
+    on_call: impl Into<ToolBridge>,
     on_write: ArtifactWriter,
     on_embed: EmbedCaller,
     input_json: Option<&str>,
 ) -> Result<EngineOutcome, String> {
-    let rt = Runtime::new().map_err(|e| format!("codemode: runtime init failed: {e}"))?;
-    rt.set_memory_limit(limits.memory_bytes);
-    rt.set_max_stack_size(limits.stack_bytes);
+    let prepared = prepare(preamble, limits.memory_bytes, limits.stack_bytes)?;
+    run_prepared(
+        prepared, user_code, limits, on_call, on_write, on_embed, input_json,
+    )
+}
+
+/// Run `user_code` in an already [`prepare`]d runtime. `limits.deadline` is
+/// enforced from here on; the heap/stack caps were fixed at preparation.
+pub fn run_prepared(
+    prepared: Prepared,
+    user_code: &str,
+    limits: &EngineLimits,
+    on_call: impl Into<ToolBridge>,
+    on_write: ArtifactWriter,
+    on_embed: EmbedCaller,
+    input_json: Option<&str>,
+) -> Result<EngineOutcome, String> {
+    let Prepared { rt, ctx, .. } = prepared;
     let deadline = limits.deadline;
     rt.set_interrupt_handler(Some(Box::new(move || Instant::now() >= deadline)));
 
-    let ctx = Context::full(&rt).map_err(|e| format!("codemode: context init failed: {e}"))?;
+    let ToolBridge {
+        submit,
+        completions,
+    } = on_call.into();
+    let in_flight = Arc::new(AtomicUsize::new(0));
 
-    // Phase 1 (inside ctx.with): register the native bridge, eval the preamble,
+    // Phase 1 (inside ctx.with): register the native bridge, bind the input,
     // and kick off the user code. No microtask runs yet — `__yarrRun` schedules
     // the work and returns immediately.
     ctx.with(|ctx| {
+        let submitted = Arc::clone(&in_flight);
         let emit = Function::new(
             ctx.clone(),
             move |cx: rquickjs::Ctx<'_>,
+                  ticket: u32,
                   id: String,
                   params_json: String|
-                  -> rquickjs::Result<String> {
-                match on_call(&id, &params_json) {
-                    Ok(result_json) => Ok(result_json),
+                  -> rquickjs::Result<()> {
+                match submit(ticket, &id, &params_json) {
+                    Ok(()) => {
+                        submitted.fetch_add(1, Ordering::SeqCst);
+                        Ok(())
+                    }
                     // Throw a proper `Error` object (not a bare string) so user
                     // `catch (e)` blocks see `e.message` and `e instanceof Error`.
                     Err(message) => Err(rquickjs::Exception::throw_message(&cx, &message)),
@@ -111,7 +221,7 @@ pub fn run(
                   content: String,
                   options_json: String|
                   -> rquickjs::Result<String> {
-                match on_write(&path, &content, &options_json) {
+                match on_write(&path, content, &options_json) {
                     Ok(receipt_json) => Ok(receipt_json),
                     Err(message) => Err(rquickjs::Exception::throw_message(&cx, &message)),
                 }
@@ -141,18 +251,17 @@ pub fn run(
             .map_err(|e| format!("codemode: failed to install embed bridge: {e}"))?;
 
         // Bind the snippet `input` as a JSON STRING global (typed set — no source
-        // splicing, so no escaping pitfalls); the preamble parses it into
-        // `globalThis.input`. Set BEFORE the preamble runs.
+        // splicing, so no escaping pitfalls); the preamble's `__yarrBindInput`
+        // parses it into `globalThis.input` before the user code is evaluated.
         if let Some(input) = input_json {
             ctx.globals()
                 .set("__yarrInputJson", input)
                 .map_err(|e| format!("codemode: failed to bind input: {e}"))?;
+            ctx.eval::<(), _>("__yarrBindInput();")
+                .catch(&ctx)
+                .map_err(|e| format!("codemode: failed to bind input: {e}"))?;
         }
 
-        ctx.eval::<(), _>(preamble)
-            .catch(&ctx)
-            .map_err(|e| format!("codemode: preamble error: {e}"))?;
-
         // `user_code` is wrapped, not concatenated into a statement position, so a
         // bare arrow-function expression parses (and a leading newline guards
         // against a `//` line-comment swallowing the closing paren).
@@ -163,10 +272,31 @@ pub fn run(
         Ok::<(), String>(())
     })?;
 
-    // Phase 2 (OUTSIDE ctx.with, else the runtime double-borrows): drain microtasks
-    // until the chain settles. Each job may run the synchronous `callTool` bridge,
-    // which blocks this thread on the dispatcher round-trip.
-    drain_jobs(&rt, deadline)?;
+    // Phase 2 (OUTSIDE ctx.with, else the runtime double-borrows): drain
+    // microtasks, then block for the next tool completion and settle it, until
+    // the script settles or nothing it could still await is in flight. Calls the
+    // script fired but never awaited are abandoned here; the host still finishes
+    // them and records them as undelivered.
+    loop {
+        drain_jobs(&rt, deadline)?;
+        if in_flight.load(Ordering::SeqCst) == 0 || script_done(&ctx)? {
+            break;
+        }
+        let remaining = deadline.saturating_duration_since(Instant::now());
+        let first = match completions.recv_timeout(remaining) {
+            Ok(completion) => completion,
+            Err(RecvTimeoutError::Timeout) => return Err("codemode: timed out".to_string()),
+            Err(RecvTimeoutError::Disconnected) => {
+                return Err("codemode: dispatcher unavailable".to_string());
+            }
+        };
+        // Settle everything that has already arrived before draining again, so a
+        // fan-out resumes in as few job-queue passes as possible.
+        for completion in std::iter::once(first).chain(completions.try_iter()) {
+            in_flight.fetch_sub(1, Ordering::SeqCst);
+            settle(&ctx, completion)?;
+        }
+    }
 
     // Phase 3: read back the result + logs.
     ctx.with(|ctx| {
@@ -229,6 +359,33 @@ fn drain_jobs(rt: &Runtime, deadline: Instant) -> Result<(), String> {
     Ok(())
 }
 
+/// Whether `__yarrRun` has settled the script's promise.
+fn script_done(ctx: &Context) -> Result<bool, String> {
+    ctx.with(|ctx| {
+        ctx.globals()
+            .get("__yarrDone")
+            .map_err(|e| format!("codemode: missing completion flag: {e}"))
+    })
+}
+
+/// Resolve or reject the promise `callTool` returned for `completion.ticket`.
+fn settle(ctx: &Context, completion: ToolCompletion) -> Result<(), String> {
+    let (ok, payload) = match completion.result {
+        Ok(result_json) => (true, result_json),
+        Err(message) => (false, message),
+    };
+    ctx.with(|ctx| {
+        let settle: Function = ctx
+            .globals()
+            .get("__yarrSettle")
+            .map_err(|e| format!("codemode: missing settle hook: {e}"))?;
+        settle
+            .call::<_, ()>((completion.ticket, ok, payload))
+            .catch(&ctx)
+            .map_err(|e| format!("codemode: failed to deliver tool result: {e}"))
+    })
+}
+
 #[cfg(test)]
 #[path = "engine_tests.rs"]
 mod tests;
@@ -3,8 +3,9 @@
 
 use std::time::{Duration, Instant};
 
-use super::{ArtifactWriter, EmbedCaller, EngineLimits, ToolCaller, run};
-use crate::codemode::build_preamble;
+use super::{ArtifactWriter, EmbedCaller, EngineLimits, run};
+use crate::codemode::Preamble;
+use crate::codemode::ToolCaller;
 
 fn limits(ttl: Duration) -> EngineLimits {
     EngineLimits {
@@ -37,7 +38,7 @@ fn no_embed() -> EmbedCaller {
 fn plain_expression_returns_value() {
     let out = run(
         "async () => 6 * 7",
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         echo_caller(),
         no_write(),
@@ -59,7 +60,7 @@ fn calltool_round_trips_through_on_call() {
     "#;
     let out = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         echo_caller(),
         no_write(),
@@ -77,7 +78,7 @@ fn console_output_is_captured() {
     let code = r#"async () => { console.log("hello", 1); console.error("boom"); return "ok"; }"#;
     let out = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         echo_caller(),
         no_write(),
@@ -99,7 +100,7 @@ fn thrown_tool_error_surfaces_as_err() {
         r#"async () => { await callTool("list", { service: "sonarr" }); return "unreachable"; }"#;
     let err = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         failing,
         no_write(),
@@ -115,7 +116,7 @@ fn script_throw_surfaces_as_err() {
     let code = r#"async () => { throw new Error("nope"); }"#;
     let err = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         echo_caller(),
         no_write(),
@@ -133,12 +134,12 @@ fn write_artifact_round_trips_through_on_write() {
         return r;
     }"#;
     // Capturing writer: echoes a receipt for whatever it's handed.
-    let writer: ArtifactWriter = Box::new(|path: &str, content: &str, _opts: &str| {
+    let writer: ArtifactWriter = Box::new(|path: &str, content: String, _opts: &str| {
         Ok(format!(r#"{{"path":"{path}","bytes":{}}}"#, content.len()))
     });
     let out = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         echo_caller(),
         writer,
@@ -159,7 +160,7 @@ fn write_artifact_error_surfaces_as_throw() {
     let writer: ArtifactWriter = Box::new(|_p, _c, _o| Err("disk full".to_string()));
     let out = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         echo_caller(),
         writer,
@@ -175,7 +176,7 @@ fn infinite_loop_is_interrupted_by_deadline() {
     let code = r#"async () => { while (true) {} }"#;
     let err = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_millis(300)),
         echo_caller(),
         no_write(),
@@ -195,7 +196,7 @@ fn memory_limit_is_enforced() {
     let code = r#"async () => { const s = "x".repeat(100 * 1024 * 1024); return s.length; }"#;
     let err = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(10)),
         echo_caller(),
         no_write(),
@@ -228,7 +229,7 @@ fn stalled_calltool_is_bounded_by_deadline() {
     let code = r#"async () => { await callTool("slow", {}); return "done"; }"#;
     let err = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_millis(100)),
         slow,
         no_write(),
@@ -248,7 +249,7 @@ fn search_with_no_lexical_overlap_and_no_semantic_score_finds_nothing() {
     let code = r#"async () => (await codemode.search("xyzzy plugh nonsense")).results"#;
     let out = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         echo_caller(),
         no_write(),
@@ -271,7 +272,7 @@ fn search_blends_in_a_high_semantic_score_for_zero_lexical_overlap_query() {
     let code = r#"async () => (await codemode.search("xyzzy plugh nonsense")).results"#;
     let out = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         echo_caller(),
         no_write(),
@@ -310,7 +311,7 @@ fn search_embed_bridge_is_not_called_for_an_empty_query() {
     let code = r#"async () => (await codemode.search("")).total"#;
     let out = run(
         code,
-        &build_preamble(&[]),
+        &Preamble::new(&[]),
         &limits(Duration::from_secs(5)),
         echo_caller(),
         no_write(),
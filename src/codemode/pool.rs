@@ -0,0 +1,117 @@
+//! Warm pool of pre-initialized QuickJS runtimes.
+//!
+//! Evaluating the preamble (runtime shim and per-service namespaces, one
+//! callable per generated operation) dominates Code Mode start-up for large
+//! fleets. The pool keeps up to `capacity` runtimes that have already evaluated
+//! it, so a run normally starts warm. Isolation is preserved by construction:
+//! every [`Prepared`] runtime is handed out once, consumed by a single run, and
+//! dropped — contexts are never returned to the pool.
+
+use std::sync::{Mutex, PoisonError};
+use std::time::Instant;
+
+use super::engine::{Prepared, prepare};
+use super::proxy::Preamble;
+use super::{CODEMODE_MEMORY_LIMIT, CODEMODE_STACK_LIMIT};
+
+/// Whether a run got a pre-initialized runtime or had to build its own.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum StartKind {
+    Warm,
+    Cold,
+}
+
+impl StartKind {
+    pub fn as_str(self) -> &'static str {
+        match self {
+            Self::Warm => "warm",
+            Self::Cold => "cold",
+        }
+    }
+}
+
+pub struct WarmPool {
+    preamble: Preamble,
+    capacity: usize,
+    spares: Mutex<Vec<Prepared>>,
+}
+
+impl WarmPool {
+    /// An empty pool; it fills through [`refill`](Self::refill), so services
+    /// that never run Code Mode never pay for a runtime.
+    pub fn new(preamble: Preamble, capacity: usize) -> Self {
+        Self {
+            preamble,
+            capacity,
+            spares: Mutex::new(Vec::with_capacity(capacity)),
+        }
+    }
+
+    /// Take a warm runtime if one is ready, otherwise prepare one inline.
+    /// Records the start latency labelled by [`StartKind`].
+    pub fn checkout(&self) -> Result<(Prepared, StartKind), String> {
+        let started = Instant::now();
+        let spare = self
+            .spares
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .pop();
+        let (prepared, kind) = match spare {
+            Some(prepared) => (prepared, StartKind::Warm),
+            None => (self.prepare()?, StartKind::Cold),
+        };
+        axum_prometheus::metrics::histogram!(
+            "yarr_codemode_start_seconds",
+            "start" => kind.as_str()
+        )
+        .record(started.elapsed().as_secs_f64());
+        Ok((prepared, kind))
+    }
+
+    /// Prepare one runtime and park it, unless the pool is already full.
+    /// Blocking; callers run it off the async executor.
+    pub fn refill(&self) -> Result<(), String> {
+        if self.len() >= self.capacity {
+            return Ok(());
+        }
+        let prepared = self.prepare()?;
+        let mut spares = self.spares.lock().unwrap_or_else(PoisonError::into_inner);
+        // Concurrent refills may have raced past the check above; drop extras.
+        if spares.len() < self.capacity {
+            spares.push(prepared);
+        }
+        Ok(())
+    }
+
+    /// Number of warm runtimes currently parked.
+    pub fn len(&self) -> usize {
+        self.spares
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+
+    /// Prepare one runtime, recording its `runtime_init` and `preamble_eval`
+    /// phases.
+    fn prepare(&self) -> Result<Prepared, String> {
+        let _span = tracing::debug_span!("codemode.prepare").entered();
+        let prepared = prepare(&self.preamble, CODEMODE_MEMORY_LIMIT, CODEMODE_STACK_LIMIT)?;
+        let timings = prepared.timings();
+        for (phase, elapsed) in [
+            ("runtime_init", timings.runtime_init),
+            ("preamble_eval", timings.preamble_eval),
+        ] {
+            axum_prometheus::metrics::histogram!("yarr_codemode_phase_seconds", "phase" => phase)
+                .record(elapsed.as_secs_f64());
+        }
+        Ok(prepared)
+    }
+}
+
+#[cfg(test)]
+#[path = "pool_tests.rs"]
+mod tests;
@@ -0,0 +1,102 @@
+use std::time::{Duration, Instant};
+
+use super::{StartKind, WarmPool};
+use crate::codemode::engine::{ArtifactWriter, EmbedCaller, EngineLimits, run_prepared};
+use crate::codemode::{Preamble, ToolCaller};
+
+fn limits() -> EngineLimits {
+    EngineLimits {
+        memory_bytes: 64 * 1024 * 1024,
+        stack_bytes: 512 * 1024,
+        deadline: Instant::now() + Duration::from_secs(5),
+    }
+}
+
+fn no_call() -> ToolCaller {
+    Box::new(|_id, _params| Err("calls disabled in this test".to_string()))
+}
+
+fn no_write() -> ArtifactWriter {
+    Box::new(|_path, _content, _opts| Err("artifacts disabled in this test".to_string()))
+}
+
+fn no_embed() -> EmbedCaller {
+    Box::new(|_query| Ok("{}".to_string()))
+}
+
+#[test]
+fn checkout_is_cold_until_refilled_and_refill_respects_capacity() {
+    let pool = WarmPool::new(Preamble::new(&[]), 2);
+    let (_, kind) = pool.checkout().unwrap();
+    assert_eq!(kind, StartKind::Cold);
+
+    for _ in 0..3 {
+        pool.refill().unwrap();
+    }
+    assert_eq!(pool.len(), 2);
+    let (_, kind) = pool.checkout().unwrap();
+    assert_eq!(kind, StartKind::Warm);
+    assert_eq!(pool.len(), 1);
+}
+
+#[test]
+fn warm_runtimes_do_not_share_script_state() {
+    let pool = WarmPool::new(Preamble::new(&[]), 2);
+    pool.refill().unwrap();
+    pool.refill().unwrap();
+
+    let (first, _) = pool.checkout().unwrap();
+    let out = run_prepared(
+        first,
+        "async () => { globalThis.leaked = 1; console.log('first'); return 1; }",
+        &limits(),
+        no_call(),
+        no_write(),
+        no_embed(),
+        None,
+    )
+    .unwrap();
+    assert_eq!(out.logs, vec!["first".to_string()]);
+
+    let (second, kind) = pool.checkout().unwrap();
+    assert_eq!(kind, StartKind::Warm);
+    let out = run_prepared(
+        second,
+        "async () => typeof globalThis.leaked",
+        &limits(),
+        no_call(),
+        no_write(),
+        no_embed(),
+        None,
+    )
+    .unwrap();
+    assert_eq!(out.result, serde_json::json!("undefined"));
+    assert!(out.logs.is_empty());
+}
+
+#[test]
+fn warm_runtime_binds_snippet_input_per_run() {
+    let pool = WarmPool::new(Preamble::new(&[]), 1);
+    pool.refill().unwrap();
+    let (prepared, _) = pool.checkout().unwrap();
+    let out = run_prepared(
+        prepared,
+        "async () => input.name",
+        &limits(),
+        no_call(),
+        no_write(),
+        no_embed(),
+        Some(r#"{"name":"warm"}"#),
+    )
+    .unwrap();
+    assert_eq!(out.result, serde_json::json!("warm"));
+}
+
+#[test]
+fn prepared_runtimes_report_their_preparation_phases() {
+    let pool = WarmPool::new(Preamble::new(&[]), 1);
+    let (prepared, _) = pool.checkout().unwrap();
+    let timings = prepared.timings();
+    assert!(timings.runtime_init > Duration::ZERO);
+    assert!(timings.preamble_eval > Duration::ZERO);
+}
@@ -9,11 +9,49 @@
 //! so a script never passes a `service` param and never enumerates services. The
 //! raw passthrough client stays under `api.<service>.{get,post,put,delete}`.
 
+use std::sync::{Arc, OnceLock};
+
 use crate::codemode::catalog::service_action_names;
+use crate::codemode::search::SearchIndex;
 use crate::config::ServiceKind;
 
+/// Everything a runtime needs before user code runs: the preamble JS and the
+/// discovery index its `codemode.search`/`describe` helpers call into. Both
+/// depend only on the configured services, so one value is kept per fleet and
+/// shared (cheaply cloned) by every run.
+///
+/// Each part is built on first use and then cached for every clone: a session
+/// that never runs Code Mode never pays for them, and one that only searches
+/// never renders the JS.
+#[derive(Clone)]
+pub struct Preamble {
+    services: Arc<[(String, ServiceKind)]>,
+    js: Arc<OnceLock<String>>,
+    index: Arc<OnceLock<Arc<SearchIndex>>>,
+}
+
+impl Preamble {
+    pub fn new(services: &[(String, ServiceKind)]) -> Self {
+        Self {
+            services: services.into(),
+            js: Arc::default(),
+            index: Arc::default(),
+        }
+    }
+
+    pub fn js(&self) -> &str {
+        self.js.get_or_init(|| build_preamble(&self.services))
+    }
+
+    pub fn index(&self) -> &Arc<SearchIndex> {
+        self.index
+            .get_or_init(|| Arc::new(SearchIndex::new(&self.services)))
+    }
+}
+
 /// The fixed JS runtime injected before user code: capture-aware `console`, the
-/// `callTool` bridge over the native emit, and the `__yarrRun` driver.
+/// promise-returning `callTool` bridge over the native emit (settled by the
+/// engine through `__yarrSettle`), and the `__yarrRun` driver.
 const RUNTIME_JS: &str = r#"
 globalThis.__yarrLogs = [];
 const __yarrFmt = (args) => args.map((a) => {
@@ -27,6 +65,8 @@ globalThis.console = {
     error: (...a) => { globalThis.__yarrLogs.push("ERROR " + __yarrFmt(a)); },
     debug: (...a) => { globalThis.__yarrLogs.push(__yarrFmt(a)); },
 };
+const __yarrPending = new Map();
+let __yarrTicket = 0;
 globalThis.callTool = (id, params = {}) => {
     if (typeof id !== "string" || id.trim() === "") {
         throw new TypeError("callTool(id, params): id must be a non-empty string");
@@ -34,7 +74,19 @@ globalThis.callTool = (id, params = {}) => {
     if (params === null || typeof params !== "object" || Array.isArray(params)) {
         throw new TypeError("callTool(id, params): params must be a JSON object");
     }
-    return JSON.parse(__yarrEmitToolCall(id, JSON.stringify(params)));
+    const ticket = ++__yarrTicket;
+    // Submit first: if the bridge throws, no pending entry is left behind. The
+    // completion can only be settled after this job finishes, so registering
+    // the resolvers afterwards never misses it.
+    __yarrEmitToolCall(ticket, id, JSON.stringify(params));
+    return new Promise((resolve, reject) => { __yarrPending.set(ticket, { resolve, reject }); });
+};
+globalThis.__yarrSettle = (ticket, ok, payload) => {
+    const pending = __yarrPending.get(ticket);
+    if (pending === undefined) return;
+    __yarrPending.delete(ticket);
+    if (!ok) { pending.reject(new Error(payload)); return; }
+    try { pending.resolve(JSON.parse(payload)); } catch (e) { pending.reject(e); }
 };
 globalThis.writeArtifact = (path, content, options = {}) => {
     if (typeof path !== "string" || path.trim() === "") {
@@ -48,8 +100,13 @@ globalThis.writeArtifact = (path, content, options = {}) => {
     }
     return JSON.parse(__yarrEmitWriteArtifact(path, content, JSON.stringify(options)));
 };
-globalThis.input = (typeof globalThis.__yarrInputJson === "string")
-    ? JSON.parse(globalThis.__yarrInputJson) : null;
+// Re-run by the engine once `__yarrInputJson` is bound, so a preamble that was
+// evaluated ahead of time (warm pool) still sees this run's snippet input.
+globalThis.__yarrBindInput = () => {
+    globalThis.input = (typeof globalThis.__yarrInputJson === "string")
+        ? JSON.parse(globalThis.__yarrInputJson) : null;
+};
+globalThis.__yarrBindInput();
 globalThis.__yarrDone = false;
 globalThis.__yarrError = false;
 globalThis.__yarrResult = "null";
@@ -86,16 +143,9 @@ pub fn build_preamble(services: &[(String, ServiceKind)]) -> String {
     out.push_str(&render_service_namespaces(services));
     let service_names: Vec<String> = services.iter().map(|(name, _)| name.clone()).collect();
     out.push_str(&render_api_namespace(&service_names));
-    // Discovery: inject the per-service ACTION catalog + the per-service TYPE
-    // catalog (response-shape TS interfaces), then the pure-JS search/describe
-    // helpers. Types are surfaced ON DEMAND — only what the agent describes is
-    // returned to it — so the full type surface is never dumped into its context.
-    out.push_str("globalThis.__codemodeCatalog = ");
-    out.push_str(&super::catalog::catalog_json(services));
-    out.push_str(";\n");
-    out.push_str("globalThis.__codemodeTypes = ");
-    out.push_str(&super::dts::type_catalog_json_for(services));
-    out.push_str(";\n");
+    // Discovery: thin wrappers over the host-side index (see `Preamble`). Types
+    // are surfaced ON DEMAND — only what the agent describes is returned to it —
+    // so the full type surface is never dumped into its context.
     out.push_str(DISCOVERY_JS);
     out
 }
@@ -138,8 +188,9 @@ fn render_service_namespaces(services: &[(String, ServiceKind)]) -> String {
             for op in crate::openapi::operations_for_kind(*kind) {
                 let op_name = op.name;
                 out.push_str(&format!(
-                    "  [{op_name:?}]: (params) => callTool(\"op\", \
-                     {{ service: {name:?}, op: {op_name:?}, args: params || {{}} }}),\n"
+                    "  [{op_name:?}]: (params, opts) => callTool(\"op\", \
+                     {{ service: {name:?}, op: {op_name:?}, args: params || {{}}, \
+                     fields: opts && opts.fields, all_pages: opts && opts.allPages }}),\n"
                 ));
             }
         } else {
@@ -155,75 +206,29 @@ fn render_service_namespaces(services: &[(String, ServiceKind)]) -> String {
     out
 }
 
-/// Pure-JS `codemode.search`/`codemode.describe` over the injected callable +
-/// type catalogs. Catalog entries are keyed by `path` — the exact fully-qualified
-/// callable (`sonarr.list`) — so search returns something the script can call
-/// directly. `describe` resolves either a callable `path` or a `service.TypeName`
-/// response type (returning its TS interface).
+/// `codemode.search`/`codemode.describe` over the host-side [`SearchIndex`]
+/// (natives `__yarrSearch`/`__yarrDescribe`, installed when the runtime is
+/// prepared). Callables are keyed by `path` — the exact fully-qualified callable
+/// (`sonarr.list`) — so search returns something the script can call directly.
+/// `describe` resolves either a callable `path` or a `service.TypeName` response
+/// type (returning its TS interface).
 ///
-/// `codemode.search` is otherwise pure JS (no host round-trip) except for one
-/// call to `__yarrEmbedQuery` — the semantic-scoring bridge (see
-/// `codemode::semantic`) — whose result is blended into the lexical score below.
-/// That bridge fails open to `"{}"` (empty scores) whenever semantic search is
-/// disabled, cooling down after a TEI failure, or the query is empty, so this
-/// blend is always safe to attempt unconditionally: worst case it's a no-op, not
-/// an error. Only callables get the semantic blend, not response types — the
-/// catalog embedded against is the callable catalog, and "find me the tool for
-/// X" is the query shape semantic search exists for.
+/// The query is first sent to `__yarrEmbedQuery` — the semantic-scoring bridge
+/// (see `codemode::semantic`) — and its `{path: similarity}` scores are handed to
+/// the index, which blends them into the lexical score of callables. That bridge
+/// fails open to `"{}"` (empty scores) whenever semantic search is disabled,
+/// cooling down after a TEI failure, or the query is empty, so the blend is
+/// always safe to attempt: worst case it's a no-op, not an error.
 const DISCOVERY_JS: &str = r#"
 globalThis.codemode = globalThis.codemode || {};
 globalThis.codemode.search = (query, limit) => {
     const rawQuery = String(query == null ? "" : query).trim();
-    const q = rawQuery.toLowerCase();
     const lim = (typeof limit === "number" && limit > 0) ? limit : 20;
-    const toks = q.split(/\s+/).filter(Boolean);
-    // A cosine similarity of ~0.7-0.9 (a strong semantic match) contributes
-    // ~14-18 points here — enough for a query with ZERO lexical token overlap
-    // (e.g. a synonym) to still clear the `score > 0` results filter below, but
-    // still ranked under a true exact/substring path match (score 50-100) or a
-    // couple of solid lexical token hits (+5 each). Semantic search is a net
-    // under lexical matching, not a replacement for it.
-    const SEMANTIC_WEIGHT = 20;
-    const semanticScores = q === "" ? {} : JSON.parse(__yarrEmbedQuery(rawQuery));
-    const callHits = globalThis.__codemodeCatalog.map((e) => {
-        const hay = (e.path + " " + e.method + " " + (e.description || "") + " " + (e.capability || "")).toLowerCase();
-        let score = 0;
-        if (e.path.toLowerCase() === q || e.method.toLowerCase() === q) score += 100;
-        else if (e.path.toLowerCase().indexOf(q) !== -1) score += 50;
-        for (const tok of toks) { if (hay.indexOf(tok) !== -1) score += 5; }
-        const semantic = semanticScores[e.path];
-        if (typeof semantic === "number" && semantic > 0) score += semantic * SEMANTIC_WEIGHT;
-        return { e: { path: e.path, service: e.service, method: e.method, kind: e.kind, scope: e.scope, destructive: e.destructive, description: e.description }, score: score };
-    });
-    const typeHits = globalThis.__codemodeTypes.map((t) => {
-        const hay = (t.name + " " + t.type_name).toLowerCase();
-        let score = 0;
-        if (t.name.toLowerCase() === q || t.type_name.toLowerCase() === q) score += 100;
-        else if (hay.indexOf(q) !== -1) score += 40;
-        for (const tok of toks) { if (hay.indexOf(tok) !== -1) score += 4; }
-        return { e: { path: t.name, kind: "type", service: t.service }, score: score };
-    });
-    const scored = callHits.concat(typeHits).filter((x) => q === "" || x.score > 0);
-    scored.sort((a, b) => b.score - a.score || a.e.path.localeCompare(b.e.path));
-    const results = scored.slice(0, lim).map((x) => x.e);
-    return { total: results.length, results: results };
-};
-globalThis.codemode.describe = (name) => {
-    // A callable, by its fully-qualified path (e.g. "radarr.add")?
-    const call = globalThis.__codemodeCatalog.find((e) => e.path === name);
-    if (call) {
-        const sig = call.path + "(" + (call.required_params || []).join(", ") + ")";
-        return Object.assign({}, call, { signature: sig });
-    }
-    // A response type, by "service.TypeName" or an unambiguous bare "TypeName".
-    let type = globalThis.__codemodeTypes.find((t) => t.name === name);
-    if (!type) {
-        const bare = globalThis.__codemodeTypes.filter((t) => t.type_name === name);
-        if (bare.length === 1) type = bare[0];
-    }
-    if (type) return { name: type.name, kind: "type", service: type.service, dts: type.dts };
-    return null;
+    const semanticScores = rawQuery === "" ? "{}" : __yarrEmbedQuery(rawQuery);
+    return JSON.parse(__yarrSearch(rawQuery, lim, semanticScores));
 };
+globalThis.codemode.describe = (name) =>
+    (typeof name === "string") ? JSON.parse(__yarrDescribe(name)) : null;
 globalThis.codemode.snippets = () => callTool("snippet_list", {});
 globalThis.codemode.run = (name, input) =>
     callTool("snippet_run", { name: name, input: (input === undefined ? null : input) });
@@ -232,6 +237,9 @@ globalThis.codemode.run = (name, input) =>
 /// Render the `api.<service>` client: per configured service, `get/post/put/delete`
 /// helpers that are thin sugar over the generic `api_*` passthrough actions
 /// (`api.sonarr.get("/series")` → `callTool("api_get", {service:"sonarr", path})`).
+/// `get` and the generated op callables take an optional `{ fields }` second
+/// argument that projects the response while it is parsed; op callables also
+/// accept `{ allPages: true }` to read a paged list to the end.
 /// `delete` resolves to `api_delete`. MCP executions reauthorize the inner call
 /// and require elicitation; direct trusted CLI executions have no peer channel.
 fn render_api_namespace(service_names: &[String]) -> String {
@@ -242,7 +250,7 @@ fn render_api_namespace(service_names: &[String]) -> String {
         // JSON object, so the server-side body default applies).
         out.push_str(&format!(
             "globalThis.api[{name:?}] = {{\n  \
-               get: (path) => callTool(\"api_get\", {{ service: {name:?}, path: path }}),\n  \
+               get: (path, opts) => callTool(\"api_get\", {{ service: {name:?}, path: path, fields: opts && opts.fields }}),\n  \
                post: (path, body) => callTool(\"api_post\", {{ service: {name:?}, path: path, body: body }}),\n  \
                put: (path, body) => callTool(\"api_put\", {{ service: {name:?}, path: path, body: body }}),\n  \
                delete: (path, body) => callTool(\"api_delete\", {{ service: {name:?}, path: path, body: body }}),\n\
@@ -30,8 +30,9 @@ fn per_service_namespaces_bake_in_the_service() {
     // Spec-backed kinds dispatch each generated operation through the `op` action,
     // with the service + op baked in (never passed by the script).
     assert!(pre.contains(r#"["service_status"]: (params) => callTool("service_status""#));
-    assert!(pre.contains(r#"["get_series"]: (params) => callTool("op""#));
+    assert!(pre.contains(r#"["get_series"]: (params, opts) => callTool("op""#));
     assert!(pre.contains(r#"op: "get_series""#));
+    assert!(pre.contains("all_pages: opts && opts.allPages"));
     assert!(pre.contains(r#"service: "sonarr""#));
     assert!(pre.contains(r#"service: "radarr""#));
 }
@@ -73,18 +74,16 @@ fn api_namespace_empty_when_no_services() {
 }
 
 #[test]
-fn preamble_injects_discovery_catalog_and_helpers() {
+fn preamble_wires_discovery_helpers_to_the_host_index() {
     let pre = build_preamble(&services());
-    assert!(pre.contains("globalThis.__codemodeCatalog = ["));
     assert!(pre.contains("globalThis.codemode.search ="));
     assert!(pre.contains("globalThis.codemode.describe ="));
-    // The catalog embeds fully-qualified generated callable paths + a destructive
-    // flag (DELETE ops).
-    assert!(pre.contains(r#""path":"sonarr.get_series""#));
-    assert!(pre.contains("\"destructive\":true"));
-    // The type catalog is injected so describe/search can surface response types.
-    assert!(pre.contains("globalThis.__codemodeTypes = ["));
-    assert!(pre.contains("sonarr.SeriesResource"));
+    assert!(pre.contains("__yarrSearch(rawQuery, lim, semanticScores)"));
+    assert!(pre.contains("__yarrDescribe(name)"));
+    // The catalogs stay host-side: nothing is serialized into the preamble.
+    assert!(!pre.contains("__codemodeCatalog"));
+    assert!(!pre.contains("__codemodeTypes"));
+    assert!(!pre.contains("sonarr.SeriesResource"));
 }
 
 #[test]
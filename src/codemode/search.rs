@@ -0,0 +1,369 @@
+//! Host-side index behind `codemode.search` / `codemode.describe`.
+//!
+//! The callable catalog ([`super::catalog`]) and the response-type catalog
+//! ([`super::dts`]) are indexed once per configured fleet. Every lowercased
+//! haystack is split into its 1-, 2- and 3-character grams, each mapped to the
+//! sorted list of entries containing it, so a query only scores the entries
+//! that can actually match a term instead of scanning the whole catalog in the
+//! interpreter. Path and type-name lookups for `describe` are plain hash maps.
+//!
+//! Ranking is unchanged from the original in-sandbox implementation:
+//!
+//!   * callables: +100 when the path or method equals the query, otherwise +50
+//!     when the path contains it; +5 per query token found anywhere in
+//!     `path method description capability`; plus the semantic similarity × 20;
+//!   * types: +100 when the qualified or bare name equals the query, otherwise
+//!     +40 when `name type_name` contains it; +4 per token;
+//!   * entries scoring 0 are dropped (unless the query is empty, which lists
+//!     everything), then results are ordered by score, descending, and path.
+
+use std::cmp::Ordering;
+use std::collections::hash_map::Entry;
+use std::collections::{BinaryHeap, HashMap};
+use std::sync::Arc;
+
+use serde_json::{Map, Value, json};
+
+use super::catalog::{CatalogEntry, build_catalog};
+use super::dts::type_entries_for;
+use crate::config::ServiceKind;
+
+/// Longest gram stored in the index; longer terms intersect their trigrams.
+const GRAM: usize = 3;
+
+/// How many points a full-strength semantic match adds to a callable. A cosine
+/// similarity of ~0.7-0.9 contributes ~14-18: enough for a synonym with zero
+/// lexical overlap to clear the `score > 0` filter, but still ranked under a
+/// real path match (50-100) or a couple of token hits (+5 each).
+const SEMANTIC_WEIGHT: f64 = 20.0;
+
+pub struct SearchIndex {
+    catalog: Arc<[CatalogEntry]>,
+    docs: Vec<Doc>,
+    grams: HashMap<Box<str>, Vec<u32>>,
+    callables: HashMap<String, u32>,
+    types: HashMap<String, u32>,
+    /// Bare type name to its entry; `None` when several services share it.
+    bare_types: HashMap<String, Option<u32>>,
+}
+
+struct Doc {
+    /// Sort key: the callable path or the qualified type name.
+    path: String,
+    names: Names,
+    /// Lowercased text the tokens (and, for types, the whole query) match in.
+    hay: String,
+    /// The row `search` returns.
+    hit: Value,
+    /// The payload `describe` returns.
+    detail: Value,
+}
+
+/// Lowercased names checked for an exact match of the whole query.
+enum Names {
+    Callable { path: String, method: String },
+    Type { name: String, type_name: String },
+}
+
+impl SearchIndex {
+    /// Index the catalogs for the configured `(name, kind)` services.
+    pub fn new(services: &[(String, ServiceKind)]) -> Self {
+        let catalog: Arc<[CatalogEntry]> = build_catalog(services).into();
+        let mut index = Self {
+            catalog: Arc::clone(&catalog),
+            docs: Vec::new(),
+            grams: HashMap::new(),
+            callables: HashMap::new(),
+            types: HashMap::new(),
+            bare_types: HashMap::new(),
+        };
+        for entry in catalog.iter() {
+            let id = index.docs.len() as u32;
+            index.callables.entry(entry.path().to_owned()).or_insert(id);
+            index.push(callable_doc(entry));
+        }
+        for entry in type_entries_for(services) {
+            let id = index.docs.len() as u32;
+            index.types.entry(entry.name.clone()).or_insert(id);
+            match index.bare_types.entry(entry.type_name.clone()) {
+                Entry::Occupied(mut bare) => *bare.get_mut() = None,
+                Entry::Vacant(bare) => {
+                    bare.insert(Some(id));
+                }
+            }
+            let hay = format!("{} {}", entry.name, entry.type_name).to_lowercase();
+            index.push(Doc {
+                path: entry.name.clone(),
+                names: Names::Type {
+                    name: entry.name.to_lowercase(),
+                    type_name: entry.type_name.to_lowercase(),
+                },
+                hay,
+                hit: json!({ "path": entry.name, "kind": "type", "service": entry.service }),
+                detail: json!({
+                    "name": entry.name,
+                    "kind": "type",
+                    "service": entry.service,
+                    "dts": entry.dts,
+                }),
+            });
+        }
+        index
+    }
+
+    /// The callable catalog the index was built from (also what semantic
+    /// search embeds).
+    pub fn catalog(&self) -> Arc<[CatalogEntry]> {
+        Arc::clone(&self.catalog)
+    }
+
+    /// Rank entries against `query` and return `{ total, results }` holding at
+    /// most `limit` rows. `semantic` maps callable paths to a similarity, as
+    /// produced by [`semantic_scores`](super::semantic_scores).
+    pub fn search(&self, query: &str, limit: usize, semantic: &Map<String, Value>) -> Value {
+        let query = Query::new(query);
+        let hits = if query.text.is_empty() {
+            self.rank(&query, 0..self.docs.len() as u32, semantic, limit)
+        } else {
+            self.rank(&query, self.candidates(&query, semantic), semantic, limit)
+        };
+        json!({ "total": hits.len(), "results": hits })
+    }
+
+    /// A callable by its exact path, else a type by its qualified name or an
+    /// unambiguous bare name; `null` when nothing matches.
+    pub fn describe(&self, name: &str) -> Value {
+        let id = self
+            .callables
+            .get(name)
+            .or_else(|| self.types.get(name))
+            .or_else(|| self.bare_types.get(name).and_then(Option::as_ref));
+        id.map_or(Value::Null, |id| self.docs[*id as usize].detail.clone())
+    }
+
+    fn push(&mut self, doc: Doc) {
+        let id = self.docs.len() as u32;
+        let bounds: Vec<usize> = doc
+            .hay
+            .char_indices()
+            .map(|(at, _)| at)
+            .chain(std::iter::once(doc.hay.len()))
+            .collect();
+        for len in 1..=GRAM {
+            for window in bounds.windows(len + 1) {
+                let gram = &doc.hay[window[0]..window[len]];
+                // Docs are pushed in id order, so a repeat is always the tail.
+                if let Some(postings) = self.grams.get_mut(gram) {
+                    if postings.last() != Some(&id) {
+                        postings.push(id);
+                    }
+                } else {
+                    self.grams.insert(gram.into(), vec![id]);
+                }
+            }
+        }
+        self.docs.push(doc);
+    }
+
+    /// Every entry that can score above zero: those whose haystack contains the
+    /// whole query or one of its tokens, plus any callable with a semantic
+    /// score. A superset is fine; [`score`](Self::score) has the final say.
+    fn candidates(&self, query: &Query, semantic: &Map<String, Value>) -> Vec<u32> {
+        let mut seen = vec![false; self.docs.len()];
+        let terms =
+            std::iter::once(query.text.as_str()).chain(query.tokens.iter().map(String::as_str));
+        for term in terms {
+            for id in self.containing(term) {
+                seen[id as usize] = true;
+            }
+        }
+        for path in semantic.keys() {
+            if let Some(id) = self.callables.get(path) {
+                seen[*id as usize] = true;
+            }
+        }
+        (0..self.docs.len() as u32)
+            .filter(|id| seen[*id as usize])
+            .collect()
+    }
+
+    /// Entries whose haystack may contain `term`: exact for short terms, the
+    /// intersection of its trigram postings otherwise.
+    fn containing(&self, term: &str) -> Vec<u32> {
+        let bounds: Vec<usize> = term
+            .char_indices()
+            .map(|(at, _)| at)
+            .chain(std::iter::once(term.len()))
+            .collect();
+        if bounds.len() <= GRAM + 1 {
+            return self.grams.get(term).cloned().unwrap_or_default();
+        }
+        let mut lists = Vec::with_capacity(bounds.len() - GRAM);
+        for window in bounds.windows(GRAM + 1) {
+            match self.grams.get(&term[window[0]..window[GRAM]]) {
+                Some(postings) => lists.push(postings),
+                None => return Vec::new(),
+            }
+        }
+        lists.sort_by_key(|postings| postings.len());
+        let mut out = lists[0].clone();
+        for postings in &lists[1..] {
+            out.retain(|id| postings.binary_search(id).is_ok());
+        }
+        out
+    }
+
+    fn score(&self, doc: &Doc, query: &Query, semantic: &Map<String, Value>) -> f64 {
+        let q = query.text.as_str();
+        let (mut score, per_token) = match &doc.names {
+            Names::Callable { path, method } if path == q || method == q => (100.0, 5.0),
+            Names::Callable { path, .. } if path.contains(q) => (50.0, 5.0),
+            Names::Callable { .. } => (0.0, 5.0),
+            Names::Type { name, type_name } if name == q || type_name == q => (100.0, 4.0),
+            Names::Type { .. } if doc.hay.contains(q) => (40.0, 4.0),
+            Names::Type { .. } => (0.0, 4.0),
+        };
+        let matched = query
+            .tokens
+            .iter()
+            .filter(|token| doc.hay.contains(token.as_str()))
+            .count();
+        score += per_token * matched as f64;
+        if let Names::Callable { .. } = doc.names
+            && let Some(similarity) = semantic.get(&doc.path).and_then(Value::as_f64)
+            && similarity > 0.0
+        {
+            score += similarity * SEMANTIC_WEIGHT;
+        }
+        score
+    }
+
+    /// Score `ids` and keep the best `limit` in a bounded heap.
+    fn rank(
+        &self,
+        query: &Query,
+        ids: impl IntoIterator<Item = u32>,
+        semantic: &Map<String, Value>,
+        limit: usize,
+    ) -> Vec<Value> {
+        let mut best: BinaryHeap<Ranked<'_>> = BinaryHeap::new();
+        for id in ids {
+            let doc = &self.docs[id as usize];
+            let score = self.score(doc, query, semantic);
+            if score <= 0.0 && !query.text.is_empty() {
+                continue;
+            }
+            best.push(Ranked {
+                score,
+                path: &doc.path,
+                id,
+            });
+            if best.len() > limit {
+                best.pop();
+            }
+        }
+        best.into_sorted_vec()
+            .into_iter()
+            .map(|ranked| self.docs[ranked.id as usize].hit.clone())
+            .collect()
+    }
+}
+
+/// A normalized query: trimmed and lowercased, plus its whitespace tokens.
+struct Query {
+    text: String,
+    tokens: Vec<String>,
+}
+
+impl Query {
+    fn new(raw: &str) -> Self {
+        let text = raw.trim().to_lowercase();
+        let tokens = text.split_whitespace().map(str::to_owned).collect();
+        Self { text, tokens }
+    }
+}
+
+/// Heap entry ordered so that the *worst* ranked hit is the greatest: higher
+/// scores first, then paths ascending, then catalog order.
+struct Ranked<'a> {
+    score: f64,
+    path: &'a str,
+    id: u32,
+}
+
+impl Ord for Ranked<'_> {
+    fn cmp(&self, other: &Self) -> Ordering {
+        other
+            .score
+            .total_cmp(&self.score)
+            .then_with(|| self.path.cmp(other.path))
+            .then_with(|| self.id.cmp(&other.id))
+    }
+}
+
+impl PartialOrd for Ranked<'_> {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl PartialEq for Ranked<'_> {
+    fn eq(&self, other: &Self) -> bool {
+        self.cmp(other) == Ordering::Equal
+    }
+}
+
+impl Eq for Ranked<'_> {}
+
+/// Index row for one callable, built from its serialized form so the search
+/// row and `describe` payload match what scripts saw before.
+fn callable_doc(entry: &CatalogEntry) -> Doc {
+    let full = serde_json::to_value(entry).unwrap_or(Value::Null);
+    let text = |key: &str| full.get(key).and_then(Value::as_str).unwrap_or("");
+    let hay = format!(
+        "{} {} {} {}",
+        entry.path(),
+        text("method"),
+        entry.description(),
+        text("capability")
+    )
+    .to_lowercase();
+    let mut hit = Map::new();
+    for key in [
+        "path",
+        "service",
+        "method",
+        "kind",
+        "scope",
+        "destructive",
+        "description",
+    ] {
+        if let Some(value) = full.get(key) {
+            hit.insert(key.to_owned(), value.clone());
+        }
+    }
+    let required: Vec<&str> = full
+        .get("required_params")
+        .and_then(Value::as_array)
+        .map(|params| params.iter().filter_map(Value::as_str).collect())
+        .unwrap_or_default();
+    let mut detail = full.as_object().cloned().unwrap_or_default();
+    detail.insert(
+        "signature".to_owned(),
+        Value::String(format!("{}({})", entry.path(), required.join(", "))),
+    );
+    Doc {
+        path: entry.path().to_owned(),
+        names: Names::Callable {
+            path: entry.path().to_lowercase(),
+            method: text("method").to_lowercase(),
+        },
+        hay,
+        hit: Value::Object(hit),
+        detail: Value::Object(detail),
+    }
+}
+
+#[cfg(test)]
+#[path = "search_tests.rs"]
+mod tests;
@@ -0,0 +1,113 @@
+use serde_json::{Map, Value, json};
+
+use super::*;
+
+fn services() -> Vec<(String, ServiceKind)> {
+    vec![
+        ("sonarr".to_string(), ServiceKind::Sonarr),
+        ("radarr".to_string(), ServiceKind::Radarr),
+        ("plex".to_string(), ServiceKind::Plex),
+        ("tautulli".to_string(), ServiceKind::Tautulli),
+    ]
+}
+
+fn paths(results: &Value) -> Vec<&str> {
+    results["results"]
+        .as_array()
+        .unwrap()
+        .iter()
+        .map(|hit| hit["path"].as_str().unwrap())
+        .collect()
+}
+
+#[test]
+fn indexed_search_matches_a_full_scan() {
+    let index = SearchIndex::new(&services());
+    let none = Map::new();
+    for raw in [
+        "series",
+        "SERIES",
+        "get_series",
+        "sonarr.get_series",
+        "queue delete",
+        "qu",
+        "q",
+        "resource",
+        "api.<service>.get",
+        "history   play",
+        "xyzzy",
+        "\u{e9}",
+    ] {
+        let query = Query::new(raw);
+        let all = index.rank(&query, 0..index.docs.len() as u32, &none, usize::MAX);
+        let indexed = index.search(raw, usize::MAX, &none);
+        assert_eq!(indexed["results"], Value::Array(all), "query {raw:?}");
+    }
+}
+
+#[test]
+fn exact_path_ranks_first_and_rows_keep_their_shape() {
+    let index = SearchIndex::new(&services());
+    let results = index.search("sonarr.get_series", 5, &Map::new());
+    assert_eq!(paths(&results)[0], "sonarr.get_series");
+    let top = &results["results"][0];
+    assert_eq!(top["service"], "sonarr");
+    assert_eq!(top["kind"], "operation");
+    assert!(top.get("scope").is_some() && top.get("destructive").is_some());
+    assert!(top.get("required_params").is_none());
+    assert_eq!(results["total"], json!(5));
+}
+
+#[test]
+fn empty_query_lists_callables_before_types_by_path() {
+    let index = SearchIndex::new(&services());
+    let results = index.search("", usize::MAX, &Map::new());
+    assert_eq!(results["total"], json!(index.docs.len()));
+    let kinds: Vec<bool> = results["results"]
+        .as_array()
+        .unwrap()
+        .iter()
+        .map(|hit| hit["kind"] == "type")
+        .collect();
+    let first_type = kinds.iter().position(|is_type| *is_type).unwrap();
+    assert!(kinds[first_type..].iter().all(|is_type| *is_type));
+    let callables = &paths(&results)[..first_type];
+    assert!(callables.windows(2).all(|pair| pair[0] <= pair[1]));
+}
+
+#[test]
+fn semantic_scores_reach_callables_with_no_lexical_overlap() {
+    let index = SearchIndex::new(&services());
+    let mut semantic = Map::new();
+    semantic.insert("plex.service_status".into(), json!(0.9));
+    semantic.insert("tautulli.ActivityEnvelope".into(), json!(0.9));
+    let results = index.search("xyzzy plugh", 20, &semantic);
+    assert_eq!(paths(&results), vec!["plex.service_status"]);
+}
+
+#[test]
+fn describe_resolves_callables_and_types() {
+    let index = SearchIndex::new(&services());
+    let call = index.describe("sonarr.get_series");
+    assert_eq!(call["kind"], "operation");
+    assert!(
+        call["signature"]
+            .as_str()
+            .unwrap()
+            .starts_with("sonarr.get_series(")
+    );
+
+    let qualified = index.describe("sonarr.SeriesResource");
+    assert_eq!(qualified["kind"], "type");
+    assert!(
+        qualified["dts"]
+            .as_str()
+            .unwrap()
+            .contains("SeriesResource")
+    );
+    assert_eq!(index.describe("SeriesResource"), qualified);
+
+    // Both arrs define it, so the bare name is ambiguous.
+    assert_eq!(index.describe("QualityProfileResource"), Value::Null);
+    assert_eq!(index.describe("nope_not_real"), Value::Null);
+}
@@ -1,12 +1,12 @@
 //! Semantic search blend for `codemode.search()`.
 //!
-//! Lexical substring matching (`codemode.search`'s JS body, in
-//! [`super::proxy`]) misses synonym queries entirely — a query like "roster of
-//! saved queues" shares no tokens with the catalog entry it should match, so it
+//! Lexical substring matching (the index in [`super::search`]) misses synonym
+//! queries entirely — a query like "roster of saved queues" shares no tokens
+//! with the catalog entry it should match, so it
 //! either returns nothing or, worse, a false-positive hit from a short token
 //! (like "of") landing inside an unrelated word. This module supplies an
 //! optional per-path similarity score, computed by embedding the query and the
-//! catalog against a TEI (Text Embeddings Inference) server, that the JS side
+//! catalog against a TEI (Text Embeddings Inference) server, that the index
 //! blends into its existing lexical score.
 //!
 //! Design constraints (all load-bearing, not incidental):
@@ -18,24 +18,34 @@
 //!   script's `codemode.search()` call.
 //! - **Disabled by default.** With `YARR_CODEMODE_TEI_URL` unset, no network
 //!   call is ever attempted — see [`tei_url`].
-//! - **Computed lazily, cached in memory, never at build time.** The catalog
-//!   embeddings are computed from the *live* catalog on first use and cached for
-//!   the process's lifetime, so they can never drift from what's actually being
-//!   served (a build-time-baked cache could go stale if the catalog changes
-//!   without someone remembering to regenerate it).
+//! - **Computed lazily, never at build time.** The catalog embeddings are
+//!   computed from the *live* catalog on first use and cached for the process's
+//!   lifetime, so they can never drift from what's actually being served (a
+//!   build-time-baked cache could go stale if the catalog changes without
+//!   someone remembering to regenerate it). With a data dir, they are also
+//!   persisted under [`CODEMODE_EMBEDDINGS_SUBDIR`](super::CODEMODE_EMBEDDINGS_SUBDIR)
+//!   in a file named by a hash of the catalog text and the TEI model, so a fresh
+//!   `yarr mcp` stdio session reuses them instead of re-embedding the catalog,
+//!   and any catalog or model change simply misses and rebuilds.
+//! - **Recent queries are remembered.** Scripts often repeat a search; the last
+//!   [`QUERY_CACHE_ENTRIES`] query embeddings are kept in an LRU so a repeat
+//!   costs one pass of the similarity kernel and no TEI round-trip.
 //! - **Bounded retry, not give-up-once.** A TEI failure starts a cooldown
 //!   ([`COOLDOWN`]); calls during the cooldown skip the network entirely and
 //!   return an empty map immediately. Once the cooldown elapses, the next call
 //!   retries — so a TEI restart is picked up automatically, no yarr restart
 //!   required, while a flapping/down TEI can't be hammered every search call.
 
-use std::collections::HashMap;
+use std::collections::{BTreeMap, HashMap};
+use std::path::{Path, PathBuf};
 use std::sync::{Arc, Mutex};
 use std::time::{Duration, Instant};
 
 use super::catalog::CatalogEntry;
 
-type CatalogVectors = Arc<[(String, Vec<f32>)]>;
+mod matrix;
+
+use matrix::{VectorMatrix, top_k};
 
 /// How long a TEI failure suppresses further attempts. Long enough that a
 /// flapping/restarting TEI container isn't hammered on every `codemode.search`
@@ -46,6 +56,21 @@ const COOLDOWN: Duration = Duration::from_secs(30);
 /// HTTP timeout for a single `/embed` call (catalog batch or query).
 const EMBED_TIMEOUT: Duration = Duration::from_secs(5);
 
+/// Inputs per catalog `/embed` request — TEI's default
+/// `--max-client-batch-size`, so a large fleet's catalog is never rejected.
+const EMBED_BATCH: usize = 32;
+
+/// Query embeddings kept for repeat searches.
+const QUERY_CACHE_ENTRIES: usize = 128;
+
+/// Most callables a single query returns scores for. Far above any search
+/// `limit`; only the long tail of weak matches is dropped.
+const TOP_K: usize = 256;
+
+/// Persisted catalog matrices kept per store dir (newest first), so a few
+/// configurations can alternate without rebuilding each other's vectors.
+const STORED_CATALOGS: usize = 8;
+
 /// `YARR_CODEMODE_TEI_URL` — base URL of a TEI (Text Embeddings Inference)
 /// server, e.g. `http://localhost:52000`. Unset (the default) disables semantic
 /// search entirely: [`semantic_scores`] short-circuits before any network call.
@@ -70,14 +95,58 @@ pub struct SemanticCache {
     /// held across network I/O; concurrent cold callers wait here and re-check
     /// the cache after the winner completes.
     initialize: tokio::sync::Mutex<()>,
+    /// Where catalog matrices persist across processes; `None` keeps them in
+    /// memory only.
+    store_dir: Option<PathBuf>,
+}
+
+/// The embedded catalog: callable paths in catalog order, one matrix row each.
+struct CatalogVectors {
+    paths: Vec<String>,
+    matrix: VectorMatrix,
 }
 
 #[derive(Default)]
 struct CacheState {
-    /// `(path, vector)` pairs for the catalog, once successfully embedded.
-    catalog_vectors: Option<CatalogVectors>,
+    /// The catalog's vectors, once successfully embedded or loaded.
+    catalog_vectors: Option<Arc<CatalogVectors>>,
     /// Set on any TEI failure; cleared once it elapses.
     cooldown_until: Option<Instant>,
+    queries: QueryCache,
+}
+
+/// LRU of normalized query embeddings, keyed by the exact query text.
+#[derive(Default)]
+struct QueryCache {
+    entries: HashMap<String, (Arc<[f32]>, u64)>,
+    /// Recency order: oldest tick first.
+    lru: BTreeMap<u64, String>,
+    tick: u64,
+}
+
+impl QueryCache {
+    fn get(&mut self, query: &str) -> Option<Arc<[f32]>> {
+        self.tick += 1;
+        let (vector, tick) = self.entries.get_mut(query)?;
+        self.lru.remove(tick);
+        *tick = self.tick;
+        self.lru.insert(self.tick, query.to_owned());
+        Some(Arc::clone(vector))
+    }
+
+    fn insert(&mut self, query: &str, vector: Arc<[f32]>) {
+        self.tick += 1;
+        if let Some((_, old)) = self.entries.insert(query.to_owned(), (vector, self.tick)) {
+            self.lru.remove(&old);
+        }
+        self.lru.insert(self.tick, query.to_owned());
+        while self.entries.len() > QUERY_CACHE_ENTRIES {
+            let Some((_, oldest)) = self.lru.pop_first() else {
+                break;
+            };
+            self.entries.remove(&oldest);
+        }
+    }
 }
 
 impl SemanticCache {
@@ -93,41 +162,38 @@ impl SemanticCache {
                 .unwrap_or_else(|_| reqwest::Client::new()),
             state: Mutex::new(CacheState::default()),
             initialize: tokio::sync::Mutex::new(()),
+            store_dir: None,
         }
     }
 
-    fn in_cooldown(&self) -> bool {
-        let state = self
-            .state
+    /// Persist catalog matrices under `dir` and reuse them across processes.
+    pub fn with_store_dir(mut self, dir: PathBuf) -> Self {
+        self.store_dir = Some(dir);
+        self
+    }
+
+    fn lock(&self) -> std::sync::MutexGuard<'_, CacheState> {
+        self.state
             .lock()
-            .unwrap_or_else(std::sync::PoisonError::into_inner);
-        state
+            .unwrap_or_else(std::sync::PoisonError::into_inner)
+    }
+
+    fn in_cooldown(&self) -> bool {
+        self.lock()
             .cooldown_until
             .is_some_and(|until| Instant::now() < until)
     }
 
     fn record_failure(&self) {
-        let mut state = self
-            .state
-            .lock()
-            .unwrap_or_else(std::sync::PoisonError::into_inner);
-        state.cooldown_until = Some(Instant::now() + COOLDOWN);
+        self.lock().cooldown_until = Some(Instant::now() + COOLDOWN);
     }
 
-    fn cached_catalog_vectors(&self) -> Option<CatalogVectors> {
-        let state = self
-            .state
-            .lock()
-            .unwrap_or_else(std::sync::PoisonError::into_inner);
-        state.catalog_vectors.clone()
+    fn cached_catalog_vectors(&self) -> Option<Arc<CatalogVectors>> {
+        self.lock().catalog_vectors.clone()
     }
 
-    fn store_catalog_vectors(&self, vectors: CatalogVectors) {
-        let mut state = self
-            .state
-            .lock()
-            .unwrap_or_else(std::sync::PoisonError::into_inner);
-        state.catalog_vectors = Some(vectors);
+    fn store_catalog_vectors(&self, vectors: Arc<CatalogVectors>) {
+        self.lock().catalog_vectors = Some(vectors);
     }
 }
 
@@ -161,36 +227,38 @@ pub async fn semantic_scores(
         None => return HashMap::new(),
     };
 
-    let query_vector = match embed_batch(
-        &cache.client,
-        tei_url,
-        std::slice::from_ref(&query.to_owned()),
-    )
-    .await
-    {
-        Ok(mut vectors) if vectors.len() == 1 => normalize_vector(vectors.remove(0)),
-        _ => {
-            cache.record_failure();
-            return HashMap::new();
-        }
+    // Bound first so the state lock is released before any await.
+    let cached = cache.lock().queries.get(query);
+    let query_vector = match cached {
+        Some(vector) => vector,
+        None => match embed_batch(&cache.client, tei_url, &[query.to_owned()]).await {
+            Ok(mut vectors) if vectors.len() == 1 => {
+                let vector: Arc<[f32]> = normalize_vector(vectors.remove(0)).into();
+                cache.lock().queries.insert(query, Arc::clone(&vector));
+                vector
+            }
+            _ => {
+                cache.record_failure();
+                return HashMap::new();
+            }
+        },
     };
 
-    catalog_vectors
-        .iter()
-        .map(|(path, vector)| {
-            let score = dot_similarity(&query_vector, vector);
-            (path.clone(), score)
-        })
+    let scores = catalog_vectors.matrix.scores(&query_vector);
+    top_k(&scores, TOP_K)
+        .into_iter()
+        .map(|(row, score)| (catalog_vectors.paths[row].clone(), score))
         .collect()
 }
 
-/// The catalog's embedded vectors, computing and caching them on first use.
-/// Returns `None` (having already recorded a cooldown) if embedding fails.
+/// The catalog's embedded vectors: from memory, else from the store dir, else
+/// embedded (and persisted) now. Returns `None` (having already recorded a
+/// cooldown) if embedding fails.
 async fn ensure_catalog_vectors(
     cache: &SemanticCache,
     tei_url: &str,
     catalog: &[CatalogEntry],
-) -> Option<Arc<[(String, Vec<f32>)]>> {
+) -> Option<Arc<CatalogVectors>> {
     if let Some(cached) = cache.cached_catalog_vectors() {
         return Some(cached);
     }
@@ -207,21 +275,121 @@ async fn ensure_catalog_vectors(
         .map(|entry| entry.description().to_owned())
         .collect();
 
-    match embed_batch(&cache.client, tei_url, &descriptions).await {
-        Ok(vectors) if vectors.len() == paths.len() => {
-            let pairs: Arc<[(String, Vec<f32>)]> = paths
-                .into_iter()
-                .zip(vectors.into_iter().map(normalize_vector))
-                .collect::<Vec<_>>()
-                .into();
-            cache.store_catalog_vectors(pairs.clone());
-            Some(pairs)
+    let stored = match &cache.store_dir {
+        Some(dir) => {
+            let model = model_id(&cache.client, tei_url).await;
+            let key = fingerprint(
+                std::iter::once(model.as_str()).chain(
+                    paths
+                        .iter()
+                        .zip(&descriptions)
+                        .flat_map(|(p, d)| [p.as_str(), d.as_str()]),
+                ),
+            );
+            Some(dir.join(format!("{key:016x}.f32")))
         }
-        _ => {
-            cache.record_failure();
-            None
+        None => None,
+    };
+    if let Some(path) = stored.clone() {
+        let rows = paths.len();
+        let loaded = tokio::task::spawn_blocking(move || VectorMatrix::load(&path, rows))
+            .await
+            .ok()
+            .flatten();
+        if let Some(matrix) = loaded {
+            let vectors = Arc::new(CatalogVectors { paths, matrix });
+            cache.store_catalog_vectors(Arc::clone(&vectors));
+            return Some(vectors);
         }
     }
+
+    let mut rows = Vec::with_capacity(descriptions.len());
+    for batch in descriptions.chunks(EMBED_BATCH) {
+        match embed_batch(&cache.client, tei_url, batch).await {
+            Ok(vectors) if vectors.len() == batch.len() => {
+                rows.extend(vectors.into_iter().map(normalize_vector));
+            }
+            _ => {
+                cache.record_failure();
+                return None;
+            }
+        }
+    }
+    let Some(matrix) = VectorMatrix::from_rows(rows) else {
+        cache.record_failure();
+        return None;
+    };
+    if let Some(path) = stored {
+        let snapshot = matrix.clone();
+        let _ = tokio::task::spawn_blocking(move || persist(&snapshot, &path)).await;
+    }
+    let vectors = Arc::new(CatalogVectors { paths, matrix });
+    cache.store_catalog_vectors(Arc::clone(&vectors));
+    Some(vectors)
+}
+
+/// TEI's model identity from `GET /info` (`model_id`, plus `model_sha` when it
+/// reports one). Falls back to the base URL, which still keys the store to one
+/// server.
+async fn model_id(client: &reqwest::Client, tei_url: &str) -> String {
+    let base = tei_url.trim_end_matches('/');
+    let info = async {
+        let response = client.get(format!("{base}/info")).send().await.ok()?;
+        response
+            .error_for_status()
+            .ok()?
+            .json::<serde_json::Value>()
+            .await
+            .ok()
+    }
+    .await;
+    let field = |name: &str| {
+        info.as_ref()
+            .and_then(|info| info.get(name))
+            .and_then(serde_json::Value::as_str)
+            .map(str::to_owned)
+    };
+    match (field("model_id"), field("model_sha")) {
+        (Some(id), Some(sha)) => format!("{id}@{sha}"),
+        (Some(id), None) => id,
+        (None, _) => base.to_owned(),
+    }
+}
+
+/// Stable 64-bit FNV-1a over `parts`, each terminated by a byte that never
+/// occurs in UTF-8 so adjacent parts cannot run together.
+fn fingerprint<'a>(parts: impl IntoIterator<Item = &'a str>) -> u64 {
+    let mut hash: u64 = 0xcbf2_9ce4_8422_2325;
+    for part in parts {
+        for byte in part.bytes().chain([0xff]) {
+            hash ^= u64::from(byte);
+            hash = hash.wrapping_mul(0x0100_0000_01b3);
+        }
+    }
+    hash
+}
+
+/// Write `matrix` to `path` and drop all but the newest [`STORED_CATALOGS`]
+/// matrices beside it. Failures only cost a re-embed next process.
+fn persist(matrix: &VectorMatrix, path: &Path) {
+    if let Err(error) = matrix.save(path) {
+        tracing::warn!(path = %path.display(), %error, "could not persist catalog embeddings");
+        return;
+    }
+    let Some(dir) = path.parent() else { return };
+    let Ok(entries) = std::fs::read_dir(dir) else {
+        return;
+    };
+    let mut stored: Vec<(std::time::SystemTime, PathBuf)> = entries
+        .filter_map(Result::ok)
+        .map(|entry| entry.path())
+        .filter(|file| file.extension().is_some_and(|ext| ext == "f32"))
+        .filter_map(|file| Some((file.metadata().ok()?.modified().ok()?, file)))
+        .collect();
+    stored.sort_by(|a, b| b.0.cmp(&a.0));
+    for (_, stale) in stored.into_iter().skip(STORED_CATALOGS) {
+        let _ = std::fs::remove_file(stale);
+    }
 }
 
 /// One batched `POST {tei_url}/embed` call: `{"inputs": texts}` in, one vector
@@ -275,13 +443,6 @@ fn normalize_vector(mut vector: Vec<f32>) -> Vec<f32> {
     vector
 }
 
-fn dot_similarity(a: &[f32], b: &[f32]) -> f32 {
-    if a.len() != b.len() || a.is_empty() {
-        return 0.0;
-    }
-    a.iter().zip(b).map(|(left, right)| left * right).sum()
-}
-
 #[cfg(test)]
 #[path = "semantic_tests.rs"]
 mod tests;
@@ -0,0 +1,161 @@
+//! Contiguous row-major `f32` matrix of normalized embeddings, its on-disk
+//! form, and the similarity kernel run against it.
+//!
+//! File layout (little-endian): the 4-byte magic `YEMB`, a `u32` format
+//! version, `u32` rows, `u32` dims, then `rows * dims` `f32` values. A file
+//! that does not match the expected row count (or is truncated, or from an
+//! older format) is treated as absent and rebuilt.
+
+use std::io::{self, Write};
+use std::path::Path;
+
+const MAGIC: &[u8; 4] = b"YEMB";
+const VERSION: u32 = 1;
+const HEADER_BYTES: usize = 16;
+
+/// Independent accumulators per dot product; wide enough for the compiler to
+/// keep them in one or two SIMD registers.
+const LANES: usize = 8;
+/// Rows scored together, so each chunk of the query is loaded once per block.
+const BLOCK_ROWS: usize = 4;
+
+#[derive(Debug, Clone, PartialEq)]
+pub(super) struct VectorMatrix {
+    dims: usize,
+    values: Vec<f32>,
+}
+
+impl VectorMatrix {
+    /// Pack equally-sized rows; `None` when they disagree on dimension or are
+    /// empty vectors.
+    pub(super) fn from_rows(rows: Vec<Vec<f32>>) -> Option<Self> {
+        let dims = rows.first().map_or(0, Vec::len);
+        if dims == 0 || rows.iter().any(|row| row.len() != dims) {
+            return None;
+        }
+        Some(Self {
+            dims,
+            values: rows.into_iter().flatten().collect(),
+        })
+    }
+
+    pub(super) fn rows(&self) -> usize {
+        self.values.len() / self.dims
+    }
+
+    /// Dot product of `query` with every row, in row order. All zeros when the
+    /// query's dimension does not match.
+    pub(super) fn scores(&self, query: &[f32]) -> Vec<f32> {
+        let mut out = vec![0.0; self.rows()];
+        if query.len() != self.dims {
+            return out;
+        }
+        let block = self.dims * BLOCK_ROWS;
+        let blocks = self.values.chunks_exact(block);
+        let rest = blocks.remainder();
+        let mut scored = out.chunks_exact_mut(BLOCK_ROWS);
+        for (rows, slot) in blocks.zip(&mut scored) {
+            slot.copy_from_slice(&dot_block(query, rows));
+        }
+        let tail = scored.into_remainder();
+        for (row, slot) in rest.chunks_exact(self.dims).zip(tail) {
+            *slot = dot(query, row);
+        }
+        out
+    }
+
+    /// Read a matrix written by [`save`](Self::save); `None` when the file is
+    /// missing, malformed, or does not hold exactly `rows` rows.
+    pub(super) fn load(path: &Path, rows: usize) -> Option<Self> {
+        let bytes = std::fs::read(path).ok()?;
+        let (header, body) = bytes.split_at_checked(HEADER_BYTES)?;
+        let field = |at: usize| u32::from_le_bytes(header[at..at + 4].try_into().unwrap());
+        if &header[..4] != MAGIC || field(4) != VERSION || field(8) as usize != rows {
+            return None;
+        }
+        let dims = field(12) as usize;
+        if dims == 0 || body.len() != rows.checked_mul(dims)?.checked_mul(4)? {
+            return None;
+        }
+        let (words, _) = body.as_chunks::<4>();
+        let values = words.iter().map(|word| f32::from_le_bytes(*word)).collect();
+        Some(Self { dims, values })
+    }
+
+    /// Write atomically: a sibling temp file renamed over `path`, so a reader
+    /// never sees a half-written matrix.
+    pub(super) fn save(&self, path: &Path) -> io::Result<()> {
+        if let Some(parent) = path.parent() {
+            std::fs::create_dir_all(parent)?;
+        }
+        let mut bytes = Vec::with_capacity(HEADER_BYTES + self.values.len() * 4);
+        bytes.extend_from_slice(MAGIC);
+        for field in [VERSION, self.rows() as u32, self.dims as u32] {
+            bytes.extend_from_slice(&field.to_le_bytes());
+        }
+        for value in &self.values {
+            bytes.extend_from_slice(&value.to_le_bytes());
+        }
+        let tmp = path.with_extension(format!("tmp{}", std::process::id()));
+        let mut file = std::fs::File::create(&tmp)?;
+        file.write_all(&bytes)?;
+        file.sync_all()?;
+        std::fs::rename(&tmp, path).inspect_err(|_| {
+            let _ = std::fs::remove_file(&tmp);
+        })
+    }
+}
+
+/// The `k` highest strictly-positive scores as `(row, score)`, unordered.
+/// Non-positive scores are dropped: the search blend ignores them anyway.
+pub(super) fn top_k(scores: &[f32], k: usize) -> Vec<(usize, f32)> {
+    let mut hits: Vec<(usize, f32)> = scores
+        .iter()
+        .copied()
+        .enumerate()
+        .filter(|(_, score)| *score > 0.0)
+        .collect();
+    if hits.len() > k && k > 0 {
+        hits.select_nth_unstable_by(k - 1, |a, b| b.1.total_cmp(&a.1));
+    }
+    hits.truncate(k);
+    hits
+}
+
+fn dot(a: &[f32], b: &[f32]) -> f32 {
+    let (a_chunks, a_tail) = a.as_chunks::<LANES>();
+    let (b_chunks, b_tail) = b.as_chunks::<LANES>();
+    let mut acc = [0.0f32; LANES];
+    for (x, y) in a_chunks.iter().zip(b_chunks) {
+        for ((sum, x), y) in acc.iter_mut().zip(x).zip(y) {
+            *sum += x * y;
+        }
+    }
+    let tail: f32 = a_tail.iter().zip(b_tail).map(|(x, y)| x * y).sum();
+    acc.iter().sum::<f32>() + tail
+}
+
+/// [`dot`] of `query` against `BLOCK_ROWS` consecutive rows of `rows`, walking
+/// the query once and feeding each chunk to every row in the block.
+fn dot_block(query: &[f32], rows: &[f32]) -> [f32; BLOCK_ROWS] {
+    let dims = query.len();
+    let (q_chunks, q_tail) = query.as_chunks::<LANES>();
+    let split: [(&[[f32; LANES]], &[f32]); BLOCK_ROWS] =
+        std::array::from_fn(|row| rows[row * dims..(row + 1) * dims].as_chunks::<LANES>());
+    let mut acc = [[0.0f32; LANES]; BLOCK_ROWS];
+    for (at, x) in q_chunks.iter().enumerate() {
+        for (row, lanes) in acc.iter_mut().enumerate() {
+            for ((sum, x), y) in lanes.iter_mut().zip(x).zip(&split[row].0[at]) {
+                *sum += x * y;
+            }
+        }
+    }
+    std::array::from_fn(|row| {
+        let tail: f32 = q_tail.iter().zip(split[row].1).map(|(x, y)| x * y).sum();
+        acc[row].iter().sum::<f32>() + tail
+    })
+}
+
+#[cfg(test)]
+#[path = "matrix_tests.rs"]
+mod tests;
@@ -0,0 +1,65 @@
+use super::*;
+
+fn rows(count: usize, dims: usize) -> Vec<Vec<f32>> {
+    (0..count)
+        .map(|row| {
+            (0..dims)
+                .map(|col| ((row * 31 + col * 7) % 13) as f32 / 13.0 - 0.4)
+                .collect()
+        })
+        .collect()
+}
+
+fn naive(a: &[f32], b: &[f32]) -> f32 {
+    a.iter().zip(b).map(|(x, y)| x * y).sum()
+}
+
+#[test]
+fn blocked_scores_match_a_naive_dot_product() {
+    // 11 rows of 37 dims: full blocks, a partial block, and a lane tail.
+    let data = rows(11, 37);
+    let query = rows(1, 37).remove(0);
+    let matrix = VectorMatrix::from_rows(data.clone()).unwrap();
+    let scores = matrix.scores(&query);
+    assert_eq!(scores.len(), 11);
+    for (row, score) in data.iter().zip(&scores) {
+        assert!((naive(&query, row) - score).abs() < 1e-5);
+        assert_eq!(*score, dot(&query, row));
+    }
+    assert!(
+        matrix
+            .scores(&query[..36])
+            .iter()
+            .all(|score| *score == 0.0)
+    );
+}
+
+#[test]
+fn from_rows_rejects_ragged_or_empty_input() {
+    assert!(VectorMatrix::from_rows(vec![vec![1.0, 2.0], vec![1.0]]).is_none());
+    assert!(VectorMatrix::from_rows(vec![Vec::new()]).is_none());
+    assert!(VectorMatrix::from_rows(Vec::new()).is_none());
+}
+
+#[test]
+fn top_k_keeps_the_best_positive_scores() {
+    let mut hits = top_k(&[0.2, -0.5, 0.9, 0.0, 0.4, 0.7], 3);
+    hits.sort_by_key(|(row, _)| *row);
+    assert_eq!(hits, vec![(2, 0.9), (4, 0.4), (5, 0.7)]);
+    assert_eq!(top_k(&[0.1, 0.3], 8).len(), 2);
+}
+
+#[test]
+fn save_and_load_round_trip_and_reject_mismatches() {
+    let dir = tempfile::tempdir().unwrap();
+    let path = dir.path().join("nested").join("catalog.f32");
+    let matrix = VectorMatrix::from_rows(rows(5, 9)).unwrap();
+    matrix.save(&path).unwrap();
+
+    assert_eq!(VectorMatrix::load(&path, 5), Some(matrix));
+    assert_eq!(VectorMatrix::load(&path, 4), None);
+    let bytes = std::fs::read(&path).unwrap();
+    std::fs::write(&path, &bytes[..bytes.len() - 2]).unwrap();
+    assert_eq!(VectorMatrix::load(&path, 5), None);
+    assert_eq!(VectorMatrix::load(&dir.path().join("missing.f32"), 5), None);
+}
@@ -182,3 +182,96 @@ async fn concurrent_first_use_embeds_the_catalog_once() {
     // all eight callers also issue their own catalog batch (16 total calls).
     assert_eq!(calls.load(Ordering::SeqCst), 9);
 }
+
+// ── persistence and query cache ──────────────────────────────────────────────
+
+/// A stub TEI: `/embed` maps each input to `[len, 1]`, `/info` names a model.
+/// Returns the base URL and the number of texts embedded so far.
+async fn stub_tei() -> (String, std::sync::Arc<std::sync::atomic::AtomicUsize>) {
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    let embedded = std::sync::Arc::new(AtomicUsize::new(0));
+    let counter = embedded.clone();
+    let app = axum::Router::new()
+        .route(
+            "/embed",
+            axum::routing::post(move |axum::Json(body): axum::Json<serde_json::Value>| {
+                let counter = counter.clone();
+                async move {
+                    let inputs = body["inputs"].as_array().cloned().unwrap_or_default();
+                    counter.fetch_add(inputs.len(), Ordering::SeqCst);
+                    let vectors: Vec<Vec<f32>> = inputs
+                        .iter()
+                        .map(|text| vec![text.as_str().map_or(0, str::len) as f32, 1.0])
+                        .collect();
+                    axum::Json(vectors)
+                }
+            }),
+        )
+        .route(
+            "/info",
+            axum::routing::get(|| async { axum::Json(serde_json::json!({"model_id": "stub"})) }),
+        );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    (format!("http://{address}"), embedded)
+}
+
+#[tokio::test]
+async fn persisted_catalog_vectors_survive_a_new_cache() {
+    use std::sync::atomic::Ordering;
+
+    let (url, embedded) = stub_tei().await;
+    let dir = tempfile::tempdir().unwrap();
+    // More entries than one TEI batch, so the catalog goes out in chunks.
+    let catalog: Vec<CatalogEntry> = (0..EMBED_BATCH + 3)
+        .map(|_| entry("sonarr.get_series", "List all series"))
+        .collect();
+
+    let first = SemanticCache::new().with_store_dir(dir.path().to_path_buf());
+    let before = semantic_scores(&first, Some(&url), &catalog, "series").await;
+    assert_eq!(embedded.load(Ordering::SeqCst), catalog.len() + 1);
+    let stored: Vec<_> = std::fs::read_dir(dir.path()).unwrap().collect();
+    assert_eq!(stored.len(), 1);
+
+    // A "new process": only the query is embedded; the catalog comes from disk.
+    let second = SemanticCache::new().with_store_dir(dir.path().to_path_buf());
+    let after = semantic_scores(&second, Some(&url), &catalog, "series").await;
+    assert_eq!(embedded.load(Ordering::SeqCst), catalog.len() + 2);
+    assert_eq!(before, after);
+
+    // A changed catalog misses the stored matrix and is embedded afresh.
+    let changed = vec![entry("radarr.get_movie", "List all movies")];
+    let third = SemanticCache::new().with_store_dir(dir.path().to_path_buf());
+    semantic_scores(&third, Some(&url), &changed, "series").await;
+    assert_eq!(embedded.load(Ordering::SeqCst), catalog.len() + 4);
+}
+
+#[tokio::test]
+async fn repeated_queries_reuse_the_cached_embedding() {
+    use std::sync::atomic::Ordering;
+
+    let (url, embedded) = stub_tei().await;
+    let cache = SemanticCache::new();
+    let catalog = vec![entry("sonarr.get_series", "List all series")];
+    let first = semantic_scores(&cache, Some(&url), &catalog, "series").await;
+    let second = semantic_scores(&cache, Some(&url), &catalog, "series").await;
+    assert_eq!(first, second);
+    assert_eq!(embedded.load(Ordering::SeqCst), 2);
+    semantic_scores(&cache, Some(&url), &catalog, "movies").await;
+    assert_eq!(embedded.load(Ordering::SeqCst), 3);
+}
+
+#[test]
+fn query_cache_evicts_the_least_recently_used() {
+    let mut queries = QueryCache::default();
+    for index in 0..QUERY_CACHE_ENTRIES {
+        queries.insert(&format!("q{index}"), Arc::from([index as f32]));
+    }
+    assert!(queries.get("q0").is_some());
+    queries.insert("fresh", Arc::from([0.0]));
+    assert!(queries.get("q0").is_some());
+    assert!(queries.get("q1").is_none());
+    assert_eq!(queries.entries.len(), QUERY_CACHE_ENTRIES);
+}
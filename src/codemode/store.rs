@@ -10,9 +10,21 @@
 //! allowlists `[A-Za-z0-9._-]`, forbids a leading dot, `..`, and any path
 //! separator, so `dir.join("<name>.json")` is always a direct child of the store
 //! dir (no traversal possible). No symlink/canonicalize dance is claimed.
+//!
+//! [`list`] answers from a manifest of every record's metadata,
+//! `<data_dir>/codemode/snippets.manifest.json`, stamped with the snippets-dir
+//! mtime it was scanned at and each record's own mtime and size. Saves and
+//! deletes rewrite it. A record added, removed or renamed by anything else
+//! (another process, a file dropped in by hand) moves the dir mtime; a record
+//! rewritten in place moves its own stamp. Either way the next listing
+//! rescans, at the cost of one `stat` per record when nothing changed. A
+//! rewrite that keeps the size within the filesystem's mtime granularity goes
+//! unseen. The manifest is a cache: it is never the only copy of anything and
+//! a missing or unreadable one just means a rescan.
 
 use std::path::{Path, PathBuf};
 use std::sync::atomic::{AtomicU64, Ordering};
+use std::time::UNIX_EPOCH;
 
 use serde::{Deserialize, Serialize};
 
@@ -35,6 +47,24 @@ struct SnippetRecord {
     code: String,
 }
 
+/// Listing cache for [`list`], written next to the snippets dir so rewriting
+/// it does not itself move the dir mtime.
+#[derive(Debug, Serialize, Deserialize)]
+struct Manifest {
+    /// Snippets-dir mtime (ns since the epoch), read before the scan.
+    dir_mtime_ns: u64,
+    snippets: Vec<ManifestEntry>,
+}
+
+/// One record's metadata and the stamp of its `<name>.json`, read before the
+/// record was.
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
+struct ManifestEntry {
+    meta: SnippetMeta,
+    mtime_ns: u64,
+    len: u64,
+}
+
 static SAVE_SEQUENCE: AtomicU64 = AtomicU64::new(0);
 
 /// Validate a caller-supplied snippet name. Allowlist-only; fail-closed.
@@ -75,6 +105,81 @@ fn meta_path(data_dir: &Path, name: &str) -> PathBuf {
     snippets_dir(data_dir).join(format!("{name}.json"))
 }
 
+fn manifest_path(data_dir: &Path) -> PathBuf {
+    data_dir.join(format!("{CODEMODE_SNIPPETS_SUBDIR}.manifest.json"))
+}
+
+/// The snippets dir's mtime in ns, or `None` when it is missing or the
+/// filesystem does not report one.
+fn dir_mtime_ns(data_dir: &Path) -> Option<u64> {
+    mtime_ns(&std::fs::metadata(snippets_dir(data_dir)).ok()?)
+}
+
+fn mtime_ns(metadata: &std::fs::Metadata) -> Option<u64> {
+    let since_epoch = metadata.modified().ok()?.duration_since(UNIX_EPOCH).ok()?;
+    u64::try_from(since_epoch.as_nanos()).ok()
+}
+
+/// The manifest's listing when it was scanned at `dir_mtime_ns` and no record
+/// in it has been rewritten since.
+fn read_manifest(data_dir: &Path, dir_mtime_ns: u64) -> Option<Vec<SnippetMeta>> {
+    let raw = std::fs::read(manifest_path(data_dir)).ok()?;
+    let manifest: Manifest = serde_json::from_slice(&raw).ok()?;
+    if manifest.dir_mtime_ns != dir_mtime_ns {
+        return None;
+    }
+    let mut snippets = Vec::with_capacity(manifest.snippets.len());
+    for entry in manifest.snippets {
+        let metadata = std::fs::metadata(meta_path(data_dir, &entry.meta.name)).ok()?;
+        if mtime_ns(&metadata) != Some(entry.mtime_ns) || metadata.len() != entry.len {
+            return None;
+        }
+        snippets.push(entry.meta);
+    }
+    Some(snippets)
+}
+
+/// Atomically replace the manifest. Failures are ignored: the next [`list`]
+/// finds no usable manifest and rescans.
+fn write_manifest(data_dir: &Path, manifest: &Manifest) {
+    let path = manifest_path(data_dir);
+    let Some(parent) = path.parent() else {
+        return;
+    };
+    let Ok(encoded) = serde_json::to_vec(manifest) else {
+        return;
+    };
+    let sequence = SAVE_SEQUENCE.fetch_add(1, Ordering::Relaxed);
+    let temporary = parent.join(format!(
+        ".snippets.manifest.{}.{sequence}.tmp",
+        std::process::id()
+    ));
+    if std::fs::write(&temporary, encoded)
+        .and_then(|()| std::fs::rename(&temporary, &path))
+        .is_err()
+    {
+        let _ = std::fs::remove_file(&temporary);
+    }
+}
+
+/// Rebuild the manifest after a save or delete. A scan that fails (a corrupt
+/// record elsewhere in the dir) removes the manifest instead, so [`list`]
+/// rescans and reports the corruption.
+fn refresh_manifest(data_dir: &Path) {
+    let rebuilt = dir_mtime_ns(data_dir).and_then(|dir_mtime_ns| {
+        scan(data_dir).ok().map(|snippets| Manifest {
+            dir_mtime_ns,
+            snippets,
+        })
+    });
+    match rebuilt {
+        Some(manifest) => write_manifest(data_dir, &manifest),
+        None => {
+            let _ = std::fs::remove_file(manifest_path(data_dir));
+        }
+    }
+}
+
 /// Save (create or overwrite) one atomic snippet record. The temporary file is
 /// written and synced in the destination directory before the final rename, so
 /// readers observe either the prior complete record or the new complete record.
@@ -120,15 +225,42 @@ pub fn save(
     result?;
     // A successful atomic save supersedes a legacy split record.
     let _ = std::fs::remove_file(source_path(data_dir, name));
+    refresh_manifest(data_dir);
     Ok(meta)
 }
 
-/// List saved snippets (metadata only), sorted by name. Corrupt atomic records
-/// are reported. Legacy split records are accepted only when their `.js` source
-/// exists, so corruption cannot be silently synthesized away.
+/// List saved snippets (metadata only), sorted by name. Served from the
+/// manifest while the snippets-dir mtime and every record's stamp still match
+/// it; otherwise the dir is rescanned and the manifest rewritten.
 pub fn list(data_dir: &Path) -> Result<Vec<SnippetMeta>, String> {
+    let Some(dir_mtime_ns) = dir_mtime_ns(data_dir) else {
+        return Ok(scan(data_dir)?
+            .into_iter()
+            .map(|entry| entry.meta)
+            .collect());
+    };
+    if let Some(snippets) = read_manifest(data_dir, dir_mtime_ns) {
+        return Ok(snippets);
+    }
+    let snippets = scan(data_dir)?;
+    let listed = snippets.iter().map(|entry| entry.meta.clone()).collect();
+    write_manifest(
+        data_dir,
+        &Manifest {
+            dir_mtime_ns,
+            snippets,
+        },
+    );
+    Ok(listed)
+}
+
+/// Read every record in the snippets dir, stamped for the manifest. Corrupt
+/// atomic records are reported. Legacy split records are accepted only when
+/// their `.js` source exists, so corruption cannot be silently synthesized
+/// away.
+fn scan(data_dir: &Path) -> Result<Vec<ManifestEntry>, String> {
     let dir = snippets_dir(data_dir);
-    let mut out: Vec<SnippetMeta> = Vec::new();
+    let mut out: Vec<ManifestEntry> = Vec::new();
     let entries = match std::fs::read_dir(&dir) {
         Ok(entries) => entries,
         Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(out),
@@ -147,6 +279,10 @@ pub fn list(data_dir: &Path) -> Result<Vec<SnippetMeta>, String> {
         if validate_snippet_name(name).is_err() {
             continue;
         }
+        // Stamped before the read: a rewrite racing it leaves a stale stamp,
+        // which only costs a rescan.
+        let metadata = std::fs::metadata(&path)
+            .map_err(|e| format!("could not read snippet `{name}`: {e}"))?;
         let raw = std::fs::read_to_string(&path)
             .map_err(|e| format!("could not read snippet `{name}`: {e}"))?;
         let meta = match serde_json::from_str::<SnippetRecord>(&raw) {
@@ -166,9 +302,13 @@ pub fn list(data_dir: &Path) -> Result<Vec<SnippetMeta>, String> {
                 meta.name
             ));
         }
-        out.push(meta);
+        out.push(ManifestEntry {
+            meta,
+            mtime_ns: mtime_ns(&metadata).unwrap_or(0),
+            len: metadata.len(),
+        });
     }
-    out.sort_by(|a, b| a.name.cmp(&b.name));
+    out.sort_by(|a, b| a.meta.name.cmp(&b.meta.name));
     Ok(out)
 }
 
@@ -200,6 +340,9 @@ pub fn delete(data_dir: &Path, name: &str) -> Result<bool, String> {
             Err(error) => return Err(format!("could not delete snippet: {error}")),
         }
     }
+    if existed {
+        refresh_manifest(data_dir);
+    }
     Ok(existed)
 }
 
@@ -98,3 +98,92 @@ fn corrupt_atomic_record_is_reported_instead_of_synthesized() {
     let error = list(tmp.path()).unwrap_err();
     assert!(error.contains("broken"), "{error}");
 }
+
+fn manifest_names(data_dir: &Path) -> Vec<String> {
+    let manifest: Manifest =
+        serde_json::from_slice(&std::fs::read(manifest_path(data_dir)).unwrap()).unwrap();
+    manifest
+        .snippets
+        .into_iter()
+        .map(|entry| entry.meta.name)
+        .collect()
+}
+
+#[test]
+fn save_and_delete_rewrite_the_manifest() {
+    let tmp = tempfile::tempdir().unwrap();
+    let dir = tmp.path();
+    save(dir, "b", "async () => 2", None).unwrap();
+    save(dir, "a", "async () => 1", None).unwrap();
+    assert_eq!(manifest_names(dir), ["a", "b"]);
+
+    assert!(delete(dir, "a").unwrap());
+    assert_eq!(manifest_names(dir), ["b"]);
+}
+
+#[test]
+fn list_answers_from_the_manifest_while_nothing_changed() {
+    let tmp = tempfile::tempdir().unwrap();
+    save(tmp.path(), "s", "async () => 1", Some("saved")).unwrap();
+
+    // A manifest whose stamps still match is taken at its word.
+    let path = manifest_path(tmp.path());
+    let mut manifest: Manifest = serde_json::from_slice(&std::fs::read(&path).unwrap()).unwrap();
+    manifest.snippets[0].meta.description = Some("cached".into());
+    write_manifest(tmp.path(), &manifest);
+    assert_eq!(
+        list(tmp.path()).unwrap()[0].description.as_deref(),
+        Some("cached")
+    );
+}
+
+#[test]
+fn a_record_rewritten_in_place_is_read_again() {
+    let tmp = tempfile::tempdir().unwrap();
+    save(tmp.path(), "s", "async () => 1", Some("before")).unwrap();
+    assert_eq!(
+        list(tmp.path()).unwrap()[0].description.as_deref(),
+        Some("before")
+    );
+
+    // Rewriting a record in place leaves the dir mtime alone; its own stamp
+    // moves.
+    let record = snippets_dir(tmp.path()).join("s.json");
+    let raw = std::fs::read_to_string(&record)
+        .unwrap()
+        .replace("before", "after");
+    std::fs::write(&record, raw).unwrap();
+    assert_eq!(
+        list(tmp.path()).unwrap()[0].description.as_deref(),
+        Some("after")
+    );
+}
+
+#[test]
+fn a_record_added_behind_the_stores_back_forces_a_rescan() {
+    let tmp = tempfile::tempdir().unwrap();
+    save(tmp.path(), "s", "async () => 1", None).unwrap();
+    assert_eq!(list(tmp.path()).unwrap().len(), 1);
+
+    std::fs::write(snippets_dir(tmp.path()).join("broken.json"), b"{not json").unwrap();
+    let error = list(tmp.path()).unwrap_err();
+    assert!(error.contains("broken"), "{error}");
+}
+
+#[test]
+fn a_stale_or_unreadable_manifest_is_rebuilt() {
+    let tmp = tempfile::tempdir().unwrap();
+    save(tmp.path(), "s", "async () => 1", None).unwrap();
+    std::fs::write(manifest_path(tmp.path()), b"garbage").unwrap();
+    assert_eq!(list(tmp.path()).unwrap().len(), 1);
+    assert_eq!(manifest_names(tmp.path()), ["s"]);
+
+    write_manifest(
+        tmp.path(),
+        &Manifest {
+            dir_mtime_ns: 1,
+            snippets: Vec::new(),
+        },
+    );
+    assert_eq!(list(tmp.path()).unwrap().len(), 1);
+}
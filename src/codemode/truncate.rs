@@ -32,7 +32,9 @@
 
 use serde_json::{Value, json};
 
-use crate::token_limit::MAX_RESPONSE_BYTES;
+use crate::token_limit::{
+    MAX_RESPONSE_BYTES, serialize_within, serialized_len, serialized_len_within,
+};
 
 /// Byte budget for the shaped Code Mode envelope. 3/5 of the transport cap leaves
 /// generous headroom (~16 KB at the default 40 KB cap) so re-serialization /
@@ -92,18 +94,10 @@ pub fn fit_response(response: &mut Value) {
     });
 }
 
-/// True iff the compact serialization of `value` is within budget.
+/// True iff the compact serialization of `value` is within budget. Stops
+/// counting at the budget, so an oversized envelope is not walked in full.
 fn within_budget(value: &Value) -> bool {
-    serialized_len(value) <= RESPONSE_BUDGET
-}
-
-fn serialized_len(value: &Value) -> usize {
-    // Fail SAFE: a (near-impossible) serialize failure on an already-materialized
-    // `Value` reports max size so we err toward truncating, never toward emitting an
-    // unbounded envelope the blunt transport cap would then chop mid-JSON.
-    serde_json::to_string(value)
-        .map(|s| s.len())
-        .unwrap_or(usize::MAX)
+    serialized_len_within(value, RESPONSE_BUDGET).is_some()
 }
 
 /// Remove array `field` from the envelope (replacing it with `[]`) and return its
@@ -131,27 +125,32 @@ fn marker_oversized_result(response: &mut Value) {
     const NEXT_ACTION: &str = "Result exceeded the Code Mode response budget. Narrow it: \
                                request fewer fields, add limit/offset/filter params, or \
                                writeArtifact() the full payload and return a summary.";
-    // Fail SAFE: an unserializable result (near-impossible for a Value) is replaced
-    // with a minimal marker rather than left for the blunt transport cap.
-    let Ok(serialized) = serde_json::to_string(result) else {
-        response["result"] = json!({ "truncated": true, "next_action": NEXT_ACTION });
-        return;
-    };
+    // Count the original without materializing it, and serialize only as much
+    // as the preview needs.
+    let original_bytes = serialized_len(result);
+    let preview = serialize_within(result, PREVIEW_BYTES).unwrap_or_else(|head| head);
     let marker = json!({
         "truncated": true,
-        "original_bytes": serialized.len(),
-        "original_tokens": serialized.len() / TOKEN_DIVISOR,
-        "preview": utf8_prefix(&serialized, PREVIEW_BYTES),
+        "original_bytes": original_bytes,
+        "original_tokens": original_bytes / TOKEN_DIVISOR,
+        "preview": preview,
         "next_action": NEXT_ACTION,
     });
-    if serialized_len(&marker) < serialized.len() {
+    if serialized_len(&marker) < original_bytes {
         response["result"] = marker;
     }
 }
 
 /// Fit the largest suffix (newest entries) of `items` into `response[field]` that
 /// keeps the envelope within budget, prepending `sentinel(dropped)` when any are
-/// dropped. Binary search keeps this O(n log n) serializations rather than O(n^2).
+/// dropped.
+///
+/// The envelope is measured once with `field` empty, then the items. Compact JSON
+/// makes the total exact arithmetic — an array of `n` members costs its members
+/// plus `n - 1` commas over `[]` — so no candidate envelope is ever re-serialized.
+/// Keeping everything is checked first: it needs no sentinel, so it can fit when
+/// every shorter suffix plus the sentinel does not. Otherwise items are measured
+/// newest first, stopping at the first one that does not fit.
 fn fit_newest(
     response: &mut Value,
     field: &str,
@@ -163,46 +162,48 @@ fn fit_newest(
         return;
     }
 
-    // `keep` = number of newest entries retained. Find the largest `keep` that fits.
-    let set = |response: &mut Value, keep: usize| {
-        let dropped = total - keep;
-        let mut out: Vec<Value> = Vec::with_capacity(keep + 1);
-        if dropped > 0 {
-            out.push(sentinel(dropped));
-        }
-        out.extend(items[total - keep..].iter().cloned());
-        response[field] = Value::Array(out);
-    };
+    response[field] = Value::Array(Vec::new());
+    let base = serialized_len(response);
+    // Envelope size with `members` array members totalling `member_bytes`.
+    let envelope_len =
+        |members: usize, member_bytes: usize| base + member_bytes + members.saturating_sub(1);
+    let sentinel_len = |dropped: usize| serialized_len(&sentinel(dropped));
 
-    // Fast path: does everything fit?
-    set(response, total);
-    if within_budget(response) {
+    let all_bytes = items.iter().try_fold(0usize, |sum, item| {
+        serialized_len_within(item, RESPONSE_BUDGET.saturating_sub(sum)).map(|len| sum + len)
+    });
+    if all_bytes.is_some_and(|bytes| envelope_len(total, bytes) <= RESPONSE_BUDGET) {
+        response[field] = Value::Array(items);
         return;
     }
 
-    let (mut lo, mut hi) = (0usize, total);
-    while lo < hi {
-        let mid = (lo + hi).div_ceil(2); // bias toward keeping more
-        set(response, mid);
-        if within_budget(response) {
-            lo = mid;
+    let mut keep = 0;
+    let mut kept_bytes = 0usize;
+    for item in items.iter().rev() {
+        let Some(item_len) = serialized_len_within(item, RESPONSE_BUDGET) else {
+            break;
+        };
+        let next = keep + 1;
+        let dropped = total - next;
+        let (members, bytes) = if dropped == 0 {
+            (next, kept_bytes + item_len)
         } else {
-            hi = mid - 1;
+            (next + 1, kept_bytes + item_len + sentinel_len(dropped))
+        };
+        if envelope_len(members, bytes) > RESPONSE_BUDGET {
+            break;
         }
+        keep = next;
+        kept_bytes += item_len;
     }
-    set(response, lo);
-}
 
-/// The largest char-boundary prefix of `s` that is at most `max_bytes` bytes.
-fn utf8_prefix(s: &str, max_bytes: usize) -> &str {
-    if s.len() <= max_bytes {
-        return s;
-    }
-    let mut end = max_bytes;
-    while end > 0 && !s.is_char_boundary(end) {
-        end -= 1;
+    let dropped = total - keep;
+    let mut out: Vec<Value> = Vec::with_capacity(keep + 1);
+    if dropped > 0 {
+        out.push(sentinel(dropped));
     }
-    &s[..end]
+    out.extend(items.into_iter().skip(dropped));
+    response[field] = Value::Array(out);
 }
 
 #[cfg(test)]
@@ -115,14 +115,67 @@ fn marker_is_skipped_when_it_would_not_shrink_a_small_result() {
 }
 
 #[test]
-fn utf8_prefix_never_splits_a_codepoint() {
+fn preview_never_splits_a_codepoint() {
     // ASCII source (\u escapes) so the repo ASCII check stays clean, while still
     // exercising 2-byte and 4-byte codepoints at varied byte offsets.
-    let s = "h\u{e9}llo w\u{f6}rld \u{1f389} end";
-    for n in 0..s.len() + 2 {
-        let p = utf8_prefix(s, n);
-        assert!(p.len() <= n || n >= s.len());
-        assert!(s.starts_with(p));
-        assert!(std::str::from_utf8(p.as_bytes()).is_ok());
+    let value = json!("h\u{e9}llo w\u{f6}rld \u{1f389} end");
+    let full = serde_json::to_string(&value).unwrap();
+    for n in 0..full.len() + 2 {
+        let p = serialize_within(&value, n).unwrap_or_else(|head| head);
+        assert!(p.len() <= n || n >= full.len());
+        assert!(full.starts_with(&p));
     }
 }
+
+#[test]
+fn trimming_keeps_the_most_newest_items_that_fit() {
+    // The single-pass fit must land exactly where re-serializing would: the kept
+    // suffix fits, and one more item would not.
+    let logs: Vec<String> = (0..3000)
+        .map(|i| format!("line {i} {}", "x".repeat(i % 17)))
+        .collect();
+    let mut env = envelope(
+        json!({ "ok": true }),
+        logs.iter().map(String::as_str).collect(),
+    );
+
+    fit_response(&mut env);
+
+    assert!(serialized_len(&env) <= RESPONSE_BUDGET);
+    let kept = env["logs"].as_array().unwrap();
+    let dropped = logs.len() - (kept.len() - 1);
+    assert!(
+        kept[0]
+            .as_str()
+            .unwrap()
+            .contains(&format!("{dropped} line(s)"))
+    );
+    let mut one_more = env.clone();
+    let mut grown = kept.clone();
+    grown.insert(1, Value::String(logs[dropped - 1].clone()));
+    grown[0] = Value::String(format!(
+        "[logs truncated to fit response budget \u{2014} {} line(s) dropped]",
+        dropped - 1
+    ));
+    one_more["logs"] = Value::Array(grown);
+    assert!(serialized_len(&one_more) > RESPONSE_BUDGET);
+}
+
+#[test]
+fn items_that_all_fit_are_kept_without_a_sentinel() {
+    // Two tiny oldest entries, far shorter than the sentinel, with the envelope
+    // exactly at the budget once every entry is back in.
+    let sentinel = |dropped: usize| Value::String(format!("[logs truncated - {dropped} dropped]"));
+    let items: Vec<Value> = ["a", "b", "newest line"]
+        .into_iter()
+        .map(Value::from)
+        .collect();
+    let all = serialized_len(&json!({ "result": "", "logs": items }));
+    let mut response = json!({ "result": "x".repeat(RESPONSE_BUDGET - all) });
+    assert!(serialized_len(&sentinel(1)) > serialized_len(&items[0]));
+
+    fit_newest(&mut response, "logs", items.clone(), sentinel);
+
+    assert_eq!(response["logs"], Value::Array(items));
+    assert_eq!(serialized_len(&response), RESPONSE_BUDGET);
+}
@@ -15,6 +15,16 @@ pub struct ServiceConfig {
     pub username: Option<String>,
     pub password: Option<String>,
     pub token: Option<String>,
+    /// Serve repeat GETs of slow-changing endpoints from the shared read cache.
+    pub read_cache: bool,
+    /// Ceiling for the adaptive in-flight request limit (see `yarr::limiter`).
+    /// 0 is treated as 1.
+    pub max_concurrency: usize,
+    /// Consecutive transport errors / HTTP 5xx that open the circuit breaker.
+    /// 0 disables the breaker.
+    pub breaker_threshold: u32,
+    /// How long an open breaker fails requests fast before probing again.
+    pub breaker_cooldown_secs: u64,
 }
 
 impl Default for ServiceConfig {
@@ -27,6 +37,10 @@ impl Default for ServiceConfig {
             username: None,
             password: None,
             token: None,
+            read_cache: false,
+            max_concurrency: 8,
+            breaker_threshold: 5,
+            breaker_cooldown_secs: 30,
         }
     }
 }
@@ -259,6 +273,24 @@ pub(super) fn load_services_from_env(config: &mut super::YarrConfig) -> anyhow::
             .ok_or_else(|| {
                 anyhow::anyhow!("YARR_{env_name}_URL is required for service {raw_name}")
             })?;
+        let mut read_cache = false;
+        super::env_bool(&format!("YARR_{env_name}_READ_CACHE"), &mut read_cache)?;
+        let defaults = ServiceConfig::default();
+        let mut max_concurrency = defaults.max_concurrency;
+        super::env_parse(
+            &format!("YARR_{env_name}_MAX_CONCURRENCY"),
+            &mut max_concurrency,
+        )?;
+        let mut breaker_threshold = defaults.breaker_threshold;
+        super::env_parse(
+            &format!("YARR_{env_name}_BREAKER_THRESHOLD"),
+            &mut breaker_threshold,
+        )?;
+        let mut breaker_cooldown_secs = defaults.breaker_cooldown_secs;
+        super::env_parse(
+            &format!("YARR_{env_name}_BREAKER_COOLDOWN_SECS"),
+            &mut breaker_cooldown_secs,
+        )?;
         let service = ServiceConfig {
             name: raw_name.to_ascii_lowercase(),
             kind,
@@ -267,6 +299,10 @@ pub(super) fn load_services_from_env(config: &mut super::YarrConfig) -> anyhow::
             username: env_optional(&format!("YARR_{env_name}_USERNAME")),
             password: env_optional(&format!("YARR_{env_name}_PASSWORD")),
             token: env_optional(&format!("YARR_{env_name}_TOKEN")),
+            read_cache,
+            max_concurrency,
+            breaker_threshold,
+            breaker_cooldown_secs,
         };
         services.push(service);
     }
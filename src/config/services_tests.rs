@@ -128,3 +128,33 @@ fn load_services_bails_when_url_missing() {
     );
     assert!(msg.contains("sonarr"), "error should name the service");
 }
+
+#[test]
+fn load_services_reads_admission_knobs() {
+    let mut env = crate::testing::TestEnv::new();
+    env.set("YARR_SERVICES", "prowlarr,sonarr");
+    env.set("YARR_PROWLARR_URL", "http://prowlarr:9696");
+    env.set("YARR_PROWLARR_MAX_CONCURRENCY", "2");
+    env.set("YARR_PROWLARR_BREAKER_THRESHOLD", "0");
+    env.set("YARR_PROWLARR_BREAKER_COOLDOWN_SECS", "120");
+    env.set("YARR_SONARR_URL", "http://sonarr:8989");
+    env.remove("YARR_SONARR_MAX_CONCURRENCY");
+    env.remove("YARR_SONARR_BREAKER_THRESHOLD");
+    env.remove("YARR_SONARR_BREAKER_COOLDOWN_SECS");
+
+    let mut config = super::super::YarrConfig::default();
+    load_services_from_env(&mut config).unwrap();
+
+    let prowlarr = &config.services[0];
+    assert_eq!(prowlarr.max_concurrency, 2);
+    assert_eq!(prowlarr.breaker_threshold, 0);
+    assert_eq!(prowlarr.breaker_cooldown_secs, 120);
+    let sonarr = &config.services[1];
+    let defaults = ServiceConfig::default();
+    assert_eq!(sonarr.max_concurrency, defaults.max_concurrency);
+    assert_eq!(sonarr.breaker_threshold, defaults.breaker_threshold);
+    assert_eq!(sonarr.breaker_cooldown_secs, defaults.breaker_cooldown_secs);
+
+    env.set("YARR_SONARR_MAX_CONCURRENCY", "lots");
+    assert!(load_services_from_env(&mut config).is_err());
+}
@@ -41,7 +41,7 @@ pub use capability::Capability;
 pub use cli::{
     Command, SetupCommand, apply_plugin_options, capability_verb_tables, parse_args,
     parse_args_configured, parse_args_from, run as run_cli_command, run_doctor, run_setup,
-    run_watch, usage as cli_usage,
+    run_watch, run_watch_sources, usage as cli_usage,
 };
 pub use config::{
     AuthConfig, Config, McpConfig, ServiceConfig, ServiceKind, YarrConfig,
@@ -62,6 +62,59 @@ pub use run_mode::RunMode;
 pub use server::{AppState, AuthPolicy, AuthPolicyKind, resolve_auth_policy_kind, router};
 pub use yarr::YarrClient;
 
+/// Hot-path entry points for the Criterion suite in `benches/` — available when
+/// `features = ["test-support"]` or in `cfg(test)`.
+///
+/// Thin re-exports and wrappers over crate-private functions, so the benchmarks
+/// time the real transport/response code without widening module visibility.
+#[cfg(any(test, feature = "test-support"))]
+#[doc(hidden)]
+pub mod bench {
+    use anyhow::Result;
+    use serde_json::{Map, Value};
+
+    use crate::config::ServiceConfig;
+    use crate::openapi::OperationSpec;
+
+    pub use crate::codemode::truncate::fit_response;
+    pub use crate::token_limit::serialize_with_limit;
+    pub use crate::yarr::helpers::{body_preview, build_operation_url, build_url, query_get, slim};
+
+    /// Decode a buffered 200 body with `content_type` the way `get_json` does.
+    pub fn decode_success(
+        service: &ServiceConfig,
+        content_type: &str,
+        bytes: Vec<u8>,
+    ) -> Result<Value> {
+        crate::yarr::decode_json_success(service, Some(content_type.to_owned()), bytes)
+    }
+
+    /// Serialize `args` for a generated operation; returns the encoded pair count.
+    pub fn prepare_parameters(spec: &OperationSpec, args: &Map<String, Value>) -> Result<usize> {
+        crate::app::openapi_ops::encoded_parameter_count(spec, args)
+    }
+
+    /// The JSON log file writer `init_logging` installs, writing to `path`.
+    pub struct LogWriter(crate::logging::NonBlockingLogWriter);
+
+    impl LogWriter {
+        pub fn open(path: std::path::PathBuf) -> Result<Self> {
+            crate::logging::non_blocking_rotating_writer(path).map(Self)
+        }
+
+        /// Emit one formatted event the way the JSON layer does.
+        pub fn event(&self, line: &[u8]) {
+            use std::io::Write;
+            let _ = self.0.clone().write_all(line);
+        }
+
+        /// Block until every event emitted so far is in the file.
+        pub fn wait_written(&self) {
+            self.0.wait_written();
+        }
+    }
+}
+
 /// Test helpers — available when `features = ["test-support"]` or in `cfg(test)`.
 ///
 /// Use these in integration tests to construct `AppState` without real creds.
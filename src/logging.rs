@@ -43,18 +43,24 @@
 //! Logs are written to `{data_dir}/logs/{service}.log`.
 //! For the yarr service this resolves to `~/.yarr/logs/yarr.log`.
 //!
-//! File writes are queued to a dedicated worker and rotated while the process
-//! is running. Four files are retained (the current file plus three backups),
-//! each capped at 10 MiB.
+//! File writes go through a bounded in-memory ring drained in batches by a
+//! dedicated writer thread, and the file is rotated while the process is
+//! running. Rotated generations are gzipped on a second background thread as
+//! `{service}.log.1.gz` through `.3.gz`; with the active file that is four
+//! generations of at most 10 MiB of text each.
 
 pub mod aurora;
 pub mod formatter;
 
-use std::io::{IsTerminal, Write};
+use std::collections::VecDeque;
+use std::io::{IsTerminal, Read, Write};
 use std::path::{Path, PathBuf};
-use std::sync::mpsc::{SyncSender, sync_channel};
+use std::sync::mpsc::{Sender, channel};
+use std::sync::{Arc, Condvar, Mutex, MutexGuard, PoisonError};
 
 use anyhow::{Context, Result};
+use flate2::Compression;
+use flate2::write::GzEncoder;
 use tracing_subscriber::{EnvFilter, layer::SubscriberExt, util::SubscriberInitExt};
 
 use formatter::AuroraFormatter;
@@ -146,19 +152,142 @@ pub fn init(data_dir: &Path, service_name: &str) -> Result<()> {
     Ok(())
 }
 
-// ── Log file rotation ─────────────────────────────────────────────────────────
+// ── Log file pipeline ─────────────────────────────────────────────────────────
+//
+// Request threads format an event and push it into a bounded ring; they never
+// touch the file. The `yarr-log-writer` thread drains the ring in batches and
+// appends each batch with one write. When the active file would cross
+// `LOG_FILE_MAX_BYTES` the writer only renames it to a staging name and opens a
+// fresh file; the `yarr-log-archiver` thread then shifts the compressed
+// generations and gzips the staged file into `{service}.log.1.gz`.
+//
+// Drop policy: when the ring is full (by event count or by bytes), the NEW event
+// is dropped and counted in `yarr_log_events_dropped_total{reason="queue_full"}`;
+// events already queued are kept, so the file never holds a torn line. After a
+// write failure the writer stops and every later event counts as
+// `writer_disconnected`.
 
-/// Maximum size of each retained log file.
+/// Maximum size of the active log file; compressed generations hold at most
+/// this much uncompressed text each.
 const LOG_FILE_MAX_BYTES: u64 = 10 * 1024 * 1024; // 10 MiB
 const LOG_BACKUPS: usize = 3;
-const LOG_QUEUE_CAPACITY: usize = 8_192;
+/// Events waiting for the writer, by count and by formatted bytes.
+const LOG_RING_MAX_EVENTS: usize = 8_192;
+const LOG_RING_MAX_BYTES: usize = 4 * 1024 * 1024;
+/// Most bytes the writer takes from the ring for one file write.
+const LOG_BATCH_MAX_BYTES: usize = 256 * 1024;
 
+/// The bounded queue between event producers and the writer thread.
+#[derive(Default)]
+struct LogRing {
+    state: Mutex<RingState>,
+    /// Signalled when an event is queued or the ring closes.
+    ready: Condvar,
+    /// Signalled when the writer has nothing queued or in flight.
+    idle: Condvar,
+}
+
+#[derive(Default)]
+struct RingState {
+    events: VecDeque<Vec<u8>>,
+    bytes: usize,
+    /// The writer is appending a batch it already took.
+    writing: bool,
+    /// The writer has stopped; nothing more will be written.
+    closed: bool,
+}
+
+impl LogRing {
+    fn lock(&self) -> MutexGuard<'_, RingState> {
+        self.state.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    /// Queue one complete event, or name why it was dropped.
+    fn push(&self, event: Vec<u8>) -> std::result::Result<(), &'static str> {
+        let mut state = self.lock();
+        if state.closed {
+            return Err("writer_disconnected");
+        }
+        if state.events.len() >= LOG_RING_MAX_EVENTS
+            || state.bytes.saturating_add(event.len()) > LOG_RING_MAX_BYTES
+        {
+            return Err("queue_full");
+        }
+        state.bytes += event.len();
+        state.events.push_back(event);
+        drop(state);
+        self.ready.notify_one();
+        Ok(())
+    }
+
+    /// Wait for queued events and move whole events, up to
+    /// [`LOG_BATCH_MAX_BYTES`] (at least one), into `batch`. `false` once the
+    /// ring is closed.
+    fn take_batch(&self, batch: &mut Vec<u8>) -> bool {
+        let mut state = self.lock();
+        state.writing = false;
+        while state.events.is_empty() {
+            self.idle.notify_all();
+            if state.closed {
+                return false;
+            }
+            state = self
+                .ready
+                .wait(state)
+                .unwrap_or_else(PoisonError::into_inner);
+        }
+        while let Some(event) = state.events.front() {
+            if !batch.is_empty() && batch.len() + event.len() > LOG_BATCH_MAX_BYTES {
+                break;
+            }
+            let event = state.events.pop_front().unwrap_or_default();
+            state.bytes -= event.len();
+            batch.extend_from_slice(&event);
+        }
+        state.writing = true;
+        true
+    }
+
+    /// Stop accepting events and discard whatever is still queued.
+    fn close(&self) {
+        let mut state = self.lock();
+        state.closed = true;
+        state.events.clear();
+        state.bytes = 0;
+        state.writing = false;
+        drop(state);
+        self.ready.notify_all();
+        self.idle.notify_all();
+    }
+
+    /// Block until every event queued so far has been written, or the writer
+    /// has stopped.
+    fn wait_written(&self) {
+        let mut state = self.lock();
+        while !state.closed && (state.writing || !state.events.is_empty()) {
+            state = self
+                .idle
+                .wait(state)
+                .unwrap_or_else(PoisonError::into_inner);
+        }
+    }
+}
+
+/// The `MakeWriter` handed to the JSON layer: buffers one formatted event and
+/// queues it whole on drop.
 #[derive(Clone)]
-struct NonBlockingLogWriter {
-    sender: SyncSender<Vec<u8>>,
+pub(crate) struct NonBlockingLogWriter {
+    ring: Arc<LogRing>,
     buffer: Vec<u8>,
 }
 
+impl NonBlockingLogWriter {
+    /// Block until every event queued so far has reached the file.
+    pub(crate) fn wait_written(&self) {
+        self.ring.wait_written();
+    }
+}
+
 impl Write for NonBlockingLogWriter {
     fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
         self.buffer.extend_from_slice(buf);
@@ -173,13 +302,9 @@ impl Write for NonBlockingLogWriter {
 impl Drop for NonBlockingLogWriter {
     fn drop(&mut self) {
         if !self.buffer.is_empty() {
-            // Logging must never hold up request processing. A saturated queue
-            // drops one complete event, never a fragment that corrupts NDJSON.
-            if let Err(error) = self.sender.try_send(std::mem::take(&mut self.buffer)) {
-                let reason = match error {
-                    std::sync::mpsc::TrySendError::Full(_) => "queue_full",
-                    std::sync::mpsc::TrySendError::Disconnected(_) => "writer_disconnected",
-                };
+            // Logging must never hold up request processing. A full ring drops
+            // one complete event, never a fragment that corrupts NDJSON.
+            if let Err(reason) = self.ring.push(std::mem::take(&mut self.buffer)) {
                 axum_prometheus::metrics::counter!(
                     "yarr_log_events_dropped_total",
                     "reason" => reason
@@ -194,12 +319,14 @@ struct RotatingFile {
     path: PathBuf,
     file: Option<std::fs::File>,
     bytes: u64,
+    archiver: Archiver,
 }
 
 impl RotatingFile {
     fn open(path: PathBuf) -> Result<Self> {
+        let archiver = Archiver::start(&path)?;
         if path.metadata().map(|metadata| metadata.len()).unwrap_or(0) >= LOG_FILE_MAX_BYTES {
-            rotate_files(&path)?;
+            archiver.stage(&path)?;
         }
         let file = std::fs::OpenOptions::new()
             .create(true)
@@ -211,18 +338,19 @@ impl RotatingFile {
             path,
             file: Some(file),
             bytes,
+            archiver,
         })
     }
 
+    /// Append one batch of complete events with a single write.
     fn append(&mut self, bytes: &[u8]) -> std::io::Result<()> {
         if self.bytes.saturating_add(bytes.len() as u64) > LOG_FILE_MAX_BYTES {
-            if let Some(file) = self.file.as_mut() {
-                file.flush()?;
-            }
             // Windows cannot rename an open file. Drop the active handle before
-            // rotating so the same implementation is portable.
+            // staging it so the same implementation is portable.
             self.file.take();
-            rotate_files(&self.path).map_err(std::io::Error::other)?;
+            self.archiver
+                .stage(&self.path)
+                .map_err(std::io::Error::other)?;
             self.file = Some(
                 std::fs::OpenOptions::new()
                     .create(true)
@@ -246,55 +374,146 @@ impl RotatingFile {
     }
 }
 
+/// Compresses rotated log files off the writer thread. Staged files are
+/// archived one at a time in the order they were staged, so generations never
+/// overtake each other.
+struct Archiver {
+    sender: Option<Sender<PathBuf>>,
+    worker: Option<std::thread::JoinHandle<()>>,
+}
+
+impl Archiver {
+    /// Start the archiver for the log at `path`, first queueing any staged
+    /// files a previous process left behind.
+    fn start(path: &Path) -> Result<Self> {
+        let (sender, receiver) = channel::<PathBuf>();
+        for leftover in staged_files(path) {
+            let _ = sender.send(leftover);
+        }
+        let log = path.to_path_buf();
+        let worker = std::thread::Builder::new()
+            .name("yarr-log-archiver".into())
+            .spawn(move || {
+                while let Ok(staged) = receiver.recv() {
+                    if let Err(error) = archive(&log, &staged) {
+                        eprintln!(
+                            "WARN  failed to archive rotated log {}: {error:#}",
+                            staged.display()
+                        );
+                    }
+                }
+            })
+            .context("failed to start log archiver thread")?;
+        Ok(Self {
+            sender: Some(sender),
+            worker: Some(worker),
+        })
+    }
+
+    /// Move the active log aside and queue it for compression. Only a rename
+    /// happens on the calling thread.
+    fn stage(&self, path: &Path) -> Result<()> {
+        let nanos = std::time::SystemTime::now()
+            .duration_since(std::time::UNIX_EPOCH)
+            .map(|elapsed| elapsed.as_nanos())
+            .unwrap_or_default();
+        let staged = PathBuf::from(format!("{}.rotating-{nanos:020}", path.display()));
+        std::fs::rename(path, &staged)
+            .with_context(|| format!("failed to rotate log file: {}", path.display()))?;
+        if let Some(sender) = &self.sender {
+            let _ = sender.send(staged);
+        }
+        Ok(())
+    }
+
+    /// Archive everything staged so far and stop the thread.
+    #[cfg(test)]
+    fn finish(&mut self) {
+        self.sender.take();
+        if let Some(worker) = self.worker.take() {
+            let _ = worker.join();
+        }
+    }
+}
+
+/// Staged files next to the log at `path`, oldest first.
+fn staged_files(path: &Path) -> Vec<PathBuf> {
+    let (Some(dir), Some(name)) = (path.parent(), path.file_name()) else {
+        return Vec::new();
+    };
+    let prefix = format!("{}.rotating-", name.to_string_lossy());
+    let mut staged: Vec<PathBuf> = std::fs::read_dir(dir)
+        .into_iter()
+        .flatten()
+        .filter_map(|entry| entry.ok())
+        .filter(|entry| entry.file_name().to_string_lossy().starts_with(&prefix))
+        .map(|entry| entry.path())
+        .collect();
+    staged.sort();
+    staged
+}
+
+/// Uncompressed backups written before rotated logs were compressed.
 fn backup_path(path: &Path, generation: usize) -> PathBuf {
     PathBuf::from(format!("{}.{}", path.display(), generation))
 }
 
-fn rotate_files(path: &Path) -> Result<()> {
-    let oldest = backup_path(path, LOG_BACKUPS);
+fn archive_path(path: &Path, generation: usize) -> PathBuf {
+    PathBuf::from(format!("{}.{}.gz", path.display(), generation))
+}
+
+/// Shift the compressed generations of the log at `path` and gzip `staged`
+/// (its first [`LOG_FILE_MAX_BYTES`]) into generation 1.
+fn archive(path: &Path, staged: &Path) -> Result<()> {
+    let oldest = archive_path(path, LOG_BACKUPS);
     if oldest.exists() {
         std::fs::remove_file(&oldest)?;
     }
     for generation in (1..LOG_BACKUPS).rev() {
-        let source = backup_path(path, generation);
+        let source = archive_path(path, generation);
         if source.exists() {
-            std::fs::rename(source, backup_path(path, generation + 1))?;
+            std::fs::rename(source, archive_path(path, generation + 1))?;
         }
     }
-    if path.exists() {
-        std::fs::rename(path, backup_path(path, 1))?;
-    }
+    // Plain backups from older releases would otherwise never age out.
     for generation in 1..=LOG_BACKUPS {
-        let backup = backup_path(path, generation);
-        if backup
-            .metadata()
-            .is_ok_and(|metadata| metadata.len() > LOG_FILE_MAX_BYTES)
-        {
-            std::fs::OpenOptions::new()
-                .write(true)
-                .open(&backup)?
-                .set_len(LOG_FILE_MAX_BYTES)?;
-        }
+        let _ = std::fs::remove_file(backup_path(path, generation));
     }
+
+    let target = archive_path(path, 1);
+    let temp = PathBuf::from(format!("{}.tmp", target.display()));
+    let source = std::fs::File::open(staged)?;
+    let mut encoder = GzEncoder::new(
+        std::io::BufWriter::new(std::fs::File::create(&temp)?),
+        Compression::default(),
+    );
+    std::io::copy(&mut source.take(LOG_FILE_MAX_BYTES), &mut encoder)?;
+    encoder.finish()?.flush()?;
+    std::fs::rename(&temp, &target)?;
+    std::fs::remove_file(staged)?;
     Ok(())
 }
 
-fn non_blocking_rotating_writer(path: PathBuf) -> Result<NonBlockingLogWriter> {
+pub(crate) fn non_blocking_rotating_writer(path: PathBuf) -> Result<NonBlockingLogWriter> {
     let mut writer = RotatingFile::open(path)?;
-    let (sender, receiver) = sync_channel::<Vec<u8>>(LOG_QUEUE_CAPACITY);
+    let ring = Arc::new(LogRing::default());
+    let queue = ring.clone();
     std::thread::Builder::new()
         .name("yarr-log-writer".into())
         .spawn(move || {
-            while let Ok(bytes) = receiver.recv() {
-                if let Err(error) = writer.append(&bytes) {
+            let mut batch = Vec::with_capacity(LOG_BATCH_MAX_BYTES);
+            while queue.take_batch(&mut batch) {
+                if let Err(error) = writer.append(&batch) {
                     eprintln!("WARN  file logging disabled after write failure: {error}");
+                    queue.close();
                     break;
                 }
+                batch.clear();
             }
         })
         .context("failed to start log writer thread")?;
     Ok(NonBlockingLogWriter {
-        sender,
+        ring,
         buffer: Vec::new(),
     })
 }
@@ -1,5 +1,20 @@
 use super::*;
 
+fn gunzip(path: &Path) -> Vec<u8> {
+    let mut out = Vec::new();
+    flate2::read::GzDecoder::new(std::fs::File::open(path).unwrap())
+        .read_to_end(&mut out)
+        .unwrap();
+    out
+}
+
+fn writer(ring: &Arc<LogRing>) -> NonBlockingLogWriter {
+    NonBlockingLogWriter {
+        ring: ring.clone(),
+        buffer: Vec::new(),
+    }
+}
+
 #[test]
 fn log_file_max_bytes_is_10mb() {
     assert_eq!(LOG_FILE_MAX_BYTES, 10 * 1024 * 1024);
@@ -25,23 +40,110 @@ fn rotating_file_rotates_while_process_is_running() {
     writer.append(b"four").unwrap();
     writer.file.as_mut().unwrap().flush().unwrap();
     assert_eq!(std::fs::read(&path).unwrap(), b"four");
+    writer.archiver.finish();
     assert_eq!(
-        std::fs::metadata(backup_path(&path, 1)).unwrap().len(),
+        gunzip(&archive_path(&path, 1)).len() as u64,
         LOG_FILE_MAX_BYTES - 2
     );
+    assert!(staged_files(&path).is_empty());
 }
 
 #[test]
 fn non_blocking_writer_enqueues_one_complete_event() {
-    let (sender, receiver) = sync_channel(1);
-    let mut writer = NonBlockingLogWriter {
-        sender,
-        buffer: Vec::new(),
-    };
+    let ring = Arc::new(LogRing::default());
+    let mut writer = writer(&ring);
     writer.write_all(b"{\"message\":").unwrap();
     writer.write_all(b"\"ok\"}\n").unwrap();
     drop(writer);
-    assert_eq!(receiver.recv().unwrap(), b"{\"message\":\"ok\"}\n");
+    let mut batch = Vec::new();
+    assert!(ring.take_batch(&mut batch));
+    assert_eq!(batch, b"{\"message\":\"ok\"}\n");
+}
+
+#[test]
+fn a_full_ring_drops_the_new_event_and_keeps_the_queued_ones() {
+    let ring = LogRing::default();
+    ring.push(vec![b'a'; LOG_RING_MAX_BYTES - 1]).unwrap();
+    assert_eq!(ring.push(b"bc".to_vec()), Err("queue_full"));
+    ring.push(b"d".to_vec()).unwrap();
+
+    let mut batch = Vec::new();
+    assert!(ring.take_batch(&mut batch));
+    assert_eq!(batch.len(), LOG_RING_MAX_BYTES - 1);
+    batch.clear();
+    assert!(ring.take_batch(&mut batch));
+    assert_eq!(batch, b"d");
+
+    ring.close();
+    assert_eq!(ring.push(b"e".to_vec()), Err("writer_disconnected"));
+    assert!(!ring.take_batch(&mut batch));
+}
+
+#[test]
+fn batches_hold_whole_events_up_to_the_batch_cap() {
+    let ring = LogRing::default();
+    let event = vec![b'x'; LOG_BATCH_MAX_BYTES / 3];
+    for _ in 0..4 {
+        ring.push(event.clone()).unwrap();
+    }
+    let mut batch = Vec::new();
+    assert!(ring.take_batch(&mut batch));
+    assert_eq!(batch.len(), 3 * event.len());
+    batch.clear();
+    assert!(ring.take_batch(&mut batch));
+    assert_eq!(batch.len(), event.len());
+}
+
+#[test]
+fn the_writer_thread_appends_queued_events_in_order() {
+    let dir = tempfile::tempdir().unwrap();
+    let path = dir.path().join("test.log");
+    let writer = non_blocking_rotating_writer(path.clone()).unwrap();
+    for n in 0..1_000 {
+        let mut event = writer.clone();
+        writeln!(event, "{{\"n\":{n}}}").unwrap();
+    }
+    writer.wait_written();
+
+    let text = std::fs::read_to_string(&path).unwrap();
+    let lines: Vec<String> = (0..1_000).map(|n| format!("{{\"n\":{n}}}")).collect();
+    assert_eq!(text.lines().collect::<Vec<_>>(), lines);
+}
+
+#[test]
+fn generations_shift_and_plain_backups_age_out() {
+    let dir = tempfile::tempdir().unwrap();
+    let path = dir.path().join("test.log");
+    std::fs::write(backup_path(&path, 1), b"legacy").unwrap();
+    for generation in 1..=LOG_BACKUPS + 1 {
+        let staged = dir.path().join(format!("staged-{generation}"));
+        std::fs::write(&staged, generation.to_string()).unwrap();
+        archive(&path, &staged).unwrap();
+        assert!(!staged.exists());
+    }
+    assert!(!backup_path(&path, 1).exists());
+    assert!(!archive_path(&path, LOG_BACKUPS + 1).exists());
+    for generation in 1..=LOG_BACKUPS {
+        let expected = (LOG_BACKUPS + 2 - generation).to_string();
+        assert_eq!(
+            gunzip(&archive_path(&path, generation)),
+            expected.as_bytes()
+        );
+    }
+}
+
+#[test]
+fn files_staged_by_an_earlier_process_are_archived_at_startup() {
+    let dir = tempfile::tempdir().unwrap();
+    let path = dir.path().join("test.log");
+    let leftover = dir.path().join("test.log.rotating-00000000000000000001");
+    std::fs::write(&leftover, b"left behind").unwrap();
+
+    let mut writer = RotatingFile::open(path.clone()).unwrap();
+    writer.archiver.finish();
+
+    assert!(!leftover.exists());
+    assert_eq!(gunzip(&archive_path(&path, 1)), b"left behind");
 }
 
 #[test]
@@ -49,10 +151,11 @@ fn oversized_existing_log_is_rotated_to_bounded_backup() {
     let dir = tempfile::tempdir().unwrap();
     let path = dir.path().join("test.log");
     std::fs::write(&path, vec![b'x'; LOG_FILE_MAX_BYTES as usize + 1]).unwrap();
-    let writer = RotatingFile::open(path.clone()).unwrap();
+    let mut writer = RotatingFile::open(path.clone()).unwrap();
     assert_eq!(writer.bytes, 0);
+    writer.archiver.finish();
     assert_eq!(
-        std::fs::metadata(backup_path(&path, 1)).unwrap().len(),
+        gunzip(&archive_path(&path, 1)).len() as u64,
         LOG_FILE_MAX_BYTES
     );
 }
@@ -23,7 +23,7 @@ use yarr::{
     AppState, AuthPolicy, AuthPolicyKind, Command, Config, READ_SCOPE, RunMode, WRITE_SCOPE,
     YarrClient, YarrService, acquire_oauth_instance_lock, apply_plugin_options, cli_usage,
     init_logging, parse_args_configured, resolve_auth_policy_kind, resolve_data_dir, rmcp_server,
-    router, run_cli_command, run_doctor, run_setup, run_watch,
+    router, run_cli_command, run_doctor, run_setup, run_watch, run_watch_sources,
 };
 
 fn main() -> Result<()> {
@@ -160,7 +160,13 @@ async fn run_cli(config: Config) -> Result<()> {
             url,
             interval,
             once,
+            sources,
         }) => {
+            if !sources.is_empty() {
+                // Upstream feeds need the service credentials; the health
+                // endpoint joins them only when asked for explicitly.
+                return run_watch_sources(&config.yarr, url, interval, sources).await;
+            }
             // Watch needs the MCP port to build the default URL but no service layer.
             let base = url.unwrap_or_else(|| format!("http://localhost:{}", config.mcp.port));
             run_watch(&base, interval, once).await
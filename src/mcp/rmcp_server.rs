@@ -130,9 +130,11 @@ impl ServerHandler for YarrRmcpServer {
         // directly here in `flat` tool mode; in `codemode` mode `op` is only ever
         // called from inside a script, which never reaches `call_tool` at all —
         // see `codemode_dispatch`) is checked separately by
-        // `is_destructive_op_call`.
+        // `is_destructive_op_call`, as is an `op_batch` carrying any generated
+        // DELETE (one prompt covers the whole batch).
         if (crate::actions::action_is_destructive(&action)
-            || (action == "op" && is_destructive_op_call(&self.state, &tool_name, &arguments)))
+            || (matches!(action.as_str(), "op" | "op_batch")
+                && is_destructive_op_call(&self.state, &tool_name, &arguments)))
             && elicit::gate_destructive(&peer, &action, &tool_name).await
                 == elicit::DeleteGate::Declined
         {
@@ -86,18 +86,30 @@ pub(super) fn tool_result_from_json(value: Value) -> Result<CallToolResult, Erro
 
 /// Whether `arguments` dispatches a generated DELETE operation via the `op`
 /// action (e.g. `{"action": "op", "op": "delete_series_by_id"}` against the
-/// `sonarr` tool in `flat` mode). `action_is_destructive` has no notion of
-/// `op`'s underlying HTTP method, so this is checked separately — otherwise a
-/// generated DELETE op would dispatch through `call_tool` with no elicitation
-/// prompt at all.
+/// `sonarr` tool in `flat` mode) or carries one among `op_batch`'s `items`.
+/// `action_is_destructive` has no notion of `op`'s underlying HTTP method, so
+/// this is checked separately — otherwise a generated DELETE op would dispatch
+/// through `call_tool` with no elicitation prompt at all.
 pub(super) fn is_destructive_op_call(state: &AppState, tool_name: &str, arguments: &Value) -> bool {
-    let Some(op_name) = arguments.get("op").and_then(Value::as_str) else {
-        return false;
-    };
     let Ok(Some(kind)) = state.service.kind_of(tool_name) else {
         return false;
     };
-    crate::openapi::find_operation(kind, op_name).is_some_and(|spec| spec.method.is_delete())
+    let is_delete = |op_name: &str| {
+        crate::openapi::find_operation(kind, op_name.trim())
+            .is_some_and(|spec| spec.method.is_delete())
+    };
+    if let Some(op_name) = arguments.get("op").and_then(Value::as_str) {
+        return is_delete(op_name);
+    }
+    arguments
+        .get("items")
+        .and_then(Value::as_array)
+        .is_some_and(|items| {
+            items
+                .iter()
+                .filter_map(|item| item.get("op").and_then(Value::as_str))
+                .any(is_delete)
+        })
 }
 
 /// Result returned when a destructive action is declined at the elicitation
@@ -43,6 +43,20 @@ pub(super) fn tool_error_result(tool: &str, action: &str, error: &anyhow::Error)
             format!("upstream response was {observed} bytes; limit is {limit} bytes"),
             "narrow or paginate the request; use a supported artifact/export operation for large data",
         ),
+        Some(crate::yarr::UpstreamError::CircuitOpen {
+            retry_after_secs, ..
+        }) => (
+            "upstream_unavailable",
+            format!("the upstream failed repeatedly; requests are paused for {retry_after_secs}s"),
+            "wait for the cooldown, then check the service with service_status",
+        ),
+        Some(crate::yarr::UpstreamError::Saturated {
+            limit, waited_ms, ..
+        }) => (
+            "upstream_saturated",
+            format!("no upstream request slot freed within {waited_ms} ms (current limit {limit})"),
+            "the upstream is responding slowly; retry with fewer concurrent calls",
+        ),
         None if error.downcast_ref::<reqwest::Error>().is_some() => (
             "upstream_transport",
             "the upstream connection failed or timed out".to_owned(),
@@ -184,6 +184,21 @@ fn destructive_op_call_ignores_non_delete_ops() {
     ));
 }
 
+#[test]
+fn destructive_op_call_flags_a_batch_containing_a_delete() {
+    let state = sonarr_only_state();
+    assert!(is_destructive_op_call(
+        &state,
+        "sonarr",
+        &json!({ "items": [{ "op": "get_series" }, { "op": "delete_series_by_id" }] })
+    ));
+    assert!(!is_destructive_op_call(
+        &state,
+        "sonarr",
+        &json!({ "items": [{ "op": "get_series" }, { "args": {} }] })
+    ));
+}
+
 #[test]
 fn destructive_op_call_ignores_unknown_service_or_op() {
     let state = sonarr_only_state();
@@ -82,7 +82,7 @@ pub(super) fn properties(kind: ServiceKind) -> Value {
         json!({
             "type": "array",
             "items": { "type": "string" },
-            "description": "Restrict returned item rows to these field names (for action=list, summary counts still use the full upstream rows)."
+            "description": "Restrict returned item rows to these field names. For action=api_get/op the projection is applied while the upstream JSON is parsed, so large listings stay cheap; for action=list, summary counts still use the full upstream rows."
         }),
     );
 
@@ -153,6 +153,13 @@ fn curated_param_description(param: &str) -> Option<&'static str> {
         "start" | "length" => {
             "Pagination knob for action=stats_history (start=offset, length=page size)."
         }
+        "days" => {
+            "History summaries: only plays started in the last N days (default: all indexed)."
+        }
+        "top" => "History summaries: rows kept in each ranking (default 10, max 100).",
+        "local" => {
+            "History summaries: answer from the local history index without syncing it first."
+        }
         _ => return None,
     })
 }
@@ -154,21 +154,28 @@ fn destructive_inner_call<'a>(state: &AppState, action: &'a YarrAction) -> (bool
         | YarrAction::ApiPost { service, .. }
         | YarrAction::ApiPut { service, .. }
         | YarrAction::ApiDelete { service, .. }
-        | YarrAction::Op { service, .. } => service.as_str(),
+        | YarrAction::Op { service, .. }
+        | YarrAction::OpBatch { service, .. } => service.as_str(),
         YarrAction::Curated { params, .. } => params
             .get("service")
             .and_then(Value::as_str)
             .unwrap_or(YARR_TOOL_NAME),
         _ => YARR_TOOL_NAME,
     };
-    let generated_delete = match action {
-        YarrAction::Op { service, op, .. } => state
+    let is_delete = |service: &str, op: &str| {
+        state
             .service
             .kind_of(service)
             .ok()
             .flatten()
             .and_then(|kind| crate::openapi::find_operation(kind, op))
-            .is_some_and(|spec| spec.method.is_delete()),
+            .is_some_and(|spec| spec.method.is_delete())
+    };
+    let generated_delete = match action {
+        YarrAction::Op { service, op, .. } => is_delete(service, op),
+        YarrAction::OpBatch { service, items, .. } => {
+            items.iter().any(|item| is_delete(service, &item.op))
+        }
         _ => false,
     };
     (
@@ -28,6 +28,8 @@
 //! Per house style every field is `Option<T>` so partial / sync-maindata
 //! variants and unknown upstream fields decode without error.
 
+use std::collections::HashMap;
+
 use schemars::JsonSchema;
 use serde::{Deserialize, Serialize};
 
@@ -335,6 +337,27 @@ pub struct BuildInfo {
     pub bitness: Option<i64>,
 }
 
+/// Incremental main data from `GET /api/v2/sync/maindata?rid=N`.
+///
+/// Pass back the previous response's `rid` to get only what changed since. A
+/// `full_update: true` response replaces all earlier state; qBittorrent sends
+/// one for `rid=0` and whenever it does not recognize the `rid` (for example
+/// after a re-login). In a delta, each `torrents` entry carries only the changed
+/// fields, so rows stay untyped maps to be merged key by key. The entry's key
+/// is the torrent hash; the row itself has no `hash` field. Categories, tags,
+/// and `server_state` are not modelled.
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize, JsonSchema)]
+pub struct SyncMainData {
+    /// Response id to send as `rid` on the next request.
+    pub rid: Option<i64>,
+    /// True when this response is a complete snapshot rather than a delta.
+    pub full_update: Option<bool>,
+    /// New or changed torrents keyed by hash.
+    pub torrents: Option<HashMap<String, serde_json::Map<String, serde_json::Value>>>,
+    /// Hashes of torrents removed since `rid`.
+    pub torrents_removed: Option<Vec<String>>,
+}
+
 #[cfg(test)]
 #[path = "qbittorrent_tests.rs"]
 mod tests;
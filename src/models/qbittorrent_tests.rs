@@ -153,3 +153,20 @@ fn empty_objects_decode_to_all_none() {
     let build: BuildInfo = serde_json::from_value(json!({})).unwrap();
     assert!(build.bitness.is_none());
 }
+
+#[test]
+fn sync_maindata_decodes_a_partial_delta() {
+    let raw = json!({
+        "rid": 15,
+        "torrents": {"abc123": {"dlspeed": 2048, "progress": 0.5}},
+        "torrents_removed": ["def456"],
+        "server_state": {"dl_info_speed": 2048},
+    });
+    let data: SyncMainData = serde_json::from_value(raw).unwrap();
+    assert_eq!(data.rid, Some(15));
+    assert_eq!(data.full_update, None);
+    let torrents = data.torrents.unwrap();
+    assert_eq!(torrents["abc123"].len(), 2);
+    assert_eq!(torrents["abc123"]["dlspeed"], 2048);
+    assert_eq!(data.torrents_removed, Some(vec!["def456".to_string()]));
+}
@@ -4,7 +4,7 @@
 //! Plex) the entire upstream API — every operation and every component type — is
 //! **generated from the vendored OpenAPI specs** under `specs/` by
 //! `cargo xtask gen-openapi`, not hand-written. This module holds the runtime
-//! shapes the generated tables fill in ([`OperationSpec`], [`TypeDef`]), the
+//! shapes the generated tables decode into ([`OperationSpec`], [`TypeDef`]), the
 //! per-kind registry, and the generic executor that turns one
 //! `(service, op, args)` call into an upstream request.
 //!
@@ -13,14 +13,21 @@
 //! regeneration step — there is no hand-rolled curated command or model for these
 //! kinds.
 
+use std::collections::HashMap;
+use std::sync::{OnceLock, PoisonError, RwLock};
+
 use serde_json::Value;
 
 use crate::config::ServiceKind;
 
 // Generated tables (one module per spec-backed service). Each provides
-// `pub static OPERATIONS: &[OperationSpec]` and `pub static TYPES: &[TypeDef]`.
+// `pub static TABLE: CompactTable` (operations sorted by `name`, decoded on
+// first use) and `pub static OMITTED_OPERATIONS: &[OmittedOperationSpec]`.
+mod compact;
 pub mod generated;
 
+pub use compact::CompactTable;
+
 #[cfg(test)]
 #[path = "openapi_tests.rs"]
 mod tests;
@@ -134,6 +141,13 @@ pub struct ParameterSpec {
     pub explode: bool,
 }
 
+impl ParameterSpec {
+    /// [`Self::schema`], parsed once per process.
+    pub fn schema_json(&self) -> &'static Value {
+        parsed_json(self.schema)
+    }
+}
+
 /// Request/response wire encoding selected from an OpenAPI media type.
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum BodyEncoding {
@@ -155,6 +169,18 @@ pub struct RepresentationSpec {
     pub encoding_metadata: &'static str,
 }
 
+impl RepresentationSpec {
+    /// [`Self::schema`], parsed once per process.
+    pub fn schema_json(&self) -> &'static Value {
+        parsed_json(self.schema)
+    }
+
+    /// [`Self::encoding_metadata`], parsed once per process.
+    pub fn encoding_metadata_json(&self) -> &'static Value {
+        parsed_json(self.encoding_metadata)
+    }
+}
+
 #[derive(Debug, Clone, Copy)]
 pub struct RequestBodySpec {
     pub required: bool,
@@ -183,22 +209,16 @@ pub struct TypeDef {
 
 /// Whether a kind's API is generated from an OpenAPI spec (vs the doc-based,
 /// hand-modeled kinds). Drives whether the per-service callable surface comes from
-/// generated operations or the legacy curated commands.
+/// generated operations or the legacy curated commands. Does not decode the table.
 pub fn is_generated(kind: ServiceKind) -> bool {
-    !operations_for_kind(kind).is_empty()
+    compact_table(kind).is_some()
 }
 
 /// The generated operations for a kind (empty for the doc-based kinds).
 pub fn operations_for_kind(kind: ServiceKind) -> &'static [OperationSpec] {
-    match kind {
-        ServiceKind::Sonarr => generated::sonarr::OPERATIONS,
-        ServiceKind::Radarr => generated::radarr::OPERATIONS,
-        ServiceKind::Prowlarr => generated::prowlarr::OPERATIONS,
-        ServiceKind::Overseerr => generated::overseerr::OPERATIONS,
-        ServiceKind::Jellyfin => generated::jellyfin::OPERATIONS,
-        ServiceKind::Plex => generated::plex::OPERATIONS,
-        _ => &[],
-    }
+    decoded(kind)
+        .map(|decoded| decoded.operations)
+        .unwrap_or_default()
 }
 
 /// Explicit support-matrix rows for operations the generator intentionally
@@ -217,20 +237,63 @@ pub fn omitted_operations_for_kind(kind: ServiceKind) -> &'static [OmittedOperat
 
 /// The generated component types for a kind (empty for the doc-based kinds).
 pub fn types_for_kind(kind: ServiceKind) -> &'static [TypeDef] {
+    decoded(kind)
+        .map(|decoded| decoded.types)
+        .unwrap_or_default()
+}
+
+/// A kind's compact table and its slot in the decode cache.
+fn compact_table(kind: ServiceKind) -> Option<(usize, &'static CompactTable)> {
     match kind {
-        ServiceKind::Sonarr => generated::sonarr::TYPES,
-        ServiceKind::Radarr => generated::radarr::TYPES,
-        ServiceKind::Prowlarr => generated::prowlarr::TYPES,
-        ServiceKind::Overseerr => generated::overseerr::TYPES,
-        ServiceKind::Jellyfin => generated::jellyfin::TYPES,
-        ServiceKind::Plex => generated::plex::TYPES,
-        _ => &[],
+        ServiceKind::Sonarr => Some((0, &generated::sonarr::TABLE)),
+        ServiceKind::Radarr => Some((1, &generated::radarr::TABLE)),
+        ServiceKind::Prowlarr => Some((2, &generated::prowlarr::TABLE)),
+        ServiceKind::Overseerr => Some((3, &generated::overseerr::TABLE)),
+        ServiceKind::Jellyfin => Some((4, &generated::jellyfin::TABLE)),
+        ServiceKind::Plex => Some((5, &generated::plex::TABLE)),
+        _ => None,
     }
 }
 
-/// Look up one generated operation by kind + name.
+/// A kind's decoded table, built the first time anything asks for it, so a
+/// process only pays for the services it actually touches.
+fn decoded(kind: ServiceKind) -> Option<&'static compact::Decoded> {
+    static DECODED: [OnceLock<compact::Decoded>; 6] = [const { OnceLock::new() }; 6];
+    let (slot, table) = compact_table(kind)?;
+    Some(DECODED[slot].get_or_init(|| table.decode()))
+}
+
+/// Look up one generated operation by kind + name. The generator emits each
+/// table sorted by name, so this is a binary search rather than a scan.
 pub fn find_operation(kind: ServiceKind, name: &str) -> Option<&'static OperationSpec> {
-    operations_for_kind(kind).iter().find(|op| op.name == name)
+    let operations = operations_for_kind(kind);
+    operations
+        .binary_search_by(|op| op.name.cmp(name))
+        .ok()
+        .map(|index| &operations[index])
+}
+
+/// Parse a generated compact-JSON column once and hand out the shared value.
+/// Keyed by the string's address; generated strings are interned in their
+/// table's pool, so each distinct schema is parsed at most once per process.
+/// Text that fails to parse caches as `Null`.
+fn parsed_json(raw: &'static str) -> &'static Value {
+    type Cache = RwLock<HashMap<(usize, usize), &'static Value>>;
+    static CACHE: OnceLock<Cache> = OnceLock::new();
+    let cache = CACHE.get_or_init(Cache::default);
+    let key = (raw.as_ptr() as usize, raw.len());
+    if let Some(value) = cache
+        .read()
+        .unwrap_or_else(PoisonError::into_inner)
+        .get(&key)
+    {
+        return value;
+    }
+    let mut cache = cache.write().unwrap_or_else(PoisonError::into_inner);
+    cache.entry(key).or_insert_with(|| {
+        // Leaked on purpose: the table is static, so the set of keys is bounded.
+        Box::leak(Box::new(serde_json::from_str(raw).unwrap_or(Value::Null)))
+    })
 }
 
 /// Render a value as a string for use in a path segment or query param. Strings
@@ -0,0 +1,169 @@
+//! The compact encoding `cargo xtask gen-openapi` emits for each service.
+//!
+//! A [`CompactTable`] is a string pool plus rows of integer indexes into it.
+//! Integer rows need no load-time relocations, so a table the process never
+//! asks for costs only file-backed read-only pages that are never touched.
+//! [`CompactTable::decode`] builds the [`OperationSpec`]/[`TypeDef`] slices on
+//! first use; every `&'static str` in them borrows from the pool, so equal
+//! strings (a body schema repeated for three JSON media types, say) share one
+//! address and `parsed_json` parses them once.
+
+use super::{
+    BodyEncoding, HttpMethod, OperationSpec, ParameterLocation, ParameterSpec, ParameterStyle,
+    RepresentationSpec, RequestBodySpec, TypeDef,
+};
+
+/// Enum columns hold the variant's declaration index (`variant as u32`).
+const METHODS: [HttpMethod; 5] = [
+    HttpMethod::Get,
+    HttpMethod::Post,
+    HttpMethod::Put,
+    HttpMethod::Delete,
+    HttpMethod::Patch,
+];
+const LOCATIONS: [ParameterLocation; 4] = [
+    ParameterLocation::Path,
+    ParameterLocation::Query,
+    ParameterLocation::Header,
+    ParameterLocation::Cookie,
+];
+const STYLES: [ParameterStyle; 7] = [
+    ParameterStyle::Simple,
+    ParameterStyle::Label,
+    ParameterStyle::Matrix,
+    ParameterStyle::Form,
+    ParameterStyle::SpaceDelimited,
+    ParameterStyle::PipeDelimited,
+    ParameterStyle::DeepObject,
+];
+const ENCODINGS: [BodyEncoding; 5] = [
+    BodyEncoding::Json,
+    BodyEncoding::FormUrlEncoded,
+    BodyEncoding::Multipart,
+    BodyEncoding::Text,
+    BodyEncoding::Binary,
+];
+
+/// One generated service. String columns are ids into the pool; optional
+/// strings store `id + 1`, with `0` for `None`. List columns are
+/// `(start, len)` pairs into `names`, `parameters` or `representations`,
+/// where each distinct list is laid out once.
+#[derive(Debug)]
+pub struct CompactTable {
+    /// Every distinct string, concatenated.
+    pub strings: &'static str,
+    /// End offset of each string in `strings`; string `i` starts where
+    /// string `i - 1` ends.
+    pub string_ends: &'static [u32],
+    /// Parameter-name lists, as string ids.
+    pub names: &'static [u32],
+    /// `[name, location, required, schema, style, explode]`.
+    pub parameters: &'static [[u32; 6]],
+    /// `[status?, media_type, encoding, schema, encoding_metadata]`.
+    pub representations: &'static [[u32; 5]],
+    /// One row per supported operation, sorted by name: `[name, method, path,
+    /// path_params.., query_params.., parameters.., body, body
+    /// representations.., responses.., request_type?, response_type?, tag,
+    /// summary]`, where `body` is 0 (none), 1 (optional) or 2 (required).
+    pub operations: &'static [[u32; 18]],
+    /// `[name, ts]`.
+    pub types: &'static [[u32; 2]],
+}
+
+/// The slices [`super::operations_for_kind`] and [`super::types_for_kind`]
+/// hand out, decoded once per kind and kept for the life of the process.
+#[derive(Debug)]
+pub(super) struct Decoded {
+    pub(super) operations: &'static [OperationSpec],
+    pub(super) types: &'static [TypeDef],
+}
+
+impl CompactTable {
+    pub(super) fn decode(&'static self) -> Decoded {
+        let names = leak(self.names.iter().map(|&id| self.string(id)).collect());
+        let parameters = leak(
+            self.parameters
+                .iter()
+                .map(|row| ParameterSpec {
+                    name: self.string(row[0]),
+                    location: LOCATIONS[row[1] as usize],
+                    required: row[2] != 0,
+                    schema: self.string(row[3]),
+                    style: STYLES[row[4] as usize],
+                    explode: row[5] != 0,
+                })
+                .collect(),
+        );
+        let representations = leak(
+            self.representations
+                .iter()
+                .map(|row| RepresentationSpec {
+                    status: self.optional(row[0]),
+                    media_type: self.string(row[1]),
+                    encoding: ENCODINGS[row[2] as usize],
+                    schema: self.string(row[3]),
+                    encoding_metadata: self.string(row[4]),
+                })
+                .collect(),
+        );
+        let operations = leak(
+            self.operations
+                .iter()
+                .map(|row| OperationSpec {
+                    name: self.string(row[0]),
+                    method: METHODS[row[1] as usize],
+                    path: self.string(row[2]),
+                    path_params: span(names, row[3], row[4]),
+                    query_params: span(names, row[5], row[6]),
+                    has_body: row[9] != 0,
+                    parameters: span(parameters, row[7], row[8]),
+                    request_body: (row[9] != 0).then(|| RequestBodySpec {
+                        required: row[9] == 2,
+                        representations: span(representations, row[10], row[11]),
+                    }),
+                    responses: span(representations, row[12], row[13]),
+                    request_type: self.optional(row[14]),
+                    response_type: self.optional(row[15]),
+                    tag: self.string(row[16]),
+                    summary: self.string(row[17]),
+                })
+                .collect(),
+        );
+        let types = leak(
+            self.types
+                .iter()
+                .map(|row| TypeDef {
+                    name: self.string(row[0]),
+                    ts: self.string(row[1]),
+                })
+                .collect(),
+        );
+        Decoded { operations, types }
+    }
+
+    fn string(&'static self, id: u32) -> &'static str {
+        let id = id as usize;
+        let start = match id {
+            0 => 0,
+            _ => self.string_ends[id - 1] as usize,
+        };
+        &self.strings[start..self.string_ends[id] as usize]
+    }
+
+    fn optional(&'static self, id: u32) -> Option<&'static str> {
+        id.checked_sub(1).map(|id| self.string(id))
+    }
+}
+
+fn span<T>(items: &'static [T], start: u32, len: u32) -> &'static [T] {
+    &items[start as usize..(start + len) as usize]
+}
+
+// Leaked on purpose: each table is decoded at most once per process.
+fn leak<T>(items: Vec<T>) -> &'static [T] {
+    Box::leak(items.into_boxed_slice())
+}
+
+#[cfg(test)]
+#[path = "compact_tests.rs"]
+mod tests;
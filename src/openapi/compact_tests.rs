@@ -0,0 +1,73 @@
+use super::*;
+
+#[test]
+fn enum_columns_index_variants_in_declaration_order() {
+    for (code, method) in METHODS.into_iter().enumerate() {
+        assert_eq!(method as usize, code);
+    }
+    for (code, location) in LOCATIONS.into_iter().enumerate() {
+        assert_eq!(location as usize, code);
+    }
+    for (code, style) in STYLES.into_iter().enumerate() {
+        assert_eq!(style as usize, code);
+    }
+    for (code, encoding) in ENCODINGS.into_iter().enumerate() {
+        assert_eq!(encoding as usize, code);
+    }
+}
+
+static TABLE: CompactTable = CompactTable {
+    // 0 get_item, 1 /item/{id}, 2 id, 3 {"type":"integer"}, 4 200,
+    // 5 application/json, 6 {"$ref":"Item"}, 7 null, 8 Item, 9 Items, 10 "",
+    // 11 export interface Item {}
+    strings: concat!(
+        "get_item",
+        "/item/{id}",
+        "id",
+        "{\"type\":\"integer\"}",
+        "200",
+        "application/json",
+        "{\"$ref\":\"Item\"}",
+        "null",
+        "Item",
+        "Items",
+        "",
+        "export interface Item {}",
+    ),
+    string_ends: &[8, 18, 20, 38, 41, 57, 72, 76, 80, 85, 85, 109],
+    names: &[2],
+    parameters: &[[2, 0, 1, 3, 0, 0]],
+    representations: &[[5, 5, 0, 6, 7]],
+    operations: &[[0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 9, 9, 10]],
+    types: &[[8, 11]],
+};
+
+#[test]
+fn decoding_borrows_every_string_from_the_pool() {
+    let decoded = TABLE.decode();
+    let [operation] = decoded.operations else {
+        panic!("one operation");
+    };
+    assert_eq!(operation.name, "get_item");
+    assert_eq!(operation.method, HttpMethod::Get);
+    assert_eq!(operation.path, "/item/{id}");
+    assert_eq!(operation.path_params, ["id"]);
+    assert!(operation.query_params.is_empty());
+    assert!(!operation.has_body && operation.request_body.is_none());
+    assert_eq!(operation.parameters[0].location, ParameterLocation::Path);
+    assert!(operation.parameters[0].required);
+    assert_eq!(operation.parameters[0].style, ParameterStyle::Simple);
+    assert_eq!(operation.responses[0].status, Some("200"));
+    assert_eq!(operation.responses[0].schema, "{\"$ref\":\"Item\"}");
+    assert_eq!(operation.request_type, None);
+    assert_eq!(operation.response_type, Some("Item"));
+    assert_eq!(operation.tag, "Items");
+    assert_eq!(operation.summary, "");
+    assert_eq!(decoded.types[0].ts, "export interface Item {}");
+
+    // The parameter name and its path projection are the same pool bytes.
+    assert!(std::ptr::eq(
+        operation.path_params[0],
+        operation.parameters[0].name
+    ));
+}
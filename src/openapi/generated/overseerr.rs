@@ -1,5398 +1,1660 @@
 //! GENERATED by `cargo xtask gen-openapi` from specs/overseerr.openapi.* -- DO NOT EDIT.
 //!
-//! 169 supported operations, 1 omitted operations, 57 component types.
+//! 169 supported operations, 1 omitted operations, 57 component types,
+//! 808 distinct strings. `TABLE.operations` is sorted by name; `find_operation`
+//! binary-searches the decoded slice.
 #![allow(clippy::all)]
-use crate::openapi::{
-    BodyEncoding, HttpMethod, OmittedOperationSpec, OperationSpec, ParameterLocation,
-    ParameterSpec, ParameterStyle, RepresentationSpec, RequestBodySpec, TypeDef,
-};
+use crate::openapi::{CompactTable, HttpMethod, OmittedOperationSpec};
 
-pub static OPERATIONS: &[OperationSpec] = &[
-    OperationSpec {
-        name: "delete_issue_by_issue_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/issue/{issueId}",
-        path_params: &["issueId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "issueId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "issue",
-        summary: "Delete issue",
-    },
-    OperationSpec {
-        name: "delete_issue_comment_by_comment_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/issueComment/{commentId}",
-        path_params: &["commentId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "commentId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "issue",
-        summary: "Delete issue comment",
-    },
-    OperationSpec {
-        name: "delete_media_by_media_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/media/{mediaId}",
-        path_params: &["mediaId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "mediaId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "media",
-        summary: "Delete media item",
-    },
-    OperationSpec {
-        name: "delete_request_by_request_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/request/{requestId}",
-        path_params: &["requestId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "requestId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "request",
-        summary: "Delete request",
-    },
-    OperationSpec {
-        name: "delete_settings_discover_by_slider_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/settings/discover/{sliderId}",
-        path_params: &["sliderId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "sliderId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DiscoverSlider\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DiscoverSlider"),
-        tag: "settings",
-        summary: "Delete slider by ID",
-    },
-    OperationSpec {
-        name: "delete_settings_radarr_by_radarr_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/settings/radarr/{radarrId}",
-        path_params: &["radarrId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "radarrId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/RadarrSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("RadarrSettings"),
-        tag: "settings",
-        summary: "Delete Radarr instance",
-    },
-    OperationSpec {
-        name: "delete_settings_sonarr_by_sonarr_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/settings/sonarr/{sonarrId}",
-        path_params: &["sonarrId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "sonarrId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SonarrSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("SonarrSettings"),
-        tag: "settings",
-        summary: "Delete Sonarr instance",
-    },
-    OperationSpec {
-        name: "delete_user_by_user_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/user/{userId}",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/User\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("User"),
-        tag: "users",
-        summary: "Delete user by ID",
-    },
-    OperationSpec {
-        name: "delete_user_push_subscription_by_endpoint_user_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/user/{userId}/pushSubscription/{endpoint}",
-        path_params: &["endpoint", "userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "endpoint",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "userId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Delete user push subscription by key",
-    },
-    OperationSpec {
-        name: "get_auth_me",
-        method: HttpMethod::Get,
-        path: "/api/v1/auth/me",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/User\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("User"),
-        tag: "auth",
-        summary: "Get logged-in user",
-    },
-    OperationSpec {
-        name: "get_backdrops",
-        method: HttpMethod::Get,
-        path: "/api/v1/backdrops",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"type\":\"string\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "tmdb",
-        summary: "Get backdrops of trending items",
-    },
-    OperationSpec {
-        name: "get_collection_by_collection_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/collection/{collectionId}",
-        path_params: &["collectionId"],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "collectionId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":537982,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Collection\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Collection"),
-        tag: "collection",
-        summary: "Get collection details",
-    },
-    OperationSpec {
-        name: "get_discover_genreslider_movie",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/genreslider/movie",
-        path_params: &[],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "language",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"example\":\"en\",\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"properties\":{\"backdrops\":{\"items\":{\"type\":\"string\"},\"type\":\"array\"},\"id\":{\"example\":1,\"type\":\"number\"},\"name\":{\"example\":\"Genre Name\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Get genre slider data for movies",
-    },
-    OperationSpec {
-        name: "get_discover_genreslider_tv",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/genreslider/tv",
-        path_params: &[],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "language",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"example\":\"en\",\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"properties\":{\"backdrops\":{\"items\":{\"type\":\"string\"},\"type\":\"array\"},\"id\":{\"example\":1,\"type\":\"number\"},\"name\":{\"example\":\"Genre Name\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Get genre slider data for TV series",
-    },
-    OperationSpec {
-        name: "get_discover_keyword_movies_by_keyword_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/keyword/{keywordId}/movies",
-        path_params: &["keywordId"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "keywordId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":207317,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Get movies from keyword",
-    },
-    OperationSpec {
-        name: "get_discover_movies",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/movies",
-        path_params: &[],
-        query_params: &[
-            "genre",
-            "keywords",
-            "language",
-            "page",
-            "primaryReleaseDateGte",
-            "primaryReleaseDateLte",
-            "sortBy",
-            "studio",
-            "voteAverageGte",
-            "voteAverageLte",
-            "voteCountGte",
-            "voteCountLte",
-            "watchProviders",
-            "watchRegion",
-            "withRuntimeGte",
-            "withRuntimeLte",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "genre",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":18,\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "keywords",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"1,2\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "primaryReleaseDateGte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"2022-01-01\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "primaryReleaseDateLte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"2023-01-01\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortBy",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"popularity.desc\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "studio",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "voteAverageGte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":7,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "voteAverageLte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":10,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "voteCountGte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":7,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "voteCountLte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":10,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "watchProviders",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"8|9\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "watchRegion",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"US\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "withRuntimeGte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":60,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "withRuntimeLte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":120,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Discover movies",
-    },
-    OperationSpec {
-        name: "get_discover_movies_genre_by_genre_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/movies/genre/{genreId}",
-        path_params: &["genreId"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "genreId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":\"1\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"genre\":{\"$ref\":\"#/components/schemas/Genre\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Discover movies by genre",
-    },
-    OperationSpec {
-        name: "get_discover_movies_language_by_language",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/movies/language/{language}",
-        path_params: &["language"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"language\":{\"$ref\":\"#/components/schemas/SpokenLanguage\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Discover movies by original language",
-    },
-    OperationSpec {
-        name: "get_discover_movies_studio_by_studio_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/movies/studio/{studioId}",
-        path_params: &["studioId"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "studioId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":\"1\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"studio\":{\"$ref\":\"#/components/schemas/ProductionCompany\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Discover movies by studio",
-    },
-    OperationSpec {
-        name: "get_discover_movies_upcoming",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/movies/upcoming",
-        path_params: &[],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Upcoming movies",
-    },
-    OperationSpec {
-        name: "get_discover_trending",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/trending",
-        path_params: &[],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"anyOf\":[{\"$ref\":\"#/components/schemas/MovieResult\"},{\"$ref\":\"#/components/schemas/TvResult\"},{\"$ref\":\"#/components/schemas/PersonResult\"}]},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Trending movies and TV",
-    },
-    OperationSpec {
-        name: "get_discover_tv",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/tv",
-        path_params: &[],
-        query_params: &[
-            "firstAirDateGte",
-            "firstAirDateLte",
-            "genre",
-            "keywords",
-            "language",
-            "network",
-            "page",
-            "sortBy",
-            "voteAverageGte",
-            "voteAverageLte",
-            "voteCountGte",
-            "voteCountLte",
-            "watchProviders",
-            "watchRegion",
-            "withRuntimeGte",
-            "withRuntimeLte",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "firstAirDateGte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"2022-01-01\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "firstAirDateLte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"2023-01-01\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "genre",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":18,\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "keywords",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"1,2\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "network",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortBy",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"popularity.desc\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "voteAverageGte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":7,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "voteAverageLte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":10,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "voteCountGte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":7,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "voteCountLte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":10,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "watchProviders",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"8|9\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "watchRegion",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"US\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "withRuntimeGte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":60,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "withRuntimeLte",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":120,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Discover TV shows",
-    },
-    OperationSpec {
-        name: "get_discover_tv_genre_by_genre_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/tv/genre/{genreId}",
-        path_params: &["genreId"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "genreId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":\"1\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"genre\":{\"$ref\":\"#/components/schemas/Genre\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Discover TV shows by genre",
-    },
-    OperationSpec {
-        name: "get_discover_tv_language_by_language",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/tv/language/{language}",
-        path_params: &["language"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"language\":{\"$ref\":\"#/components/schemas/SpokenLanguage\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Discover TV shows by original language",
-    },
-    OperationSpec {
-        name: "get_discover_tv_network_by_network_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/tv/network/{networkId}",
-        path_params: &["networkId"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "networkId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":\"1\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"network\":{\"$ref\":\"#/components/schemas/Network\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Discover TV shows by network",
-    },
-    OperationSpec {
-        name: "get_discover_tv_upcoming",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/tv/upcoming",
-        path_params: &[],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Discover Upcoming TV shows",
-    },
-    OperationSpec {
-        name: "get_discover_watchlist",
-        method: HttpMethod::Get,
-        path: "/api/v1/discover/watchlist",
-        path_params: &[],
-        query_params: &["page"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "page",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"type\":\"number\"},\"results\":{\"items\":{\"properties\":{\"ratingKey\":{\"type\":\"string\"},\"title\":{\"type\":\"string\"},\"tmdbId\":{\"example\":1,\"type\":\"number\"},\"type\":{\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"},\"totalPages\":{\"type\":\"number\"},\"totalResults\":{\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Get the Plex watchlist.",
-    },
-    OperationSpec {
-        name: "get_genres_movie",
-        method: HttpMethod::Get,
-        path: "/api/v1/genres/movie",
-        path_params: &[],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "language",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"example\":\"en\",\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"properties\":{\"id\":{\"example\":10751,\"type\":\"number\"},\"name\":{\"example\":\"Family\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "tmdb",
-        summary: "Get list of official TMDB movie genres",
-    },
-    OperationSpec {
-        name: "get_genres_tv",
-        method: HttpMethod::Get,
-        path: "/api/v1/genres/tv",
-        path_params: &[],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "language",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"example\":\"en\",\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"properties\":{\"id\":{\"example\":18,\"type\":\"number\"},\"name\":{\"example\":\"Drama\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "tmdb",
-        summary: "Get list of official TMDB movie genres",
-    },
-    OperationSpec {
-        name: "get_issue",
-        method: HttpMethod::Get,
-        path: "/api/v1/issue",
-        path_params: &[],
-        query_params: &["filter", "requestedBy", "skip", "sort", "take"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "filter",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"open\",\"enum\":[\"all\",\"open\",\"resolved\"],\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "requestedBy",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":1,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "skip",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":0,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sort",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"added\",\"enum\":[\"added\",\"modified\"],\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "take",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":20,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"pageInfo\":{\"$ref\":\"#/components/schemas/PageInfo\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/Issue\"},\"type\":\"array\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "issue",
-        summary: "Get all issues",
-    },
-    OperationSpec {
-        name: "get_issue_by_issue_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/issue/{issueId}",
-        path_params: &["issueId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "issueId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":1,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Issue\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Issue"),
-        tag: "issue",
-        summary: "Get issue",
-    },
-    OperationSpec {
-        name: "get_issue_comment_by_comment_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/issueComment/{commentId}",
-        path_params: &["commentId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "commentId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":1,\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IssueComment\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IssueComment"),
-        tag: "issue",
-        summary: "Get issue comment",
-    },
-    OperationSpec {
-        name: "get_issue_count",
-        method: HttpMethod::Get,
-        path: "/api/v1/issue/count",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"audio\":{\"type\":\"number\"},\"closed\":{\"type\":\"number\"},\"open\":{\"type\":\"number\"},\"others\":{\"type\":\"number\"},\"subtitles\":{\"type\":\"number\"},\"total\":{\"type\":\"number\"},\"video\":{\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "issue",
-        summary: "Gets issue counts",
-    },
-    OperationSpec {
-        name: "get_keyword_by_keyword_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/keyword/{keywordId}",
-        path_params: &["keywordId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "keywordId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":1,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Keyword\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Keyword"),
-        tag: "other",
-        summary: "Get keyword",
-    },
-    OperationSpec {
-        name: "get_languages",
-        method: HttpMethod::Get,
-        path: "/api/v1/languages",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"properties\":{\"english_name\":{\"example\":\"English\",\"type\":\"string\"},\"iso_639_1\":{\"example\":\"en\",\"type\":\"string\"},\"name\":{\"example\":\"English\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "tmdb",
-        summary: "Languages supported by TMDB",
-    },
-    OperationSpec {
-        name: "get_media",
-        method: HttpMethod::Get,
-        path: "/api/v1/media",
-        path_params: &[],
-        query_params: &["filter", "skip", "sort", "take"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "filter",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"enum\":[\"all\",\"available\",\"partial\",\"allavailable\",\"processing\",\"pending\",\"deleted\"],\"nullable\":true,\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "skip",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":0,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sort",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"added\",\"enum\":[\"added\",\"modified\",\"mediaAdded\"],\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "take",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":20,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"pageInfo\":{\"$ref\":\"#/components/schemas/PageInfo\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MediaInfo\"},\"type\":\"array\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "media",
-        summary: "Get media",
-    },
-    OperationSpec {
-        name: "get_media_watch_data_by_media_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/media/{mediaId}/watch_data",
-        path_params: &["mediaId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "mediaId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"data\":{\"properties\":{\"playCount\":{\"type\":\"number\"},\"playCount30Days\":{\"type\":\"number\"},\"playCount7Days\":{\"type\":\"number\"},\"users\":{\"items\":{\"$ref\":\"#/components/schemas/User\"},\"type\":\"array\"}},\"type\":\"object\"},\"data4k\":{\"properties\":{\"playCount\":{\"type\":\"number\"},\"playCount30Days\":{\"type\":\"number\"},\"playCount7Days\":{\"type\":\"number\"},\"users\":{\"items\":{\"$ref\":\"#/components/schemas/User\"},\"type\":\"array\"}},\"type\":\"object\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "media",
-        summary: "Get watch data",
-    },
-    OperationSpec {
-        name: "get_movie_by_movie_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/movie/{movieId}",
-        path_params: &["movieId"],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":337401,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MovieDetails\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MovieDetails"),
-        tag: "movies",
-        summary: "Get movie details",
-    },
-    OperationSpec {
-        name: "get_movie_ratings_by_movie_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/movie/{movieId}/ratings",
-        path_params: &["movieId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "movieId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":337401,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"audienceRating\":{\"enum\":[\"Spilled\",\"Upright\"],\"type\":\"string\"},\"audienceScore\":{\"example\":65,\"type\":\"number\"},\"criticsRating\":{\"enum\":[\"Rotten\",\"Fresh\",\"Certified Fresh\"],\"type\":\"string\"},\"criticsScore\":{\"example\":85,\"type\":\"number\"},\"title\":{\"example\":\"Mulan\",\"type\":\"string\"},\"url\":{\"example\":\"http://www.rottentomatoes.com/m/mulan_2020/\",\"type\":\"string\"},\"year\":{\"example\":2020,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "movies",
-        summary: "Get movie ratings",
-    },
-    OperationSpec {
-        name: "get_movie_ratingscombined_by_movie_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/movie/{movieId}/ratingscombined",
-        path_params: &["movieId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "movieId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":337401,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"imdb\":{\"properties\":{\"criticsScore\":{\"example\":6.5,\"type\":\"number\"},\"title\":{\"example\":\"I am Legend\",\"type\":\"string\"},\"url\":{\"example\":\"https://www.imdb.com/title/tt0480249\",\"type\":\"string\"}},\"type\":\"object\"},\"rt\":{\"properties\":{\"audienceRating\":{\"enum\":[\"Spilled\",\"Upright\"],\"type\":\"string\"},\"audienceScore\":{\"example\":65,\"type\":\"number\"},\"criticsRating\":{\"enum\":[\"Rotten\",\"Fresh\",\"Certified Fresh\"],\"type\":\"string\"},\"criticsScore\":{\"example\":85,\"type\":\"number\"},\"title\":{\"example\":\"Mulan\",\"type\":\"string\"},\"url\":{\"example\":\"http://www.rottentomatoes.com/m/mulan_2020/\",\"type\":\"string\"},\"year\":{\"example\":2020,\"type\":\"number\"}},\"type\":\"object\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "movies",
-        summary: "Get RT and IMDB movie ratings combined",
-    },
-    OperationSpec {
-        name: "get_movie_recommendations_by_movie_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/movie/{movieId}/recommendations",
-        path_params: &["movieId"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":337401,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "movies",
-        summary: "Get recommended movies",
-    },
-    OperationSpec {
-        name: "get_movie_similar_by_movie_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/movie/{movieId}/similar",
-        path_params: &["movieId"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":337401,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "movies",
-        summary: "Get similar movies",
-    },
-    OperationSpec {
-        name: "get_network_by_network_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/network/{networkId}",
-        path_params: &["networkId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "networkId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":1,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ProductionCompany\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ProductionCompany"),
-        tag: "tmdb",
-        summary: "Get TV network details",
-    },
-    OperationSpec {
-        name: "get_person_by_person_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/person/{personId}",
-        path_params: &["personId"],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "personId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":287,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PersonDetails\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PersonDetails"),
-        tag: "person",
-        summary: "Get person details",
-    },
-    OperationSpec {
-        name: "get_person_combined_credits_by_person_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/person/{personId}/combined_credits",
-        path_params: &["personId"],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "personId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":287,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"cast\":{\"items\":{\"$ref\":\"#/components/schemas/CreditCast\"},\"type\":\"array\"},\"crew\":{\"items\":{\"$ref\":\"#/components/schemas/CreditCrew\"},\"type\":\"array\"},\"id\":{\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "person",
-        summary: "Get combined credits",
-    },
-    OperationSpec {
-        name: "get_regions",
-        method: HttpMethod::Get,
-        path: "/api/v1/regions",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"properties\":{\"english_name\":{\"example\":\"United States of America\",\"type\":\"string\"},\"iso_3166_1\":{\"example\":\"US\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "tmdb",
-        summary: "Regions supported by TMDB",
-    },
-    OperationSpec {
-        name: "get_request",
-        method: HttpMethod::Get,
-        path: "/api/v1/request",
-        path_params: &[],
-        query_params: &["filter", "requestedBy", "skip", "sort", "take"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "filter",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"enum\":[\"all\",\"approved\",\"available\",\"pending\",\"processing\",\"unavailable\",\"failed\",\"deleted\",\"completed\"],\"nullable\":true,\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "requestedBy",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":1,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "skip",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":0,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sort",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"added\",\"enum\":[\"added\",\"modified\"],\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "take",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":20,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"pageInfo\":{\"$ref\":\"#/components/schemas/PageInfo\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MediaRequest\"},\"type\":\"array\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "request",
-        summary: "Get all requests",
-    },
-    OperationSpec {
-        name: "get_request_by_request_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/request/{requestId}",
-        path_params: &["requestId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "requestId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MediaRequest\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MediaRequest"),
-        tag: "request",
-        summary: "Get MediaRequest",
-    },
-    OperationSpec {
-        name: "get_request_count",
-        method: HttpMethod::Get,
-        path: "/api/v1/request/count",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"approved\":{\"type\":\"number\"},\"available\":{\"type\":\"number\"},\"declined\":{\"type\":\"number\"},\"movie\":{\"type\":\"number\"},\"pending\":{\"type\":\"number\"},\"processing\":{\"type\":\"number\"},\"total\":{\"type\":\"number\"},\"tv\":{\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "request",
-        summary: "Gets request counts",
-    },
-    OperationSpec {
-        name: "get_search",
-        method: HttpMethod::Get,
-        path: "/api/v1/search",
-        path_params: &[],
-        query_params: &["language", "page", "query"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "query",
-                location: ParameterLocation::Query,
-                required: true,
-                schema: "{\"example\":\"Mulan\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"anyOf\":[{\"$ref\":\"#/components/schemas/MovieResult\"},{\"$ref\":\"#/components/schemas/TvResult\"},{\"$ref\":\"#/components/schemas/PersonResult\"}]},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Search for movies, TV shows, or people",
-    },
-    OperationSpec {
-        name: "get_search_company",
-        method: HttpMethod::Get,
-        path: "/api/v1/search/company",
-        path_params: &[],
-        query_params: &["page", "query"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "query",
-                location: ParameterLocation::Query,
-                required: true,
-                schema: "{\"example\":\"Disney\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/Company\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Search for companies",
-    },
-    OperationSpec {
-        name: "get_search_keyword",
-        method: HttpMethod::Get,
-        path: "/api/v1/search/keyword",
-        path_params: &[],
-        query_params: &["page", "query"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "query",
-                location: ParameterLocation::Query,
-                required: true,
-                schema: "{\"example\":\"christmas\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/Keyword\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "search",
-        summary: "Search for keywords",
-    },
-    OperationSpec {
-        name: "get_service_radarr",
-        method: HttpMethod::Get,
-        path: "/api/v1/service/radarr",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/RadarrSettings\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("RadarrSettings"),
-        tag: "service",
-        summary: "Get non-sensitive Radarr server list",
-    },
-    OperationSpec {
-        name: "get_service_radarr_by_radarr_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/service/radarr/{radarrId}",
-        path_params: &["radarrId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "radarrId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":0,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"profiles\":{\"$ref\":\"#/components/schemas/ServiceProfile\"},\"server\":{\"$ref\":\"#/components/schemas/RadarrSettings\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "service",
-        summary: "Get Radarr server quality profiles and root folders",
-    },
-    OperationSpec {
-        name: "get_service_sonarr",
-        method: HttpMethod::Get,
-        path: "/api/v1/service/sonarr",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/SonarrSettings\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("SonarrSettings"),
-        tag: "service",
-        summary: "Get non-sensitive Sonarr server list",
-    },
-    OperationSpec {
-        name: "get_service_sonarr_by_sonarr_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/service/sonarr/{sonarrId}",
-        path_params: &["sonarrId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "sonarrId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":0,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"profiles\":{\"$ref\":\"#/components/schemas/ServiceProfile\"},\"server\":{\"$ref\":\"#/components/schemas/SonarrSettings\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "service",
-        summary: "Get Sonarr server quality profiles and root folders",
-    },
-    OperationSpec {
-        name: "get_service_sonarr_lookup_by_tmdb_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/service/sonarr/lookup/{tmdbId}",
-        path_params: &["tmdbId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "tmdbId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":0,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/SonarrSeries\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("SonarrSeries"),
-        tag: "service",
-        summary: "Get series from Sonarr",
-    },
-    OperationSpec {
-        name: "get_settings_about",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/about",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"appDataPath\":{\"example\":\"/app/config\",\"type\":\"string\"},\"totalMediaItems\":{\"example\":100,\"type\":\"number\"},\"totalRequests\":{\"example\":100,\"type\":\"number\"},\"tz\":{\"example\":\"Asia/Tokyo\",\"nullable\":true,\"type\":\"string\"},\"version\":{\"example\":\"1.0.0\",\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Get server stats",
-    },
-    OperationSpec {
-        name: "get_settings_cache",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/cache",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"apiCaches\":{\"items\":{\"properties\":{\"id\":{\"example\":\"cache-id\",\"type\":\"string\"},\"name\":{\"example\":\"cache name\",\"type\":\"string\"},\"stats\":{\"properties\":{\"hits\":{\"type\":\"number\"},\"keys\":{\"type\":\"number\"},\"ksize\":{\"type\":\"number\"},\"misses\":{\"type\":\"number\"},\"vsize\":{\"type\":\"number\"}},\"type\":\"object\"}},\"type\":\"object\"},\"type\":\"array\"},\"imageCache\":{\"properties\":{\"tmdb\":{\"properties\":{\"imageCount\":{\"example\":123,\"type\":\"number\"},\"size\":{\"example\":123456,\"type\":\"number\"}},\"type\":\"object\"}},\"type\":\"object\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Get a list of active caches",
-    },
-    OperationSpec {
-        name: "get_settings_discover",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/discover",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DiscoverSlider\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DiscoverSlider"),
-        tag: "settings",
-        summary: "Get all discover sliders",
-    },
-    OperationSpec {
-        name: "get_settings_discover_reset",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/discover/reset",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Reset all discover sliders",
-    },
-    OperationSpec {
-        name: "get_settings_jobs",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/jobs",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/Job\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Job"),
-        tag: "settings",
-        summary: "Get scheduled jobs",
-    },
-    OperationSpec {
-        name: "get_settings_logs",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/logs",
-        path_params: &[],
-        query_params: &["filter", "search", "skip", "take"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "filter",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"debug\",\"enum\":[\"debug\",\"info\",\"warn\",\"error\"],\"nullable\":true,\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "search",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"plex\",\"nullable\":true,\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "skip",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":0,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "take",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":25,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"properties\":{\"label\":{\"example\":\"server\",\"type\":\"string\"},\"level\":{\"example\":\"info\",\"type\":\"string\"},\"message\":{\"example\":\"Server ready on port 5055\",\"type\":\"string\"},\"timestamp\":{\"example\":\"2020-12-15T16:20:00.069Z\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Returns logs",
-    },
-    OperationSpec {
-        name: "get_settings_main",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/main",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MainSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MainSettings"),
-        tag: "settings",
-        summary: "Get main settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_discord",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/discord",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DiscordSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DiscordSettings"),
-        tag: "settings",
-        summary: "Get Discord notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_email",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/email",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationEmailSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NotificationEmailSettings"),
-        tag: "settings",
-        summary: "Get email notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_gotify",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/gotify",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/GotifySettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("GotifySettings"),
-        tag: "settings",
-        summary: "Get Gotify notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_lunasea",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/lunasea",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LunaSeaSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LunaSeaSettings"),
-        tag: "settings",
-        summary: "Get LunaSea notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_pushbullet",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/pushbullet",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PushbulletSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PushbulletSettings"),
-        tag: "settings",
-        summary: "Get Pushbullet notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_pushover",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/pushover",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PushoverSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PushoverSettings"),
-        tag: "settings",
-        summary: "Get Pushover notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_pushover_sounds",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/pushover/sounds",
-        path_params: &[],
-        query_params: &["token"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "token",
-            location: ParameterLocation::Query,
-            required: true,
-            schema: "{\"nullable\":false,\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"properties\":{\"description\":{\"type\":\"string\"},\"name\":{\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Get Pushover sounds",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_slack",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/slack",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SlackSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("SlackSettings"),
-        tag: "settings",
-        summary: "Get Slack notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_telegram",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/telegram",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TelegramSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TelegramSettings"),
-        tag: "settings",
-        summary: "Get Telegram notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_webhook",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/webhook",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/WebhookSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("WebhookSettings"),
-        tag: "settings",
-        summary: "Get webhook notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_notifications_webpush",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/notifications/webpush",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/WebPushSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("WebPushSettings"),
-        tag: "settings",
-        summary: "Get Web Push notification settings",
-    },
-    OperationSpec {
-        name: "get_settings_plex",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/plex",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PlexSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PlexSettings"),
-        tag: "settings",
-        summary: "Get Plex settings",
-    },
-    OperationSpec {
-        name: "get_settings_plex_devices_servers",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/plex/devices/servers",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/PlexDevice\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PlexDevice"),
-        tag: "settings",
-        summary: "Gets the user's available Plex servers",
-    },
-    OperationSpec {
-        name: "get_settings_plex_sync",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/plex/sync",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"currentLibrary\":{\"$ref\":\"#/components/schemas/PlexLibrary\"},\"libraries\":{\"items\":{\"$ref\":\"#/components/schemas/PlexLibrary\"},\"type\":\"array\"},\"progress\":{\"example\":0,\"type\":\"number\"},\"running\":{\"example\":false,\"type\":\"boolean\"},\"total\":{\"example\":100,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Get status of full Plex library scan",
-    },
-    OperationSpec {
-        name: "get_settings_plex_users",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/plex/users",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"properties\":{\"email\":{\"type\":\"string\"},\"id\":{\"type\":\"string\"},\"thumb\":{\"type\":\"string\"},\"title\":{\"type\":\"string\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Get Plex users",
-    },
-    OperationSpec {
-        name: "get_settings_public",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/public",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PublicSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PublicSettings"),
-        tag: "settings",
-        summary: "Get public settings",
-    },
-    OperationSpec {
-        name: "get_settings_radarr",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/radarr",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/RadarrSettings\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("RadarrSettings"),
-        tag: "settings",
-        summary: "Get Radarr settings",
-    },
-    OperationSpec {
-        name: "get_settings_radarr_profiles_by_radarr_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/radarr/{radarrId}/profiles",
-        path_params: &["radarrId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "radarrId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ServiceProfile\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ServiceProfile"),
-        tag: "settings",
-        summary: "Get available Radarr profiles",
-    },
-    OperationSpec {
-        name: "get_settings_sonarr",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/sonarr",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/SonarrSettings\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("SonarrSettings"),
-        tag: "settings",
-        summary: "Get Sonarr settings",
-    },
-    OperationSpec {
-        name: "get_settings_tautulli",
-        method: HttpMethod::Get,
-        path: "/api/v1/settings/tautulli",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TautulliSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TautulliSettings"),
-        tag: "settings",
-        summary: "Get Tautulli settings",
-    },
-    OperationSpec {
-        name: "get_status",
-        method: HttpMethod::Get,
-        path: "/api/v1/status",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"commitTag\":{\"type\":\"string\"},\"commitsBehind\":{\"type\":\"number\"},\"restartRequired\":{\"type\":\"boolean\"},\"updateAvailable\":{\"type\":\"boolean\"},\"version\":{\"example\":\"1.0.0\",\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "public",
-        summary: "Get Overseerr status",
-    },
-    OperationSpec {
-        name: "get_status_appdata",
-        method: HttpMethod::Get,
-        path: "/api/v1/status/appdata",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"appData\":{\"example\":true,\"type\":\"boolean\"},\"appDataPath\":{\"example\":\"/app/config\",\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "public",
-        summary: "Get application data volume status",
-    },
-    OperationSpec {
-        name: "get_studio_by_studio_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/studio/{studioId}",
-        path_params: &["studioId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "studioId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":2,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ProductionCompany\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ProductionCompany"),
-        tag: "tmdb",
-        summary: "Get movie studio details",
-    },
-    OperationSpec {
-        name: "get_tv_by_tv_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/tv/{tvId}",
-        path_params: &["tvId"],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tvId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":76479,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TvDetails\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TvDetails"),
-        tag: "tv",
-        summary: "Get TV details",
-    },
-    OperationSpec {
-        name: "get_tv_ratings_by_tv_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/tv/{tvId}/ratings",
-        path_params: &["tvId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "tvId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":76479,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"criticsRating\":{\"enum\":[\"Rotten\",\"Fresh\"],\"type\":\"string\"},\"criticsScore\":{\"example\":85,\"type\":\"number\"},\"title\":{\"example\":\"The Boys\",\"type\":\"string\"},\"url\":{\"example\":\"http://www.rottentomatoes.com/m/mulan_2020/\",\"type\":\"string\"},\"year\":{\"example\":2019,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "tv",
-        summary: "Get TV ratings",
-    },
-    OperationSpec {
-        name: "get_tv_recommendations_by_tv_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/tv/{tvId}/recommendations",
-        path_params: &["tvId"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tvId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":76479,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "tv",
-        summary: "Get recommended TV series",
-    },
-    OperationSpec {
-        name: "get_tv_season_by_season_id_tv_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/tv/{tvId}/season/{seasonId}",
-        path_params: &["seasonId", "tvId"],
-        query_params: &["language"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seasonId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "tvId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":76479,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Season\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Season"),
-        tag: "tv",
-        summary: "Get season details and episode list",
-    },
-    OperationSpec {
-        name: "get_tv_similar_by_tv_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/tv/{tvId}/similar",
-        path_params: &["tvId"],
-        query_params: &["language", "page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "language",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":\"en\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tvId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":76479,\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "tv",
-        summary: "Get similar TV series",
-    },
-    OperationSpec {
-        name: "get_user",
-        method: HttpMethod::Get,
-        path: "/api/v1/user",
-        path_params: &[],
-        query_params: &["skip", "sort", "take"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "skip",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":0,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sort",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"created\",\"enum\":[\"created\",\"updated\",\"requests\",\"displayname\"],\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "take",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":20,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"pageInfo\":{\"$ref\":\"#/components/schemas/PageInfo\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/User\"},\"type\":\"array\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get all users",
-    },
-    OperationSpec {
-        name: "get_user_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/User\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("User"),
-        tag: "users",
-        summary: "Get user by ID",
-    },
-    OperationSpec {
-        name: "get_user_push_subscription_by_endpoint_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/pushSubscription/{endpoint}",
-        path_params: &["endpoint", "userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "endpoint",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "userId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"auth\":{\"type\":\"string\"},\"endpoint\":{\"type\":\"string\"},\"p256dh\":{\"type\":\"string\"},\"userAgent\":{\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get web push notification settings for a user",
-    },
-    OperationSpec {
-        name: "get_user_push_subscriptions_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/pushSubscriptions",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"auth\":{\"type\":\"string\"},\"endpoint\":{\"type\":\"string\"},\"p256dh\":{\"type\":\"string\"},\"userAgent\":{\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get all web push notification settings for a user",
-    },
-    OperationSpec {
-        name: "get_user_quota_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/quota",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"movie\":{\"properties\":{\"days\":{\"example\":7,\"type\":\"number\"},\"limit\":{\"example\":10,\"type\":\"number\"},\"remaining\":{\"example\":4,\"type\":\"number\"},\"restricted\":{\"example\":false,\"type\":\"boolean\"},\"used\":{\"example\":6,\"type\":\"number\"}},\"type\":\"object\"},\"tv\":{\"properties\":{\"days\":{\"example\":7,\"type\":\"number\"},\"limit\":{\"example\":10,\"type\":\"number\"},\"remaining\":{\"example\":4,\"type\":\"number\"},\"restricted\":{\"example\":false,\"type\":\"boolean\"},\"used\":{\"example\":6,\"type\":\"number\"}},\"type\":\"object\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get quotas for a specific user",
-    },
-    OperationSpec {
-        name: "get_user_requests_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/requests",
-        path_params: &["userId"],
-        query_params: &["skip", "take"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "skip",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":0,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "take",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"example\":20,\"nullable\":true,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "userId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"pageInfo\":{\"$ref\":\"#/components/schemas/PageInfo\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MediaRequest\"},\"type\":\"array\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get requests for a specific user",
-    },
-    OperationSpec {
-        name: "get_user_settings_main_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/settings/main",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"username\":{\"example\":\"Mr User\",\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get general settings for a user",
-    },
-    OperationSpec {
-        name: "get_user_settings_notifications_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/settings/notifications",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/UserSettingsNotifications\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("UserSettingsNotifications"),
-        tag: "users",
-        summary: "Get notification settings for a user",
-    },
-    OperationSpec {
-        name: "get_user_settings_password_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/settings/password",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"hasPassword\":{\"example\":true,\"type\":\"boolean\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get password page informatiom",
-    },
-    OperationSpec {
-        name: "get_user_settings_permissions_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/settings/permissions",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"permissions\":{\"example\":2,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get permission settings for a user",
-    },
-    OperationSpec {
-        name: "get_user_watch_data_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/watch_data",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"playCount\":{\"type\":\"number\"},\"recentlyWatched\":{\"items\":{\"$ref\":\"#/components/schemas/MediaInfo\"},\"type\":\"array\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get watch data",
-    },
-    OperationSpec {
-        name: "get_user_watchlist_by_user_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/user/{userId}/watchlist",
-        path_params: &["userId"],
-        query_params: &["page"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"example\":1,\"type\":\"number\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "userId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"number\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"page\":{\"type\":\"number\"},\"results\":{\"items\":{\"properties\":{\"ratingKey\":{\"type\":\"string\"},\"title\":{\"type\":\"string\"},\"tmdbId\":{\"example\":1,\"type\":\"number\"},\"type\":{\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"},\"totalPages\":{\"type\":\"number\"},\"totalResults\":{\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Get the Plex watchlist for a specific user",
-    },
-    OperationSpec {
-        name: "get_watchproviders_movies",
-        method: HttpMethod::Get,
-        path: "/api/v1/watchproviders/movies",
-        path_params: &[],
-        query_params: &["watchRegion"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "watchRegion",
-            location: ParameterLocation::Query,
-            required: true,
-            schema: "{\"example\":\"US\",\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/WatchProviderDetails\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("WatchProviderDetails"),
-        tag: "other",
-        summary: "Get watch provider movies",
-    },
-    OperationSpec {
-        name: "get_watchproviders_regions",
-        method: HttpMethod::Get,
-        path: "/api/v1/watchproviders/regions",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/WatchProviderRegion\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("WatchProviderRegion"),
-        tag: "other",
-        summary: "Get watch provider regions",
-    },
-    OperationSpec {
-        name: "get_watchproviders_tv",
-        method: HttpMethod::Get,
-        path: "/api/v1/watchproviders/tv",
-        path_params: &[],
-        query_params: &["watchRegion"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "watchRegion",
-            location: ParameterLocation::Query,
-            required: true,
-            schema: "{\"example\":\"US\",\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/WatchProviderDetails\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("WatchProviderDetails"),
-        tag: "other",
-        summary: "Get watch provider series",
-    },
-    OperationSpec {
-        name: "post_auth_local",
-        method: HttpMethod::Post,
-        path: "/api/v1/auth/local",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"email\":{\"type\":\"string\"},\"password\":{\"type\":\"string\"}},\"required\":[\"email\",\"password\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/User\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("User"),
-        tag: "auth",
-        summary: "Sign in using a local account",
-    },
-    OperationSpec {
-        name: "post_auth_logout",
-        method: HttpMethod::Post,
-        path: "/api/v1/auth/logout",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"status\":{\"example\":\"ok\",\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "auth",
-        summary: "Sign out and clear session cookie",
-    },
-    OperationSpec {
-        name: "post_auth_plex",
-        method: HttpMethod::Post,
-        path: "/api/v1/auth/plex",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"authToken\":{\"type\":\"string\"}},\"required\":[\"authToken\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/User\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("User"),
-        tag: "auth",
-        summary: "Sign in using a Plex token",
-    },
-    OperationSpec {
-        name: "post_auth_reset_password",
-        method: HttpMethod::Post,
-        path: "/api/v1/auth/reset-password",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"email\":{\"type\":\"string\"}},\"required\":[\"email\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"status\":{\"example\":\"ok\",\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Send a reset password email",
-    },
-    OperationSpec {
-        name: "post_auth_reset_password_by_guid",
-        method: HttpMethod::Post,
-        path: "/api/v1/auth/reset-password/{guid}",
-        path_params: &["guid"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "guid",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":\"9afef5a7-ec89-4d5f-9397-261e96970b50\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"password\":{\"type\":\"string\"}},\"required\":[\"password\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"status\":{\"example\":\"ok\",\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Reset the password for a user",
-    },
-    OperationSpec {
-        name: "post_issue",
-        method: HttpMethod::Post,
-        path: "/api/v1/issue",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"issueType\":{\"type\":\"number\"},\"mediaId\":{\"type\":\"number\"},\"message\":{\"type\":\"string\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("201"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Issue\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Issue"),
-        tag: "issue",
-        summary: "Create new issue",
-    },
-    OperationSpec {
-        name: "post_issue_by_issue_id_status",
-        method: HttpMethod::Post,
-        path: "/api/v1/issue/{issueId}/{status}",
-        path_params: &["issueId", "status"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "issueId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":\"1\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "status",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"enum\":[\"open\",\"resolved\"],\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Issue\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Issue"),
-        tag: "issue",
-        summary: "Update an issue's status",
-    },
-    OperationSpec {
-        name: "post_issue_comment_by_issue_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/issue/{issueId}/comment",
-        path_params: &["issueId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "issueId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":1,\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"message\":{\"type\":\"string\"}},\"required\":[\"message\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Issue\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Issue"),
-        tag: "issue",
-        summary: "Create a comment",
-    },
-    OperationSpec {
-        name: "post_media_by_media_id_status",
-        method: HttpMethod::Post,
-        path: "/api/v1/media/{mediaId}/{status}",
-        path_params: &["mediaId", "status"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "mediaId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "status",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"enum\":[\"available\",\"partial\",\"processing\",\"pending\",\"unknown\",\"deleted\"],\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"is4k\":{\"example\":false,\"type\":\"boolean\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MediaInfo\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MediaInfo"),
-        tag: "media",
-        summary: "Update media status",
-    },
-    OperationSpec {
-        name: "post_request",
-        method: HttpMethod::Post,
-        path: "/api/v1/request",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"is4k\":{\"example\":false,\"type\":\"boolean\"},\"languageProfileId\":{\"type\":\"number\"},\"mediaId\":{\"example\":123,\"type\":\"number\"},\"mediaType\":{\"enum\":[\"movie\",\"tv\"],\"example\":\"movie\",\"type\":\"string\"},\"profileId\":{\"type\":\"number\"},\"rootFolder\":{\"type\":\"string\"},\"seasons\":{\"oneOf\":[{\"items\":{\"minimum\":0,\"type\":\"number\"},\"type\":\"array\"},{\"enum\":[\"all\"],\"type\":\"string\"}]},\"serverId\":{\"type\":\"number\"},\"tvdbId\":{\"example\":123,\"type\":\"number\"},\"userId\":{\"nullable\":true,\"type\":\"number\"}},\"required\":[\"mediaType\",\"mediaId\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("201"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MediaRequest\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MediaRequest"),
-        tag: "request",
-        summary: "Create new request",
-    },
-    OperationSpec {
-        name: "post_request_by_request_id_status",
-        method: HttpMethod::Post,
-        path: "/api/v1/request/{requestId}/{status}",
-        path_params: &["requestId", "status"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "requestId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"example\":\"1\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "status",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"enum\":[\"approve\",\"decline\"],\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MediaRequest\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MediaRequest"),
-        tag: "request",
-        summary: "Update a request's status",
-    },
-    OperationSpec {
-        name: "post_request_retry_by_request_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/request/{requestId}/retry",
-        path_params: &["requestId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "requestId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":\"1\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MediaRequest\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MediaRequest"),
-        tag: "request",
-        summary: "Retry failed request",
-    },
-    OperationSpec {
-        name: "post_settings_cache_flush_by_cache_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/cache/{cacheId}/flush",
-        path_params: &["cacheId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "cacheId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Flush a specific cache",
-    },
-    OperationSpec {
-        name: "post_settings_discover",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/discover",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DiscoverSlider\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DiscoverSlider\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DiscoverSlider"),
-        response_type: Some("DiscoverSlider"),
-        tag: "settings",
-        summary: "Batch update all sliders.",
-    },
-    OperationSpec {
-        name: "post_settings_discover_add",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/discover/add",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"data\":{\"example\":\"1\",\"type\":\"string\"},\"title\":{\"example\":\"New Slider\",\"type\":\"string\"},\"type\":{\"example\":1,\"type\":\"number\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DiscoverSlider\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DiscoverSlider"),
-        tag: "settings",
-        summary: "Add a new slider",
-    },
-    OperationSpec {
-        name: "post_settings_initialize",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/initialize",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PublicSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PublicSettings"),
-        tag: "settings",
-        summary: "Initialize application",
-    },
-    OperationSpec {
-        name: "post_settings_jobs_cancel_by_job_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/jobs/{jobId}/cancel",
-        path_params: &["jobId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "jobId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Job\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Job"),
-        tag: "settings",
-        summary: "Cancel a specific job",
-    },
-    OperationSpec {
-        name: "post_settings_jobs_run_by_job_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/jobs/{jobId}/run",
-        path_params: &["jobId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "jobId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Job\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Job"),
-        tag: "settings",
-        summary: "Invoke a specific job",
-    },
-    OperationSpec {
-        name: "post_settings_jobs_schedule_by_job_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/jobs/{jobId}/schedule",
-        path_params: &["jobId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "jobId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"schedule\":{\"example\":\"0 */5 * * * *\",\"type\":\"string\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/Job\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("Job"),
-        tag: "settings",
-        summary: "Modify job schedule",
-    },
-    OperationSpec {
-        name: "post_settings_main",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/main",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MainSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MainSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("MainSettings"),
-        response_type: Some("MainSettings"),
-        tag: "settings",
-        summary: "Update main settings",
-    },
-    OperationSpec {
-        name: "post_settings_main_regenerate",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/main/regenerate",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MainSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MainSettings"),
-        tag: "settings",
-        summary: "Get main settings with newly-generated API key",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_discord",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/discord",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DiscordSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DiscordSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DiscordSettings"),
-        response_type: Some("DiscordSettings"),
-        tag: "settings",
-        summary: "Update Discord notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_discord_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/discord/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DiscordSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DiscordSettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test Discord settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_email",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/email",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationEmailSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationEmailSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("NotificationEmailSettings"),
-        response_type: Some("NotificationEmailSettings"),
-        tag: "settings",
-        summary: "Update email notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_email_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/email/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationEmailSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("NotificationEmailSettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test email settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_gotify",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/gotify",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/GotifySettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/GotifySettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("GotifySettings"),
-        response_type: Some("GotifySettings"),
-        tag: "settings",
-        summary: "Update Gotify notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_gotify_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/gotify/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/GotifySettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("GotifySettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test Gotify settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_lunasea",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/lunasea",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/LunaSeaSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LunaSeaSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("LunaSeaSettings"),
-        response_type: Some("LunaSeaSettings"),
-        tag: "settings",
-        summary: "Update LunaSea notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_lunasea_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/lunasea/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/LunaSeaSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("LunaSeaSettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test LunaSea settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_pushbullet",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/pushbullet",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/PushbulletSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PushbulletSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("PushbulletSettings"),
-        response_type: Some("PushbulletSettings"),
-        tag: "settings",
-        summary: "Update Pushbullet notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_pushbullet_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/pushbullet/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/PushbulletSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("PushbulletSettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test Pushbullet settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_pushover",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/pushover",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/PushoverSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PushoverSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("PushoverSettings"),
-        response_type: Some("PushoverSettings"),
-        tag: "settings",
-        summary: "Update Pushover notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_pushover_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/pushover/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/PushoverSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("PushoverSettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test Pushover settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_slack",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/slack",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/SlackSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SlackSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("SlackSettings"),
-        response_type: Some("SlackSettings"),
-        tag: "settings",
-        summary: "Update Slack notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_slack_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/slack/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/SlackSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("SlackSettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test Slack settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_telegram",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/telegram",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TelegramSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TelegramSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("TelegramSettings"),
-        response_type: Some("TelegramSettings"),
-        tag: "settings",
-        summary: "Update Telegram notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_telegram_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/telegram/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TelegramSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("TelegramSettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test Telegram settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_webhook",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/webhook",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/WebhookSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/WebhookSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("WebhookSettings"),
-        response_type: Some("WebhookSettings"),
-        tag: "settings",
-        summary: "Update webhook notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_webhook_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/webhook/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/WebhookSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("WebhookSettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test webhook settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_webpush",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/webpush",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/WebPushSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/WebPushSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("WebPushSettings"),
-        response_type: Some("WebPushSettings"),
-        tag: "settings",
-        summary: "Update Web Push notification settings",
-    },
-    OperationSpec {
-        name: "post_settings_notifications_webpush_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/notifications/webpush/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/WebPushSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("WebPushSettings"),
-        response_type: None,
-        tag: "settings",
-        summary: "Test Web Push settings",
-    },
-    OperationSpec {
-        name: "post_settings_plex",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/plex",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/PlexSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PlexSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("PlexSettings"),
-        response_type: Some("PlexSettings"),
-        tag: "settings",
-        summary: "Update Plex settings",
-    },
-    OperationSpec {
-        name: "post_settings_plex_sync",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/plex/sync",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"cancel\":{\"example\":false,\"type\":\"boolean\"},\"start\":{\"example\":false,\"type\":\"boolean\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"currentLibrary\":{\"$ref\":\"#/components/schemas/PlexLibrary\"},\"libraries\":{\"items\":{\"$ref\":\"#/components/schemas/PlexLibrary\"},\"type\":\"array\"},\"progress\":{\"example\":0,\"type\":\"number\"},\"running\":{\"example\":false,\"type\":\"boolean\"},\"total\":{\"example\":100,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Start full Plex library scan",
-    },
-    OperationSpec {
-        name: "post_settings_radarr",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/radarr",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RadarrSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("201"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/RadarrSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("RadarrSettings"),
-        response_type: Some("RadarrSettings"),
-        tag: "settings",
-        summary: "Create Radarr instance",
-    },
-    OperationSpec {
-        name: "post_settings_radarr_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/radarr/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"apiKey\":{\"example\":\"yourapikey\",\"type\":\"string\"},\"baseUrl\":{\"type\":\"string\"},\"hostname\":{\"example\":\"127.0.0.1\",\"type\":\"string\"},\"port\":{\"example\":7878,\"type\":\"number\"},\"useSsl\":{\"example\":false,\"type\":\"boolean\"}},\"required\":[\"hostname\",\"port\",\"apiKey\",\"useSsl\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"profiles\":{\"items\":{\"$ref\":\"#/components/schemas/ServiceProfile\"},\"type\":\"array\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Test Radarr configuration",
-    },
-    OperationSpec {
-        name: "post_settings_sonarr",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/sonarr",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/SonarrSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("201"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SonarrSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("SonarrSettings"),
-        response_type: Some("SonarrSettings"),
-        tag: "settings",
-        summary: "Create Sonarr instance",
-    },
-    OperationSpec {
-        name: "post_settings_sonarr_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/sonarr/test",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"apiKey\":{\"example\":\"yourapikey\",\"type\":\"string\"},\"baseUrl\":{\"type\":\"string\"},\"hostname\":{\"example\":\"127.0.0.1\",\"type\":\"string\"},\"port\":{\"example\":8989,\"type\":\"number\"},\"useSsl\":{\"example\":false,\"type\":\"boolean\"}},\"required\":[\"hostname\",\"port\",\"apiKey\",\"useSsl\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"profiles\":{\"items\":{\"$ref\":\"#/components/schemas/ServiceProfile\"},\"type\":\"array\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "settings",
-        summary: "Test Sonarr configuration",
-    },
-    OperationSpec {
-        name: "post_settings_tautulli",
-        method: HttpMethod::Post,
-        path: "/api/v1/settings/tautulli",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TautulliSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TautulliSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("TautulliSettings"),
-        response_type: Some("TautulliSettings"),
-        tag: "settings",
-        summary: "Update Tautulli settings",
-    },
-    OperationSpec {
-        name: "post_user",
-        method: HttpMethod::Post,
-        path: "/api/v1/user",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"email\":{\"example\":\"hey@itsme.com\",\"type\":\"string\"},\"permissions\":{\"type\":\"number\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("201"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/User\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("User"),
-        tag: "users",
-        summary: "Create new user",
-    },
-    OperationSpec {
-        name: "post_user_import_from_plex",
-        method: HttpMethod::Post,
-        path: "/api/v1/user/import-from-plex",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"plexIds\":{\"items\":{\"type\":\"string\"},\"type\":\"array\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("201"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/User\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("User"),
-        tag: "users",
-        summary: "Import all users from Plex",
-    },
-    OperationSpec {
-        name: "post_user_register_push_subscription",
-        method: HttpMethod::Post,
-        path: "/api/v1/user/registerPushSubscription",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"auth\":{\"type\":\"string\"},\"endpoint\":{\"type\":\"string\"},\"p256dh\":{\"type\":\"string\"},\"userAgent\":{\"type\":\"string\"}},\"required\":[\"endpoint\",\"auth\",\"p256dh\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Register a web push /user/registerPushSubscription",
-    },
-    OperationSpec {
-        name: "post_user_settings_main_by_user_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/user/{userId}/settings/main",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"username\":{\"nullable\":true,\"type\":\"string\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"username\":{\"example\":\"Mr User\",\"type\":\"string\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Update general settings for a user",
-    },
-    OperationSpec {
-        name: "post_user_settings_notifications_by_user_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/user/{userId}/settings/notifications",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UserSettingsNotifications\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/UserSettingsNotifications\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("UserSettingsNotifications"),
-        response_type: Some("UserSettingsNotifications"),
-        tag: "users",
-        summary: "Update notification settings for a user",
-    },
-    OperationSpec {
-        name: "post_user_settings_password_by_user_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/user/{userId}/settings/password",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"currentPassword\":{\"nullable\":true,\"type\":\"string\"},\"newPassword\":{\"type\":\"string\"}},\"required\":[\"newPassword\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Update password for a user",
-    },
-    OperationSpec {
-        name: "post_user_settings_permissions_by_user_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/user/{userId}/settings/permissions",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"permissions\":{\"type\":\"number\"}},\"required\":[\"permissions\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"properties\":{\"permissions\":{\"example\":2,\"type\":\"number\"}},\"type\":\"object\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: None,
-        tag: "users",
-        summary: "Update permission settings for a user",
-    },
-    OperationSpec {
-        name: "put_issue_comment_by_comment_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/issueComment/{commentId}",
-        path_params: &["commentId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "commentId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"example\":1,\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"message\":{\"type\":\"string\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IssueComment\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IssueComment"),
-        tag: "issue",
-        summary: "Update issue comment",
-    },
-    OperationSpec {
-        name: "put_request_by_request_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/request/{requestId}",
-        path_params: &["requestId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "requestId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"is4k\":{\"example\":false,\"type\":\"boolean\"},\"languageProfileId\":{\"type\":\"number\"},\"mediaType\":{\"enum\":[\"movie\",\"tv\"],\"type\":\"string\"},\"profileId\":{\"type\":\"number\"},\"rootFolder\":{\"type\":\"string\"},\"seasons\":{\"items\":{\"minimum\":0,\"type\":\"number\"},\"type\":\"array\"},\"serverId\":{\"type\":\"number\"},\"userId\":{\"nullable\":true,\"type\":\"number\"}},\"required\":[\"mediaType\"],\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MediaRequest\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MediaRequest"),
-        tag: "request",
-        summary: "Update MediaRequest",
-    },
-    OperationSpec {
-        name: "put_settings_discover_by_slider_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/settings/discover/{sliderId}",
-        path_params: &["sliderId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "sliderId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"data\":{\"example\":\"1\",\"type\":\"string\"},\"title\":{\"example\":\"Slider Title\",\"type\":\"string\"},\"type\":{\"example\":1,\"type\":\"number\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DiscoverSlider\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DiscoverSlider"),
-        tag: "settings",
-        summary: "Update a single slider",
-    },
-    OperationSpec {
-        name: "put_settings_radarr_by_radarr_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/settings/radarr/{radarrId}",
-        path_params: &["radarrId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "radarrId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RadarrSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/RadarrSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("RadarrSettings"),
-        response_type: Some("RadarrSettings"),
-        tag: "settings",
-        summary: "Update Radarr instance",
-    },
-    OperationSpec {
-        name: "put_settings_sonarr_by_sonarr_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/settings/sonarr/{sonarrId}",
-        path_params: &["sonarrId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "sonarrId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/SonarrSettings\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SonarrSettings\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("SonarrSettings"),
-        response_type: Some("SonarrSettings"),
-        tag: "settings",
-        summary: "Update Sonarr instance",
-    },
-    OperationSpec {
-        name: "put_user",
-        method: HttpMethod::Put,
-        path: "/api/v1/user",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"properties\":{\"ids\":{\"items\":{\"type\":\"integer\"},\"type\":\"array\"},\"permissions\":{\"type\":\"integer\"}},\"type\":\"object\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/User\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("User"),
-        tag: "users",
-        summary: "Update batch of users",
-    },
-    OperationSpec {
-        name: "put_user_by_user_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/user/{userId}",
-        path_params: &["userId"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "userId",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"number\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/User\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/User\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("User"),
-        response_type: Some("User"),
-        tag: "users",
-        summary: "Update a user by user ID",
-    },
-];
+pub static TABLE: CompactTable = CompactTable {
+    strings: concat!(
+        "delete_issue_by_issue_id",
+        "/api/v1/issue/{issueId}",
+        "issueId",
+        "{\"type\":\"string\"}",
+        "issue",
+        "Delete issue",
+        "delete_issue_comment_by_comment_id",
+        "/api/v1/issueComment/{commentId}",
+        "commentId",
+        "Delete issue comment",
+        "delete_media_by_media_id",
+        "/api/v1/media/{mediaId}",
+        "mediaId",
+        "media",
+        "Delete media item",
+        "delete_request_by_request_id",
+        "/api/v1/request/{requestId}",
+        "requestId",
+        "request",
+        "Delete request",
+        "delete_settings_discover_by_slider_id",
+        "/api/v1/settings/discover/{sliderId}",
+        "sliderId",
+        "{\"type\":\"number\"}",
+        "200",
+        "application/json",
+        "{\"$ref\":\"#/components/schemas/DiscoverSlider\"}",
+        "null",
+        "DiscoverSlider",
+        "settings",
+        "Delete slider by ID",
+        "delete_settings_radarr_by_radarr_id",
+        "/api/v1/settings/radarr/{radarrId}",
+        "radarrId",
+        "{\"type\":\"integer\"}",
+        "{\"$ref\":\"#/components/schemas/RadarrSettings\"}",
+        "RadarrSettings",
+        "Delete Radarr instance",
+        "delete_settings_sonarr_by_sonarr_id",
+        "/api/v1/settings/sonarr/{sonarrId}",
+        "sonarrId",
+        "{\"$ref\":\"#/components/schemas/SonarrSettings\"}",
+        "SonarrSettings",
+        "Delete Sonarr instance",
+        "delete_user_by_user_id",
+        "/api/v1/user/{userId}",
+        "userId",
+        "{\"$ref\":\"#/components/schemas/User\"}",
+        "User",
+        "users",
+        "Delete user by ID",
+        "delete_user_push_subscription_by_endpoint_user_id",
+        "/api/v1/user/{userId}/pushSubscription/{endpoint}",
+        "endpoint",
+        "Delete user push subscription by key",
+        "get_auth_me",
+        "/api/v1/auth/me",
+        "auth",
+        "Get logged-in user",
+        "get_backdrops",
+        "/api/v1/backdrops",
+        "{\"items\":{\"type\":\"string\"},\"type\":\"array\"}",
+        "tmdb",
+        "Get backdrops of trending items",
+        "get_collection_by_collection_id",
+        "/api/v1/collection/{collectionId}",
+        "collectionId",
+        "language",
+        "{\"example\":537982,\"type\":\"number\"}",
+        "{\"example\":\"en\",\"type\":\"string\"}",
+        "{\"$ref\":\"#/components/schemas/Collection\"}",
+        "Collection",
+        "collection",
+        "Get collection details",
+        "get_discover_genreslider_movie",
+        "/api/v1/discover/genreslider/movie",
+        "{\"items\":{\"properties\":{\"backdrops\":{\"items\":{\"type\":\"string\"},\"type\":\"array\"},\"id\":{\"example\":1,\"type\":\"number\"},\"name\":{\"example\":\"Genre Name\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
+        "search",
+        "Get genre slider data for movies",
+        "get_discover_genreslider_tv",
+        "/api/v1/discover/genreslider/tv",
+        "Get genre slider data for TV series",
+        "get_discover_keyword_movies_by_keyword_id",
+        "/api/v1/discover/keyword/{keywordId}/movies",
+        "keywordId",
+        "page",
+        "{\"example\":207317,\"type\":\"number\"}",
+        "{\"default\":1,\"example\":1,\"type\":\"number\"}",
+        "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Get movies from keyword",
+        "get_discover_movies",
+        "/api/v1/discover/movies",
+        "genre",
+        "keywords",
+        "primaryReleaseDateGte",
+        "primaryReleaseDateLte",
+        "sortBy",
+        "studio",
+        "voteAverageGte",
+        "voteAverageLte",
+        "voteCountGte",
+        "voteCountLte",
+        "watchProviders",
+        "watchRegion",
+        "withRuntimeGte",
+        "withRuntimeLte",
+        "{\"example\":18,\"type\":\"string\"}",
+        "{\"example\":\"1,2\",\"type\":\"string\"}",
+        "{\"example\":\"2022-01-01\",\"type\":\"string\"}",
+        "{\"example\":\"2023-01-01\",\"type\":\"string\"}",
+        "{\"example\":\"popularity.desc\",\"type\":\"string\"}",
+        "{\"example\":1,\"type\":\"number\"}",
+        "{\"example\":7,\"type\":\"number\"}",
+        "{\"example\":10,\"type\":\"number\"}",
+        "{\"example\":\"8|9\",\"type\":\"string\"}",
+        "{\"example\":\"US\",\"type\":\"string\"}",
+        "{\"example\":60,\"type\":\"number\"}",
+        "{\"example\":120,\"type\":\"number\"}",
+        "Discover movies",
+        "get_discover_movies_genre_by_genre_id",
+        "/api/v1/discover/movies/genre/{genreId}",
+        "genreId",
+        "{\"example\":\"1\",\"type\":\"string\"}",
+        "{\"properties\":{\"genre\":{\"$ref\":\"#/components/schemas/Genre\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Discover movies by genre",
+        "get_discover_movies_language_by_language",
+        "/api/v1/discover/movies/language/{language}",
+        "{\"properties\":{\"language\":{\"$ref\":\"#/components/schemas/SpokenLanguage\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Discover movies by original language",
+        "get_discover_movies_studio_by_studio_id",
+        "/api/v1/discover/movies/studio/{studioId}",
+        "studioId",
+        "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MovieResult\"},\"type\":\"array\"},\"studio\":{\"$ref\":\"#/components/schemas/ProductionCompany\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Discover movies by studio",
+        "get_discover_movies_upcoming",
+        "/api/v1/discover/movies/upcoming",
+        "Upcoming movies",
+        "get_discover_trending",
+        "/api/v1/discover/trending",
+        "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"anyOf\":[{\"$ref\":\"#/components/schemas/MovieResult\"},{\"$ref\":\"#/components/schemas/TvResult\"},{\"$ref\":\"#/components/schemas/PersonResult\"}]},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Trending movies and TV",
+        "get_discover_tv",
+        "/api/v1/discover/tv",
+        "firstAirDateGte",
+        "firstAirDateLte",
+        "network",
+        "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Discover TV shows",
+        "get_discover_tv_genre_by_genre_id",
+        "/api/v1/discover/tv/genre/{genreId}",
+        "{\"properties\":{\"genre\":{\"$ref\":\"#/components/schemas/Genre\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Discover TV shows by genre",
+        "get_discover_tv_language_by_language",
+        "/api/v1/discover/tv/language/{language}",
+        "{\"properties\":{\"language\":{\"$ref\":\"#/components/schemas/SpokenLanguage\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Discover TV shows by original language",
+        "get_discover_tv_network_by_network_id",
+        "/api/v1/discover/tv/network/{networkId}",
+        "networkId",
+        "{\"properties\":{\"network\":{\"$ref\":\"#/components/schemas/Network\"},\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/TvResult\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Discover TV shows by network",
+        "get_discover_tv_upcoming",
+        "/api/v1/discover/tv/upcoming",
+        "Discover Upcoming TV shows",
+        "get_discover_watchlist",
+        "/api/v1/discover/watchlist",
+        "{\"properties\":{\"page\":{\"type\":\"number\"},\"results\":{\"items\":{\"properties\":{\"ratingKey\":{\"type\":\"string\"},\"title\":{\"type\":\"string\"},\"tmdbId\":{\"example\":1,\"type\":\"number\"},\"type\":{\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"},\"totalPages\":{\"type\":\"number\"},\"totalResults\":{\"type\":\"number\"}},\"type\":\"object\"}",
+        "Get the Plex watchlist.",
+        "get_genres_movie",
+        "/api/v1/genres/movie",
+        "{\"items\":{\"properties\":{\"id\":{\"example\":10751,\"type\":\"number\"},\"name\":{\"example\":\"Family\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
+        "Get list of official TMDB movie genres",
+        "get_genres_tv",
+        "/api/v1/genres/tv",
+        "{\"items\":{\"properties\":{\"id\":{\"example\":18,\"type\":\"number\"},\"name\":{\"example\":\"Drama\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
+        "get_issue",
+        "/api/v1/issue",
+        "filter",
+        "requestedBy",
+        "skip",
+        "sort",
+        "take",
+        "{\"default\":\"open\",\"enum\":[\"all\",\"open\",\"resolved\"],\"type\":\"string\"}",
+        "{\"example\":1,\"nullable\":true,\"type\":\"number\"}",
+        "{\"example\":0,\"nullable\":true,\"type\":\"number\"}",
+        "{\"default\":\"added\",\"enum\":[\"added\",\"modified\"],\"type\":\"string\"}",
+        "{\"example\":20,\"nullable\":true,\"type\":\"number\"}",
+        "{\"properties\":{\"pageInfo\":{\"$ref\":\"#/components/schemas/PageInfo\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/Issue\"},\"type\":\"array\"}},\"type\":\"object\"}",
+        "Get all issues",
+        "get_issue_by_issue_id",
+        "{\"$ref\":\"#/components/schemas/Issue\"}",
+        "Issue",
+        "Get issue",
+        "get_issue_comment_by_comment_id",
+        "{\"example\":1,\"type\":\"string\"}",
+        "{\"$ref\":\"#/components/schemas/IssueComment\"}",
+        "IssueComment",
+        "Get issue comment",
+        "get_issue_count",
+        "/api/v1/issue/count",
+        "{\"properties\":{\"audio\":{\"type\":\"number\"},\"closed\":{\"type\":\"number\"},\"open\":{\"type\":\"number\"},\"others\":{\"type\":\"number\"},\"subtitles\":{\"type\":\"number\"},\"total\":{\"type\":\"number\"},\"video\":{\"type\":\"number\"}},\"type\":\"object\"}",
+        "Gets issue counts",
+        "get_keyword_by_keyword_id",
+        "/api/v1/keyword/{keywordId}",
+        "{\"$ref\":\"#/components/schemas/Keyword\"}",
+        "Keyword",
+        "other",
+        "Get keyword",
+        "get_languages",
+        "/api/v1/languages",
+        "{\"items\":{\"properties\":{\"english_name\":{\"example\":\"English\",\"type\":\"string\"},\"iso_639_1\":{\"example\":\"en\",\"type\":\"string\"},\"name\":{\"example\":\"English\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
+        "Languages supported by TMDB",
+        "get_media",
+        "/api/v1/media",
+        "{\"enum\":[\"all\",\"available\",\"partial\",\"allavailable\",\"processing\",\"pending\",\"deleted\"],\"nullable\":true,\"type\":\"string\"}",
+        "{\"default\":\"added\",\"enum\":[\"added\",\"modified\",\"mediaAdded\"],\"type\":\"string\"}",
+        "{\"properties\":{\"pageInfo\":{\"$ref\":\"#/components/schemas/PageInfo\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MediaInfo\"},\"type\":\"array\"}},\"type\":\"object\"}",
+        "Get media",
+        "get_media_watch_data_by_media_id",
+        "/api/v1/media/{mediaId}/watch_data",
+        "{\"properties\":{\"data\":{\"properties\":{\"playCount\":{\"type\":\"number\"},\"playCount30Days\":{\"type\":\"number\"},\"playCount7Days\":{\"type\":\"number\"},\"users\":{\"items\":{\"$ref\":\"#/components/schemas/User\"},\"type\":\"array\"}},\"type\":\"object\"},\"data4k\":{\"properties\":{\"playCount\":{\"type\":\"number\"},\"playCount30Days\":{\"type\":\"number\"},\"playCount7Days\":{\"type\":\"number\"},\"users\":{\"items\":{\"$ref\":\"#/components/schemas/User\"},\"type\":\"array\"}},\"type\":\"object\"}},\"type\":\"object\"}",
+        "Get watch data",
+        "get_movie_by_movie_id",
+        "/api/v1/movie/{movieId}",
+        "movieId",
+        "{\"example\":337401,\"type\":\"number\"}",
+        "{\"$ref\":\"#/components/schemas/MovieDetails\"}",
+        "MovieDetails",
+        "movies",
+        "Get movie details",
+        "get_movie_ratings_by_movie_id",
+        "/api/v1/movie/{movieId}/ratings",
+        "{\"properties\":{\"audienceRating\":{\"enum\":[\"Spilled\",\"Upright\"],\"type\":\"string\"},\"audienceScore\":{\"example\":65,\"type\":\"number\"},\"criticsRating\":{\"enum\":[\"Rotten\",\"Fresh\",\"Certified Fresh\"],\"type\":\"string\"},\"criticsScore\":{\"example\":85,\"type\":\"number\"},\"title\":{\"example\":\"Mulan\",\"type\":\"string\"},\"url\":{\"example\":\"http://www.rottentomatoes.com/m/mulan_2020/\",\"type\":\"string\"},\"year\":{\"example\":2020,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Get movie ratings",
+        "get_movie_ratingscombined_by_movie_id",
+        "/api/v1/movie/{movieId}/ratingscombined",
+        "{\"properties\":{\"imdb\":{\"properties\":{\"criticsScore\":{\"example\":6.5,\"type\":\"number\"},\"title\":{\"example\":\"I am Legend\",\"type\":\"string\"},\"url\":{\"example\":\"https://www.imdb.com/title/tt0480249\",\"type\":\"string\"}},\"type\":\"object\"},\"rt\":{\"properties\":{\"audienceRating\":{\"enum\":[\"Spilled\",\"Upright\"],\"type\":\"string\"},\"audienceScore\":{\"example\":65,\"type\":\"number\"},\"criticsRating\":{\"enum\":[\"Rotten\",\"Fresh\",\"Certified Fresh\"],\"type\":\"string\"},\"criticsScore\":{\"example\":85,\"type\":\"number\"},\"title\":{\"example\":\"Mulan\",\"type\":\"string\"},\"url\":{\"example\":\"http://www.rottentomatoes.com/m/mulan_2020/\",\"type\":\"string\"},\"year\":{\"example\":2020,\"type\":\"number\"}},\"type\":\"object\"}},\"type\":\"object\"}",
+        "Get RT and IMDB movie ratings combined",
+        "get_movie_recommendations_by_movie_id",
+        "/api/v1/movie/{movieId}/recommendations",
+        "Get recommended movies",
+        "get_movie_similar_by_movie_id",
+        "/api/v1/movie/{movieId}/similar",
+        "Get similar movies",
+        "get_network_by_network_id",
+        "/api/v1/network/{networkId}",
+        "{\"$ref\":\"#/components/schemas/ProductionCompany\"}",
+        "ProductionCompany",
+        "Get TV network details",
+        "get_person_by_person_id",
+        "/api/v1/person/{personId}",
+        "personId",
+        "{\"example\":287,\"type\":\"number\"}",
+        "{\"$ref\":\"#/components/schemas/PersonDetails\"}",
+        "PersonDetails",
+        "person",
+        "Get person details",
+        "get_person_combined_credits_by_person_id",
+        "/api/v1/person/{personId}/combined_credits",
+        "{\"properties\":{\"cast\":{\"items\":{\"$ref\":\"#/components/schemas/CreditCast\"},\"type\":\"array\"},\"crew\":{\"items\":{\"$ref\":\"#/components/schemas/CreditCrew\"},\"type\":\"array\"},\"id\":{\"type\":\"number\"}},\"type\":\"object\"}",
+        "Get combined credits",
+        "get_regions",
+        "/api/v1/regions",
+        "{\"items\":{\"properties\":{\"english_name\":{\"example\":\"United States of America\",\"type\":\"string\"},\"iso_3166_1\":{\"example\":\"US\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
+        "Regions supported by TMDB",
+        "get_request",
+        "/api/v1/request",
+        "{\"enum\":[\"all\",\"approved\",\"available\",\"pending\",\"processing\",\"unavailable\",\"failed\",\"deleted\",\"completed\"],\"nullable\":true,\"type\":\"string\"}",
+        "{\"properties\":{\"pageInfo\":{\"$ref\":\"#/components/schemas/PageInfo\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/MediaRequest\"},\"type\":\"array\"}},\"type\":\"object\"}",
+        "Get all requests",
+        "get_request_by_request_id",
+        "{\"$ref\":\"#/components/schemas/MediaRequest\"}",
+        "MediaRequest",
+        "Get MediaRequest",
+        "get_request_count",
+        "/api/v1/request/count",
+        "{\"properties\":{\"approved\":{\"type\":\"number\"},\"available\":{\"type\":\"number\"},\"declined\":{\"type\":\"number\"},\"movie\":{\"type\":\"number\"},\"pending\":{\"type\":\"number\"},\"processing\":{\"type\":\"number\"},\"total\":{\"type\":\"number\"},\"tv\":{\"type\":\"number\"}},\"type\":\"object\"}",
+        "Gets request counts",
+        "get_search",
+        "/api/v1/search",
+        "query",
+        "{\"example\":\"Mulan\",\"type\":\"string\"}",
+        "Search for movies, TV shows, or people",
+        "get_search_company",
+        "/api/v1/search/company",
+        "{\"example\":\"Disney\",\"type\":\"string\"}",
+        "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/Company\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Search for companies",
+        "get_search_keyword",
+        "/api/v1/search/keyword",
+        "{\"example\":\"christmas\",\"type\":\"string\"}",
+        "{\"properties\":{\"page\":{\"example\":1,\"type\":\"number\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/Keyword\"},\"type\":\"array\"},\"totalPages\":{\"example\":20,\"type\":\"number\"},\"totalResults\":{\"example\":200,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Search for keywords",
+        "get_service_radarr",
+        "/api/v1/service/radarr",
+        "{\"items\":{\"$ref\":\"#/components/schemas/RadarrSettings\"},\"type\":\"array\"}",
+        "service",
+        "Get non-sensitive Radarr server list",
+        "get_service_radarr_by_radarr_id",
+        "/api/v1/service/radarr/{radarrId}",
+        "{\"example\":0,\"type\":\"number\"}",
+        "{\"properties\":{\"profiles\":{\"$ref\":\"#/components/schemas/ServiceProfile\"},\"server\":{\"$ref\":\"#/components/schemas/RadarrSettings\"}},\"type\":\"object\"}",
+        "Get Radarr server quality profiles and root folders",
+        "get_service_sonarr",
+        "/api/v1/service/sonarr",
+        "{\"items\":{\"$ref\":\"#/components/schemas/SonarrSettings\"},\"type\":\"array\"}",
+        "Get non-sensitive Sonarr server list",
+        "get_service_sonarr_by_sonarr_id",
+        "/api/v1/service/sonarr/{sonarrId}",
+        "{\"properties\":{\"profiles\":{\"$ref\":\"#/components/schemas/ServiceProfile\"},\"server\":{\"$ref\":\"#/components/schemas/SonarrSettings\"}},\"type\":\"object\"}",
+        "Get Sonarr server quality profiles and root folders",
+        "get_service_sonarr_lookup_by_tmdb_id",
+        "/api/v1/service/sonarr/lookup/{tmdbId}",
+        "tmdbId",
+        "{\"items\":{\"$ref\":\"#/components/schemas/SonarrSeries\"},\"type\":\"array\"}",
+        "SonarrSeries",
+        "Get series from Sonarr",
+        "get_settings_about",
+        "/api/v1/settings/about",
+        "{\"properties\":{\"appDataPath\":{\"example\":\"/app/config\",\"type\":\"string\"},\"totalMediaItems\":{\"example\":100,\"type\":\"number\"},\"totalRequests\":{\"example\":100,\"type\":\"number\"},\"tz\":{\"example\":\"Asia/Tokyo\",\"nullable\":true,\"type\":\"string\"},\"version\":{\"example\":\"1.0.0\",\"type\":\"string\"}},\"type\":\"object\"}",
+        "Get server stats",
+        "get_settings_cache",
+        "/api/v1/settings/cache",
+        "{\"properties\":{\"apiCaches\":{\"items\":{\"properties\":{\"id\":{\"example\":\"cache-id\",\"type\":\"string\"},\"name\":{\"example\":\"cache name\",\"type\":\"string\"},\"stats\":{\"properties\":{\"hits\":{\"type\":\"number\"},\"keys\":{\"type\":\"number\"},\"ksize\":{\"type\":\"number\"},\"misses\":{\"type\":\"number\"},\"vsize\":{\"type\":\"number\"}},\"type\":\"object\"}},\"type\":\"object\"},\"type\":\"array\"},\"imageCache\":{\"properties\":{\"tmdb\":{\"properties\":{\"imageCount\":{\"example\":123,\"type\":\"number\"},\"size\":{\"example\":123456,\"type\":\"number\"}},\"type\":\"object\"}},\"type\":\"object\"}},\"type\":\"object\"}",
+        "Get a list of active caches",
+        "get_settings_discover",
+        "/api/v1/settings/discover",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DiscoverSlider\"},\"type\":\"array\"}",
+        "Get all discover sliders",
+        "get_settings_discover_reset",
+        "/api/v1/settings/discover/reset",
+        "Reset all discover sliders",
+        "get_settings_jobs",
+        "/api/v1/settings/jobs",
+        "{\"items\":{\"$ref\":\"#/components/schemas/Job\"},\"type\":\"array\"}",
+        "Job",
+        "Get scheduled jobs",
+        "get_settings_logs",
+        "/api/v1/settings/logs",
+        "{\"default\":\"debug\",\"enum\":[\"debug\",\"info\",\"warn\",\"error\"],\"nullable\":true,\"type\":\"string\"}",
+        "{\"example\":\"plex\",\"nullable\":true,\"type\":\"string\"}",
+        "{\"example\":25,\"nullable\":true,\"type\":\"number\"}",
+        "{\"items\":{\"properties\":{\"label\":{\"example\":\"server\",\"type\":\"string\"},\"level\":{\"example\":\"info\",\"type\":\"string\"},\"message\":{\"example\":\"Server ready on port 5055\",\"type\":\"string\"},\"timestamp\":{\"example\":\"2020-12-15T16:20:00.069Z\",\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
+        "Returns logs",
+        "get_settings_main",
+        "/api/v1/settings/main",
+        "{\"$ref\":\"#/components/schemas/MainSettings\"}",
+        "MainSettings",
+        "Get main settings",
+        "get_settings_notifications_discord",
+        "/api/v1/settings/notifications/discord",
+        "{\"$ref\":\"#/components/schemas/DiscordSettings\"}",
+        "DiscordSettings",
+        "Get Discord notification settings",
+        "get_settings_notifications_email",
+        "/api/v1/settings/notifications/email",
+        "{\"$ref\":\"#/components/schemas/NotificationEmailSettings\"}",
+        "NotificationEmailSettings",
+        "Get email notification settings",
+        "get_settings_notifications_gotify",
+        "/api/v1/settings/notifications/gotify",
+        "{\"$ref\":\"#/components/schemas/GotifySettings\"}",
+        "GotifySettings",
+        "Get Gotify notification settings",
+        "get_settings_notifications_lunasea",
+        "/api/v1/settings/notifications/lunasea",
+        "{\"$ref\":\"#/components/schemas/LunaSeaSettings\"}",
+        "LunaSeaSettings",
+        "Get LunaSea notification settings",
+        "get_settings_notifications_pushbullet",
+        "/api/v1/settings/notifications/pushbullet",
+        "{\"$ref\":\"#/components/schemas/PushbulletSettings\"}",
+        "PushbulletSettings",
+        "Get Pushbullet notification settings",
+        "get_settings_notifications_pushover",
+        "/api/v1/settings/notifications/pushover",
+        "{\"$ref\":\"#/components/schemas/PushoverSettings\"}",
+        "PushoverSettings",
+        "Get Pushover notification settings",
+        "get_settings_notifications_pushover_sounds",
+        "/api/v1/settings/notifications/pushover/sounds",
+        "token",
+        "{\"nullable\":false,\"type\":\"string\"}",
+        "{\"items\":{\"properties\":{\"description\":{\"type\":\"string\"},\"name\":{\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
+        "Get Pushover sounds",
+        "get_settings_notifications_slack",
+        "/api/v1/settings/notifications/slack",
+        "{\"$ref\":\"#/components/schemas/SlackSettings\"}",
+        "SlackSettings",
+        "Get Slack notification settings",
+        "get_settings_notifications_telegram",
+        "/api/v1/settings/notifications/telegram",
+        "{\"$ref\":\"#/components/schemas/TelegramSettings\"}",
+        "TelegramSettings",
+        "Get Telegram notification settings",
+        "get_settings_notifications_webhook",
+        "/api/v1/settings/notifications/webhook",
+        "{\"$ref\":\"#/components/schemas/WebhookSettings\"}",
+        "WebhookSettings",
+        "Get webhook notification settings",
+        "get_settings_notifications_webpush",
+        "/api/v1/settings/notifications/webpush",
+        "{\"$ref\":\"#/components/schemas/WebPushSettings\"}",
+        "WebPushSettings",
+        "Get Web Push notification settings",
+        "get_settings_plex",
+        "/api/v1/settings/plex",
+        "{\"$ref\":\"#/components/schemas/PlexSettings\"}",
+        "PlexSettings",
+        "Get Plex settings",
+        "get_settings_plex_devices_servers",
+        "/api/v1/settings/plex/devices/servers",
+        "{\"items\":{\"$ref\":\"#/components/schemas/PlexDevice\"},\"type\":\"array\"}",
+        "PlexDevice",
+        "Gets the user's available Plex servers",
+        "get_settings_plex_sync",
+        "/api/v1/settings/plex/sync",
+        "{\"properties\":{\"currentLibrary\":{\"$ref\":\"#/components/schemas/PlexLibrary\"},\"libraries\":{\"items\":{\"$ref\":\"#/components/schemas/PlexLibrary\"},\"type\":\"array\"},\"progress\":{\"example\":0,\"type\":\"number\"},\"running\":{\"example\":false,\"type\":\"boolean\"},\"total\":{\"example\":100,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Get status of full Plex library scan",
+        "get_settings_plex_users",
+        "/api/v1/settings/plex/users",
+        "{\"items\":{\"properties\":{\"email\":{\"type\":\"string\"},\"id\":{\"type\":\"string\"},\"thumb\":{\"type\":\"string\"},\"title\":{\"type\":\"string\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"},\"type\":\"array\"}",
+        "Get Plex users",
+        "get_settings_public",
+        "/api/v1/settings/public",
+        "{\"$ref\":\"#/components/schemas/PublicSettings\"}",
+        "PublicSettings",
+        "Get public settings",
+        "get_settings_radarr",
+        "/api/v1/settings/radarr",
+        "Get Radarr settings",
+        "get_settings_radarr_profiles_by_radarr_id",
+        "/api/v1/settings/radarr/{radarrId}/profiles",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ServiceProfile\"},\"type\":\"array\"}",
+        "ServiceProfile",
+        "Get available Radarr profiles",
+        "get_settings_sonarr",
+        "/api/v1/settings/sonarr",
+        "Get Sonarr settings",
+        "get_settings_tautulli",
+        "/api/v1/settings/tautulli",
+        "{\"$ref\":\"#/components/schemas/TautulliSettings\"}",
+        "TautulliSettings",
+        "Get Tautulli settings",
+        "get_status",
+        "/api/v1/status",
+        "{\"properties\":{\"commitTag\":{\"type\":\"string\"},\"commitsBehind\":{\"type\":\"number\"},\"restartRequired\":{\"type\":\"boolean\"},\"updateAvailable\":{\"type\":\"boolean\"},\"version\":{\"example\":\"1.0.0\",\"type\":\"string\"}},\"type\":\"object\"}",
+        "public",
+        "Get Overseerr status",
+        "get_status_appdata",
+        "/api/v1/status/appdata",
+        "{\"properties\":{\"appData\":{\"example\":true,\"type\":\"boolean\"},\"appDataPath\":{\"example\":\"/app/config\",\"type\":\"string\"}},\"type\":\"object\"}",
+        "Get application data volume status",
+        "get_studio_by_studio_id",
+        "/api/v1/studio/{studioId}",
+        "{\"example\":2,\"type\":\"number\"}",
+        "Get movie studio details",
+        "get_tv_by_tv_id",
+        "/api/v1/tv/{tvId}",
+        "tvId",
+        "{\"example\":76479,\"type\":\"number\"}",
+        "{\"$ref\":\"#/components/schemas/TvDetails\"}",
+        "TvDetails",
+        "tv",
+        "Get TV details",
+        "get_tv_ratings_by_tv_id",
+        "/api/v1/tv/{tvId}/ratings",
+        "{\"properties\":{\"criticsRating\":{\"enum\":[\"Rotten\",\"Fresh\"],\"type\":\"string\"},\"criticsScore\":{\"example\":85,\"type\":\"number\"},\"title\":{\"example\":\"The Boys\",\"type\":\"string\"},\"url\":{\"example\":\"http://www.rottentomatoes.com/m/mulan_2020/\",\"type\":\"string\"},\"year\":{\"example\":2019,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Get TV ratings",
+        "get_tv_recommendations_by_tv_id",
+        "/api/v1/tv/{tvId}/recommendations",
+        "Get recommended TV series",
+        "get_tv_season_by_season_id_tv_id",
+        "/api/v1/tv/{tvId}/season/{seasonId}",
+        "seasonId",
+        "{\"$ref\":\"#/components/schemas/Season\"}",
+        "Season",
+        "Get season details and episode list",
+        "get_tv_similar_by_tv_id",
+        "/api/v1/tv/{tvId}/similar",
+        "Get similar TV series",
+        "get_user",
+        "/api/v1/user",
+        "{\"default\":\"created\",\"enum\":[\"created\",\"updated\",\"requests\",\"displayname\"],\"type\":\"string\"}",
+        "{\"properties\":{\"pageInfo\":{\"$ref\":\"#/components/schemas/PageInfo\"},\"results\":{\"items\":{\"$ref\":\"#/components/schemas/User\"},\"type\":\"array\"}},\"type\":\"object\"}",
+        "Get all users",
+        "get_user_by_user_id",
+        "Get user by ID",
+        "get_user_push_subscription_by_endpoint_user_id",
+        "{\"properties\":{\"auth\":{\"type\":\"string\"},\"endpoint\":{\"type\":\"string\"},\"p256dh\":{\"type\":\"string\"},\"userAgent\":{\"type\":\"string\"}},\"type\":\"object\"}",
+        "Get web push notification settings for a user",
+        "get_user_push_subscriptions_by_user_id",
+        "/api/v1/user/{userId}/pushSubscriptions",
+        "Get all web push notification settings for a user",
+        "get_user_quota_by_user_id",
+        "/api/v1/user/{userId}/quota",
+        "{\"properties\":{\"movie\":{\"properties\":{\"days\":{\"example\":7,\"type\":\"number\"},\"limit\":{\"example\":10,\"type\":\"number\"},\"remaining\":{\"example\":4,\"type\":\"number\"},\"restricted\":{\"example\":false,\"type\":\"boolean\"},\"used\":{\"example\":6,\"type\":\"number\"}},\"type\":\"object\"},\"tv\":{\"properties\":{\"days\":{\"example\":7,\"type\":\"number\"},\"limit\":{\"example\":10,\"type\":\"number\"},\"remaining\":{\"example\":4,\"type\":\"number\"},\"restricted\":{\"example\":false,\"type\":\"boolean\"},\"used\":{\"example\":6,\"type\":\"number\"}},\"type\":\"object\"}},\"type\":\"object\"}",
+        "Get quotas for a specific user",
+        "get_user_requests_by_user_id",
+        "/api/v1/user/{userId}/requests",
+        "Get requests for a specific user",
+        "get_user_settings_main_by_user_id",
+        "/api/v1/user/{userId}/settings/main",
+        "{\"properties\":{\"username\":{\"example\":\"Mr User\",\"type\":\"string\"}},\"type\":\"object\"}",
+        "Get general settings for a user",
+        "get_user_settings_notifications_by_user_id",
+        "/api/v1/user/{userId}/settings/notifications",
+        "{\"$ref\":\"#/components/schemas/UserSettingsNotifications\"}",
+        "UserSettingsNotifications",
+        "Get notification settings for a user",
+        "get_user_settings_password_by_user_id",
+        "/api/v1/user/{userId}/settings/password",
+        "{\"properties\":{\"hasPassword\":{\"example\":true,\"type\":\"boolean\"}},\"type\":\"object\"}",
+        "Get password page informatiom",
+        "get_user_settings_permissions_by_user_id",
+        "/api/v1/user/{userId}/settings/permissions",
+        "{\"properties\":{\"permissions\":{\"example\":2,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Get permission settings for a user",
+        "get_user_watch_data_by_user_id",
+        "/api/v1/user/{userId}/watch_data",
+        "{\"properties\":{\"playCount\":{\"type\":\"number\"},\"recentlyWatched\":{\"items\":{\"$ref\":\"#/components/schemas/MediaInfo\"},\"type\":\"array\"}},\"type\":\"object\"}",
+        "get_user_watchlist_by_user_id",
+        "/api/v1/user/{userId}/watchlist",
+        "Get the Plex watchlist for a specific user",
+        "get_watchproviders_movies",
+        "/api/v1/watchproviders/movies",
+        "{\"items\":{\"$ref\":\"#/components/schemas/WatchProviderDetails\"},\"type\":\"array\"}",
+        "WatchProviderDetails",
+        "Get watch provider movies",
+        "get_watchproviders_regions",
+        "/api/v1/watchproviders/regions",
+        "{\"items\":{\"$ref\":\"#/components/schemas/WatchProviderRegion\"},\"type\":\"array\"}",
+        "WatchProviderRegion",
+        "Get watch provider regions",
+        "get_watchproviders_tv",
+        "/api/v1/watchproviders/tv",
+        "Get watch provider series",
+        "post_auth_local",
+        "/api/v1/auth/local",
+        "{\"properties\":{\"email\":{\"type\":\"string\"},\"password\":{\"type\":\"string\"}},\"required\":[\"email\",\"password\"],\"type\":\"object\"}",
+        "Sign in using a local account",
+        "post_auth_logout",
+        "/api/v1/auth/logout",
+        "{\"properties\":{\"status\":{\"example\":\"ok\",\"type\":\"string\"}},\"type\":\"object\"}",
+        "Sign out and clear session cookie",
+        "post_auth_plex",
+        "/api/v1/auth/plex",
+        "{\"properties\":{\"authToken\":{\"type\":\"string\"}},\"required\":[\"authToken\"],\"type\":\"object\"}",
+        "Sign in using a Plex token",
+        "post_auth_reset_password",
+        "/api/v1/auth/reset-password",
+        "{\"properties\":{\"email\":{\"type\":\"string\"}},\"required\":[\"email\"],\"type\":\"object\"}",
+        "Send a reset password email",
+        "post_auth_reset_password_by_guid",
+        "/api/v1/auth/reset-password/{guid}",
+        "guid",
+        "{\"example\":\"9afef5a7-ec89-4d5f-9397-261e96970b50\",\"type\":\"string\"}",
+        "{\"properties\":{\"password\":{\"type\":\"string\"}},\"required\":[\"password\"],\"type\":\"object\"}",
+        "Reset the password for a user",
+        "post_issue",
+        "{\"properties\":{\"issueType\":{\"type\":\"number\"},\"mediaId\":{\"type\":\"number\"},\"message\":{\"type\":\"string\"}},\"type\":\"object\"}",
+        "201",
+        "Create new issue",
+        "post_issue_by_issue_id_status",
+        "/api/v1/issue/{issueId}/{status}",
+        "status",
+        "{\"enum\":[\"open\",\"resolved\"],\"type\":\"string\"}",
+        "Update an issue's status",
+        "post_issue_comment_by_issue_id",
+        "/api/v1/issue/{issueId}/comment",
+        "{\"properties\":{\"message\":{\"type\":\"string\"}},\"required\":[\"message\"],\"type\":\"object\"}",
+        "Create a comment",
+        "post_media_by_media_id_status",
+        "/api/v1/media/{mediaId}/{status}",
+        "{\"enum\":[\"available\",\"partial\",\"processing\",\"pending\",\"unknown\",\"deleted\"],\"type\":\"string\"}",
+        "{\"properties\":{\"is4k\":{\"example\":false,\"type\":\"boolean\"}},\"type\":\"object\"}",
+        "{\"$ref\":\"#/components/schemas/MediaInfo\"}",
+        "MediaInfo",
+        "Update media status",
+        "post_request",
+        "{\"properties\":{\"is4k\":{\"example\":false,\"type\":\"boolean\"},\"languageProfileId\":{\"type\":\"number\"},\"mediaId\":{\"example\":123,\"type\":\"number\"},\"mediaType\":{\"enum\":[\"movie\",\"tv\"],\"example\":\"movie\",\"type\":\"string\"},\"profileId\":{\"type\":\"number\"},\"rootFolder\":{\"type\":\"string\"},\"seasons\":{\"oneOf\":[{\"items\":{\"minimum\":0,\"type\":\"number\"},\"type\":\"array\"},{\"enum\":[\"all\"],\"type\":\"string\"}]},\"serverId\":{\"type\":\"number\"},\"tvdbId\":{\"example\":123,\"type\":\"number\"},\"userId\":{\"nullable\":true,\"type\":\"number\"}},\"required\":[\"mediaType\",\"mediaId\"],\"type\":\"object\"}",
+        "Create new request",
+        "post_request_by_request_id_status",
+        "/api/v1/request/{requestId}/{status}",
+        "{\"enum\":[\"approve\",\"decline\"],\"type\":\"string\"}",
+        "Update a request's status",
+        "post_request_retry_by_request_id",
+        "/api/v1/request/{requestId}/retry",
+        "Retry failed request",
+        "post_settings_cache_flush_by_cache_id",
+        "/api/v1/settings/cache/{cacheId}/flush",
+        "cacheId",
+        "Flush a specific cache",
+        "post_settings_discover",
+        "Batch update all sliders.",
+        "post_settings_discover_add",
+        "/api/v1/settings/discover/add",
+        "{\"properties\":{\"data\":{\"example\":\"1\",\"type\":\"string\"},\"title\":{\"example\":\"New Slider\",\"type\":\"string\"},\"type\":{\"example\":1,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Add a new slider",
+        "post_settings_initialize",
+        "/api/v1/settings/initialize",
+        "Initialize application",
+        "post_settings_jobs_cancel_by_job_id",
+        "/api/v1/settings/jobs/{jobId}/cancel",
+        "jobId",
+        "{\"$ref\":\"#/components/schemas/Job\"}",
+        "Cancel a specific job",
+        "post_settings_jobs_run_by_job_id",
+        "/api/v1/settings/jobs/{jobId}/run",
+        "Invoke a specific job",
+        "post_settings_jobs_schedule_by_job_id",
+        "/api/v1/settings/jobs/{jobId}/schedule",
+        "{\"properties\":{\"schedule\":{\"example\":\"0 */5 * * * *\",\"type\":\"string\"}},\"type\":\"object\"}",
+        "Modify job schedule",
+        "post_settings_main",
+        "Update main settings",
+        "post_settings_main_regenerate",
+        "/api/v1/settings/main/regenerate",
+        "Get main settings with newly-generated API key",
+        "post_settings_notifications_discord",
+        "Update Discord notification settings",
+        "post_settings_notifications_discord_test",
+        "/api/v1/settings/notifications/discord/test",
+        "Test Discord settings",
+        "post_settings_notifications_email",
+        "Update email notification settings",
+        "post_settings_notifications_email_test",
+        "/api/v1/settings/notifications/email/test",
+        "Test email settings",
+        "post_settings_notifications_gotify",
+        "Update Gotify notification settings",
+        "post_settings_notifications_gotify_test",
+        "/api/v1/settings/notifications/gotify/test",
+        "Test Gotify settings",
+        "post_settings_notifications_lunasea",
+        "Update LunaSea notification settings",
+        "post_settings_notifications_lunasea_test",
+        "/api/v1/settings/notifications/lunasea/test",
+        "Test LunaSea settings",
+        "post_settings_notifications_pushbullet",
+        "Update Pushbullet notification settings",
+        "post_settings_notifications_pushbullet_test",
+        "/api/v1/settings/notifications/pushbullet/test",
+        "Test Pushbullet settings",
+        "post_settings_notifications_pushover",
+        "Update Pushover notification settings",
+        "post_settings_notifications_pushover_test",
+        "/api/v1/settings/notifications/pushover/test",
+        "Test Pushover settings",
+        "post_settings_notifications_slack",
+        "Update Slack notification settings",
+        "post_settings_notifications_slack_test",
+        "/api/v1/settings/notifications/slack/test",
+        "Test Slack settings",
+        "post_settings_notifications_telegram",
+        "Update Telegram notification settings",
+        "post_settings_notifications_telegram_test",
+        "/api/v1/settings/notifications/telegram/test",
+        "Test Telegram settings",
+        "post_settings_notifications_webhook",
+        "Update webhook notification settings",
+        "post_settings_notifications_webhook_test",
+        "/api/v1/settings/notifications/webhook/test",
+        "Test webhook settings",
+        "post_settings_notifications_webpush",
+        "Update Web Push notification settings",
+        "post_settings_notifications_webpush_test",
+        "/api/v1/settings/notifications/webpush/test",
+        "Test Web Push settings",
+        "post_settings_plex",
+        "Update Plex settings",
+        "post_settings_plex_sync",
+        "{\"properties\":{\"cancel\":{\"example\":false,\"type\":\"boolean\"},\"start\":{\"example\":false,\"type\":\"boolean\"}},\"type\":\"object\"}",
+        "Start full Plex library scan",
+        "post_settings_radarr",
+        "Create Radarr instance",
+        "post_settings_radarr_test",
+        "/api/v1/settings/radarr/test",
+        "{\"properties\":{\"apiKey\":{\"example\":\"yourapikey\",\"type\":\"string\"},\"baseUrl\":{\"type\":\"string\"},\"hostname\":{\"example\":\"127.0.0.1\",\"type\":\"string\"},\"port\":{\"example\":7878,\"type\":\"number\"},\"useSsl\":{\"example\":false,\"type\":\"boolean\"}},\"required\":[\"hostname\",\"port\",\"apiKey\",\"useSsl\"],\"type\":\"object\"}",
+        "{\"properties\":{\"profiles\":{\"items\":{\"$ref\":\"#/components/schemas/ServiceProfile\"},\"type\":\"array\"}},\"type\":\"object\"}",
+        "Test Radarr configuration",
+        "post_settings_sonarr",
+        "Create Sonarr instance",
+        "post_settings_sonarr_test",
+        "/api/v1/settings/sonarr/test",
+        "{\"properties\":{\"apiKey\":{\"example\":\"yourapikey\",\"type\":\"string\"},\"baseUrl\":{\"type\":\"string\"},\"hostname\":{\"example\":\"127.0.0.1\",\"type\":\"string\"},\"port\":{\"example\":8989,\"type\":\"number\"},\"useSsl\":{\"example\":false,\"type\":\"boolean\"}},\"required\":[\"hostname\",\"port\",\"apiKey\",\"useSsl\"],\"type\":\"object\"}",
+        "Test Sonarr configuration",
+        "post_settings_tautulli",
+        "Update Tautulli settings",
+        "post_user",
+        "{\"properties\":{\"email\":{\"example\":\"hey@itsme.com\",\"type\":\"string\"},\"permissions\":{\"type\":\"number\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"}",
+        "Create new user",
+        "post_user_import_from_plex",
+        "/api/v1/user/import-from-plex",
+        "{\"properties\":{\"plexIds\":{\"items\":{\"type\":\"string\"},\"type\":\"array\"}},\"type\":\"object\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/User\"},\"type\":\"array\"}",
+        "Import all users from Plex",
+        "post_user_register_push_subscription",
+        "/api/v1/user/registerPushSubscription",
+        "{\"properties\":{\"auth\":{\"type\":\"string\"},\"endpoint\":{\"type\":\"string\"},\"p256dh\":{\"type\":\"string\"},\"userAgent\":{\"type\":\"string\"}},\"required\":[\"endpoint\",\"auth\",\"p256dh\"],\"type\":\"object\"}",
+        "Register a web push /user/registerPushSubscription",
+        "post_user_settings_main_by_user_id",
+        "{\"properties\":{\"username\":{\"nullable\":true,\"type\":\"string\"}},\"type\":\"object\"}",
+        "Update general settings for a user",
+        "post_user_settings_notifications_by_user_id",
+        "Update notification settings for a user",
+        "post_user_settings_password_by_user_id",
+        "{\"properties\":{\"currentPassword\":{\"nullable\":true,\"type\":\"string\"},\"newPassword\":{\"type\":\"string\"}},\"required\":[\"newPassword\"],\"type\":\"object\"}",
+        "Update password for a user",
+        "post_user_settings_permissions_by_user_id",
+        "{\"properties\":{\"permissions\":{\"type\":\"number\"}},\"required\":[\"permissions\"],\"type\":\"object\"}",
+        "Update permission settings for a user",
+        "put_issue_comment_by_comment_id",
+        "{\"properties\":{\"message\":{\"type\":\"string\"}},\"type\":\"object\"}",
+        "Update issue comment",
+        "put_request_by_request_id",
+        "{\"properties\":{\"is4k\":{\"example\":false,\"type\":\"boolean\"},\"languageProfileId\":{\"type\":\"number\"},\"mediaType\":{\"enum\":[\"movie\",\"tv\"],\"type\":\"string\"},\"profileId\":{\"type\":\"number\"},\"rootFolder\":{\"type\":\"string\"},\"seasons\":{\"items\":{\"minimum\":0,\"type\":\"number\"},\"type\":\"array\"},\"serverId\":{\"type\":\"number\"},\"userId\":{\"nullable\":true,\"type\":\"number\"}},\"required\":[\"mediaType\"],\"type\":\"object\"}",
+        "Update MediaRequest",
+        "put_settings_discover_by_slider_id",
+        "{\"properties\":{\"data\":{\"example\":\"1\",\"type\":\"string\"},\"title\":{\"example\":\"Slider Title\",\"type\":\"string\"},\"type\":{\"example\":1,\"type\":\"number\"}},\"type\":\"object\"}",
+        "Update a single slider",
+        "put_settings_radarr_by_radarr_id",
+        "Update Radarr instance",
+        "put_settings_sonarr_by_sonarr_id",
+        "Update Sonarr instance",
+        "put_user",
+        "{\"properties\":{\"ids\":{\"items\":{\"type\":\"integer\"},\"type\":\"array\"},\"permissions\":{\"type\":\"integer\"}},\"type\":\"object\"}",
+        "Update batch of users",
+        "put_user_by_user_id",
+        "Update a user by user ID",
+        "Cast",
+        "export interface Cast {\n  castId?: number;\n  character?: string;\n  creditId?: string;\n  gender?: number;\n  id?: number;\n  name?: string;\n  order?: number;\n  profilePath?: string | null;\n}",
+        "export interface Collection {\n  backdropPath?: string;\n  id?: number;\n  name?: string;\n  overview?: string;\n  parts?: MovieResult[];\n  posterPath?: string;\n}",
+        "Company",
+        "export interface Company {\n  id?: number;\n  logo_path?: string | null;\n  name?: string;\n}",
+        "CreditCast",
+        "export interface CreditCast {\n  adult?: boolean;\n  backdropPath?: string;\n  character?: string;\n  creditId?: string;\n  episodeCount?: number;\n  firstAirDate?: string;\n  genreIds?: number[];\n  id?: number;\n  mediaInfo?: MediaInfo;\n  mediaType?: string;\n  name?: string;\n  originCountry?: string[];\n  originalLanguage?: string;\n  originalName?: string;\n  originalTitle?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  releaseDate?: string;\n  title?: string;\n  video?: boolean;\n  voteAverage?: number;\n  voteCount?: number;\n}",
+        "CreditCrew",
+        "export interface CreditCrew {\n  adult?: boolean;\n  backdropPath?: string;\n  creditId?: string;\n  department?: string;\n  episodeCount?: number;\n  firstAirDate?: string;\n  genreIds?: number[];\n  id?: number;\n  job?: string;\n  mediaInfo?: MediaInfo;\n  mediaType?: string;\n  name?: string;\n  originCountry?: string[];\n  originalLanguage?: string;\n  originalName?: string;\n  originalTitle?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  releaseDate?: string;\n  title?: string;\n  video?: boolean;\n  voteAverage?: number;\n  voteCount?: number;\n}",
+        "Crew",
+        "export interface Crew {\n  creditId?: string;\n  department?: string;\n  gender?: number;\n  id?: number;\n  job?: string;\n  name?: string;\n  profilePath?: string | null;\n}",
+        "export interface DiscordSettings {\n  enabled?: boolean;\n  options?: { botAvatarUrl?: string; botUsername?: string; enableMentions?: boolean; webhookUrl?: string; };\n  types?: number;\n}",
+        "export interface DiscoverSlider {\n  data: string | null;\n  enabled: boolean;\n  id?: number;\n  isBuiltIn?: boolean;\n  title: string | null;\n  type: number;\n}",
+        "Episode",
+        "export interface Episode {\n  airDate?: string | null;\n  episodeNumber?: number;\n  id?: number;\n  name?: string;\n  overview?: string;\n  productionCode?: string;\n  seasonNumber?: number;\n  showId?: number;\n  stillPath?: string | null;\n  voteAverage?: number;\n  voteCount?: number;\n}",
+        "ExternalIds",
+        "export interface ExternalIds {\n  facebookId?: string | null;\n  freebaseId?: string | null;\n  freebaseMid?: string | null;\n  imdbId?: string | null;\n  instagramId?: string | null;\n  tvdbId?: number | null;\n  tvrageId?: number | null;\n  twitterId?: string | null;\n}",
+        "Genre",
+        "export interface Genre {\n  id?: number;\n  name?: string;\n}",
+        "export interface GotifySettings {\n  enabled?: boolean;\n  options?: { token?: string; url?: string; };\n  types?: number;\n}",
+        "export interface Issue {\n  comments?: IssueComment[];\n  createdBy?: User;\n  id?: number;\n  issueType?: number;\n  media?: MediaInfo;\n  modifiedBy?: User;\n}",
+        "export interface IssueComment {\n  id?: number;\n  message?: string;\n  user?: User;\n}",
+        "export interface Job {\n  id?: string;\n  interval?: \"short\" | \"long\" | \"fixed\";\n  name?: string;\n  nextExecutionTime?: string;\n  running?: boolean;\n  type?: \"process\" | \"command\";\n}",
+        "export interface Keyword {\n  id?: number;\n  name?: string;\n}",
+        "export interface LunaSeaSettings {\n  enabled?: boolean;\n  options?: { profileName?: string; webhookUrl?: string; };\n  types?: number;\n}",
+        "export interface MainSettings {\n  apiKey?: string;\n  appLanguage?: string;\n  applicationTitle?: string;\n  applicationUrl?: string;\n  csrfProtection?: boolean;\n  defaultPermissions?: number;\n  hideAvailable?: boolean;\n  localLogin?: boolean;\n  newPlexLogin?: boolean;\n  partialRequestsEnabled?: boolean;\n  trustProxy?: boolean;\n}",
+        "export interface MediaInfo {\n  createdAt?: string;\n  id?: number;\n  requests?: MediaRequest[];\n  status?: number;\n  tmdbId?: number;\n  tvdbId?: number | null;\n  updatedAt?: string;\n}",
+        "export interface MediaRequest {\n  createdAt?: string;\n  id: number;\n  is4k?: boolean;\n  media?: MediaInfo;\n  modifiedBy?: User | string | null;\n  profileId?: number;\n  requestedBy?: User;\n  rootFolder?: string;\n  serverId?: number;\n  status: number;\n  updatedAt?: string;\n}",
+        "export interface MovieDetails {\n  adult?: boolean;\n  backdropPath?: string;\n  budget?: number;\n  collection?: { backdropPath?: string; id?: number; name?: string; posterPath?: string; };\n  credits?: { cast?: Cast[]; crew?: Crew[]; };\n  externalIds?: ExternalIds;\n  genres?: Genre[];\n  homepage?: string;\n  id?: number;\n  imdbId?: string;\n  mediaInfo?: MediaInfo;\n  originalLanguage?: string;\n  originalTitle?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  productionCompanies?: ProductionCompany[];\n  productionCountries?: { iso_3166_1?: string; name?: string; }[];\n  relatedVideos?: RelatedVideo[];\n  releaseDate?: string;\n  releases?: { results?: ({ iso_3166_1?: string; rating?: string | null; release_dates?: ({ certification?: string; iso_639_1?: string | null; note?: string | null; release_date?: string; type?: number; })[]; })[]; };\n  revenue?: number | null;\n  runtime?: number;\n  spokenLanguages?: SpokenLanguage[];\n  status?: string;\n  tagline?: string;\n  title?: string;\n  video?: boolean;\n  voteAverage?: number;\n  voteCount?: number;\n  watchProviders?: WatchProviders[];\n}",
+        "MovieResult",
+        "export interface MovieResult {\n  adult?: boolean;\n  backdropPath?: string;\n  genreIds?: number[];\n  id: number;\n  mediaInfo?: MediaInfo;\n  mediaType: string;\n  originalLanguage?: string;\n  originalTitle?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  releaseDate?: string;\n  title: string;\n  video?: boolean;\n  voteAverage?: number;\n  voteCount?: number;\n}",
+        "Network",
+        "export interface Network {\n  id?: number;\n  logoPath?: string | null;\n  name?: string;\n  originCountry?: string;\n}",
+        "NotificationAgentTypes",
+        "export interface NotificationAgentTypes {\n  discord?: number;\n  email?: number;\n  pushbullet?: number;\n  pushover?: number;\n  slack?: number;\n  telegram?: number;\n  webhook?: number;\n  webpush?: number;\n}",
+        "export interface NotificationEmailSettings {\n  enabled?: boolean;\n  options?: { allowSelfSigned?: boolean; authPass?: string | null; authUser?: string | null; emailFrom?: string; ignoreTls?: boolean; requireTls?: boolean; secure?: boolean; senderName?: string; smtpHost?: string; smtpPort?: number; };\n  types?: number;\n}",
+        "PageInfo",
+        "export interface PageInfo {\n  page?: number;\n  pages?: number;\n  results?: number;\n}",
+        "export interface PersonDetails {\n  adult?: boolean;\n  alsoKnownAs?: string[];\n  biography?: string;\n  deathday?: string;\n  gender?: string;\n  homepage?: string;\n  id?: number;\n  imdbId?: string;\n  knownForDepartment?: string;\n  name?: string;\n  placeOfBirth?: string;\n  popularity?: string;\n  profilePath?: string;\n}",
+        "PersonResult",
+        "export interface PersonResult {\n  adult?: boolean;\n  id?: number;\n  knownFor?: (MovieResult | TvResult)[];\n  mediaType?: string;\n  profilePath?: string;\n}",
+        "PlexConnection",
+        "export interface PlexConnection {\n  address: string;\n  local: boolean;\n  message?: string;\n  port: number;\n  protocol: string;\n  status?: number;\n  uri: string;\n}",
+        "export interface PlexDevice {\n  accessToken?: string;\n  clientIdentifier: string;\n  connection: PlexConnection[];\n  createdAt: string;\n  device: string;\n  dnsRebindingProtection?: boolean;\n  home?: boolean;\n  httpsRequired?: boolean;\n  lastSeenAt: string;\n  name: string;\n  natLoopbackSupported?: boolean;\n  owned: boolean;\n  ownerID?: string;\n  platform: string;\n  platformVersion?: string;\n  presence?: boolean;\n  product: string;\n  productVersion: string;\n  provides: string[];\n  publicAddress?: string;\n  publicAddressMatches?: boolean;\n  relay?: boolean;\n  sourceTitle?: string;\n  synced?: boolean;\n}",
+        "PlexLibrary",
+        "export interface PlexLibrary {\n  enabled: boolean;\n  id: string;\n  name: string;\n}",
+        "export interface PlexSettings {\n  ip: string;\n  libraries?: PlexLibrary[];\n  machineId: string;\n  name: string;\n  port: number;\n  useSsl?: boolean | null;\n  webAppUrl?: string | null;\n}",
+        "export interface ProductionCompany {\n  id?: number;\n  logoPath?: string | null;\n  name?: string;\n  originCountry?: string;\n}",
+        "export interface PublicSettings {\n  initialized?: boolean;\n}",
+        "export interface PushbulletSettings {\n  enabled?: boolean;\n  options?: { accessToken?: string; channelTag?: string | null; };\n  types?: number;\n}",
+        "export interface PushoverSettings {\n  enabled?: boolean;\n  options?: { accessToken?: string; sound?: string; userToken?: string; };\n  types?: number;\n}",
+        "export interface RadarrSettings {\n  activeDirectory: string;\n  activeProfileId: number;\n  activeProfileName: string;\n  apiKey: string;\n  baseUrl?: string;\n  externalUrl?: string;\n  hostname: string;\n  id?: number;\n  is4k: boolean;\n  isDefault: boolean;\n  minimumAvailability: string;\n  name: string;\n  port: number;\n  preventSearch?: boolean;\n  syncEnabled?: boolean;\n  useSsl: boolean;\n}",
+        "RelatedVideo",
+        "export interface RelatedVideo {\n  key?: string;\n  name?: string;\n  site?: \"YouTube\";\n  size?: number;\n  type?: \"Clip\" | \"Teaser\" | \"Trailer\" | \"Featurette\" | \"Opening Credits\" | \"Behind the Scenes\" | \"Bloopers\";\n  url?: string;\n}",
+        "export interface Season {\n  airDate?: string | null;\n  episodeCount?: number;\n  episodes?: Episode[];\n  id?: number;\n  name?: string;\n  overview?: string;\n  posterPath?: string;\n  seasonNumber?: number;\n}",
+        "ServarrTag",
+        "export interface ServarrTag {\n  id?: number;\n  label?: string;\n}",
+        "export interface ServiceProfile {\n  id?: number;\n  name?: string;\n}",
+        "export interface SlackSettings {\n  enabled?: boolean;\n  options?: { webhookUrl?: string; };\n  types?: number;\n}",
+        "export interface SonarrSeries {\n  addOptions?: ({ ignoreEpisodesWithFiles?: boolean | null; ignoreEpisodesWithoutFiles?: boolean | null; searchForMissingEpisodes?: boolean | null; })[];\n  added?: string;\n  airTime?: string;\n  certification?: string;\n  cleanTitle?: string;\n  firstAired?: string;\n  genres?: string[];\n  id?: number | null;\n  images?: { coverType?: string; url?: string; }[];\n  imdbId?: string;\n  languageProfileId?: number;\n  lastInfoSync?: string | null;\n  monitored?: boolean;\n  network?: string;\n  overview?: string;\n  path?: string;\n  profileId?: number;\n  qualityProfileId?: number;\n  ratings?: { value?: number; votes?: number; }[];\n  remotePoster?: string;\n  rootFolderPath?: string | null;\n  runtime?: number;\n  seasonCount?: number;\n  seasonFolder?: boolean;\n  seasons?: { monitored?: boolean; seasonNumber?: number; }[];\n  seriesType?: string;\n  sortTitle?: string;\n  status?: string;\n  tags?: string[];\n  title?: string;\n  titleSlug?: string;\n  tvMazeId?: number;\n  tvRageId?: number;\n  tvdbId?: number;\n  useSceneNumbering?: boolean;\n  year?: number;\n}",
+        "export interface SonarrSettings {\n  activeAnimeDirectory?: string | null;\n  activeAnimeLanguageProfileId?: number | null;\n  activeAnimeProfileId?: number | null;\n  activeAnimeProfileName?: string | null;\n  activeDirectory: string;\n  activeLanguageProfileId?: number;\n  activeProfileId: number;\n  activeProfileName: string;\n  apiKey: string;\n  baseUrl?: string;\n  enableSeasonFolders: boolean;\n  externalUrl?: string;\n  hostname: string;\n  id?: number;\n  is4k: boolean;\n  isDefault: boolean;\n  name: string;\n  port: number;\n  preventSearch?: boolean;\n  syncEnabled?: boolean;\n  useSsl: boolean;\n}",
+        "SpokenLanguage",
+        "export interface SpokenLanguage {\n  englishName?: string | null;\n  iso_639_1?: string;\n  name?: string;\n}",
+        "export interface TautulliSettings {\n  apiKey?: string | null;\n  externalUrl?: string | null;\n  hostname?: string | null;\n  port?: number | null;\n  useSsl?: boolean | null;\n}",
+        "export interface TelegramSettings {\n  enabled?: boolean;\n  options?: { botAPI?: string; botUsername?: string; chatId?: string; sendSilently?: boolean; };\n  types?: number;\n}",
+        "export interface TvDetails {\n  backdropPath?: string;\n  contentRatings?: { results?: { iso_3166_1?: string; rating?: string; }[]; };\n  createdBy?: ({ gender?: number; id?: number; name?: string; profilePath?: string | null; })[];\n  credits?: { cast?: Cast[]; crew?: Crew[]; };\n  episodeRunTime?: number[];\n  externalIds?: ExternalIds;\n  firstAirDate?: string;\n  genres?: Genre[];\n  homepage?: string;\n  id?: number;\n  inProduction?: boolean;\n  keywords?: Keyword[];\n  languages?: string[];\n  lastAirDate?: string;\n  lastEpisodeToAir?: Episode;\n  mediaInfo?: MediaInfo;\n  name?: string;\n  networks?: ProductionCompany[];\n  nextEpisodeToAir?: Episode;\n  numberOfEpisodes?: number;\n  numberOfSeason?: number;\n  originCountry?: string[];\n  originalLanguage?: string;\n  originalName?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  productionCompanies?: ProductionCompany[];\n  productionCountries?: { iso_3166_1?: string; name?: string; }[];\n  seasons?: Season[];\n  spokenLanguages?: SpokenLanguage[];\n  status?: string;\n  tagline?: string;\n  type?: string;\n  voteAverage?: number;\n  voteCount?: number;\n  watchProviders?: WatchProviders[];\n}",
+        "TvResult",
+        "export interface TvResult {\n  backdropPath?: string;\n  firstAirDate?: string;\n  genreIds?: number[];\n  id?: number;\n  mediaInfo?: MediaInfo;\n  mediaType?: string;\n  name?: string;\n  originCountry?: string[];\n  originalLanguage?: string;\n  originalName?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  voteAverage?: number;\n  voteCount?: number;\n}",
+        "export interface User {\n  avatar?: string;\n  createdAt: string;\n  email: string;\n  id: number;\n  permissions?: number;\n  plexToken?: string;\n  plexUsername?: string;\n  requestCount?: number;\n  updatedAt: string;\n  userType?: number;\n  username?: string;\n}",
+        "UserSettings",
+        "export interface UserSettings {\n  locale?: string;\n  originalLanguage?: string;\n  region?: string;\n}",
+        "export interface UserSettingsNotifications {\n  discordEnabled?: boolean;\n  discordEnabledTypes?: number | null;\n  discordId?: string | null;\n  emailEnabled?: boolean;\n  notificationTypes?: NotificationAgentTypes;\n  pgpKey?: string | null;\n  pushbulletAccessToken?: string | null;\n  pushoverApplicationToken?: string | null;\n  pushoverSound?: string | null;\n  pushoverUserKey?: string | null;\n  telegramBotUsername?: string | null;\n  telegramChatId?: string | null;\n  telegramEnabled?: boolean;\n  telegramSendSilently?: boolean | null;\n}",
+        "export interface WatchProviderDetails {\n  displayPriority?: number;\n  id?: number;\n  logoPath?: string;\n  name?: string;\n}",
+        "export interface WatchProviderRegion {\n  english_name?: string;\n  iso_3166_1?: string;\n  native_name?: string;\n}",
+        "WatchProviders",
+        "export type WatchProviders = { buy?: WatchProviderDetails[]; flatrate?: unknown; iso_3166_1?: string; link?: string; }[];",
+        "export interface WebPushSettings {\n  enabled?: boolean;\n  types?: number;\n}",
+        "export interface WebhookSettings {\n  enabled?: boolean;\n  options?: { authHeader?: string; jsonPayload?: string; webhookUrl?: string; };\n  types?: number;\n}",
+    ),
+    string_ends: &[
+        24, 47, 54, 71, 76, 88, 122, 154, 163, 183, 207, 230, 237, 242, 259, 287, 314, 323, 330,
+        344, 381, 417, 425, 442, 445, 461, 507, 511, 525, 533, 552, 587, 621, 629, 647, 693, 707,
+        729, 764, 798, 806, 852, 866, 888, 910, 931, 937, 973, 977, 982, 999, 1048, 1097, 1105,
+        1141, 1152, 1167, 1171, 1189, 1202, 1219, 1261, 1265, 1296, 1327, 1360, 1372, 1380, 1414,
+        1446, 1488, 1498, 1508, 1530, 1560, 1594, 1789, 1795, 1827, 1854, 1885, 1920, 1961, 2004,
+        2013, 2017, 2051, 2092, 2331, 2354, 2373, 2396, 2401, 2409, 2430, 2451, 2457, 2463, 2477,
+        2491, 2503, 2515, 2529, 2540, 2554, 2568, 2598, 2631, 2671, 2711, 2756, 2785, 2814, 2844,
+        2877, 2909, 2939, 2970, 2985, 3022, 3061, 3068, 3099, 3384, 3408, 3448, 3491, 3788, 3824,
+        3863, 3904, 3912, 4210, 4235, 4263, 4295, 4310, 4331, 4356, 4693, 4715, 4730, 4749, 4764,
+        4779, 4786, 5022, 5039, 5072, 5107, 5389, 5415, 5451, 5490, 5784, 5822, 5859, 5898, 5907,
+        6193, 6221, 6245, 6273, 6299, 6321, 6347, 6656, 6679, 6695, 6715, 6855, 6893, 6906, 6923,
+        7059, 7068, 7081, 7087, 7098, 7102, 7106, 7110, 7177, 7222, 7267, 7330, 7376, 7533, 7547,
+        7568, 7605, 7610, 7619, 7650, 7679, 7723, 7735, 7752, 7767, 7786, 8005, 8022, 8047, 8074,
+        8113, 8120, 8125, 8136, 8149, 8166, 8366, 8393, 8402, 8415, 8533, 8609, 8770, 8779, 8811,
+        8845, 9301, 9315, 9336, 9359, 9366, 9400, 9444, 9456, 9462, 9479, 9508, 9539, 9970, 9987,
+        10024, 10063, 10742, 10780, 10817, 10856, 10878, 10907, 10938, 10956, 10981, 11008, 11057,
+        11074, 11096, 11119, 11144, 11152, 11183, 11228, 11241, 11247, 11265, 11305, 11347, 11552,
+        11572, 11583, 11598, 11771, 11796, 11807, 11822, 11961, 12125, 12141, 12166, 12210, 12222,
+        12238, 12255, 12276, 12530, 12549, 12559, 12573, 12578, 12613, 12651, 12669, 12691, 12727,
+        12962, 12982, 13000, 13022, 13061, 13296, 13315, 13333, 13355, 13426, 13433, 13469, 13500,
+        13533, 13562, 13708, 13759, 13777, 13799, 13870, 13906, 13937, 13970, 14116, 14167, 14203,
+        14241, 14247, 14316, 14328, 14350, 14368, 14390, 14684, 14700, 14718, 14740, 15277, 15304,
+        15325, 15350, 15421, 15445, 15472, 15503, 15529, 15546, 15567, 15627, 15630, 15648, 15665,
+        15686, 15776, 15826, 15872, 16150, 16162, 16179, 16200, 16244, 16256, 16273, 16307, 16345,
+        16392, 16407, 16440, 16472, 16508, 16565, 16590, 16621, 16654, 16691, 16737, 16751, 16783,
+        16817, 16855, 16902, 16917, 16950, 16987, 17028, 17078, 17096, 17132, 17167, 17206, 17254,
+        17270, 17304, 17346, 17392, 17397, 17431, 17545, 17564, 17596, 17632, 17677, 17690, 17721,
+        17756, 17795, 17843, 17859, 17893, 17927, 17965, 18012, 18027, 18060, 18094, 18132, 18179,
+        18194, 18228, 18245, 18266, 18310, 18322, 18339, 18372, 18409, 18476, 18486, 18524, 18546,
+        18572, 18872, 18908, 18931, 18958, 19145, 19159, 19178, 19201, 19247, 19261, 19280, 19299,
+        19322, 19341, 19382, 19425, 19496, 19510, 19539, 19558, 19581, 19600, 19621, 19646, 19694,
+        19710, 19731, 19741, 19755, 19971, 19977, 19997, 20015, 20037, 20169, 20203, 20226, 20251,
+        20280, 20304, 20319, 20336, 20340, 20373, 20414, 20423, 20425, 20439, 20462, 20487, 20792,
+        20806, 20837, 20870, 20895, 20927, 20962, 20970, 21008, 21014, 21049, 21072, 21097, 21118,
+        21126, 21138, 21229, 21385, 21398, 21417, 21431, 21477, 21620, 21665, 21703, 21742, 21791,
+        21816, 21843, 22360, 22390, 22418, 22448, 22480, 22513, 22548, 22629, 22660, 22702, 22746,
+        22803, 22828, 22864, 22901, 22940, 23020, 23049, 23089, 23131, 23207, 23241, 23271, 23303,
+        23450, 23479, 23510, 23552, 23577, 23606, 23683, 23703, 23728, 23754, 23784, 23860, 23879,
+        23905, 23926, 23951, 23976, 23991, 24009, 24128, 24157, 24173, 24192, 24266, 24299, 24313,
+        24330, 24417, 24443, 24467, 24494, 24573, 24600, 24632, 24666, 24670, 24736, 24821, 24850,
+        24860, 24978, 24981, 24997, 25026, 25058, 25064, 25108, 25132, 25162, 25193, 25276, 25292,
+        25321, 25353, 25444, 25518, 25559, 25568, 25587, 25599, 26142, 26160, 26193, 26229, 26275,
+        26300, 26332, 26365, 26385, 26422, 26460, 26467, 26489, 26511, 26536, 26562, 26591, 26748,
+        26764, 26788, 26815, 26837, 26872, 26908, 26913, 26948, 26969, 27001, 27034, 27055, 27092,
+        27130, 27217, 27236, 27254, 27274, 27303, 27335, 27381, 27416, 27452, 27492, 27535, 27556,
+        27589, 27623, 27661, 27702, 27721, 27755, 27790, 27829, 27871, 27891, 27926, 27962, 28002,
+        28045, 28066, 28104, 28143, 28186, 28232, 28256, 28292, 28329, 28370, 28414, 28436, 28469,
+        28503, 28541, 28582, 28601, 28637, 28674, 28715, 28759, 28781, 28816, 28852, 28892, 28935,
+        28956, 28991, 29028, 29068, 29111, 29133, 29151, 29171, 29194, 29313, 29341, 29361, 29383,
+        29408, 29436, 29730, 29845, 29870, 29890, 29912, 29937, 29965, 30259, 30284, 30306, 30330,
+        30339, 30484, 30499, 30525, 30554, 30639, 30700, 30726, 30762, 30799, 30982, 31032, 31066,
+        31143, 31177, 31220, 31259, 31297, 31440, 31466, 31507, 31598, 31635, 31666, 31726, 31746,
+        31771, 32158, 32177, 32211, 32370, 32392, 32424, 32446, 32478, 32500, 32508, 32623, 32644,
+        32663, 32687, 32691, 32878, 33035, 33042, 33131, 33141, 33693, 33703, 34272, 34276, 34443,
+        34627, 34783, 34790, 35070, 35081, 35344, 35349, 35407, 35528, 35682, 35765, 35945, 36005,
+        36140, 36468, 36650, 36923, 38041, 38052, 38439, 38446, 38560, 38582, 38786, 39107, 39115,
+        39199, 39515, 39527, 39681, 39695, 39857, 40462, 40473, 40555, 40740, 40864, 40924, 41069,
+        41220, 41608, 41620, 41849, 42053, 42063, 42127, 42194, 42305, 43385, 43980, 43994, 44099,
+        44272, 44445, 45612, 45620, 45996, 46251, 46263, 46363, 46899, 47021, 47133, 47147, 47268,
+        47343, 47499,
+    ],
+    names: &[
+        2, 8, 12, 17, 22, 33, 40, 46, 53, 46, 66, 67, 84, 67, 85, 92, 93, 67, 85, 94, 95, 96, 97,
+        98, 99, 100, 101, 102, 103, 104, 105, 121, 131, 143, 144, 92, 93, 67, 145, 85, 96, 98, 99,
+        100, 101, 102, 103, 104, 105, 158, 85, 177, 178, 179, 180, 181, 177, 179, 180, 181, 224,
+        251, 67, 85, 280, 85, 280, 313, 177, 77, 179, 181, 381, 459, 474, 459, 179, 180, 181, 179,
+        181, 103, 555, 2, 565, 12, 565, 17, 565, 591, 604,
+    ],
+    parameters: &[
+        [2, 0, 1, 3, 0, 0],
+        [8, 0, 1, 3, 0, 0],
+        [12, 0, 1, 3, 0, 0],
+        [17, 0, 1, 3, 0, 0],
+        [22, 0, 1, 23, 0, 0],
+        [33, 0, 1, 34, 0, 0],
+        [40, 0, 1, 34, 0, 0],
+        [46, 0, 1, 23, 0, 0],
+        [53, 0, 1, 3, 0, 0],
+        [46, 0, 1, 23, 0, 0],
+        [66, 0, 1, 68, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [67, 1, 0, 69, 3, 1],
+        [84, 0, 1, 86, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [92, 1, 0, 106, 3, 1],
+        [93, 1, 0, 107, 3, 1],
+        [67, 1, 0, 69, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [94, 1, 0, 108, 3, 1],
+        [95, 1, 0, 109, 3, 1],
+        [96, 1, 0, 110, 3, 1],
+        [97, 1, 0, 111, 3, 1],
+        [98, 1, 0, 112, 3, 1],
+        [99, 1, 0, 113, 3, 1],
+        [100, 1, 0, 112, 3, 1],
+        [101, 1, 0, 113, 3, 1],
+        [102, 1, 0, 114, 3, 1],
+        [103, 1, 0, 115, 3, 1],
+        [104, 1, 0, 116, 3, 1],
+        [105, 1, 0, 117, 3, 1],
+        [121, 0, 1, 122, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [67, 0, 1, 69, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [67, 1, 0, 69, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [131, 0, 1, 122, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [143, 1, 0, 108, 3, 1],
+        [144, 1, 0, 109, 3, 1],
+        [92, 1, 0, 106, 3, 1],
+        [93, 1, 0, 107, 3, 1],
+        [67, 1, 0, 69, 3, 1],
+        [145, 1, 0, 111, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [96, 1, 0, 110, 3, 1],
+        [98, 1, 0, 112, 3, 1],
+        [99, 1, 0, 113, 3, 1],
+        [100, 1, 0, 112, 3, 1],
+        [101, 1, 0, 113, 3, 1],
+        [102, 1, 0, 114, 3, 1],
+        [103, 1, 0, 115, 3, 1],
+        [104, 1, 0, 116, 3, 1],
+        [105, 1, 0, 117, 3, 1],
+        [67, 1, 0, 69, 3, 1],
+        [158, 0, 1, 122, 0, 0],
+        [85, 1, 0, 87, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [177, 1, 0, 182, 3, 1],
+        [178, 1, 0, 183, 3, 1],
+        [179, 1, 0, 184, 3, 1],
+        [180, 1, 0, 185, 3, 1],
+        [181, 1, 0, 186, 3, 1],
+        [2, 0, 1, 111, 0, 0],
+        [8, 0, 1, 194, 0, 0],
+        [84, 0, 1, 111, 0, 0],
+        [177, 1, 0, 214, 3, 1],
+        [179, 1, 0, 184, 3, 1],
+        [180, 1, 0, 215, 3, 1],
+        [181, 1, 0, 186, 3, 1],
+        [67, 1, 0, 69, 3, 1],
+        [224, 0, 1, 225, 0, 0],
+        [224, 0, 1, 225, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [224, 0, 1, 225, 0, 0],
+        [85, 1, 0, 87, 3, 1],
+        [158, 0, 1, 111, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [251, 0, 1, 252, 0, 0],
+        [177, 1, 0, 267, 3, 1],
+        [178, 1, 0, 183, 3, 1],
+        [179, 1, 0, 184, 3, 1],
+        [180, 1, 0, 185, 3, 1],
+        [181, 1, 0, 186, 3, 1],
+        [67, 1, 0, 69, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [280, 1, 1, 281, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [280, 1, 1, 285, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [280, 1, 1, 290, 3, 1],
+        [33, 0, 1, 300, 0, 0],
+        [40, 0, 1, 300, 0, 0],
+        [313, 0, 1, 300, 0, 0],
+        [177, 1, 0, 339, 3, 1],
+        [77, 1, 0, 340, 3, 1],
+        [179, 1, 0, 184, 3, 1],
+        [181, 1, 0, 341, 3, 1],
+        [381, 1, 1, 382, 3, 1],
+        [131, 0, 1, 455, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [459, 0, 1, 460, 0, 0],
+        [459, 0, 1, 460, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [85, 1, 0, 87, 3, 1],
+        [459, 0, 1, 460, 0, 0],
+        [67, 1, 0, 69, 3, 1],
+        [474, 0, 1, 111, 0, 0],
+        [459, 0, 1, 460, 0, 0],
+        [179, 1, 0, 184, 3, 1],
+        [180, 1, 0, 483, 3, 1],
+        [181, 1, 0, 186, 3, 1],
+        [179, 1, 0, 184, 3, 1],
+        [181, 1, 0, 186, 3, 1],
+        [46, 0, 1, 23, 0, 0],
+        [85, 1, 0, 87, 3, 1],
+        [46, 0, 1, 23, 0, 0],
+        [103, 1, 1, 115, 3, 1],
+        [555, 0, 1, 556, 0, 0],
+        [2, 0, 1, 122, 0, 0],
+        [565, 0, 1, 566, 0, 0],
+        [12, 0, 1, 3, 0, 0],
+        [565, 0, 1, 574, 0, 0],
+        [17, 0, 1, 122, 0, 0],
+        [565, 0, 1, 584, 0, 0],
+        [17, 0, 1, 122, 0, 0],
+        [591, 0, 1, 3, 0, 0],
+        [604, 0, 1, 3, 0, 0],
+    ],
+    representations: &[
+        [25, 25, 0, 26, 27],
+        [25, 25, 0, 35, 27],
+        [25, 25, 0, 41, 27],
+        [25, 25, 0, 47, 27],
+        [25, 25, 0, 61, 27],
+        [25, 25, 0, 70, 27],
+        [25, 25, 0, 76, 27],
+        [25, 25, 0, 88, 27],
+        [25, 25, 0, 123, 27],
+        [25, 25, 0, 127, 27],
+        [25, 25, 0, 132, 27],
+        [25, 25, 0, 139, 27],
+        [25, 25, 0, 146, 27],
+        [25, 25, 0, 150, 27],
+        [25, 25, 0, 154, 27],
+        [25, 25, 0, 159, 27],
+        [25, 25, 0, 166, 27],
+        [25, 25, 0, 170, 27],
+        [25, 25, 0, 174, 27],
+        [25, 25, 0, 187, 27],
+        [25, 25, 0, 190, 27],
+        [25, 25, 0, 195, 27],
+        [25, 25, 0, 200, 27],
+        [25, 25, 0, 204, 27],
+        [25, 25, 0, 210, 27],
+        [25, 25, 0, 216, 27],
+        [25, 25, 0, 220, 27],
+        [25, 25, 0, 226, 27],
+        [25, 25, 0, 232, 27],
+        [25, 25, 0, 236, 27],
+        [25, 25, 0, 246, 27],
+        [25, 25, 0, 253, 27],
+        [25, 25, 0, 259, 27],
+        [25, 25, 0, 263, 27],
+        [25, 25, 0, 268, 27],
+        [25, 25, 0, 271, 27],
+        [25, 25, 0, 276, 27],
+        [25, 25, 0, 286, 27],
+        [25, 25, 0, 291, 27],
+        [25, 25, 0, 295, 27],
+        [25, 25, 0, 301, 27],
+        [25, 25, 0, 305, 27],
+        [25, 25, 0, 309, 27],
+        [25, 25, 0, 314, 27],
+        [25, 25, 0, 319, 27],
+        [25, 25, 0, 323, 27],
+        [25, 25, 0, 327, 27],
+        [25, 25, 0, 334, 27],
+        [25, 25, 0, 342, 27],
+        [25, 25, 0, 346, 27],
+        [25, 25, 0, 351, 27],
+        [25, 25, 0, 356, 27],
+        [25, 25, 0, 361, 27],
+        [25, 25, 0, 366, 27],
+        [25, 25, 0, 371, 27],
+        [25, 25, 0, 376, 27],
+        [25, 25, 0, 383, 27],
+        [25, 25, 0, 387, 27],
+        [25, 25, 0, 392, 27],
+        [25, 25, 0, 397, 27],
+        [25, 25, 0, 402, 27],
+        [25, 25, 0, 407, 27],
+        [25, 25, 0, 412, 27],
+        [25, 25, 0, 417, 27],
+        [25, 25, 0, 421, 27],
+        [25, 25, 0, 425, 27],
+        [25, 25, 0, 433, 27],
+        [25, 25, 0, 441, 27],
+        [25, 25, 0, 446, 27],
+        [25, 25, 0, 451, 27],
+        [25, 25, 0, 461, 27],
+        [25, 25, 0, 467, 27],
+        [25, 25, 0, 475, 27],
+        [25, 25, 0, 484, 27],
+        [25, 25, 0, 489, 27],
+        [25, 25, 0, 496, 27],
+        [25, 25, 0, 503, 27],
+        [25, 25, 0, 507, 27],
+        [25, 25, 0, 512, 27],
+        [25, 25, 0, 516, 27],
+        [25, 25, 0, 520, 27],
+        [25, 25, 0, 526, 27],
+        [25, 25, 0, 531, 27],
+        [0, 25, 0, 539, 27],
+        [25, 25, 0, 543, 27],
+        [0, 25, 0, 547, 27],
+        [0, 25, 0, 551, 27],
+        [0, 25, 0, 557, 27],
+        [0, 25, 0, 560, 27],
+        [562, 25, 0, 190, 27],
+        [0, 25, 0, 570, 27],
+        [0, 25, 0, 575, 27],
+        [25, 25, 0, 576, 27],
+        [0, 25, 0, 580, 27],
+        [562, 25, 0, 271, 27],
+        [0, 25, 0, 327, 27],
+        [0, 25, 0, 597, 27],
+        [25, 25, 0, 605, 27],
+        [0, 25, 0, 612, 27],
+        [0, 25, 0, 346, 27],
+        [0, 25, 0, 351, 27],
+        [0, 25, 0, 356, 27],
+        [0, 25, 0, 361, 27],
+        [0, 25, 0, 366, 27],
+        [0, 25, 0, 371, 27],
+        [0, 25, 0, 376, 27],
+        [0, 25, 0, 387, 27],
+        [0, 25, 0, 392, 27],
+        [0, 25, 0, 397, 27],
+        [0, 25, 0, 402, 27],
+        [0, 25, 0, 407, 27],
+        [0, 25, 0, 672, 27],
+        [0, 25, 0, 35, 27],
+        [562, 25, 0, 35, 27],
+        [0, 25, 0, 678, 27],
+        [25, 25, 0, 679, 27],
+        [0, 25, 0, 41, 27],
+        [562, 25, 0, 41, 27],
+        [0, 25, 0, 685, 27],
+        [0, 25, 0, 441, 27],
+        [0, 25, 0, 690, 27],
+        [562, 25, 0, 47, 27],
+        [0, 25, 0, 694, 27],
+        [562, 25, 0, 695, 27],
+        [0, 25, 0, 699, 27],
+        [0, 25, 0, 702, 27],
+        [0, 25, 0, 507, 27],
+        [0, 25, 0, 707, 27],
+        [0, 25, 0, 710, 27],
+        [0, 25, 0, 713, 27],
+        [0, 25, 0, 716, 27],
+        [0, 25, 0, 719, 27],
+        [0, 25, 0, 726, 27],
+        [25, 25, 0, 695, 27],
+        [0, 25, 0, 47, 27],
+    ],
+    operations: &[
+        [0, 3, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 4, 5],
+        [6, 3, 7, 1, 1, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 4, 9],
+        [10, 3, 11, 2, 1, 0, 0, 2, 1, 0, 0, 0, 0, 0, 0, 0, 13, 14],
+        [15, 3, 16, 3, 1, 0, 0, 3, 1, 0, 0, 0, 0, 0, 0, 0, 18, 19],
+        [20, 3, 21, 4, 1, 0, 0, 4, 1, 0, 0, 0, 0, 1, 0, 29, 29, 30],
+        [31, 3, 32, 5, 1, 0, 0, 5, 1, 0, 0, 0, 1, 1, 0, 37, 29, 37],
+        [38, 3, 39, 6, 1, 0, 0, 6, 1, 0, 0, 0, 2, 1, 0, 43, 29, 43],
+        [44, 3, 45, 7, 1, 0, 0, 7, 1, 0, 0, 0, 3, 1, 0, 49, 49, 50],
+        [51, 3, 52, 8, 2, 0, 0, 8, 2, 0, 0, 0, 0, 0, 0, 0, 49, 54],
+        [55, 0, 56, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1, 0, 49, 57, 58],
+        [59, 0, 60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 1, 0, 0, 62, 63],
+        [64, 0, 65, 10, 1, 11, 1, 10, 2, 0, 0, 0, 5, 1, 0, 72, 72, 73],
+        [74, 0, 75, 0, 0, 11, 1, 12, 1, 0, 0, 0, 6, 1, 0, 0, 77, 78],
+        [79, 0, 80, 0, 0, 11, 1, 12, 1, 0, 0, 0, 6, 1, 0, 0, 77, 81],
+        [82, 0, 83, 12, 1, 13, 2, 13, 3, 0, 0, 0, 7, 1, 0, 0, 77, 89],
+        [
+            90, 0, 91, 0, 0, 15, 16, 16, 16, 0, 0, 0, 7, 1, 0, 0, 77, 118,
+        ],
+        [
+            119, 0, 120, 31, 1, 13, 2, 32, 3, 0, 0, 0, 8, 1, 0, 0, 77, 124,
+        ],
+        [
+            125, 0, 126, 11, 1, 13, 2, 35, 3, 0, 0, 0, 9, 1, 0, 0, 77, 128,
+        ],
+        [
+            129, 0, 130, 32, 1, 13, 2, 38, 3, 0, 0, 0, 10, 1, 0, 0, 77, 133,
+        ],
+        [
+            134, 0, 135, 0, 0, 13, 2, 41, 2, 0, 0, 0, 7, 1, 0, 0, 77, 136,
+        ],
+        [
+            137, 0, 138, 0, 0, 13, 2, 41, 2, 0, 0, 0, 11, 1, 0, 0, 77, 140,
+        ],
+        [
+            141, 0, 142, 0, 0, 33, 16, 43, 16, 0, 0, 0, 12, 1, 0, 0, 77, 147,
+        ],
+        [
+            148, 0, 149, 31, 1, 13, 2, 32, 3, 0, 0, 0, 13, 1, 0, 0, 77, 151,
+        ],
+        [
+            152, 0, 153, 11, 1, 13, 2, 35, 3, 0, 0, 0, 14, 1, 0, 0, 77, 155,
+        ],
+        [
+            156, 0, 157, 49, 1, 13, 2, 59, 3, 0, 0, 0, 15, 1, 0, 0, 77, 160,
+        ],
+        [
+            161, 0, 162, 0, 0, 13, 2, 41, 2, 0, 0, 0, 12, 1, 0, 0, 77, 163,
+        ],
+        [
+            164, 0, 165, 0, 0, 50, 1, 62, 1, 0, 0, 0, 16, 1, 0, 0, 77, 167,
+        ],
+        [
+            168, 0, 169, 0, 0, 11, 1, 12, 1, 0, 0, 0, 17, 1, 0, 0, 62, 171,
+        ],
+        [
+            172, 0, 173, 0, 0, 11, 1, 12, 1, 0, 0, 0, 18, 1, 0, 0, 62, 171,
+        ],
+        [
+            175, 0, 176, 0, 0, 51, 5, 63, 5, 0, 0, 0, 19, 1, 0, 0, 4, 188,
+        ],
+        [189, 0, 1, 0, 1, 0, 0, 68, 1, 0, 0, 0, 20, 1, 0, 192, 4, 192],
+        [193, 0, 7, 1, 1, 0, 0, 69, 1, 0, 0, 0, 21, 1, 0, 197, 4, 197],
+        [198, 0, 199, 0, 0, 0, 0, 0, 0, 0, 0, 0, 22, 1, 0, 0, 4, 201],
+        [
+            202, 0, 203, 12, 1, 0, 0, 70, 1, 0, 0, 0, 23, 1, 0, 206, 206, 207,
+        ],
+        [208, 0, 209, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 1, 0, 0, 62, 211],
+        [
+            212, 0, 213, 0, 0, 56, 4, 71, 4, 0, 0, 0, 25, 1, 0, 0, 13, 217,
+        ],
+        [218, 0, 219, 2, 1, 0, 0, 2, 1, 0, 0, 0, 26, 1, 0, 0, 13, 221],
+        [
+            222, 0, 223, 60, 1, 11, 1, 75, 2, 0, 0, 0, 27, 1, 0, 228, 228, 229,
+        ],
+        [
+            230, 0, 231, 60, 1, 0, 0, 77, 1, 0, 0, 0, 28, 1, 0, 0, 228, 233,
+        ],
+        [
+            234, 0, 235, 60, 1, 0, 0, 77, 1, 0, 0, 0, 29, 1, 0, 0, 228, 237,
+        ],
+        [
+            238, 0, 239, 60, 1, 13, 2, 78, 3, 0, 0, 0, 7, 1, 0, 0, 228, 240,
+        ],
+        [
+            241, 0, 242, 60, 1, 13, 2, 78, 3, 0, 0, 0, 7, 1, 0, 0, 228, 243,
+        ],
+        [
+            244, 0, 245, 49, 1, 0, 0, 81, 1, 0, 0, 0, 30, 1, 0, 248, 62, 248,
+        ],
+        [
+            249, 0, 250, 61, 1, 11, 1, 82, 2, 0, 0, 0, 31, 1, 0, 255, 255, 256,
+        ],
+        [
+            257, 0, 258, 61, 1, 11, 1, 82, 2, 0, 0, 0, 32, 1, 0, 0, 255, 260,
+        ],
+        [261, 0, 262, 0, 0, 0, 0, 0, 0, 0, 0, 0, 33, 1, 0, 0, 62, 264],
+        [
+            265, 0, 266, 0, 0, 51, 5, 84, 5, 0, 0, 0, 34, 1, 0, 0, 18, 269,
+        ],
+        [
+            270, 0, 16, 3, 1, 0, 0, 3, 1, 0, 0, 0, 35, 1, 0, 273, 18, 273,
+        ],
+        [274, 0, 275, 0, 0, 0, 0, 0, 0, 0, 0, 0, 36, 1, 0, 0, 18, 277],
+        [
+            278, 0, 279, 0, 0, 62, 3, 89, 3, 0, 0, 0, 11, 1, 0, 0, 77, 282,
+        ],
+        [
+            283, 0, 284, 0, 0, 65, 2, 92, 2, 0, 0, 0, 37, 1, 0, 0, 77, 287,
+        ],
+        [
+            288, 0, 289, 0, 0, 65, 2, 94, 2, 0, 0, 0, 38, 1, 0, 0, 77, 292,
+        ],
+        [
+            293, 0, 294, 0, 0, 0, 0, 0, 0, 0, 0, 0, 39, 1, 0, 37, 296, 297,
+        ],
+        [
+            298, 0, 299, 5, 1, 0, 0, 96, 1, 0, 0, 0, 40, 1, 0, 0, 296, 302,
+        ],
+        [
+            303, 0, 304, 0, 0, 0, 0, 0, 0, 0, 0, 0, 41, 1, 0, 43, 296, 306,
+        ],
+        [
+            307, 0, 308, 6, 1, 0, 0, 97, 1, 0, 0, 0, 42, 1, 0, 0, 296, 310,
+        ],
+        [
+            311, 0, 312, 67, 1, 0, 0, 98, 1, 0, 0, 0, 43, 1, 0, 316, 296, 316,
+        ],
+        [317, 0, 318, 0, 0, 0, 0, 0, 0, 0, 0, 0, 44, 1, 0, 0, 29, 320],
+        [321, 0, 322, 0, 0, 0, 0, 0, 0, 0, 0, 0, 45, 1, 0, 0, 29, 324],
+        [
+            325, 0, 326, 0, 0, 0, 0, 0, 0, 0, 0, 0, 46, 1, 0, 29, 29, 328,
+        ],
+        [329, 0, 330, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 29, 331],
+        [
+            332, 0, 333, 0, 0, 0, 0, 0, 0, 0, 0, 0, 47, 1, 0, 336, 29, 336,
+        ],
+        [
+            337, 0, 338, 0, 0, 68, 4, 99, 4, 0, 0, 0, 48, 1, 0, 0, 29, 343,
+        ],
+        [
+            344, 0, 345, 0, 0, 0, 0, 0, 0, 0, 0, 0, 49, 1, 0, 348, 29, 348,
+        ],
+        [
+            349, 0, 350, 0, 0, 0, 0, 0, 0, 0, 0, 0, 50, 1, 0, 353, 29, 353,
+        ],
+        [
+            354, 0, 355, 0, 0, 0, 0, 0, 0, 0, 0, 0, 51, 1, 0, 358, 29, 358,
+        ],
+        [
+            359, 0, 360, 0, 0, 0, 0, 0, 0, 0, 0, 0, 52, 1, 0, 363, 29, 363,
+        ],
+        [
+            364, 0, 365, 0, 0, 0, 0, 0, 0, 0, 0, 0, 53, 1, 0, 368, 29, 368,
+        ],
+        [
+            369, 0, 370, 0, 0, 0, 0, 0, 0, 0, 0, 0, 54, 1, 0, 373, 29, 373,
+        ],
+        [
+            374, 0, 375, 0, 0, 0, 0, 0, 0, 0, 0, 0, 55, 1, 0, 378, 29, 378,
+        ],
+        [
+            379, 0, 380, 0, 0, 72, 1, 103, 1, 0, 0, 0, 56, 1, 0, 0, 29, 384,
+        ],
+        [
+            385, 0, 386, 0, 0, 0, 0, 0, 0, 0, 0, 0, 57, 1, 0, 389, 29, 389,
+        ],
+        [
+            390, 0, 391, 0, 0, 0, 0, 0, 0, 0, 0, 0, 58, 1, 0, 394, 29, 394,
+        ],
+        [
+            395, 0, 396, 0, 0, 0, 0, 0, 0, 0, 0, 0, 59, 1, 0, 399, 29, 399,
+        ],
+        [
+            400, 0, 401, 0, 0, 0, 0, 0, 0, 0, 0, 0, 60, 1, 0, 404, 29, 404,
+        ],
+        [
+            405, 0, 406, 0, 0, 0, 0, 0, 0, 0, 0, 0, 61, 1, 0, 409, 29, 409,
+        ],
+        [
+            410, 0, 411, 0, 0, 0, 0, 0, 0, 0, 0, 0, 62, 1, 0, 414, 29, 414,
+        ],
+        [415, 0, 416, 0, 0, 0, 0, 0, 0, 0, 0, 0, 63, 1, 0, 0, 29, 418],
+        [419, 0, 420, 0, 0, 0, 0, 0, 0, 0, 0, 0, 64, 1, 0, 0, 29, 422],
+        [
+            423, 0, 424, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 1, 0, 427, 29, 427,
+        ],
+        [
+            428, 0, 429, 0, 0, 0, 0, 0, 0, 0, 0, 0, 39, 1, 0, 37, 29, 430,
+        ],
+        [
+            431, 0, 432, 5, 1, 0, 0, 5, 1, 0, 0, 0, 66, 1, 0, 435, 29, 435,
+        ],
+        [
+            436, 0, 437, 0, 0, 0, 0, 0, 0, 0, 0, 0, 41, 1, 0, 43, 29, 438,
+        ],
+        [
+            439, 0, 440, 0, 0, 0, 0, 0, 0, 0, 0, 0, 67, 1, 0, 443, 29, 443,
+        ],
+        [
+            444, 0, 445, 0, 0, 0, 0, 0, 0, 0, 0, 0, 68, 1, 0, 0, 447, 448,
+        ],
+        [
+            449, 0, 450, 0, 0, 0, 0, 0, 0, 0, 0, 0, 69, 1, 0, 0, 447, 452,
+        ],
+        [
+            453, 0, 454, 32, 1, 0, 0, 104, 1, 0, 0, 0, 30, 1, 0, 248, 62, 456,
+        ],
+        [
+            457, 0, 458, 73, 1, 11, 1, 105, 2, 0, 0, 0, 70, 1, 0, 463, 463, 464,
+        ],
+        [
+            465, 0, 466, 73, 1, 0, 0, 107, 1, 0, 0, 0, 71, 1, 0, 0, 463, 468,
+        ],
+        [
+            469, 0, 470, 73, 1, 13, 2, 108, 3, 0, 0, 0, 12, 1, 0, 0, 463, 471,
+        ],
+        [
+            472, 0, 473, 74, 2, 11, 1, 111, 3, 0, 0, 0, 72, 1, 0, 477, 463, 477,
+        ],
+        [
+            478, 0, 479, 73, 1, 13, 2, 108, 3, 0, 0, 0, 12, 1, 0, 0, 463, 480,
+        ],
+        [
+            481, 0, 482, 0, 0, 76, 3, 114, 3, 0, 0, 0, 73, 1, 0, 0, 49, 485,
+        ],
+        [486, 0, 45, 7, 1, 0, 0, 7, 1, 0, 0, 0, 3, 1, 0, 49, 49, 487],
+        [488, 0, 52, 8, 2, 0, 0, 8, 2, 0, 0, 0, 74, 1, 0, 0, 49, 490],
+        [491, 0, 492, 7, 1, 0, 0, 7, 1, 0, 0, 0, 74, 1, 0, 0, 49, 493],
+        [494, 0, 495, 7, 1, 0, 0, 7, 1, 0, 0, 0, 75, 1, 0, 0, 49, 497],
+        [
+            498, 0, 499, 7, 1, 79, 2, 117, 3, 0, 0, 0, 34, 1, 0, 0, 49, 500,
+        ],
+        [501, 0, 502, 7, 1, 0, 0, 7, 1, 0, 0, 0, 76, 1, 0, 0, 49, 504],
+        [
+            505, 0, 506, 7, 1, 0, 0, 7, 1, 0, 0, 0, 77, 1, 0, 509, 49, 509,
+        ],
+        [510, 0, 511, 7, 1, 0, 0, 7, 1, 0, 0, 0, 78, 1, 0, 0, 49, 513],
+        [514, 0, 515, 7, 1, 0, 0, 7, 1, 0, 0, 0, 79, 1, 0, 0, 49, 517],
+        [518, 0, 519, 7, 1, 0, 0, 7, 1, 0, 0, 0, 80, 1, 0, 0, 49, 221],
+        [
+            521, 0, 522, 7, 1, 50, 1, 120, 2, 0, 0, 0, 16, 1, 0, 0, 49, 523,
+        ],
+        [
+            524, 0, 525, 0, 0, 81, 1, 122, 1, 0, 0, 0, 81, 1, 0, 528, 206, 528,
+        ],
+        [
+            529, 0, 530, 0, 0, 0, 0, 0, 0, 0, 0, 0, 82, 1, 0, 533, 206, 533,
+        ],
+        [
+            534, 0, 535, 0, 0, 81, 1, 122, 1, 0, 0, 0, 81, 1, 0, 528, 206, 536,
+        ],
+        [
+            537, 1, 538, 0, 0, 0, 0, 0, 0, 2, 83, 1, 3, 1, 0, 49, 57, 540,
+        ],
+        [541, 1, 542, 0, 0, 0, 0, 0, 0, 0, 0, 0, 84, 1, 0, 0, 57, 544],
+        [
+            545, 1, 546, 0, 0, 0, 0, 0, 0, 2, 85, 1, 3, 1, 0, 49, 57, 548,
+        ],
+        [
+            549, 1, 550, 0, 0, 0, 0, 0, 0, 2, 86, 1, 84, 1, 0, 0, 49, 552,
+        ],
+        [
+            553, 1, 554, 82, 1, 0, 0, 123, 1, 2, 87, 1, 84, 1, 0, 0, 49, 558,
+        ],
+        [
+            559, 1, 176, 0, 0, 0, 0, 0, 0, 2, 88, 1, 89, 1, 0, 192, 4, 562,
+        ],
+        [
+            563, 1, 564, 83, 2, 0, 0, 124, 2, 0, 0, 0, 20, 1, 0, 192, 4, 567,
+        ],
+        [
+            568, 1, 569, 0, 1, 0, 0, 68, 1, 2, 90, 1, 20, 1, 0, 192, 4, 571,
+        ],
+        [
+            572, 1, 573, 85, 2, 0, 0, 126, 2, 1, 91, 1, 92, 1, 0, 578, 13, 578,
+        ],
+        [
+            579, 1, 266, 0, 0, 0, 0, 0, 0, 2, 93, 1, 94, 1, 0, 273, 18, 581,
+        ],
+        [
+            582, 1, 583, 87, 2, 0, 0, 128, 2, 0, 0, 0, 35, 1, 0, 273, 18, 585,
+        ],
+        [
+            586, 1, 587, 3, 1, 0, 0, 130, 1, 0, 0, 0, 35, 1, 0, 273, 18, 588,
+        ],
+        [
+            589, 1, 590, 89, 1, 0, 0, 131, 1, 0, 0, 0, 0, 0, 0, 0, 29, 592,
+        ],
+        [
+            593, 1, 326, 0, 0, 0, 0, 0, 0, 2, 95, 1, 46, 1, 29, 29, 29, 594,
+        ],
+        [
+            595, 1, 596, 0, 0, 0, 0, 0, 0, 2, 96, 1, 0, 1, 0, 29, 29, 598,
+        ],
+        [
+            599, 1, 600, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 1, 0, 427, 29, 601,
+        ],
+        [
+            602, 1, 603, 90, 1, 0, 0, 132, 1, 0, 0, 0, 97, 1, 0, 336, 29, 606,
+        ],
+        [
+            607, 1, 608, 90, 1, 0, 0, 132, 1, 0, 0, 0, 97, 1, 0, 336, 29, 609,
+        ],
+        [
+            610, 1, 611, 90, 1, 0, 0, 132, 1, 2, 98, 1, 97, 1, 0, 336, 29, 613,
+        ],
+        [
+            614, 1, 345, 0, 0, 0, 0, 0, 0, 2, 99, 1, 49, 1, 348, 348, 29, 615,
+        ],
+        [
+            616, 1, 617, 0, 0, 0, 0, 0, 0, 0, 0, 0, 49, 1, 0, 348, 29, 618,
+        ],
+        [
+            619, 1, 350, 0, 0, 0, 0, 0, 0, 2, 100, 1, 50, 1, 353, 353, 29, 620,
+        ],
+        [
+            621, 1, 622, 0, 0, 0, 0, 0, 0, 2, 100, 1, 0, 0, 353, 0, 29, 623,
+        ],
+        [
+            624, 1, 355, 0, 0, 0, 0, 0, 0, 2, 101, 1, 51, 1, 358, 358, 29, 625,
+        ],
+        [
+            626, 1, 627, 0, 0, 0, 0, 0, 0, 2, 101, 1, 0, 0, 358, 0, 29, 628,
+        ],
+        [
+            629, 1, 360, 0, 0, 0, 0, 0, 0, 2, 102, 1, 52, 1, 363, 363, 29, 630,
+        ],
+        [
+            631, 1, 632, 0, 0, 0, 0, 0, 0, 2, 102, 1, 0, 0, 363, 0, 29, 633,
+        ],
+        [
+            634, 1, 365, 0, 0, 0, 0, 0, 0, 2, 103, 1, 53, 1, 368, 368, 29, 635,
+        ],
+        [
+            636, 1, 637, 0, 0, 0, 0, 0, 0, 2, 103, 1, 0, 0, 368, 0, 29, 638,
+        ],
+        [
+            639, 1, 370, 0, 0, 0, 0, 0, 0, 2, 104, 1, 54, 1, 373, 373, 29, 640,
+        ],
+        [
+            641, 1, 642, 0, 0, 0, 0, 0, 0, 2, 104, 1, 0, 0, 373, 0, 29, 643,
+        ],
+        [
+            644, 1, 375, 0, 0, 0, 0, 0, 0, 2, 105, 1, 55, 1, 378, 378, 29, 645,
+        ],
+        [
+            646, 1, 647, 0, 0, 0, 0, 0, 0, 2, 105, 1, 0, 0, 378, 0, 29, 648,
+        ],
+        [
+            649, 1, 386, 0, 0, 0, 0, 0, 0, 2, 106, 1, 57, 1, 389, 389, 29, 650,
+        ],
+        [
+            651, 1, 652, 0, 0, 0, 0, 0, 0, 2, 106, 1, 0, 0, 389, 0, 29, 653,
+        ],
+        [
+            654, 1, 391, 0, 0, 0, 0, 0, 0, 2, 107, 1, 58, 1, 394, 394, 29, 655,
+        ],
+        [
+            656, 1, 657, 0, 0, 0, 0, 0, 0, 2, 107, 1, 0, 0, 394, 0, 29, 658,
+        ],
+        [
+            659, 1, 396, 0, 0, 0, 0, 0, 0, 2, 108, 1, 59, 1, 399, 399, 29, 660,
+        ],
+        [
+            661, 1, 662, 0, 0, 0, 0, 0, 0, 2, 108, 1, 0, 0, 399, 0, 29, 663,
+        ],
+        [
+            664, 1, 401, 0, 0, 0, 0, 0, 0, 2, 109, 1, 60, 1, 404, 404, 29, 665,
+        ],
+        [
+            666, 1, 667, 0, 0, 0, 0, 0, 0, 2, 109, 1, 0, 0, 404, 0, 29, 668,
+        ],
+        [
+            669, 1, 406, 0, 0, 0, 0, 0, 0, 2, 110, 1, 61, 1, 409, 409, 29, 670,
+        ],
+        [
+            671, 1, 416, 0, 0, 0, 0, 0, 0, 1, 111, 1, 63, 1, 0, 0, 29, 673,
+        ],
+        [
+            674, 1, 429, 0, 0, 0, 0, 0, 0, 2, 112, 1, 113, 1, 37, 37, 29, 675,
+        ],
+        [
+            676, 1, 677, 0, 0, 0, 0, 0, 0, 2, 114, 1, 115, 1, 0, 0, 29, 680,
+        ],
+        [
+            681, 1, 437, 0, 0, 0, 0, 0, 0, 2, 116, 1, 117, 1, 43, 43, 29, 682,
+        ],
+        [
+            683, 1, 684, 0, 0, 0, 0, 0, 0, 2, 118, 1, 115, 1, 0, 0, 29, 686,
+        ],
+        [
+            687, 1, 440, 0, 0, 0, 0, 0, 0, 2, 119, 1, 67, 1, 443, 443, 29, 688,
+        ],
+        [
+            689, 1, 482, 0, 0, 0, 0, 0, 0, 2, 120, 1, 121, 1, 0, 49, 49, 691,
+        ],
+        [
+            692, 1, 693, 0, 0, 0, 0, 0, 0, 1, 122, 1, 123, 1, 0, 49, 49, 696,
+        ],
+        [
+            697, 1, 698, 0, 0, 0, 0, 0, 0, 2, 124, 1, 0, 0, 0, 0, 49, 700,
+        ],
+        [
+            701, 1, 502, 7, 1, 0, 0, 7, 1, 2, 125, 1, 76, 1, 0, 0, 49, 703,
+        ],
+        [
+            704, 1, 506, 7, 1, 0, 0, 7, 1, 2, 126, 1, 77, 1, 509, 509, 49, 705,
+        ],
+        [
+            706, 1, 511, 7, 1, 0, 0, 7, 1, 2, 127, 1, 0, 0, 0, 0, 49, 708,
+        ],
+        [
+            709, 1, 515, 7, 1, 0, 0, 7, 1, 2, 128, 1, 79, 1, 0, 0, 49, 711,
+        ],
+        [
+            712, 2, 7, 1, 1, 0, 0, 69, 1, 2, 129, 1, 21, 1, 0, 197, 4, 714,
+        ],
+        [
+            715, 2, 16, 3, 1, 0, 0, 3, 1, 2, 130, 1, 35, 1, 0, 273, 18, 717,
+        ],
+        [
+            718, 2, 21, 4, 1, 0, 0, 4, 1, 2, 131, 1, 0, 1, 0, 29, 29, 720,
+        ],
+        [
+            721, 2, 32, 5, 1, 0, 0, 5, 1, 2, 112, 1, 1, 1, 37, 37, 29, 722,
+        ],
+        [
+            723, 2, 39, 6, 1, 0, 0, 6, 1, 2, 116, 1, 2, 1, 43, 43, 29, 724,
+        ],
+        [
+            725, 2, 482, 0, 0, 0, 0, 0, 0, 2, 132, 1, 133, 1, 0, 49, 49, 727,
+        ],
+        [
+            728, 2, 45, 7, 1, 0, 0, 7, 1, 2, 134, 1, 3, 1, 49, 49, 49, 729,
+        ],
+    ],
+    types: &[
+        [730, 731],
+        [71, 732],
+        [733, 734],
+        [735, 736],
+        [737, 738],
+        [739, 740],
+        [352, 741],
+        [28, 742],
+        [743, 744],
+        [745, 746],
+        [747, 748],
+        [362, 749],
+        [191, 750],
+        [196, 751],
+        [335, 752],
+        [205, 753],
+        [367, 754],
+        [347, 755],
+        [577, 756],
+        [272, 757],
+        [227, 758],
+        [759, 760],
+        [761, 762],
+        [763, 764],
+        [357, 765],
+        [766, 767],
+        [254, 768],
+        [769, 770],
+        [771, 772],
+        [413, 773],
+        [774, 775],
+        [408, 776],
+        [247, 777],
+        [426, 778],
+        [372, 779],
+        [377, 780],
+        [36, 781],
+        [782, 783],
+        [476, 784],
+        [785, 786],
+        [434, 787],
+        [388, 788],
+        [315, 789],
+        [42, 790],
+        [791, 792],
+        [442, 793],
+        [393, 794],
+        [462, 795],
+        [796, 797],
+        [48, 798],
+        [799, 800],
+        [508, 801],
+        [527, 802],
+        [532, 803],
+        [804, 805],
+        [403, 806],
+        [398, 807],
+    ],
+};
 
 pub static OMITTED_OPERATIONS: &[OmittedOperationSpec] = &[OmittedOperationSpec {
     name: "get_settings_plex_library",
@@ -5400,234 +1662,3 @@ pub static OMITTED_OPERATIONS: &[OmittedOperationSpec] = &[OmittedOperationSpec
     path: "/api/v1/settings/plex/library",
     reason: "parameter `enable` requires allowReserved serialization",
 }];
-
-pub static TYPES: &[TypeDef] = &[
-    TypeDef {
-        name: "Cast",
-        ts: "export interface Cast {\n  castId?: number;\n  character?: string;\n  creditId?: string;\n  gender?: number;\n  id?: number;\n  name?: string;\n  order?: number;\n  profilePath?: string | null;\n}",
-    },
-    TypeDef {
-        name: "Collection",
-        ts: "export interface Collection {\n  backdropPath?: string;\n  id?: number;\n  name?: string;\n  overview?: string;\n  parts?: MovieResult[];\n  posterPath?: string;\n}",
-    },
-    TypeDef {
-        name: "Company",
-        ts: "export interface Company {\n  id?: number;\n  logo_path?: string | null;\n  name?: string;\n}",
-    },
-    TypeDef {
-        name: "CreditCast",
-        ts: "export interface CreditCast {\n  adult?: boolean;\n  backdropPath?: string;\n  character?: string;\n  creditId?: string;\n  episodeCount?: number;\n  firstAirDate?: string;\n  genreIds?: number[];\n  id?: number;\n  mediaInfo?: MediaInfo;\n  mediaType?: string;\n  name?: string;\n  originCountry?: string[];\n  originalLanguage?: string;\n  originalName?: string;\n  originalTitle?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  releaseDate?: string;\n  title?: string;\n  video?: boolean;\n  voteAverage?: number;\n  voteCount?: number;\n}",
-    },
-    TypeDef {
-        name: "CreditCrew",
-        ts: "export interface CreditCrew {\n  adult?: boolean;\n  backdropPath?: string;\n  creditId?: string;\n  department?: string;\n  episodeCount?: number;\n  firstAirDate?: string;\n  genreIds?: number[];\n  id?: number;\n  job?: string;\n  mediaInfo?: MediaInfo;\n  mediaType?: string;\n  name?: string;\n  originCountry?: string[];\n  originalLanguage?: string;\n  originalName?: string;\n  originalTitle?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  releaseDate?: string;\n  title?: string;\n  video?: boolean;\n  voteAverage?: number;\n  voteCount?: number;\n}",
-    },
-    TypeDef {
-        name: "Crew",
-        ts: "export interface Crew {\n  creditId?: string;\n  department?: string;\n  gender?: number;\n  id?: number;\n  job?: string;\n  name?: string;\n  profilePath?: string | null;\n}",
-    },
-    TypeDef {
-        name: "DiscordSettings",
-        ts: "export interface DiscordSettings {\n  enabled?: boolean;\n  options?: { botAvatarUrl?: string; botUsername?: string; enableMentions?: boolean; webhookUrl?: string; };\n  types?: number;\n}",
-    },
-    TypeDef {
-        name: "DiscoverSlider",
-        ts: "export interface DiscoverSlider {\n  data: string | null;\n  enabled: boolean;\n  id?: number;\n  isBuiltIn?: boolean;\n  title: string | null;\n  type: number;\n}",
-    },
-    TypeDef {
-        name: "Episode",
-        ts: "export interface Episode {\n  airDate?: string | null;\n  episodeNumber?: number;\n  id?: number;\n  name?: string;\n  overview?: string;\n  productionCode?: string;\n  seasonNumber?: number;\n  showId?: number;\n  stillPath?: string | null;\n  voteAverage?: number;\n  voteCount?: number;\n}",
-    },
-    TypeDef {
-        name: "ExternalIds",
-        ts: "export interface ExternalIds {\n  facebookId?: string | null;\n  freebaseId?: string | null;\n  freebaseMid?: string | null;\n  imdbId?: string | null;\n  instagramId?: string | null;\n  tvdbId?: number | null;\n  tvrageId?: number | null;\n  twitterId?: string | null;\n}",
-    },
-    TypeDef {
-        name: "Genre",
-        ts: "export interface Genre {\n  id?: number;\n  name?: string;\n}",
-    },
-    TypeDef {
-        name: "GotifySettings",
-        ts: "export interface GotifySettings {\n  enabled?: boolean;\n  options?: { token?: string; url?: string; };\n  types?: number;\n}",
-    },
-    TypeDef {
-        name: "Issue",
-        ts: "export interface Issue {\n  comments?: IssueComment[];\n  createdBy?: User;\n  id?: number;\n  issueType?: number;\n  media?: MediaInfo;\n  modifiedBy?: User;\n}",
-    },
-    TypeDef {
-        name: "IssueComment",
-        ts: "export interface IssueComment {\n  id?: number;\n  message?: string;\n  user?: User;\n}",
-    },
-    TypeDef {
-        name: "Job",
-        ts: "export interface Job {\n  id?: string;\n  interval?: \"short\" | \"long\" | \"fixed\";\n  name?: string;\n  nextExecutionTime?: string;\n  running?: boolean;\n  type?: \"process\" | \"command\";\n}",
-    },
-    TypeDef {
-        name: "Keyword",
-        ts: "export interface Keyword {\n  id?: number;\n  name?: string;\n}",
-    },
-    TypeDef {
-        name: "LunaSeaSettings",
-        ts: "export interface LunaSeaSettings {\n  enabled?: boolean;\n  options?: { profileName?: string; webhookUrl?: string; };\n  types?: number;\n}",
-    },
-    TypeDef {
-        name: "MainSettings",
-        ts: "export interface MainSettings {\n  apiKey?: string;\n  appLanguage?: string;\n  applicationTitle?: string;\n  applicationUrl?: string;\n  csrfProtection?: boolean;\n  defaultPermissions?: number;\n  hideAvailable?: boolean;\n  localLogin?: boolean;\n  newPlexLogin?: boolean;\n  partialRequestsEnabled?: boolean;\n  trustProxy?: boolean;\n}",
-    },
-    TypeDef {
-        name: "MediaInfo",
-        ts: "export interface MediaInfo {\n  createdAt?: string;\n  id?: number;\n  requests?: MediaRequest[];\n  status?: number;\n  tmdbId?: number;\n  tvdbId?: number | null;\n  updatedAt?: string;\n}",
-    },
-    TypeDef {
-        name: "MediaRequest",
-        ts: "export interface MediaRequest {\n  createdAt?: string;\n  id: number;\n  is4k?: boolean;\n  media?: MediaInfo;\n  modifiedBy?: User | string | null;\n  profileId?: number;\n  requestedBy?: User;\n  rootFolder?: string;\n  serverId?: number;\n  status: number;\n  updatedAt?: string;\n}",
-    },
-    TypeDef {
-        name: "MovieDetails",
-        ts: "export interface MovieDetails {\n  adult?: boolean;\n  backdropPath?: string;\n  budget?: number;\n  collection?: { backdropPath?: string; id?: number; name?: string; posterPath?: string; };\n  credits?: { cast?: Cast[]; crew?: Crew[]; };\n  externalIds?: ExternalIds;\n  genres?: Genre[];\n  homepage?: string;\n  id?: number;\n  imdbId?: string;\n  mediaInfo?: MediaInfo;\n  originalLanguage?: string;\n  originalTitle?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  productionCompanies?: ProductionCompany[];\n  productionCountries?: { iso_3166_1?: string; name?: string; }[];\n  relatedVideos?: RelatedVideo[];\n  releaseDate?: string;\n  releases?: { results?: ({ iso_3166_1?: string; rating?: string | null; release_dates?: ({ certification?: string; iso_639_1?: string | null; note?: string | null; release_date?: string; type?: number; })[]; })[]; };\n  revenue?: number | null;\n  runtime?: number;\n  spokenLanguages?: SpokenLanguage[];\n  status?: string;\n  tagline?: string;\n  title?: string;\n  video?: boolean;\n  voteAverage?: number;\n  voteCount?: number;\n  watchProviders?: WatchProviders[];\n}",
-    },
-    TypeDef {
-        name: "MovieResult",
-        ts: "export interface MovieResult {\n  adult?: boolean;\n  backdropPath?: string;\n  genreIds?: number[];\n  id: number;\n  mediaInfo?: MediaInfo;\n  mediaType: string;\n  originalLanguage?: string;\n  originalTitle?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  releaseDate?: string;\n  title: string;\n  video?: boolean;\n  voteAverage?: number;\n  voteCount?: number;\n}",
-    },
-    TypeDef {
-        name: "Network",
-        ts: "export interface Network {\n  id?: number;\n  logoPath?: string | null;\n  name?: string;\n  originCountry?: string;\n}",
-    },
-    TypeDef {
-        name: "NotificationAgentTypes",
-        ts: "export interface NotificationAgentTypes {\n  discord?: number;\n  email?: number;\n  pushbullet?: number;\n  pushover?: number;\n  slack?: number;\n  telegram?: number;\n  webhook?: number;\n  webpush?: number;\n}",
-    },
-    TypeDef {
-        name: "NotificationEmailSettings",
-        ts: "export interface NotificationEmailSettings {\n  enabled?: boolean;\n  options?: { allowSelfSigned?: boolean; authPass?: string | null; authUser?: string | null; emailFrom?: string; ignoreTls?: boolean; requireTls?: boolean; secure?: boolean; senderName?: string; smtpHost?: string; smtpPort?: number; };\n  types?: number;\n}",
-    },
-    TypeDef {
-        name: "PageInfo",
-        ts: "export interface PageInfo {\n  page?: number;\n  pages?: number;\n  results?: number;\n}",
-    },
-    TypeDef {
-        name: "PersonDetails",
-        ts: "export interface PersonDetails {\n  adult?: boolean;\n  alsoKnownAs?: string[];\n  biography?: string;\n  deathday?: string;\n  gender?: string;\n  homepage?: string;\n  id?: number;\n  imdbId?: string;\n  knownForDepartment?: string;\n  name?: string;\n  placeOfBirth?: string;\n  popularity?: string;\n  profilePath?: string;\n}",
-    },
-    TypeDef {
-        name: "PersonResult",
-        ts: "export interface PersonResult {\n  adult?: boolean;\n  id?: number;\n  knownFor?: (MovieResult | TvResult)[];\n  mediaType?: string;\n  profilePath?: string;\n}",
-    },
-    TypeDef {
-        name: "PlexConnection",
-        ts: "export interface PlexConnection {\n  address: string;\n  local: boolean;\n  message?: string;\n  port: number;\n  protocol: string;\n  status?: number;\n  uri: string;\n}",
-    },
-    TypeDef {
-        name: "PlexDevice",
-        ts: "export interface PlexDevice {\n  accessToken?: string;\n  clientIdentifier: string;\n  connection: PlexConnection[];\n  createdAt: string;\n  device: string;\n  dnsRebindingProtection?: boolean;\n  home?: boolean;\n  httpsRequired?: boolean;\n  lastSeenAt: string;\n  name: string;\n  natLoopbackSupported?: boolean;\n  owned: boolean;\n  ownerID?: string;\n  platform: string;\n  platformVersion?: string;\n  presence?: boolean;\n  product: string;\n  productVersion: string;\n  provides: string[];\n  publicAddress?: string;\n  publicAddressMatches?: boolean;\n  relay?: boolean;\n  sourceTitle?: string;\n  synced?: boolean;\n}",
-    },
-    TypeDef {
-        name: "PlexLibrary",
-        ts: "export interface PlexLibrary {\n  enabled: boolean;\n  id: string;\n  name: string;\n}",
-    },
-    TypeDef {
-        name: "PlexSettings",
-        ts: "export interface PlexSettings {\n  ip: string;\n  libraries?: PlexLibrary[];\n  machineId: string;\n  name: string;\n  port: number;\n  useSsl?: boolean | null;\n  webAppUrl?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ProductionCompany",
-        ts: "export interface ProductionCompany {\n  id?: number;\n  logoPath?: string | null;\n  name?: string;\n  originCountry?: string;\n}",
-    },
-    TypeDef {
-        name: "PublicSettings",
-        ts: "export interface PublicSettings {\n  initialized?: boolean;\n}",
-    },
-    TypeDef {
-        name: "PushbulletSettings",
-        ts: "export interface PushbulletSettings {\n  enabled?: boolean;\n  options?: { accessToken?: string; channelTag?: string | null; };\n  types?: number;\n}",
-    },
-    TypeDef {
-        name: "PushoverSettings",
-        ts: "export interface PushoverSettings {\n  enabled?: boolean;\n  options?: { accessToken?: string; sound?: string; userToken?: string; };\n  types?: number;\n}",
-    },
-    TypeDef {
-        name: "RadarrSettings",
-        ts: "export interface RadarrSettings {\n  activeDirectory: string;\n  activeProfileId: number;\n  activeProfileName: string;\n  apiKey: string;\n  baseUrl?: string;\n  externalUrl?: string;\n  hostname: string;\n  id?: number;\n  is4k: boolean;\n  isDefault: boolean;\n  minimumAvailability: string;\n  name: string;\n  port: number;\n  preventSearch?: boolean;\n  syncEnabled?: boolean;\n  useSsl: boolean;\n}",
-    },
-    TypeDef {
-        name: "RelatedVideo",
-        ts: "export interface RelatedVideo {\n  key?: string;\n  name?: string;\n  site?: \"YouTube\";\n  size?: number;\n  type?: \"Clip\" | \"Teaser\" | \"Trailer\" | \"Featurette\" | \"Opening Credits\" | \"Behind the Scenes\" | \"Bloopers\";\n  url?: string;\n}",
-    },
-    TypeDef {
-        name: "Season",
-        ts: "export interface Season {\n  airDate?: string | null;\n  episodeCount?: number;\n  episodes?: Episode[];\n  id?: number;\n  name?: string;\n  overview?: string;\n  posterPath?: string;\n  seasonNumber?: number;\n}",
-    },
-    TypeDef {
-        name: "ServarrTag",
-        ts: "export interface ServarrTag {\n  id?: number;\n  label?: string;\n}",
-    },
-    TypeDef {
-        name: "ServiceProfile",
-        ts: "export interface ServiceProfile {\n  id?: number;\n  name?: string;\n}",
-    },
-    TypeDef {
-        name: "SlackSettings",
-        ts: "export interface SlackSettings {\n  enabled?: boolean;\n  options?: { webhookUrl?: string; };\n  types?: number;\n}",
-    },
-    TypeDef {
-        name: "SonarrSeries",
-        ts: "export interface SonarrSeries {\n  addOptions?: ({ ignoreEpisodesWithFiles?: boolean | null; ignoreEpisodesWithoutFiles?: boolean | null; searchForMissingEpisodes?: boolean | null; })[];\n  added?: string;\n  airTime?: string;\n  certification?: string;\n  cleanTitle?: string;\n  firstAired?: string;\n  genres?: string[];\n  id?: number | null;\n  images?: { coverType?: string; url?: string; }[];\n  imdbId?: string;\n  languageProfileId?: number;\n  lastInfoSync?: string | null;\n  monitored?: boolean;\n  network?: string;\n  overview?: string;\n  path?: string;\n  profileId?: number;\n  qualityProfileId?: number;\n  ratings?: { value?: number; votes?: number; }[];\n  remotePoster?: string;\n  rootFolderPath?: string | null;\n  runtime?: number;\n  seasonCount?: number;\n  seasonFolder?: boolean;\n  seasons?: { monitored?: boolean; seasonNumber?: number; }[];\n  seriesType?: string;\n  sortTitle?: string;\n  status?: string;\n  tags?: string[];\n  title?: string;\n  titleSlug?: string;\n  tvMazeId?: number;\n  tvRageId?: number;\n  tvdbId?: number;\n  useSceneNumbering?: boolean;\n  year?: number;\n}",
-    },
-    TypeDef {
-        name: "SonarrSettings",
-        ts: "export interface SonarrSettings {\n  activeAnimeDirectory?: string | null;\n  activeAnimeLanguageProfileId?: number | null;\n  activeAnimeProfileId?: number | null;\n  activeAnimeProfileName?: string | null;\n  activeDirectory: string;\n  activeLanguageProfileId?: number;\n  activeProfileId: number;\n  activeProfileName: string;\n  apiKey: string;\n  baseUrl?: string;\n  enableSeasonFolders: boolean;\n  externalUrl?: string;\n  hostname: string;\n  id?: number;\n  is4k: boolean;\n  isDefault: boolean;\n  name: string;\n  port: number;\n  preventSearch?: boolean;\n  syncEnabled?: boolean;\n  useSsl: boolean;\n}",
-    },
-    TypeDef {
-        name: "SpokenLanguage",
-        ts: "export interface SpokenLanguage {\n  englishName?: string | null;\n  iso_639_1?: string;\n  name?: string;\n}",
-    },
-    TypeDef {
-        name: "TautulliSettings",
-        ts: "export interface TautulliSettings {\n  apiKey?: string | null;\n  externalUrl?: string | null;\n  hostname?: string | null;\n  port?: number | null;\n  useSsl?: boolean | null;\n}",
-    },
-    TypeDef {
-        name: "TelegramSettings",
-        ts: "export interface TelegramSettings {\n  enabled?: boolean;\n  options?: { botAPI?: string; botUsername?: string; chatId?: string; sendSilently?: boolean; };\n  types?: number;\n}",
-    },
-    TypeDef {
-        name: "TvDetails",
-        ts: "export interface TvDetails {\n  backdropPath?: string;\n  contentRatings?: { results?: { iso_3166_1?: string; rating?: string; }[]; };\n  createdBy?: ({ gender?: number; id?: number; name?: string; profilePath?: string | null; })[];\n  credits?: { cast?: Cast[]; crew?: Crew[]; };\n  episodeRunTime?: number[];\n  externalIds?: ExternalIds;\n  firstAirDate?: string;\n  genres?: Genre[];\n  homepage?: string;\n  id?: number;\n  inProduction?: boolean;\n  keywords?: Keyword[];\n  languages?: string[];\n  lastAirDate?: string;\n  lastEpisodeToAir?: Episode;\n  mediaInfo?: MediaInfo;\n  name?: string;\n  networks?: ProductionCompany[];\n  nextEpisodeToAir?: Episode;\n  numberOfEpisodes?: number;\n  numberOfSeason?: number;\n  originCountry?: string[];\n  originalLanguage?: string;\n  originalName?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  productionCompanies?: ProductionCompany[];\n  productionCountries?: { iso_3166_1?: string; name?: string; }[];\n  seasons?: Season[];\n  spokenLanguages?: SpokenLanguage[];\n  status?: string;\n  tagline?: string;\n  type?: string;\n  voteAverage?: number;\n  voteCount?: number;\n  watchProviders?: WatchProviders[];\n}",
-    },
-    TypeDef {
-        name: "TvResult",
-        ts: "export interface TvResult {\n  backdropPath?: string;\n  firstAirDate?: string;\n  genreIds?: number[];\n  id?: number;\n  mediaInfo?: MediaInfo;\n  mediaType?: string;\n  name?: string;\n  originCountry?: string[];\n  originalLanguage?: string;\n  originalName?: string;\n  overview?: string;\n  popularity?: number;\n  posterPath?: string;\n  voteAverage?: number;\n  voteCount?: number;\n}",
-    },
-    TypeDef {
-        name: "User",
-        ts: "export interface User {\n  avatar?: string;\n  createdAt: string;\n  email: string;\n  id: number;\n  permissions?: number;\n  plexToken?: string;\n  plexUsername?: string;\n  requestCount?: number;\n  updatedAt: string;\n  userType?: number;\n  username?: string;\n}",
-    },
-    TypeDef {
-        name: "UserSettings",
-        ts: "export interface UserSettings {\n  locale?: string;\n  originalLanguage?: string;\n  region?: string;\n}",
-    },
-    TypeDef {
-        name: "UserSettingsNotifications",
-        ts: "export interface UserSettingsNotifications {\n  discordEnabled?: boolean;\n  discordEnabledTypes?: number | null;\n  discordId?: string | null;\n  emailEnabled?: boolean;\n  notificationTypes?: NotificationAgentTypes;\n  pgpKey?: string | null;\n  pushbulletAccessToken?: string | null;\n  pushoverApplicationToken?: string | null;\n  pushoverSound?: string | null;\n  pushoverUserKey?: string | null;\n  telegramBotUsername?: string | null;\n  telegramChatId?: string | null;\n  telegramEnabled?: boolean;\n  telegramSendSilently?: boolean | null;\n}",
-    },
-    TypeDef {
-        name: "WatchProviderDetails",
-        ts: "export interface WatchProviderDetails {\n  displayPriority?: number;\n  id?: number;\n  logoPath?: string;\n  name?: string;\n}",
-    },
-    TypeDef {
-        name: "WatchProviderRegion",
-        ts: "export interface WatchProviderRegion {\n  english_name?: string;\n  iso_3166_1?: string;\n  native_name?: string;\n}",
-    },
-    TypeDef {
-        name: "WatchProviders",
-        ts: "export type WatchProviders = { buy?: WatchProviderDetails[]; flatrate?: unknown; iso_3166_1?: string; link?: string; }[];",
-    },
-    TypeDef {
-        name: "WebPushSettings",
-        ts: "export interface WebPushSettings {\n  enabled?: boolean;\n  types?: number;\n}",
-    },
-    TypeDef {
-        name: "WebhookSettings",
-        ts: "export interface WebhookSettings {\n  enabled?: boolean;\n  options?: { authHeader?: string; jsonPayload?: string; webhookUrl?: string; };\n  types?: number;\n}",
-    },
-];
@@ -1,4162 +1,1043 @@
 //! GENERATED by `cargo xtask gen-openapi` from specs/prowlarr.openapi.* -- DO NOT EDIT.
 //!
-//! 127 supported operations, 1 omitted operations, 70 component types.
+//! 127 supported operations, 1 omitted operations, 70 component types,
+//! 523 distinct strings. `TABLE.operations` is sorted by name; `find_operation`
+//! binary-searches the decoded slice.
 #![allow(clippy::all)]
-use crate::openapi::{
-    BodyEncoding, HttpMethod, OmittedOperationSpec, OperationSpec, ParameterLocation,
-    ParameterSpec, ParameterStyle, RepresentationSpec, RequestBodySpec, TypeDef,
-};
+use crate::openapi::{CompactTable, HttpMethod, OmittedOperationSpec};
 
-pub static OPERATIONS: &[OperationSpec] = &[
-    OperationSpec {
-        name: "delete_applications_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v1/applications/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ApplicationBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ApplicationBulkResource"),
-        response_type: None,
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_applications_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/applications/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_appprofile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/appprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "AppProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_command_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/command/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_customfilter_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/customfilter/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_downloadclient_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v1/downloadclient/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DownloadClientBulkResource"),
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_downloadclient_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_indexer_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v1/indexer/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerBulkResource"),
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_indexer_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_indexerproxy_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/indexerproxy/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "IndexerProxy",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_notification_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/notification/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_system_backup_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/system/backup/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_tag_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v1/tag/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get",
-        method: HttpMethod::Get,
-        path: "/api",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ApiInfoResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ApiInfoResource"),
-        tag: "ApiInfo",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_applications",
-        method: HttpMethod::Get,
-        path: "/api/v1/applications",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ApplicationResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ApplicationResource"),
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_applications_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/applications/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ApplicationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ApplicationResource"),
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_applications_schema",
-        method: HttpMethod::Get,
-        path: "/api/v1/applications/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ApplicationResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ApplicationResource"),
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_appprofile",
-        method: HttpMethod::Get,
-        path: "/api/v1/appprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/AppProfileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("AppProfileResource"),
-        tag: "AppProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_appprofile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/appprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/AppProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("AppProfileResource"),
-        tag: "AppProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_appprofile_schema",
-        method: HttpMethod::Get,
-        path: "/api/v1/appprofile/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/AppProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("AppProfileResource"),
-        tag: "AppProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_by_id",
-        method: HttpMethod::Get,
-        path: "/{id}/api",
-        path_params: &["id"],
-        query_params: &[
-            "album",
-            "artist",
-            "author",
-            "cat",
-            "configured",
-            "doubanid",
-            "ep",
-            "extended",
-            "genre",
-            "host",
-            "imdbid",
-            "label",
-            "limit",
-            "maxage",
-            "maxsize",
-            "minage",
-            "minsize",
-            "offset",
-            "publisher",
-            "q",
-            "rid",
-            "season",
-            "server",
-            "source",
-            "t",
-            "title",
-            "tmdbid",
-            "track",
-            "traktid",
-            "tvdbid",
-            "tvmazeid",
-            "year",
+pub static TABLE: CompactTable = CompactTable {
+    strings: concat!(
+        "delete_applications_bulk",
+        "/api/v1/applications/bulk",
+        "application/json",
+        "{\"$ref\":\"#/components/schemas/ApplicationBulkResource\"}",
+        "null",
+        "ApplicationBulkResource",
+        "Application",
+        "",
+        "delete_applications_by_id",
+        "/api/v1/applications/{id}",
+        "id",
+        "{\"format\":\"int32\",\"type\":\"integer\"}",
+        "delete_appprofile_by_id",
+        "/api/v1/appprofile/{id}",
+        "AppProfile",
+        "delete_command_by_id",
+        "/api/v1/command/{id}",
+        "Command",
+        "delete_customfilter_by_id",
+        "/api/v1/customfilter/{id}",
+        "CustomFilter",
+        "delete_downloadclient_bulk",
+        "/api/v1/downloadclient/bulk",
+        "{\"$ref\":\"#/components/schemas/DownloadClientBulkResource\"}",
+        "DownloadClientBulkResource",
+        "DownloadClient",
+        "delete_downloadclient_by_id",
+        "/api/v1/downloadclient/{id}",
+        "delete_indexer_bulk",
+        "/api/v1/indexer/bulk",
+        "{\"$ref\":\"#/components/schemas/IndexerBulkResource\"}",
+        "IndexerBulkResource",
+        "Indexer",
+        "delete_indexer_by_id",
+        "/api/v1/indexer/{id}",
+        "delete_indexerproxy_by_id",
+        "/api/v1/indexerproxy/{id}",
+        "IndexerProxy",
+        "delete_notification_by_id",
+        "/api/v1/notification/{id}",
+        "Notification",
+        "delete_system_backup_by_id",
+        "/api/v1/system/backup/{id}",
+        "Backup",
+        "delete_tag_by_id",
+        "/api/v1/tag/{id}",
+        "Tag",
+        "get",
+        "/api",
+        "200",
+        "{\"$ref\":\"#/components/schemas/ApiInfoResource\"}",
+        "ApiInfoResource",
+        "ApiInfo",
+        "get_applications",
+        "/api/v1/applications",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ApplicationResource\"},\"type\":\"array\"}",
+        "ApplicationResource",
+        "get_applications_by_id",
+        "{\"$ref\":\"#/components/schemas/ApplicationResource\"}",
+        "get_applications_schema",
+        "/api/v1/applications/schema",
+        "get_appprofile",
+        "/api/v1/appprofile",
+        "{\"items\":{\"$ref\":\"#/components/schemas/AppProfileResource\"},\"type\":\"array\"}",
+        "AppProfileResource",
+        "get_appprofile_by_id",
+        "{\"$ref\":\"#/components/schemas/AppProfileResource\"}",
+        "get_appprofile_schema",
+        "/api/v1/appprofile/schema",
+        "get_by_id",
+        "/{id}/api",
+        "album",
+        "artist",
+        "author",
+        "cat",
+        "configured",
+        "doubanid",
+        "ep",
+        "extended",
+        "genre",
+        "host",
+        "imdbid",
+        "label",
+        "limit",
+        "maxage",
+        "maxsize",
+        "minage",
+        "minsize",
+        "offset",
+        "publisher",
+        "q",
+        "rid",
+        "season",
+        "server",
+        "source",
+        "t",
+        "title",
+        "tmdbid",
+        "track",
+        "traktid",
+        "tvdbid",
+        "tvmazeid",
+        "year",
+        "{\"type\":\"string\"}",
+        "{\"format\":\"int64\",\"type\":\"integer\"}",
+        "Newznab",
+        "get_by_path_2",
+        "/{path}",
+        "path",
+        "{\"pattern\":\"^(?!api/).*\",\"type\":\"string\"}",
+        "StaticResource",
+        "get_command",
+        "/api/v1/command",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CommandResource\"},\"type\":\"array\"}",
+        "CommandResource",
+        "get_command_by_id",
+        "{\"$ref\":\"#/components/schemas/CommandResource\"}",
+        "get_config_development",
+        "/api/v1/config/development",
+        "{\"$ref\":\"#/components/schemas/DevelopmentConfigResource\"}",
+        "DevelopmentConfigResource",
+        "DevelopmentConfig",
+        "get_config_development_by_id",
+        "/api/v1/config/development/{id}",
+        "get_config_downloadclient",
+        "/api/v1/config/downloadclient",
+        "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
+        "DownloadClientConfigResource",
+        "DownloadClientConfig",
+        "get_config_downloadclient_by_id",
+        "/api/v1/config/downloadclient/{id}",
+        "get_config_host",
+        "/api/v1/config/host",
+        "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
+        "HostConfigResource",
+        "HostConfig",
+        "get_config_host_by_id",
+        "/api/v1/config/host/{id}",
+        "get_config_ui",
+        "/api/v1/config/ui",
+        "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
+        "UiConfigResource",
+        "UiConfig",
+        "get_config_ui_by_id",
+        "/api/v1/config/ui/{id}",
+        "get_content_by_path",
+        "/content/{path}",
+        "get_customfilter",
+        "/api/v1/customfilter",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CustomFilterResource\"},\"type\":\"array\"}",
+        "CustomFilterResource",
+        "get_customfilter_by_id",
+        "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
+        "get_download_by_id",
+        "/{id}/download",
+        "file",
+        "link",
+        "get_downloadclient",
+        "/api/v1/downloadclient",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DownloadClientResource\"},\"type\":\"array\"}",
+        "DownloadClientResource",
+        "get_downloadclient_by_id",
+        "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
+        "get_downloadclient_schema",
+        "/api/v1/downloadclient/schema",
+        "get_filesystem",
+        "/api/v1/filesystem",
+        "allowFoldersWithoutTrailingSlashes",
+        "includeFiles",
+        "{\"default\":false,\"type\":\"boolean\"}",
+        "FileSystem",
+        "get_filesystem_type",
+        "/api/v1/filesystem/type",
+        "get_health",
+        "/api/v1/health",
+        "{\"items\":{\"$ref\":\"#/components/schemas/HealthResource\"},\"type\":\"array\"}",
+        "HealthResource",
+        "Health",
+        "get_history",
+        "/api/v1/history",
+        "downloadId",
+        "eventType",
+        "indexerIds",
+        "page",
+        "pageSize",
+        "sortDirection",
+        "sortKey",
+        "successful",
+        "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
+        "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
+        "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
+        "{\"$ref\":\"#/components/schemas/SortDirection\"}",
+        "{\"type\":\"boolean\"}",
+        "{\"$ref\":\"#/components/schemas/HistoryResourcePagingResource\"}",
+        "HistoryResourcePagingResource",
+        "History",
+        "get_history_indexer",
+        "/api/v1/history/indexer",
+        "indexerId",
+        "{\"$ref\":\"#/components/schemas/HistoryEventType\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/HistoryResource\"},\"type\":\"array\"}",
+        "HistoryResource",
+        "get_history_since",
+        "/api/v1/history/since",
+        "date",
+        "{\"format\":\"date-time\",\"type\":\"string\"}",
+        "get_indexer",
+        "/api/v1/indexer",
+        "{\"items\":{\"$ref\":\"#/components/schemas/IndexerResource\"},\"type\":\"array\"}",
+        "IndexerResource",
+        "get_indexer_by_id",
+        "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
+        "get_indexer_categories",
+        "/api/v1/indexer/categories",
+        "{\"items\":{\"$ref\":\"#/components/schemas/IndexerCategory\"},\"type\":\"array\"}",
+        "IndexerCategory",
+        "IndexerDefaultCategories",
+        "get_indexer_download_by_id",
+        "/api/v1/indexer/{id}/download",
+        "get_indexer_newznab_by_id",
+        "/api/v1/indexer/{id}/newznab",
+        "get_indexer_schema",
+        "/api/v1/indexer/schema",
+        "get_indexerproxy",
+        "/api/v1/indexerproxy",
+        "{\"items\":{\"$ref\":\"#/components/schemas/IndexerProxyResource\"},\"type\":\"array\"}",
+        "IndexerProxyResource",
+        "get_indexerproxy_by_id",
+        "{\"$ref\":\"#/components/schemas/IndexerProxyResource\"}",
+        "get_indexerproxy_schema",
+        "/api/v1/indexerproxy/schema",
+        "get_indexerstats",
+        "/api/v1/indexerstats",
+        "endDate",
+        "indexers",
+        "protocols",
+        "startDate",
+        "tags",
+        "{\"$ref\":\"#/components/schemas/IndexerStatsResource\"}",
+        "IndexerStatsResource",
+        "IndexerStats",
+        "get_indexerstatus",
+        "/api/v1/indexerstatus",
+        "{\"items\":{\"$ref\":\"#/components/schemas/IndexerStatusResource\"},\"type\":\"array\"}",
+        "IndexerStatusResource",
+        "IndexerStatus",
+        "get_localization",
+        "/api/v1/localization",
+        "Localization",
+        "get_localization_options",
+        "/api/v1/localization/options",
+        "{\"items\":{\"$ref\":\"#/components/schemas/LocalizationOption\"},\"type\":\"array\"}",
+        "LocalizationOption",
+        "get_log",
+        "/api/v1/log",
+        "level",
+        "{\"$ref\":\"#/components/schemas/LogResourcePagingResource\"}",
+        "LogResourcePagingResource",
+        "Log",
+        "get_log_file",
+        "/api/v1/log/file",
+        "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
+        "LogFileResource",
+        "LogFile",
+        "get_log_file_by_filename",
+        "/api/v1/log/file/{filename}",
+        "filename",
+        "{\"pattern\":\"[-.a-zA-Z0-9]+?\\\\.txt\",\"type\":\"string\"}",
+        "text/plain",
+        "{\"$ref\":\"#/components/schemas/IActionResult\"}",
+        "IActionResult",
+        "get_log_file_update",
+        "/api/v1/log/file/update",
+        "UpdateLogFile",
+        "get_log_file_update_by_filename",
+        "/api/v1/log/file/update/{filename}",
+        "get_login",
+        "/login",
+        "get_logout",
+        "/logout",
+        "Authentication",
+        "get_notification",
+        "/api/v1/notification",
+        "{\"items\":{\"$ref\":\"#/components/schemas/NotificationResource\"},\"type\":\"array\"}",
+        "NotificationResource",
+        "get_notification_by_id",
+        "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
+        "get_notification_schema",
+        "/api/v1/notification/schema",
+        "get_ping",
+        "/ping",
+        "{\"$ref\":\"#/components/schemas/PingResource\"}",
+        "PingResource",
+        "Ping",
+        "get_search",
+        "/api/v1/search",
+        "categories",
+        "query",
+        "type",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
+        "ReleaseResource",
+        "Search",
+        "get_system_backup",
+        "/api/v1/system/backup",
+        "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
+        "BackupResource",
+        "get_system_routes",
+        "/api/v1/system/routes",
+        "System",
+        "get_system_routes_duplicate",
+        "/api/v1/system/routes/duplicate",
+        "get_system_status",
+        "/api/v1/system/status",
+        "{\"$ref\":\"#/components/schemas/SystemResource\"}",
+        "SystemResource",
+        "get_system_task",
+        "/api/v1/system/task",
+        "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
+        "TaskResource",
+        "Task",
+        "get_system_task_by_id",
+        "/api/v1/system/task/{id}",
+        "{\"$ref\":\"#/components/schemas/TaskResource\"}",
+        "get_tag",
+        "/api/v1/tag",
+        "{\"items\":{\"$ref\":\"#/components/schemas/TagResource\"},\"type\":\"array\"}",
+        "TagResource",
+        "get_tag_by_id",
+        "{\"$ref\":\"#/components/schemas/TagResource\"}",
+        "get_tag_detail",
+        "/api/v1/tag/detail",
+        "{\"items\":{\"$ref\":\"#/components/schemas/TagDetailsResource\"},\"type\":\"array\"}",
+        "TagDetailsResource",
+        "TagDetails",
+        "get_tag_detail_by_id",
+        "/api/v1/tag/detail/{id}",
+        "{\"$ref\":\"#/components/schemas/TagDetailsResource\"}",
+        "get_update",
+        "/api/v1/update",
+        "{\"items\":{\"$ref\":\"#/components/schemas/UpdateResource\"},\"type\":\"array\"}",
+        "UpdateResource",
+        "Update",
+        "post_applications",
+        "forceSave",
+        "post_applications_action_by_name",
+        "/api/v1/applications/action/{name}",
+        "name",
+        "post_applications_test",
+        "/api/v1/applications/test",
+        "forceTest",
+        "post_applications_testall",
+        "/api/v1/applications/testall",
+        "post_appprofile",
+        "post_command",
+        "post_customfilter",
+        "post_downloadclient",
+        "post_downloadclient_action_by_name",
+        "/api/v1/downloadclient/action/{name}",
+        "post_downloadclient_test",
+        "/api/v1/downloadclient/test",
+        "post_downloadclient_testall",
+        "/api/v1/downloadclient/testall",
+        "post_indexer",
+        "post_indexer_action_by_name",
+        "/api/v1/indexer/action/{name}",
+        "post_indexer_test",
+        "/api/v1/indexer/test",
+        "post_indexer_testall",
+        "/api/v1/indexer/testall",
+        "post_indexerproxy",
+        "post_indexerproxy_action_by_name",
+        "/api/v1/indexerproxy/action/{name}",
+        "post_indexerproxy_test",
+        "/api/v1/indexerproxy/test",
+        "post_indexerproxy_testall",
+        "/api/v1/indexerproxy/testall",
+        "post_login",
+        "returnUrl",
+        "multipart/form-data",
+        "{\"properties\":{\"password\":{\"type\":\"string\"},\"rememberMe\":{\"type\":\"string\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"}",
+        "{\"password\":{\"style\":\"form\"},\"rememberMe\":{\"style\":\"form\"},\"username\":{\"style\":\"form\"}}",
+        "post_notification",
+        "post_notification_action_by_name",
+        "/api/v1/notification/action/{name}",
+        "post_notification_test",
+        "/api/v1/notification/test",
+        "post_notification_testall",
+        "/api/v1/notification/testall",
+        "post_search",
+        "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
+        "post_search_bulk",
+        "/api/v1/search/bulk",
+        "post_system_backup_restore_by_id",
+        "/api/v1/system/backup/restore/{id}",
+        "post_system_backup_restore_upload",
+        "/api/v1/system/backup/restore/upload",
+        "{\"type\":\"object\",\"required\":[\"file\"],\"properties\":{\"file\":{\"type\":\"string\",\"format\":\"binary\"}}}",
+        "{\"file\":{\"contentType\":\"application/zip\"}}",
+        "post_system_restart",
+        "/api/v1/system/restart",
+        "post_system_shutdown",
+        "/api/v1/system/shutdown",
+        "post_tag",
+        "put_applications_bulk",
+        "put_applications_by_id",
+        "put_appprofile_by_id",
+        "put_config_development_by_id",
+        "put_config_downloadclient_by_id",
+        "put_config_host_by_id",
+        "put_config_ui_by_id",
+        "put_customfilter_by_id",
+        "put_downloadclient_bulk",
+        "put_downloadclient_by_id",
+        "put_indexer_bulk",
+        "put_indexer_by_id",
+        "put_indexerproxy_by_id",
+        "put_notification_by_id",
+        "put_tag_by_id",
+        "export interface ApiInfoResource {\n  current?: string | null;\n  deprecated?: string[] | null;\n}",
+        "export interface AppProfileResource {\n  enableAutomaticSearch?: boolean;\n  enableInteractiveSearch?: boolean;\n  enableRss?: boolean;\n  id?: number;\n  minimumSeeders?: number;\n  name?: string | null;\n}",
+        "export interface ApplicationBulkResource {\n  applyTags?: ApplyTags;\n  ids?: number[] | null;\n  syncLevel?: ApplicationSyncLevel;\n  tags?: number[] | null;\n}",
+        "export interface ApplicationResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: ApplicationResource[] | null;\n  syncLevel?: ApplicationSyncLevel;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
+        "ApplicationSyncLevel",
+        "export type ApplicationSyncLevel = \"disabled\" | \"addOnly\" | \"fullSync\";",
+        "ApplyTags",
+        "export type ApplyTags = \"add\" | \"remove\" | \"replace\";",
+        "AuthenticationRequiredType",
+        "export type AuthenticationRequiredType = \"enabled\" | \"disabledForLocalAddresses\";",
+        "AuthenticationType",
+        "export type AuthenticationType = \"none\" | \"basic\" | \"forms\" | \"external\";",
+        "export interface BackupResource {\n  id?: number;\n  name?: string | null;\n  path?: string | null;\n  size?: number;\n  time?: string;\n  type?: BackupType;\n}",
+        "BackupType",
+        "export type BackupType = \"scheduled\" | \"manual\" | \"update\";",
+        "BookSearchParam",
+        "export type BookSearchParam = \"q\" | \"title\" | \"author\" | \"publisher\" | \"genre\" | \"year\";",
+        "CertificateValidationType",
+        "export type CertificateValidationType = \"enabled\" | \"disabledForLocalAddresses\" | \"disabled\";",
+        "export interface Command {\n  clientUserAgent?: string | null;\n  completionMessage?: string | null;\n  isExclusive?: boolean;\n  isTypeExclusive?: boolean;\n  lastExecutionTime?: string | null;\n  lastStartTime?: string | null;\n  name?: string | null;\n  requiresDiskAccess?: boolean;\n  sendUpdatesToClient?: boolean;\n  suppressMessages?: boolean;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
+        "CommandPriority",
+        "export type CommandPriority = \"normal\" | \"high\" | \"low\";",
+        "export interface CommandResource {\n  body?: Command;\n  clientUserAgent?: string | null;\n  commandName?: string | null;\n  duration?: string | null;\n  ended?: string | null;\n  exception?: string | null;\n  id?: number;\n  lastExecutionTime?: string | null;\n  message?: string | null;\n  name?: string | null;\n  priority?: CommandPriority;\n  queued?: string;\n  sendUpdatesToClient?: boolean;\n  started?: string | null;\n  stateChangeTime?: string | null;\n  status?: CommandStatus;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
+        "CommandStatus",
+        "export type CommandStatus = \"queued\" | \"started\" | \"completed\" | \"failed\" | \"aborted\" | \"cancelled\" | \"orphaned\";",
+        "CommandTrigger",
+        "export type CommandTrigger = \"unspecified\" | \"manual\" | \"scheduled\";",
+        "export interface CustomFilterResource {\n  filters?: Record<string, unknown>[] | null;\n  id?: number;\n  label?: string | null;\n  type?: string | null;\n}",
+        "DatabaseType",
+        "export type DatabaseType = \"sqLite\" | \"postgreSQL\";",
+        "export interface DevelopmentConfigResource {\n  consoleLogLevel?: string | null;\n  filterSentryEvents?: boolean;\n  id?: number;\n  logIndexerResponse?: boolean;\n  logRotate?: number;\n  logSql?: boolean;\n}",
+        "export interface DownloadClientBulkResource {\n  applyTags?: ApplyTags;\n  enable?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  tags?: number[] | null;\n}",
+        "DownloadClientCategory",
+        "export interface DownloadClientCategory {\n  categories?: number[] | null;\n  clientCategory?: string | null;\n}",
+        "export interface DownloadClientConfigResource {\n  id?: number;\n}",
+        "export interface DownloadClientResource {\n  categories?: DownloadClientCategory[] | null;\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: DownloadClientResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  supportsCategories?: boolean;\n  tags?: number[] | null;\n}",
+        "DownloadProtocol",
+        "export type DownloadProtocol = \"unknown\" | \"usenet\" | \"torrent\";",
+        "Field",
+        "export interface Field {\n  advanced?: boolean;\n  helpLink?: string | null;\n  helpText?: string | null;\n  helpTextWarning?: string | null;\n  hidden?: string | null;\n  isFloat?: boolean;\n  label?: string | null;\n  name?: string | null;\n  order?: number;\n  placeholder?: string | null;\n  privacy?: PrivacyLevel;\n  section?: string | null;\n  selectOptions?: SelectOption[] | null;\n  selectOptionsProviderAction?: string | null;\n  type?: string | null;\n  unit?: string | null;\n  value?: unknown | null;\n}",
+        "HealthCheckResult",
+        "export type HealthCheckResult = \"ok\" | \"notice\" | \"warning\" | \"error\";",
+        "export interface HealthResource {\n  id?: number;\n  message?: string | null;\n  source?: string | null;\n  type?: HealthCheckResult;\n  wikiUrl?: string | null;\n}",
+        "HistoryEventType",
+        "export type HistoryEventType = \"unknown\" | \"releaseGrabbed\" | \"indexerQuery\" | \"indexerRss\" | \"indexerAuth\" | \"indexerInfo\";",
+        "export interface HistoryResource {\n  data?: Record<string, string | null> | null;\n  date?: string;\n  downloadId?: string | null;\n  eventType?: HistoryEventType;\n  id?: number;\n  indexerId?: number;\n  successful?: boolean;\n}",
+        "export interface HistoryResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: HistoryResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "export interface HostConfigResource {\n  analyticsEnabled?: boolean;\n  apiKey?: string | null;\n  applicationUrl?: string | null;\n  authenticationMethod?: AuthenticationType;\n  authenticationRequired?: AuthenticationRequiredType;\n  backupFolder?: string | null;\n  backupInterval?: number;\n  backupRetention?: number;\n  bindAddress?: string | null;\n  branch?: string | null;\n  certificateValidation?: CertificateValidationType;\n  consoleLogLevel?: string | null;\n  enableSsl?: boolean;\n  historyCleanupDays?: number;\n  id?: number;\n  instanceName?: string | null;\n  launchBrowser?: boolean;\n  logLevel?: string | null;\n  logSizeLimit?: number;\n  password?: string | null;\n  passwordConfirmation?: string | null;\n  port?: number;\n  proxyBypassFilter?: string | null;\n  proxyBypassLocalAddresses?: boolean;\n  proxyEnabled?: boolean;\n  proxyHostname?: string | null;\n  proxyPassword?: string | null;\n  proxyPort?: number;\n  proxyType?: ProxyType;\n  proxyUsername?: string | null;\n  sslCertPassword?: string | null;\n  sslCertPath?: string | null;\n  sslPort?: number;\n  trustCgnatIpAddresses?: boolean;\n  updateAutomatically?: boolean;\n  updateMechanism?: UpdateMechanism;\n  updateScriptPath?: string | null;\n  urlBase?: string | null;\n  username?: string | null;\n}",
+        "HostStatistics",
+        "export interface HostStatistics {\n  host?: string | null;\n  numberOfGrabs?: number;\n  numberOfQueries?: number;\n}",
+        "export interface IActionResult {}",
+        "export interface IndexerBulkResource {\n  appProfileId?: number | null;\n  applyTags?: ApplyTags;\n  enable?: boolean | null;\n  ids?: number[] | null;\n  minimumSeeders?: number | null;\n  packSeedTime?: number | null;\n  preferMagnetUrl?: boolean | null;\n  priority?: number | null;\n  seedRatio?: number | null;\n  seedTime?: number | null;\n  tags?: number[] | null;\n}",
+        "IndexerCapabilityResource",
+        "export interface IndexerCapabilityResource {\n  bookSearchParams?: BookSearchParam[] | null;\n  categories?: IndexerCategory[] | null;\n  id?: number;\n  limitsDefault?: number | null;\n  limitsMax?: number | null;\n  movieSearchParams?: MovieSearchParam[] | null;\n  musicSearchParams?: MusicSearchParam[] | null;\n  searchParams?: SearchParam[] | null;\n  supportsRawSearch?: boolean;\n  tvSearchParams?: TvSearchParam[] | null;\n}",
+        "export interface IndexerCategory {\n  description?: string | null;\n  id?: number;\n  name?: string | null;\n  subCategories?: IndexerCategory[] | null;\n}",
+        "IndexerPrivacy",
+        "export type IndexerPrivacy = \"public\" | \"semiPrivate\" | \"private\";",
+        "export interface IndexerProxyResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  includeHealthWarnings?: boolean;\n  infoLink?: string | null;\n  link?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  onHealthIssue?: boolean;\n  presets?: IndexerProxyResource[] | null;\n  supportsOnHealthIssue?: boolean;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
+        "export interface IndexerResource {\n  added?: string;\n  appProfileId?: number;\n  capabilities?: IndexerCapabilityResource;\n  configContract?: string | null;\n  definitionName?: string | null;\n  description?: string | null;\n  downloadClientId?: number;\n  enable?: boolean;\n  encoding?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  indexerUrls?: string[] | null;\n  infoLink?: string | null;\n  language?: string | null;\n  legacyUrls?: string[] | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: IndexerResource[] | null;\n  priority?: number;\n  privacy?: IndexerPrivacy;\n  protocol?: DownloadProtocol;\n  redirect?: boolean;\n  sortName?: string | null;\n  status?: IndexerStatusResource;\n  supportsPagination?: boolean;\n  supportsRedirect?: boolean;\n  supportsRss?: boolean;\n  supportsSearch?: boolean;\n  tags?: number[] | null;\n}",
+        "IndexerStatistics",
+        "export interface IndexerStatistics {\n  averageGrabResponseTime?: number;\n  averageResponseTime?: number;\n  indexerId?: number;\n  indexerName?: string | null;\n  numberOfAuthQueries?: number;\n  numberOfFailedAuthQueries?: number;\n  numberOfFailedGrabs?: number;\n  numberOfFailedQueries?: number;\n  numberOfFailedRssQueries?: number;\n  numberOfGrabs?: number;\n  numberOfQueries?: number;\n  numberOfRssQueries?: number;\n}",
+        "export interface IndexerStatsResource {\n  hosts?: HostStatistics[] | null;\n  id?: number;\n  indexers?: IndexerStatistics[] | null;\n  userAgents?: UserAgentStatistics[] | null;\n}",
+        "export interface IndexerStatusResource {\n  disabledTill?: string | null;\n  id?: number;\n  indexerId?: number;\n  initialFailure?: string | null;\n  mostRecentFailure?: string | null;\n}",
+        "export interface LocalizationOption {\n  name?: string | null;\n  value?: string | null;\n}",
+        "export interface LogFileResource {\n  contentsUrl?: string | null;\n  downloadUrl?: string | null;\n  filename?: string | null;\n  id?: number;\n  lastWriteTime?: string;\n}",
+        "LogResource",
+        "export interface LogResource {\n  exception?: string | null;\n  exceptionType?: string | null;\n  id?: number;\n  level?: string | null;\n  logger?: string | null;\n  message?: string | null;\n  method?: string | null;\n  time?: string;\n}",
+        "export interface LogResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: LogResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "MovieSearchParam",
+        "export type MovieSearchParam = \"q\" | \"imdbId\" | \"tmdbId\" | \"imdbTitle\" | \"imdbYear\" | \"traktId\" | \"genre\" | \"doubanId\" | \"year\";",
+        "MusicSearchParam",
+        "export type MusicSearchParam = \"q\" | \"album\" | \"artist\" | \"label\" | \"year\" | \"genre\" | \"track\";",
+        "export interface NotificationResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  includeHealthWarnings?: boolean;\n  includeManualGrabs?: boolean;\n  infoLink?: string | null;\n  link?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  onApplicationUpdate?: boolean;\n  onGrab?: boolean;\n  onHealthIssue?: boolean;\n  onHealthRestored?: boolean;\n  presets?: NotificationResource[] | null;\n  supportsOnApplicationUpdate?: boolean;\n  supportsOnGrab?: boolean;\n  supportsOnHealthIssue?: boolean;\n  supportsOnHealthRestored?: boolean;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
+        "export interface PingResource {\n  status?: string | null;\n}",
+        "PrivacyLevel",
+        "export type PrivacyLevel = \"normal\" | \"password\" | \"apiKey\" | \"userName\";",
+        "ProviderMessage",
+        "export interface ProviderMessage {\n  message?: string | null;\n  type?: ProviderMessageType;\n}",
+        "ProviderMessageType",
+        "export type ProviderMessageType = \"info\" | \"warning\" | \"error\";",
+        "ProxyType",
+        "export type ProxyType = \"http\" | \"socks4\" | \"socks5\";",
+        "export interface ReleaseResource {\n  age?: number;\n  ageHours?: number;\n  ageMinutes?: number;\n  categories?: IndexerCategory[] | null;\n  commentUrl?: string | null;\n  downloadClientId?: number | null;\n  downloadUrl?: string | null;\n  fileName?: string | null;\n  files?: number | null;\n  grabs?: number | null;\n  guid?: string | null;\n  id?: number;\n  imdbId?: number;\n  indexer?: string | null;\n  indexerFlags?: string[] | null;\n  indexerId?: number;\n  infoHash?: string | null;\n  infoUrl?: string | null;\n  leechers?: number | null;\n  magnetUrl?: string | null;\n  posterUrl?: string | null;\n  protocol?: DownloadProtocol;\n  publishDate?: string;\n  releaseHash?: string | null;\n  seeders?: number | null;\n  size?: number;\n  sortTitle?: string | null;\n  subGroup?: string | null;\n  title?: string | null;\n  tmdbId?: number;\n  tvMazeId?: number;\n  tvdbId?: number;\n}",
+        "RuntimeMode",
+        "export type RuntimeMode = \"console\" | \"service\" | \"tray\";",
+        "SearchParam",
+        "export type SearchParam = \"q\";",
+        "SelectOption",
+        "export interface SelectOption {\n  hint?: string | null;\n  name?: string | null;\n  order?: number;\n  parentValue?: number | null;\n  value?: number;\n}",
+        "SortDirection",
+        "export type SortDirection = \"default\" | \"ascending\" | \"descending\";",
+        "export interface SystemResource {\n  appData?: string | null;\n  appName?: string | null;\n  authentication?: AuthenticationType;\n  branch?: string | null;\n  buildTime?: string;\n  databaseType?: DatabaseType;\n  databaseVersion?: string | null;\n  instanceName?: string | null;\n  isAdmin?: boolean;\n  isDebug?: boolean;\n  isDocker?: boolean;\n  isLinux?: boolean;\n  isNetCore?: boolean;\n  isOsx?: boolean;\n  isProduction?: boolean;\n  isUserInteractive?: boolean;\n  isWindows?: boolean;\n  migrationVersion?: number;\n  mode?: RuntimeMode;\n  osName?: string | null;\n  osVersion?: string | null;\n  packageAuthor?: string | null;\n  packageUpdateMechanism?: UpdateMechanism;\n  packageUpdateMechanismMessage?: string | null;\n  packageVersion?: string | null;\n  runtimeName?: string | null;\n  runtimeVersion?: string | null;\n  startTime?: string;\n  startupPath?: string | null;\n  urlBase?: string | null;\n  version?: string | null;\n}",
+        "export interface TagDetailsResource {\n  applicationIds?: number[] | null;\n  id?: number;\n  indexerIds?: number[] | null;\n  indexerProxyIds?: number[] | null;\n  label?: string | null;\n  notificationIds?: number[] | null;\n}",
+        "export interface TagResource {\n  id?: number;\n  label?: string | null;\n}",
+        "export interface TaskResource {\n  id?: number;\n  interval?: number;\n  lastDuration?: string;\n  lastExecution?: string;\n  lastStartTime?: string;\n  name?: string | null;\n  nextExecution?: string;\n  taskName?: string | null;\n}",
+        "TvSearchParam",
+        "export type TvSearchParam = \"q\" | \"season\" | \"ep\" | \"imdbId\" | \"tvdbId\" | \"rId\" | \"tvMazeId\" | \"traktId\" | \"tmdbId\" | \"doubanId\" | \"genre\" | \"year\";",
+        "export interface UiConfigResource {\n  calendarWeekColumnHeader?: string | null;\n  enableColorImpairedMode?: boolean;\n  firstDayOfWeek?: number;\n  id?: number;\n  longDateFormat?: string | null;\n  shortDateFormat?: string | null;\n  showRelativeDates?: boolean;\n  theme?: string | null;\n  timeFormat?: string | null;\n  uiLanguage?: string | null;\n}",
+        "UpdateChanges",
+        "export interface UpdateChanges {\n  fixed?: string[] | null;\n  new?: string[] | null;\n}",
+        "UpdateMechanism",
+        "export type UpdateMechanism = \"builtIn\" | \"script\" | \"external\" | \"apt\" | \"docker\";",
+        "export interface UpdateResource {\n  branch?: string | null;\n  changes?: UpdateChanges;\n  fileName?: string | null;\n  hash?: string | null;\n  id?: number;\n  installable?: boolean;\n  installed?: boolean;\n  installedOn?: string | null;\n  latest?: boolean;\n  releaseDate?: string;\n  url?: string | null;\n  version?: string | null;\n}",
+        "UserAgentStatistics",
+        "export interface UserAgentStatistics {\n  numberOfGrabs?: number;\n  numberOfQueries?: number;\n  userAgent?: string | null;\n}",
+    ),
+    string_ends: &[
+        24, 49, 65, 120, 124, 147, 158, 158, 183, 208, 210, 245, 268, 291, 301, 321, 341, 348, 373,
+        398, 410, 436, 463, 521, 547, 561, 588, 615, 634, 654, 705, 724, 731, 751, 771, 796, 821,
+        833, 858, 883, 895, 921, 947, 953, 969, 985, 988, 991, 995, 998, 1045, 1060, 1067, 1083,
+        1103, 1179, 1198, 1220, 1271, 1294, 1321, 1335, 1353, 1428, 1446, 1466, 1516, 1537, 1562,
+        1571, 1580, 1585, 1591, 1597, 1600, 1610, 1618, 1620, 1628, 1633, 1637, 1643, 1648, 1653,
+        1659, 1666, 1672, 1679, 1685, 1694, 1695, 1698, 1704, 1710, 1716, 1717, 1722, 1728, 1733,
+        1740, 1746, 1754, 1758, 1775, 1810, 1817, 1830, 1837, 1841, 1882, 1896, 1907, 1922, 1994,
+        2009, 2026, 2073, 2095, 2121, 2178, 2203, 2220, 2248, 2279, 2304, 2333, 2393, 2421, 2441,
+        2472, 2506, 2521, 2540, 2590, 2608, 2618, 2639, 2663, 2676, 2693, 2741, 2757, 2765, 2784,
+        2806, 2825, 2840, 2856, 2876, 2953, 2973, 2995, 3047, 3065, 3079, 3083, 3087, 3105, 3127,
+        3206, 3228, 3252, 3306, 3331, 3360, 3374, 3392, 3426, 3438, 3472, 3482, 3501, 3524, 3534,
+        3548, 3619, 3633, 3639, 3650, 3665, 3675, 3684, 3694, 3698, 3706, 3719, 3726, 3736, 3796,
+        3843, 3891, 3936, 3954, 4015, 4044, 4051, 4070, 4093, 4102, 4150, 4222, 4237, 4254, 4275,
+        4279, 4317, 4328, 4343, 4415, 4430, 4447, 4494, 4516, 4542, 4614, 4629, 4653, 4679, 4708,
+        4733, 4761, 4779, 4801, 4817, 4837, 4914, 4934, 4956, 5008, 5031, 5058, 5074, 5094, 5101,
+        5109, 5118, 5127, 5131, 5183, 5203, 5215, 5232, 5253, 5331, 5352, 5365, 5381, 5401, 5413,
+        5437, 5465, 5540, 5558, 5565, 5576, 5581, 5638, 5663, 5666, 5678, 5694, 5766, 5781, 5788,
+        5812, 5839, 5847, 5898, 5908, 5953, 5966, 5985, 6008, 6021, 6052, 6086, 6095, 6101, 6111,
+        6118, 6132, 6148, 6168, 6245, 6265, 6287, 6339, 6362, 6389, 6397, 6402, 6446, 6458, 6462,
+        6472, 6486, 6496, 6501, 6505, 6577, 6592, 6598, 6615, 6636, 6707, 6721, 6738, 6759, 6765,
+        6792, 6823, 6840, 6861, 6907, 6921, 6936, 6955, 7024, 7036, 7040, 7061, 7085, 7129, 7136,
+        7147, 7215, 7226, 7239, 7282, 7296, 7314, 7389, 7407, 7417, 7437, 7460, 7510, 7520, 7534,
+        7605, 7619, 7625, 7642, 7651, 7683, 7717, 7721, 7743, 7768, 7777, 7802, 7830, 7845, 7857,
+        7874, 7893, 7927, 7963, 7987, 8014, 8041, 8071, 8083, 8110, 8139, 8156, 8176, 8196, 8219,
+        8236, 8268, 8302, 8324, 8349, 8374, 8402, 8412, 8421, 8440, 8561, 8648, 8665, 8697, 8731,
+        8753, 8778, 8803, 8831, 8842, 8889, 8905, 8924, 8956, 8990, 9023, 9059, 9154, 9196, 9215,
+        9237, 9257, 9280, 9288, 9309, 9331, 9351, 9379, 9410, 9431, 9450, 9472, 9495, 9519, 9535,
+        9552, 9574, 9596, 9609, 9704, 9904, 10060, 10464, 10484, 10555, 10564, 10617, 10643, 10724,
+        10742, 10815, 10968, 10978, 11037, 11052, 11140, 11165, 11258, 11662, 11677, 11733, 12269,
+        12282, 12395, 12409, 12477, 12628, 12640, 12691, 12893, 13071, 13093, 13202, 13266, 13761,
+        13777, 13841, 13846, 14345, 14362, 14432, 14590, 14606, 14730, 14953, 15164, 16421, 16435,
+        16548, 16581, 16943, 16968, 17390, 17540, 17554, 17620, 18111, 19041, 19058, 19475, 19652,
+        19834, 19922, 20089, 20100, 20330, 20533, 20549, 20677, 20693, 20788, 21501, 21560, 21572,
+        21645, 21660, 21753, 21772, 21835, 21844, 21897, 22762, 22773, 22830, 22841, 22871, 22883,
+        23031, 23044, 23111, 24030, 24251, 24323, 24547, 24560, 24708, 25053, 25066, 25152, 25167,
+        25250, 25578, 25597, 25720,
+    ],
+    names: &[
+        10, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+        93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 108, 155, 156, 167, 168, 108, 180, 181, 182,
+        183, 184, 185, 186, 187, 181, 198, 83, 204, 181, 233, 234, 235, 236, 237, 255, 183, 184,
+        185, 186, 266, 296, 182, 83, 88, 297, 298, 343, 346, 349, 377,
+    ],
+    parameters: &[
+        [10, 0, 1, 11, 0, 0],
+        [71, 1, 0, 103, 3, 1],
+        [72, 1, 0, 103, 3, 1],
+        [73, 1, 0, 103, 3, 1],
+        [74, 1, 0, 103, 3, 1],
+        [75, 1, 0, 103, 3, 1],
+        [76, 1, 0, 11, 3, 1],
+        [77, 1, 0, 103, 3, 1],
+        [78, 1, 0, 103, 3, 1],
+        [79, 1, 0, 103, 3, 1],
+        [80, 1, 0, 103, 3, 1],
+        [10, 0, 1, 11, 0, 0],
+        [81, 1, 0, 103, 3, 1],
+        [82, 1, 0, 103, 3, 1],
+        [83, 1, 0, 11, 3, 1],
+        [84, 1, 0, 11, 3, 1],
+        [85, 1, 0, 104, 3, 1],
+        [86, 1, 0, 11, 3, 1],
+        [87, 1, 0, 104, 3, 1],
+        [88, 1, 0, 11, 3, 1],
+        [89, 1, 0, 103, 3, 1],
+        [90, 1, 0, 103, 3, 1],
+        [91, 1, 0, 11, 3, 1],
+        [92, 1, 0, 11, 3, 1],
+        [93, 1, 0, 103, 3, 1],
+        [94, 1, 0, 103, 3, 1],
+        [95, 1, 0, 103, 3, 1],
+        [96, 1, 0, 103, 3, 1],
+        [97, 1, 0, 11, 3, 1],
+        [98, 1, 0, 103, 3, 1],
+        [99, 1, 0, 11, 3, 1],
+        [100, 1, 0, 11, 3, 1],
+        [101, 1, 0, 11, 3, 1],
+        [102, 1, 0, 11, 3, 1],
+        [108, 0, 1, 109, 0, 0],
+        [155, 1, 0, 103, 3, 1],
+        [10, 0, 1, 11, 0, 0],
+        [156, 1, 0, 103, 3, 1],
+        [167, 1, 0, 169, 3, 1],
+        [168, 1, 0, 169, 3, 1],
+        [108, 1, 0, 103, 3, 1],
+        [108, 1, 0, 103, 3, 1],
+        [180, 1, 0, 103, 3, 1],
+        [181, 1, 0, 188, 3, 1],
+        [182, 1, 0, 188, 3, 1],
+        [183, 1, 0, 189, 3, 1],
+        [184, 1, 0, 190, 3, 1],
+        [185, 1, 0, 191, 3, 1],
+        [186, 1, 0, 103, 3, 1],
+        [187, 1, 0, 192, 3, 1],
+        [181, 1, 0, 199, 3, 1],
+        [198, 1, 0, 11, 3, 1],
+        [83, 1, 0, 11, 3, 1],
+        [204, 1, 0, 205, 3, 1],
+        [181, 1, 0, 199, 3, 1],
+        [233, 1, 0, 205, 3, 1],
+        [234, 1, 0, 103, 3, 1],
+        [235, 1, 0, 103, 3, 1],
+        [236, 1, 0, 205, 3, 1],
+        [237, 1, 0, 103, 3, 1],
+        [255, 1, 0, 103, 3, 1],
+        [183, 1, 0, 189, 3, 1],
+        [184, 1, 0, 190, 3, 1],
+        [185, 1, 0, 191, 3, 1],
+        [186, 1, 0, 103, 3, 1],
+        [266, 0, 1, 267, 0, 0],
+        [296, 1, 0, 188, 3, 1],
+        [182, 1, 0, 188, 3, 1],
+        [83, 1, 0, 11, 3, 1],
+        [88, 1, 0, 11, 3, 1],
+        [297, 1, 0, 103, 3, 1],
+        [298, 1, 0, 103, 3, 1],
+        [343, 1, 0, 169, 3, 1],
+        [346, 0, 1, 103, 0, 0],
+        [349, 1, 0, 169, 3, 1],
+        [377, 1, 0, 103, 3, 1],
+        [343, 1, 0, 169, 3, 1],
+        [10, 0, 1, 103, 0, 0],
+        [10, 0, 1, 103, 0, 0],
+    ],
+    representations: &[
+        [0, 2, 0, 3, 4],
+        [0, 2, 0, 23, 4],
+        [0, 2, 0, 30, 4],
+        [50, 2, 0, 50, 4],
+        [50, 2, 0, 55, 4],
+        [50, 2, 0, 58, 4],
+        [50, 2, 0, 63, 4],
+        [50, 2, 0, 66, 4],
+        [50, 2, 0, 113, 4],
+        [50, 2, 0, 116, 4],
+        [50, 2, 0, 119, 4],
+        [50, 2, 0, 126, 4],
+        [50, 2, 0, 133, 4],
+        [50, 2, 0, 140, 4],
+        [50, 2, 0, 149, 4],
+        [50, 2, 0, 152, 4],
+        [50, 2, 0, 159, 4],
+        [50, 2, 0, 162, 4],
+        [50, 2, 0, 175, 4],
+        [50, 2, 0, 193, 4],
+        [50, 2, 0, 200, 4],
+        [50, 2, 0, 208, 4],
+        [50, 2, 0, 211, 4],
+        [50, 2, 0, 214, 4],
+        [50, 2, 0, 225, 4],
+        [50, 2, 0, 228, 4],
+        [50, 2, 0, 238, 4],
+        [50, 2, 0, 243, 4],
+        [50, 2, 0, 251, 4],
+        [50, 2, 0, 256, 4],
+        [50, 2, 0, 261, 4],
+        [50, 268, 3, 269, 4],
+        [50, 2, 0, 283, 4],
+        [50, 2, 0, 286, 4],
+        [50, 2, 0, 291, 4],
+        [50, 2, 0, 299, 4],
+        [50, 2, 0, 304, 4],
+        [50, 2, 0, 313, 4],
+        [50, 2, 0, 317, 4],
+        [50, 2, 0, 322, 4],
+        [50, 2, 0, 325, 4],
+        [50, 2, 0, 328, 4],
+        [50, 2, 0, 331, 4],
+        [50, 2, 0, 336, 4],
+        [50, 2, 0, 339, 4],
+        [0, 2, 0, 58, 4],
+        [0, 2, 0, 66, 4],
+        [0, 2, 0, 116, 4],
+        [0, 2, 0, 152, 4],
+        [0, 2, 0, 162, 4],
+        [0, 2, 0, 211, 4],
+        [0, 2, 0, 228, 4],
+        [0, 378, 2, 379, 380],
+        [0, 2, 0, 286, 4],
+        [0, 2, 0, 389, 4],
+        [50, 2, 0, 389, 4],
+        [0, 2, 0, 299, 4],
+        [0, 378, 2, 396, 397],
+        [0, 2, 0, 328, 4],
+        [0, 2, 0, 119, 4],
+        [0, 2, 0, 126, 4],
+        [0, 2, 0, 133, 4],
+        [0, 2, 0, 140, 4],
+    ],
+    operations: &[
+        [0, 3, 1, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 6, 0, 6, 7],
+        [8, 3, 9, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 6, 7],
+        [12, 3, 13, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 14, 7],
+        [15, 3, 16, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 17, 7],
+        [18, 3, 19, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 20, 7],
+        [21, 3, 22, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 25, 0, 25, 7],
+        [26, 3, 27, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 25, 7],
+        [28, 3, 29, 0, 0, 0, 0, 0, 0, 1, 2, 1, 0, 0, 32, 0, 32, 7],
+        [33, 3, 34, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 32, 7],
+        [35, 3, 36, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 37, 7],
+        [38, 3, 39, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 40, 7],
+        [41, 3, 42, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 43, 7],
+        [44, 3, 45, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 46, 7],
+        [47, 0, 48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1, 0, 52, 52, 7],
+        [53, 0, 54, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 1, 0, 57, 6, 7],
+        [57, 0, 9, 0, 1, 0, 0, 0, 1, 0, 0, 0, 5, 1, 0, 57, 6, 7],
+        [59, 0, 60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 1, 0, 57, 6, 7],
+        [61, 0, 62, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6, 1, 0, 65, 14, 7],
+        [65, 0, 13, 0, 1, 0, 0, 0, 1, 0, 0, 0, 7, 1, 0, 65, 14, 7],
+        [67, 0, 68, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 1, 0, 65, 14, 7],
+        [69, 0, 70, 0, 1, 1, 32, 1, 33, 0, 0, 0, 0, 0, 0, 0, 105, 7],
+        [106, 0, 107, 33, 1, 0, 0, 34, 1, 0, 0, 0, 0, 0, 0, 0, 110, 7],
+        [111, 0, 112, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 1, 0, 115, 17, 7],
+        [115, 0, 16, 0, 1, 0, 0, 0, 1, 0, 0, 0, 9, 1, 0, 115, 17, 7],
+        [
+            117, 0, 118, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 1, 0, 121, 121, 7,
+        ],
+        [
+            122, 0, 123, 0, 1, 0, 0, 0, 1, 0, 0, 0, 10, 1, 0, 121, 121, 7,
+        ],
+        [
+            124, 0, 125, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11, 1, 0, 128, 128, 7,
+        ],
+        [
+            129, 0, 130, 0, 1, 0, 0, 0, 1, 0, 0, 0, 11, 1, 0, 128, 128, 7,
+        ],
+        [
+            131, 0, 132, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 1, 0, 135, 135, 7,
+        ],
+        [
+            136, 0, 137, 0, 1, 0, 0, 0, 1, 0, 0, 0, 12, 1, 0, 135, 135, 7,
+        ],
+        [
+            138, 0, 139, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 1, 0, 142, 142, 7,
+        ],
+        [
+            143, 0, 144, 0, 1, 0, 0, 0, 1, 0, 0, 0, 13, 1, 0, 142, 142, 7,
+        ],
+        [145, 0, 146, 33, 1, 0, 0, 34, 1, 0, 0, 0, 0, 0, 0, 0, 110, 7],
+        [147, 0, 148, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14, 1, 0, 151, 20, 7],
+        [151, 0, 19, 0, 1, 0, 0, 0, 1, 0, 0, 0, 15, 1, 0, 151, 20, 7],
+        [153, 0, 154, 0, 1, 34, 2, 35, 3, 0, 0, 0, 0, 0, 0, 0, 105, 7],
+        [157, 0, 158, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16, 1, 0, 161, 25, 7],
+        [161, 0, 27, 0, 1, 0, 0, 0, 1, 0, 0, 0, 17, 1, 0, 161, 25, 7],
+        [163, 0, 164, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16, 1, 0, 161, 25, 7],
+        [165, 0, 166, 0, 0, 36, 3, 38, 3, 0, 0, 0, 0, 0, 0, 0, 170, 7],
+        [171, 0, 172, 0, 0, 33, 1, 41, 1, 0, 0, 0, 0, 0, 0, 0, 170, 7],
+        [
+            173, 0, 174, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18, 1, 0, 177, 177, 7,
+        ],
+        [
+            178, 0, 179, 0, 0, 39, 8, 42, 8, 0, 0, 0, 19, 1, 0, 195, 195, 7,
+        ],
+        [
+            196, 0, 197, 0, 0, 47, 3, 50, 3, 0, 0, 0, 20, 1, 0, 202, 195, 7,
+        ],
+        [
+            202, 0, 203, 0, 0, 50, 2, 53, 2, 0, 0, 0, 20, 1, 0, 202, 195, 7,
+        ],
+        [206, 0, 207, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21, 1, 0, 210, 32, 7],
+        [210, 0, 34, 0, 1, 0, 0, 0, 1, 0, 0, 0, 22, 1, 0, 210, 32, 7],
+        [
+            212, 0, 213, 0, 0, 0, 0, 0, 0, 0, 0, 0, 23, 1, 0, 216, 216, 7,
+        ],
+        [217, 0, 218, 0, 1, 34, 2, 35, 3, 0, 0, 0, 0, 0, 0, 0, 105, 7],
+        [219, 0, 220, 0, 1, 1, 32, 1, 33, 0, 0, 0, 0, 0, 0, 0, 105, 7],
+        [221, 0, 222, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21, 1, 0, 210, 32, 7],
+        [223, 0, 224, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 1, 0, 227, 37, 7],
+        [227, 0, 36, 0, 1, 0, 0, 0, 1, 0, 0, 0, 25, 1, 0, 227, 37, 7],
+        [229, 0, 230, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 1, 0, 227, 37, 7],
+        [
+            231, 0, 232, 0, 0, 52, 5, 55, 5, 0, 0, 0, 26, 1, 0, 240, 240, 7,
+        ],
+        [
+            241, 0, 242, 0, 0, 0, 0, 0, 0, 0, 0, 0, 27, 1, 0, 245, 245, 7,
+        ],
+        [246, 0, 247, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 248, 7],
+        [
+            249, 0, 250, 0, 0, 0, 0, 0, 0, 0, 0, 0, 28, 1, 0, 253, 248, 7,
+        ],
+        [
+            253, 0, 254, 0, 0, 57, 5, 60, 5, 0, 0, 0, 29, 1, 0, 258, 258, 7,
+        ],
+        [
+            259, 0, 260, 0, 0, 0, 0, 0, 0, 0, 0, 0, 30, 1, 0, 263, 263, 7,
+        ],
+        [
+            264, 0, 265, 62, 1, 0, 0, 65, 1, 0, 0, 0, 31, 1, 0, 271, 263, 7,
+        ],
+        [
+            271, 0, 272, 0, 0, 0, 0, 0, 0, 0, 0, 0, 30, 1, 0, 263, 273, 7,
         ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "album",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "artist",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "author",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "cat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "configured",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "doubanid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "ep",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "extended",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "genre",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "host",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "imdbid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "label",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "limit",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "maxage",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "maxsize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int64\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "minage",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "minsize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int64\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "offset",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "publisher",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "q",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "rid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "season",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "server",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "source",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "t",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "title",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tmdbid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "track",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "traktid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tvdbid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tvmazeid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "year",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [
+            274, 0, 275, 62, 1, 0, 0, 65, 1, 0, 0, 0, 31, 1, 0, 271, 273, 7,
         ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Newznab",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_by_path_2",
-        method: HttpMethod::Get,
-        path: "/{path}",
-        path_params: &["path"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"^(?!api/).*\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "StaticResource",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_command",
-        method: HttpMethod::Get,
-        path: "/api/v1/command",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/CommandResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CommandResource"),
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_command_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/command/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CommandResource"),
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_development",
-        method: HttpMethod::Get,
-        path: "/api/v1/config/development",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DevelopmentConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DevelopmentConfigResource"),
-        tag: "DevelopmentConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_development_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/config/development/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DevelopmentConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DevelopmentConfigResource"),
-        tag: "DevelopmentConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_downloadclient",
-        method: HttpMethod::Get,
-        path: "/api/v1/config/downloadclient",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientConfigResource"),
-        tag: "DownloadClientConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_downloadclient_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/config/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientConfigResource"),
-        tag: "DownloadClientConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_host",
-        method: HttpMethod::Get,
-        path: "/api/v1/config/host",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HostConfigResource"),
-        tag: "HostConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_host_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/config/host/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HostConfigResource"),
-        tag: "HostConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_ui",
-        method: HttpMethod::Get,
-        path: "/api/v1/config/ui",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("UiConfigResource"),
-        tag: "UiConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_ui_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/config/ui/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("UiConfigResource"),
-        tag: "UiConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_content_by_path",
-        method: HttpMethod::Get,
-        path: "/content/{path}",
-        path_params: &["path"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"^(?!api/).*\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "StaticResource",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customfilter",
-        method: HttpMethod::Get,
-        path: "/api/v1/customfilter",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/CustomFilterResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customfilter_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/customfilter/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_download_by_id",
-        method: HttpMethod::Get,
-        path: "/{id}/download",
-        path_params: &["id"],
-        query_params: &["file", "link"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "file",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "link",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [276, 0, 277, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 110, 7],
+        [278, 0, 279, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 280, 7],
+        [281, 0, 282, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 1, 0, 285, 40, 7],
+        [285, 0, 39, 0, 1, 0, 0, 0, 1, 0, 0, 0, 33, 1, 0, 285, 40, 7],
+        [287, 0, 288, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 1, 0, 285, 40, 7],
+        [
+            289, 0, 290, 0, 0, 0, 0, 0, 0, 0, 0, 0, 34, 1, 0, 293, 293, 7,
         ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Newznab",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_downloadclient",
-        method: HttpMethod::Get,
-        path: "/api/v1/downloadclient",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DownloadClientResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_downloadclient_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_downloadclient_schema",
-        method: HttpMethod::Get,
-        path: "/api/v1/downloadclient/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DownloadClientResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_filesystem",
-        method: HttpMethod::Get,
-        path: "/api/v1/filesystem",
-        path_params: &[],
-        query_params: &["allowFoldersWithoutTrailingSlashes", "includeFiles", "path"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "allowFoldersWithoutTrailingSlashes",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeFiles",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "path",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [
+            294, 0, 295, 0, 0, 63, 6, 66, 6, 0, 0, 0, 35, 1, 0, 301, 301, 7,
         ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "FileSystem",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_filesystem_type",
-        method: HttpMethod::Get,
-        path: "/api/v1/filesystem/type",
-        path_params: &[],
-        query_params: &["path"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "FileSystem",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_health",
-        method: HttpMethod::Get,
-        path: "/api/v1/health",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/HealthResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HealthResource"),
-        tag: "Health",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_history",
-        method: HttpMethod::Get,
-        path: "/api/v1/history",
-        path_params: &[],
-        query_params: &[
-            "downloadId",
-            "eventType",
-            "indexerIds",
-            "page",
-            "pageSize",
-            "sortDirection",
-            "sortKey",
-            "successful",
+        [302, 0, 303, 0, 0, 0, 0, 0, 0, 0, 0, 0, 36, 1, 0, 306, 43, 7],
+        [306, 0, 307, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 308, 7],
+        [309, 0, 310, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 308, 7],
+        [
+            311, 0, 312, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 1, 0, 315, 308, 7,
         ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "downloadId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "eventType",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "indexerIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "successful",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [
+            315, 0, 316, 0, 0, 0, 0, 0, 0, 0, 0, 0, 38, 1, 0, 319, 319, 7,
         ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/HistoryResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HistoryResourcePagingResource"),
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_history_indexer",
-        method: HttpMethod::Get,
-        path: "/api/v1/history/indexer",
-        path_params: &[],
-        query_params: &["eventType", "indexerId", "limit"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "eventType",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/HistoryEventType\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "indexerId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "limit",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [
+            320, 0, 321, 0, 1, 0, 0, 0, 1, 0, 0, 0, 39, 1, 0, 319, 319, 7,
         ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/HistoryResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HistoryResource"),
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_history_since",
-        method: HttpMethod::Get,
-        path: "/api/v1/history/since",
-        path_params: &[],
-        query_params: &["date", "eventType"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "date",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"date-time\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "eventType",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/HistoryEventType\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [323, 0, 324, 0, 0, 0, 0, 0, 0, 0, 0, 0, 40, 1, 0, 327, 46, 7],
+        [327, 0, 45, 0, 1, 0, 0, 0, 1, 0, 0, 0, 41, 1, 0, 327, 46, 7],
+        [
+            329, 0, 330, 0, 0, 0, 0, 0, 0, 0, 0, 0, 42, 1, 0, 333, 333, 7,
         ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/HistoryResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HistoryResource"),
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexer",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer_categories",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexer/categories",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerCategory\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerCategory"),
-        tag: "IndexerDefaultCategories",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer_download_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexer/{id}/download",
-        path_params: &["id"],
-        query_params: &["file", "link"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "file",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "link",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [
+            334, 0, 335, 0, 1, 0, 0, 0, 1, 0, 0, 0, 43, 1, 0, 333, 333, 7,
         ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Newznab",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer_newznab_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexer/{id}/newznab",
-        path_params: &["id"],
-        query_params: &[
-            "album",
-            "artist",
-            "author",
-            "cat",
-            "configured",
-            "doubanid",
-            "ep",
-            "extended",
-            "genre",
-            "host",
-            "imdbid",
-            "label",
-            "limit",
-            "maxage",
-            "maxsize",
-            "minage",
-            "minsize",
-            "offset",
-            "publisher",
-            "q",
-            "rid",
-            "season",
-            "server",
-            "source",
-            "t",
-            "title",
-            "tmdbid",
-            "track",
-            "traktid",
-            "tvdbid",
-            "tvmazeid",
-            "year",
+        [
+            337, 0, 338, 0, 0, 0, 0, 0, 0, 0, 0, 0, 44, 1, 0, 341, 341, 7,
         ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "album",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "artist",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "author",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "cat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "configured",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "doubanid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "ep",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "extended",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "genre",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "host",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "imdbid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "label",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "limit",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "maxage",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "maxsize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int64\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "minage",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "minsize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int64\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "offset",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "publisher",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "q",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "rid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "season",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "server",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "source",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "t",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "title",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tmdbid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "track",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "traktid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tvdbid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tvmazeid",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "year",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [342, 1, 54, 0, 0, 69, 1, 72, 1, 1, 45, 1, 5, 1, 57, 57, 6, 7],
+        [344, 1, 345, 70, 1, 0, 0, 73, 1, 1, 45, 1, 0, 0, 57, 0, 6, 7],
+        [347, 1, 348, 0, 0, 71, 1, 74, 1, 1, 45, 1, 0, 0, 57, 0, 6, 7],
+        [350, 1, 351, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6, 7],
+        [352, 1, 62, 0, 0, 0, 0, 0, 0, 1, 46, 1, 7, 1, 65, 65, 14, 7],
+        [
+            353, 1, 112, 0, 0, 0, 0, 0, 0, 1, 47, 1, 9, 1, 115, 115, 17, 7,
         ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Newznab",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer_schema",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexer/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexerproxy",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexerproxy",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerProxyResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerProxyResource"),
-        tag: "IndexerProxy",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexerproxy_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexerproxy/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerProxyResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerProxyResource"),
-        tag: "IndexerProxy",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexerproxy_schema",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexerproxy/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerProxyResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerProxyResource"),
-        tag: "IndexerProxy",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexerstats",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexerstats",
-        path_params: &[],
-        query_params: &["endDate", "indexers", "protocols", "startDate", "tags"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "endDate",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"date-time\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "indexers",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "protocols",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "startDate",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"date-time\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tags",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [
+            354, 1, 148, 0, 0, 0, 0, 0, 0, 1, 48, 1, 15, 1, 151, 151, 20, 7,
         ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerStatsResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerStatsResource"),
-        tag: "IndexerStats",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexerstatus",
-        method: HttpMethod::Get,
-        path: "/api/v1/indexerstatus",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerStatusResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerStatusResource"),
-        tag: "IndexerStatus",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_localization",
-        method: HttpMethod::Get,
-        path: "/api/v1/localization",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Localization",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_localization_options",
-        method: HttpMethod::Get,
-        path: "/api/v1/localization/options",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/LocalizationOption\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LocalizationOption"),
-        tag: "Localization",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log",
-        method: HttpMethod::Get,
-        path: "/api/v1/log",
-        path_params: &[],
-        query_params: &["level", "page", "pageSize", "sortDirection", "sortKey"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "level",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [
+            355, 1, 158, 0, 0, 69, 1, 72, 1, 1, 49, 1, 17, 1, 161, 161, 25, 7,
         ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LogResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LogResourcePagingResource"),
-        tag: "Log",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file",
-        method: HttpMethod::Get,
-        path: "/api/v1/log/file",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LogFileResource"),
-        tag: "LogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file_by_filename",
-        method: HttpMethod::Get,
-        path: "/api/v1/log/file/{filename}",
-        path_params: &["filename"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "filename",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"[-.a-zA-Z0-9]+?\\\\.txt\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "text/plain",
-            encoding: BodyEncoding::Text,
-            schema: "{\"$ref\":\"#/components/schemas/IActionResult\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IActionResult"),
-        tag: "LogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file_update",
-        method: HttpMethod::Get,
-        path: "/api/v1/log/file/update",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LogFileResource"),
-        tag: "UpdateLogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file_update_by_filename",
-        method: HttpMethod::Get,
-        path: "/api/v1/log/file/update/{filename}",
-        path_params: &["filename"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "filename",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"[-.a-zA-Z0-9]+?\\\\.txt\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "text/plain",
-            encoding: BodyEncoding::Text,
-            schema: "{\"$ref\":\"#/components/schemas/IActionResult\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IActionResult"),
-        tag: "UpdateLogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_login",
-        method: HttpMethod::Get,
-        path: "/login",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "StaticResource",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_logout",
-        method: HttpMethod::Get,
-        path: "/logout",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Authentication",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_notification",
-        method: HttpMethod::Get,
-        path: "/api/v1/notification",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/NotificationResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_notification_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/notification/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_notification_schema",
-        method: HttpMethod::Get,
-        path: "/api/v1/notification/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/NotificationResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_ping",
-        method: HttpMethod::Get,
-        path: "/ping",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PingResource"),
-        tag: "Ping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_search",
-        method: HttpMethod::Get,
-        path: "/api/v1/search",
-        path_params: &[],
-        query_params: &[
-            "categories",
-            "indexerIds",
-            "limit",
-            "offset",
-            "query",
-            "type",
+        [
+            356, 1, 357, 70, 1, 0, 0, 73, 1, 1, 49, 1, 0, 0, 161, 0, 25, 7,
         ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "categories",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "indexerIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "limit",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "offset",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "query",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "type",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
+        [
+            358, 1, 359, 0, 0, 71, 1, 74, 1, 1, 49, 1, 0, 0, 161, 0, 25, 7,
         ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ReleaseResource"),
-        tag: "Search",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_backup",
-        method: HttpMethod::Get,
-        path: "/api/v1/system/backup",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("BackupResource"),
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_routes",
-        method: HttpMethod::Get,
-        path: "/api/v1/system/routes",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_routes_duplicate",
-        method: HttpMethod::Get,
-        path: "/api/v1/system/routes/duplicate",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_status",
-        method: HttpMethod::Get,
-        path: "/api/v1/system/status",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SystemResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("SystemResource"),
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_task",
-        method: HttpMethod::Get,
-        path: "/api/v1/system/task",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TaskResource"),
-        tag: "Task",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_task_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/system/task/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TaskResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TaskResource"),
-        tag: "Task",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag",
-        method: HttpMethod::Get,
-        path: "/api/v1/tag",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/tag/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag_detail",
-        method: HttpMethod::Get,
-        path: "/api/v1/tag/detail",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagDetailsResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TagDetailsResource"),
-        tag: "TagDetails",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag_detail_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v1/tag/detail/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TagDetailsResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TagDetailsResource"),
-        tag: "TagDetails",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_update",
-        method: HttpMethod::Get,
-        path: "/api/v1/update",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/UpdateResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("UpdateResource"),
-        tag: "Update",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_applications",
-        method: HttpMethod::Post,
-        path: "/api/v1/applications",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ApplicationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ApplicationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ApplicationResource"),
-        response_type: Some("ApplicationResource"),
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_applications_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v1/applications/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ApplicationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ApplicationResource"),
-        response_type: None,
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_applications_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/applications/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ApplicationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ApplicationResource"),
-        response_type: None,
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_applications_testall",
-        method: HttpMethod::Post,
-        path: "/api/v1/applications/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_appprofile",
-        method: HttpMethod::Post,
-        path: "/api/v1/appprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AppProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/AppProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("AppProfileResource"),
-        response_type: Some("AppProfileResource"),
-        tag: "AppProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_command",
-        method: HttpMethod::Post,
-        path: "/api/v1/command",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("CommandResource"),
-        response_type: Some("CommandResource"),
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_customfilter",
-        method: HttpMethod::Post,
-        path: "/api/v1/customfilter",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("CustomFilterResource"),
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient",
-        method: HttpMethod::Post,
-        path: "/api/v1/downloadclient",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientResource"),
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v1/downloadclient/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DownloadClientResource"),
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/downloadclient/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DownloadClientResource"),
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient_testall",
-        method: HttpMethod::Post,
-        path: "/api/v1/downloadclient/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer",
-        method: HttpMethod::Post,
-        path: "/api/v1/indexer",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerResource"),
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v1/indexer/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerResource"),
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/indexer/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerResource"),
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer_testall",
-        method: HttpMethod::Post,
-        path: "/api/v1/indexer/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexerproxy",
-        method: HttpMethod::Post,
-        path: "/api/v1/indexerproxy",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerProxyResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerProxyResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerProxyResource"),
-        response_type: Some("IndexerProxyResource"),
-        tag: "IndexerProxy",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexerproxy_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v1/indexerproxy/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerProxyResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerProxyResource"),
-        response_type: None,
-        tag: "IndexerProxy",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexerproxy_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/indexerproxy/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerProxyResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerProxyResource"),
-        response_type: None,
-        tag: "IndexerProxy",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexerproxy_testall",
-        method: HttpMethod::Post,
-        path: "/api/v1/indexerproxy/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "IndexerProxy",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_login",
-        method: HttpMethod::Post,
-        path: "/login",
-        path_params: &[],
-        query_params: &["returnUrl"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "returnUrl",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "multipart/form-data",
-                encoding: BodyEncoding::Multipart,
-                schema: "{\"properties\":{\"password\":{\"type\":\"string\"},\"rememberMe\":{\"type\":\"string\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"}",
-                encoding_metadata: "{\"password\":{\"style\":\"form\"},\"rememberMe\":{\"style\":\"form\"},\"username\":{\"style\":\"form\"}}",
-            }],
-        }),
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Authentication",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification",
-        method: HttpMethod::Post,
-        path: "/api/v1/notification",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("NotificationResource"),
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v1/notification/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("NotificationResource"),
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification_test",
-        method: HttpMethod::Post,
-        path: "/api/v1/notification/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("NotificationResource"),
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification_testall",
-        method: HttpMethod::Post,
-        path: "/api/v1/notification/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_search",
-        method: HttpMethod::Post,
-        path: "/api/v1/search",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ReleaseResource"),
-        response_type: Some("ReleaseResource"),
-        tag: "Search",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_search_bulk",
-        method: HttpMethod::Post,
-        path: "/api/v1/search/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ReleaseResource"),
-        response_type: Some("ReleaseResource"),
-        tag: "Search",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_backup_restore_by_id",
-        method: HttpMethod::Post,
-        path: "/api/v1/system/backup/restore/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_backup_restore_upload",
-        method: HttpMethod::Post,
-        path: "/api/v1/system/backup/restore/upload",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "multipart/form-data",
-                encoding: BodyEncoding::Multipart,
-                schema: "{\"type\":\"object\",\"required\":[\"file\"],\"properties\":{\"file\":{\"type\":\"string\",\"format\":\"binary\"}}}",
-                encoding_metadata: "{\"file\":{\"contentType\":\"application/zip\"}}",
-            }],
-        }),
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_restart",
-        method: HttpMethod::Post,
-        path: "/api/v1/system/restart",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_shutdown",
-        method: HttpMethod::Post,
-        path: "/api/v1/system/shutdown",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_tag",
-        method: HttpMethod::Post,
-        path: "/api/v1/tag",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("TagResource"),
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_applications_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v1/applications/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ApplicationBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ApplicationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ApplicationBulkResource"),
-        response_type: Some("ApplicationResource"),
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_applications_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/applications/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
+        [360, 1, 361, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25, 7],
+        [
+            362, 1, 207, 0, 0, 69, 1, 72, 1, 1, 50, 1, 22, 1, 210, 210, 32, 7,
         ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ApplicationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ApplicationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ApplicationResource"),
-        response_type: Some("ApplicationResource"),
-        tag: "Application",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_appprofile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/appprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AppProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/AppProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("AppProfileResource"),
-        response_type: Some("AppProfileResource"),
-        tag: "AppProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_development_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/config/development/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DevelopmentConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DevelopmentConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DevelopmentConfigResource"),
-        response_type: Some("DevelopmentConfigResource"),
-        tag: "DevelopmentConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_downloadclient_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/config/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientConfigResource"),
-        response_type: Some("DownloadClientConfigResource"),
-        tag: "DownloadClientConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_host_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/config/host/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("HostConfigResource"),
-        response_type: Some("HostConfigResource"),
-        tag: "HostConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_ui_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/config/ui/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("UiConfigResource"),
-        response_type: Some("UiConfigResource"),
-        tag: "UiConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_customfilter_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/customfilter/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("CustomFilterResource"),
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_downloadclient_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v1/downloadclient/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientBulkResource"),
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_downloadclient_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
+        [
+            363, 1, 364, 70, 1, 0, 0, 73, 1, 1, 50, 1, 0, 0, 210, 0, 32, 7,
         ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientResource"),
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_indexer_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v1/indexer/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerBulkResource"),
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_indexer_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/indexer/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
+        [
+            365, 1, 366, 0, 0, 71, 1, 74, 1, 1, 50, 1, 0, 0, 210, 0, 32, 7,
         ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerResource"),
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_indexerproxy_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/indexerproxy/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
+        [367, 1, 368, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 7],
+        [
+            369, 1, 224, 0, 0, 69, 1, 72, 1, 1, 51, 1, 25, 1, 227, 227, 37, 7,
         ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerProxyResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerProxyResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerProxyResource"),
-        response_type: Some("IndexerProxyResource"),
-        tag: "IndexerProxy",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_notification_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/notification/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
+        [
+            370, 1, 371, 70, 1, 0, 0, 73, 1, 1, 51, 1, 0, 0, 227, 0, 37, 7,
         ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("NotificationResource"),
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_tag_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v1/tag/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("TagResource"),
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-];
+        [
+            372, 1, 373, 0, 0, 71, 1, 74, 1, 1, 51, 1, 0, 0, 227, 0, 37, 7,
+        ],
+        [374, 1, 375, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 7],
+        [
+            376, 1, 277, 0, 0, 72, 1, 75, 1, 1, 52, 1, 0, 0, 0, 0, 280, 7,
+        ],
+        [
+            381, 1, 282, 0, 0, 69, 1, 72, 1, 1, 53, 1, 33, 1, 285, 285, 40, 7,
+        ],
+        [
+            382, 1, 383, 70, 1, 0, 0, 73, 1, 1, 53, 1, 0, 0, 285, 0, 40, 7,
+        ],
+        [
+            384, 1, 385, 0, 0, 71, 1, 74, 1, 1, 53, 1, 0, 0, 285, 0, 40, 7,
+        ],
+        [386, 1, 387, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 40, 7],
+        [
+            388, 1, 295, 0, 0, 0, 0, 0, 0, 1, 54, 1, 55, 1, 301, 301, 301, 7,
+        ],
+        [
+            390, 1, 391, 0, 0, 0, 0, 0, 0, 1, 56, 1, 55, 1, 301, 301, 301, 7,
+        ],
+        [392, 1, 393, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 43, 7],
+        [394, 1, 395, 0, 0, 0, 0, 0, 0, 2, 57, 1, 0, 0, 0, 0, 43, 7],
+        [398, 1, 399, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 308, 7],
+        [400, 1, 401, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 308, 7],
+        [
+            402, 1, 324, 0, 0, 0, 0, 0, 0, 1, 58, 1, 41, 1, 327, 327, 46, 7,
+        ],
+        [403, 2, 1, 0, 0, 0, 0, 0, 0, 1, 0, 1, 5, 1, 6, 57, 6, 7],
+        [404, 2, 9, 0, 1, 69, 1, 76, 2, 1, 45, 1, 5, 1, 57, 57, 6, 7],
+        [405, 2, 13, 0, 1, 0, 0, 78, 1, 1, 46, 1, 7, 1, 65, 65, 14, 7],
+        [
+            406, 2, 123, 0, 1, 0, 0, 78, 1, 1, 59, 1, 10, 1, 121, 121, 121, 7,
+        ],
+        [
+            407, 2, 130, 0, 1, 0, 0, 78, 1, 1, 60, 1, 11, 1, 128, 128, 128, 7,
+        ],
+        [
+            408, 2, 137, 0, 1, 0, 0, 78, 1, 1, 61, 1, 12, 1, 135, 135, 135, 7,
+        ],
+        [
+            409, 2, 144, 0, 1, 0, 0, 78, 1, 1, 62, 1, 13, 1, 142, 142, 142, 7,
+        ],
+        [
+            410, 2, 19, 0, 1, 0, 0, 78, 1, 1, 48, 1, 15, 1, 151, 151, 20, 7,
+        ],
+        [411, 2, 22, 0, 0, 0, 0, 0, 0, 1, 1, 1, 17, 1, 25, 161, 25, 7],
+        [
+            412, 2, 27, 0, 1, 69, 1, 76, 2, 1, 49, 1, 17, 1, 161, 161, 25, 7,
+        ],
+        [413, 2, 29, 0, 0, 0, 0, 0, 0, 1, 2, 1, 22, 1, 32, 210, 32, 7],
+        [
+            414, 2, 34, 0, 1, 69, 1, 76, 2, 1, 50, 1, 22, 1, 210, 210, 32, 7,
+        ],
+        [
+            415, 2, 36, 0, 1, 69, 1, 76, 2, 1, 51, 1, 25, 1, 227, 227, 37, 7,
+        ],
+        [
+            416, 2, 39, 0, 1, 69, 1, 76, 2, 1, 53, 1, 33, 1, 285, 285, 40, 7,
+        ],
+        [
+            417, 2, 45, 0, 1, 0, 0, 78, 1, 1, 58, 1, 41, 1, 327, 327, 46, 7,
+        ],
+    ],
+    types: &[
+        [51, 418],
+        [64, 419],
+        [5, 420],
+        [56, 421],
+        [422, 423],
+        [424, 425],
+        [426, 427],
+        [428, 429],
+        [305, 430],
+        [431, 432],
+        [433, 434],
+        [435, 436],
+        [17, 437],
+        [438, 439],
+        [114, 440],
+        [441, 442],
+        [443, 444],
+        [150, 445],
+        [446, 447],
+        [120, 448],
+        [24, 449],
+        [450, 451],
+        [127, 452],
+        [160, 453],
+        [454, 455],
+        [456, 457],
+        [458, 459],
+        [176, 460],
+        [461, 462],
+        [201, 463],
+        [194, 464],
+        [134, 465],
+        [466, 467],
+        [270, 468],
+        [31, 469],
+        [470, 471],
+        [215, 472],
+        [473, 474],
+        [226, 475],
+        [209, 476],
+        [477, 478],
+        [239, 479],
+        [244, 480],
+        [252, 481],
+        [262, 482],
+        [483, 484],
+        [257, 485],
+        [486, 487],
+        [488, 489],
+        [284, 490],
+        [292, 491],
+        [492, 493],
+        [494, 495],
+        [496, 497],
+        [498, 499],
+        [300, 500],
+        [501, 502],
+        [503, 504],
+        [505, 506],
+        [507, 508],
+        [314, 509],
+        [332, 510],
+        [326, 511],
+        [318, 512],
+        [513, 514],
+        [141, 515],
+        [516, 517],
+        [518, 519],
+        [340, 520],
+        [521, 522],
+    ],
+};
 
 pub static OMITTED_OPERATIONS: &[OmittedOperationSpec] = &[OmittedOperationSpec {
     name: "get_by_path",
@@ -4164,286 +1045,3 @@ pub static OMITTED_OPERATIONS: &[OmittedOperationSpec] = &[OmittedOperationSpec
     path: "/",
     reason: "path parameter `path` has no matching placeholder",
 }];
-
-pub static TYPES: &[TypeDef] = &[
-    TypeDef {
-        name: "ApiInfoResource",
-        ts: "export interface ApiInfoResource {\n  current?: string | null;\n  deprecated?: string[] | null;\n}",
-    },
-    TypeDef {
-        name: "AppProfileResource",
-        ts: "export interface AppProfileResource {\n  enableAutomaticSearch?: boolean;\n  enableInteractiveSearch?: boolean;\n  enableRss?: boolean;\n  id?: number;\n  minimumSeeders?: number;\n  name?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ApplicationBulkResource",
-        ts: "export interface ApplicationBulkResource {\n  applyTags?: ApplyTags;\n  ids?: number[] | null;\n  syncLevel?: ApplicationSyncLevel;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "ApplicationResource",
-        ts: "export interface ApplicationResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: ApplicationResource[] | null;\n  syncLevel?: ApplicationSyncLevel;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ApplicationSyncLevel",
-        ts: "export type ApplicationSyncLevel = \"disabled\" | \"addOnly\" | \"fullSync\";",
-    },
-    TypeDef {
-        name: "ApplyTags",
-        ts: "export type ApplyTags = \"add\" | \"remove\" | \"replace\";",
-    },
-    TypeDef {
-        name: "AuthenticationRequiredType",
-        ts: "export type AuthenticationRequiredType = \"enabled\" | \"disabledForLocalAddresses\";",
-    },
-    TypeDef {
-        name: "AuthenticationType",
-        ts: "export type AuthenticationType = \"none\" | \"basic\" | \"forms\" | \"external\";",
-    },
-    TypeDef {
-        name: "BackupResource",
-        ts: "export interface BackupResource {\n  id?: number;\n  name?: string | null;\n  path?: string | null;\n  size?: number;\n  time?: string;\n  type?: BackupType;\n}",
-    },
-    TypeDef {
-        name: "BackupType",
-        ts: "export type BackupType = \"scheduled\" | \"manual\" | \"update\";",
-    },
-    TypeDef {
-        name: "BookSearchParam",
-        ts: "export type BookSearchParam = \"q\" | \"title\" | \"author\" | \"publisher\" | \"genre\" | \"year\";",
-    },
-    TypeDef {
-        name: "CertificateValidationType",
-        ts: "export type CertificateValidationType = \"enabled\" | \"disabledForLocalAddresses\" | \"disabled\";",
-    },
-    TypeDef {
-        name: "Command",
-        ts: "export interface Command {\n  clientUserAgent?: string | null;\n  completionMessage?: string | null;\n  isExclusive?: boolean;\n  isTypeExclusive?: boolean;\n  lastExecutionTime?: string | null;\n  lastStartTime?: string | null;\n  name?: string | null;\n  requiresDiskAccess?: boolean;\n  sendUpdatesToClient?: boolean;\n  suppressMessages?: boolean;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
-    },
-    TypeDef {
-        name: "CommandPriority",
-        ts: "export type CommandPriority = \"normal\" | \"high\" | \"low\";",
-    },
-    TypeDef {
-        name: "CommandResource",
-        ts: "export interface CommandResource {\n  body?: Command;\n  clientUserAgent?: string | null;\n  commandName?: string | null;\n  duration?: string | null;\n  ended?: string | null;\n  exception?: string | null;\n  id?: number;\n  lastExecutionTime?: string | null;\n  message?: string | null;\n  name?: string | null;\n  priority?: CommandPriority;\n  queued?: string;\n  sendUpdatesToClient?: boolean;\n  started?: string | null;\n  stateChangeTime?: string | null;\n  status?: CommandStatus;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
-    },
-    TypeDef {
-        name: "CommandStatus",
-        ts: "export type CommandStatus = \"queued\" | \"started\" | \"completed\" | \"failed\" | \"aborted\" | \"cancelled\" | \"orphaned\";",
-    },
-    TypeDef {
-        name: "CommandTrigger",
-        ts: "export type CommandTrigger = \"unspecified\" | \"manual\" | \"scheduled\";",
-    },
-    TypeDef {
-        name: "CustomFilterResource",
-        ts: "export interface CustomFilterResource {\n  filters?: Record<string, unknown>[] | null;\n  id?: number;\n  label?: string | null;\n  type?: string | null;\n}",
-    },
-    TypeDef {
-        name: "DatabaseType",
-        ts: "export type DatabaseType = \"sqLite\" | \"postgreSQL\";",
-    },
-    TypeDef {
-        name: "DevelopmentConfigResource",
-        ts: "export interface DevelopmentConfigResource {\n  consoleLogLevel?: string | null;\n  filterSentryEvents?: boolean;\n  id?: number;\n  logIndexerResponse?: boolean;\n  logRotate?: number;\n  logSql?: boolean;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientBulkResource",
-        ts: "export interface DownloadClientBulkResource {\n  applyTags?: ApplyTags;\n  enable?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientCategory",
-        ts: "export interface DownloadClientCategory {\n  categories?: number[] | null;\n  clientCategory?: string | null;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientConfigResource",
-        ts: "export interface DownloadClientConfigResource {\n  id?: number;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientResource",
-        ts: "export interface DownloadClientResource {\n  categories?: DownloadClientCategory[] | null;\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: DownloadClientResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  supportsCategories?: boolean;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "DownloadProtocol",
-        ts: "export type DownloadProtocol = \"unknown\" | \"usenet\" | \"torrent\";",
-    },
-    TypeDef {
-        name: "Field",
-        ts: "export interface Field {\n  advanced?: boolean;\n  helpLink?: string | null;\n  helpText?: string | null;\n  helpTextWarning?: string | null;\n  hidden?: string | null;\n  isFloat?: boolean;\n  label?: string | null;\n  name?: string | null;\n  order?: number;\n  placeholder?: string | null;\n  privacy?: PrivacyLevel;\n  section?: string | null;\n  selectOptions?: SelectOption[] | null;\n  selectOptionsProviderAction?: string | null;\n  type?: string | null;\n  unit?: string | null;\n  value?: unknown | null;\n}",
-    },
-    TypeDef {
-        name: "HealthCheckResult",
-        ts: "export type HealthCheckResult = \"ok\" | \"notice\" | \"warning\" | \"error\";",
-    },
-    TypeDef {
-        name: "HealthResource",
-        ts: "export interface HealthResource {\n  id?: number;\n  message?: string | null;\n  source?: string | null;\n  type?: HealthCheckResult;\n  wikiUrl?: string | null;\n}",
-    },
-    TypeDef {
-        name: "HistoryEventType",
-        ts: "export type HistoryEventType = \"unknown\" | \"releaseGrabbed\" | \"indexerQuery\" | \"indexerRss\" | \"indexerAuth\" | \"indexerInfo\";",
-    },
-    TypeDef {
-        name: "HistoryResource",
-        ts: "export interface HistoryResource {\n  data?: Record<string, string | null> | null;\n  date?: string;\n  downloadId?: string | null;\n  eventType?: HistoryEventType;\n  id?: number;\n  indexerId?: number;\n  successful?: boolean;\n}",
-    },
-    TypeDef {
-        name: "HistoryResourcePagingResource",
-        ts: "export interface HistoryResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: HistoryResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "HostConfigResource",
-        ts: "export interface HostConfigResource {\n  analyticsEnabled?: boolean;\n  apiKey?: string | null;\n  applicationUrl?: string | null;\n  authenticationMethod?: AuthenticationType;\n  authenticationRequired?: AuthenticationRequiredType;\n  backupFolder?: string | null;\n  backupInterval?: number;\n  backupRetention?: number;\n  bindAddress?: string | null;\n  branch?: string | null;\n  certificateValidation?: CertificateValidationType;\n  consoleLogLevel?: string | null;\n  enableSsl?: boolean;\n  historyCleanupDays?: number;\n  id?: number;\n  instanceName?: string | null;\n  launchBrowser?: boolean;\n  logLevel?: string | null;\n  logSizeLimit?: number;\n  password?: string | null;\n  passwordConfirmation?: string | null;\n  port?: number;\n  proxyBypassFilter?: string | null;\n  proxyBypassLocalAddresses?: boolean;\n  proxyEnabled?: boolean;\n  proxyHostname?: string | null;\n  proxyPassword?: string | null;\n  proxyPort?: number;\n  proxyType?: ProxyType;\n  proxyUsername?: string | null;\n  sslCertPassword?: string | null;\n  sslCertPath?: string | null;\n  sslPort?: number;\n  trustCgnatIpAddresses?: boolean;\n  updateAutomatically?: boolean;\n  updateMechanism?: UpdateMechanism;\n  updateScriptPath?: string | null;\n  urlBase?: string | null;\n  username?: string | null;\n}",
-    },
-    TypeDef {
-        name: "HostStatistics",
-        ts: "export interface HostStatistics {\n  host?: string | null;\n  numberOfGrabs?: number;\n  numberOfQueries?: number;\n}",
-    },
-    TypeDef {
-        name: "IActionResult",
-        ts: "export interface IActionResult {}",
-    },
-    TypeDef {
-        name: "IndexerBulkResource",
-        ts: "export interface IndexerBulkResource {\n  appProfileId?: number | null;\n  applyTags?: ApplyTags;\n  enable?: boolean | null;\n  ids?: number[] | null;\n  minimumSeeders?: number | null;\n  packSeedTime?: number | null;\n  preferMagnetUrl?: boolean | null;\n  priority?: number | null;\n  seedRatio?: number | null;\n  seedTime?: number | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerCapabilityResource",
-        ts: "export interface IndexerCapabilityResource {\n  bookSearchParams?: BookSearchParam[] | null;\n  categories?: IndexerCategory[] | null;\n  id?: number;\n  limitsDefault?: number | null;\n  limitsMax?: number | null;\n  movieSearchParams?: MovieSearchParam[] | null;\n  musicSearchParams?: MusicSearchParam[] | null;\n  searchParams?: SearchParam[] | null;\n  supportsRawSearch?: boolean;\n  tvSearchParams?: TvSearchParam[] | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerCategory",
-        ts: "export interface IndexerCategory {\n  description?: string | null;\n  id?: number;\n  name?: string | null;\n  subCategories?: IndexerCategory[] | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerPrivacy",
-        ts: "export type IndexerPrivacy = \"public\" | \"semiPrivate\" | \"private\";",
-    },
-    TypeDef {
-        name: "IndexerProxyResource",
-        ts: "export interface IndexerProxyResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  includeHealthWarnings?: boolean;\n  infoLink?: string | null;\n  link?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  onHealthIssue?: boolean;\n  presets?: IndexerProxyResource[] | null;\n  supportsOnHealthIssue?: boolean;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerResource",
-        ts: "export interface IndexerResource {\n  added?: string;\n  appProfileId?: number;\n  capabilities?: IndexerCapabilityResource;\n  configContract?: string | null;\n  definitionName?: string | null;\n  description?: string | null;\n  downloadClientId?: number;\n  enable?: boolean;\n  encoding?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  indexerUrls?: string[] | null;\n  infoLink?: string | null;\n  language?: string | null;\n  legacyUrls?: string[] | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: IndexerResource[] | null;\n  priority?: number;\n  privacy?: IndexerPrivacy;\n  protocol?: DownloadProtocol;\n  redirect?: boolean;\n  sortName?: string | null;\n  status?: IndexerStatusResource;\n  supportsPagination?: boolean;\n  supportsRedirect?: boolean;\n  supportsRss?: boolean;\n  supportsSearch?: boolean;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerStatistics",
-        ts: "export interface IndexerStatistics {\n  averageGrabResponseTime?: number;\n  averageResponseTime?: number;\n  indexerId?: number;\n  indexerName?: string | null;\n  numberOfAuthQueries?: number;\n  numberOfFailedAuthQueries?: number;\n  numberOfFailedGrabs?: number;\n  numberOfFailedQueries?: number;\n  numberOfFailedRssQueries?: number;\n  numberOfGrabs?: number;\n  numberOfQueries?: number;\n  numberOfRssQueries?: number;\n}",
-    },
-    TypeDef {
-        name: "IndexerStatsResource",
-        ts: "export interface IndexerStatsResource {\n  hosts?: HostStatistics[] | null;\n  id?: number;\n  indexers?: IndexerStatistics[] | null;\n  userAgents?: UserAgentStatistics[] | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerStatusResource",
-        ts: "export interface IndexerStatusResource {\n  disabledTill?: string | null;\n  id?: number;\n  indexerId?: number;\n  initialFailure?: string | null;\n  mostRecentFailure?: string | null;\n}",
-    },
-    TypeDef {
-        name: "LocalizationOption",
-        ts: "export interface LocalizationOption {\n  name?: string | null;\n  value?: string | null;\n}",
-    },
-    TypeDef {
-        name: "LogFileResource",
-        ts: "export interface LogFileResource {\n  contentsUrl?: string | null;\n  downloadUrl?: string | null;\n  filename?: string | null;\n  id?: number;\n  lastWriteTime?: string;\n}",
-    },
-    TypeDef {
-        name: "LogResource",
-        ts: "export interface LogResource {\n  exception?: string | null;\n  exceptionType?: string | null;\n  id?: number;\n  level?: string | null;\n  logger?: string | null;\n  message?: string | null;\n  method?: string | null;\n  time?: string;\n}",
-    },
-    TypeDef {
-        name: "LogResourcePagingResource",
-        ts: "export interface LogResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: LogResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "MovieSearchParam",
-        ts: "export type MovieSearchParam = \"q\" | \"imdbId\" | \"tmdbId\" | \"imdbTitle\" | \"imdbYear\" | \"traktId\" | \"genre\" | \"doubanId\" | \"year\";",
-    },
-    TypeDef {
-        name: "MusicSearchParam",
-        ts: "export type MusicSearchParam = \"q\" | \"album\" | \"artist\" | \"label\" | \"year\" | \"genre\" | \"track\";",
-    },
-    TypeDef {
-        name: "NotificationResource",
-        ts: "export interface NotificationResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  includeHealthWarnings?: boolean;\n  includeManualGrabs?: boolean;\n  infoLink?: string | null;\n  link?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  onApplicationUpdate?: boolean;\n  onGrab?: boolean;\n  onHealthIssue?: boolean;\n  onHealthRestored?: boolean;\n  presets?: NotificationResource[] | null;\n  supportsOnApplicationUpdate?: boolean;\n  supportsOnGrab?: boolean;\n  supportsOnHealthIssue?: boolean;\n  supportsOnHealthRestored?: boolean;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
-    },
-    TypeDef {
-        name: "PingResource",
-        ts: "export interface PingResource {\n  status?: string | null;\n}",
-    },
-    TypeDef {
-        name: "PrivacyLevel",
-        ts: "export type PrivacyLevel = \"normal\" | \"password\" | \"apiKey\" | \"userName\";",
-    },
-    TypeDef {
-        name: "ProviderMessage",
-        ts: "export interface ProviderMessage {\n  message?: string | null;\n  type?: ProviderMessageType;\n}",
-    },
-    TypeDef {
-        name: "ProviderMessageType",
-        ts: "export type ProviderMessageType = \"info\" | \"warning\" | \"error\";",
-    },
-    TypeDef {
-        name: "ProxyType",
-        ts: "export type ProxyType = \"http\" | \"socks4\" | \"socks5\";",
-    },
-    TypeDef {
-        name: "ReleaseResource",
-        ts: "export interface ReleaseResource {\n  age?: number;\n  ageHours?: number;\n  ageMinutes?: number;\n  categories?: IndexerCategory[] | null;\n  commentUrl?: string | null;\n  downloadClientId?: number | null;\n  downloadUrl?: string | null;\n  fileName?: string | null;\n  files?: number | null;\n  grabs?: number | null;\n  guid?: string | null;\n  id?: number;\n  imdbId?: number;\n  indexer?: string | null;\n  indexerFlags?: string[] | null;\n  indexerId?: number;\n  infoHash?: string | null;\n  infoUrl?: string | null;\n  leechers?: number | null;\n  magnetUrl?: string | null;\n  posterUrl?: string | null;\n  protocol?: DownloadProtocol;\n  publishDate?: string;\n  releaseHash?: string | null;\n  seeders?: number | null;\n  size?: number;\n  sortTitle?: string | null;\n  subGroup?: string | null;\n  title?: string | null;\n  tmdbId?: number;\n  tvMazeId?: number;\n  tvdbId?: number;\n}",
-    },
-    TypeDef {
-        name: "RuntimeMode",
-        ts: "export type RuntimeMode = \"console\" | \"service\" | \"tray\";",
-    },
-    TypeDef {
-        name: "SearchParam",
-        ts: "export type SearchParam = \"q\";",
-    },
-    TypeDef {
-        name: "SelectOption",
-        ts: "export interface SelectOption {\n  hint?: string | null;\n  name?: string | null;\n  order?: number;\n  parentValue?: number | null;\n  value?: number;\n}",
-    },
-    TypeDef {
-        name: "SortDirection",
-        ts: "export type SortDirection = \"default\" | \"ascending\" | \"descending\";",
-    },
-    TypeDef {
-        name: "SystemResource",
-        ts: "export interface SystemResource {\n  appData?: string | null;\n  appName?: string | null;\n  authentication?: AuthenticationType;\n  branch?: string | null;\n  buildTime?: string;\n  databaseType?: DatabaseType;\n  databaseVersion?: string | null;\n  instanceName?: string | null;\n  isAdmin?: boolean;\n  isDebug?: boolean;\n  isDocker?: boolean;\n  isLinux?: boolean;\n  isNetCore?: boolean;\n  isOsx?: boolean;\n  isProduction?: boolean;\n  isUserInteractive?: boolean;\n  isWindows?: boolean;\n  migrationVersion?: number;\n  mode?: RuntimeMode;\n  osName?: string | null;\n  osVersion?: string | null;\n  packageAuthor?: string | null;\n  packageUpdateMechanism?: UpdateMechanism;\n  packageUpdateMechanismMessage?: string | null;\n  packageVersion?: string | null;\n  runtimeName?: string | null;\n  runtimeVersion?: string | null;\n  startTime?: string;\n  startupPath?: string | null;\n  urlBase?: string | null;\n  version?: string | null;\n}",
-    },
-    TypeDef {
-        name: "TagDetailsResource",
-        ts: "export interface TagDetailsResource {\n  applicationIds?: number[] | null;\n  id?: number;\n  indexerIds?: number[] | null;\n  indexerProxyIds?: number[] | null;\n  label?: string | null;\n  notificationIds?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "TagResource",
-        ts: "export interface TagResource {\n  id?: number;\n  label?: string | null;\n}",
-    },
-    TypeDef {
-        name: "TaskResource",
-        ts: "export interface TaskResource {\n  id?: number;\n  interval?: number;\n  lastDuration?: string;\n  lastExecution?: string;\n  lastStartTime?: string;\n  name?: string | null;\n  nextExecution?: string;\n  taskName?: string | null;\n}",
-    },
-    TypeDef {
-        name: "TvSearchParam",
-        ts: "export type TvSearchParam = \"q\" | \"season\" | \"ep\" | \"imdbId\" | \"tvdbId\" | \"rId\" | \"tvMazeId\" | \"traktId\" | \"tmdbId\" | \"doubanId\" | \"genre\" | \"year\";",
-    },
-    TypeDef {
-        name: "UiConfigResource",
-        ts: "export interface UiConfigResource {\n  calendarWeekColumnHeader?: string | null;\n  enableColorImpairedMode?: boolean;\n  firstDayOfWeek?: number;\n  id?: number;\n  longDateFormat?: string | null;\n  shortDateFormat?: string | null;\n  showRelativeDates?: boolean;\n  theme?: string | null;\n  timeFormat?: string | null;\n  uiLanguage?: string | null;\n}",
-    },
-    TypeDef {
-        name: "UpdateChanges",
-        ts: "export interface UpdateChanges {\n  fixed?: string[] | null;\n  new?: string[] | null;\n}",
-    },
-    TypeDef {
-        name: "UpdateMechanism",
-        ts: "export type UpdateMechanism = \"builtIn\" | \"script\" | \"external\" | \"apt\" | \"docker\";",
-    },
-    TypeDef {
-        name: "UpdateResource",
-        ts: "export interface UpdateResource {\n  branch?: string | null;\n  changes?: UpdateChanges;\n  fileName?: string | null;\n  hash?: string | null;\n  id?: number;\n  installable?: boolean;\n  installed?: boolean;\n  installedOn?: string | null;\n  latest?: boolean;\n  releaseDate?: string;\n  url?: string | null;\n  version?: string | null;\n}",
-    },
-    TypeDef {
-        name: "UserAgentStatistics",
-        ts: "export interface UserAgentStatistics {\n  numberOfGrabs?: number;\n  numberOfQueries?: number;\n  userAgent?: string | null;\n}",
-    },
-];
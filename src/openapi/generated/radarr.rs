@@ -1,8770 +1,2119 @@
 //! GENERATED by `cargo xtask gen-openapi` from specs/radarr.openapi.* -- DO NOT EDIT.
 //!
-//! 236 supported operations, 1 omitted operations, 137 component types.
+//! 236 supported operations, 1 omitted operations, 137 component types,
+//! 931 distinct strings. `TABLE.operations` is sorted by name; `find_operation`
+//! binary-searches the decoded slice.
 #![allow(clippy::all)]
-use crate::openapi::{
-    BodyEncoding, HttpMethod, OmittedOperationSpec, OperationSpec, ParameterLocation,
-    ParameterSpec, ParameterStyle, RepresentationSpec, RequestBodySpec, TypeDef,
-};
+use crate::openapi::{CompactTable, HttpMethod, OmittedOperationSpec};
 
-pub static OPERATIONS: &[OperationSpec] = &[
-    OperationSpec {
-        name: "delete_autotagging_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/autotagging/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_blocklist_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/blocklist/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/BlocklistBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/BlocklistBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/BlocklistBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("BlocklistBulkResource"),
-        response_type: None,
-        tag: "Blocklist",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_blocklist_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/blocklist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Blocklist",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_command_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/command/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_customfilter_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/customfilter/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_customformat_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/customformat/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("CustomFormatBulkResource"),
-        response_type: None,
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_customformat_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/customformat/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_delayprofile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/delayprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_downloadclient_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/downloadclient/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DownloadClientBulkResource"),
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_downloadclient_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_exclusions_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/exclusions/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("ImportListExclusionBulkResource"),
-        response_type: None,
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_exclusions_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/exclusions/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_importlist_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/importlist/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ImportListBulkResource"),
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_importlist_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/importlist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_indexer_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/indexer/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerBulkResource"),
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_indexer_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_metadata_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/metadata/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_movie_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/movie/{id}",
-        path_params: &["id"],
-        query_params: &["addImportExclusion", "deleteFiles"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "addImportExclusion",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "deleteFiles",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Movie",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_movie_editor",
-        method: HttpMethod::Delete,
-        path: "/api/v3/movie/editor",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/MovieEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/MovieEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/MovieEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("MovieEditorResource"),
-        response_type: None,
-        tag: "MovieEditor",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_moviefile_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/moviefile/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieFileListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("MovieFileListResource"),
-        response_type: None,
-        tag: "MovieFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_moviefile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/moviefile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "MovieFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_notification_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/notification/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_qualityprofile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/qualityprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_queue_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/queue/bulk",
-        path_params: &[],
-        query_params: &[
-            "blocklist",
-            "changeCategory",
-            "removeFromClient",
-            "skipRedownload",
-        ],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "blocklist",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "changeCategory",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "removeFromClient",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "skipRedownload",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("QueueBulkResource"),
-        response_type: None,
-        tag: "Queue",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_queue_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/queue/{id}",
-        path_params: &["id"],
-        query_params: &[
-            "blocklist",
-            "changeCategory",
-            "removeFromClient",
-            "skipRedownload",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "blocklist",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "changeCategory",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "removeFromClient",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "skipRedownload",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Queue",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_releaseprofile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/releaseprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_remotepathmapping_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/remotepathmapping/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_rootfolder_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/rootfolder/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "RootFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_system_backup_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/system/backup/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_tag_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/tag/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get",
-        method: HttpMethod::Get,
-        path: "/api",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ApiInfoResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ApiInfoResource"),
-        tag: "ApiInfo",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_alttitle",
-        method: HttpMethod::Get,
-        path: "/api/v3/alttitle",
-        path_params: &[],
-        query_params: &["movieId", "movieMetadataId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieMetadataId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/AlternativeTitleResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/AlternativeTitleResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/AlternativeTitleResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("AlternativeTitleResource"),
-        tag: "AlternativeTitle",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_alttitle_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/alttitle/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AlternativeTitleResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AlternativeTitleResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/AlternativeTitleResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("AlternativeTitleResource"),
-        tag: "AlternativeTitle",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_autotagging",
-        method: HttpMethod::Get,
-        path: "/api/v3/autotagging",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/AutoTaggingResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("AutoTaggingResource"),
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_autotagging_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/autotagging/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("AutoTaggingResource"),
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_autotagging_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/autotagging/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_blocklist",
-        method: HttpMethod::Get,
-        path: "/api/v3/blocklist",
-        path_params: &[],
-        query_params: &[
-            "movieIds",
-            "page",
-            "pageSize",
-            "protocols",
-            "sortDirection",
-            "sortKey",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "movieIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "protocols",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DownloadProtocol\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/BlocklistResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("BlocklistResourcePagingResource"),
-        tag: "Blocklist",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_blocklist_movie",
-        method: HttpMethod::Get,
-        path: "/api/v3/blocklist/movie",
-        path_params: &[],
-        query_params: &["movieId"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "movieId",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/BlocklistResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/BlocklistResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/BlocklistResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("BlocklistResource"),
-        tag: "Blocklist",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_by_path_2",
-        method: HttpMethod::Get,
-        path: "/{path}",
-        path_params: &["path"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"^(?!(api|feed)/).*\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "StaticResource",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_calendar",
-        method: HttpMethod::Get,
-        path: "/api/v3/calendar",
-        path_params: &[],
-        query_params: &["end", "start", "tags", "unmonitored"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "end",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"date-time\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "start",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"date-time\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tags",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "unmonitored",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MovieResource"),
-        tag: "Calendar",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_collection",
-        method: HttpMethod::Get,
-        path: "/api/v3/collection",
-        path_params: &[],
-        query_params: &["tmdbId"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "tmdbId",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/CollectionResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CollectionResource"),
-        tag: "Collection",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_collection_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/collection/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CollectionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CollectionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CollectionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("CollectionResource"),
-        tag: "Collection",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_command",
-        method: HttpMethod::Get,
-        path: "/api/v3/command",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/CommandResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/CommandResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/CommandResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("CommandResource"),
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_command_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/command/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("CommandResource"),
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_downloadclient",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/downloadclient",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientConfigResource"),
-        tag: "DownloadClientConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_downloadclient_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("DownloadClientConfigResource"),
-        tag: "DownloadClientConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_host",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/host",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("HostConfigResource"),
-        tag: "HostConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_host_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/host/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("HostConfigResource"),
-        tag: "HostConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_importlist",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/importlist",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListConfigResource"),
-        tag: "ImportListConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_importlist_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/importlist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("ImportListConfigResource"),
-        tag: "ImportListConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_indexer",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/indexer",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerConfigResource"),
-        tag: "IndexerConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_indexer_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("IndexerConfigResource"),
-        tag: "IndexerConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_mediamanagement",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/mediamanagement",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MediaManagementConfigResource"),
-        tag: "MediaManagementConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_mediamanagement_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/mediamanagement/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("MediaManagementConfigResource"),
-        tag: "MediaManagementConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_metadata",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/metadata",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MetadataConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MetadataConfigResource"),
-        tag: "MetadataConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_metadata_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/metadata/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("MetadataConfigResource"),
-        tag: "MetadataConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_naming",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/naming",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("NamingConfigResource"),
-        tag: "NamingConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_naming_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/naming/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("NamingConfigResource"),
-        tag: "NamingConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_naming_examples",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/naming/examples",
-        path_params: &[],
-        query_params: &[
-            "colonReplacementFormat",
-            "id",
-            "movieFolderFormat",
-            "renameMovies",
-            "replaceIllegalCharacters",
-            "resourceName",
-            "standardMovieFormat",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "colonReplacementFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/ColonReplacementFormat\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieFolderFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "renameMovies",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "replaceIllegalCharacters",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "resourceName",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "standardMovieFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "NamingConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_ui",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/ui",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("UiConfigResource"),
-        tag: "UiConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_ui_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/ui/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("UiConfigResource"),
-        tag: "UiConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_content_by_path",
-        method: HttpMethod::Get,
-        path: "/content/{path}",
-        path_params: &["path"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"^(?!api/).*\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "StaticResource",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_credit",
-        method: HttpMethod::Get,
-        path: "/api/v3/credit",
-        path_params: &[],
-        query_params: &["movieId", "movieMetadataId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieMetadataId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Credit",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_credit_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/credit/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CreditResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CreditResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CreditResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("CreditResource"),
-        tag: "Credit",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customfilter",
-        method: HttpMethod::Get,
-        path: "/api/v3/customfilter",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/CustomFilterResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/CustomFilterResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/CustomFilterResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customfilter_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/customfilter/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customformat",
-        method: HttpMethod::Get,
-        path: "/api/v3/customformat",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/CustomFormatResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customformat_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/customformat/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customformat_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/customformat/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_delayprofile",
-        method: HttpMethod::Get,
-        path: "/api/v3/delayprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_delayprofile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/delayprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_diskspace",
-        method: HttpMethod::Get,
-        path: "/api/v3/diskspace",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DiskSpaceResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DiskSpaceResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DiskSpaceResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("DiskSpaceResource"),
-        tag: "DiskSpace",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_downloadclient",
-        method: HttpMethod::Get,
-        path: "/api/v3/downloadclient",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DownloadClientResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_downloadclient_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_downloadclient_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/downloadclient/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DownloadClientResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_exclusions",
-        method: HttpMethod::Get,
-        path: "/api/v3/exclusions",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListExclusionResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_exclusions_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/exclusions/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("ImportListExclusionResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_exclusions_paged",
-        method: HttpMethod::Get,
-        path: "/api/v3/exclusions/paged",
-        path_params: &[],
-        query_params: &["page", "pageSize", "sortDirection", "sortKey"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListExclusionResourcePagingResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_extrafile",
-        method: HttpMethod::Get,
-        path: "/api/v3/extrafile",
-        path_params: &[],
-        query_params: &["movieId"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "movieId",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ExtraFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ExtraFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ExtraFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("ExtraFileResource"),
-        tag: "ExtraFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_feed_calendar_radarr_ics",
-        method: HttpMethod::Get,
-        path: "/feed/v3/calendar/radarr.ics",
-        path_params: &[],
-        query_params: &[
-            "futureDays",
-            "pastDays",
-            "releaseTypes",
-            "tags",
-            "unmonitored",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "futureDays",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":28,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pastDays",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":7,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "releaseTypes",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/CalendarReleaseType\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tags",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "unmonitored",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "CalendarFeed",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_filesystem",
-        method: HttpMethod::Get,
-        path: "/api/v3/filesystem",
-        path_params: &[],
-        query_params: &["allowFoldersWithoutTrailingSlashes", "includeFiles", "path"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "allowFoldersWithoutTrailingSlashes",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeFiles",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "path",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "FileSystem",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_filesystem_mediafiles",
-        method: HttpMethod::Get,
-        path: "/api/v3/filesystem/mediafiles",
-        path_params: &[],
-        query_params: &["path"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "FileSystem",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_filesystem_type",
-        method: HttpMethod::Get,
-        path: "/api/v3/filesystem/type",
-        path_params: &[],
-        query_params: &["path"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "FileSystem",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_health",
-        method: HttpMethod::Get,
-        path: "/api/v3/health",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/HealthResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/HealthResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/HealthResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("HealthResource"),
-        tag: "Health",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_history",
-        method: HttpMethod::Get,
-        path: "/api/v3/history",
-        path_params: &[],
-        query_params: &[
-            "downloadId",
-            "eventType",
-            "includeMovie",
-            "languages",
-            "movieIds",
-            "page",
-            "pageSize",
-            "quality",
-            "sortDirection",
-            "sortKey",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "downloadId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "eventType",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeMovie",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "languages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "quality",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/HistoryResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HistoryResourcePagingResource"),
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_history_movie",
-        method: HttpMethod::Get,
-        path: "/api/v3/history/movie",
-        path_params: &[],
-        query_params: &["eventType", "includeMovie", "movieId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "eventType",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/MovieHistoryEventType\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeMovie",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/HistoryResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HistoryResource"),
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_history_since",
-        method: HttpMethod::Get,
-        path: "/api/v3/history/since",
-        path_params: &[],
-        query_params: &["date", "eventType", "includeMovie"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "date",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"date-time\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "eventType",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/MovieHistoryEventType\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeMovie",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/HistoryResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HistoryResource"),
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlist",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlist",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ImportListResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlist_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlist_movie",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlist/movie",
-        path_params: &[],
-        query_params: &[
-            "includePopular",
-            "includeRecommendations",
-            "includeTrending",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "includePopular",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeRecommendations",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeTrending",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ImportListMovies",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlist_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlist/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ImportListResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer",
-        method: HttpMethod::Get,
-        path: "/api/v3/indexer",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/indexer/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexerflag",
-        method: HttpMethod::Get,
-        path: "/api/v3/indexerflag",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerFlagResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerFlagResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerFlagResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("IndexerFlagResource"),
-        tag: "IndexerFlag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_language",
-        method: HttpMethod::Get,
-        path: "/api/v3/language",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LanguageResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LanguageResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LanguageResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("LanguageResource"),
-        tag: "Language",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_language_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/language/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/LanguageResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/LanguageResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/LanguageResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("LanguageResource"),
-        tag: "Language",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_localization",
-        method: HttpMethod::Get,
-        path: "/api/v3/localization",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"type\":\"string\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"type\":\"string\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"type\":\"string\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: None,
-        tag: "Localization",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_localization_language",
-        method: HttpMethod::Get,
-        path: "/api/v3/localization/language",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LocalizationLanguageResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LocalizationLanguageResource"),
-        tag: "Localization",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log",
-        method: HttpMethod::Get,
-        path: "/api/v3/log",
-        path_params: &[],
-        query_params: &["level", "page", "pageSize", "sortDirection", "sortKey"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "level",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LogResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LogResourcePagingResource"),
-        tag: "Log",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file",
-        method: HttpMethod::Get,
-        path: "/api/v3/log/file",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("LogFileResource"),
-        tag: "LogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file_by_filename",
-        method: HttpMethod::Get,
-        path: "/api/v3/log/file/{filename}",
-        path_params: &["filename"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "filename",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"[-.a-zA-Z0-9]+?\\\\.txt\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "LogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file_update",
-        method: HttpMethod::Get,
-        path: "/api/v3/log/file/update",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("LogFileResource"),
-        tag: "UpdateLogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file_update_by_filename",
-        method: HttpMethod::Get,
-        path: "/api/v3/log/file/update/{filename}",
-        path_params: &["filename"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "filename",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"[-.a-zA-Z0-9]+?\\\\.txt\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "UpdateLogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_login",
-        method: HttpMethod::Get,
-        path: "/login",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "StaticResource",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_logout",
-        method: HttpMethod::Get,
-        path: "/logout",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Authentication",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_manualimport",
-        method: HttpMethod::Get,
-        path: "/api/v3/manualimport",
-        path_params: &[],
-        query_params: &["downloadId", "filterExistingFiles", "folder", "movieId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "downloadId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "filterExistingFiles",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "folder",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ManualImportResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ManualImportResource"),
-        tag: "ManualImport",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_mediacover_by_filename_movie_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/mediacover/{movieId}/{filename}",
-        path_params: &["filename", "movieId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "filename",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"pattern\":\"(.+)\\\\.(jpg|png|gif)\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "MediaCover",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_metadata",
-        method: HttpMethod::Get,
-        path: "/api/v3/metadata",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/MetadataResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_metadata_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/metadata/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_metadata_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/metadata/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/MetadataResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_movie",
-        method: HttpMethod::Get,
-        path: "/api/v3/movie",
-        path_params: &[],
-        query_params: &["excludeLocalCovers", "languageId", "tmdbId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "excludeLocalCovers",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "languageId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tmdbId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("MovieResource"),
-        tag: "Movie",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_movie_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/movie/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/MovieResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("MovieResource"),
-        tag: "Movie",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_movie_folder_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/movie/{id}/folder",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "MovieFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_movie_lookup",
-        method: HttpMethod::Get,
-        path: "/api/v3/movie/lookup",
-        path_params: &[],
-        query_params: &["term"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "term",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MovieResource"),
-        tag: "MovieLookup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_movie_lookup_imdb",
-        method: HttpMethod::Get,
-        path: "/api/v3/movie/lookup/imdb",
-        path_params: &[],
-        query_params: &["imdbId"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "imdbId",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MovieResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MovieResource"),
-        tag: "MovieLookup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_movie_lookup_tmdb",
-        method: HttpMethod::Get,
-        path: "/api/v3/movie/lookup/tmdb",
-        path_params: &[],
-        query_params: &["tmdbId"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "tmdbId",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MovieResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MovieResource"),
-        tag: "MovieLookup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_moviefile",
-        method: HttpMethod::Get,
-        path: "/api/v3/moviefile",
-        path_params: &[],
-        query_params: &["movieFileIds", "movieId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "movieFileIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieFileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MovieFileResource"),
-        tag: "MovieFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_moviefile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/moviefile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieFileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieFileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/MovieFileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("MovieFileResource"),
-        tag: "MovieFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_notification",
-        method: HttpMethod::Get,
-        path: "/api/v3/notification",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/NotificationResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_notification_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/notification/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_notification_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/notification/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/NotificationResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_parse",
-        method: HttpMethod::Get,
-        path: "/api/v3/parse",
-        path_params: &[],
-        query_params: &["title"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "title",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ParseResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ParseResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ParseResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("ParseResource"),
-        tag: "Parse",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_ping",
-        method: HttpMethod::Get,
-        path: "/ping",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PingResource"),
-        tag: "Ping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualitydefinition",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualitydefinition",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QualityDefinitionResource"),
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualitydefinition_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualitydefinition/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QualityDefinitionResource"),
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualitydefinition_limits",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualitydefinition/limits",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionLimitsResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionLimitsResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionLimitsResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QualityDefinitionLimitsResource"),
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualityprofile",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualityprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualityprofile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualityprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualityprofile_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualityprofile/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfileSchema",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_queue",
-        method: HttpMethod::Get,
-        path: "/api/v3/queue",
-        path_params: &[],
-        query_params: &[
-            "includeMovie",
-            "includeUnknownMovieItems",
-            "languages",
-            "movieIds",
-            "page",
-            "pageSize",
-            "protocol",
-            "quality",
-            "sortDirection",
-            "sortKey",
-            "status",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "includeMovie",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeUnknownMovieItems",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "languages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "protocol",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadProtocol\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "quality",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "status",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QueueStatus\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/QueueResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("QueueResourcePagingResource"),
-        tag: "Queue",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_queue_details",
-        method: HttpMethod::Get,
-        path: "/api/v3/queue/details",
-        path_params: &[],
-        query_params: &["includeMovie", "movieId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "includeMovie",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "movieId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QueueResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QueueResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QueueResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QueueResource"),
-        tag: "QueueDetails",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_queue_status",
-        method: HttpMethod::Get,
-        path: "/api/v3/queue/status",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QueueStatusResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QueueStatusResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QueueStatusResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QueueStatusResource"),
-        tag: "QueueStatus",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_release",
-        method: HttpMethod::Get,
-        path: "/api/v3/release",
-        path_params: &[],
-        query_params: &["movieId"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "movieId",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ReleaseResource"),
-        tag: "Release",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_releaseprofile",
-        method: HttpMethod::Get,
-        path: "/api/v3/releaseprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("ReleaseProfileResource"),
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_releaseprofile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/releaseprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("ReleaseProfileResource"),
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_remotepathmapping",
-        method: HttpMethod::Get,
-        path: "/api/v3/remotepathmapping",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("RemotePathMappingResource"),
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_remotepathmapping_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/remotepathmapping/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("RemotePathMappingResource"),
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_rename",
-        method: HttpMethod::Get,
-        path: "/api/v3/rename",
-        path_params: &[],
-        query_params: &["movieId"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "movieId",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/RenameMovieResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/RenameMovieResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/RenameMovieResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("RenameMovieResource"),
-        tag: "RenameMovie",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_rootfolder",
-        method: HttpMethod::Get,
-        path: "/api/v3/rootfolder",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/RootFolderResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/RootFolderResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/RootFolderResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("RootFolderResource"),
-        tag: "RootFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_rootfolder_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/rootfolder/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("RootFolderResource"),
-        tag: "RootFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_backup",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/backup",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("BackupResource"),
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_routes",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/routes",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_routes_duplicate",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/routes/duplicate",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_status",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/status",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/SystemResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/SystemResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/SystemResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("SystemResource"),
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_task",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/task",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("TaskResource"),
-        tag: "Task",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_task_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/task/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TaskResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TaskResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/TaskResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("TaskResource"),
-        tag: "Task",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag",
-        method: HttpMethod::Get,
-        path: "/api/v3/tag",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/tag/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag_detail",
-        method: HttpMethod::Get,
-        path: "/api/v3/tag/detail",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagDetailsResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagDetailsResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagDetailsResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("TagDetailsResource"),
-        tag: "TagDetails",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag_detail_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/tag/detail/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagDetailsResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagDetailsResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/TagDetailsResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("TagDetailsResource"),
-        tag: "TagDetails",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_update",
-        method: HttpMethod::Get,
-        path: "/api/v3/update",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/UpdateResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/UpdateResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/UpdateResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("UpdateResource"),
-        tag: "Update",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_wanted_cutoff",
-        method: HttpMethod::Get,
-        path: "/api/v3/wanted/cutoff",
-        path_params: &[],
-        query_params: &["monitored", "page", "pageSize", "sortDirection", "sortKey"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "monitored",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MovieResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MovieResourcePagingResource"),
-        tag: "Cutoff",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_wanted_missing",
-        method: HttpMethod::Get,
-        path: "/api/v3/wanted/missing",
-        path_params: &[],
-        query_params: &["monitored", "page", "pageSize", "sortDirection", "sortKey"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "monitored",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MovieResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MovieResourcePagingResource"),
-        tag: "Missing",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_autotagging",
-        method: HttpMethod::Post,
-        path: "/api/v3/autotagging",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("AutoTaggingResource"),
-        response_type: Some("AutoTaggingResource"),
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_command",
-        method: HttpMethod::Post,
-        path: "/api/v3/command",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("CommandResource"),
-        response_type: Some("CommandResource"),
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_customfilter",
-        method: HttpMethod::Post,
-        path: "/api/v3/customfilter",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("CustomFilterResource"),
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_customformat",
-        method: HttpMethod::Post,
-        path: "/api/v3/customformat",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("CustomFormatResource"),
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_delayprofile",
-        method: HttpMethod::Post,
-        path: "/api/v3/delayprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("DelayProfileResource"),
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient",
-        method: HttpMethod::Post,
-        path: "/api/v3/downloadclient",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientResource"),
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/downloadclient/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DownloadClientResource"),
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/downloadclient/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DownloadClientResource"),
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/downloadclient/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_exclusions",
-        method: HttpMethod::Post,
-        path: "/api/v3/exclusions",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ImportListExclusionResource"),
-        response_type: Some("ImportListExclusionResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_exclusions_bulk",
-        method: HttpMethod::Post,
-        path: "/api/v3/exclusions/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("ImportListExclusionResource"),
-        response_type: None,
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_history_failed_by_id",
-        method: HttpMethod::Post,
-        path: "/api/v3/history/failed/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlist",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlist",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ImportListResource"),
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlist_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlist/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ImportListResource"),
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlist_movie",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlist/movie",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("MovieResource"),
-        response_type: None,
-        tag: "ImportListMovies",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlist_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlist/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ImportListResource"),
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlist_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlist/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer",
-        method: HttpMethod::Post,
-        path: "/api/v3/indexer",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerResource"),
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/indexer/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerResource"),
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/indexer/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerResource"),
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/indexer/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_login",
-        method: HttpMethod::Post,
-        path: "/login",
-        path_params: &[],
-        query_params: &["returnUrl"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "returnUrl",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "multipart/form-data",
-                encoding: BodyEncoding::Multipart,
-                schema: "{\"properties\":{\"password\":{\"type\":\"string\"},\"rememberMe\":{\"type\":\"string\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"}",
-                encoding_metadata: "{\"password\":{\"style\":\"form\"},\"rememberMe\":{\"style\":\"form\"},\"username\":{\"style\":\"form\"}}",
-            }],
-        }),
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Authentication",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_manualimport",
-        method: HttpMethod::Post,
-        path: "/api/v3/manualimport",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ManualImportReprocessResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ManualImportReprocessResource"),
-        response_type: None,
-        tag: "ManualImport",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_metadata",
-        method: HttpMethod::Post,
-        path: "/api/v3/metadata",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("MetadataResource"),
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_metadata_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/metadata/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("MetadataResource"),
-        response_type: None,
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_metadata_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/metadata/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("MetadataResource"),
-        response_type: None,
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_metadata_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/metadata/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_movie",
-        method: HttpMethod::Post,
-        path: "/api/v3/movie",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MovieResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("MovieResource"),
-        response_type: Some("MovieResource"),
-        tag: "Movie",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_movie_import",
-        method: HttpMethod::Post,
-        path: "/api/v3/movie/import",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("MovieResource"),
-        response_type: Some("MovieResource"),
-        tag: "MovieImport",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification",
-        method: HttpMethod::Post,
-        path: "/api/v3/notification",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("NotificationResource"),
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/notification/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("NotificationResource"),
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/notification/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("NotificationResource"),
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/notification/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_qualityprofile",
-        method: HttpMethod::Post,
-        path: "/api/v3/qualityprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("QualityProfileResource"),
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_queue_grab_bulk",
-        method: HttpMethod::Post,
-        path: "/api/v3/queue/grab/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("QueueBulkResource"),
-        response_type: None,
-        tag: "QueueAction",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_queue_grab_by_id",
-        method: HttpMethod::Post,
-        path: "/api/v3/queue/grab/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "QueueAction",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_release",
-        method: HttpMethod::Post,
-        path: "/api/v3/release",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ReleaseResource"),
-        response_type: None,
-        tag: "Release",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_release_push",
-        method: HttpMethod::Post,
-        path: "/api/v3/release/push",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ReleaseResource"),
-        response_type: Some("ReleaseResource"),
-        tag: "ReleasePush",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_releaseprofile",
-        method: HttpMethod::Post,
-        path: "/api/v3/releaseprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ReleaseProfileResource"),
-        response_type: Some("ReleaseProfileResource"),
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_remotepathmapping",
-        method: HttpMethod::Post,
-        path: "/api/v3/remotepathmapping",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("RemotePathMappingResource"),
-        response_type: Some("RemotePathMappingResource"),
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_rootfolder",
-        method: HttpMethod::Post,
-        path: "/api/v3/rootfolder",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("RootFolderResource"),
-        response_type: Some("RootFolderResource"),
-        tag: "RootFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_backup_restore_by_id",
-        method: HttpMethod::Post,
-        path: "/api/v3/system/backup/restore/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_backup_restore_upload",
-        method: HttpMethod::Post,
-        path: "/api/v3/system/backup/restore/upload",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "multipart/form-data",
-                encoding: BodyEncoding::Multipart,
-                schema: "{\"type\":\"object\",\"required\":[\"file\"],\"properties\":{\"file\":{\"type\":\"string\",\"format\":\"binary\"}}}",
-                encoding_metadata: "{\"file\":{\"contentType\":\"application/zip\"}}",
-            }],
-        }),
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_restart",
-        method: HttpMethod::Post,
-        path: "/api/v3/system/restart",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_shutdown",
-        method: HttpMethod::Post,
-        path: "/api/v3/system/shutdown",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_tag",
-        method: HttpMethod::Post,
-        path: "/api/v3/tag",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("TagResource"),
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_autotagging_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/autotagging/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("AutoTaggingResource"),
-        response_type: Some("AutoTaggingResource"),
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_collection",
-        method: HttpMethod::Put,
-        path: "/api/v3/collection",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CollectionUpdateResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("CollectionUpdateResource"),
-        response_type: None,
-        tag: "Collection",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_collection_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/collection/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CollectionResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CollectionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CollectionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CollectionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("CollectionResource"),
-        response_type: Some("CollectionResource"),
-        tag: "Collection",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_downloadclient_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("DownloadClientConfigResource"),
-        response_type: Some("DownloadClientConfigResource"),
-        tag: "DownloadClientConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_host_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/host/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("HostConfigResource"),
-        response_type: Some("HostConfigResource"),
-        tag: "HostConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_importlist_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/importlist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ImportListConfigResource"),
-        response_type: Some("ImportListConfigResource"),
-        tag: "ImportListConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_indexer_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("IndexerConfigResource"),
-        response_type: Some("IndexerConfigResource"),
-        tag: "IndexerConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_mediamanagement_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/mediamanagement/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("MediaManagementConfigResource"),
-        response_type: Some("MediaManagementConfigResource"),
-        tag: "MediaManagementConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_metadata_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/metadata/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("MetadataConfigResource"),
-        response_type: Some("MetadataConfigResource"),
-        tag: "MetadataConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_naming_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/naming/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("NamingConfigResource"),
-        response_type: Some("NamingConfigResource"),
-        tag: "NamingConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_ui_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/ui/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("UiConfigResource"),
-        response_type: Some("UiConfigResource"),
-        tag: "UiConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_customfilter_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/customfilter/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("CustomFilterResource"),
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_customformat_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/customformat/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("CustomFormatBulkResource"),
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_customformat_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/customformat/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("CustomFormatResource"),
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_delayprofile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/delayprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("DelayProfileResource"),
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_delayprofile_reorder_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/delayprofile/reorder/{id}",
-        path_params: &["id"],
-        query_params: &["after"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "after",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_downloadclient_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/downloadclient/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientBulkResource"),
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_downloadclient_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientResource"),
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_exclusions_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/exclusions/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ImportListExclusionResource"),
-        response_type: Some("ImportListExclusionResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_importlist_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/importlist/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ImportListBulkResource"),
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_importlist_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/importlist/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ImportListResource"),
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_indexer_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/indexer/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerBulkResource"),
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_indexer_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/indexer/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerResource"),
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_metadata_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/metadata/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("MetadataResource"),
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_movie_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/movie/{id}",
-        path_params: &["id"],
-        query_params: &["moveFiles"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "moveFiles",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MovieResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("MovieResource"),
-        response_type: Some("MovieResource"),
-        tag: "Movie",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_movie_editor",
-        method: HttpMethod::Put,
-        path: "/api/v3/movie/editor",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/MovieEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/MovieEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/MovieEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("MovieEditorResource"),
-        response_type: None,
-        tag: "MovieEditor",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_moviefile_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/moviefile/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/MovieFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("MovieFileResource"),
-        response_type: None,
-        tag: "MovieFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_moviefile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/moviefile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieFileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieFileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieFileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/MovieFileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("MovieFileResource"),
-        response_type: Some("MovieFileResource"),
-        tag: "MovieFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_moviefile_editor",
-        method: HttpMethod::Put,
-        path: "/api/v3/moviefile/editor",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MovieFileListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("MovieFileListResource"),
-        response_type: None,
-        tag: "MovieFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_notification_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/notification/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("NotificationResource"),
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_qualitydefinition_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/qualitydefinition/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("QualityDefinitionResource"),
-        response_type: Some("QualityDefinitionResource"),
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_qualitydefinition_update",
-        method: HttpMethod::Put,
-        path: "/api/v3/qualitydefinition/update",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("QualityDefinitionResource"),
-        response_type: None,
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_qualityprofile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/qualityprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("QualityProfileResource"),
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_releaseprofile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/releaseprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ReleaseProfileResource"),
-        response_type: Some("ReleaseProfileResource"),
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_remotepathmapping_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/remotepathmapping/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("RemotePathMappingResource"),
-        response_type: Some("RemotePathMappingResource"),
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_tag_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/tag/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("TagResource"),
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-];
+pub static TABLE: CompactTable = CompactTable {
+    strings: concat!(
+        "delete_autotagging_by_id",
+        "/api/v3/autotagging/{id}",
+        "id",
+        "{\"format\":\"int32\",\"type\":\"integer\"}",
+        "AutoTagging",
+        "",
+        "delete_blocklist_bulk",
+        "/api/v3/blocklist/bulk",
+        "application/*+json",
+        "{\"$ref\":\"#/components/schemas/BlocklistBulkResource\"}",
+        "null",
+        "application/json",
+        "text/json",
+        "BlocklistBulkResource",
+        "Blocklist",
+        "delete_blocklist_by_id",
+        "/api/v3/blocklist/{id}",
+        "delete_command_by_id",
+        "/api/v3/command/{id}",
+        "Command",
+        "delete_customfilter_by_id",
+        "/api/v3/customfilter/{id}",
+        "CustomFilter",
+        "delete_customformat_bulk",
+        "/api/v3/customformat/bulk",
+        "{\"$ref\":\"#/components/schemas/CustomFormatBulkResource\"}",
+        "CustomFormatBulkResource",
+        "CustomFormat",
+        "delete_customformat_by_id",
+        "/api/v3/customformat/{id}",
+        "delete_delayprofile_by_id",
+        "/api/v3/delayprofile/{id}",
+        "DelayProfile",
+        "delete_downloadclient_bulk",
+        "/api/v3/downloadclient/bulk",
+        "{\"$ref\":\"#/components/schemas/DownloadClientBulkResource\"}",
+        "DownloadClientBulkResource",
+        "DownloadClient",
+        "delete_downloadclient_by_id",
+        "/api/v3/downloadclient/{id}",
+        "delete_exclusions_bulk",
+        "/api/v3/exclusions/bulk",
+        "{\"$ref\":\"#/components/schemas/ImportListExclusionBulkResource\"}",
+        "ImportListExclusionBulkResource",
+        "ImportListExclusion",
+        "delete_exclusions_by_id",
+        "/api/v3/exclusions/{id}",
+        "delete_importlist_bulk",
+        "/api/v3/importlist/bulk",
+        "{\"$ref\":\"#/components/schemas/ImportListBulkResource\"}",
+        "ImportListBulkResource",
+        "ImportList",
+        "delete_importlist_by_id",
+        "/api/v3/importlist/{id}",
+        "delete_indexer_bulk",
+        "/api/v3/indexer/bulk",
+        "{\"$ref\":\"#/components/schemas/IndexerBulkResource\"}",
+        "IndexerBulkResource",
+        "Indexer",
+        "delete_indexer_by_id",
+        "/api/v3/indexer/{id}",
+        "delete_metadata_by_id",
+        "/api/v3/metadata/{id}",
+        "Metadata",
+        "delete_movie_by_id",
+        "/api/v3/movie/{id}",
+        "addImportExclusion",
+        "deleteFiles",
+        "{\"default\":false,\"type\":\"boolean\"}",
+        "Movie",
+        "delete_movie_editor",
+        "/api/v3/movie/editor",
+        "{\"$ref\":\"#/components/schemas/MovieEditorResource\"}",
+        "MovieEditorResource",
+        "MovieEditor",
+        "delete_moviefile_bulk",
+        "/api/v3/moviefile/bulk",
+        "{\"$ref\":\"#/components/schemas/MovieFileListResource\"}",
+        "MovieFileListResource",
+        "MovieFile",
+        "delete_moviefile_by_id",
+        "/api/v3/moviefile/{id}",
+        "delete_notification_by_id",
+        "/api/v3/notification/{id}",
+        "Notification",
+        "delete_qualityprofile_by_id",
+        "/api/v3/qualityprofile/{id}",
+        "QualityProfile",
+        "delete_queue_bulk",
+        "/api/v3/queue/bulk",
+        "blocklist",
+        "changeCategory",
+        "removeFromClient",
+        "skipRedownload",
+        "{\"default\":true,\"type\":\"boolean\"}",
+        "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
+        "QueueBulkResource",
+        "Queue",
+        "delete_queue_by_id",
+        "/api/v3/queue/{id}",
+        "delete_releaseprofile_by_id",
+        "/api/v3/releaseprofile/{id}",
+        "ReleaseProfile",
+        "delete_remotepathmapping_by_id",
+        "/api/v3/remotepathmapping/{id}",
+        "RemotePathMapping",
+        "delete_rootfolder_by_id",
+        "/api/v3/rootfolder/{id}",
+        "RootFolder",
+        "delete_system_backup_by_id",
+        "/api/v3/system/backup/{id}",
+        "Backup",
+        "delete_tag_by_id",
+        "/api/v3/tag/{id}",
+        "Tag",
+        "get",
+        "/api",
+        "200",
+        "{\"$ref\":\"#/components/schemas/ApiInfoResource\"}",
+        "ApiInfoResource",
+        "ApiInfo",
+        "get_alttitle",
+        "/api/v3/alttitle",
+        "movieId",
+        "movieMetadataId",
+        "{\"items\":{\"$ref\":\"#/components/schemas/AlternativeTitleResource\"},\"type\":\"array\"}",
+        "text/plain",
+        "AlternativeTitleResource",
+        "AlternativeTitle",
+        "get_alttitle_by_id",
+        "/api/v3/alttitle/{id}",
+        "{\"$ref\":\"#/components/schemas/AlternativeTitleResource\"}",
+        "get_autotagging",
+        "/api/v3/autotagging",
+        "{\"items\":{\"$ref\":\"#/components/schemas/AutoTaggingResource\"},\"type\":\"array\"}",
+        "AutoTaggingResource",
+        "get_autotagging_by_id",
+        "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
+        "get_autotagging_schema",
+        "/api/v3/autotagging/schema",
+        "get_blocklist",
+        "/api/v3/blocklist",
+        "movieIds",
+        "page",
+        "pageSize",
+        "protocols",
+        "sortDirection",
+        "sortKey",
+        "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
+        "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
+        "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DownloadProtocol\"},\"type\":\"array\"}",
+        "{\"$ref\":\"#/components/schemas/SortDirection\"}",
+        "{\"type\":\"string\"}",
+        "{\"$ref\":\"#/components/schemas/BlocklistResourcePagingResource\"}",
+        "BlocklistResourcePagingResource",
+        "get_blocklist_movie",
+        "/api/v3/blocklist/movie",
+        "{\"items\":{\"$ref\":\"#/components/schemas/BlocklistResource\"},\"type\":\"array\"}",
+        "BlocklistResource",
+        "get_by_path_2",
+        "/{path}",
+        "path",
+        "{\"pattern\":\"^(?!(api|feed)/).*\",\"type\":\"string\"}",
+        "StaticResource",
+        "get_calendar",
+        "/api/v3/calendar",
+        "end",
+        "start",
+        "tags",
+        "unmonitored",
+        "{\"format\":\"date-time\",\"type\":\"string\"}",
+        "{\"default\":\"\",\"type\":\"string\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/MovieResource\"},\"type\":\"array\"}",
+        "MovieResource",
+        "Calendar",
+        "get_collection",
+        "/api/v3/collection",
+        "tmdbId",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CollectionResource\"},\"type\":\"array\"}",
+        "CollectionResource",
+        "Collection",
+        "get_collection_by_id",
+        "/api/v3/collection/{id}",
+        "{\"$ref\":\"#/components/schemas/CollectionResource\"}",
+        "get_command",
+        "/api/v3/command",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CommandResource\"},\"type\":\"array\"}",
+        "CommandResource",
+        "get_command_by_id",
+        "{\"$ref\":\"#/components/schemas/CommandResource\"}",
+        "get_config_downloadclient",
+        "/api/v3/config/downloadclient",
+        "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
+        "DownloadClientConfigResource",
+        "DownloadClientConfig",
+        "get_config_downloadclient_by_id",
+        "/api/v3/config/downloadclient/{id}",
+        "get_config_host",
+        "/api/v3/config/host",
+        "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
+        "HostConfigResource",
+        "HostConfig",
+        "get_config_host_by_id",
+        "/api/v3/config/host/{id}",
+        "get_config_importlist",
+        "/api/v3/config/importlist",
+        "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
+        "ImportListConfigResource",
+        "ImportListConfig",
+        "get_config_importlist_by_id",
+        "/api/v3/config/importlist/{id}",
+        "get_config_indexer",
+        "/api/v3/config/indexer",
+        "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
+        "IndexerConfigResource",
+        "IndexerConfig",
+        "get_config_indexer_by_id",
+        "/api/v3/config/indexer/{id}",
+        "get_config_mediamanagement",
+        "/api/v3/config/mediamanagement",
+        "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
+        "MediaManagementConfigResource",
+        "MediaManagementConfig",
+        "get_config_mediamanagement_by_id",
+        "/api/v3/config/mediamanagement/{id}",
+        "get_config_metadata",
+        "/api/v3/config/metadata",
+        "{\"$ref\":\"#/components/schemas/MetadataConfigResource\"}",
+        "MetadataConfigResource",
+        "MetadataConfig",
+        "get_config_metadata_by_id",
+        "/api/v3/config/metadata/{id}",
+        "get_config_naming",
+        "/api/v3/config/naming",
+        "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
+        "NamingConfigResource",
+        "NamingConfig",
+        "get_config_naming_by_id",
+        "/api/v3/config/naming/{id}",
+        "get_config_naming_examples",
+        "/api/v3/config/naming/examples",
+        "colonReplacementFormat",
+        "movieFolderFormat",
+        "renameMovies",
+        "replaceIllegalCharacters",
+        "resourceName",
+        "standardMovieFormat",
+        "{\"$ref\":\"#/components/schemas/ColonReplacementFormat\"}",
+        "{\"type\":\"boolean\"}",
+        "get_config_ui",
+        "/api/v3/config/ui",
+        "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
+        "UiConfigResource",
+        "UiConfig",
+        "get_config_ui_by_id",
+        "/api/v3/config/ui/{id}",
+        "get_content_by_path",
+        "/content/{path}",
+        "{\"pattern\":\"^(?!api/).*\",\"type\":\"string\"}",
+        "get_credit",
+        "/api/v3/credit",
+        "Credit",
+        "get_credit_by_id",
+        "/api/v3/credit/{id}",
+        "{\"$ref\":\"#/components/schemas/CreditResource\"}",
+        "CreditResource",
+        "get_customfilter",
+        "/api/v3/customfilter",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CustomFilterResource\"},\"type\":\"array\"}",
+        "CustomFilterResource",
+        "get_customfilter_by_id",
+        "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
+        "get_customformat",
+        "/api/v3/customformat",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CustomFormatResource\"},\"type\":\"array\"}",
+        "CustomFormatResource",
+        "get_customformat_by_id",
+        "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
+        "get_customformat_schema",
+        "/api/v3/customformat/schema",
+        "get_delayprofile",
+        "/api/v3/delayprofile",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
+        "DelayProfileResource",
+        "get_delayprofile_by_id",
+        "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
+        "get_diskspace",
+        "/api/v3/diskspace",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DiskSpaceResource\"},\"type\":\"array\"}",
+        "DiskSpaceResource",
+        "DiskSpace",
+        "get_downloadclient",
+        "/api/v3/downloadclient",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DownloadClientResource\"},\"type\":\"array\"}",
+        "DownloadClientResource",
+        "get_downloadclient_by_id",
+        "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
+        "get_downloadclient_schema",
+        "/api/v3/downloadclient/schema",
+        "get_exclusions",
+        "/api/v3/exclusions",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"},\"type\":\"array\"}",
+        "ImportListExclusionResource",
+        "get_exclusions_by_id",
+        "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
+        "get_exclusions_paged",
+        "/api/v3/exclusions/paged",
+        "{\"$ref\":\"#/components/schemas/ImportListExclusionResourcePagingResource\"}",
+        "ImportListExclusionResourcePagingResource",
+        "get_extrafile",
+        "/api/v3/extrafile",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ExtraFileResource\"},\"type\":\"array\"}",
+        "ExtraFileResource",
+        "ExtraFile",
+        "get_feed_calendar_radarr_ics",
+        "/feed/v3/calendar/radarr.ics",
+        "futureDays",
+        "pastDays",
+        "releaseTypes",
+        "{\"default\":28,\"format\":\"int32\",\"type\":\"integer\"}",
+        "{\"default\":7,\"format\":\"int32\",\"type\":\"integer\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CalendarReleaseType\"},\"type\":\"array\"}",
+        "CalendarFeed",
+        "get_filesystem",
+        "/api/v3/filesystem",
+        "allowFoldersWithoutTrailingSlashes",
+        "includeFiles",
+        "FileSystem",
+        "get_filesystem_mediafiles",
+        "/api/v3/filesystem/mediafiles",
+        "get_filesystem_type",
+        "/api/v3/filesystem/type",
+        "get_health",
+        "/api/v3/health",
+        "{\"items\":{\"$ref\":\"#/components/schemas/HealthResource\"},\"type\":\"array\"}",
+        "HealthResource",
+        "Health",
+        "get_history",
+        "/api/v3/history",
+        "downloadId",
+        "eventType",
+        "includeMovie",
+        "languages",
+        "quality",
+        "{\"$ref\":\"#/components/schemas/HistoryResourcePagingResource\"}",
+        "HistoryResourcePagingResource",
+        "History",
+        "get_history_movie",
+        "/api/v3/history/movie",
+        "{\"$ref\":\"#/components/schemas/MovieHistoryEventType\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/HistoryResource\"},\"type\":\"array\"}",
+        "HistoryResource",
+        "get_history_since",
+        "/api/v3/history/since",
+        "date",
+        "get_importlist",
+        "/api/v3/importlist",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ImportListResource\"},\"type\":\"array\"}",
+        "ImportListResource",
+        "get_importlist_by_id",
+        "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
+        "get_importlist_movie",
+        "/api/v3/importlist/movie",
+        "includePopular",
+        "includeRecommendations",
+        "includeTrending",
+        "ImportListMovies",
+        "get_importlist_schema",
+        "/api/v3/importlist/schema",
+        "get_indexer",
+        "/api/v3/indexer",
+        "{\"items\":{\"$ref\":\"#/components/schemas/IndexerResource\"},\"type\":\"array\"}",
+        "IndexerResource",
+        "get_indexer_by_id",
+        "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
+        "get_indexer_schema",
+        "/api/v3/indexer/schema",
+        "get_indexerflag",
+        "/api/v3/indexerflag",
+        "{\"items\":{\"$ref\":\"#/components/schemas/IndexerFlagResource\"},\"type\":\"array\"}",
+        "IndexerFlagResource",
+        "IndexerFlag",
+        "get_language",
+        "/api/v3/language",
+        "{\"items\":{\"$ref\":\"#/components/schemas/LanguageResource\"},\"type\":\"array\"}",
+        "LanguageResource",
+        "Language",
+        "get_language_by_id",
+        "/api/v3/language/{id}",
+        "{\"$ref\":\"#/components/schemas/LanguageResource\"}",
+        "get_localization",
+        "/api/v3/localization",
+        "Localization",
+        "get_localization_language",
+        "/api/v3/localization/language",
+        "{\"$ref\":\"#/components/schemas/LocalizationLanguageResource\"}",
+        "LocalizationLanguageResource",
+        "get_log",
+        "/api/v3/log",
+        "level",
+        "{\"$ref\":\"#/components/schemas/LogResourcePagingResource\"}",
+        "LogResourcePagingResource",
+        "Log",
+        "get_log_file",
+        "/api/v3/log/file",
+        "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
+        "LogFileResource",
+        "LogFile",
+        "get_log_file_by_filename",
+        "/api/v3/log/file/{filename}",
+        "filename",
+        "{\"pattern\":\"[-.a-zA-Z0-9]+?\\\\.txt\",\"type\":\"string\"}",
+        "get_log_file_update",
+        "/api/v3/log/file/update",
+        "UpdateLogFile",
+        "get_log_file_update_by_filename",
+        "/api/v3/log/file/update/{filename}",
+        "get_login",
+        "/login",
+        "get_logout",
+        "/logout",
+        "Authentication",
+        "get_manualimport",
+        "/api/v3/manualimport",
+        "filterExistingFiles",
+        "folder",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ManualImportResource\"},\"type\":\"array\"}",
+        "ManualImportResource",
+        "ManualImport",
+        "get_mediacover_by_filename_movie_id",
+        "/api/v3/mediacover/{movieId}/{filename}",
+        "{\"pattern\":\"(.+)\\\\.(jpg|png|gif)\",\"type\":\"string\"}",
+        "MediaCover",
+        "get_metadata",
+        "/api/v3/metadata",
+        "{\"items\":{\"$ref\":\"#/components/schemas/MetadataResource\"},\"type\":\"array\"}",
+        "MetadataResource",
+        "get_metadata_by_id",
+        "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
+        "get_metadata_schema",
+        "/api/v3/metadata/schema",
+        "get_movie",
+        "/api/v3/movie",
+        "excludeLocalCovers",
+        "languageId",
+        "get_movie_by_id",
+        "{\"$ref\":\"#/components/schemas/MovieResource\"}",
+        "get_movie_folder_by_id",
+        "/api/v3/movie/{id}/folder",
+        "MovieFolder",
+        "get_movie_lookup",
+        "/api/v3/movie/lookup",
+        "term",
+        "MovieLookup",
+        "get_movie_lookup_imdb",
+        "/api/v3/movie/lookup/imdb",
+        "imdbId",
+        "get_movie_lookup_tmdb",
+        "/api/v3/movie/lookup/tmdb",
+        "get_moviefile",
+        "/api/v3/moviefile",
+        "movieFileIds",
+        "{\"items\":{\"$ref\":\"#/components/schemas/MovieFileResource\"},\"type\":\"array\"}",
+        "MovieFileResource",
+        "get_moviefile_by_id",
+        "{\"$ref\":\"#/components/schemas/MovieFileResource\"}",
+        "get_notification",
+        "/api/v3/notification",
+        "{\"items\":{\"$ref\":\"#/components/schemas/NotificationResource\"},\"type\":\"array\"}",
+        "NotificationResource",
+        "get_notification_by_id",
+        "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
+        "get_notification_schema",
+        "/api/v3/notification/schema",
+        "get_parse",
+        "/api/v3/parse",
+        "title",
+        "{\"$ref\":\"#/components/schemas/ParseResource\"}",
+        "ParseResource",
+        "Parse",
+        "get_ping",
+        "/ping",
+        "{\"$ref\":\"#/components/schemas/PingResource\"}",
+        "PingResource",
+        "Ping",
+        "get_qualitydefinition",
+        "/api/v3/qualitydefinition",
+        "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
+        "QualityDefinitionResource",
+        "QualityDefinition",
+        "get_qualitydefinition_by_id",
+        "/api/v3/qualitydefinition/{id}",
+        "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
+        "get_qualitydefinition_limits",
+        "/api/v3/qualitydefinition/limits",
+        "{\"$ref\":\"#/components/schemas/QualityDefinitionLimitsResource\"}",
+        "QualityDefinitionLimitsResource",
+        "get_qualityprofile",
+        "/api/v3/qualityprofile",
+        "{\"items\":{\"$ref\":\"#/components/schemas/QualityProfileResource\"},\"type\":\"array\"}",
+        "QualityProfileResource",
+        "get_qualityprofile_by_id",
+        "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
+        "get_qualityprofile_schema",
+        "/api/v3/qualityprofile/schema",
+        "QualityProfileSchema",
+        "get_queue",
+        "/api/v3/queue",
+        "includeUnknownMovieItems",
+        "protocol",
+        "status",
+        "{\"$ref\":\"#/components/schemas/DownloadProtocol\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/QueueStatus\"},\"type\":\"array\"}",
+        "{\"$ref\":\"#/components/schemas/QueueResourcePagingResource\"}",
+        "QueueResourcePagingResource",
+        "get_queue_details",
+        "/api/v3/queue/details",
+        "{\"items\":{\"$ref\":\"#/components/schemas/QueueResource\"},\"type\":\"array\"}",
+        "QueueResource",
+        "QueueDetails",
+        "get_queue_status",
+        "/api/v3/queue/status",
+        "{\"$ref\":\"#/components/schemas/QueueStatusResource\"}",
+        "QueueStatusResource",
+        "QueueStatus",
+        "get_release",
+        "/api/v3/release",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
+        "ReleaseResource",
+        "Release",
+        "get_releaseprofile",
+        "/api/v3/releaseprofile",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"},\"type\":\"array\"}",
+        "ReleaseProfileResource",
+        "get_releaseprofile_by_id",
+        "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
+        "get_remotepathmapping",
+        "/api/v3/remotepathmapping",
+        "{\"items\":{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"},\"type\":\"array\"}",
+        "RemotePathMappingResource",
+        "get_remotepathmapping_by_id",
+        "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
+        "get_rename",
+        "/api/v3/rename",
+        "{\"items\":{\"$ref\":\"#/components/schemas/RenameMovieResource\"},\"type\":\"array\"}",
+        "RenameMovieResource",
+        "RenameMovie",
+        "get_rootfolder",
+        "/api/v3/rootfolder",
+        "{\"items\":{\"$ref\":\"#/components/schemas/RootFolderResource\"},\"type\":\"array\"}",
+        "RootFolderResource",
+        "get_rootfolder_by_id",
+        "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
+        "get_system_backup",
+        "/api/v3/system/backup",
+        "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
+        "BackupResource",
+        "get_system_routes",
+        "/api/v3/system/routes",
+        "System",
+        "get_system_routes_duplicate",
+        "/api/v3/system/routes/duplicate",
+        "get_system_status",
+        "/api/v3/system/status",
+        "{\"$ref\":\"#/components/schemas/SystemResource\"}",
+        "SystemResource",
+        "get_system_task",
+        "/api/v3/system/task",
+        "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
+        "TaskResource",
+        "Task",
+        "get_system_task_by_id",
+        "/api/v3/system/task/{id}",
+        "{\"$ref\":\"#/components/schemas/TaskResource\"}",
+        "get_tag",
+        "/api/v3/tag",
+        "{\"items\":{\"$ref\":\"#/components/schemas/TagResource\"},\"type\":\"array\"}",
+        "TagResource",
+        "get_tag_by_id",
+        "{\"$ref\":\"#/components/schemas/TagResource\"}",
+        "get_tag_detail",
+        "/api/v3/tag/detail",
+        "{\"items\":{\"$ref\":\"#/components/schemas/TagDetailsResource\"},\"type\":\"array\"}",
+        "TagDetailsResource",
+        "TagDetails",
+        "get_tag_detail_by_id",
+        "/api/v3/tag/detail/{id}",
+        "{\"$ref\":\"#/components/schemas/TagDetailsResource\"}",
+        "get_update",
+        "/api/v3/update",
+        "{\"items\":{\"$ref\":\"#/components/schemas/UpdateResource\"},\"type\":\"array\"}",
+        "UpdateResource",
+        "Update",
+        "get_wanted_cutoff",
+        "/api/v3/wanted/cutoff",
+        "monitored",
+        "{\"$ref\":\"#/components/schemas/MovieResourcePagingResource\"}",
+        "MovieResourcePagingResource",
+        "Cutoff",
+        "get_wanted_missing",
+        "/api/v3/wanted/missing",
+        "Missing",
+        "post_autotagging",
+        "post_command",
+        "post_customfilter",
+        "post_customformat",
+        "post_delayprofile",
+        "post_downloadclient",
+        "forceSave",
+        "post_downloadclient_action_by_name",
+        "/api/v3/downloadclient/action/{name}",
+        "name",
+        "post_downloadclient_test",
+        "/api/v3/downloadclient/test",
+        "forceTest",
+        "post_downloadclient_testall",
+        "/api/v3/downloadclient/testall",
+        "post_exclusions",
+        "post_exclusions_bulk",
+        "post_history_failed_by_id",
+        "/api/v3/history/failed/{id}",
+        "post_importlist",
+        "post_importlist_action_by_name",
+        "/api/v3/importlist/action/{name}",
+        "post_importlist_movie",
+        "post_importlist_test",
+        "/api/v3/importlist/test",
+        "post_importlist_testall",
+        "/api/v3/importlist/testall",
+        "post_indexer",
+        "post_indexer_action_by_name",
+        "/api/v3/indexer/action/{name}",
+        "post_indexer_test",
+        "/api/v3/indexer/test",
+        "post_indexer_testall",
+        "/api/v3/indexer/testall",
+        "post_login",
+        "returnUrl",
+        "multipart/form-data",
+        "{\"properties\":{\"password\":{\"type\":\"string\"},\"rememberMe\":{\"type\":\"string\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"}",
+        "{\"password\":{\"style\":\"form\"},\"rememberMe\":{\"style\":\"form\"},\"username\":{\"style\":\"form\"}}",
+        "post_manualimport",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ManualImportReprocessResource\"},\"type\":\"array\"}",
+        "ManualImportReprocessResource",
+        "post_metadata",
+        "post_metadata_action_by_name",
+        "/api/v3/metadata/action/{name}",
+        "post_metadata_test",
+        "/api/v3/metadata/test",
+        "post_metadata_testall",
+        "/api/v3/metadata/testall",
+        "post_movie",
+        "post_movie_import",
+        "/api/v3/movie/import",
+        "MovieImport",
+        "post_notification",
+        "post_notification_action_by_name",
+        "/api/v3/notification/action/{name}",
+        "post_notification_test",
+        "/api/v3/notification/test",
+        "post_notification_testall",
+        "/api/v3/notification/testall",
+        "post_qualityprofile",
+        "post_queue_grab_bulk",
+        "/api/v3/queue/grab/bulk",
+        "QueueAction",
+        "post_queue_grab_by_id",
+        "/api/v3/queue/grab/{id}",
+        "post_release",
+        "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
+        "post_release_push",
+        "/api/v3/release/push",
+        "ReleasePush",
+        "post_releaseprofile",
+        "post_remotepathmapping",
+        "post_rootfolder",
+        "post_system_backup_restore_by_id",
+        "/api/v3/system/backup/restore/{id}",
+        "post_system_backup_restore_upload",
+        "/api/v3/system/backup/restore/upload",
+        "{\"type\":\"object\",\"required\":[\"file\"],\"properties\":{\"file\":{\"type\":\"string\",\"format\":\"binary\"}}}",
+        "{\"file\":{\"contentType\":\"application/zip\"}}",
+        "post_system_restart",
+        "/api/v3/system/restart",
+        "post_system_shutdown",
+        "/api/v3/system/shutdown",
+        "post_tag",
+        "put_autotagging_by_id",
+        "put_collection",
+        "{\"$ref\":\"#/components/schemas/CollectionUpdateResource\"}",
+        "CollectionUpdateResource",
+        "put_collection_by_id",
+        "put_config_downloadclient_by_id",
+        "put_config_host_by_id",
+        "put_config_importlist_by_id",
+        "put_config_indexer_by_id",
+        "put_config_mediamanagement_by_id",
+        "put_config_metadata_by_id",
+        "put_config_naming_by_id",
+        "put_config_ui_by_id",
+        "put_customfilter_by_id",
+        "put_customformat_bulk",
+        "put_customformat_by_id",
+        "put_delayprofile_by_id",
+        "put_delayprofile_reorder_by_id",
+        "/api/v3/delayprofile/reorder/{id}",
+        "after",
+        "put_downloadclient_bulk",
+        "put_downloadclient_by_id",
+        "put_exclusions_by_id",
+        "put_importlist_bulk",
+        "put_importlist_by_id",
+        "put_indexer_bulk",
+        "put_indexer_by_id",
+        "put_metadata_by_id",
+        "put_movie_by_id",
+        "moveFiles",
+        "put_movie_editor",
+        "put_moviefile_bulk",
+        "put_moviefile_by_id",
+        "put_moviefile_editor",
+        "/api/v3/moviefile/editor",
+        "put_notification_by_id",
+        "put_qualitydefinition_by_id",
+        "put_qualitydefinition_update",
+        "/api/v3/qualitydefinition/update",
+        "put_qualityprofile_by_id",
+        "put_releaseprofile_by_id",
+        "put_remotepathmapping_by_id",
+        "put_tag_by_id",
+        "AddMovieMethod",
+        "export type AddMovieMethod = \"manual\" | \"list\" | \"collection\";",
+        "AddMovieOptions",
+        "export interface AddMovieOptions {\n  addMethod?: AddMovieMethod;\n  ignoreEpisodesWithFiles?: boolean;\n  ignoreEpisodesWithoutFiles?: boolean;\n  monitor?: MonitorTypes;\n  searchForMovie?: boolean;\n}",
+        "export interface AlternativeTitleResource {\n  cleanTitle?: string | null;\n  id?: number;\n  movieMetadataId?: number;\n  sourceType?: SourceType;\n  title?: string | null;\n}",
+        "export interface ApiInfoResource {\n  current?: string | null;\n  deprecated?: string[] | null;\n}",
+        "ApplyTags",
+        "export type ApplyTags = \"add\" | \"remove\" | \"replace\";",
+        "AuthenticationRequiredType",
+        "export type AuthenticationRequiredType = \"enabled\" | \"disabledForLocalAddresses\";",
+        "AuthenticationType",
+        "export type AuthenticationType = \"none\" | \"basic\" | \"forms\" | \"external\";",
+        "export interface AutoTaggingResource {\n  id?: number;\n  name?: string | null;\n  removeTagsAutomatically?: boolean;\n  specifications?: AutoTaggingSpecificationSchema[] | null;\n  tags?: number[] | null;\n}",
+        "AutoTaggingSpecificationSchema",
+        "export interface AutoTaggingSpecificationSchema {\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  name?: string | null;\n  negate?: boolean;\n  required?: boolean;\n}",
+        "export interface BackupResource {\n  id?: number;\n  name?: string | null;\n  path?: string | null;\n  size?: number;\n  time?: string;\n  type?: BackupType;\n}",
+        "BackupType",
+        "export type BackupType = \"scheduled\" | \"manual\" | \"update\";",
+        "export interface BlocklistBulkResource {\n  ids?: number[] | null;\n}",
+        "export interface BlocklistResource {\n  customFormats?: CustomFormatResource[] | null;\n  date?: string;\n  id?: number;\n  indexer?: string | null;\n  languages?: Language[] | null;\n  message?: string | null;\n  movie?: MovieResource;\n  movieId?: number;\n  protocol?: DownloadProtocol;\n  quality?: QualityModel;\n  sourceTitle?: string | null;\n}",
+        "export interface BlocklistResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: BlocklistResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "CalendarReleaseType",
+        "export type CalendarReleaseType = \"cinemaRelease\" | \"digitalRelease\" | \"physicalRelease\";",
+        "CertificateValidationType",
+        "export type CertificateValidationType = \"enabled\" | \"disabledForLocalAddresses\" | \"disabled\";",
+        "CollectionMovieResource",
+        "export interface CollectionMovieResource {\n  cleanTitle?: string | null;\n  folder?: string | null;\n  genres?: string[] | null;\n  images?: MediaCover[] | null;\n  imdbId?: string | null;\n  isExcluded?: boolean;\n  isExisting?: boolean;\n  overview?: string | null;\n  ratings?: Ratings;\n  runtime?: number;\n  sortTitle?: string | null;\n  status?: MovieStatusType;\n  title?: string | null;\n  tmdbId?: number;\n  year?: number;\n}",
+        "export interface CollectionResource {\n  id?: number;\n  images?: MediaCover[] | null;\n  minimumAvailability?: MovieStatusType;\n  missingMovies?: number;\n  monitored?: boolean;\n  movies?: CollectionMovieResource[] | null;\n  overview?: string | null;\n  qualityProfileId?: number;\n  rootFolderPath?: string | null;\n  searchOnAdd?: boolean;\n  sortTitle?: string | null;\n  tags?: number[] | null;\n  title?: string | null;\n  tmdbId?: number;\n}",
+        "export interface CollectionUpdateResource {\n  collectionIds?: number[] | null;\n  minimumAvailability?: MovieStatusType;\n  monitorMovies?: boolean | null;\n  monitored?: boolean | null;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  searchOnAdd?: boolean | null;\n}",
+        "ColonReplacementFormat",
+        "export type ColonReplacementFormat = \"delete\" | \"dash\" | \"spaceDash\" | \"spaceDashSpace\" | \"smart\";",
+        "export interface Command {\n  clientUserAgent?: string | null;\n  completionMessage?: string | null;\n  isExclusive?: boolean;\n  isLongRunning?: boolean;\n  isTypeExclusive?: boolean;\n  lastExecutionTime?: string | null;\n  lastStartTime?: string | null;\n  name?: string | null;\n  requiresDiskAccess?: boolean;\n  sendUpdatesToClient?: boolean;\n  suppressMessages?: boolean;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
+        "CommandPriority",
+        "export type CommandPriority = \"normal\" | \"high\" | \"low\";",
+        "export interface CommandResource {\n  body?: Command;\n  clientUserAgent?: string | null;\n  commandName?: string | null;\n  duration?: string | null;\n  ended?: string | null;\n  exception?: string | null;\n  id?: number;\n  lastExecutionTime?: string | null;\n  message?: string | null;\n  name?: string | null;\n  priority?: CommandPriority;\n  queued?: string;\n  result?: CommandResult;\n  sendUpdatesToClient?: boolean;\n  started?: string | null;\n  stateChangeTime?: string | null;\n  status?: CommandStatus;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
+        "CommandResult",
+        "export type CommandResult = \"unknown\" | \"successful\" | \"unsuccessful\";",
+        "CommandStatus",
+        "export type CommandStatus = \"queued\" | \"started\" | \"completed\" | \"failed\" | \"aborted\" | \"cancelled\" | \"orphaned\";",
+        "CommandTrigger",
+        "export type CommandTrigger = \"unspecified\" | \"manual\" | \"scheduled\";",
+        "export interface CreditResource {\n  character?: string | null;\n  creditTmdbId?: string | null;\n  department?: string | null;\n  id?: number;\n  images?: MediaCover[] | null;\n  job?: string | null;\n  movieMetadataId?: number;\n  order?: number;\n  personName?: string | null;\n  personTmdbId?: number;\n  type?: CreditType;\n}",
+        "CreditType",
+        "export type CreditType = \"cast\" | \"crew\";",
+        "export interface CustomFilterResource {\n  filters?: Record<string, unknown>[] | null;\n  id?: number;\n  label?: string | null;\n  type?: string | null;\n}",
+        "export interface CustomFormatBulkResource {\n  ids?: number[] | null;\n  includeCustomFormatWhenRenaming?: boolean | null;\n}",
+        "export interface CustomFormatResource {\n  id?: number;\n  includeCustomFormatWhenRenaming?: boolean | null;\n  name?: string | null;\n  specifications?: CustomFormatSpecificationSchema[] | null;\n}",
+        "CustomFormatSpecificationSchema",
+        "export interface CustomFormatSpecificationSchema {\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  name?: string | null;\n  negate?: boolean;\n  presets?: CustomFormatSpecificationSchema[] | null;\n  required?: boolean;\n}",
+        "DatabaseType",
+        "export type DatabaseType = \"sqLite\" | \"postgreSQL\";",
+        "export interface DelayProfileResource {\n  bypassIfAboveCustomFormatScore?: boolean;\n  bypassIfHighestQuality?: boolean;\n  enableTorrent?: boolean;\n  enableUsenet?: boolean;\n  id?: number;\n  minimumCustomFormatScore?: number;\n  order?: number;\n  preferredProtocol?: DownloadProtocol;\n  tags?: number[] | null;\n  torrentDelay?: number;\n  usenetDelay?: number;\n}",
+        "export interface DiskSpaceResource {\n  freeSpace?: number;\n  id?: number;\n  label?: string | null;\n  path?: string | null;\n  totalSpace?: number;\n}",
+        "export interface DownloadClientBulkResource {\n  applyTags?: ApplyTags;\n  enable?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  removeCompletedDownloads?: boolean | null;\n  removeFailedDownloads?: boolean | null;\n  tags?: number[] | null;\n}",
+        "export interface DownloadClientConfigResource {\n  autoRedownloadFailed?: boolean;\n  autoRedownloadFailedFromInteractiveSearch?: boolean;\n  checkForFinishedDownloadInterval?: number;\n  downloadClientWorkingFolders?: string | null;\n  enableCompletedDownloadHandling?: boolean;\n  id?: number;\n}",
+        "export interface DownloadClientResource {\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: DownloadClientResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  removeCompletedDownloads?: boolean;\n  removeFailedDownloads?: boolean;\n  tags?: number[] | null;\n}",
+        "DownloadProtocol",
+        "export type DownloadProtocol = \"unknown\" | \"usenet\" | \"torrent\";",
+        "export interface ExtraFileResource {\n  extension?: string | null;\n  id?: number;\n  languageTags?: string[] | null;\n  movieFileId?: number | null;\n  movieId?: number;\n  relativePath?: string | null;\n  title?: string | null;\n  type?: ExtraFileType;\n}",
+        "ExtraFileType",
+        "export type ExtraFileType = \"subtitle\" | \"metadata\" | \"other\";",
+        "Field",
+        "export interface Field {\n  advanced?: boolean;\n  helpLink?: string | null;\n  helpText?: string | null;\n  helpTextWarning?: string | null;\n  hidden?: string | null;\n  isFloat?: boolean;\n  label?: string | null;\n  name?: string | null;\n  order?: number;\n  placeholder?: string | null;\n  privacy?: PrivacyLevel;\n  section?: string | null;\n  selectOptions?: SelectOption[] | null;\n  selectOptionsProviderAction?: string | null;\n  type?: string | null;\n  unit?: string | null;\n  value?: unknown | null;\n}",
+        "FileDateType",
+        "export type FileDateType = \"none\" | \"cinemas\" | \"release\";",
+        "HealthCheckResult",
+        "export type HealthCheckResult = \"ok\" | \"notice\" | \"warning\" | \"error\";",
+        "export interface HealthResource {\n  id?: number;\n  message?: string | null;\n  source?: string | null;\n  type?: HealthCheckResult;\n  wikiUrl?: string | null;\n}",
+        "export interface HistoryResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  data?: Record<string, string | null> | null;\n  date?: string;\n  downloadId?: string | null;\n  eventType?: MovieHistoryEventType;\n  id?: number;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  movieId?: number;\n  quality?: QualityModel;\n  qualityCutoffNotMet?: boolean;\n  sourceTitle?: string | null;\n}",
+        "export interface HistoryResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: HistoryResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "export interface HostConfigResource {\n  analyticsEnabled?: boolean;\n  apiKey?: string | null;\n  applicationUrl?: string | null;\n  authenticationMethod?: AuthenticationType;\n  authenticationRequired?: AuthenticationRequiredType;\n  backupFolder?: string | null;\n  backupInterval?: number;\n  backupRetention?: number;\n  bindAddress?: string | null;\n  branch?: string | null;\n  certificateValidation?: CertificateValidationType;\n  consoleLogLevel?: string | null;\n  enableSsl?: boolean;\n  id?: number;\n  instanceName?: string | null;\n  launchBrowser?: boolean;\n  logLevel?: string | null;\n  logSizeLimit?: number;\n  password?: string | null;\n  passwordConfirmation?: string | null;\n  port?: number;\n  proxyBypassFilter?: string | null;\n  proxyBypassLocalAddresses?: boolean;\n  proxyEnabled?: boolean;\n  proxyHostname?: string | null;\n  proxyPassword?: string | null;\n  proxyPort?: number;\n  proxyType?: ProxyType;\n  proxyUsername?: string | null;\n  sslCertPassword?: string | null;\n  sslCertPath?: string | null;\n  sslPort?: number;\n  trustCgnatIpAddresses?: boolean;\n  updateAutomatically?: boolean;\n  updateMechanism?: UpdateMechanism;\n  updateScriptPath?: string | null;\n  urlBase?: string | null;\n  username?: string | null;\n}",
+        "export interface ImportListBulkResource {\n  applyTags?: ApplyTags;\n  enableAuto?: boolean | null;\n  enabled?: boolean | null;\n  ids?: number[] | null;\n  minimumAvailability?: MovieStatusType;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  tags?: number[] | null;\n}",
+        "export interface ImportListConfigResource {\n  id?: number;\n  listSyncLevel?: string | null;\n}",
+        "export interface ImportListExclusionBulkResource {\n  ids?: number[] | null;\n}",
+        "export interface ImportListExclusionResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  movieTitle?: string | null;\n  movieYear?: number;\n  name?: string | null;\n  presets?: ImportListExclusionResource[] | null;\n  tags?: number[] | null;\n  tmdbId?: number;\n}",
+        "export interface ImportListExclusionResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: ImportListExclusionResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "export interface ImportListResource {\n  configContract?: string | null;\n  enableAuto?: boolean;\n  enabled?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  listOrder?: number;\n  listType?: ImportListType;\n  message?: ProviderMessage;\n  minRefreshInterval?: string;\n  minimumAvailability?: MovieStatusType;\n  monitor?: MonitorTypes;\n  name?: string | null;\n  presets?: ImportListResource[] | null;\n  qualityProfileId?: number;\n  rootFolderPath?: string | null;\n  searchOnAdd?: boolean;\n  tags?: number[] | null;\n}",
+        "ImportListType",
+        "export type ImportListType = \"program\" | \"tmdb\" | \"trakt\" | \"plex\" | \"simkl\" | \"other\" | \"advanced\";",
+        "ImportRejectionResource",
+        "export interface ImportRejectionResource {\n  reason?: string | null;\n  type?: RejectionType;\n}",
+        "export interface IndexerBulkResource {\n  applyTags?: ApplyTags;\n  enableAutomaticSearch?: boolean | null;\n  enableInteractiveSearch?: boolean | null;\n  enableRss?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  tags?: number[] | null;\n}",
+        "export interface IndexerConfigResource {\n  allowHardcodedSubs?: boolean;\n  availabilityDelay?: number;\n  id?: number;\n  maximumSize?: number;\n  minimumAge?: number;\n  preferIndexerFlags?: boolean;\n  retention?: number;\n  rssSyncInterval?: number;\n  whitelistedHardcodedSubs?: string | null;\n}",
+        "export interface IndexerFlagResource {\n  id?: number;\n  name?: string | null;\n  nameLower?: string | null;\n}",
+        "export interface IndexerResource {\n  configContract?: string | null;\n  downloadClientId?: number;\n  enableAutomaticSearch?: boolean;\n  enableInteractiveSearch?: boolean;\n  enableRss?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: IndexerResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  supportsRss?: boolean;\n  supportsSearch?: boolean;\n  tags?: number[] | null;\n}",
+        "export interface Language {\n  id?: number;\n  name?: string | null;\n}",
+        "export interface LanguageResource {\n  id?: number;\n  name?: string | null;\n  nameLower?: string | null;\n}",
+        "export interface LocalizationLanguageResource {\n  identifier?: string | null;\n}",
+        "export interface LogFileResource {\n  contentsUrl?: string | null;\n  downloadUrl?: string | null;\n  filename?: string | null;\n  id?: number;\n  lastWriteTime?: string;\n}",
+        "LogResource",
+        "export interface LogResource {\n  exception?: string | null;\n  exceptionType?: string | null;\n  id?: number;\n  level?: string | null;\n  logger?: string | null;\n  message?: string | null;\n  method?: string | null;\n  time?: string;\n}",
+        "export interface LogResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: LogResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "export interface ManualImportReprocessResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadId?: string | null;\n  id?: number;\n  indexerFlags?: number;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  movieId?: number;\n  path?: string | null;\n  quality?: QualityModel;\n  rejections?: ImportRejectionResource[] | null;\n  releaseGroup?: string | null;\n}",
+        "export interface ManualImportResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadId?: string | null;\n  folderName?: string | null;\n  id?: number;\n  indexerFlags?: number;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  movieFileId?: number | null;\n  name?: string | null;\n  path?: string | null;\n  quality?: QualityModel;\n  qualityWeight?: number;\n  rejections?: ImportRejectionResource[] | null;\n  relativePath?: string | null;\n  releaseGroup?: string | null;\n  size?: number;\n}",
+        "export interface MediaCover {\n  coverType?: MediaCoverTypes;\n  remoteUrl?: string | null;\n  url?: string | null;\n}",
+        "MediaCoverTypes",
+        "export type MediaCoverTypes = \"unknown\" | \"poster\" | \"banner\" | \"fanart\" | \"screenshot\" | \"headshot\" | \"clearlogo\";",
+        "MediaInfoResource",
+        "export interface MediaInfoResource {\n  audioBitrate?: number;\n  audioChannels?: number;\n  audioCodec?: string | null;\n  audioLanguages?: string | null;\n  audioStreamCount?: number;\n  id?: number;\n  resolution?: string | null;\n  runTime?: string | null;\n  scanType?: string | null;\n  subtitles?: string | null;\n  videoBitDepth?: number;\n  videoBitrate?: number;\n  videoCodec?: string | null;\n  videoDynamicRange?: string | null;\n  videoDynamicRangeType?: string | null;\n  videoFps?: number;\n}",
+        "export interface MediaManagementConfigResource {\n  autoRenameFolders?: boolean;\n  autoUnmonitorPreviouslyDownloadedMovies?: boolean;\n  chmodFolder?: string | null;\n  chownGroup?: string | null;\n  copyUsingHardlinks?: boolean;\n  createEmptyMovieFolders?: boolean;\n  deleteEmptyFolders?: boolean;\n  downloadPropersAndRepacks?: ProperDownloadTypes;\n  enableMediaInfo?: boolean;\n  extraFileExtensions?: string | null;\n  fileDate?: FileDateType;\n  id?: number;\n  importExtraFiles?: boolean;\n  minimumFreeSpaceWhenImporting?: number;\n  pathsDefaultStatic?: boolean;\n  recycleBin?: string | null;\n  recycleBinCleanupDays?: number;\n  rescanAfterRefresh?: RescanAfterRefreshType;\n  scriptImportPath?: string | null;\n  setPermissionsLinux?: boolean;\n  skipFreeSpaceCheckWhenImporting?: boolean;\n  useScriptImport?: boolean;\n}",
+        "export interface MetadataConfigResource {\n  certificationCountry?: TMDbCountryCode;\n  id?: number;\n}",
+        "export interface MetadataResource {\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: MetadataResource[] | null;\n  tags?: number[] | null;\n}",
+        "Modifier",
+        "export type Modifier = \"none\" | \"regional\" | \"screener\" | \"rawhd\" | \"brdisk\" | \"remux\";",
+        "MonitorTypes",
+        "export type MonitorTypes = \"movieOnly\" | \"movieAndCollection\" | \"none\";",
+        "MovieCollectionResource",
+        "export interface MovieCollectionResource {\n  title?: string | null;\n  tmdbId?: number;\n}",
+        "export interface MovieEditorResource {\n  addImportExclusion?: boolean;\n  applyTags?: ApplyTags;\n  deleteFiles?: boolean;\n  minimumAvailability?: MovieStatusType;\n  monitored?: boolean | null;\n  moveFiles?: boolean;\n  movieIds?: number[] | null;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  tags?: number[] | null;\n}",
+        "export interface MovieFileListResource {\n  edition?: string | null;\n  indexerFlags?: number | null;\n  languages?: Language[] | null;\n  movieFileIds?: number[] | null;\n  quality?: QualityModel;\n  releaseGroup?: string | null;\n  sceneName?: string | null;\n}",
+        "export interface MovieFileResource {\n  customFormatScore?: number | null;\n  customFormats?: CustomFormatResource[] | null;\n  dateAdded?: string;\n  edition?: string | null;\n  id?: number;\n  indexerFlags?: number | null;\n  languages?: Language[] | null;\n  mediaInfo?: MediaInfoResource;\n  movieId?: number;\n  originalFilePath?: string | null;\n  path?: string | null;\n  quality?: QualityModel;\n  qualityCutoffNotMet?: boolean;\n  relativePath?: string | null;\n  releaseGroup?: string | null;\n  sceneName?: string | null;\n  size?: number;\n}",
+        "MovieHistoryEventType",
+        "export type MovieHistoryEventType = \"unknown\" | \"grabbed\" | \"downloadFolderImported\" | \"downloadFailed\" | \"movieFileDeleted\" | \"movieFolderImported\" | \"movieFileRenamed\" | \"downloadIgnored\";",
+        "export interface MovieResource {\n  addOptions?: AddMovieOptions;\n  added?: string;\n  alternateTitles?: AlternativeTitleResource[] | null;\n  certification?: string | null;\n  cleanTitle?: string | null;\n  collection?: MovieCollectionResource;\n  digitalRelease?: string | null;\n  folder?: string | null;\n  folderName?: string | null;\n  genres?: string[] | null;\n  hasFile?: boolean | null;\n  id?: number;\n  images?: MediaCover[] | null;\n  imdbId?: string | null;\n  inCinemas?: string | null;\n  isAvailable?: boolean;\n  keywords?: string[] | null;\n  lastSearchTime?: string | null;\n  minimumAvailability?: MovieStatusType;\n  monitored?: boolean;\n  movieFile?: MovieFileResource;\n  movieFileId?: number;\n  originalLanguage?: Language;\n  originalTitle?: string | null;\n  overview?: string | null;\n  path?: string | null;\n  physicalRelease?: string | null;\n  physicalReleaseNote?: string | null;\n  popularity?: number;\n  qualityProfileId?: number;\n  ratings?: Ratings;\n  releaseDate?: string | null;\n  remotePoster?: string | null;\n  rootFolderPath?: string | null;\n  runtime?: number;\n  secondaryYear?: number | null;\n  secondaryYearSourceId?: number;\n  sizeOnDisk?: number | null;\n  sortTitle?: string | null;\n  statistics?: MovieStatisticsResource;\n  status?: MovieStatusType;\n  studio?: string | null;\n  tags?: number[] | null;\n  title?: string | null;\n  titleSlug?: string | null;\n  tmdbId?: number;\n  website?: string | null;\n  year?: number;\n  youTubeTrailerId?: string | null;\n}",
+        "export interface MovieResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: MovieResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "MovieRuntimeFormatType",
+        "export type MovieRuntimeFormatType = \"hoursMinutes\" | \"minutes\";",
+        "MovieStatisticsResource",
+        "export interface MovieStatisticsResource {\n  movieFileCount?: number;\n  releaseGroups?: string[] | null;\n  sizeOnDisk?: number;\n}",
+        "MovieStatusType",
+        "export type MovieStatusType = \"tba\" | \"announced\" | \"inCinemas\" | \"released\" | \"deleted\";",
+        "export interface NamingConfigResource {\n  colonReplacementFormat?: ColonReplacementFormat;\n  id?: number;\n  movieFolderFormat?: string | null;\n  renameMovies?: boolean;\n  replaceIllegalCharacters?: boolean;\n  standardMovieFormat?: string | null;\n}",
+        "export interface NotificationResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  includeHealthWarnings?: boolean;\n  infoLink?: string | null;\n  link?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  onApplicationUpdate?: boolean;\n  onDownload?: boolean;\n  onGrab?: boolean;\n  onHealthIssue?: boolean;\n  onHealthRestored?: boolean;\n  onManualInteractionRequired?: boolean;\n  onMovieAdded?: boolean;\n  onMovieDelete?: boolean;\n  onMovieFileDelete?: boolean;\n  onMovieFileDeleteForUpgrade?: boolean;\n  onRename?: boolean;\n  onUpgrade?: boolean;\n  presets?: NotificationResource[] | null;\n  supportsOnApplicationUpdate?: boolean;\n  supportsOnDownload?: boolean;\n  supportsOnGrab?: boolean;\n  supportsOnHealthIssue?: boolean;\n  supportsOnHealthRestored?: boolean;\n  supportsOnManualInteractionRequired?: boolean;\n  supportsOnMovieAdded?: boolean;\n  supportsOnMovieDelete?: boolean;\n  supportsOnMovieFileDelete?: boolean;\n  supportsOnMovieFileDeleteForUpgrade?: boolean;\n  supportsOnRename?: boolean;\n  supportsOnUpgrade?: boolean;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
+        "export interface ParseResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  id?: number;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  parsedMovieInfo?: ParsedMovieInfo;\n  title?: string | null;\n}",
+        "ParsedMovieInfo",
+        "export interface ParsedMovieInfo {\n  edition?: string | null;\n  hardcodedSubs?: string | null;\n  imdbId?: string | null;\n  languages?: Language[] | null;\n  movieTitle?: string | null;\n  movieTitles?: string[] | null;\n  originalTitle?: string | null;\n  primaryMovieTitle?: string | null;\n  quality?: QualityModel;\n  releaseGroup?: string | null;\n  releaseHash?: string | null;\n  releaseTitle?: string | null;\n  simpleReleaseTitle?: string | null;\n  tmdbId?: number;\n  year?: number;\n}",
+        "export interface PingResource {\n  status?: string | null;\n}",
+        "PrivacyLevel",
+        "export type PrivacyLevel = \"normal\" | \"password\" | \"apiKey\" | \"userName\";",
+        "ProfileFormatItemResource",
+        "export interface ProfileFormatItemResource {\n  format?: number;\n  id?: number;\n  name?: string | null;\n  score?: number;\n}",
+        "ProperDownloadTypes",
+        "export type ProperDownloadTypes = \"preferAndUpgrade\" | \"doNotUpgrade\" | \"doNotPrefer\";",
+        "ProviderMessage",
+        "export interface ProviderMessage {\n  message?: string | null;\n  type?: ProviderMessageType;\n}",
+        "ProviderMessageType",
+        "export type ProviderMessageType = \"info\" | \"warning\" | \"error\";",
+        "ProxyType",
+        "export type ProxyType = \"http\" | \"socks4\" | \"socks5\";",
+        "Quality",
+        "export interface Quality {\n  id?: number;\n  modifier?: Modifier;\n  name?: string | null;\n  resolution?: number;\n  source?: QualitySource;\n}",
+        "export interface QualityDefinitionLimitsResource {\n  max?: number;\n  min?: number;\n}",
+        "export interface QualityDefinitionResource {\n  id?: number;\n  maxSize?: number | null;\n  minSize?: number | null;\n  preferredSize?: number | null;\n  quality?: Quality;\n  title?: string | null;\n  weight?: number;\n}",
+        "QualityModel",
+        "export interface QualityModel {\n  quality?: Quality;\n  revision?: Revision;\n}",
+        "QualityProfileQualityItemResource",
+        "export interface QualityProfileQualityItemResource {\n  allowed?: boolean;\n  id?: number;\n  items?: QualityProfileQualityItemResource[] | null;\n  name?: string | null;\n  quality?: Quality;\n}",
+        "export interface QualityProfileResource {\n  cutoff?: number;\n  cutoffFormatScore?: number;\n  formatItems?: ProfileFormatItemResource[] | null;\n  id?: number;\n  items?: QualityProfileQualityItemResource[] | null;\n  language?: Language;\n  minFormatScore?: number;\n  minUpgradeFormatScore?: number;\n  name?: string | null;\n  upgradeAllowed?: boolean;\n}",
+        "QualitySource",
+        "export type QualitySource = \"unknown\" | \"cam\" | \"telesync\" | \"telecine\" | \"workprint\" | \"dvd\" | \"tv\" | \"webdl\" | \"webrip\" | \"bluray\";",
+        "export interface QueueBulkResource {\n  ids?: number[] | null;\n}",
+        "export interface QueueResource {\n  added?: string | null;\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadClient?: string | null;\n  downloadClientHasPostImportCategory?: boolean;\n  downloadId?: string | null;\n  errorMessage?: string | null;\n  estimatedCompletionTime?: string | null;\n  id?: number;\n  indexer?: string | null;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  movieId?: number | null;\n  outputPath?: string | null;\n  protocol?: DownloadProtocol;\n  quality?: QualityModel;\n  size?: number;\n  sizeleft?: number;\n  status?: QueueStatus;\n  statusMessages?: TrackedDownloadStatusMessage[] | null;\n  timeleft?: string | null;\n  title?: string | null;\n  trackedDownloadState?: TrackedDownloadState;\n  trackedDownloadStatus?: TrackedDownloadStatus;\n}",
+        "export interface QueueResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: QueueResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "export type QueueStatus = \"unknown\" | \"queued\" | \"paused\" | \"downloading\" | \"completed\" | \"failed\" | \"warning\" | \"delay\" | \"downloadClientUnavailable\" | \"fallback\";",
+        "export interface QueueStatusResource {\n  count?: number;\n  errors?: boolean;\n  id?: number;\n  totalCount?: number;\n  unknownCount?: number;\n  unknownErrors?: boolean;\n  unknownWarnings?: boolean;\n  warnings?: boolean;\n}",
+        "RatingChild",
+        "export interface RatingChild {\n  type?: RatingType;\n  value?: number;\n  votes?: number;\n}",
+        "RatingType",
+        "export type RatingType = \"user\" | \"critic\";",
+        "Ratings",
+        "export interface Ratings {\n  imdb?: RatingChild;\n  metacritic?: RatingChild;\n  rottenTomatoes?: RatingChild;\n  tmdb?: RatingChild;\n  trakt?: RatingChild;\n}",
+        "RejectionType",
+        "export type RejectionType = \"permanent\" | \"temporary\";",
+        "export interface ReleaseProfileResource {\n  enabled?: boolean;\n  id?: number;\n  ignored?: unknown | null;\n  indexerId?: number;\n  name?: string | null;\n  required?: unknown | null;\n  tags?: number[] | null;\n}",
+        "export interface ReleaseResource {\n  age?: number;\n  ageHours?: number;\n  ageMinutes?: number;\n  approved?: boolean;\n  commentUrl?: string | null;\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadAllowed?: boolean;\n  downloadClient?: string | null;\n  downloadClientId?: number | null;\n  downloadUrl?: string | null;\n  edition?: string | null;\n  guid?: string | null;\n  id?: number;\n  imdbId?: number;\n  indexer?: string | null;\n  indexerFlags?: unknown | null;\n  indexerId?: number;\n  infoHash?: string | null;\n  infoUrl?: string | null;\n  languages?: Language[] | null;\n  leechers?: number | null;\n  magnetUrl?: string | null;\n  mappedMovieId?: number | null;\n  movieId?: number | null;\n  movieRequested?: boolean;\n  movieTitles?: string[] | null;\n  protocol?: DownloadProtocol;\n  publishDate?: string;\n  quality?: QualityModel;\n  qualityWeight?: number;\n  rejected?: boolean;\n  rejections?: string[] | null;\n  releaseGroup?: string | null;\n  releaseHash?: string | null;\n  releaseWeight?: number;\n  sceneSource?: boolean;\n  seeders?: number | null;\n  shouldOverride?: boolean | null;\n  size?: number;\n  subGroup?: string | null;\n  temporarilyRejected?: boolean;\n  title?: string | null;\n  tmdbId?: number;\n}",
+        "export interface RemotePathMappingResource {\n  host?: string | null;\n  id?: number;\n  localPath?: string | null;\n  remotePath?: string | null;\n}",
+        "export interface RenameMovieResource {\n  existingPath?: string | null;\n  id?: number;\n  movieFileId?: number;\n  movieId?: number;\n  newPath?: string | null;\n}",
+        "RescanAfterRefreshType",
+        "export type RescanAfterRefreshType = \"always\" | \"afterManual\" | \"never\";",
+        "Revision",
+        "export interface Revision {\n  isRepack?: boolean;\n  real?: number;\n  version?: number;\n}",
+        "export interface RootFolderResource {\n  accessible?: boolean;\n  freeSpace?: number | null;\n  id?: number;\n  path?: string | null;\n  unmappedFolders?: UnmappedFolder[] | null;\n}",
+        "RuntimeMode",
+        "export type RuntimeMode = \"console\" | \"service\" | \"tray\";",
+        "SelectOption",
+        "export interface SelectOption {\n  dividerAfter?: boolean;\n  hint?: string | null;\n  name?: string | null;\n  order?: number;\n  value?: number;\n}",
+        "SortDirection",
+        "export type SortDirection = \"default\" | \"ascending\" | \"descending\";",
+        "SourceType",
+        "export type SourceType = \"tmdb\" | \"mappings\" | \"user\" | \"indexer\";",
+        "export interface SystemResource {\n  appData?: string | null;\n  appName?: string | null;\n  authentication?: AuthenticationType;\n  branch?: string | null;\n  buildTime?: string;\n  databaseType?: DatabaseType;\n  databaseVersion?: string | null;\n  instanceName?: string | null;\n  isAdmin?: boolean;\n  isDebug?: boolean;\n  isDocker?: boolean;\n  isLinux?: boolean;\n  isNetCore?: boolean;\n  isOsx?: boolean;\n  isProduction?: boolean;\n  isUserInteractive?: boolean;\n  isWindows?: boolean;\n  migrationVersion?: number;\n  mode?: RuntimeMode;\n  osName?: string | null;\n  osVersion?: string | null;\n  packageAuthor?: string | null;\n  packageUpdateMechanism?: UpdateMechanism;\n  packageUpdateMechanismMessage?: string | null;\n  packageVersion?: string | null;\n  runtimeName?: string | null;\n  runtimeVersion?: string | null;\n  startTime?: string;\n  startupPath?: string | null;\n  urlBase?: string | null;\n  version?: string | null;\n}",
+        "TMDbCountryCode",
+        "export type TMDbCountryCode = \"au\" | \"br\" | \"ca\" | \"fr\" | \"de\" | \"gb\" | \"in\" | \"ie\" | \"it\" | \"nz\" | \"ro\" | \"es\" | \"us\";",
+        "export interface TagDetailsResource {\n  autoTagIds?: number[] | null;\n  delayProfileIds?: number[] | null;\n  downloadClientIds?: number[] | null;\n  id?: number;\n  importListIds?: number[] | null;\n  indexerIds?: number[] | null;\n  label?: string | null;\n  movieIds?: number[] | null;\n  notificationIds?: number[] | null;\n  releaseProfileIds?: number[] | null;\n}",
+        "export interface TagResource {\n  id?: number;\n  label?: string | null;\n}",
+        "export interface TaskResource {\n  id?: number;\n  interval?: number;\n  lastDuration?: string;\n  lastExecution?: string;\n  lastStartTime?: string;\n  name?: string | null;\n  nextExecution?: string;\n  taskName?: string | null;\n}",
+        "TrackedDownloadState",
+        "export type TrackedDownloadState = \"downloading\" | \"importBlocked\" | \"importPending\" | \"importing\" | \"imported\" | \"failedPending\" | \"failed\" | \"ignored\";",
+        "TrackedDownloadStatus",
+        "export type TrackedDownloadStatus = \"ok\" | \"warning\" | \"error\";",
+        "TrackedDownloadStatusMessage",
+        "export interface TrackedDownloadStatusMessage {\n  messages?: string[] | null;\n  title?: string | null;\n}",
+        "export interface UiConfigResource {\n  calendarWeekColumnHeader?: string | null;\n  enableColorImpairedMode?: boolean;\n  firstDayOfWeek?: number;\n  id?: number;\n  longDateFormat?: string | null;\n  movieInfoLanguage?: number;\n  movieRuntimeFormat?: MovieRuntimeFormatType;\n  shortDateFormat?: string | null;\n  showRelativeDates?: boolean;\n  theme?: string | null;\n  timeFormat?: string | null;\n  uiLanguage?: number;\n}",
+        "UnmappedFolder",
+        "export interface UnmappedFolder {\n  name?: string | null;\n  path?: string | null;\n  relativePath?: string | null;\n}",
+        "UpdateChanges",
+        "export interface UpdateChanges {\n  fixed?: string[] | null;\n  new?: string[] | null;\n}",
+        "UpdateMechanism",
+        "export type UpdateMechanism = \"builtIn\" | \"script\" | \"external\" | \"apt\" | \"docker\";",
+        "export interface UpdateResource {\n  branch?: string | null;\n  changes?: UpdateChanges;\n  fileName?: string | null;\n  hash?: string | null;\n  id?: number;\n  installable?: boolean;\n  installed?: boolean;\n  installedOn?: string | null;\n  latest?: boolean;\n  releaseDate?: string;\n  url?: string | null;\n  version?: string | null;\n}",
+    ),
+    string_ends: &[
+        24, 48, 50, 85, 96, 96, 117, 139, 157, 210, 214, 230, 239, 260, 269, 291, 313, 333, 353,
+        360, 385, 410, 422, 446, 471, 527, 551, 563, 588, 613, 638, 663, 675, 701, 728, 786, 812,
+        826, 853, 880, 902, 925, 988, 1019, 1038, 1061, 1084, 1106, 1129, 1183, 1205, 1215, 1238,
+        1261, 1280, 1300, 1351, 1370, 1377, 1397, 1417, 1438, 1459, 1467, 1485, 1503, 1521, 1532,
+        1566, 1571, 1590, 1610, 1661, 1680, 1691, 1712, 1734, 1787, 1808, 1817, 1839, 1861, 1886,
+        1911, 1923, 1950, 1977, 1991, 2008, 2026, 2035, 2049, 2065, 2079, 2112, 2161, 2178, 2183,
+        2201, 2219, 2246, 2273, 2287, 2317, 2347, 2364, 2387, 2410, 2420, 2446, 2472, 2478, 2494,
+        2510, 2513, 2516, 2520, 2523, 2570, 2585, 2592, 2604, 2620, 2627, 2642, 2723, 2733, 2757,
+        2773, 2791, 2812, 2868, 2883, 2902, 2978, 2997, 3018, 3069, 3091, 3117, 3130, 3147, 3155,
+        3159, 3167, 3176, 3189, 3196, 3256, 3303, 3351, 3424, 3469, 3486, 3549, 3580, 3599, 3622,
+        3696, 3713, 3726, 3733, 3737, 3785, 3799, 3811, 3827, 3830, 3835, 3839, 3850, 3888, 3918,
+        3988, 4001, 4009, 4023, 4041, 4047, 4122, 4140, 4150, 4170, 4193, 4243, 4254, 4269, 4341,
+        4356, 4373, 4420, 4445, 4474, 4534, 4562, 4582, 4613, 4647, 4662, 4681, 4731, 4749, 4759,
+        4780, 4804, 4825, 4850, 4906, 4930, 4946, 4973, 5003, 5021, 5043, 5096, 5117, 5130, 5154,
+        5181, 5207, 5237, 5298, 5327, 5348, 5380, 5415, 5434, 5457, 5511, 5533, 5547, 5572, 5600,
+        5617, 5638, 5690, 5710, 5722, 5745, 5771, 5797, 5827, 5849, 5866, 5878, 5902, 5914, 5933,
+        5987, 6005, 6018, 6035, 6083, 6099, 6107, 6126, 6148, 6167, 6182, 6223, 6233, 6247, 6253,
+        6269, 6288, 6334, 6348, 6364, 6384, 6461, 6481, 6503, 6555, 6571, 6591, 6668, 6688, 6710,
+        6762, 6785, 6812, 6828, 6848, 6925, 6945, 6967, 7019, 7032, 7049, 7123, 7140, 7149, 7167,
+        7189, 7268, 7290, 7314, 7368, 7393, 7422, 7436, 7454, 7538, 7565, 7585, 7644, 7664, 7688,
+        7761, 7802, 7815, 7832, 7906, 7923, 7932, 7960, 7988, 7998, 8006, 8018, 8066, 8113, 8189,
+        8201, 8215, 8233, 8267, 8279, 8289, 8314, 8343, 8362, 8385, 8395, 8409, 8480, 8494, 8500,
+        8511, 8526, 8536, 8545, 8557, 8566, 8573, 8634, 8663, 8670, 8687, 8708, 8761, 8833, 8848,
+        8865, 8886, 8890, 8904, 8922, 8997, 9015, 9035, 9085, 9105, 9129, 9143, 9165, 9180, 9196,
+        9217, 9242, 9253, 9268, 9340, 9355, 9372, 9419, 9437, 9459, 9474, 9493, 9569, 9588, 9599,
+        9611, 9627, 9700, 9716, 9724, 9742, 9763, 9811, 9827, 9847, 9859, 9884, 9913, 9973, 10001,
+        10008, 10019, 10024, 10081, 10106, 10109, 10121, 10137, 10209, 10224, 10231, 10255, 10282,
+        10290, 10341, 10360, 10383, 10396, 10427, 10461, 10470, 10476, 10486, 10493, 10507, 10523,
+        10543, 10562, 10568, 10645, 10665, 10677, 10712, 10751, 10801, 10811, 10823, 10839, 10912,
+        10928, 10946, 10994, 11013, 11036, 11045, 11058, 11076, 11086, 11101, 11146, 11168, 11193,
+        11204, 11220, 11240, 11244, 11255, 11276, 11301, 11307, 11328, 11353, 11366, 11383, 11395,
+        11469, 11486, 11505, 11554, 11570, 11590, 11667, 11687, 11709, 11761, 11784, 11811, 11820,
+        11833, 11838, 11883, 11896, 11901, 11909, 11914, 11958, 11970, 11974, 11995, 12020, 12102,
+        12127, 12144, 12171, 12201, 12258, 12286, 12318, 12381, 12412, 12430, 12452, 12531, 12553,
+        12577, 12631, 12656, 12685, 12705, 12714, 12727, 12751, 12759, 12765, 12813, 12881, 12940,
+        12967, 12984, 13005, 13075, 13088, 13100, 13116, 13136, 13187, 13206, 13217, 13228, 13243,
+        13315, 13330, 13337, 13355, 13377, 13456, 13478, 13502, 13556, 13577, 13602, 13684, 13709,
+        13736, 13793, 13803, 13817, 13893, 13912, 13923, 13937, 13955, 14030, 14048, 14068, 14118,
+        14135, 14156, 14227, 14241, 14258, 14279, 14285, 14312, 14343, 14360, 14381, 14427, 14441,
+        14456, 14475, 14544, 14556, 14560, 14581, 14605, 14649, 14656, 14667, 14735, 14746, 14759,
+        14802, 14816, 14834, 14909, 14927, 14937, 14957, 14980, 15030, 15040, 15054, 15125, 15139,
+        15145, 15162, 15183, 15192, 15251, 15278, 15284, 15302, 15324, 15331, 15347, 15359, 15376,
+        15393, 15410, 15429, 15438, 15472, 15508, 15512, 15536, 15563, 15572, 15599, 15629, 15644,
+        15664, 15689, 15716, 15731, 15761, 15793, 15814, 15834, 15857, 15880, 15906, 15918, 15945,
+        15974, 15991, 16011, 16031, 16054, 16064, 16073, 16092, 16213, 16300, 16317, 16403, 16432,
+        16445, 16473, 16503, 16521, 16542, 16563, 16587, 16597, 16614, 16634, 16645, 16662, 16694,
+        16728, 16750, 16775, 16800, 16828, 16847, 16867, 16890, 16901, 16922, 16945, 16957, 17004,
+        17021, 17041, 17052, 17071, 17093, 17108, 17140, 17174, 17207, 17243, 17338, 17380, 17399,
+        17421, 17441, 17464, 17472, 17493, 17507, 17563, 17587, 17607, 17638, 17659, 17686, 17710,
+        17742, 17767, 17790, 17809, 17831, 17852, 17874, 17896, 17926, 17959, 17964, 17987, 18011,
+        18031, 18050, 18070, 18086, 18103, 18121, 18136, 18145, 18161, 18179, 18198, 18218, 18242,
+        18264, 18291, 18319, 18351, 18375, 18399, 18426, 18439, 18453, 18515, 18530, 18727, 18897,
+        18992, 19001, 19054, 19080, 19161, 19179, 19252, 19454, 19484, 19715, 19868, 19878, 19937,
+        20004, 20343, 20558, 20577, 20666, 20691, 20784, 20807, 21228, 21664, 21951, 21973, 22071,
+        22502, 22517, 22573, 23135, 23148, 23218, 23231, 23344, 23358, 23426, 23744, 23754, 23795,
+        23946, 24068, 24261, 24292, 24606, 24618, 24669, 25028, 25175, 25440, 25731, 26219, 26235,
+        26299, 26547, 26560, 26622, 26627, 27126, 27138, 27196, 27213, 27283, 27441, 27870, 28081,
+        29307, 29596, 29689, 29766, 30190, 30425, 31042, 31056, 31156, 31179, 31273, 31533, 31825,
+        31933, 32491, 32559, 32664, 32743, 32910, 32921, 33151, 33354, 33762, 34301, 34415, 34430,
+        34545, 34562, 35053, 35868, 35968, 36319, 36327, 36414, 36426, 36497, 36520, 36608, 36950,
+        37205, 37740, 37761, 37951, 39430, 39637, 39659, 39723, 39746, 39875, 39890, 39979, 40226,
+        41441, 41689, 41704, 42187, 42246, 42258, 42331, 42356, 42478, 42497, 42583, 42598, 42691,
+        42710, 42773, 42782, 42835, 42842, 42981, 43065, 43278, 43290, 43367, 43400, 43589, 43938,
+        43951, 44084, 44147, 44956, 45163, 45327, 45546, 45557, 45646, 45656, 45699, 45706, 45861,
+        45874, 45928, 46136, 47385, 47529, 47687, 47709, 47781, 47789, 47877, 48053, 48064, 48121,
+        48133, 48276, 48289, 48356, 48366, 48432, 49351, 49366, 49485, 49845, 49917, 50141, 50161,
+        50314, 50335, 50398, 50426, 50530, 50945, 50959, 51074, 51087, 51173, 51188, 51271, 51599,
+    ],
+    names: &[
+        2, 66, 67, 90, 91, 92, 93, 123, 124, 142, 143, 144, 145, 146, 147, 123, 162, 167, 168, 169,
+        170, 178, 242, 2, 243, 244, 245, 246, 247, 143, 144, 146, 147, 317, 318, 319, 169, 170,
+        326, 327, 162, 340, 341, 342, 343, 142, 143, 144, 344, 146, 147, 341, 342, 123, 355, 341,
+        342, 364, 365, 366, 400, 143, 144, 146, 147, 411, 340, 425, 426, 123, 411, 123, 444, 445,
+        178, 453, 457, 462, 123, 477, 342, 509, 343, 142, 143, 144, 510, 344, 146, 147, 511, 342,
+        123, 596, 143, 144, 146, 147, 609, 612, 615, 638, 707, 717,
+    ],
+    parameters: &[
+        [2, 0, 1, 3, 0, 0],
+        [66, 1, 0, 68, 3, 1],
+        [67, 1, 0, 68, 3, 1],
+        [2, 0, 1, 3, 0, 0],
+        [90, 1, 0, 68, 3, 1],
+        [91, 1, 0, 68, 3, 1],
+        [92, 1, 0, 94, 3, 1],
+        [93, 1, 0, 68, 3, 1],
+        [90, 1, 0, 68, 3, 1],
+        [91, 1, 0, 68, 3, 1],
+        [2, 0, 1, 3, 0, 0],
+        [92, 1, 0, 94, 3, 1],
+        [93, 1, 0, 68, 3, 1],
+        [123, 1, 0, 3, 3, 1],
+        [124, 1, 0, 3, 3, 1],
+        [142, 1, 0, 148, 3, 1],
+        [143, 1, 0, 149, 3, 1],
+        [144, 1, 0, 150, 3, 1],
+        [145, 1, 0, 151, 3, 1],
+        [146, 1, 0, 152, 3, 1],
+        [147, 1, 0, 153, 3, 1],
+        [123, 1, 0, 3, 3, 1],
+        [162, 0, 1, 163, 0, 0],
+        [167, 1, 0, 171, 3, 1],
+        [168, 1, 0, 171, 3, 1],
+        [169, 1, 0, 172, 3, 1],
+        [170, 1, 0, 68, 3, 1],
+        [178, 1, 0, 3, 3, 1],
+        [242, 1, 0, 248, 3, 1],
+        [2, 1, 0, 3, 3, 1],
+        [243, 1, 0, 153, 3, 1],
+        [244, 1, 0, 249, 3, 1],
+        [245, 1, 0, 249, 3, 1],
+        [246, 1, 0, 153, 3, 1],
+        [247, 1, 0, 153, 3, 1],
+        [162, 0, 1, 259, 0, 0],
+        [143, 1, 0, 149, 3, 1],
+        [144, 1, 0, 150, 3, 1],
+        [146, 1, 0, 152, 3, 1],
+        [147, 1, 0, 153, 3, 1],
+        [317, 1, 0, 320, 3, 1],
+        [318, 1, 0, 321, 3, 1],
+        [319, 1, 0, 322, 3, 1],
+        [169, 1, 0, 172, 3, 1],
+        [170, 1, 0, 68, 3, 1],
+        [326, 1, 0, 68, 3, 1],
+        [327, 1, 0, 68, 3, 1],
+        [162, 1, 0, 153, 3, 1],
+        [162, 1, 0, 153, 3, 1],
+        [340, 1, 0, 153, 3, 1],
+        [341, 1, 0, 148, 3, 1],
+        [342, 1, 0, 249, 3, 1],
+        [343, 1, 0, 148, 3, 1],
+        [142, 1, 0, 148, 3, 1],
+        [143, 1, 0, 149, 3, 1],
+        [144, 1, 0, 150, 3, 1],
+        [344, 1, 0, 148, 3, 1],
+        [146, 1, 0, 152, 3, 1],
+        [147, 1, 0, 153, 3, 1],
+        [341, 1, 0, 350, 3, 1],
+        [342, 1, 0, 68, 3, 1],
+        [123, 1, 0, 3, 3, 1],
+        [355, 1, 0, 171, 3, 1],
+        [341, 1, 0, 350, 3, 1],
+        [342, 1, 0, 68, 3, 1],
+        [364, 1, 0, 68, 3, 1],
+        [365, 1, 0, 68, 3, 1],
+        [366, 1, 0, 68, 3, 1],
+        [400, 1, 0, 153, 3, 1],
+        [143, 1, 0, 149, 3, 1],
+        [144, 1, 0, 150, 3, 1],
+        [146, 1, 0, 152, 3, 1],
+        [147, 1, 0, 153, 3, 1],
+        [411, 0, 1, 412, 0, 0],
+        [340, 1, 0, 153, 3, 1],
+        [425, 1, 0, 94, 3, 1],
+        [426, 1, 0, 153, 3, 1],
+        [123, 1, 0, 3, 3, 1],
+        [411, 0, 1, 432, 0, 0],
+        [123, 0, 1, 3, 0, 0],
+        [444, 1, 0, 68, 3, 1],
+        [445, 1, 0, 3, 3, 1],
+        [178, 1, 0, 3, 3, 1],
+        [453, 1, 0, 153, 3, 1],
+        [457, 1, 0, 153, 3, 1],
+        [462, 1, 0, 148, 3, 1],
+        [123, 1, 0, 148, 3, 1],
+        [477, 1, 0, 153, 3, 1],
+        [342, 1, 0, 68, 3, 1],
+        [509, 1, 0, 68, 3, 1],
+        [343, 1, 0, 148, 3, 1],
+        [142, 1, 0, 148, 3, 1],
+        [143, 1, 0, 149, 3, 1],
+        [144, 1, 0, 150, 3, 1],
+        [510, 1, 0, 512, 3, 1],
+        [344, 1, 0, 148, 3, 1],
+        [146, 1, 0, 152, 3, 1],
+        [147, 1, 0, 153, 3, 1],
+        [511, 1, 0, 513, 3, 1],
+        [342, 1, 0, 68, 3, 1],
+        [123, 1, 0, 3, 3, 1],
+        [123, 1, 0, 148, 3, 1],
+        [596, 1, 0, 94, 3, 1],
+        [143, 1, 0, 149, 3, 1],
+        [144, 1, 0, 150, 3, 1],
+        [146, 1, 0, 152, 3, 1],
+        [147, 1, 0, 153, 3, 1],
+        [609, 1, 0, 68, 3, 1],
+        [612, 0, 1, 153, 0, 0],
+        [615, 1, 0, 68, 3, 1],
+        [638, 1, 0, 153, 3, 1],
+        [2, 0, 1, 153, 0, 0],
+        [707, 1, 0, 3, 3, 1],
+        [2, 0, 1, 3, 0, 0],
+        [609, 1, 0, 68, 3, 1],
+        [2, 0, 1, 3, 0, 0],
+        [2, 0, 1, 153, 0, 0],
+        [717, 1, 0, 68, 3, 1],
+    ],
+    representations: &[
+        [0, 8, 0, 9, 10],
+        [0, 11, 0, 9, 10],
+        [0, 12, 0, 9, 10],
+        [0, 11, 0, 25, 10],
+        [0, 11, 0, 35, 10],
+        [0, 8, 0, 42, 10],
+        [0, 11, 0, 42, 10],
+        [0, 12, 0, 42, 10],
+        [0, 11, 0, 49, 10],
+        [0, 11, 0, 56, 10],
+        [0, 8, 0, 72, 10],
+        [0, 11, 0, 72, 10],
+        [0, 12, 0, 72, 10],
+        [0, 11, 0, 77, 10],
+        [0, 8, 0, 95, 10],
+        [0, 11, 0, 95, 10],
+        [0, 12, 0, 95, 10],
+        [118, 11, 0, 118, 10],
+        [118, 11, 0, 125, 10],
+        [118, 12, 0, 125, 10],
+        [118, 126, 3, 125, 10],
+        [118, 11, 0, 131, 10],
+        [118, 12, 0, 131, 10],
+        [118, 126, 3, 131, 10],
+        [118, 11, 0, 134, 10],
+        [118, 11, 0, 137, 10],
+        [118, 12, 0, 137, 10],
+        [118, 126, 3, 137, 10],
+        [118, 11, 0, 154, 10],
+        [118, 11, 0, 158, 10],
+        [118, 12, 0, 158, 10],
+        [118, 126, 3, 158, 10],
+        [118, 11, 0, 173, 10],
+        [118, 11, 0, 179, 10],
+        [118, 11, 0, 184, 10],
+        [118, 12, 0, 184, 10],
+        [118, 126, 3, 184, 10],
+        [118, 11, 0, 187, 10],
+        [118, 12, 0, 187, 10],
+        [118, 126, 3, 187, 10],
+        [118, 11, 0, 190, 10],
+        [118, 12, 0, 190, 10],
+        [118, 126, 3, 190, 10],
+        [118, 11, 0, 193, 10],
+        [118, 11, 0, 193, 10],
+        [118, 12, 0, 193, 10],
+        [118, 126, 3, 193, 10],
+        [118, 11, 0, 200, 10],
+        [118, 12, 0, 200, 10],
+        [118, 126, 3, 200, 10],
+        [118, 11, 0, 207, 10],
+        [118, 11, 0, 207, 10],
+        [118, 12, 0, 207, 10],
+        [118, 126, 3, 207, 10],
+        [118, 11, 0, 214, 10],
+        [118, 11, 0, 214, 10],
+        [118, 12, 0, 214, 10],
+        [118, 126, 3, 214, 10],
+        [118, 11, 0, 221, 10],
+        [118, 11, 0, 221, 10],
+        [118, 12, 0, 221, 10],
+        [118, 126, 3, 221, 10],
+        [118, 11, 0, 228, 10],
+        [118, 11, 0, 228, 10],
+        [118, 12, 0, 228, 10],
+        [118, 126, 3, 228, 10],
+        [118, 11, 0, 235, 10],
+        [118, 12, 0, 235, 10],
+        [118, 126, 3, 235, 10],
+        [118, 11, 0, 252, 10],
+        [118, 11, 0, 252, 10],
+        [118, 12, 0, 252, 10],
+        [118, 126, 3, 252, 10],
+        [118, 11, 0, 265, 10],
+        [118, 12, 0, 265, 10],
+        [118, 126, 3, 265, 10],
+        [118, 11, 0, 269, 10],
+        [118, 12, 0, 269, 10],
+        [118, 126, 3, 269, 10],
+        [118, 11, 0, 272, 10],
+        [118, 12, 0, 272, 10],
+        [118, 126, 3, 272, 10],
+        [118, 11, 0, 275, 10],
+        [118, 11, 0, 278, 10],
+        [118, 12, 0, 278, 10],
+        [118, 126, 3, 278, 10],
+        [118, 11, 0, 283, 10],
+        [118, 12, 0, 283, 10],
+        [118, 126, 3, 283, 10],
+        [118, 11, 0, 286, 10],
+        [118, 12, 0, 286, 10],
+        [118, 126, 3, 286, 10],
+        [118, 11, 0, 289, 10],
+        [118, 12, 0, 289, 10],
+        [118, 126, 3, 289, 10],
+        [118, 11, 0, 294, 10],
+        [118, 11, 0, 297, 10],
+        [118, 12, 0, 297, 10],
+        [118, 126, 3, 297, 10],
+        [118, 11, 0, 302, 10],
+        [118, 11, 0, 305, 10],
+        [118, 12, 0, 305, 10],
+        [118, 126, 3, 305, 10],
+        [118, 11, 0, 308, 10],
+        [118, 11, 0, 312, 10],
+        [118, 12, 0, 312, 10],
+        [118, 126, 3, 312, 10],
+        [118, 11, 0, 335, 10],
+        [118, 12, 0, 335, 10],
+        [118, 126, 3, 335, 10],
+        [118, 11, 0, 345, 10],
+        [118, 11, 0, 351, 10],
+        [118, 11, 0, 358, 10],
+        [118, 11, 0, 361, 10],
+        [118, 12, 0, 361, 10],
+        [118, 126, 3, 361, 10],
+        [118, 11, 0, 372, 10],
+        [118, 11, 0, 375, 10],
+        [118, 12, 0, 375, 10],
+        [118, 126, 3, 375, 10],
+        [118, 11, 0, 380, 10],
+        [118, 12, 0, 380, 10],
+        [118, 126, 3, 380, 10],
+        [118, 11, 0, 385, 10],
+        [118, 12, 0, 385, 10],
+        [118, 126, 3, 385, 10],
+        [118, 11, 0, 390, 10],
+        [118, 12, 0, 390, 10],
+        [118, 126, 3, 390, 10],
+        [118, 11, 0, 153, 10],
+        [118, 12, 0, 153, 10],
+        [118, 126, 3, 153, 10],
+        [118, 11, 0, 396, 10],
+        [118, 11, 0, 401, 10],
+        [118, 11, 0, 406, 10],
+        [118, 12, 0, 406, 10],
+        [118, 126, 3, 406, 10],
+        [118, 11, 0, 427, 10],
+        [118, 11, 0, 436, 10],
+        [118, 11, 0, 439, 10],
+        [118, 12, 0, 439, 10],
+        [118, 126, 3, 439, 10],
+        [118, 11, 0, 173, 10],
+        [118, 12, 0, 173, 10],
+        [118, 126, 3, 173, 10],
+        [118, 11, 0, 447, 10],
+        [118, 12, 0, 447, 10],
+        [118, 126, 3, 447, 10],
+        [118, 11, 0, 447, 10],
+        [118, 11, 0, 463, 10],
+        [118, 11, 0, 466, 10],
+        [118, 12, 0, 466, 10],
+        [118, 126, 3, 466, 10],
+        [118, 11, 0, 469, 10],
+        [118, 11, 0, 472, 10],
+        [118, 12, 0, 472, 10],
+        [118, 126, 3, 472, 10],
+        [118, 11, 0, 478, 10],
+        [118, 12, 0, 478, 10],
+        [118, 126, 3, 478, 10],
+        [118, 11, 0, 483, 10],
+        [118, 11, 0, 488, 10],
+        [118, 12, 0, 488, 10],
+        [118, 126, 3, 488, 10],
+        [118, 11, 0, 493, 10],
+        [118, 12, 0, 493, 10],
+        [118, 126, 3, 493, 10],
+        [118, 11, 0, 496, 10],
+        [118, 12, 0, 496, 10],
+        [118, 126, 3, 496, 10],
+        [118, 11, 0, 500, 10],
+        [118, 12, 0, 500, 10],
+        [118, 126, 3, 500, 10],
+        [118, 11, 0, 503, 10],
+        [118, 12, 0, 503, 10],
+        [118, 126, 3, 503, 10],
+        [118, 11, 0, 514, 10],
+        [118, 11, 0, 518, 10],
+        [118, 12, 0, 518, 10],
+        [118, 126, 3, 518, 10],
+        [118, 11, 0, 523, 10],
+        [118, 12, 0, 523, 10],
+        [118, 126, 3, 523, 10],
+        [118, 11, 0, 528, 10],
+        [118, 11, 0, 533, 10],
+        [118, 12, 0, 533, 10],
+        [118, 126, 3, 533, 10],
+        [118, 11, 0, 536, 10],
+        [118, 12, 0, 536, 10],
+        [118, 126, 3, 536, 10],
+        [118, 11, 0, 539, 10],
+        [118, 12, 0, 539, 10],
+        [118, 126, 3, 539, 10],
+        [118, 11, 0, 542, 10],
+        [118, 12, 0, 542, 10],
+        [118, 126, 3, 542, 10],
+        [118, 11, 0, 545, 10],
+        [118, 12, 0, 545, 10],
+        [118, 126, 3, 545, 10],
+        [118, 11, 0, 550, 10],
+        [118, 12, 0, 550, 10],
+        [118, 126, 3, 550, 10],
+        [118, 11, 0, 553, 10],
+        [118, 12, 0, 553, 10],
+        [118, 126, 3, 553, 10],
+        [118, 11, 0, 556, 10],
+        [118, 12, 0, 556, 10],
+        [118, 126, 3, 556, 10],
+        [118, 11, 0, 565, 10],
+        [118, 12, 0, 565, 10],
+        [118, 126, 3, 565, 10],
+        [118, 11, 0, 569, 10],
+        [118, 12, 0, 569, 10],
+        [118, 126, 3, 569, 10],
+        [118, 11, 0, 574, 10],
+        [118, 12, 0, 574, 10],
+        [118, 126, 3, 574, 10],
+        [118, 11, 0, 577, 10],
+        [118, 12, 0, 577, 10],
+        [118, 126, 3, 577, 10],
+        [118, 11, 0, 580, 10],
+        [118, 12, 0, 580, 10],
+        [118, 126, 3, 580, 10],
+        [118, 11, 0, 583, 10],
+        [118, 12, 0, 583, 10],
+        [118, 126, 3, 583, 10],
+        [118, 11, 0, 588, 10],
+        [118, 12, 0, 588, 10],
+        [118, 126, 3, 588, 10],
+        [118, 11, 0, 591, 10],
+        [118, 12, 0, 591, 10],
+        [118, 126, 3, 591, 10],
+        [118, 11, 0, 597, 10],
+        [0, 11, 0, 137, 10],
+        [0, 11, 0, 190, 10],
+        [118, 11, 0, 190, 10],
+        [0, 11, 0, 272, 10],
+        [0, 11, 0, 278, 10],
+        [0, 11, 0, 286, 10],
+        [0, 11, 0, 297, 10],
+        [118, 11, 0, 297, 10],
+        [0, 11, 0, 305, 10],
+        [0, 8, 0, 302, 10],
+        [0, 11, 0, 302, 10],
+        [0, 12, 0, 302, 10],
+        [0, 11, 0, 361, 10],
+        [118, 11, 0, 361, 10],
+        [0, 8, 0, 173, 10],
+        [0, 11, 0, 173, 10],
+        [0, 12, 0, 173, 10],
+        [0, 11, 0, 375, 10],
+        [118, 11, 0, 375, 10],
+        [0, 639, 2, 640, 641],
+        [0, 11, 0, 643, 10],
+        [0, 11, 0, 439, 10],
+        [118, 11, 0, 439, 10],
+        [0, 11, 0, 447, 10],
+        [0, 11, 0, 173, 10],
+        [0, 11, 0, 472, 10],
+        [118, 11, 0, 472, 10],
+        [0, 11, 0, 503, 10],
+        [0, 11, 0, 95, 10],
+        [0, 11, 0, 670, 10],
+        [118, 11, 0, 528, 10],
+        [118, 12, 0, 528, 10],
+        [118, 126, 3, 528, 10],
+        [0, 8, 0, 536, 10],
+        [0, 11, 0, 536, 10],
+        [0, 12, 0, 536, 10],
+        [0, 11, 0, 542, 10],
+        [0, 11, 0, 553, 10],
+        [0, 639, 2, 681, 682],
+        [0, 11, 0, 580, 10],
+        [0, 11, 0, 690, 10],
+        [0, 11, 0, 184, 10],
+        [0, 11, 0, 193, 10],
+        [0, 8, 0, 200, 10],
+        [0, 11, 0, 200, 10],
+        [0, 12, 0, 200, 10],
+        [0, 11, 0, 207, 10],
+        [0, 11, 0, 214, 10],
+        [0, 11, 0, 221, 10],
+        [0, 11, 0, 228, 10],
+        [0, 8, 0, 235, 10],
+        [0, 11, 0, 235, 10],
+        [0, 12, 0, 235, 10],
+        [0, 11, 0, 252, 10],
+        [118, 11, 0, 278, 10],
+        [0, 11, 0, 463, 10],
+        [0, 11, 0, 466, 10],
+        [0, 8, 0, 493, 10],
+        [0, 11, 0, 493, 10],
+        [0, 12, 0, 493, 10],
+        [0, 8, 0, 488, 10],
+        [0, 11, 0, 488, 10],
+        [0, 12, 0, 488, 10],
+        [0, 8, 0, 542, 10],
+        [0, 11, 0, 542, 10],
+        [0, 12, 0, 542, 10],
+    ],
+    operations: &[
+        [0, 3, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 4, 5],
+        [6, 3, 7, 0, 0, 0, 0, 0, 0, 1, 0, 3, 0, 0, 14, 0, 14, 5],
+        [15, 3, 16, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 14, 5],
+        [17, 3, 18, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 19, 5],
+        [20, 3, 21, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 22, 5],
+        [23, 3, 24, 0, 0, 0, 0, 0, 0, 1, 3, 1, 0, 0, 27, 0, 27, 5],
+        [28, 3, 29, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 27, 5],
+        [30, 3, 31, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 32, 5],
+        [33, 3, 34, 0, 0, 0, 0, 0, 0, 1, 4, 1, 0, 0, 37, 0, 37, 5],
+        [38, 3, 39, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 37, 5],
+        [40, 3, 41, 0, 0, 0, 0, 0, 0, 1, 5, 3, 0, 0, 44, 0, 44, 5],
+        [45, 3, 46, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 44, 5],
+        [47, 3, 48, 0, 0, 0, 0, 0, 0, 1, 8, 1, 0, 0, 51, 0, 51, 5],
+        [52, 3, 53, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 51, 5],
+        [54, 3, 55, 0, 0, 0, 0, 0, 0, 1, 9, 1, 0, 0, 58, 0, 58, 5],
+        [59, 3, 60, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 58, 5],
+        [61, 3, 62, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 63, 5],
+        [64, 3, 65, 0, 1, 1, 2, 1, 3, 0, 0, 0, 0, 0, 0, 0, 69, 5],
+        [70, 3, 71, 0, 0, 0, 0, 0, 0, 1, 10, 3, 0, 0, 74, 0, 74, 5],
+        [75, 3, 76, 0, 0, 0, 0, 0, 0, 1, 13, 1, 0, 0, 79, 0, 79, 5],
+        [80, 3, 81, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 79, 5],
+        [82, 3, 83, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 84, 5],
+        [85, 3, 86, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 87, 5],
+        [88, 3, 89, 0, 0, 3, 4, 4, 4, 1, 14, 3, 0, 0, 97, 0, 97, 5],
+        [98, 3, 99, 0, 1, 3, 4, 8, 5, 0, 0, 0, 0, 0, 0, 0, 97, 5],
+        [100, 3, 101, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 102, 5],
+        [103, 3, 104, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 105, 5],
+        [106, 3, 107, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 108, 5],
+        [109, 3, 110, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 111, 5],
+        [112, 3, 113, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 114, 5],
+        [
+            115, 0, 116, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17, 1, 0, 120, 120, 5,
+        ],
+        [
+            121, 0, 122, 0, 0, 7, 2, 13, 2, 0, 0, 0, 18, 3, 0, 128, 128, 5,
+        ],
+        [
+            129, 0, 130, 0, 1, 0, 0, 0, 1, 0, 0, 0, 21, 3, 0, 128, 128, 5,
+        ],
+        [132, 0, 133, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 1, 0, 136, 4, 5],
+        [136, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 25, 3, 0, 136, 4, 5],
+        [138, 0, 139, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 5],
+        [
+            140, 0, 141, 0, 0, 9, 6, 15, 6, 0, 0, 0, 28, 1, 0, 156, 14, 5,
+        ],
+        [
+            156, 0, 157, 0, 0, 15, 1, 21, 1, 0, 0, 0, 29, 3, 0, 160, 14, 5,
+        ],
+        [160, 0, 161, 16, 1, 0, 0, 22, 1, 0, 0, 0, 0, 0, 0, 0, 164, 5],
+        [
+            165, 0, 166, 0, 0, 17, 4, 23, 4, 0, 0, 0, 32, 1, 0, 175, 175, 5,
+        ],
+        [
+            176, 0, 177, 0, 0, 21, 1, 27, 1, 0, 0, 0, 33, 1, 0, 181, 181, 5,
+        ],
+        [
+            182, 0, 183, 0, 1, 0, 0, 0, 1, 0, 0, 0, 34, 3, 0, 181, 181, 5,
+        ],
+        [185, 0, 186, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 3, 0, 189, 19, 5],
+        [189, 0, 18, 0, 1, 0, 0, 0, 1, 0, 0, 0, 40, 3, 0, 189, 19, 5],
+        [
+            191, 0, 192, 0, 0, 0, 0, 0, 0, 0, 0, 0, 43, 1, 0, 195, 195, 5,
+        ],
+        [
+            196, 0, 197, 0, 1, 0, 0, 0, 1, 0, 0, 0, 44, 3, 0, 195, 195, 5,
+        ],
+        [
+            198, 0, 199, 0, 0, 0, 0, 0, 0, 0, 0, 0, 47, 3, 0, 202, 202, 5,
+        ],
+        [
+            203, 0, 204, 0, 1, 0, 0, 0, 1, 0, 0, 0, 47, 3, 0, 202, 202, 5,
+        ],
+        [
+            205, 0, 206, 0, 0, 0, 0, 0, 0, 0, 0, 0, 50, 1, 0, 209, 209, 5,
+        ],
+        [
+            210, 0, 211, 0, 1, 0, 0, 0, 1, 0, 0, 0, 51, 3, 0, 209, 209, 5,
+        ],
+        [
+            212, 0, 213, 0, 0, 0, 0, 0, 0, 0, 0, 0, 54, 1, 0, 216, 216, 5,
+        ],
+        [
+            217, 0, 218, 0, 1, 0, 0, 0, 1, 0, 0, 0, 55, 3, 0, 216, 216, 5,
+        ],
+        [
+            219, 0, 220, 0, 0, 0, 0, 0, 0, 0, 0, 0, 58, 1, 0, 223, 223, 5,
+        ],
+        [
+            224, 0, 225, 0, 1, 0, 0, 0, 1, 0, 0, 0, 59, 3, 0, 223, 223, 5,
+        ],
+        [
+            226, 0, 227, 0, 0, 0, 0, 0, 0, 0, 0, 0, 62, 1, 0, 230, 230, 5,
+        ],
+        [
+            231, 0, 232, 0, 1, 0, 0, 0, 1, 0, 0, 0, 63, 3, 0, 230, 230, 5,
+        ],
+        [
+            233, 0, 234, 0, 0, 0, 0, 0, 0, 0, 0, 0, 66, 3, 0, 237, 237, 5,
+        ],
+        [
+            238, 0, 239, 0, 1, 0, 0, 0, 1, 0, 0, 0, 66, 3, 0, 237, 237, 5,
+        ],
+        [240, 0, 241, 0, 0, 22, 7, 28, 7, 0, 0, 0, 0, 0, 0, 0, 237, 5],
+        [
+            250, 0, 251, 0, 0, 0, 0, 0, 0, 0, 0, 0, 69, 1, 0, 254, 254, 5,
+        ],
+        [
+            255, 0, 256, 0, 1, 0, 0, 0, 1, 0, 0, 0, 70, 3, 0, 254, 254, 5,
+        ],
+        [257, 0, 258, 16, 1, 0, 0, 35, 1, 0, 0, 0, 0, 0, 0, 0, 164, 5],
+        [260, 0, 261, 0, 0, 7, 2, 13, 2, 0, 0, 0, 0, 0, 0, 0, 262, 5],
+        [
+            263, 0, 264, 0, 1, 0, 0, 0, 1, 0, 0, 0, 73, 3, 0, 267, 262, 5,
+        ],
+        [267, 0, 268, 0, 0, 0, 0, 0, 0, 0, 0, 0, 76, 3, 0, 271, 22, 5],
+        [271, 0, 21, 0, 1, 0, 0, 0, 1, 0, 0, 0, 79, 3, 0, 271, 22, 5],
+        [273, 0, 274, 0, 0, 0, 0, 0, 0, 0, 0, 0, 82, 1, 0, 277, 27, 5],
+        [277, 0, 29, 0, 1, 0, 0, 0, 1, 0, 0, 0, 83, 3, 0, 277, 27, 5],
+        [279, 0, 280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 27, 5],
+        [281, 0, 282, 0, 0, 0, 0, 0, 0, 0, 0, 0, 86, 3, 0, 285, 32, 5],
+        [285, 0, 31, 0, 1, 0, 0, 0, 1, 0, 0, 0, 89, 3, 0, 285, 32, 5],
+        [
+            287, 0, 288, 0, 0, 0, 0, 0, 0, 0, 0, 0, 92, 3, 0, 291, 291, 5,
+        ],
+        [292, 0, 293, 0, 0, 0, 0, 0, 0, 0, 0, 0, 95, 1, 0, 296, 37, 5],
+        [296, 0, 39, 0, 1, 0, 0, 0, 1, 0, 0, 0, 96, 3, 0, 296, 37, 5],
+        [298, 0, 299, 0, 0, 0, 0, 0, 0, 0, 0, 0, 95, 1, 0, 296, 37, 5],
+        [300, 0, 301, 0, 0, 0, 0, 0, 0, 0, 0, 0, 99, 1, 0, 304, 44, 5],
+        [304, 0, 46, 0, 1, 0, 0, 0, 1, 0, 0, 0, 100, 3, 0, 304, 44, 5],
+        [
+            306, 0, 307, 0, 0, 29, 4, 36, 4, 0, 0, 0, 103, 1, 0, 310, 44, 5,
+        ],
+        [
+            310, 0, 311, 0, 0, 15, 1, 21, 1, 0, 0, 0, 104, 3, 0, 314, 314, 5,
+        ],
+        [315, 0, 316, 0, 0, 33, 5, 40, 5, 0, 0, 0, 0, 0, 0, 0, 323, 5],
+        [324, 0, 325, 0, 0, 38, 3, 45, 3, 0, 0, 0, 0, 0, 0, 0, 328, 5],
+        [329, 0, 330, 0, 0, 16, 1, 48, 1, 0, 0, 0, 0, 0, 0, 0, 328, 5],
+        [331, 0, 332, 0, 0, 16, 1, 48, 1, 0, 0, 0, 0, 0, 0, 0, 328, 5],
+        [
+            333, 0, 334, 0, 0, 0, 0, 0, 0, 0, 0, 0, 107, 3, 0, 337, 337, 5,
+        ],
+        [
+            338, 0, 339, 0, 0, 41, 10, 49, 10, 0, 0, 0, 110, 1, 0, 347, 347, 5,
+        ],
+        [
+            348, 0, 349, 0, 0, 51, 3, 59, 3, 0, 0, 0, 111, 1, 0, 353, 347, 5,
+        ],
+        [
+            353, 0, 354, 0, 0, 54, 3, 62, 3, 0, 0, 0, 111, 1, 0, 353, 347, 5,
+        ],
+        [
+            356, 0, 357, 0, 0, 0, 0, 0, 0, 0, 0, 0, 112, 1, 0, 360, 51, 5,
+        ],
+        [360, 0, 53, 0, 1, 0, 0, 0, 1, 0, 0, 0, 113, 3, 0, 360, 51, 5],
+        [362, 0, 363, 0, 0, 57, 3, 65, 3, 0, 0, 0, 0, 0, 0, 0, 367, 5],
+        [
+            368, 0, 369, 0, 0, 0, 0, 0, 0, 0, 0, 0, 112, 1, 0, 360, 51, 5,
+        ],
+        [
+            370, 0, 371, 0, 0, 0, 0, 0, 0, 0, 0, 0, 116, 1, 0, 374, 58, 5,
+        ],
+        [374, 0, 60, 0, 1, 0, 0, 0, 1, 0, 0, 0, 117, 3, 0, 374, 58, 5],
+        [
+            376, 0, 377, 0, 0, 0, 0, 0, 0, 0, 0, 0, 116, 1, 0, 374, 58, 5,
+        ],
+        [
+            378, 0, 379, 0, 0, 0, 0, 0, 0, 0, 0, 0, 120, 3, 0, 382, 382, 5,
+        ],
+        [
+            383, 0, 384, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 3, 0, 387, 387, 5,
+        ],
+        [
+            388, 0, 389, 0, 1, 0, 0, 0, 1, 0, 0, 0, 126, 3, 0, 387, 387, 5,
+        ],
+        [391, 0, 392, 0, 0, 0, 0, 0, 0, 0, 0, 0, 129, 3, 0, 0, 393, 5],
+        [
+            394, 0, 395, 0, 0, 0, 0, 0, 0, 0, 0, 0, 132, 1, 0, 398, 393, 5,
+        ],
+        [
+            398, 0, 399, 0, 0, 60, 5, 68, 5, 0, 0, 0, 133, 1, 0, 403, 403, 5,
+        ],
+        [
+            404, 0, 405, 0, 0, 0, 0, 0, 0, 0, 0, 0, 134, 3, 0, 408, 408, 5,
+        ],
+        [409, 0, 410, 65, 1, 0, 0, 73, 1, 0, 0, 0, 0, 0, 0, 0, 408, 5],
+        [
+            413, 0, 414, 0, 0, 0, 0, 0, 0, 0, 0, 0, 134, 3, 0, 408, 415, 5,
+        ],
+        [416, 0, 417, 65, 1, 0, 0, 73, 1, 0, 0, 0, 0, 0, 0, 0, 415, 5],
+        [418, 0, 419, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 164, 5],
+        [420, 0, 421, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 422, 5],
+        [
+            423, 0, 424, 0, 0, 66, 4, 74, 4, 0, 0, 0, 137, 1, 0, 429, 429, 5,
+        ],
+        [430, 0, 431, 70, 2, 0, 0, 78, 2, 0, 0, 0, 0, 0, 0, 0, 433, 5],
+        [
+            434, 0, 435, 0, 0, 0, 0, 0, 0, 0, 0, 0, 138, 1, 0, 438, 63, 5,
+        ],
+        [438, 0, 62, 0, 1, 0, 0, 0, 1, 0, 0, 0, 139, 3, 0, 438, 63, 5],
+        [
+            440, 0, 441, 0, 0, 0, 0, 0, 0, 0, 0, 0, 138, 1, 0, 438, 63, 5,
+        ],
+        [
+            442, 0, 443, 0, 0, 72, 3, 80, 3, 0, 0, 0, 142, 3, 0, 175, 69, 5,
+        ],
+        [446, 0, 65, 0, 1, 0, 0, 0, 1, 0, 0, 0, 145, 3, 0, 175, 69, 5],
+        [448, 0, 449, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 450, 5],
+        [
+            451, 0, 452, 0, 0, 75, 1, 83, 1, 0, 0, 0, 32, 1, 0, 175, 454, 5,
+        ],
+        [
+            455, 0, 456, 0, 0, 76, 1, 84, 1, 0, 0, 0, 148, 1, 0, 175, 454, 5,
+        ],
+        [
+            458, 0, 459, 0, 0, 21, 1, 27, 1, 0, 0, 0, 148, 1, 0, 175, 454, 5,
+        ],
+        [
+            460, 0, 461, 0, 0, 77, 2, 85, 2, 0, 0, 0, 149, 1, 0, 465, 79, 5,
+        ],
+        [465, 0, 81, 0, 1, 0, 0, 0, 1, 0, 0, 0, 150, 3, 0, 465, 79, 5],
+        [
+            467, 0, 468, 0, 0, 0, 0, 0, 0, 0, 0, 0, 153, 1, 0, 471, 84, 5,
+        ],
+        [471, 0, 83, 0, 1, 0, 0, 0, 1, 0, 0, 0, 154, 3, 0, 471, 84, 5],
+        [
+            473, 0, 474, 0, 0, 0, 0, 0, 0, 0, 0, 0, 153, 1, 0, 471, 84, 5,
+        ],
+        [
+            475, 0, 476, 0, 0, 79, 1, 87, 1, 0, 0, 0, 157, 3, 0, 480, 480, 5,
+        ],
+        [
+            481, 0, 482, 0, 0, 0, 0, 0, 0, 0, 0, 0, 160, 1, 0, 485, 485, 5,
+        ],
+        [
+            486, 0, 487, 0, 0, 0, 0, 0, 0, 0, 0, 0, 161, 3, 0, 490, 490, 5,
+        ],
+        [
+            491, 0, 492, 0, 1, 0, 0, 0, 1, 0, 0, 0, 164, 3, 0, 490, 490, 5,
+        ],
+        [
+            494, 0, 495, 0, 0, 0, 0, 0, 0, 0, 0, 0, 167, 3, 0, 498, 490, 5,
+        ],
+        [
+            498, 0, 499, 0, 0, 0, 0, 0, 0, 0, 0, 0, 170, 3, 0, 502, 87, 5,
+        ],
+        [502, 0, 86, 0, 1, 0, 0, 0, 1, 0, 0, 0, 173, 3, 0, 502, 87, 5],
+        [
+            504, 0, 505, 0, 0, 0, 0, 0, 0, 0, 0, 0, 173, 3, 0, 502, 506, 5,
+        ],
+        [
+            507, 0, 508, 0, 0, 80, 11, 88, 11, 0, 0, 0, 176, 1, 0, 516, 97, 5,
+        ],
+        [
+            516, 0, 517, 0, 0, 91, 2, 99, 2, 0, 0, 0, 177, 3, 0, 520, 520, 5,
+        ],
+        [
+            521, 0, 522, 0, 0, 0, 0, 0, 0, 0, 0, 0, 180, 3, 0, 525, 525, 5,
+        ],
+        [
+            526, 0, 527, 0, 0, 15, 1, 21, 1, 0, 0, 0, 183, 1, 0, 530, 530, 5,
+        ],
+        [
+            531, 0, 532, 0, 0, 0, 0, 0, 0, 0, 0, 0, 184, 3, 0, 535, 102, 5,
+        ],
+        [
+            535, 0, 101, 0, 1, 0, 0, 0, 1, 0, 0, 0, 187, 3, 0, 535, 102, 5,
+        ],
+        [
+            537, 0, 538, 0, 0, 0, 0, 0, 0, 0, 0, 0, 190, 3, 0, 541, 105, 5,
+        ],
+        [
+            541, 0, 104, 0, 1, 0, 0, 0, 1, 0, 0, 0, 193, 3, 0, 541, 105, 5,
+        ],
+        [
+            543, 0, 544, 0, 0, 15, 1, 101, 1, 0, 0, 0, 196, 3, 0, 547, 547, 5,
+        ],
+        [
+            548, 0, 549, 0, 0, 0, 0, 0, 0, 0, 0, 0, 199, 3, 0, 552, 108, 5,
+        ],
+        [
+            552, 0, 107, 0, 1, 0, 0, 0, 1, 0, 0, 0, 202, 3, 0, 552, 108, 5,
+        ],
+        [
+            554, 0, 555, 0, 0, 0, 0, 0, 0, 0, 0, 0, 205, 3, 0, 558, 111, 5,
+        ],
+        [558, 0, 559, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 560, 5],
+        [561, 0, 562, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 560, 5],
+        [
+            563, 0, 564, 0, 0, 0, 0, 0, 0, 0, 0, 0, 208, 3, 0, 567, 560, 5,
+        ],
+        [
+            567, 0, 568, 0, 0, 0, 0, 0, 0, 0, 0, 0, 211, 3, 0, 571, 571, 5,
+        ],
+        [
+            572, 0, 573, 0, 1, 0, 0, 0, 1, 0, 0, 0, 214, 3, 0, 571, 571, 5,
+        ],
+        [
+            575, 0, 576, 0, 0, 0, 0, 0, 0, 0, 0, 0, 217, 3, 0, 579, 114, 5,
+        ],
+        [
+            579, 0, 113, 0, 1, 0, 0, 0, 1, 0, 0, 0, 220, 3, 0, 579, 114, 5,
+        ],
+        [
+            581, 0, 582, 0, 0, 0, 0, 0, 0, 0, 0, 0, 223, 3, 0, 585, 585, 5,
+        ],
+        [
+            586, 0, 587, 0, 1, 0, 0, 0, 1, 0, 0, 0, 226, 3, 0, 585, 585, 5,
+        ],
+        [
+            589, 0, 590, 0, 0, 0, 0, 0, 0, 0, 0, 0, 229, 3, 0, 593, 593, 5,
+        ],
+        [
+            594, 0, 595, 0, 0, 93, 5, 102, 5, 0, 0, 0, 232, 1, 0, 599, 599, 5,
+        ],
+        [
+            600, 0, 601, 0, 0, 93, 5, 102, 5, 0, 0, 0, 232, 1, 0, 599, 602, 5,
+        ],
+        [
+            603, 1, 133, 0, 0, 0, 0, 0, 0, 1, 233, 1, 25, 3, 136, 136, 4, 5,
+        ],
+        [
+            604, 1, 186, 0, 0, 0, 0, 0, 0, 1, 234, 1, 235, 1, 189, 189, 19, 5,
+        ],
+        [
+            605, 1, 268, 0, 0, 0, 0, 0, 0, 1, 236, 1, 79, 3, 271, 271, 22, 5,
+        ],
+        [
+            606, 1, 274, 0, 0, 0, 0, 0, 0, 1, 237, 1, 83, 3, 277, 277, 27, 5,
+        ],
+        [
+            607, 1, 282, 0, 0, 0, 0, 0, 0, 1, 238, 1, 89, 3, 285, 285, 32, 5,
+        ],
+        [
+            608, 1, 293, 0, 0, 98, 1, 107, 1, 1, 239, 1, 240, 1, 296, 296, 37, 5,
+        ],
+        [
+            610, 1, 611, 99, 1, 0, 0, 108, 1, 1, 239, 1, 0, 0, 296, 0, 37, 5,
+        ],
+        [
+            613, 1, 614, 0, 0, 100, 1, 109, 1, 1, 239, 1, 0, 0, 296, 0, 37, 5,
+        ],
+        [616, 1, 617, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 5],
+        [
+            618, 1, 301, 0, 0, 0, 0, 0, 0, 1, 241, 1, 100, 3, 304, 304, 44, 5,
+        ],
+        [619, 1, 41, 0, 0, 0, 0, 0, 0, 1, 242, 3, 0, 0, 304, 0, 44, 5],
+        [620, 1, 621, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 347, 5],
+        [
+            622, 1, 357, 0, 0, 98, 1, 107, 1, 1, 245, 1, 246, 1, 360, 360, 51, 5,
+        ],
+        [
+            623, 1, 624, 99, 1, 0, 0, 108, 1, 1, 245, 1, 0, 0, 360, 0, 51, 5,
+        ],
+        [
+            625, 1, 363, 0, 0, 0, 0, 0, 0, 1, 247, 3, 0, 0, 175, 0, 367, 5,
+        ],
+        [
+            626, 1, 627, 0, 0, 100, 1, 109, 1, 1, 245, 1, 0, 0, 360, 0, 51, 5,
+        ],
+        [628, 1, 629, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 51, 5],
+        [
+            630, 1, 371, 0, 0, 98, 1, 107, 1, 1, 250, 1, 251, 1, 374, 374, 58, 5,
+        ],
+        [
+            631, 1, 632, 99, 1, 0, 0, 108, 1, 1, 250, 1, 0, 0, 374, 0, 58, 5,
+        ],
+        [
+            633, 1, 634, 0, 0, 100, 1, 109, 1, 1, 250, 1, 0, 0, 374, 0, 58, 5,
+        ],
+        [635, 1, 636, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 58, 5],
+        [
+            637, 1, 419, 0, 0, 101, 1, 110, 1, 1, 252, 1, 0, 0, 0, 0, 422, 5,
+        ],
+        [
+            642, 1, 424, 0, 0, 0, 0, 0, 0, 1, 253, 1, 0, 0, 645, 0, 429, 5,
+        ],
+        [
+            645, 1, 435, 0, 0, 98, 1, 107, 1, 1, 254, 1, 255, 1, 438, 438, 63, 5,
+        ],
+        [
+            646, 1, 647, 99, 1, 0, 0, 108, 1, 1, 254, 1, 0, 0, 438, 0, 63, 5,
+        ],
+        [
+            648, 1, 649, 0, 0, 100, 1, 109, 1, 1, 254, 1, 0, 0, 438, 0, 63, 5,
+        ],
+        [650, 1, 651, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 63, 5],
+        [
+            652, 1, 443, 0, 0, 0, 0, 0, 0, 1, 256, 1, 148, 1, 175, 175, 69, 5,
+        ],
+        [
+            653, 1, 654, 0, 0, 0, 0, 0, 0, 1, 257, 1, 32, 1, 175, 175, 655, 5,
+        ],
+        [
+            656, 1, 468, 0, 0, 98, 1, 107, 1, 1, 258, 1, 259, 1, 471, 471, 84, 5,
+        ],
+        [
+            657, 1, 658, 99, 1, 0, 0, 108, 1, 1, 258, 1, 0, 0, 471, 0, 84, 5,
+        ],
+        [
+            659, 1, 660, 0, 0, 100, 1, 109, 1, 1, 258, 1, 0, 0, 471, 0, 84, 5,
+        ],
+        [661, 1, 662, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 84, 5],
+        [
+            663, 1, 499, 0, 0, 0, 0, 0, 0, 1, 260, 1, 173, 3, 502, 502, 87, 5,
+        ],
+        [
+            664, 1, 665, 0, 0, 0, 0, 0, 0, 1, 261, 1, 0, 0, 97, 0, 666, 5,
+        ],
+        [667, 1, 668, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 666, 5],
+        [
+            669, 1, 527, 0, 0, 0, 0, 0, 0, 1, 262, 1, 0, 0, 530, 0, 530, 5,
+        ],
+        [
+            671, 1, 672, 0, 0, 0, 0, 0, 0, 1, 262, 1, 263, 3, 530, 530, 673, 5,
+        ],
+        [
+            674, 1, 532, 0, 0, 0, 0, 0, 0, 1, 266, 3, 187, 3, 535, 535, 102, 5,
+        ],
+        [
+            675, 1, 538, 0, 0, 0, 0, 0, 0, 1, 269, 1, 193, 3, 541, 541, 105, 5,
+        ],
+        [
+            676, 1, 549, 0, 0, 0, 0, 0, 0, 1, 270, 1, 202, 3, 552, 552, 108, 5,
+        ],
+        [677, 1, 678, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 111, 5],
+        [679, 1, 680, 0, 0, 0, 0, 0, 0, 2, 271, 1, 0, 0, 0, 0, 111, 5],
+        [683, 1, 684, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 560, 5],
+        [685, 1, 686, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 560, 5],
+        [
+            687, 1, 576, 0, 0, 0, 0, 0, 0, 1, 272, 1, 220, 3, 579, 579, 114, 5,
+        ],
+        [
+            688, 2, 1, 0, 1, 0, 0, 111, 1, 1, 233, 1, 25, 3, 136, 136, 4, 5,
+        ],
+        [
+            689, 2, 177, 0, 0, 0, 0, 0, 0, 1, 273, 1, 0, 0, 692, 0, 181, 5,
+        ],
+        [
+            692, 2, 183, 0, 1, 0, 0, 111, 1, 1, 274, 1, 34, 3, 181, 181, 181, 5,
+        ],
+        [
+            693, 2, 197, 0, 1, 0, 0, 111, 1, 1, 275, 1, 44, 3, 195, 195, 195, 5,
+        ],
+        [
+            694, 2, 204, 0, 1, 0, 0, 111, 1, 1, 276, 3, 47, 3, 202, 202, 202, 5,
+        ],
+        [
+            695, 2, 211, 0, 1, 0, 0, 111, 1, 1, 279, 1, 51, 3, 209, 209, 209, 5,
+        ],
+        [
+            696, 2, 218, 0, 1, 0, 0, 111, 1, 1, 280, 1, 55, 3, 216, 216, 216, 5,
+        ],
+        [
+            697, 2, 225, 0, 1, 0, 0, 111, 1, 1, 281, 1, 59, 3, 223, 223, 223, 5,
+        ],
+        [
+            698, 2, 232, 0, 1, 0, 0, 111, 1, 1, 282, 1, 63, 3, 230, 230, 230, 5,
+        ],
+        [
+            699, 2, 239, 0, 1, 0, 0, 111, 1, 1, 283, 3, 66, 3, 237, 237, 237, 5,
+        ],
+        [
+            700, 2, 256, 0, 1, 0, 0, 111, 1, 1, 286, 1, 70, 3, 254, 254, 254, 5,
+        ],
+        [
+            701, 2, 21, 0, 1, 0, 0, 111, 1, 1, 236, 1, 79, 3, 271, 271, 22, 5,
+        ],
+        [
+            702, 2, 24, 0, 0, 0, 0, 0, 0, 1, 3, 1, 287, 1, 27, 277, 27, 5,
+        ],
+        [
+            703, 2, 29, 0, 1, 0, 0, 111, 1, 1, 237, 1, 83, 3, 277, 277, 27, 5,
+        ],
+        [
+            704, 2, 31, 0, 1, 0, 0, 111, 1, 1, 238, 1, 89, 3, 285, 285, 32, 5,
+        ],
+        [
+            705, 2, 706, 0, 1, 102, 1, 112, 2, 0, 0, 0, 86, 3, 0, 285, 32, 5,
+        ],
+        [
+            708, 2, 34, 0, 0, 0, 0, 0, 0, 1, 4, 1, 240, 1, 37, 296, 37, 5,
+        ],
+        [
+            709, 2, 39, 0, 1, 98, 1, 114, 2, 1, 239, 1, 240, 1, 296, 296, 37, 5,
+        ],
+        [
+            710, 2, 46, 0, 1, 0, 0, 111, 1, 1, 241, 1, 100, 3, 304, 304, 44, 5,
+        ],
+        [
+            711, 2, 48, 0, 0, 0, 0, 0, 0, 1, 8, 1, 246, 1, 51, 360, 51, 5,
+        ],
+        [
+            712, 2, 53, 0, 1, 98, 1, 114, 2, 1, 245, 1, 246, 1, 360, 360, 51, 5,
+        ],
+        [
+            713, 2, 55, 0, 0, 0, 0, 0, 0, 1, 9, 1, 251, 1, 58, 374, 58, 5,
+        ],
+        [
+            714, 2, 60, 0, 1, 98, 1, 114, 2, 1, 250, 1, 251, 1, 374, 374, 58, 5,
+        ],
+        [
+            715, 2, 62, 0, 1, 98, 1, 114, 2, 1, 254, 1, 255, 1, 438, 438, 63, 5,
+        ],
+        [
+            716, 2, 65, 0, 1, 103, 1, 116, 2, 1, 256, 1, 148, 1, 175, 175, 69, 5,
+        ],
+        [718, 2, 71, 0, 0, 0, 0, 0, 0, 1, 10, 3, 0, 0, 74, 0, 74, 5],
+        [719, 2, 76, 0, 0, 0, 0, 0, 0, 1, 288, 1, 0, 0, 465, 0, 79, 5],
+        [
+            720, 2, 81, 0, 1, 0, 0, 111, 1, 1, 289, 1, 150, 3, 465, 465, 79, 5,
+        ],
+        [721, 2, 722, 0, 0, 0, 0, 0, 0, 1, 13, 1, 0, 0, 79, 0, 79, 5],
+        [
+            723, 2, 83, 0, 1, 98, 1, 114, 2, 1, 258, 1, 259, 1, 471, 471, 84, 5,
+        ],
+        [
+            724, 2, 492, 0, 1, 0, 0, 111, 1, 1, 290, 3, 164, 3, 490, 490, 490, 5,
+        ],
+        [
+            725, 2, 726, 0, 0, 0, 0, 0, 0, 1, 293, 3, 0, 0, 490, 0, 490, 5,
+        ],
+        [
+            727, 2, 86, 0, 1, 0, 0, 111, 1, 1, 260, 1, 173, 3, 502, 502, 87, 5,
+        ],
+        [
+            728, 2, 101, 0, 1, 0, 0, 111, 1, 1, 266, 3, 187, 3, 535, 535, 102, 5,
+        ],
+        [
+            729, 2, 104, 0, 1, 0, 0, 111, 1, 1, 296, 3, 193, 3, 541, 541, 105, 5,
+        ],
+        [
+            730, 2, 113, 0, 1, 0, 0, 111, 1, 1, 272, 1, 220, 3, 579, 579, 114, 5,
+        ],
+    ],
+    types: &[
+        [731, 732],
+        [733, 734],
+        [127, 735],
+        [119, 736],
+        [737, 738],
+        [739, 740],
+        [741, 742],
+        [135, 743],
+        [744, 745],
+        [557, 746],
+        [747, 748],
+        [13, 749],
+        [159, 750],
+        [155, 751],
+        [752, 753],
+        [754, 755],
+        [756, 757],
+        [180, 758],
+        [691, 759],
+        [760, 761],
+        [19, 762],
+        [763, 764],
+        [188, 765],
+        [766, 767],
+        [768, 769],
+        [770, 771],
+        [266, 772],
+        [773, 774],
+        [270, 775],
+        [26, 776],
+        [276, 777],
+        [778, 779],
+        [780, 781],
+        [284, 782],
+        [290, 783],
+        [36, 784],
+        [194, 785],
+        [295, 786],
+        [787, 788],
+        [313, 789],
+        [790, 791],
+        [792, 793],
+        [794, 795],
+        [796, 797],
+        [336, 798],
+        [352, 799],
+        [346, 800],
+        [201, 801],
+        [50, 802],
+        [208, 803],
+        [43, 804],
+        [303, 805],
+        [309, 806],
+        [359, 807],
+        [808, 809],
+        [810, 811],
+        [57, 812],
+        [215, 813],
+        [381, 814],
+        [373, 815],
+        [387, 816],
+        [386, 817],
+        [397, 818],
+        [407, 819],
+        [820, 821],
+        [402, 822],
+        [644, 823],
+        [428, 824],
+        [433, 825],
+        [826, 827],
+        [828, 829],
+        [222, 830],
+        [229, 831],
+        [437, 832],
+        [833, 834],
+        [835, 836],
+        [837, 838],
+        [73, 839],
+        [78, 840],
+        [464, 841],
+        [842, 843],
+        [174, 844],
+        [598, 845],
+        [846, 847],
+        [848, 849],
+        [850, 851],
+        [236, 852],
+        [470, 853],
+        [479, 854],
+        [855, 856],
+        [484, 857],
+        [858, 859],
+        [860, 861],
+        [862, 863],
+        [864, 865],
+        [866, 867],
+        [868, 869],
+        [870, 871],
+        [497, 872],
+        [489, 873],
+        [874, 875],
+        [876, 877],
+        [501, 878],
+        [879, 880],
+        [96, 881],
+        [519, 882],
+        [515, 883],
+        [525, 884],
+        [524, 885],
+        [886, 887],
+        [888, 889],
+        [890, 891],
+        [892, 893],
+        [534, 894],
+        [529, 895],
+        [540, 896],
+        [546, 897],
+        [898, 899],
+        [900, 901],
+        [551, 902],
+        [903, 904],
+        [905, 906],
+        [907, 908],
+        [909, 910],
+        [566, 911],
+        [912, 913],
+        [584, 914],
+        [578, 915],
+        [570, 916],
+        [917, 918],
+        [919, 920],
+        [921, 922],
+        [253, 923],
+        [924, 925],
+        [926, 927],
+        [928, 929],
+        [592, 930],
+    ],
+};
 
 pub static OMITTED_OPERATIONS: &[OmittedOperationSpec] = &[OmittedOperationSpec {
     name: "get_by_path",
@@ -8772,554 +2121,3 @@ pub static OMITTED_OPERATIONS: &[OmittedOperationSpec] = &[OmittedOperationSpec
     path: "/",
     reason: "path parameter `path` has no matching placeholder",
 }];
-
-pub static TYPES: &[TypeDef] = &[
-    TypeDef {
-        name: "AddMovieMethod",
-        ts: "export type AddMovieMethod = \"manual\" | \"list\" | \"collection\";",
-    },
-    TypeDef {
-        name: "AddMovieOptions",
-        ts: "export interface AddMovieOptions {\n  addMethod?: AddMovieMethod;\n  ignoreEpisodesWithFiles?: boolean;\n  ignoreEpisodesWithoutFiles?: boolean;\n  monitor?: MonitorTypes;\n  searchForMovie?: boolean;\n}",
-    },
-    TypeDef {
-        name: "AlternativeTitleResource",
-        ts: "export interface AlternativeTitleResource {\n  cleanTitle?: string | null;\n  id?: number;\n  movieMetadataId?: number;\n  sourceType?: SourceType;\n  title?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ApiInfoResource",
-        ts: "export interface ApiInfoResource {\n  current?: string | null;\n  deprecated?: string[] | null;\n}",
-    },
-    TypeDef {
-        name: "ApplyTags",
-        ts: "export type ApplyTags = \"add\" | \"remove\" | \"replace\";",
-    },
-    TypeDef {
-        name: "AuthenticationRequiredType",
-        ts: "export type AuthenticationRequiredType = \"enabled\" | \"disabledForLocalAddresses\";",
-    },
-    TypeDef {
-        name: "AuthenticationType",
-        ts: "export type AuthenticationType = \"none\" | \"basic\" | \"forms\" | \"external\";",
-    },
-    TypeDef {
-        name: "AutoTaggingResource",
-        ts: "export interface AutoTaggingResource {\n  id?: number;\n  name?: string | null;\n  removeTagsAutomatically?: boolean;\n  specifications?: AutoTaggingSpecificationSchema[] | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "AutoTaggingSpecificationSchema",
-        ts: "export interface AutoTaggingSpecificationSchema {\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  name?: string | null;\n  negate?: boolean;\n  required?: boolean;\n}",
-    },
-    TypeDef {
-        name: "BackupResource",
-        ts: "export interface BackupResource {\n  id?: number;\n  name?: string | null;\n  path?: string | null;\n  size?: number;\n  time?: string;\n  type?: BackupType;\n}",
-    },
-    TypeDef {
-        name: "BackupType",
-        ts: "export type BackupType = \"scheduled\" | \"manual\" | \"update\";",
-    },
-    TypeDef {
-        name: "BlocklistBulkResource",
-        ts: "export interface BlocklistBulkResource {\n  ids?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "BlocklistResource",
-        ts: "export interface BlocklistResource {\n  customFormats?: CustomFormatResource[] | null;\n  date?: string;\n  id?: number;\n  indexer?: string | null;\n  languages?: Language[] | null;\n  message?: string | null;\n  movie?: MovieResource;\n  movieId?: number;\n  protocol?: DownloadProtocol;\n  quality?: QualityModel;\n  sourceTitle?: string | null;\n}",
-    },
-    TypeDef {
-        name: "BlocklistResourcePagingResource",
-        ts: "export interface BlocklistResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: BlocklistResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "CalendarReleaseType",
-        ts: "export type CalendarReleaseType = \"cinemaRelease\" | \"digitalRelease\" | \"physicalRelease\";",
-    },
-    TypeDef {
-        name: "CertificateValidationType",
-        ts: "export type CertificateValidationType = \"enabled\" | \"disabledForLocalAddresses\" | \"disabled\";",
-    },
-    TypeDef {
-        name: "CollectionMovieResource",
-        ts: "export interface CollectionMovieResource {\n  cleanTitle?: string | null;\n  folder?: string | null;\n  genres?: string[] | null;\n  images?: MediaCover[] | null;\n  imdbId?: string | null;\n  isExcluded?: boolean;\n  isExisting?: boolean;\n  overview?: string | null;\n  ratings?: Ratings;\n  runtime?: number;\n  sortTitle?: string | null;\n  status?: MovieStatusType;\n  title?: string | null;\n  tmdbId?: number;\n  year?: number;\n}",
-    },
-    TypeDef {
-        name: "CollectionResource",
-        ts: "export interface CollectionResource {\n  id?: number;\n  images?: MediaCover[] | null;\n  minimumAvailability?: MovieStatusType;\n  missingMovies?: number;\n  monitored?: boolean;\n  movies?: CollectionMovieResource[] | null;\n  overview?: string | null;\n  qualityProfileId?: number;\n  rootFolderPath?: string | null;\n  searchOnAdd?: boolean;\n  sortTitle?: string | null;\n  tags?: number[] | null;\n  title?: string | null;\n  tmdbId?: number;\n}",
-    },
-    TypeDef {
-        name: "CollectionUpdateResource",
-        ts: "export interface CollectionUpdateResource {\n  collectionIds?: number[] | null;\n  minimumAvailability?: MovieStatusType;\n  monitorMovies?: boolean | null;\n  monitored?: boolean | null;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  searchOnAdd?: boolean | null;\n}",
-    },
-    TypeDef {
-        name: "ColonReplacementFormat",
-        ts: "export type ColonReplacementFormat = \"delete\" | \"dash\" | \"spaceDash\" | \"spaceDashSpace\" | \"smart\";",
-    },
-    TypeDef {
-        name: "Command",
-        ts: "export interface Command {\n  clientUserAgent?: string | null;\n  completionMessage?: string | null;\n  isExclusive?: boolean;\n  isLongRunning?: boolean;\n  isTypeExclusive?: boolean;\n  lastExecutionTime?: string | null;\n  lastStartTime?: string | null;\n  name?: string | null;\n  requiresDiskAccess?: boolean;\n  sendUpdatesToClient?: boolean;\n  suppressMessages?: boolean;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
-    },
-    TypeDef {
-        name: "CommandPriority",
-        ts: "export type CommandPriority = \"normal\" | \"high\" | \"low\";",
-    },
-    TypeDef {
-        name: "CommandResource",
-        ts: "export interface CommandResource {\n  body?: Command;\n  clientUserAgent?: string | null;\n  commandName?: string | null;\n  duration?: string | null;\n  ended?: string | null;\n  exception?: string | null;\n  id?: number;\n  lastExecutionTime?: string | null;\n  message?: string | null;\n  name?: string | null;\n  priority?: CommandPriority;\n  queued?: string;\n  result?: CommandResult;\n  sendUpdatesToClient?: boolean;\n  started?: string | null;\n  stateChangeTime?: string | null;\n  status?: CommandStatus;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
-    },
-    TypeDef {
-        name: "CommandResult",
-        ts: "export type CommandResult = \"unknown\" | \"successful\" | \"unsuccessful\";",
-    },
-    TypeDef {
-        name: "CommandStatus",
-        ts: "export type CommandStatus = \"queued\" | \"started\" | \"completed\" | \"failed\" | \"aborted\" | \"cancelled\" | \"orphaned\";",
-    },
-    TypeDef {
-        name: "CommandTrigger",
-        ts: "export type CommandTrigger = \"unspecified\" | \"manual\" | \"scheduled\";",
-    },
-    TypeDef {
-        name: "CreditResource",
-        ts: "export interface CreditResource {\n  character?: string | null;\n  creditTmdbId?: string | null;\n  department?: string | null;\n  id?: number;\n  images?: MediaCover[] | null;\n  job?: string | null;\n  movieMetadataId?: number;\n  order?: number;\n  personName?: string | null;\n  personTmdbId?: number;\n  type?: CreditType;\n}",
-    },
-    TypeDef {
-        name: "CreditType",
-        ts: "export type CreditType = \"cast\" | \"crew\";",
-    },
-    TypeDef {
-        name: "CustomFilterResource",
-        ts: "export interface CustomFilterResource {\n  filters?: Record<string, unknown>[] | null;\n  id?: number;\n  label?: string | null;\n  type?: string | null;\n}",
-    },
-    TypeDef {
-        name: "CustomFormatBulkResource",
-        ts: "export interface CustomFormatBulkResource {\n  ids?: number[] | null;\n  includeCustomFormatWhenRenaming?: boolean | null;\n}",
-    },
-    TypeDef {
-        name: "CustomFormatResource",
-        ts: "export interface CustomFormatResource {\n  id?: number;\n  includeCustomFormatWhenRenaming?: boolean | null;\n  name?: string | null;\n  specifications?: CustomFormatSpecificationSchema[] | null;\n}",
-    },
-    TypeDef {
-        name: "CustomFormatSpecificationSchema",
-        ts: "export interface CustomFormatSpecificationSchema {\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  name?: string | null;\n  negate?: boolean;\n  presets?: CustomFormatSpecificationSchema[] | null;\n  required?: boolean;\n}",
-    },
-    TypeDef {
-        name: "DatabaseType",
-        ts: "export type DatabaseType = \"sqLite\" | \"postgreSQL\";",
-    },
-    TypeDef {
-        name: "DelayProfileResource",
-        ts: "export interface DelayProfileResource {\n  bypassIfAboveCustomFormatScore?: boolean;\n  bypassIfHighestQuality?: boolean;\n  enableTorrent?: boolean;\n  enableUsenet?: boolean;\n  id?: number;\n  minimumCustomFormatScore?: number;\n  order?: number;\n  preferredProtocol?: DownloadProtocol;\n  tags?: number[] | null;\n  torrentDelay?: number;\n  usenetDelay?: number;\n}",
-    },
-    TypeDef {
-        name: "DiskSpaceResource",
-        ts: "export interface DiskSpaceResource {\n  freeSpace?: number;\n  id?: number;\n  label?: string | null;\n  path?: string | null;\n  totalSpace?: number;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientBulkResource",
-        ts: "export interface DownloadClientBulkResource {\n  applyTags?: ApplyTags;\n  enable?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  removeCompletedDownloads?: boolean | null;\n  removeFailedDownloads?: boolean | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientConfigResource",
-        ts: "export interface DownloadClientConfigResource {\n  autoRedownloadFailed?: boolean;\n  autoRedownloadFailedFromInteractiveSearch?: boolean;\n  checkForFinishedDownloadInterval?: number;\n  downloadClientWorkingFolders?: string | null;\n  enableCompletedDownloadHandling?: boolean;\n  id?: number;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientResource",
-        ts: "export interface DownloadClientResource {\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: DownloadClientResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  removeCompletedDownloads?: boolean;\n  removeFailedDownloads?: boolean;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "DownloadProtocol",
-        ts: "export type DownloadProtocol = \"unknown\" | \"usenet\" | \"torrent\";",
-    },
-    TypeDef {
-        name: "ExtraFileResource",
-        ts: "export interface ExtraFileResource {\n  extension?: string | null;\n  id?: number;\n  languageTags?: string[] | null;\n  movieFileId?: number | null;\n  movieId?: number;\n  relativePath?: string | null;\n  title?: string | null;\n  type?: ExtraFileType;\n}",
-    },
-    TypeDef {
-        name: "ExtraFileType",
-        ts: "export type ExtraFileType = \"subtitle\" | \"metadata\" | \"other\";",
-    },
-    TypeDef {
-        name: "Field",
-        ts: "export interface Field {\n  advanced?: boolean;\n  helpLink?: string | null;\n  helpText?: string | null;\n  helpTextWarning?: string | null;\n  hidden?: string | null;\n  isFloat?: boolean;\n  label?: string | null;\n  name?: string | null;\n  order?: number;\n  placeholder?: string | null;\n  privacy?: PrivacyLevel;\n  section?: string | null;\n  selectOptions?: SelectOption[] | null;\n  selectOptionsProviderAction?: string | null;\n  type?: string | null;\n  unit?: string | null;\n  value?: unknown | null;\n}",
-    },
-    TypeDef {
-        name: "FileDateType",
-        ts: "export type FileDateType = \"none\" | \"cinemas\" | \"release\";",
-    },
-    TypeDef {
-        name: "HealthCheckResult",
-        ts: "export type HealthCheckResult = \"ok\" | \"notice\" | \"warning\" | \"error\";",
-    },
-    TypeDef {
-        name: "HealthResource",
-        ts: "export interface HealthResource {\n  id?: number;\n  message?: string | null;\n  source?: string | null;\n  type?: HealthCheckResult;\n  wikiUrl?: string | null;\n}",
-    },
-    TypeDef {
-        name: "HistoryResource",
-        ts: "export interface HistoryResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  data?: Record<string, string | null> | null;\n  date?: string;\n  downloadId?: string | null;\n  eventType?: MovieHistoryEventType;\n  id?: number;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  movieId?: number;\n  quality?: QualityModel;\n  qualityCutoffNotMet?: boolean;\n  sourceTitle?: string | null;\n}",
-    },
-    TypeDef {
-        name: "HistoryResourcePagingResource",
-        ts: "export interface HistoryResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: HistoryResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "HostConfigResource",
-        ts: "export interface HostConfigResource {\n  analyticsEnabled?: boolean;\n  apiKey?: string | null;\n  applicationUrl?: string | null;\n  authenticationMethod?: AuthenticationType;\n  authenticationRequired?: AuthenticationRequiredType;\n  backupFolder?: string | null;\n  backupInterval?: number;\n  backupRetention?: number;\n  bindAddress?: string | null;\n  branch?: string | null;\n  certificateValidation?: CertificateValidationType;\n  consoleLogLevel?: string | null;\n  enableSsl?: boolean;\n  id?: number;\n  instanceName?: string | null;\n  launchBrowser?: boolean;\n  logLevel?: string | null;\n  logSizeLimit?: number;\n  password?: string | null;\n  passwordConfirmation?: string | null;\n  port?: number;\n  proxyBypassFilter?: string | null;\n  proxyBypassLocalAddresses?: boolean;\n  proxyEnabled?: boolean;\n  proxyHostname?: string | null;\n  proxyPassword?: string | null;\n  proxyPort?: number;\n  proxyType?: ProxyType;\n  proxyUsername?: string | null;\n  sslCertPassword?: string | null;\n  sslCertPath?: string | null;\n  sslPort?: number;\n  trustCgnatIpAddresses?: boolean;\n  updateAutomatically?: boolean;\n  updateMechanism?: UpdateMechanism;\n  updateScriptPath?: string | null;\n  urlBase?: string | null;\n  username?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ImportListBulkResource",
-        ts: "export interface ImportListBulkResource {\n  applyTags?: ApplyTags;\n  enableAuto?: boolean | null;\n  enabled?: boolean | null;\n  ids?: number[] | null;\n  minimumAvailability?: MovieStatusType;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "ImportListConfigResource",
-        ts: "export interface ImportListConfigResource {\n  id?: number;\n  listSyncLevel?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ImportListExclusionBulkResource",
-        ts: "export interface ImportListExclusionBulkResource {\n  ids?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "ImportListExclusionResource",
-        ts: "export interface ImportListExclusionResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  movieTitle?: string | null;\n  movieYear?: number;\n  name?: string | null;\n  presets?: ImportListExclusionResource[] | null;\n  tags?: number[] | null;\n  tmdbId?: number;\n}",
-    },
-    TypeDef {
-        name: "ImportListExclusionResourcePagingResource",
-        ts: "export interface ImportListExclusionResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: ImportListExclusionResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "ImportListResource",
-        ts: "export interface ImportListResource {\n  configContract?: string | null;\n  enableAuto?: boolean;\n  enabled?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  listOrder?: number;\n  listType?: ImportListType;\n  message?: ProviderMessage;\n  minRefreshInterval?: string;\n  minimumAvailability?: MovieStatusType;\n  monitor?: MonitorTypes;\n  name?: string | null;\n  presets?: ImportListResource[] | null;\n  qualityProfileId?: number;\n  rootFolderPath?: string | null;\n  searchOnAdd?: boolean;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "ImportListType",
-        ts: "export type ImportListType = \"program\" | \"tmdb\" | \"trakt\" | \"plex\" | \"simkl\" | \"other\" | \"advanced\";",
-    },
-    TypeDef {
-        name: "ImportRejectionResource",
-        ts: "export interface ImportRejectionResource {\n  reason?: string | null;\n  type?: RejectionType;\n}",
-    },
-    TypeDef {
-        name: "IndexerBulkResource",
-        ts: "export interface IndexerBulkResource {\n  applyTags?: ApplyTags;\n  enableAutomaticSearch?: boolean | null;\n  enableInteractiveSearch?: boolean | null;\n  enableRss?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerConfigResource",
-        ts: "export interface IndexerConfigResource {\n  allowHardcodedSubs?: boolean;\n  availabilityDelay?: number;\n  id?: number;\n  maximumSize?: number;\n  minimumAge?: number;\n  preferIndexerFlags?: boolean;\n  retention?: number;\n  rssSyncInterval?: number;\n  whitelistedHardcodedSubs?: string | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerFlagResource",
-        ts: "export interface IndexerFlagResource {\n  id?: number;\n  name?: string | null;\n  nameLower?: string | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerResource",
-        ts: "export interface IndexerResource {\n  configContract?: string | null;\n  downloadClientId?: number;\n  enableAutomaticSearch?: boolean;\n  enableInteractiveSearch?: boolean;\n  enableRss?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: IndexerResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  supportsRss?: boolean;\n  supportsSearch?: boolean;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "Language",
-        ts: "export interface Language {\n  id?: number;\n  name?: string | null;\n}",
-    },
-    TypeDef {
-        name: "LanguageResource",
-        ts: "export interface LanguageResource {\n  id?: number;\n  name?: string | null;\n  nameLower?: string | null;\n}",
-    },
-    TypeDef {
-        name: "LocalizationLanguageResource",
-        ts: "export interface LocalizationLanguageResource {\n  identifier?: string | null;\n}",
-    },
-    TypeDef {
-        name: "LogFileResource",
-        ts: "export interface LogFileResource {\n  contentsUrl?: string | null;\n  downloadUrl?: string | null;\n  filename?: string | null;\n  id?: number;\n  lastWriteTime?: string;\n}",
-    },
-    TypeDef {
-        name: "LogResource",
-        ts: "export interface LogResource {\n  exception?: string | null;\n  exceptionType?: string | null;\n  id?: number;\n  level?: string | null;\n  logger?: string | null;\n  message?: string | null;\n  method?: string | null;\n  time?: string;\n}",
-    },
-    TypeDef {
-        name: "LogResourcePagingResource",
-        ts: "export interface LogResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: LogResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "ManualImportReprocessResource",
-        ts: "export interface ManualImportReprocessResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadId?: string | null;\n  id?: number;\n  indexerFlags?: number;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  movieId?: number;\n  path?: string | null;\n  quality?: QualityModel;\n  rejections?: ImportRejectionResource[] | null;\n  releaseGroup?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ManualImportResource",
-        ts: "export interface ManualImportResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadId?: string | null;\n  folderName?: string | null;\n  id?: number;\n  indexerFlags?: number;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  movieFileId?: number | null;\n  name?: string | null;\n  path?: string | null;\n  quality?: QualityModel;\n  qualityWeight?: number;\n  rejections?: ImportRejectionResource[] | null;\n  relativePath?: string | null;\n  releaseGroup?: string | null;\n  size?: number;\n}",
-    },
-    TypeDef {
-        name: "MediaCover",
-        ts: "export interface MediaCover {\n  coverType?: MediaCoverTypes;\n  remoteUrl?: string | null;\n  url?: string | null;\n}",
-    },
-    TypeDef {
-        name: "MediaCoverTypes",
-        ts: "export type MediaCoverTypes = \"unknown\" | \"poster\" | \"banner\" | \"fanart\" | \"screenshot\" | \"headshot\" | \"clearlogo\";",
-    },
-    TypeDef {
-        name: "MediaInfoResource",
-        ts: "export interface MediaInfoResource {\n  audioBitrate?: number;\n  audioChannels?: number;\n  audioCodec?: string | null;\n  audioLanguages?: string | null;\n  audioStreamCount?: number;\n  id?: number;\n  resolution?: string | null;\n  runTime?: string | null;\n  scanType?: string | null;\n  subtitles?: string | null;\n  videoBitDepth?: number;\n  videoBitrate?: number;\n  videoCodec?: string | null;\n  videoDynamicRange?: string | null;\n  videoDynamicRangeType?: string | null;\n  videoFps?: number;\n}",
-    },
-    TypeDef {
-        name: "MediaManagementConfigResource",
-        ts: "export interface MediaManagementConfigResource {\n  autoRenameFolders?: boolean;\n  autoUnmonitorPreviouslyDownloadedMovies?: boolean;\n  chmodFolder?: string | null;\n  chownGroup?: string | null;\n  copyUsingHardlinks?: boolean;\n  createEmptyMovieFolders?: boolean;\n  deleteEmptyFolders?: boolean;\n  downloadPropersAndRepacks?: ProperDownloadTypes;\n  enableMediaInfo?: boolean;\n  extraFileExtensions?: string | null;\n  fileDate?: FileDateType;\n  id?: number;\n  importExtraFiles?: boolean;\n  minimumFreeSpaceWhenImporting?: number;\n  pathsDefaultStatic?: boolean;\n  recycleBin?: string | null;\n  recycleBinCleanupDays?: number;\n  rescanAfterRefresh?: RescanAfterRefreshType;\n  scriptImportPath?: string | null;\n  setPermissionsLinux?: boolean;\n  skipFreeSpaceCheckWhenImporting?: boolean;\n  useScriptImport?: boolean;\n}",
-    },
-    TypeDef {
-        name: "MetadataConfigResource",
-        ts: "export interface MetadataConfigResource {\n  certificationCountry?: TMDbCountryCode;\n  id?: number;\n}",
-    },
-    TypeDef {
-        name: "MetadataResource",
-        ts: "export interface MetadataResource {\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: MetadataResource[] | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "Modifier",
-        ts: "export type Modifier = \"none\" | \"regional\" | \"screener\" | \"rawhd\" | \"brdisk\" | \"remux\";",
-    },
-    TypeDef {
-        name: "MonitorTypes",
-        ts: "export type MonitorTypes = \"movieOnly\" | \"movieAndCollection\" | \"none\";",
-    },
-    TypeDef {
-        name: "MovieCollectionResource",
-        ts: "export interface MovieCollectionResource {\n  title?: string | null;\n  tmdbId?: number;\n}",
-    },
-    TypeDef {
-        name: "MovieEditorResource",
-        ts: "export interface MovieEditorResource {\n  addImportExclusion?: boolean;\n  applyTags?: ApplyTags;\n  deleteFiles?: boolean;\n  minimumAvailability?: MovieStatusType;\n  monitored?: boolean | null;\n  moveFiles?: boolean;\n  movieIds?: number[] | null;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "MovieFileListResource",
-        ts: "export interface MovieFileListResource {\n  edition?: string | null;\n  indexerFlags?: number | null;\n  languages?: Language[] | null;\n  movieFileIds?: number[] | null;\n  quality?: QualityModel;\n  releaseGroup?: string | null;\n  sceneName?: string | null;\n}",
-    },
-    TypeDef {
-        name: "MovieFileResource",
-        ts: "export interface MovieFileResource {\n  customFormatScore?: number | null;\n  customFormats?: CustomFormatResource[] | null;\n  dateAdded?: string;\n  edition?: string | null;\n  id?: number;\n  indexerFlags?: number | null;\n  languages?: Language[] | null;\n  mediaInfo?: MediaInfoResource;\n  movieId?: number;\n  originalFilePath?: string | null;\n  path?: string | null;\n  quality?: QualityModel;\n  qualityCutoffNotMet?: boolean;\n  relativePath?: string | null;\n  releaseGroup?: string | null;\n  sceneName?: string | null;\n  size?: number;\n}",
-    },
-    TypeDef {
-        name: "MovieHistoryEventType",
-        ts: "export type MovieHistoryEventType = \"unknown\" | \"grabbed\" | \"downloadFolderImported\" | \"downloadFailed\" | \"movieFileDeleted\" | \"movieFolderImported\" | \"movieFileRenamed\" | \"downloadIgnored\";",
-    },
-    TypeDef {
-        name: "MovieResource",
-        ts: "export interface MovieResource {\n  addOptions?: AddMovieOptions;\n  added?: string;\n  alternateTitles?: AlternativeTitleResource[] | null;\n  certification?: string | null;\n  cleanTitle?: string | null;\n  collection?: MovieCollectionResource;\n  digitalRelease?: string | null;\n  folder?: string | null;\n  folderName?: string | null;\n  genres?: string[] | null;\n  hasFile?: boolean | null;\n  id?: number;\n  images?: MediaCover[] | null;\n  imdbId?: string | null;\n  inCinemas?: string | null;\n  isAvailable?: boolean;\n  keywords?: string[] | null;\n  lastSearchTime?: string | null;\n  minimumAvailability?: MovieStatusType;\n  monitored?: boolean;\n  movieFile?: MovieFileResource;\n  movieFileId?: number;\n  originalLanguage?: Language;\n  originalTitle?: string | null;\n  overview?: string | null;\n  path?: string | null;\n  physicalRelease?: string | null;\n  physicalReleaseNote?: string | null;\n  popularity?: number;\n  qualityProfileId?: number;\n  ratings?: Ratings;\n  releaseDate?: string | null;\n  remotePoster?: string | null;\n  rootFolderPath?: string | null;\n  runtime?: number;\n  secondaryYear?: number | null;\n  secondaryYearSourceId?: number;\n  sizeOnDisk?: number | null;\n  sortTitle?: string | null;\n  statistics?: MovieStatisticsResource;\n  status?: MovieStatusType;\n  studio?: string | null;\n  tags?: number[] | null;\n  title?: string | null;\n  titleSlug?: string | null;\n  tmdbId?: number;\n  website?: string | null;\n  year?: number;\n  youTubeTrailerId?: string | null;\n}",
-    },
-    TypeDef {
-        name: "MovieResourcePagingResource",
-        ts: "export interface MovieResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: MovieResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "MovieRuntimeFormatType",
-        ts: "export type MovieRuntimeFormatType = \"hoursMinutes\" | \"minutes\";",
-    },
-    TypeDef {
-        name: "MovieStatisticsResource",
-        ts: "export interface MovieStatisticsResource {\n  movieFileCount?: number;\n  releaseGroups?: string[] | null;\n  sizeOnDisk?: number;\n}",
-    },
-    TypeDef {
-        name: "MovieStatusType",
-        ts: "export type MovieStatusType = \"tba\" | \"announced\" | \"inCinemas\" | \"released\" | \"deleted\";",
-    },
-    TypeDef {
-        name: "NamingConfigResource",
-        ts: "export interface NamingConfigResource {\n  colonReplacementFormat?: ColonReplacementFormat;\n  id?: number;\n  movieFolderFormat?: string | null;\n  renameMovies?: boolean;\n  replaceIllegalCharacters?: boolean;\n  standardMovieFormat?: string | null;\n}",
-    },
-    TypeDef {
-        name: "NotificationResource",
-        ts: "export interface NotificationResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  includeHealthWarnings?: boolean;\n  infoLink?: string | null;\n  link?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  onApplicationUpdate?: boolean;\n  onDownload?: boolean;\n  onGrab?: boolean;\n  onHealthIssue?: boolean;\n  onHealthRestored?: boolean;\n  onManualInteractionRequired?: boolean;\n  onMovieAdded?: boolean;\n  onMovieDelete?: boolean;\n  onMovieFileDelete?: boolean;\n  onMovieFileDeleteForUpgrade?: boolean;\n  onRename?: boolean;\n  onUpgrade?: boolean;\n  presets?: NotificationResource[] | null;\n  supportsOnApplicationUpdate?: boolean;\n  supportsOnDownload?: boolean;\n  supportsOnGrab?: boolean;\n  supportsOnHealthIssue?: boolean;\n  supportsOnHealthRestored?: boolean;\n  supportsOnManualInteractionRequired?: boolean;\n  supportsOnMovieAdded?: boolean;\n  supportsOnMovieDelete?: boolean;\n  supportsOnMovieFileDelete?: boolean;\n  supportsOnMovieFileDeleteForUpgrade?: boolean;\n  supportsOnRename?: boolean;\n  supportsOnUpgrade?: boolean;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ParseResource",
-        ts: "export interface ParseResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  id?: number;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  parsedMovieInfo?: ParsedMovieInfo;\n  title?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ParsedMovieInfo",
-        ts: "export interface ParsedMovieInfo {\n  edition?: string | null;\n  hardcodedSubs?: string | null;\n  imdbId?: string | null;\n  languages?: Language[] | null;\n  movieTitle?: string | null;\n  movieTitles?: string[] | null;\n  originalTitle?: string | null;\n  primaryMovieTitle?: string | null;\n  quality?: QualityModel;\n  releaseGroup?: string | null;\n  releaseHash?: string | null;\n  releaseTitle?: string | null;\n  simpleReleaseTitle?: string | null;\n  tmdbId?: number;\n  year?: number;\n}",
-    },
-    TypeDef {
-        name: "PingResource",
-        ts: "export interface PingResource {\n  status?: string | null;\n}",
-    },
-    TypeDef {
-        name: "PrivacyLevel",
-        ts: "export type PrivacyLevel = \"normal\" | \"password\" | \"apiKey\" | \"userName\";",
-    },
-    TypeDef {
-        name: "ProfileFormatItemResource",
-        ts: "export interface ProfileFormatItemResource {\n  format?: number;\n  id?: number;\n  name?: string | null;\n  score?: number;\n}",
-    },
-    TypeDef {
-        name: "ProperDownloadTypes",
-        ts: "export type ProperDownloadTypes = \"preferAndUpgrade\" | \"doNotUpgrade\" | \"doNotPrefer\";",
-    },
-    TypeDef {
-        name: "ProviderMessage",
-        ts: "export interface ProviderMessage {\n  message?: string | null;\n  type?: ProviderMessageType;\n}",
-    },
-    TypeDef {
-        name: "ProviderMessageType",
-        ts: "export type ProviderMessageType = \"info\" | \"warning\" | \"error\";",
-    },
-    TypeDef {
-        name: "ProxyType",
-        ts: "export type ProxyType = \"http\" | \"socks4\" | \"socks5\";",
-    },
-    TypeDef {
-        name: "Quality",
-        ts: "export interface Quality {\n  id?: number;\n  modifier?: Modifier;\n  name?: string | null;\n  resolution?: number;\n  source?: QualitySource;\n}",
-    },
-    TypeDef {
-        name: "QualityDefinitionLimitsResource",
-        ts: "export interface QualityDefinitionLimitsResource {\n  max?: number;\n  min?: number;\n}",
-    },
-    TypeDef {
-        name: "QualityDefinitionResource",
-        ts: "export interface QualityDefinitionResource {\n  id?: number;\n  maxSize?: number | null;\n  minSize?: number | null;\n  preferredSize?: number | null;\n  quality?: Quality;\n  title?: string | null;\n  weight?: number;\n}",
-    },
-    TypeDef {
-        name: "QualityModel",
-        ts: "export interface QualityModel {\n  quality?: Quality;\n  revision?: Revision;\n}",
-    },
-    TypeDef {
-        name: "QualityProfileQualityItemResource",
-        ts: "export interface QualityProfileQualityItemResource {\n  allowed?: boolean;\n  id?: number;\n  items?: QualityProfileQualityItemResource[] | null;\n  name?: string | null;\n  quality?: Quality;\n}",
-    },
-    TypeDef {
-        name: "QualityProfileResource",
-        ts: "export interface QualityProfileResource {\n  cutoff?: number;\n  cutoffFormatScore?: number;\n  formatItems?: ProfileFormatItemResource[] | null;\n  id?: number;\n  items?: QualityProfileQualityItemResource[] | null;\n  language?: Language;\n  minFormatScore?: number;\n  minUpgradeFormatScore?: number;\n  name?: string | null;\n  upgradeAllowed?: boolean;\n}",
-    },
-    TypeDef {
-        name: "QualitySource",
-        ts: "export type QualitySource = \"unknown\" | \"cam\" | \"telesync\" | \"telecine\" | \"workprint\" | \"dvd\" | \"tv\" | \"webdl\" | \"webrip\" | \"bluray\";",
-    },
-    TypeDef {
-        name: "QueueBulkResource",
-        ts: "export interface QueueBulkResource {\n  ids?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "QueueResource",
-        ts: "export interface QueueResource {\n  added?: string | null;\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadClient?: string | null;\n  downloadClientHasPostImportCategory?: boolean;\n  downloadId?: string | null;\n  errorMessage?: string | null;\n  estimatedCompletionTime?: string | null;\n  id?: number;\n  indexer?: string | null;\n  languages?: Language[] | null;\n  movie?: MovieResource;\n  movieId?: number | null;\n  outputPath?: string | null;\n  protocol?: DownloadProtocol;\n  quality?: QualityModel;\n  size?: number;\n  sizeleft?: number;\n  status?: QueueStatus;\n  statusMessages?: TrackedDownloadStatusMessage[] | null;\n  timeleft?: string | null;\n  title?: string | null;\n  trackedDownloadState?: TrackedDownloadState;\n  trackedDownloadStatus?: TrackedDownloadStatus;\n}",
-    },
-    TypeDef {
-        name: "QueueResourcePagingResource",
-        ts: "export interface QueueResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: QueueResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "QueueStatus",
-        ts: "export type QueueStatus = \"unknown\" | \"queued\" | \"paused\" | \"downloading\" | \"completed\" | \"failed\" | \"warning\" | \"delay\" | \"downloadClientUnavailable\" | \"fallback\";",
-    },
-    TypeDef {
-        name: "QueueStatusResource",
-        ts: "export interface QueueStatusResource {\n  count?: number;\n  errors?: boolean;\n  id?: number;\n  totalCount?: number;\n  unknownCount?: number;\n  unknownErrors?: boolean;\n  unknownWarnings?: boolean;\n  warnings?: boolean;\n}",
-    },
-    TypeDef {
-        name: "RatingChild",
-        ts: "export interface RatingChild {\n  type?: RatingType;\n  value?: number;\n  votes?: number;\n}",
-    },
-    TypeDef {
-        name: "RatingType",
-        ts: "export type RatingType = \"user\" | \"critic\";",
-    },
-    TypeDef {
-        name: "Ratings",
-        ts: "export interface Ratings {\n  imdb?: RatingChild;\n  metacritic?: RatingChild;\n  rottenTomatoes?: RatingChild;\n  tmdb?: RatingChild;\n  trakt?: RatingChild;\n}",
-    },
-    TypeDef {
-        name: "RejectionType",
-        ts: "export type RejectionType = \"permanent\" | \"temporary\";",
-    },
-    TypeDef {
-        name: "ReleaseProfileResource",
-        ts: "export interface ReleaseProfileResource {\n  enabled?: boolean;\n  id?: number;\n  ignored?: unknown | null;\n  indexerId?: number;\n  name?: string | null;\n  required?: unknown | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "ReleaseResource",
-        ts: "export interface ReleaseResource {\n  age?: number;\n  ageHours?: number;\n  ageMinutes?: number;\n  approved?: boolean;\n  commentUrl?: string | null;\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadAllowed?: boolean;\n  downloadClient?: string | null;\n  downloadClientId?: number | null;\n  downloadUrl?: string | null;\n  edition?: string | null;\n  guid?: string | null;\n  id?: number;\n  imdbId?: number;\n  indexer?: string | null;\n  indexerFlags?: unknown | null;\n  indexerId?: number;\n  infoHash?: string | null;\n  infoUrl?: string | null;\n  languages?: Language[] | null;\n  leechers?: number | null;\n  magnetUrl?: string | null;\n  mappedMovieId?: number | null;\n  movieId?: number | null;\n  movieRequested?: boolean;\n  movieTitles?: string[] | null;\n  protocol?: DownloadProtocol;\n  publishDate?: string;\n  quality?: QualityModel;\n  qualityWeight?: number;\n  rejected?: boolean;\n  rejections?: string[] | null;\n  releaseGroup?: string | null;\n  releaseHash?: string | null;\n  releaseWeight?: number;\n  sceneSource?: boolean;\n  seeders?: number | null;\n  shouldOverride?: boolean | null;\n  size?: number;\n  subGroup?: string | null;\n  temporarilyRejected?: boolean;\n  title?: string | null;\n  tmdbId?: number;\n}",
-    },
-    TypeDef {
-        name: "RemotePathMappingResource",
-        ts: "export interface RemotePathMappingResource {\n  host?: string | null;\n  id?: number;\n  localPath?: string | null;\n  remotePath?: string | null;\n}",
-    },
-    TypeDef {
-        name: "RenameMovieResource",
-        ts: "export interface RenameMovieResource {\n  existingPath?: string | null;\n  id?: number;\n  movieFileId?: number;\n  movieId?: number;\n  newPath?: string | null;\n}",
-    },
-    TypeDef {
-        name: "RescanAfterRefreshType",
-        ts: "export type RescanAfterRefreshType = \"always\" | \"afterManual\" | \"never\";",
-    },
-    TypeDef {
-        name: "Revision",
-        ts: "export interface Revision {\n  isRepack?: boolean;\n  real?: number;\n  version?: number;\n}",
-    },
-    TypeDef {
-        name: "RootFolderResource",
-        ts: "export interface RootFolderResource {\n  accessible?: boolean;\n  freeSpace?: number | null;\n  id?: number;\n  path?: string | null;\n  unmappedFolders?: UnmappedFolder[] | null;\n}",
-    },
-    TypeDef {
-        name: "RuntimeMode",
-        ts: "export type RuntimeMode = \"console\" | \"service\" | \"tray\";",
-    },
-    TypeDef {
-        name: "SelectOption",
-        ts: "export interface SelectOption {\n  dividerAfter?: boolean;\n  hint?: string | null;\n  name?: string | null;\n  order?: number;\n  value?: number;\n}",
-    },
-    TypeDef {
-        name: "SortDirection",
-        ts: "export type SortDirection = \"default\" | \"ascending\" | \"descending\";",
-    },
-    TypeDef {
-        name: "SourceType",
-        ts: "export type SourceType = \"tmdb\" | \"mappings\" | \"user\" | \"indexer\";",
-    },
-    TypeDef {
-        name: "SystemResource",
-        ts: "export interface SystemResource {\n  appData?: string | null;\n  appName?: string | null;\n  authentication?: AuthenticationType;\n  branch?: string | null;\n  buildTime?: string;\n  databaseType?: DatabaseType;\n  databaseVersion?: string | null;\n  instanceName?: string | null;\n  isAdmin?: boolean;\n  isDebug?: boolean;\n  isDocker?: boolean;\n  isLinux?: boolean;\n  isNetCore?: boolean;\n  isOsx?: boolean;\n  isProduction?: boolean;\n  isUserInteractive?: boolean;\n  isWindows?: boolean;\n  migrationVersion?: number;\n  mode?: RuntimeMode;\n  osName?: string | null;\n  osVersion?: string | null;\n  packageAuthor?: string | null;\n  packageUpdateMechanism?: UpdateMechanism;\n  packageUpdateMechanismMessage?: string | null;\n  packageVersion?: string | null;\n  runtimeName?: string | null;\n  runtimeVersion?: string | null;\n  startTime?: string;\n  startupPath?: string | null;\n  urlBase?: string | null;\n  version?: string | null;\n}",
-    },
-    TypeDef {
-        name: "TMDbCountryCode",
-        ts: "export type TMDbCountryCode = \"au\" | \"br\" | \"ca\" | \"fr\" | \"de\" | \"gb\" | \"in\" | \"ie\" | \"it\" | \"nz\" | \"ro\" | \"es\" | \"us\";",
-    },
-    TypeDef {
-        name: "TagDetailsResource",
-        ts: "export interface TagDetailsResource {\n  autoTagIds?: number[] | null;\n  delayProfileIds?: number[] | null;\n  downloadClientIds?: number[] | null;\n  id?: number;\n  importListIds?: number[] | null;\n  indexerIds?: number[] | null;\n  label?: string | null;\n  movieIds?: number[] | null;\n  notificationIds?: number[] | null;\n  releaseProfileIds?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "TagResource",
-        ts: "export interface TagResource {\n  id?: number;\n  label?: string | null;\n}",
-    },
-    TypeDef {
-        name: "TaskResource",
-        ts: "export interface TaskResource {\n  id?: number;\n  interval?: number;\n  lastDuration?: string;\n  lastExecution?: string;\n  lastStartTime?: string;\n  name?: string | null;\n  nextExecution?: string;\n  taskName?: string | null;\n}",
-    },
-    TypeDef {
-        name: "TrackedDownloadState",
-        ts: "export type TrackedDownloadState = \"downloading\" | \"importBlocked\" | \"importPending\" | \"importing\" | \"imported\" | \"failedPending\" | \"failed\" | \"ignored\";",
-    },
-    TypeDef {
-        name: "TrackedDownloadStatus",
-        ts: "export type TrackedDownloadStatus = \"ok\" | \"warning\" | \"error\";",
-    },
-    TypeDef {
-        name: "TrackedDownloadStatusMessage",
-        ts: "export interface TrackedDownloadStatusMessage {\n  messages?: string[] | null;\n  title?: string | null;\n}",
-    },
-    TypeDef {
-        name: "UiConfigResource",
-        ts: "export interface UiConfigResource {\n  calendarWeekColumnHeader?: string | null;\n  enableColorImpairedMode?: boolean;\n  firstDayOfWeek?: number;\n  id?: number;\n  longDateFormat?: string | null;\n  movieInfoLanguage?: number;\n  movieRuntimeFormat?: MovieRuntimeFormatType;\n  shortDateFormat?: string | null;\n  showRelativeDates?: boolean;\n  theme?: string | null;\n  timeFormat?: string | null;\n  uiLanguage?: number;\n}",
-    },
-    TypeDef {
-        name: "UnmappedFolder",
-        ts: "export interface UnmappedFolder {\n  name?: string | null;\n  path?: string | null;\n  relativePath?: string | null;\n}",
-    },
-    TypeDef {
-        name: "UpdateChanges",
-        ts: "export interface UpdateChanges {\n  fixed?: string[] | null;\n  new?: string[] | null;\n}",
-    },
-    TypeDef {
-        name: "UpdateMechanism",
-        ts: "export type UpdateMechanism = \"builtIn\" | \"script\" | \"external\" | \"apt\" | \"docker\";",
-    },
-    TypeDef {
-        name: "UpdateResource",
-        ts: "export interface UpdateResource {\n  branch?: string | null;\n  changes?: UpdateChanges;\n  fileName?: string | null;\n  hash?: string | null;\n  id?: number;\n  installable?: boolean;\n  installed?: boolean;\n  installedOn?: string | null;\n  latest?: boolean;\n  releaseDate?: string;\n  url?: string | null;\n  version?: string | null;\n}",
-    },
-];
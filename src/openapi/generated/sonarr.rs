@@ -1,8069 +1,2050 @@
 //! GENERATED by `cargo xtask gen-openapi` from specs/sonarr.openapi.* -- DO NOT EDIT.
 //!
-//! 233 supported operations, 1 omitted operations, 136 component types.
+//! 233 supported operations, 1 omitted operations, 136 component types,
+//! 926 distinct strings. `TABLE.operations` is sorted by name; `find_operation`
+//! binary-searches the decoded slice.
 #![allow(clippy::all)]
-use crate::openapi::{
-    BodyEncoding, HttpMethod, OmittedOperationSpec, OperationSpec, ParameterLocation,
-    ParameterSpec, ParameterStyle, RepresentationSpec, RequestBodySpec, TypeDef,
-};
+use crate::openapi::{CompactTable, HttpMethod, OmittedOperationSpec};
 
-pub static OPERATIONS: &[OperationSpec] = &[
-    OperationSpec {
-        name: "delete_autotagging_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/autotagging/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_blocklist_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/blocklist/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/BlocklistBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/BlocklistBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/BlocklistBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("BlocklistBulkResource"),
-        response_type: None,
-        tag: "Blocklist",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_blocklist_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/blocklist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Blocklist",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_command_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/command/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_customfilter_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/customfilter/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_customformat_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/customformat/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("CustomFormatBulkResource"),
-        response_type: None,
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_customformat_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/customformat/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_delayprofile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/delayprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_downloadclient_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/downloadclient/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DownloadClientBulkResource"),
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_downloadclient_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_episodefile_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/episodefile/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeFileListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("EpisodeFileListResource"),
-        response_type: None,
-        tag: "EpisodeFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_episodefile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/episodefile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "EpisodeFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_importlist_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/importlist/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ImportListBulkResource"),
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_importlist_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/importlist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_importlistexclusion_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/importlistexclusion/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("ImportListExclusionBulkResource"),
-        response_type: None,
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_importlistexclusion_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/importlistexclusion/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_indexer_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/indexer/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerBulkResource"),
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_indexer_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_languageprofile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/languageprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "LanguageProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_metadata_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/metadata/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_notification_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/notification/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_qualityprofile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/qualityprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_queue_bulk",
-        method: HttpMethod::Delete,
-        path: "/api/v3/queue/bulk",
-        path_params: &[],
-        query_params: &[
-            "blocklist",
-            "changeCategory",
-            "removeFromClient",
-            "skipRedownload",
-        ],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "blocklist",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "changeCategory",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "removeFromClient",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "skipRedownload",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("QueueBulkResource"),
-        response_type: None,
-        tag: "Queue",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_queue_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/queue/{id}",
-        path_params: &["id"],
-        query_params: &[
-            "blocklist",
-            "changeCategory",
-            "removeFromClient",
-            "skipRedownload",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "blocklist",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "changeCategory",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "removeFromClient",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "skipRedownload",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Queue",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_releaseprofile_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/releaseprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_remotepathmapping_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/remotepathmapping/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_rootfolder_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/rootfolder/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "RootFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_series_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/series/{id}",
-        path_params: &["id"],
-        query_params: &["addImportListExclusion", "deleteFiles"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "addImportListExclusion",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "deleteFiles",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Series",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_series_editor",
-        method: HttpMethod::Delete,
-        path: "/api/v3/series/editor",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/SeriesEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/SeriesEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/SeriesEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("SeriesEditorResource"),
-        response_type: None,
-        tag: "SeriesEditor",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_system_backup_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/system/backup/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "delete_tag_by_id",
-        method: HttpMethod::Delete,
-        path: "/api/v3/tag/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get",
-        method: HttpMethod::Get,
-        path: "/api",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ApiInfo",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_autotagging",
-        method: HttpMethod::Get,
-        path: "/api/v3/autotagging",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/AutoTaggingResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("AutoTaggingResource"),
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_autotagging_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/autotagging/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("AutoTaggingResource"),
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_autotagging_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/autotagging/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_blocklist",
-        method: HttpMethod::Get,
-        path: "/api/v3/blocklist",
-        path_params: &[],
-        query_params: &[
-            "page",
-            "pageSize",
-            "protocols",
-            "seriesIds",
-            "sortDirection",
-            "sortKey",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "protocols",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DownloadProtocol\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/BlocklistResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("BlocklistResourcePagingResource"),
-        tag: "Blocklist",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_by_path_2",
-        method: HttpMethod::Get,
-        path: "/{path}",
-        path_params: &["path"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"^(?!(api|feed)/).*\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "StaticResource",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_calendar",
-        method: HttpMethod::Get,
-        path: "/api/v3/calendar",
-        path_params: &[],
-        query_params: &[
-            "end",
-            "includeEpisodeFile",
-            "includeEpisodeImages",
-            "includeSeries",
-            "start",
-            "tags",
-            "unmonitored",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "end",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"date-time\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeEpisodeFile",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeEpisodeImages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeSeries",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "start",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"date-time\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tags",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "unmonitored",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/EpisodeResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeResource"),
-        tag: "Calendar",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_calendar_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/calendar/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/EpisodeResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeResource"),
-        tag: "Calendar",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_command",
-        method: HttpMethod::Get,
-        path: "/api/v3/command",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/CommandResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CommandResource"),
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_command_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/command/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CommandResource"),
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_downloadclient",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/downloadclient",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientConfigResource"),
-        tag: "DownloadClientConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_downloadclient_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientConfigResource"),
-        tag: "DownloadClientConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_host",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/host",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("HostConfigResource"),
-        tag: "HostConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_host_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/host/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HostConfigResource"),
-        tag: "HostConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_importlist",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/importlist",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListConfigResource"),
-        tag: "ImportListConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_importlist_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/importlist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListConfigResource"),
-        tag: "ImportListConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_indexer",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/indexer",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerConfigResource"),
-        tag: "IndexerConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_indexer_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerConfigResource"),
-        tag: "IndexerConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_mediamanagement",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/mediamanagement",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MediaManagementConfigResource"),
-        tag: "MediaManagementConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_mediamanagement_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/mediamanagement/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MediaManagementConfigResource"),
-        tag: "MediaManagementConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_naming",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/naming",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("NamingConfigResource"),
-        tag: "NamingConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_naming_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/naming/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NamingConfigResource"),
-        tag: "NamingConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_naming_examples",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/naming/examples",
-        path_params: &[],
-        query_params: &[
-            "animeEpisodeFormat",
-            "colonReplacementFormat",
-            "customColonReplacementFormat",
-            "dailyEpisodeFormat",
-            "id",
-            "multiEpisodeStyle",
-            "renameEpisodes",
-            "replaceIllegalCharacters",
-            "resourceName",
-            "seasonFolderFormat",
-            "seriesFolderFormat",
-            "specialsFolderFormat",
-            "standardEpisodeFormat",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "animeEpisodeFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "colonReplacementFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "customColonReplacementFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "dailyEpisodeFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "multiEpisodeStyle",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "renameEpisodes",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "replaceIllegalCharacters",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "resourceName",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seasonFolderFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesFolderFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "specialsFolderFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "standardEpisodeFormat",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "NamingConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_ui",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/ui",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("UiConfigResource"),
-        tag: "UiConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_config_ui_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/config/ui/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("UiConfigResource"),
-        tag: "UiConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_content_by_path",
-        method: HttpMethod::Get,
-        path: "/content/{path}",
-        path_params: &["path"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"^(?!api/).*\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "StaticResource",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customfilter",
-        method: HttpMethod::Get,
-        path: "/api/v3/customfilter",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/CustomFilterResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customfilter_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/customfilter/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customformat",
-        method: HttpMethod::Get,
-        path: "/api/v3/customformat",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/CustomFormatResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customformat_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/customformat/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_customformat_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/customformat/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_delayprofile",
-        method: HttpMethod::Get,
-        path: "/api/v3/delayprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_delayprofile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/delayprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_diskspace",
-        method: HttpMethod::Get,
-        path: "/api/v3/diskspace",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DiskSpaceResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DiskSpaceResource"),
-        tag: "DiskSpace",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_downloadclient",
-        method: HttpMethod::Get,
-        path: "/api/v3/downloadclient",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DownloadClientResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_downloadclient_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_downloadclient_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/downloadclient/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/DownloadClientResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_episode",
-        method: HttpMethod::Get,
-        path: "/api/v3/episode",
-        path_params: &[],
-        query_params: &[
-            "episodeFileId",
-            "episodeIds",
-            "includeEpisodeFile",
-            "includeImages",
-            "includeSeries",
-            "seasonNumber",
-            "seriesId",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "episodeFileId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "episodeIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeEpisodeFile",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeImages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeSeries",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seasonNumber",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/EpisodeResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeResource"),
-        tag: "Episode",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_episode_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/episode/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/EpisodeResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeResource"),
-        tag: "Episode",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_episodefile",
-        method: HttpMethod::Get,
-        path: "/api/v3/episodefile",
-        path_params: &[],
-        query_params: &["episodeFileIds", "seriesId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "episodeFileIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/EpisodeFileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeFileResource"),
-        tag: "EpisodeFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_episodefile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/episodefile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/EpisodeFileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeFileResource"),
-        tag: "EpisodeFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_feed_calendar_sonarr_ics",
-        method: HttpMethod::Get,
-        path: "/feed/v3/calendar/sonarr.ics",
-        path_params: &[],
-        query_params: &[
-            "asAllDay",
-            "futureDays",
-            "pastDays",
-            "premieresOnly",
-            "tags",
-            "unmonitored",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "asAllDay",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "futureDays",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":28,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pastDays",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":7,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "premieresOnly",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tags",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":\"\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "unmonitored",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "CalendarFeed",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_filesystem",
-        method: HttpMethod::Get,
-        path: "/api/v3/filesystem",
-        path_params: &[],
-        query_params: &["allowFoldersWithoutTrailingSlashes", "includeFiles", "path"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "allowFoldersWithoutTrailingSlashes",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeFiles",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "path",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "FileSystem",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_filesystem_mediafiles",
-        method: HttpMethod::Get,
-        path: "/api/v3/filesystem/mediafiles",
-        path_params: &[],
-        query_params: &["path"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "FileSystem",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_filesystem_type",
-        method: HttpMethod::Get,
-        path: "/api/v3/filesystem/type",
-        path_params: &[],
-        query_params: &["path"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "path",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "FileSystem",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_health",
-        method: HttpMethod::Get,
-        path: "/api/v3/health",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/HealthResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HealthResource"),
-        tag: "Health",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_history",
-        method: HttpMethod::Get,
-        path: "/api/v3/history",
-        path_params: &[],
-        query_params: &[
-            "downloadId",
-            "episodeId",
-            "eventType",
-            "includeEpisode",
-            "includeSeries",
-            "languages",
-            "page",
-            "pageSize",
-            "quality",
-            "seriesIds",
-            "sortDirection",
-            "sortKey",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "downloadId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "episodeId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "eventType",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeEpisode",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeSeries",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "languages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "quality",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/HistoryResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HistoryResourcePagingResource"),
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_history_series",
-        method: HttpMethod::Get,
-        path: "/api/v3/history/series",
-        path_params: &[],
-        query_params: &[
-            "eventType",
-            "includeEpisode",
-            "includeSeries",
-            "seasonNumber",
-            "seriesId",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "eventType",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeHistoryEventType\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeEpisode",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeSeries",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seasonNumber",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/HistoryResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HistoryResource"),
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_history_since",
-        method: HttpMethod::Get,
-        path: "/api/v3/history/since",
-        path_params: &[],
-        query_params: &["date", "eventType", "includeEpisode", "includeSeries"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "date",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"date-time\",\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "eventType",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeHistoryEventType\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeEpisode",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeSeries",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/HistoryResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("HistoryResource"),
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlist",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlist",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ImportListResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlist_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlist_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlist/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ImportListResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlistexclusion",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlistexclusion",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListExclusionResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlistexclusion_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlistexclusion/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListExclusionResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_importlistexclusion_paged",
-        method: HttpMethod::Get,
-        path: "/api/v3/importlistexclusion/paged",
-        path_params: &[],
-        query_params: &["page", "pageSize", "sortDirection", "sortKey"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ImportListExclusionResourcePagingResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer",
-        method: HttpMethod::Get,
-        path: "/api/v3/indexer",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexer_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/indexer/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_indexerflag",
-        method: HttpMethod::Get,
-        path: "/api/v3/indexerflag",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerFlagResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerFlagResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/IndexerFlagResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("IndexerFlagResource"),
-        tag: "IndexerFlag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_language",
-        method: HttpMethod::Get,
-        path: "/api/v3/language",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LanguageResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LanguageResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/LanguageResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("LanguageResource"),
-        tag: "Language",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_language_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/language/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LanguageResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LanguageResource"),
-        tag: "Language",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_languageprofile",
-        method: HttpMethod::Get,
-        path: "/api/v3/languageprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/LanguageProfileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LanguageProfileResource"),
-        tag: "LanguageProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_languageprofile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/languageprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LanguageProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LanguageProfileResource"),
-        tag: "LanguageProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_languageprofile_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/languageprofile/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LanguageProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LanguageProfileResource"),
-        tag: "LanguageProfileSchema",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_localization",
-        method: HttpMethod::Get,
-        path: "/api/v3/localization",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LocalizationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LocalizationResource"),
-        tag: "Localization",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_localization_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/localization/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LocalizationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LocalizationResource"),
-        tag: "Localization",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_localization_language",
-        method: HttpMethod::Get,
-        path: "/api/v3/localization/language",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LocalizationLanguageResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LocalizationLanguageResource"),
-        tag: "Localization",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log",
-        method: HttpMethod::Get,
-        path: "/api/v3/log",
-        path_params: &[],
-        query_params: &["level", "page", "pageSize", "sortDirection", "sortKey"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "level",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LogResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LogResourcePagingResource"),
-        tag: "Log",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file",
-        method: HttpMethod::Get,
-        path: "/api/v3/log/file",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LogFileResource"),
-        tag: "LogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file_by_filename",
-        method: HttpMethod::Get,
-        path: "/api/v3/log/file/{filename}",
-        path_params: &["filename"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "filename",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"[-.a-zA-Z0-9]+?\\\\.txt\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "LogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file_update",
-        method: HttpMethod::Get,
-        path: "/api/v3/log/file/update",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("LogFileResource"),
-        tag: "UpdateLogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_log_file_update_by_filename",
-        method: HttpMethod::Get,
-        path: "/api/v3/log/file/update/{filename}",
-        path_params: &["filename"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "filename",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"pattern\":\"[-.a-zA-Z0-9]+?\\\\.txt\",\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "UpdateLogFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_login",
-        method: HttpMethod::Get,
-        path: "/login",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "StaticResource",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_logout",
-        method: HttpMethod::Get,
-        path: "/logout",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Authentication",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_manualimport",
-        method: HttpMethod::Get,
-        path: "/api/v3/manualimport",
-        path_params: &[],
-        query_params: &[
-            "downloadId",
-            "filterExistingFiles",
-            "folder",
-            "seasonNumber",
-            "seriesId",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "downloadId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "filterExistingFiles",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "folder",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seasonNumber",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ManualImportResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ManualImportResource"),
-        tag: "ManualImport",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_mediacover_by_filename_series_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/mediacover/{seriesId}/{filename}",
-        path_params: &["filename", "seriesId"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "filename",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"pattern\":\"(.+)\\\\.(jpg|png|gif)\",\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "seriesId",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "MediaCover",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_metadata",
-        method: HttpMethod::Get,
-        path: "/api/v3/metadata",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/MetadataResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_metadata_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/metadata/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_metadata_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/metadata/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/MetadataResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_notification",
-        method: HttpMethod::Get,
-        path: "/api/v3/notification",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/NotificationResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_notification_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/notification/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_notification_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/notification/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/NotificationResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_parse",
-        method: HttpMethod::Get,
-        path: "/api/v3/parse",
-        path_params: &[],
-        query_params: &["path", "title"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "path",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "title",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ParseResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ParseResource"),
-        tag: "Parse",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_ping",
-        method: HttpMethod::Get,
-        path: "/ping",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/PingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("PingResource"),
-        tag: "Ping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualitydefinition",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualitydefinition",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QualityDefinitionResource"),
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualitydefinition_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualitydefinition/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("QualityDefinitionResource"),
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualitydefinition_limits",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualitydefinition/limits",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionLimitsResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionLimitsResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionLimitsResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QualityDefinitionLimitsResource"),
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualityprofile",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualityprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityProfileResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualityprofile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualityprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_qualityprofile_schema",
-        method: HttpMethod::Get,
-        path: "/api/v3/qualityprofile/schema",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfileSchema",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_queue",
-        method: HttpMethod::Get,
-        path: "/api/v3/queue",
-        path_params: &[],
-        query_params: &[
-            "includeEpisode",
-            "includeSeries",
-            "includeUnknownSeriesItems",
-            "languages",
-            "page",
-            "pageSize",
-            "protocol",
-            "quality",
-            "seriesIds",
-            "sortDirection",
-            "sortKey",
-            "status",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "includeEpisode",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeSeries",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeUnknownSeriesItems",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "languages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "protocol",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadProtocol\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "quality",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "status",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/QueueStatus\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/QueueResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("QueueResourcePagingResource"),
-        tag: "Queue",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_queue_details",
-        method: HttpMethod::Get,
-        path: "/api/v3/queue/details",
-        path_params: &[],
-        query_params: &["episodeIds", "includeEpisode", "includeSeries", "seriesId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "episodeIds",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeEpisode",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeSeries",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/QueueResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("QueueResource"),
-        tag: "QueueDetails",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_queue_status",
-        method: HttpMethod::Get,
-        path: "/api/v3/queue/status",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/QueueStatusResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("QueueStatusResource"),
-        tag: "QueueStatus",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_release",
-        method: HttpMethod::Get,
-        path: "/api/v3/release",
-        path_params: &[],
-        query_params: &["episodeId", "seasonNumber", "seriesId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "episodeId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seasonNumber",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ReleaseResource"),
-        tag: "Release",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_releaseprofile",
-        method: HttpMethod::Get,
-        path: "/api/v3/releaseprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("ReleaseProfileResource"),
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_releaseprofile_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/releaseprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("ReleaseProfileResource"),
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_remotepathmapping",
-        method: HttpMethod::Get,
-        path: "/api/v3/remotepathmapping",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("RemotePathMappingResource"),
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_remotepathmapping_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/remotepathmapping/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("RemotePathMappingResource"),
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_rename",
-        method: HttpMethod::Get,
-        path: "/api/v3/rename",
-        path_params: &[],
-        query_params: &["seasonNumber", "seriesId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "seasonNumber",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "seriesId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/RenameEpisodeResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("RenameEpisodeResource"),
-        tag: "RenameEpisode",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_rootfolder",
-        method: HttpMethod::Get,
-        path: "/api/v3/rootfolder",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/RootFolderResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("RootFolderResource"),
-        tag: "RootFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_rootfolder_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/rootfolder/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("RootFolderResource"),
-        tag: "RootFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_series",
-        method: HttpMethod::Get,
-        path: "/api/v3/series",
-        path_params: &[],
-        query_params: &["includeSeasonImages", "tvdbId"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "includeSeasonImages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "tvdbId",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/SeriesResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("SeriesResource"),
-        tag: "Series",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_series_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/series/{id}",
-        path_params: &["id"],
-        query_params: &["includeSeasonImages"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "includeSeasonImages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SeriesResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("SeriesResource"),
-        tag: "Series",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_series_folder_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/series/{id}/folder",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "SeriesFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_series_lookup",
-        method: HttpMethod::Get,
-        path: "/api/v3/series/lookup",
-        path_params: &[],
-        query_params: &["term"],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "term",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/SeriesResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/SeriesResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/SeriesResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("SeriesResource"),
-        tag: "SeriesLookup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_backup",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/backup",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("BackupResource"),
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_routes",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/routes",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_routes_duplicate",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/routes/duplicate",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_status",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/status",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SystemResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("SystemResource"),
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_task",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/task",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("TaskResource"),
-        tag: "Task",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_system_task_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/system/task/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TaskResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TaskResource"),
-        tag: "Task",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag",
-        method: HttpMethod::Get,
-        path: "/api/v3/tag",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/tag/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag_detail",
-        method: HttpMethod::Get,
-        path: "/api/v3/tag/detail",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/TagDetailsResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TagDetailsResource"),
-        tag: "TagDetails",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_tag_detail_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/tag/detail/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/TagDetailsResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("TagDetailsResource"),
-        tag: "TagDetails",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_update",
-        method: HttpMethod::Get,
-        path: "/api/v3/update",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"items\":{\"$ref\":\"#/components/schemas/UpdateResource\"},\"type\":\"array\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("UpdateResource"),
-        tag: "Update",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_wanted_cutoff",
-        method: HttpMethod::Get,
-        path: "/api/v3/wanted/cutoff",
-        path_params: &[],
-        query_params: &[
-            "includeEpisodeFile",
-            "includeImages",
-            "includeSeries",
-            "monitored",
-            "page",
-            "pageSize",
-            "sortDirection",
-            "sortKey",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "includeEpisodeFile",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeImages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeSeries",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "monitored",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/EpisodeResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeResourcePagingResource"),
-        tag: "Cutoff",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_wanted_cutoff_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/wanted/cutoff/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/EpisodeResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeResource"),
-        tag: "Cutoff",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_wanted_missing",
-        method: HttpMethod::Get,
-        path: "/api/v3/wanted/missing",
-        path_params: &[],
-        query_params: &[
-            "includeImages",
-            "includeSeries",
-            "monitored",
-            "page",
-            "pageSize",
-            "sortDirection",
-            "sortKey",
-        ],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "includeImages",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "includeSeries",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "monitored",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":true,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "page",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "pageSize",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortDirection",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"$ref\":\"#/components/schemas/SortDirection\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "sortKey",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/EpisodeResourcePagingResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeResourcePagingResource"),
-        tag: "Missing",
-        summary: "",
-    },
-    OperationSpec {
-        name: "get_wanted_missing_by_id",
-        method: HttpMethod::Get,
-        path: "/api/v3/wanted/missing/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/EpisodeResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: None,
-        response_type: Some("EpisodeResource"),
-        tag: "Missing",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_autotagging",
-        method: HttpMethod::Post,
-        path: "/api/v3/autotagging",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("AutoTaggingResource"),
-        response_type: Some("AutoTaggingResource"),
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_command",
-        method: HttpMethod::Post,
-        path: "/api/v3/command",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CommandResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("CommandResource"),
-        response_type: Some("CommandResource"),
-        tag: "Command",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_customfilter",
-        method: HttpMethod::Post,
-        path: "/api/v3/customfilter",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("CustomFilterResource"),
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_customformat",
-        method: HttpMethod::Post,
-        path: "/api/v3/customformat",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("CustomFormatResource"),
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_delayprofile",
-        method: HttpMethod::Post,
-        path: "/api/v3/delayprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("DelayProfileResource"),
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient",
-        method: HttpMethod::Post,
-        path: "/api/v3/downloadclient",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientResource"),
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/downloadclient/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DownloadClientResource"),
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/downloadclient/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("DownloadClientResource"),
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_downloadclient_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/downloadclient/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_history_failed_by_id",
-        method: HttpMethod::Post,
-        path: "/api/v3/history/failed/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "History",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlist",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlist",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ImportListResource"),
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlist_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlist/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ImportListResource"),
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlist_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlist/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ImportListResource"),
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlist_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlist/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_importlistexclusion",
-        method: HttpMethod::Post,
-        path: "/api/v3/importlistexclusion",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ImportListExclusionResource"),
-        response_type: Some("ImportListExclusionResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer",
-        method: HttpMethod::Post,
-        path: "/api/v3/indexer",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerResource"),
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/indexer/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerResource"),
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/indexer/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("IndexerResource"),
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_indexer_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/indexer/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_languageprofile",
-        method: HttpMethod::Post,
-        path: "/api/v3/languageprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/LanguageProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LanguageProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("LanguageProfileResource"),
-        response_type: Some("LanguageProfileResource"),
-        tag: "LanguageProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_login",
-        method: HttpMethod::Post,
-        path: "/login",
-        path_params: &[],
-        query_params: &["returnUrl"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "returnUrl",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "multipart/form-data",
-                encoding: BodyEncoding::Multipart,
-                schema: "{\"properties\":{\"password\":{\"type\":\"string\"},\"rememberMe\":{\"type\":\"string\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"}",
-                encoding_metadata: "{\"password\":{\"style\":\"form\"},\"rememberMe\":{\"style\":\"form\"},\"username\":{\"style\":\"form\"}}",
-            }],
-        }),
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Authentication",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_manualimport",
-        method: HttpMethod::Post,
-        path: "/api/v3/manualimport",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ManualImportReprocessResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ManualImportReprocessResource"),
-        response_type: None,
-        tag: "ManualImport",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_metadata",
-        method: HttpMethod::Post,
-        path: "/api/v3/metadata",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("MetadataResource"),
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_metadata_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/metadata/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("MetadataResource"),
-        response_type: None,
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_metadata_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/metadata/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("MetadataResource"),
-        response_type: None,
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_metadata_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/metadata/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification",
-        method: HttpMethod::Post,
-        path: "/api/v3/notification",
-        path_params: &[],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceSave",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("NotificationResource"),
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification_action_by_name",
-        method: HttpMethod::Post,
-        path: "/api/v3/notification/action/{name}",
-        path_params: &["name"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "name",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("NotificationResource"),
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification_test",
-        method: HttpMethod::Post,
-        path: "/api/v3/notification/test",
-        path_params: &[],
-        query_params: &["forceTest"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "forceTest",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("NotificationResource"),
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_notification_testall",
-        method: HttpMethod::Post,
-        path: "/api/v3/notification/testall",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_qualityprofile",
-        method: HttpMethod::Post,
-        path: "/api/v3/qualityprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("QualityProfileResource"),
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_queue_grab_bulk",
-        method: HttpMethod::Post,
-        path: "/api/v3/queue/grab/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("QueueBulkResource"),
-        response_type: None,
-        tag: "QueueAction",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_queue_grab_by_id",
-        method: HttpMethod::Post,
-        path: "/api/v3/queue/grab/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "QueueAction",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_release",
-        method: HttpMethod::Post,
-        path: "/api/v3/release",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("ReleaseResource"),
-        response_type: None,
-        tag: "Release",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_release_push",
-        method: HttpMethod::Post,
-        path: "/api/v3/release/push",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ReleaseResource"),
-        response_type: Some("ReleaseResource"),
-        tag: "ReleasePush",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_releaseprofile",
-        method: HttpMethod::Post,
-        path: "/api/v3/releaseprofile",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ReleaseProfileResource"),
-        response_type: Some("ReleaseProfileResource"),
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_remotepathmapping",
-        method: HttpMethod::Post,
-        path: "/api/v3/remotepathmapping",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("RemotePathMappingResource"),
-        response_type: Some("RemotePathMappingResource"),
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_rootfolder",
-        method: HttpMethod::Post,
-        path: "/api/v3/rootfolder",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("RootFolderResource"),
-        response_type: Some("RootFolderResource"),
-        tag: "RootFolder",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_seasonpass",
-        method: HttpMethod::Post,
-        path: "/api/v3/seasonpass",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/SeasonPassResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("SeasonPassResource"),
-        response_type: None,
-        tag: "SeasonPass",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_series",
-        method: HttpMethod::Post,
-        path: "/api/v3/series",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/SeriesResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SeriesResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("SeriesResource"),
-        response_type: Some("SeriesResource"),
-        tag: "Series",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_series_import",
-        method: HttpMethod::Post,
-        path: "/api/v3/series/import",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/SeriesResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/SeriesResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/SeriesResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("SeriesResource"),
-        response_type: None,
-        tag: "SeriesImport",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_backup_restore_by_id",
-        method: HttpMethod::Post,
-        path: "/api/v3/system/backup/restore/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: false,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_backup_restore_upload",
-        method: HttpMethod::Post,
-        path: "/api/v3/system/backup/restore/upload",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: true,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "multipart/form-data",
-                encoding: BodyEncoding::Multipart,
-                schema: "{\"type\":\"object\",\"required\":[\"file\"],\"properties\":{\"file\":{\"type\":\"string\",\"format\":\"binary\"}}}",
-                encoding_metadata: "{\"file\":{\"contentType\":\"application/zip\"}}",
-            }],
-        }),
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "Backup",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_restart",
-        method: HttpMethod::Post,
-        path: "/api/v3/system/restart",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_system_shutdown",
-        method: HttpMethod::Post,
-        path: "/api/v3/system/shutdown",
-        path_params: &[],
-        query_params: &[],
-        has_body: false,
-        parameters: &[],
-        request_body: None,
-        responses: &[],
-        request_type: None,
-        response_type: None,
-        tag: "System",
-        summary: "",
-    },
-    OperationSpec {
-        name: "post_tag",
-        method: HttpMethod::Post,
-        path: "/api/v3/tag",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("TagResource"),
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_autotagging_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/autotagging/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("AutoTaggingResource"),
-        response_type: Some("AutoTaggingResource"),
-        tag: "AutoTagging",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_downloadclient_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("DownloadClientConfigResource"),
-        response_type: Some("DownloadClientConfigResource"),
-        tag: "DownloadClientConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_host_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/host/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("HostConfigResource"),
-        response_type: Some("HostConfigResource"),
-        tag: "HostConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_importlist_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/importlist/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ImportListConfigResource"),
-        response_type: Some("ImportListConfigResource"),
-        tag: "ImportListConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_indexer_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/indexer/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("IndexerConfigResource"),
-        response_type: Some("IndexerConfigResource"),
-        tag: "IndexerConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_mediamanagement_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/mediamanagement/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("MediaManagementConfigResource"),
-        response_type: Some("MediaManagementConfigResource"),
-        tag: "MediaManagementConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_naming_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/naming/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("NamingConfigResource"),
-        response_type: Some("NamingConfigResource"),
-        tag: "NamingConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_config_ui_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/config/ui/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("UiConfigResource"),
-        response_type: Some("UiConfigResource"),
-        tag: "UiConfig",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_customfilter_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/customfilter/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("CustomFilterResource"),
-        response_type: Some("CustomFilterResource"),
-        tag: "CustomFilter",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_customformat_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/customformat/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("CustomFormatBulkResource"),
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_customformat_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/customformat/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("CustomFormatResource"),
-        response_type: Some("CustomFormatResource"),
-        tag: "CustomFormat",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_delayprofile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/delayprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("DelayProfileResource"),
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_delayprofile_reorder_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/delayprofile/reorder/{id}",
-        path_params: &["id"],
-        query_params: &["after"],
-        has_body: false,
-        parameters: &[
-            ParameterSpec {
-                name: "after",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: None,
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: None,
-        response_type: Some("DelayProfileResource"),
-        tag: "DelayProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_downloadclient_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/downloadclient/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientBulkResource"),
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_downloadclient_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/downloadclient/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("DownloadClientResource"),
-        response_type: Some("DownloadClientResource"),
-        tag: "DownloadClient",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_episode_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/episode/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("EpisodeResource"),
-        response_type: Some("EpisodeResource"),
-        tag: "Episode",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_episode_monitor",
-        method: HttpMethod::Put,
-        path: "/api/v3/episode/monitor",
-        path_params: &[],
-        query_params: &["includeImages"],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "includeImages",
-            location: ParameterLocation::Query,
-            required: false,
-            schema: "{\"default\":false,\"type\":\"boolean\"}",
-            style: ParameterStyle::Form,
-            explode: true,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodesMonitoredResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("EpisodesMonitoredResource"),
-        response_type: None,
-        tag: "Episode",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_episodefile_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/episodefile/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"items\":{\"$ref\":\"#/components/schemas/EpisodeFileResource\"},\"type\":\"array\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("EpisodeFileResource"),
-        response_type: None,
-        tag: "EpisodeFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_episodefile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/episodefile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeFileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeFileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeFileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeFileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("EpisodeFileResource"),
-        response_type: Some("EpisodeFileResource"),
-        tag: "EpisodeFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_episodefile_editor",
-        method: HttpMethod::Put,
-        path: "/api/v3/episodefile/editor",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/EpisodeFileListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[],
-        request_type: Some("EpisodeFileListResource"),
-        response_type: None,
-        tag: "EpisodeFile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_importlist_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/importlist/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ImportListBulkResource"),
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_importlist_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/importlist/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("ImportListResource"),
-        response_type: Some("ImportListResource"),
-        tag: "ImportList",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_importlistexclusion_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/importlistexclusion/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ImportListExclusionResource"),
-        response_type: Some("ImportListExclusionResource"),
-        tag: "ImportListExclusion",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_indexer_bulk",
-        method: HttpMethod::Put,
-        path: "/api/v3/indexer/bulk",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerBulkResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerBulkResource"),
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_indexer_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/indexer/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("IndexerResource"),
-        response_type: Some("IndexerResource"),
-        tag: "Indexer",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_languageprofile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/languageprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/LanguageProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/LanguageProfileResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("LanguageProfileResource"),
-        response_type: Some("LanguageProfileResource"),
-        tag: "LanguageProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_metadata_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/metadata/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("MetadataResource"),
-        response_type: Some("MetadataResource"),
-        tag: "Metadata",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_notification_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/notification/{id}",
-        path_params: &["id"],
-        query_params: &["forceSave"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "forceSave",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"format\":\"int32\",\"type\":\"integer\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("NotificationResource"),
-        response_type: Some("NotificationResource"),
-        tag: "Notification",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_qualitydefinition_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/qualitydefinition/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("QualityDefinitionResource"),
-        response_type: Some("QualityDefinitionResource"),
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_qualitydefinition_update",
-        method: HttpMethod::Put,
-        path: "/api/v3/qualitydefinition/update",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("QualityDefinitionResource"),
-        response_type: None,
-        tag: "QualityDefinition",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_qualityprofile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/qualityprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("QualityProfileResource"),
-        response_type: Some("QualityProfileResource"),
-        tag: "QualityProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_releaseprofile_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/releaseprofile/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("ReleaseProfileResource"),
-        response_type: Some("ReleaseProfileResource"),
-        tag: "ReleaseProfile",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_remotepathmapping_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/remotepathmapping/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("RemotePathMappingResource"),
-        response_type: Some("RemotePathMappingResource"),
-        tag: "RemotePathMapping",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_series_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/series/{id}",
-        path_params: &["id"],
-        query_params: &["moveFiles"],
-        has_body: true,
-        parameters: &[
-            ParameterSpec {
-                name: "id",
-                location: ParameterLocation::Path,
-                required: true,
-                schema: "{\"type\":\"string\"}",
-                style: ParameterStyle::Simple,
-                explode: false,
-            },
-            ParameterSpec {
-                name: "moveFiles",
-                location: ParameterLocation::Query,
-                required: false,
-                schema: "{\"default\":false,\"type\":\"boolean\"}",
-                style: ParameterStyle::Form,
-                explode: true,
-            },
-        ],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/SeriesResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[RepresentationSpec {
-            status: Some("200"),
-            media_type: "application/json",
-            encoding: BodyEncoding::Json,
-            schema: "{\"$ref\":\"#/components/schemas/SeriesResource\"}",
-            encoding_metadata: "null",
-        }],
-        request_type: Some("SeriesResource"),
-        response_type: Some("SeriesResource"),
-        tag: "Series",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_series_editor",
-        method: HttpMethod::Put,
-        path: "/api/v3/series/editor",
-        path_params: &[],
-        query_params: &[],
-        has_body: true,
-        parameters: &[],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/*+json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/SeriesEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "application/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/SeriesEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-                RepresentationSpec {
-                    status: None,
-                    media_type: "text/json",
-                    encoding: BodyEncoding::Json,
-                    schema: "{\"$ref\":\"#/components/schemas/SeriesEditorResource\"}",
-                    encoding_metadata: "null",
-                },
-            ],
-        }),
-        responses: &[],
-        request_type: Some("SeriesEditorResource"),
-        response_type: None,
-        tag: "SeriesEditor",
-        summary: "",
-    },
-    OperationSpec {
-        name: "put_tag_by_id",
-        method: HttpMethod::Put,
-        path: "/api/v3/tag/{id}",
-        path_params: &["id"],
-        query_params: &[],
-        has_body: true,
-        parameters: &[ParameterSpec {
-            name: "id",
-            location: ParameterLocation::Path,
-            required: true,
-            schema: "{\"type\":\"string\"}",
-            style: ParameterStyle::Simple,
-            explode: false,
-        }],
-        request_body: Some(RequestBodySpec {
-            required: false,
-            representations: &[RepresentationSpec {
-                status: None,
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            }],
-        }),
-        responses: &[
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "application/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/json",
-                encoding: BodyEncoding::Json,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-            RepresentationSpec {
-                status: Some("200"),
-                media_type: "text/plain",
-                encoding: BodyEncoding::Text,
-                schema: "{\"$ref\":\"#/components/schemas/TagResource\"}",
-                encoding_metadata: "null",
-            },
-        ],
-        request_type: Some("TagResource"),
-        response_type: Some("TagResource"),
-        tag: "Tag",
-        summary: "",
-    },
-];
+pub static TABLE: CompactTable = CompactTable {
+    strings: concat!(
+        "delete_autotagging_by_id",
+        "/api/v3/autotagging/{id}",
+        "id",
+        "{\"format\":\"int32\",\"type\":\"integer\"}",
+        "AutoTagging",
+        "",
+        "delete_blocklist_bulk",
+        "/api/v3/blocklist/bulk",
+        "application/*+json",
+        "{\"$ref\":\"#/components/schemas/BlocklistBulkResource\"}",
+        "null",
+        "application/json",
+        "text/json",
+        "BlocklistBulkResource",
+        "Blocklist",
+        "delete_blocklist_by_id",
+        "/api/v3/blocklist/{id}",
+        "delete_command_by_id",
+        "/api/v3/command/{id}",
+        "Command",
+        "delete_customfilter_by_id",
+        "/api/v3/customfilter/{id}",
+        "CustomFilter",
+        "delete_customformat_bulk",
+        "/api/v3/customformat/bulk",
+        "{\"$ref\":\"#/components/schemas/CustomFormatBulkResource\"}",
+        "CustomFormatBulkResource",
+        "CustomFormat",
+        "delete_customformat_by_id",
+        "/api/v3/customformat/{id}",
+        "delete_delayprofile_by_id",
+        "/api/v3/delayprofile/{id}",
+        "DelayProfile",
+        "delete_downloadclient_bulk",
+        "/api/v3/downloadclient/bulk",
+        "{\"$ref\":\"#/components/schemas/DownloadClientBulkResource\"}",
+        "DownloadClientBulkResource",
+        "DownloadClient",
+        "delete_downloadclient_by_id",
+        "/api/v3/downloadclient/{id}",
+        "delete_episodefile_bulk",
+        "/api/v3/episodefile/bulk",
+        "{\"$ref\":\"#/components/schemas/EpisodeFileListResource\"}",
+        "EpisodeFileListResource",
+        "EpisodeFile",
+        "delete_episodefile_by_id",
+        "/api/v3/episodefile/{id}",
+        "delete_importlist_bulk",
+        "/api/v3/importlist/bulk",
+        "{\"$ref\":\"#/components/schemas/ImportListBulkResource\"}",
+        "ImportListBulkResource",
+        "ImportList",
+        "delete_importlist_by_id",
+        "/api/v3/importlist/{id}",
+        "delete_importlistexclusion_bulk",
+        "/api/v3/importlistexclusion/bulk",
+        "{\"$ref\":\"#/components/schemas/ImportListExclusionBulkResource\"}",
+        "ImportListExclusionBulkResource",
+        "ImportListExclusion",
+        "delete_importlistexclusion_by_id",
+        "/api/v3/importlistexclusion/{id}",
+        "delete_indexer_bulk",
+        "/api/v3/indexer/bulk",
+        "{\"$ref\":\"#/components/schemas/IndexerBulkResource\"}",
+        "IndexerBulkResource",
+        "Indexer",
+        "delete_indexer_by_id",
+        "/api/v3/indexer/{id}",
+        "delete_languageprofile_by_id",
+        "/api/v3/languageprofile/{id}",
+        "LanguageProfile",
+        "delete_metadata_by_id",
+        "/api/v3/metadata/{id}",
+        "Metadata",
+        "delete_notification_by_id",
+        "/api/v3/notification/{id}",
+        "Notification",
+        "delete_qualityprofile_by_id",
+        "/api/v3/qualityprofile/{id}",
+        "QualityProfile",
+        "delete_queue_bulk",
+        "/api/v3/queue/bulk",
+        "blocklist",
+        "changeCategory",
+        "removeFromClient",
+        "skipRedownload",
+        "{\"default\":false,\"type\":\"boolean\"}",
+        "{\"default\":true,\"type\":\"boolean\"}",
+        "{\"$ref\":\"#/components/schemas/QueueBulkResource\"}",
+        "QueueBulkResource",
+        "Queue",
+        "delete_queue_by_id",
+        "/api/v3/queue/{id}",
+        "delete_releaseprofile_by_id",
+        "/api/v3/releaseprofile/{id}",
+        "ReleaseProfile",
+        "delete_remotepathmapping_by_id",
+        "/api/v3/remotepathmapping/{id}",
+        "RemotePathMapping",
+        "delete_rootfolder_by_id",
+        "/api/v3/rootfolder/{id}",
+        "RootFolder",
+        "delete_series_by_id",
+        "/api/v3/series/{id}",
+        "addImportListExclusion",
+        "deleteFiles",
+        "Series",
+        "delete_series_editor",
+        "/api/v3/series/editor",
+        "{\"$ref\":\"#/components/schemas/SeriesEditorResource\"}",
+        "SeriesEditorResource",
+        "SeriesEditor",
+        "delete_system_backup_by_id",
+        "/api/v3/system/backup/{id}",
+        "Backup",
+        "delete_tag_by_id",
+        "/api/v3/tag/{id}",
+        "Tag",
+        "get",
+        "/api",
+        "ApiInfo",
+        "get_autotagging",
+        "/api/v3/autotagging",
+        "200",
+        "{\"items\":{\"$ref\":\"#/components/schemas/AutoTaggingResource\"},\"type\":\"array\"}",
+        "AutoTaggingResource",
+        "get_autotagging_by_id",
+        "{\"$ref\":\"#/components/schemas/AutoTaggingResource\"}",
+        "get_autotagging_schema",
+        "/api/v3/autotagging/schema",
+        "get_blocklist",
+        "/api/v3/blocklist",
+        "page",
+        "pageSize",
+        "protocols",
+        "seriesIds",
+        "sortDirection",
+        "sortKey",
+        "{\"default\":1,\"format\":\"int32\",\"type\":\"integer\"}",
+        "{\"default\":10,\"format\":\"int32\",\"type\":\"integer\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DownloadProtocol\"},\"type\":\"array\"}",
+        "{\"items\":{\"format\":\"int32\",\"type\":\"integer\"},\"type\":\"array\"}",
+        "{\"$ref\":\"#/components/schemas/SortDirection\"}",
+        "{\"type\":\"string\"}",
+        "{\"$ref\":\"#/components/schemas/BlocklistResourcePagingResource\"}",
+        "BlocklistResourcePagingResource",
+        "get_by_path_2",
+        "/{path}",
+        "path",
+        "{\"pattern\":\"^(?!(api|feed)/).*\",\"type\":\"string\"}",
+        "StaticResource",
+        "get_calendar",
+        "/api/v3/calendar",
+        "end",
+        "includeEpisodeFile",
+        "includeEpisodeImages",
+        "includeSeries",
+        "start",
+        "tags",
+        "unmonitored",
+        "{\"format\":\"date-time\",\"type\":\"string\"}",
+        "{\"default\":\"\",\"type\":\"string\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/EpisodeResource\"},\"type\":\"array\"}",
+        "EpisodeResource",
+        "Calendar",
+        "get_calendar_by_id",
+        "/api/v3/calendar/{id}",
+        "{\"$ref\":\"#/components/schemas/EpisodeResource\"}",
+        "get_command",
+        "/api/v3/command",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CommandResource\"},\"type\":\"array\"}",
+        "CommandResource",
+        "get_command_by_id",
+        "{\"$ref\":\"#/components/schemas/CommandResource\"}",
+        "get_config_downloadclient",
+        "/api/v3/config/downloadclient",
+        "{\"$ref\":\"#/components/schemas/DownloadClientConfigResource\"}",
+        "DownloadClientConfigResource",
+        "DownloadClientConfig",
+        "get_config_downloadclient_by_id",
+        "/api/v3/config/downloadclient/{id}",
+        "get_config_host",
+        "/api/v3/config/host",
+        "{\"$ref\":\"#/components/schemas/HostConfigResource\"}",
+        "text/plain",
+        "HostConfigResource",
+        "HostConfig",
+        "get_config_host_by_id",
+        "/api/v3/config/host/{id}",
+        "get_config_importlist",
+        "/api/v3/config/importlist",
+        "{\"$ref\":\"#/components/schemas/ImportListConfigResource\"}",
+        "ImportListConfigResource",
+        "ImportListConfig",
+        "get_config_importlist_by_id",
+        "/api/v3/config/importlist/{id}",
+        "get_config_indexer",
+        "/api/v3/config/indexer",
+        "{\"$ref\":\"#/components/schemas/IndexerConfigResource\"}",
+        "IndexerConfigResource",
+        "IndexerConfig",
+        "get_config_indexer_by_id",
+        "/api/v3/config/indexer/{id}",
+        "get_config_mediamanagement",
+        "/api/v3/config/mediamanagement",
+        "{\"$ref\":\"#/components/schemas/MediaManagementConfigResource\"}",
+        "MediaManagementConfigResource",
+        "MediaManagementConfig",
+        "get_config_mediamanagement_by_id",
+        "/api/v3/config/mediamanagement/{id}",
+        "get_config_naming",
+        "/api/v3/config/naming",
+        "{\"$ref\":\"#/components/schemas/NamingConfigResource\"}",
+        "NamingConfigResource",
+        "NamingConfig",
+        "get_config_naming_by_id",
+        "/api/v3/config/naming/{id}",
+        "get_config_naming_examples",
+        "/api/v3/config/naming/examples",
+        "animeEpisodeFormat",
+        "colonReplacementFormat",
+        "customColonReplacementFormat",
+        "dailyEpisodeFormat",
+        "multiEpisodeStyle",
+        "renameEpisodes",
+        "replaceIllegalCharacters",
+        "resourceName",
+        "seasonFolderFormat",
+        "seriesFolderFormat",
+        "specialsFolderFormat",
+        "standardEpisodeFormat",
+        "{\"type\":\"boolean\"}",
+        "get_config_ui",
+        "/api/v3/config/ui",
+        "{\"$ref\":\"#/components/schemas/UiConfigResource\"}",
+        "UiConfigResource",
+        "UiConfig",
+        "get_config_ui_by_id",
+        "/api/v3/config/ui/{id}",
+        "get_content_by_path",
+        "/content/{path}",
+        "{\"pattern\":\"^(?!api/).*\",\"type\":\"string\"}",
+        "get_customfilter",
+        "/api/v3/customfilter",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CustomFilterResource\"},\"type\":\"array\"}",
+        "CustomFilterResource",
+        "get_customfilter_by_id",
+        "{\"$ref\":\"#/components/schemas/CustomFilterResource\"}",
+        "get_customformat",
+        "/api/v3/customformat",
+        "{\"items\":{\"$ref\":\"#/components/schemas/CustomFormatResource\"},\"type\":\"array\"}",
+        "CustomFormatResource",
+        "get_customformat_by_id",
+        "{\"$ref\":\"#/components/schemas/CustomFormatResource\"}",
+        "get_customformat_schema",
+        "/api/v3/customformat/schema",
+        "get_delayprofile",
+        "/api/v3/delayprofile",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DelayProfileResource\"},\"type\":\"array\"}",
+        "DelayProfileResource",
+        "get_delayprofile_by_id",
+        "{\"$ref\":\"#/components/schemas/DelayProfileResource\"}",
+        "get_diskspace",
+        "/api/v3/diskspace",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DiskSpaceResource\"},\"type\":\"array\"}",
+        "DiskSpaceResource",
+        "DiskSpace",
+        "get_downloadclient",
+        "/api/v3/downloadclient",
+        "{\"items\":{\"$ref\":\"#/components/schemas/DownloadClientResource\"},\"type\":\"array\"}",
+        "DownloadClientResource",
+        "get_downloadclient_by_id",
+        "{\"$ref\":\"#/components/schemas/DownloadClientResource\"}",
+        "get_downloadclient_schema",
+        "/api/v3/downloadclient/schema",
+        "get_episode",
+        "/api/v3/episode",
+        "episodeFileId",
+        "episodeIds",
+        "includeImages",
+        "seasonNumber",
+        "seriesId",
+        "Episode",
+        "get_episode_by_id",
+        "/api/v3/episode/{id}",
+        "get_episodefile",
+        "/api/v3/episodefile",
+        "episodeFileIds",
+        "{\"items\":{\"$ref\":\"#/components/schemas/EpisodeFileResource\"},\"type\":\"array\"}",
+        "EpisodeFileResource",
+        "get_episodefile_by_id",
+        "{\"$ref\":\"#/components/schemas/EpisodeFileResource\"}",
+        "get_feed_calendar_sonarr_ics",
+        "/feed/v3/calendar/sonarr.ics",
+        "asAllDay",
+        "futureDays",
+        "pastDays",
+        "premieresOnly",
+        "{\"default\":28,\"format\":\"int32\",\"type\":\"integer\"}",
+        "{\"default\":7,\"format\":\"int32\",\"type\":\"integer\"}",
+        "CalendarFeed",
+        "get_filesystem",
+        "/api/v3/filesystem",
+        "allowFoldersWithoutTrailingSlashes",
+        "includeFiles",
+        "FileSystem",
+        "get_filesystem_mediafiles",
+        "/api/v3/filesystem/mediafiles",
+        "get_filesystem_type",
+        "/api/v3/filesystem/type",
+        "get_health",
+        "/api/v3/health",
+        "{\"items\":{\"$ref\":\"#/components/schemas/HealthResource\"},\"type\":\"array\"}",
+        "HealthResource",
+        "Health",
+        "get_history",
+        "/api/v3/history",
+        "downloadId",
+        "episodeId",
+        "eventType",
+        "includeEpisode",
+        "languages",
+        "quality",
+        "{\"$ref\":\"#/components/schemas/HistoryResourcePagingResource\"}",
+        "HistoryResourcePagingResource",
+        "History",
+        "get_history_series",
+        "/api/v3/history/series",
+        "{\"$ref\":\"#/components/schemas/EpisodeHistoryEventType\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/HistoryResource\"},\"type\":\"array\"}",
+        "HistoryResource",
+        "get_history_since",
+        "/api/v3/history/since",
+        "date",
+        "get_importlist",
+        "/api/v3/importlist",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ImportListResource\"},\"type\":\"array\"}",
+        "ImportListResource",
+        "get_importlist_by_id",
+        "{\"$ref\":\"#/components/schemas/ImportListResource\"}",
+        "get_importlist_schema",
+        "/api/v3/importlist/schema",
+        "get_importlistexclusion",
+        "/api/v3/importlistexclusion",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"},\"type\":\"array\"}",
+        "ImportListExclusionResource",
+        "get_importlistexclusion_by_id",
+        "{\"$ref\":\"#/components/schemas/ImportListExclusionResource\"}",
+        "get_importlistexclusion_paged",
+        "/api/v3/importlistexclusion/paged",
+        "{\"$ref\":\"#/components/schemas/ImportListExclusionResourcePagingResource\"}",
+        "ImportListExclusionResourcePagingResource",
+        "get_indexer",
+        "/api/v3/indexer",
+        "{\"items\":{\"$ref\":\"#/components/schemas/IndexerResource\"},\"type\":\"array\"}",
+        "IndexerResource",
+        "get_indexer_by_id",
+        "{\"$ref\":\"#/components/schemas/IndexerResource\"}",
+        "get_indexer_schema",
+        "/api/v3/indexer/schema",
+        "get_indexerflag",
+        "/api/v3/indexerflag",
+        "{\"items\":{\"$ref\":\"#/components/schemas/IndexerFlagResource\"},\"type\":\"array\"}",
+        "IndexerFlagResource",
+        "IndexerFlag",
+        "get_language",
+        "/api/v3/language",
+        "{\"items\":{\"$ref\":\"#/components/schemas/LanguageResource\"},\"type\":\"array\"}",
+        "LanguageResource",
+        "Language",
+        "get_language_by_id",
+        "/api/v3/language/{id}",
+        "{\"$ref\":\"#/components/schemas/LanguageResource\"}",
+        "get_languageprofile",
+        "/api/v3/languageprofile",
+        "{\"items\":{\"$ref\":\"#/components/schemas/LanguageProfileResource\"},\"type\":\"array\"}",
+        "LanguageProfileResource",
+        "get_languageprofile_by_id",
+        "{\"$ref\":\"#/components/schemas/LanguageProfileResource\"}",
+        "get_languageprofile_schema",
+        "/api/v3/languageprofile/schema",
+        "LanguageProfileSchema",
+        "get_localization",
+        "/api/v3/localization",
+        "{\"$ref\":\"#/components/schemas/LocalizationResource\"}",
+        "LocalizationResource",
+        "Localization",
+        "get_localization_by_id",
+        "/api/v3/localization/{id}",
+        "get_localization_language",
+        "/api/v3/localization/language",
+        "{\"$ref\":\"#/components/schemas/LocalizationLanguageResource\"}",
+        "LocalizationLanguageResource",
+        "get_log",
+        "/api/v3/log",
+        "level",
+        "{\"$ref\":\"#/components/schemas/LogResourcePagingResource\"}",
+        "LogResourcePagingResource",
+        "Log",
+        "get_log_file",
+        "/api/v3/log/file",
+        "{\"items\":{\"$ref\":\"#/components/schemas/LogFileResource\"},\"type\":\"array\"}",
+        "LogFileResource",
+        "LogFile",
+        "get_log_file_by_filename",
+        "/api/v3/log/file/{filename}",
+        "filename",
+        "{\"pattern\":\"[-.a-zA-Z0-9]+?\\\\.txt\",\"type\":\"string\"}",
+        "get_log_file_update",
+        "/api/v3/log/file/update",
+        "UpdateLogFile",
+        "get_log_file_update_by_filename",
+        "/api/v3/log/file/update/{filename}",
+        "get_login",
+        "/login",
+        "get_logout",
+        "/logout",
+        "Authentication",
+        "get_manualimport",
+        "/api/v3/manualimport",
+        "filterExistingFiles",
+        "folder",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ManualImportResource\"},\"type\":\"array\"}",
+        "ManualImportResource",
+        "ManualImport",
+        "get_mediacover_by_filename_series_id",
+        "/api/v3/mediacover/{seriesId}/{filename}",
+        "{\"pattern\":\"(.+)\\\\.(jpg|png|gif)\",\"type\":\"string\"}",
+        "MediaCover",
+        "get_metadata",
+        "/api/v3/metadata",
+        "{\"items\":{\"$ref\":\"#/components/schemas/MetadataResource\"},\"type\":\"array\"}",
+        "MetadataResource",
+        "get_metadata_by_id",
+        "{\"$ref\":\"#/components/schemas/MetadataResource\"}",
+        "get_metadata_schema",
+        "/api/v3/metadata/schema",
+        "get_notification",
+        "/api/v3/notification",
+        "{\"items\":{\"$ref\":\"#/components/schemas/NotificationResource\"},\"type\":\"array\"}",
+        "NotificationResource",
+        "get_notification_by_id",
+        "{\"$ref\":\"#/components/schemas/NotificationResource\"}",
+        "get_notification_schema",
+        "/api/v3/notification/schema",
+        "get_parse",
+        "/api/v3/parse",
+        "title",
+        "{\"$ref\":\"#/components/schemas/ParseResource\"}",
+        "ParseResource",
+        "Parse",
+        "get_ping",
+        "/ping",
+        "{\"$ref\":\"#/components/schemas/PingResource\"}",
+        "PingResource",
+        "Ping",
+        "get_qualitydefinition",
+        "/api/v3/qualitydefinition",
+        "{\"items\":{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"},\"type\":\"array\"}",
+        "QualityDefinitionResource",
+        "QualityDefinition",
+        "get_qualitydefinition_by_id",
+        "/api/v3/qualitydefinition/{id}",
+        "{\"$ref\":\"#/components/schemas/QualityDefinitionResource\"}",
+        "get_qualitydefinition_limits",
+        "/api/v3/qualitydefinition/limits",
+        "{\"$ref\":\"#/components/schemas/QualityDefinitionLimitsResource\"}",
+        "QualityDefinitionLimitsResource",
+        "get_qualityprofile",
+        "/api/v3/qualityprofile",
+        "{\"items\":{\"$ref\":\"#/components/schemas/QualityProfileResource\"},\"type\":\"array\"}",
+        "QualityProfileResource",
+        "get_qualityprofile_by_id",
+        "{\"$ref\":\"#/components/schemas/QualityProfileResource\"}",
+        "get_qualityprofile_schema",
+        "/api/v3/qualityprofile/schema",
+        "QualityProfileSchema",
+        "get_queue",
+        "/api/v3/queue",
+        "includeUnknownSeriesItems",
+        "protocol",
+        "status",
+        "{\"$ref\":\"#/components/schemas/DownloadProtocol\"}",
+        "{\"items\":{\"$ref\":\"#/components/schemas/QueueStatus\"},\"type\":\"array\"}",
+        "{\"$ref\":\"#/components/schemas/QueueResourcePagingResource\"}",
+        "QueueResourcePagingResource",
+        "get_queue_details",
+        "/api/v3/queue/details",
+        "{\"items\":{\"$ref\":\"#/components/schemas/QueueResource\"},\"type\":\"array\"}",
+        "QueueResource",
+        "QueueDetails",
+        "get_queue_status",
+        "/api/v3/queue/status",
+        "{\"$ref\":\"#/components/schemas/QueueStatusResource\"}",
+        "QueueStatusResource",
+        "QueueStatus",
+        "get_release",
+        "/api/v3/release",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseResource\"},\"type\":\"array\"}",
+        "ReleaseResource",
+        "Release",
+        "get_releaseprofile",
+        "/api/v3/releaseprofile",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"},\"type\":\"array\"}",
+        "ReleaseProfileResource",
+        "get_releaseprofile_by_id",
+        "{\"$ref\":\"#/components/schemas/ReleaseProfileResource\"}",
+        "get_remotepathmapping",
+        "/api/v3/remotepathmapping",
+        "{\"items\":{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"},\"type\":\"array\"}",
+        "RemotePathMappingResource",
+        "get_remotepathmapping_by_id",
+        "{\"$ref\":\"#/components/schemas/RemotePathMappingResource\"}",
+        "get_rename",
+        "/api/v3/rename",
+        "{\"items\":{\"$ref\":\"#/components/schemas/RenameEpisodeResource\"},\"type\":\"array\"}",
+        "RenameEpisodeResource",
+        "RenameEpisode",
+        "get_rootfolder",
+        "/api/v3/rootfolder",
+        "{\"items\":{\"$ref\":\"#/components/schemas/RootFolderResource\"},\"type\":\"array\"}",
+        "RootFolderResource",
+        "get_rootfolder_by_id",
+        "{\"$ref\":\"#/components/schemas/RootFolderResource\"}",
+        "get_series",
+        "/api/v3/series",
+        "includeSeasonImages",
+        "tvdbId",
+        "{\"items\":{\"$ref\":\"#/components/schemas/SeriesResource\"},\"type\":\"array\"}",
+        "SeriesResource",
+        "get_series_by_id",
+        "{\"$ref\":\"#/components/schemas/SeriesResource\"}",
+        "get_series_folder_by_id",
+        "/api/v3/series/{id}/folder",
+        "SeriesFolder",
+        "get_series_lookup",
+        "/api/v3/series/lookup",
+        "term",
+        "SeriesLookup",
+        "get_system_backup",
+        "/api/v3/system/backup",
+        "{\"items\":{\"$ref\":\"#/components/schemas/BackupResource\"},\"type\":\"array\"}",
+        "BackupResource",
+        "get_system_routes",
+        "/api/v3/system/routes",
+        "System",
+        "get_system_routes_duplicate",
+        "/api/v3/system/routes/duplicate",
+        "get_system_status",
+        "/api/v3/system/status",
+        "{\"$ref\":\"#/components/schemas/SystemResource\"}",
+        "SystemResource",
+        "get_system_task",
+        "/api/v3/system/task",
+        "{\"items\":{\"$ref\":\"#/components/schemas/TaskResource\"},\"type\":\"array\"}",
+        "TaskResource",
+        "Task",
+        "get_system_task_by_id",
+        "/api/v3/system/task/{id}",
+        "{\"$ref\":\"#/components/schemas/TaskResource\"}",
+        "get_tag",
+        "/api/v3/tag",
+        "{\"items\":{\"$ref\":\"#/components/schemas/TagResource\"},\"type\":\"array\"}",
+        "TagResource",
+        "get_tag_by_id",
+        "{\"$ref\":\"#/components/schemas/TagResource\"}",
+        "get_tag_detail",
+        "/api/v3/tag/detail",
+        "{\"items\":{\"$ref\":\"#/components/schemas/TagDetailsResource\"},\"type\":\"array\"}",
+        "TagDetailsResource",
+        "TagDetails",
+        "get_tag_detail_by_id",
+        "/api/v3/tag/detail/{id}",
+        "{\"$ref\":\"#/components/schemas/TagDetailsResource\"}",
+        "get_update",
+        "/api/v3/update",
+        "{\"items\":{\"$ref\":\"#/components/schemas/UpdateResource\"},\"type\":\"array\"}",
+        "UpdateResource",
+        "Update",
+        "get_wanted_cutoff",
+        "/api/v3/wanted/cutoff",
+        "monitored",
+        "{\"$ref\":\"#/components/schemas/EpisodeResourcePagingResource\"}",
+        "EpisodeResourcePagingResource",
+        "Cutoff",
+        "get_wanted_cutoff_by_id",
+        "/api/v3/wanted/cutoff/{id}",
+        "get_wanted_missing",
+        "/api/v3/wanted/missing",
+        "Missing",
+        "get_wanted_missing_by_id",
+        "/api/v3/wanted/missing/{id}",
+        "post_autotagging",
+        "post_command",
+        "post_customfilter",
+        "post_customformat",
+        "post_delayprofile",
+        "post_downloadclient",
+        "forceSave",
+        "post_downloadclient_action_by_name",
+        "/api/v3/downloadclient/action/{name}",
+        "name",
+        "post_downloadclient_test",
+        "/api/v3/downloadclient/test",
+        "forceTest",
+        "post_downloadclient_testall",
+        "/api/v3/downloadclient/testall",
+        "post_history_failed_by_id",
+        "/api/v3/history/failed/{id}",
+        "post_importlist",
+        "post_importlist_action_by_name",
+        "/api/v3/importlist/action/{name}",
+        "post_importlist_test",
+        "/api/v3/importlist/test",
+        "post_importlist_testall",
+        "/api/v3/importlist/testall",
+        "post_importlistexclusion",
+        "post_indexer",
+        "post_indexer_action_by_name",
+        "/api/v3/indexer/action/{name}",
+        "post_indexer_test",
+        "/api/v3/indexer/test",
+        "post_indexer_testall",
+        "/api/v3/indexer/testall",
+        "post_languageprofile",
+        "post_login",
+        "returnUrl",
+        "multipart/form-data",
+        "{\"properties\":{\"password\":{\"type\":\"string\"},\"rememberMe\":{\"type\":\"string\"},\"username\":{\"type\":\"string\"}},\"type\":\"object\"}",
+        "{\"password\":{\"style\":\"form\"},\"rememberMe\":{\"style\":\"form\"},\"username\":{\"style\":\"form\"}}",
+        "post_manualimport",
+        "{\"items\":{\"$ref\":\"#/components/schemas/ManualImportReprocessResource\"},\"type\":\"array\"}",
+        "ManualImportReprocessResource",
+        "post_metadata",
+        "post_metadata_action_by_name",
+        "/api/v3/metadata/action/{name}",
+        "post_metadata_test",
+        "/api/v3/metadata/test",
+        "post_metadata_testall",
+        "/api/v3/metadata/testall",
+        "post_notification",
+        "post_notification_action_by_name",
+        "/api/v3/notification/action/{name}",
+        "post_notification_test",
+        "/api/v3/notification/test",
+        "post_notification_testall",
+        "/api/v3/notification/testall",
+        "post_qualityprofile",
+        "post_queue_grab_bulk",
+        "/api/v3/queue/grab/bulk",
+        "QueueAction",
+        "post_queue_grab_by_id",
+        "/api/v3/queue/grab/{id}",
+        "post_release",
+        "{\"$ref\":\"#/components/schemas/ReleaseResource\"}",
+        "post_release_push",
+        "/api/v3/release/push",
+        "ReleasePush",
+        "post_releaseprofile",
+        "post_remotepathmapping",
+        "post_rootfolder",
+        "post_seasonpass",
+        "/api/v3/seasonpass",
+        "{\"$ref\":\"#/components/schemas/SeasonPassResource\"}",
+        "SeasonPassResource",
+        "SeasonPass",
+        "post_series",
+        "post_series_import",
+        "/api/v3/series/import",
+        "SeriesImport",
+        "post_system_backup_restore_by_id",
+        "/api/v3/system/backup/restore/{id}",
+        "post_system_backup_restore_upload",
+        "/api/v3/system/backup/restore/upload",
+        "{\"type\":\"object\",\"required\":[\"file\"],\"properties\":{\"file\":{\"type\":\"string\",\"format\":\"binary\"}}}",
+        "{\"file\":{\"contentType\":\"application/zip\"}}",
+        "post_system_restart",
+        "/api/v3/system/restart",
+        "post_system_shutdown",
+        "/api/v3/system/shutdown",
+        "post_tag",
+        "put_autotagging_by_id",
+        "put_config_downloadclient_by_id",
+        "put_config_host_by_id",
+        "put_config_importlist_by_id",
+        "put_config_indexer_by_id",
+        "put_config_mediamanagement_by_id",
+        "put_config_naming_by_id",
+        "put_config_ui_by_id",
+        "put_customfilter_by_id",
+        "put_customformat_bulk",
+        "put_customformat_by_id",
+        "put_delayprofile_by_id",
+        "put_delayprofile_reorder_by_id",
+        "/api/v3/delayprofile/reorder/{id}",
+        "after",
+        "put_downloadclient_bulk",
+        "put_downloadclient_by_id",
+        "put_episode_by_id",
+        "put_episode_monitor",
+        "/api/v3/episode/monitor",
+        "{\"$ref\":\"#/components/schemas/EpisodesMonitoredResource\"}",
+        "EpisodesMonitoredResource",
+        "put_episodefile_bulk",
+        "put_episodefile_by_id",
+        "put_episodefile_editor",
+        "/api/v3/episodefile/editor",
+        "put_importlist_bulk",
+        "put_importlist_by_id",
+        "put_importlistexclusion_by_id",
+        "put_indexer_bulk",
+        "put_indexer_by_id",
+        "put_languageprofile_by_id",
+        "put_metadata_by_id",
+        "put_notification_by_id",
+        "put_qualitydefinition_by_id",
+        "put_qualitydefinition_update",
+        "/api/v3/qualitydefinition/update",
+        "put_qualityprofile_by_id",
+        "put_releaseprofile_by_id",
+        "put_remotepathmapping_by_id",
+        "put_series_by_id",
+        "moveFiles",
+        "put_series_editor",
+        "put_tag_by_id",
+        "AddSeriesOptions",
+        "export interface AddSeriesOptions {\n  ignoreEpisodesWithFiles?: boolean;\n  ignoreEpisodesWithoutFiles?: boolean;\n  monitor?: MonitorTypes;\n  searchForCutoffUnmetEpisodes?: boolean;\n  searchForMissingEpisodes?: boolean;\n}",
+        "AlternateTitleResource",
+        "export interface AlternateTitleResource {\n  comment?: string | null;\n  sceneOrigin?: string | null;\n  sceneSeasonNumber?: number | null;\n  seasonNumber?: number | null;\n  title?: string | null;\n}",
+        "ApplyTags",
+        "export type ApplyTags = \"add\" | \"remove\" | \"replace\";",
+        "AuthenticationRequiredType",
+        "export type AuthenticationRequiredType = \"enabled\" | \"disabledForLocalAddresses\";",
+        "AuthenticationType",
+        "export type AuthenticationType = \"none\" | \"basic\" | \"forms\" | \"external\";",
+        "export interface AutoTaggingResource {\n  id?: number;\n  name?: string | null;\n  removeTagsAutomatically?: boolean;\n  specifications?: AutoTaggingSpecificationSchema[] | null;\n  tags?: number[] | null;\n}",
+        "AutoTaggingSpecificationSchema",
+        "export interface AutoTaggingSpecificationSchema {\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  name?: string | null;\n  negate?: boolean;\n  required?: boolean;\n}",
+        "export interface BackupResource {\n  id?: number;\n  name?: string | null;\n  path?: string | null;\n  size?: number;\n  time?: string;\n  type?: BackupType;\n}",
+        "BackupType",
+        "export type BackupType = \"scheduled\" | \"manual\" | \"update\";",
+        "export interface BlocklistBulkResource {\n  ids?: number[] | null;\n}",
+        "BlocklistResource",
+        "export interface BlocklistResource {\n  customFormats?: CustomFormatResource[] | null;\n  date?: string;\n  episodeIds?: number[] | null;\n  id?: number;\n  indexer?: string | null;\n  languages?: Language[] | null;\n  message?: string | null;\n  protocol?: DownloadProtocol;\n  quality?: QualityModel;\n  series?: SeriesResource;\n  seriesId?: number;\n  sourceTitle?: string | null;\n}",
+        "export interface BlocklistResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: BlocklistResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "CertificateValidationType",
+        "export type CertificateValidationType = \"enabled\" | \"disabledForLocalAddresses\" | \"disabled\";",
+        "export interface Command {\n  clientUserAgent?: string | null;\n  completionMessage?: string | null;\n  isExclusive?: boolean;\n  isLongRunning?: boolean;\n  lastExecutionTime?: string | null;\n  lastStartTime?: string | null;\n  name?: string | null;\n  requiresDiskAccess?: boolean;\n  sendUpdatesToClient?: boolean;\n  suppressMessages?: boolean;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
+        "CommandPriority",
+        "export type CommandPriority = \"normal\" | \"high\" | \"low\";",
+        "export interface CommandResource {\n  body?: Command;\n  clientUserAgent?: string | null;\n  commandName?: string | null;\n  duration?: string | null;\n  ended?: string | null;\n  exception?: string | null;\n  id?: number;\n  lastExecutionTime?: string | null;\n  message?: string | null;\n  name?: string | null;\n  priority?: CommandPriority;\n  queued?: string;\n  result?: CommandResult;\n  sendUpdatesToClient?: boolean;\n  started?: string | null;\n  stateChangeTime?: string | null;\n  status?: CommandStatus;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
+        "CommandResult",
+        "export type CommandResult = \"unknown\" | \"successful\" | \"unsuccessful\";",
+        "CommandStatus",
+        "export type CommandStatus = \"queued\" | \"started\" | \"completed\" | \"failed\" | \"aborted\" | \"cancelled\" | \"orphaned\";",
+        "CommandTrigger",
+        "export type CommandTrigger = \"unspecified\" | \"manual\" | \"scheduled\";",
+        "export interface CustomFilterResource {\n  filters?: Record<string, unknown>[] | null;\n  id?: number;\n  label?: string | null;\n  type?: string | null;\n}",
+        "export interface CustomFormatBulkResource {\n  ids?: number[] | null;\n  includeCustomFormatWhenRenaming?: boolean | null;\n}",
+        "export interface CustomFormatResource {\n  id?: number;\n  includeCustomFormatWhenRenaming?: boolean | null;\n  name?: string | null;\n  specifications?: CustomFormatSpecificationSchema[] | null;\n}",
+        "CustomFormatSpecificationSchema",
+        "export interface CustomFormatSpecificationSchema {\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  name?: string | null;\n  negate?: boolean;\n  presets?: CustomFormatSpecificationSchema[] | null;\n  required?: boolean;\n}",
+        "DatabaseType",
+        "export type DatabaseType = \"sqLite\" | \"postgreSQL\";",
+        "export interface DelayProfileResource {\n  bypassIfAboveCustomFormatScore?: boolean;\n  bypassIfHighestQuality?: boolean;\n  enableTorrent?: boolean;\n  enableUsenet?: boolean;\n  id?: number;\n  minimumCustomFormatScore?: number;\n  order?: number;\n  preferredProtocol?: DownloadProtocol;\n  tags?: number[] | null;\n  torrentDelay?: number;\n  usenetDelay?: number;\n}",
+        "export interface DiskSpaceResource {\n  freeSpace?: number;\n  id?: number;\n  label?: string | null;\n  path?: string | null;\n  totalSpace?: number;\n}",
+        "export interface DownloadClientBulkResource {\n  applyTags?: ApplyTags;\n  enable?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  removeCompletedDownloads?: boolean | null;\n  removeFailedDownloads?: boolean | null;\n  tags?: number[] | null;\n}",
+        "export interface DownloadClientConfigResource {\n  autoRedownloadFailed?: boolean;\n  autoRedownloadFailedFromInteractiveSearch?: boolean;\n  downloadClientWorkingFolders?: string | null;\n  enableCompletedDownloadHandling?: boolean;\n  id?: number;\n}",
+        "export interface DownloadClientResource {\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: DownloadClientResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  removeCompletedDownloads?: boolean;\n  removeFailedDownloads?: boolean;\n  tags?: number[] | null;\n}",
+        "DownloadProtocol",
+        "export type DownloadProtocol = \"unknown\" | \"usenet\" | \"torrent\";",
+        "export interface EpisodeFileListResource {\n  episodeFileIds?: number[] | null;\n  languages?: Language[] | null;\n  quality?: QualityModel;\n  releaseGroup?: string | null;\n  sceneName?: string | null;\n}",
+        "export interface EpisodeFileResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  dateAdded?: string;\n  id?: number;\n  indexerFlags?: number | null;\n  languages?: Language[] | null;\n  mediaInfo?: MediaInfoResource;\n  path?: string | null;\n  quality?: QualityModel;\n  qualityCutoffNotMet?: boolean;\n  relativePath?: string | null;\n  releaseGroup?: string | null;\n  releaseType?: ReleaseType;\n  sceneName?: string | null;\n  seasonNumber?: number;\n  seriesId?: number;\n  size?: number;\n}",
+        "EpisodeHistoryEventType",
+        "export type EpisodeHistoryEventType = \"unknown\" | \"grabbed\" | \"seriesFolderImported\" | \"downloadFolderImported\" | \"downloadFailed\" | \"episodeFileDeleted\" | \"episodeFileRenamed\" | \"downloadIgnored\";",
+        "export interface EpisodeResource {\n  absoluteEpisodeNumber?: number | null;\n  airDate?: string | null;\n  airDateUtc?: string | null;\n  endTime?: string | null;\n  episodeFile?: EpisodeFileResource;\n  episodeFileId?: number;\n  episodeNumber?: number;\n  finaleType?: string | null;\n  grabDate?: string | null;\n  hasFile?: boolean;\n  id?: number;\n  images?: MediaCover[] | null;\n  lastSearchTime?: string | null;\n  monitored?: boolean;\n  overview?: string | null;\n  runtime?: number;\n  sceneAbsoluteEpisodeNumber?: number | null;\n  sceneEpisodeNumber?: number | null;\n  sceneSeasonNumber?: number | null;\n  seasonNumber?: number;\n  series?: SeriesResource;\n  seriesId?: number;\n  title?: string | null;\n  tvdbId?: number;\n  unverifiedSceneNumbering?: boolean;\n}",
+        "export interface EpisodeResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: EpisodeResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "EpisodeTitleRequiredType",
+        "export type EpisodeTitleRequiredType = \"always\" | \"bulkSeasonReleases\" | \"never\";",
+        "export interface EpisodesMonitoredResource {\n  episodeIds?: number[] | null;\n  monitored?: boolean;\n}",
+        "Field",
+        "export interface Field {\n  advanced?: boolean;\n  helpLink?: string | null;\n  helpText?: string | null;\n  helpTextWarning?: string | null;\n  hidden?: string | null;\n  isFloat?: boolean;\n  label?: string | null;\n  name?: string | null;\n  order?: number;\n  placeholder?: string | null;\n  privacy?: PrivacyLevel;\n  section?: string | null;\n  selectOptions?: SelectOption[] | null;\n  selectOptionsProviderAction?: string | null;\n  type?: string | null;\n  unit?: string | null;\n  value?: unknown | null;\n}",
+        "FileDateType",
+        "export type FileDateType = \"none\" | \"localAirDate\" | \"utcAirDate\";",
+        "HealthCheckResult",
+        "export type HealthCheckResult = \"ok\" | \"notice\" | \"warning\" | \"error\";",
+        "export interface HealthResource {\n  id?: number;\n  message?: string | null;\n  source?: string | null;\n  type?: HealthCheckResult;\n  wikiUrl?: HttpUri;\n}",
+        "export interface HistoryResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  data?: Record<string, string | null> | null;\n  date?: string;\n  downloadId?: string | null;\n  episode?: EpisodeResource;\n  episodeId?: number;\n  eventType?: EpisodeHistoryEventType;\n  id?: number;\n  languages?: Language[] | null;\n  quality?: QualityModel;\n  qualityCutoffNotMet?: boolean;\n  series?: SeriesResource;\n  seriesId?: number;\n  sourceTitle?: string | null;\n}",
+        "export interface HistoryResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: HistoryResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "export interface HostConfigResource {\n  analyticsEnabled?: boolean;\n  apiKey?: string | null;\n  applicationUrl?: string | null;\n  authenticationMethod?: AuthenticationType;\n  authenticationRequired?: AuthenticationRequiredType;\n  backupFolder?: string | null;\n  backupInterval?: number;\n  backupRetention?: number;\n  bindAddress?: string | null;\n  branch?: string | null;\n  certificateValidation?: CertificateValidationType;\n  consoleLogLevel?: string | null;\n  enableSsl?: boolean;\n  id?: number;\n  instanceName?: string | null;\n  launchBrowser?: boolean;\n  logLevel?: string | null;\n  logSizeLimit?: number;\n  password?: string | null;\n  passwordConfirmation?: string | null;\n  port?: number;\n  proxyBypassFilter?: string | null;\n  proxyBypassLocalAddresses?: boolean;\n  proxyEnabled?: boolean;\n  proxyHostname?: string | null;\n  proxyPassword?: string | null;\n  proxyPort?: number;\n  proxyType?: ProxyType;\n  proxyUsername?: string | null;\n  sslCertPassword?: string | null;\n  sslCertPath?: string | null;\n  sslPort?: number;\n  trustCgnatIpAddresses?: boolean;\n  updateAutomatically?: boolean;\n  updateMechanism?: UpdateMechanism;\n  updateScriptPath?: string | null;\n  urlBase?: string | null;\n  username?: string | null;\n}",
+        "HttpUri",
+        "export interface HttpUri {\n  fragment?: string | null;\n  fullUri?: string | null;\n  host?: string | null;\n  path?: string | null;\n  port?: number | null;\n  query?: string | null;\n  scheme?: string | null;\n}",
+        "export interface ImportListBulkResource {\n  applyTags?: ApplyTags;\n  enableAutomaticAdd?: boolean | null;\n  ids?: number[] | null;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  tags?: number[] | null;\n}",
+        "export interface ImportListConfigResource {\n  id?: number;\n  listSyncLevel?: ListSyncLevelType;\n  listSyncTag?: number;\n}",
+        "export interface ImportListExclusionBulkResource {\n  ids?: number[] | null;\n}",
+        "export interface ImportListExclusionResource {\n  id?: number;\n  title?: string | null;\n  tvdbId?: number;\n}",
+        "export interface ImportListExclusionResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: ImportListExclusionResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "export interface ImportListResource {\n  configContract?: string | null;\n  enableAutomaticAdd?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  listOrder?: number;\n  listType?: ImportListType;\n  message?: ProviderMessage;\n  minRefreshInterval?: string;\n  monitorNewItems?: NewItemMonitorTypes;\n  name?: string | null;\n  presets?: ImportListResource[] | null;\n  qualityProfileId?: number;\n  rootFolderPath?: string | null;\n  searchForMissingEpisodes?: boolean;\n  seasonFolder?: boolean;\n  seriesType?: SeriesTypes;\n  shouldMonitor?: MonitorTypes;\n  tags?: number[] | null;\n}",
+        "ImportListType",
+        "export type ImportListType = \"program\" | \"plex\" | \"trakt\" | \"simkl\" | \"other\" | \"advanced\";",
+        "ImportRejectionResource",
+        "export interface ImportRejectionResource {\n  reason?: string | null;\n  type?: RejectionType;\n}",
+        "export interface IndexerBulkResource {\n  applyTags?: ApplyTags;\n  enableAutomaticSearch?: boolean | null;\n  enableInteractiveSearch?: boolean | null;\n  enableRss?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  tags?: number[] | null;\n}",
+        "export interface IndexerConfigResource {\n  id?: number;\n  maximumSize?: number;\n  minimumAge?: number;\n  retention?: number;\n  rssSyncInterval?: number;\n}",
+        "export interface IndexerFlagResource {\n  id?: number;\n  name?: string | null;\n  nameLower?: string | null;\n}",
+        "export interface IndexerResource {\n  configContract?: string | null;\n  downloadClientId?: number;\n  enableAutomaticSearch?: boolean;\n  enableInteractiveSearch?: boolean;\n  enableRss?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: IndexerResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  seasonSearchMaximumSingleEpisodeAge?: number;\n  supportsRss?: boolean;\n  supportsSearch?: boolean;\n  tags?: number[] | null;\n}",
+        "export interface Language {\n  id?: number;\n  name?: string | null;\n}",
+        "LanguageProfileItemResource",
+        "export interface LanguageProfileItemResource {\n  allowed?: boolean;\n  id?: number;\n  language?: Language;\n}",
+        "export interface LanguageProfileResource {\n  cutoff?: Language;\n  id?: number;\n  languages?: LanguageProfileItemResource[] | null;\n  name?: string | null;\n  upgradeAllowed?: boolean;\n}",
+        "export interface LanguageResource {\n  id?: number;\n  name?: string | null;\n  nameLower?: string | null;\n}",
+        "ListSyncLevelType",
+        "export type ListSyncLevelType = \"disabled\" | \"logOnly\" | \"keepAndUnmonitor\" | \"keepAndTag\";",
+        "export interface LocalizationLanguageResource {\n  identifier?: string | null;\n}",
+        "export interface LocalizationResource {\n  id?: number;\n  strings?: Record<string, string | null> | null;\n}",
+        "export interface LogFileResource {\n  contentsUrl?: string | null;\n  downloadUrl?: string | null;\n  filename?: string | null;\n  id?: number;\n  lastWriteTime?: string;\n}",
+        "LogResource",
+        "export interface LogResource {\n  exception?: string | null;\n  exceptionType?: string | null;\n  id?: number;\n  level?: string | null;\n  logger?: string | null;\n  message?: string | null;\n  method?: string | null;\n  time?: string;\n}",
+        "export interface LogResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: LogResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "export interface ManualImportReprocessResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadId?: string | null;\n  episodeIds?: number[] | null;\n  episodes?: EpisodeResource[] | null;\n  id?: number;\n  indexerFlags?: number;\n  languages?: Language[] | null;\n  path?: string | null;\n  quality?: QualityModel;\n  rejections?: ImportRejectionResource[] | null;\n  releaseGroup?: string | null;\n  releaseType?: ReleaseType;\n  seasonNumber?: number | null;\n  seriesId?: number;\n}",
+        "export interface ManualImportResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadId?: string | null;\n  episodeFileId?: number | null;\n  episodes?: EpisodeResource[] | null;\n  folderName?: string | null;\n  id?: number;\n  indexerFlags?: number;\n  languages?: Language[] | null;\n  name?: string | null;\n  path?: string | null;\n  quality?: QualityModel;\n  qualityWeight?: number;\n  rejections?: ImportRejectionResource[] | null;\n  relativePath?: string | null;\n  releaseGroup?: string | null;\n  releaseType?: ReleaseType;\n  seasonNumber?: number | null;\n  series?: SeriesResource;\n  size?: number;\n}",
+        "export interface MediaCover {\n  coverType?: MediaCoverTypes;\n  remoteUrl?: string | null;\n  url?: string | null;\n}",
+        "MediaCoverTypes",
+        "export type MediaCoverTypes = \"unknown\" | \"poster\" | \"banner\" | \"fanart\" | \"screenshot\" | \"headshot\" | \"clearlogo\";",
+        "MediaInfoResource",
+        "export interface MediaInfoResource {\n  audioBitrate?: number;\n  audioChannels?: number;\n  audioCodec?: string | null;\n  audioLanguages?: string | null;\n  audioStreamCount?: number;\n  id?: number;\n  resolution?: string | null;\n  runTime?: string | null;\n  scanType?: string | null;\n  subtitles?: string | null;\n  videoBitDepth?: number;\n  videoBitrate?: number;\n  videoCodec?: string | null;\n  videoDynamicRange?: string | null;\n  videoDynamicRangeType?: string | null;\n  videoFps?: number;\n}",
+        "export interface MediaManagementConfigResource {\n  autoUnmonitorPreviouslyDownloadedEpisodes?: boolean;\n  chmodFolder?: string | null;\n  chownGroup?: string | null;\n  copyUsingHardlinks?: boolean;\n  createEmptySeriesFolders?: boolean;\n  deleteEmptyFolders?: boolean;\n  downloadPropersAndRepacks?: ProperDownloadTypes;\n  enableMediaInfo?: boolean;\n  episodeTitleRequired?: EpisodeTitleRequiredType;\n  extraFileExtensions?: string | null;\n  fileDate?: FileDateType;\n  id?: number;\n  importExtraFiles?: boolean;\n  minimumFreeSpaceWhenImporting?: number;\n  recycleBin?: string | null;\n  recycleBinCleanupDays?: number;\n  rescanAfterRefresh?: RescanAfterRefreshType;\n  scriptImportPath?: string | null;\n  setPermissionsLinux?: boolean;\n  skipFreeSpaceCheckWhenImporting?: boolean;\n  useScriptImport?: boolean;\n}",
+        "export interface MetadataResource {\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: MetadataResource[] | null;\n  tags?: number[] | null;\n}",
+        "MonitorTypes",
+        "export type MonitorTypes = \"unknown\" | \"all\" | \"future\" | \"missing\" | \"existing\" | \"firstSeason\" | \"lastSeason\" | \"latestSeason\" | \"pilot\" | \"recent\" | \"monitorSpecials\" | \"unmonitorSpecials\" | \"none\" | \"skip\";",
+        "MonitoringOptions",
+        "export interface MonitoringOptions {\n  ignoreEpisodesWithFiles?: boolean;\n  ignoreEpisodesWithoutFiles?: boolean;\n  monitor?: MonitorTypes;\n}",
+        "export interface NamingConfigResource {\n  animeEpisodeFormat?: string | null;\n  colonReplacementFormat?: number;\n  customColonReplacementFormat?: string | null;\n  dailyEpisodeFormat?: string | null;\n  id?: number;\n  multiEpisodeStyle?: number;\n  renameEpisodes?: boolean;\n  replaceIllegalCharacters?: boolean;\n  seasonFolderFormat?: string | null;\n  seriesFolderFormat?: string | null;\n  specialsFolderFormat?: string | null;\n  standardEpisodeFormat?: string | null;\n}",
+        "NewItemMonitorTypes",
+        "export type NewItemMonitorTypes = \"all\" | \"none\";",
+        "export interface NotificationResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  includeHealthWarnings?: boolean;\n  infoLink?: string | null;\n  link?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  onApplicationUpdate?: boolean;\n  onDownload?: boolean;\n  onEpisodeFileDelete?: boolean;\n  onEpisodeFileDeleteForUpgrade?: boolean;\n  onGrab?: boolean;\n  onHealthIssue?: boolean;\n  onHealthRestored?: boolean;\n  onImportComplete?: boolean;\n  onManualInteractionRequired?: boolean;\n  onRename?: boolean;\n  onSeriesAdd?: boolean;\n  onSeriesDelete?: boolean;\n  onUpgrade?: boolean;\n  presets?: NotificationResource[] | null;\n  supportsOnApplicationUpdate?: boolean;\n  supportsOnDownload?: boolean;\n  supportsOnEpisodeFileDelete?: boolean;\n  supportsOnEpisodeFileDeleteForUpgrade?: boolean;\n  supportsOnGrab?: boolean;\n  supportsOnHealthIssue?: boolean;\n  supportsOnHealthRestored?: boolean;\n  supportsOnImportComplete?: boolean;\n  supportsOnManualInteractionRequired?: boolean;\n  supportsOnRename?: boolean;\n  supportsOnSeriesAdd?: boolean;\n  supportsOnSeriesDelete?: boolean;\n  supportsOnUpgrade?: boolean;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
+        "export interface ParseResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  episodes?: EpisodeResource[] | null;\n  id?: number;\n  languages?: Language[] | null;\n  parsedEpisodeInfo?: ParsedEpisodeInfo;\n  series?: SeriesResource;\n  title?: string | null;\n}",
+        "ParsedEpisodeInfo",
+        "export interface ParsedEpisodeInfo {\n  absoluteEpisodeNumbers?: number[] | null;\n  airDate?: string | null;\n  dailyPart?: number | null;\n  episodeNumbers?: number[] | null;\n  fullSeason?: boolean;\n  isAbsoluteNumbering?: boolean;\n  isDaily?: boolean;\n  isMiniSeries?: boolean;\n  isMultiSeason?: boolean;\n  isPartialSeason?: boolean;\n  isPossibleSceneSeasonSpecial?: boolean;\n  isPossibleSpecialEpisode?: boolean;\n  isSeasonExtra?: boolean;\n  isSplitEpisode?: boolean;\n  languages?: Language[] | null;\n  quality?: QualityModel;\n  releaseGroup?: string | null;\n  releaseHash?: string | null;\n  releaseTitle?: string | null;\n  releaseTokens?: string | null;\n  releaseType?: ReleaseType;\n  seasonNumber?: number;\n  seasonPart?: number;\n  seriesTitle?: string | null;\n  seriesTitleInfo?: SeriesTitleInfo;\n  special?: boolean;\n  specialAbsoluteEpisodeNumbers?: number[] | null;\n}",
+        "export interface PingResource {\n  status?: string | null;\n}",
+        "PrivacyLevel",
+        "export type PrivacyLevel = \"normal\" | \"password\" | \"apiKey\" | \"userName\";",
+        "ProfileFormatItemResource",
+        "export interface ProfileFormatItemResource {\n  format?: number;\n  id?: number;\n  name?: string | null;\n  score?: number;\n}",
+        "ProperDownloadTypes",
+        "export type ProperDownloadTypes = \"preferAndUpgrade\" | \"doNotUpgrade\" | \"doNotPrefer\";",
+        "ProviderMessage",
+        "export interface ProviderMessage {\n  message?: string | null;\n  type?: ProviderMessageType;\n}",
+        "ProviderMessageType",
+        "export type ProviderMessageType = \"info\" | \"warning\" | \"error\";",
+        "ProxyType",
+        "export type ProxyType = \"http\" | \"socks4\" | \"socks5\";",
+        "Quality",
+        "export interface Quality {\n  id?: number;\n  name?: string | null;\n  resolution?: number;\n  source?: QualitySource;\n}",
+        "export interface QualityDefinitionLimitsResource {\n  max?: number;\n  min?: number;\n}",
+        "export interface QualityDefinitionResource {\n  id?: number;\n  maxSize?: number | null;\n  minSize?: number | null;\n  preferredSize?: number | null;\n  quality?: Quality;\n  title?: string | null;\n  weight?: number;\n}",
+        "QualityModel",
+        "export interface QualityModel {\n  quality?: Quality;\n  revision?: Revision;\n}",
+        "QualityProfileQualityItemResource",
+        "export interface QualityProfileQualityItemResource {\n  allowed?: boolean;\n  id?: number;\n  items?: QualityProfileQualityItemResource[] | null;\n  name?: string | null;\n  quality?: Quality;\n}",
+        "export interface QualityProfileResource {\n  cutoff?: number;\n  cutoffFormatScore?: number;\n  formatItems?: ProfileFormatItemResource[] | null;\n  id?: number;\n  items?: QualityProfileQualityItemResource[] | null;\n  minFormatScore?: number;\n  minUpgradeFormatScore?: number;\n  name?: string | null;\n  upgradeAllowed?: boolean;\n}",
+        "QualitySource",
+        "export type QualitySource = \"unknown\" | \"television\" | \"televisionRaw\" | \"web\" | \"webRip\" | \"dvd\" | \"bluray\" | \"blurayRaw\";",
+        "export interface QueueBulkResource {\n  ids?: number[] | null;\n}",
+        "export interface QueueResource {\n  added?: string | null;\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadClient?: string | null;\n  downloadClientHasPostImportCategory?: boolean;\n  downloadId?: string | null;\n  episode?: EpisodeResource;\n  episodeHasFile?: boolean;\n  episodeId?: number | null;\n  errorMessage?: string | null;\n  estimatedCompletionTime?: string | null;\n  id?: number;\n  indexer?: string | null;\n  languages?: Language[] | null;\n  outputPath?: string | null;\n  protocol?: DownloadProtocol;\n  quality?: QualityModel;\n  seasonNumber?: number | null;\n  series?: SeriesResource;\n  seriesId?: number | null;\n  size?: number;\n  sizeleft?: number;\n  status?: QueueStatus;\n  statusMessages?: TrackedDownloadStatusMessage[] | null;\n  timeleft?: string | null;\n  title?: string | null;\n  trackedDownloadState?: TrackedDownloadState;\n  trackedDownloadStatus?: TrackedDownloadStatus;\n}",
+        "export interface QueueResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: QueueResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
+        "export type QueueStatus = \"unknown\" | \"queued\" | \"paused\" | \"downloading\" | \"completed\" | \"failed\" | \"warning\" | \"delay\" | \"downloadClientUnavailable\" | \"fallback\";",
+        "export interface QueueStatusResource {\n  count?: number;\n  errors?: boolean;\n  id?: number;\n  totalCount?: number;\n  unknownCount?: number;\n  unknownErrors?: boolean;\n  unknownWarnings?: boolean;\n  warnings?: boolean;\n}",
+        "Ratings",
+        "export interface Ratings {\n  value?: number;\n  votes?: number;\n}",
+        "RejectionType",
+        "export type RejectionType = \"permanent\" | \"temporary\";",
+        "ReleaseEpisodeResource",
+        "export interface ReleaseEpisodeResource {\n  absoluteEpisodeNumber?: number | null;\n  episodeNumber?: number;\n  id?: number;\n  seasonNumber?: number;\n  title?: string | null;\n}",
+        "export interface ReleaseProfileResource {\n  enabled?: boolean;\n  id?: number;\n  ignored?: unknown | null;\n  indexerId?: number;\n  name?: string | null;\n  required?: unknown | null;\n  tags?: number[] | null;\n}",
+        "export interface ReleaseResource {\n  absoluteEpisodeNumbers?: number[] | null;\n  age?: number;\n  ageHours?: number;\n  ageMinutes?: number;\n  airDate?: string | null;\n  approved?: boolean;\n  commentUrl?: string | null;\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadAllowed?: boolean;\n  downloadClient?: string | null;\n  downloadClientId?: number | null;\n  downloadUrl?: string | null;\n  episodeId?: number | null;\n  episodeIds?: number[] | null;\n  episodeNumbers?: number[] | null;\n  episodeRequested?: boolean;\n  fullSeason?: boolean;\n  guid?: string | null;\n  id?: number;\n  imdbId?: string | null;\n  indexer?: string | null;\n  indexerFlags?: number;\n  indexerId?: number;\n  infoHash?: string | null;\n  infoUrl?: string | null;\n  isAbsoluteNumbering?: boolean;\n  isDaily?: boolean;\n  isPossibleSpecialEpisode?: boolean;\n  languageWeight?: number;\n  languages?: Language[] | null;\n  leechers?: number | null;\n  magnetUrl?: string | null;\n  mappedAbsoluteEpisodeNumbers?: number[] | null;\n  mappedEpisodeInfo?: ReleaseEpisodeResource[] | null;\n  mappedEpisodeNumbers?: number[] | null;\n  mappedSeasonNumber?: number | null;\n  mappedSeriesId?: number | null;\n  protocol?: DownloadProtocol;\n  publishDate?: string;\n  quality?: QualityModel;\n  qualityWeight?: number;\n  rejected?: boolean;\n  rejections?: string[] | null;\n  releaseGroup?: string | null;\n  releaseHash?: string | null;\n  releaseWeight?: number;\n  sceneMapping?: AlternateTitleResource;\n  sceneSource?: boolean;\n  seasonNumber?: number;\n  seeders?: number | null;\n  seriesId?: number | null;\n  seriesTitle?: string | null;\n  shouldOverride?: boolean | null;\n  size?: number;\n  special?: boolean;\n  subGroup?: string | null;\n  temporarilyRejected?: boolean;\n  title?: string | null;\n  tvRageId?: number;\n  tvdbId?: number;\n}",
+        "ReleaseType",
+        "export type ReleaseType = \"unknown\" | \"singleEpisode\" | \"multiEpisode\" | \"seasonPack\";",
+        "export interface RemotePathMappingResource {\n  host?: string | null;\n  id?: number;\n  localPath?: string | null;\n  remotePath?: string | null;\n}",
+        "export interface RenameEpisodeResource {\n  episodeFileId?: number;\n  episodeNumbers?: number[] | null;\n  existingPath?: string | null;\n  id?: number;\n  newPath?: string | null;\n  seasonNumber?: number;\n  seriesId?: number;\n}",
+        "RescanAfterRefreshType",
+        "export type RescanAfterRefreshType = \"always\" | \"afterManual\" | \"never\";",
+        "Revision",
+        "export interface Revision {\n  isRepack?: boolean;\n  real?: number;\n  version?: number;\n}",
+        "export interface RootFolderResource {\n  accessible?: boolean;\n  freeSpace?: number | null;\n  id?: number;\n  path?: string | null;\n  unmappedFolders?: UnmappedFolder[] | null;\n}",
+        "RuntimeMode",
+        "export type RuntimeMode = \"console\" | \"service\" | \"tray\";",
+        "export interface SeasonPassResource {\n  monitoringOptions?: MonitoringOptions;\n  series?: SeasonPassSeriesResource[] | null;\n}",
+        "SeasonPassSeriesResource",
+        "export interface SeasonPassSeriesResource {\n  id?: number;\n  monitored?: boolean | null;\n  seasons?: SeasonResource[] | null;\n}",
+        "SeasonResource",
+        "export interface SeasonResource {\n  images?: MediaCover[] | null;\n  monitored?: boolean;\n  seasonNumber?: number;\n  statistics?: SeasonStatisticsResource;\n}",
+        "SeasonStatisticsResource",
+        "export interface SeasonStatisticsResource {\n  episodeCount?: number;\n  episodeFileCount?: number;\n  nextAiring?: string | null;\n  percentOfEpisodes?: number;\n  previousAiring?: string | null;\n  releaseGroups?: string[] | null;\n  sizeOnDisk?: number;\n  totalEpisodeCount?: number;\n}",
+        "SelectOption",
+        "export interface SelectOption {\n  hint?: string | null;\n  name?: string | null;\n  order?: number;\n  value?: number;\n}",
+        "export interface SeriesEditorResource {\n  addImportListExclusion?: boolean;\n  applyTags?: ApplyTags;\n  deleteFiles?: boolean;\n  monitorNewItems?: NewItemMonitorTypes;\n  monitored?: boolean | null;\n  moveFiles?: boolean;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  seasonFolder?: boolean | null;\n  seriesIds?: number[] | null;\n  seriesType?: SeriesTypes;\n  tags?: number[] | null;\n}",
+        "export interface SeriesResource {\n  addOptions?: AddSeriesOptions;\n  added?: string;\n  airTime?: string | null;\n  alternateTitles?: AlternateTitleResource[] | null;\n  certification?: string | null;\n  cleanTitle?: string | null;\n  ended?: boolean;\n  episodesChanged?: boolean | null;\n  firstAired?: string | null;\n  folder?: string | null;\n  genres?: string[] | null;\n  id?: number;\n  images?: MediaCover[] | null;\n  imdbId?: string | null;\n  languageProfileId?: number;\n  lastAired?: string | null;\n  monitorNewItems?: NewItemMonitorTypes;\n  monitored?: boolean;\n  network?: string | null;\n  nextAiring?: string | null;\n  originalLanguage?: Language;\n  overview?: string | null;\n  path?: string | null;\n  previousAiring?: string | null;\n  profileName?: string | null;\n  qualityProfileId?: number;\n  ratings?: Ratings;\n  remotePoster?: string | null;\n  rootFolderPath?: string | null;\n  runtime?: number;\n  seasonFolder?: boolean;\n  seasons?: SeasonResource[] | null;\n  seriesType?: SeriesTypes;\n  sortTitle?: string | null;\n  statistics?: SeriesStatisticsResource;\n  status?: SeriesStatusType;\n  tags?: number[] | null;\n  title?: string | null;\n  titleSlug?: string | null;\n  tmdbId?: number;\n  tvMazeId?: number;\n  tvRageId?: number;\n  tvdbId?: number;\n  useSceneNumbering?: boolean;\n  year?: number;\n}",
+        "SeriesStatisticsResource",
+        "export interface SeriesStatisticsResource {\n  episodeCount?: number;\n  episodeFileCount?: number;\n  percentOfEpisodes?: number;\n  releaseGroups?: string[] | null;\n  seasonCount?: number;\n  sizeOnDisk?: number;\n  totalEpisodeCount?: number;\n}",
+        "SeriesStatusType",
+        "export type SeriesStatusType = \"continuing\" | \"ended\" | \"upcoming\" | \"deleted\";",
+        "SeriesTitleInfo",
+        "export interface SeriesTitleInfo {\n  allTitles?: string[] | null;\n  title?: string | null;\n  titleWithoutYear?: string | null;\n  year?: number;\n}",
+        "SeriesTypes",
+        "export type SeriesTypes = \"standard\" | \"daily\" | \"anime\";",
+        "SortDirection",
+        "export type SortDirection = \"default\" | \"ascending\" | \"descending\";",
+        "export interface SystemResource {\n  appData?: string | null;\n  appName?: string | null;\n  authentication?: AuthenticationType;\n  branch?: string | null;\n  buildTime?: string;\n  databaseType?: DatabaseType;\n  databaseVersion?: string | null;\n  instanceName?: string | null;\n  isAdmin?: boolean;\n  isDebug?: boolean;\n  isDocker?: boolean;\n  isLinux?: boolean;\n  isNetCore?: boolean;\n  isOsx?: boolean;\n  isProduction?: boolean;\n  isUserInteractive?: boolean;\n  isWindows?: boolean;\n  migrationVersion?: number;\n  mode?: RuntimeMode;\n  osName?: string | null;\n  osVersion?: string | null;\n  packageAuthor?: string | null;\n  packageUpdateMechanism?: UpdateMechanism;\n  packageUpdateMechanismMessage?: string | null;\n  packageVersion?: string | null;\n  runtimeName?: string | null;\n  runtimeVersion?: string | null;\n  sqliteVersion?: string | null;\n  startTime?: string;\n  startupPath?: string | null;\n  urlBase?: string | null;\n  version?: string | null;\n}",
+        "export interface TagDetailsResource {\n  autoTagIds?: number[] | null;\n  delayProfileIds?: number[] | null;\n  downloadClientIds?: number[] | null;\n  id?: number;\n  importListIds?: number[] | null;\n  indexerIds?: number[] | null;\n  label?: string | null;\n  notificationIds?: number[] | null;\n  restrictionIds?: number[] | null;\n  seriesIds?: number[] | null;\n}",
+        "export interface TagResource {\n  id?: number;\n  label?: string | null;\n}",
+        "export interface TaskResource {\n  id?: number;\n  interval?: number;\n  lastDuration?: string;\n  lastExecution?: string;\n  lastStartTime?: string;\n  name?: string | null;\n  nextExecution?: string;\n  taskName?: string | null;\n}",
+        "TrackedDownloadState",
+        "export type TrackedDownloadState = \"downloading\" | \"importBlocked\" | \"importPending\" | \"importing\" | \"imported\" | \"failedPending\" | \"failed\" | \"ignored\";",
+        "TrackedDownloadStatus",
+        "export type TrackedDownloadStatus = \"ok\" | \"warning\" | \"error\";",
+        "TrackedDownloadStatusMessage",
+        "export interface TrackedDownloadStatusMessage {\n  messages?: string[] | null;\n  title?: string | null;\n}",
+        "export interface UiConfigResource {\n  calendarWeekColumnHeader?: string | null;\n  enableColorImpairedMode?: boolean;\n  firstDayOfWeek?: number;\n  id?: number;\n  longDateFormat?: string | null;\n  shortDateFormat?: string | null;\n  showRelativeDates?: boolean;\n  theme?: string | null;\n  timeFormat?: string | null;\n  uiLanguage?: number;\n}",
+        "UnmappedFolder",
+        "export interface UnmappedFolder {\n  name?: string | null;\n  path?: string | null;\n  relativePath?: string | null;\n}",
+        "UpdateChanges",
+        "export interface UpdateChanges {\n  fixed?: string[] | null;\n  new?: string[] | null;\n}",
+        "UpdateMechanism",
+        "export type UpdateMechanism = \"builtIn\" | \"script\" | \"external\" | \"apt\" | \"docker\";",
+        "export interface UpdateResource {\n  branch?: string | null;\n  changes?: UpdateChanges;\n  fileName?: string | null;\n  hash?: string | null;\n  id?: number;\n  installable?: boolean;\n  installed?: boolean;\n  installedOn?: string | null;\n  latest?: boolean;\n  releaseDate?: string;\n  url?: string | null;\n  version?: string | null;\n}",
+    ),
+    string_ends: &[
+        24, 48, 50, 85, 96, 96, 117, 139, 157, 210, 214, 230, 239, 260, 269, 291, 313, 333, 353,
+        360, 385, 410, 422, 446, 471, 527, 551, 563, 588, 613, 638, 663, 675, 701, 728, 786, 812,
+        826, 853, 880, 903, 927, 982, 1005, 1016, 1040, 1064, 1086, 1109, 1163, 1185, 1195, 1218,
+        1241, 1272, 1304, 1367, 1398, 1417, 1449, 1481, 1500, 1520, 1571, 1590, 1597, 1617, 1637,
+        1665, 1693, 1708, 1729, 1750, 1758, 1783, 1808, 1820, 1847, 1874, 1888, 1905, 1923, 1932,
+        1946, 1962, 1976, 2010, 2043, 2092, 2109, 2114, 2132, 2150, 2177, 2204, 2218, 2248, 2278,
+        2295, 2318, 2341, 2351, 2370, 2389, 2411, 2422, 2428, 2448, 2469, 2521, 2541, 2553, 2579,
+        2605, 2611, 2627, 2643, 2646, 2649, 2653, 2660, 2675, 2694, 2697, 2773, 2792, 2813, 2864,
+        2886, 2912, 2925, 2942, 2946, 2954, 2963, 2972, 2985, 2992, 3039, 3087, 3160, 3220, 3265,
+        3282, 3345, 3376, 3389, 3396, 3400, 3448, 3462, 3474, 3490, 3493, 3511, 3531, 3544, 3549,
+        3553, 3564, 3602, 3632, 3704, 3719, 3727, 3745, 3766, 3813, 3824, 3839, 3911, 3926, 3943,
+        3990, 4015, 4044, 4104, 4132, 4152, 4183, 4217, 4232, 4251, 4301, 4311, 4329, 4339, 4360,
+        4384, 4405, 4430, 4486, 4510, 4526, 4553, 4583, 4601, 4623, 4676, 4697, 4710, 4734, 4761,
+        4787, 4817, 4878, 4907, 4928, 4960, 4995, 5012, 5033, 5085, 5105, 5117, 5140, 5166, 5192,
+        5222, 5240, 5262, 5290, 5308, 5325, 5339, 5363, 5375, 5393, 5411, 5431, 5452, 5470, 5483,
+        5500, 5548, 5564, 5572, 5591, 5613, 5632, 5647, 5688, 5704, 5724, 5801, 5821, 5843, 5895,
+        5911, 5931, 6008, 6028, 6050, 6102, 6125, 6152, 6168, 6188, 6265, 6285, 6307, 6359, 6372,
+        6389, 6463, 6480, 6489, 6507, 6529, 6608, 6630, 6654, 6708, 6733, 6762, 6773, 6788, 6801,
+        6811, 6824, 6836, 6844, 6851, 6868, 6888, 6903, 6922, 6936, 7012, 7031, 7052, 7103, 7131,
+        7159, 7167, 7177, 7185, 7198, 7246, 7293, 7305, 7319, 7337, 7371, 7383, 7393, 7418, 7447,
+        7466, 7489, 7499, 7513, 7584, 7598, 7604, 7615, 7630, 7640, 7649, 7658, 7672, 7681, 7688,
+        7749, 7778, 7785, 7803, 7825, 7880, 7952, 7967, 7984, 8005, 8009, 8023, 8041, 8116, 8134,
+        8154, 8204, 8225, 8250, 8273, 8300, 8384, 8411, 8440, 8499, 8528, 8561, 8634, 8675, 8686,
+        8701, 8773, 8788, 8805, 8852, 8870, 8892, 8907, 8926, 9002, 9021, 9032, 9044, 9060, 9133,
+        9149, 9157, 9175, 9196, 9244, 9263, 9286, 9366, 9389, 9414, 9469, 9495, 9525, 9546, 9562,
+        9582, 9634, 9654, 9666, 9688, 9713, 9738, 9767, 9827, 9855, 9862, 9873, 9878, 9935, 9960,
+        9963, 9975, 9991, 10063, 10078, 10085, 10109, 10136, 10144, 10195, 10214, 10237, 10250,
+        10281, 10315, 10324, 10330, 10340, 10347, 10361, 10377, 10397, 10416, 10422, 10499, 10519,
+        10531, 10567, 10607, 10657, 10667, 10679, 10695, 10768, 10784, 10802, 10850, 10869, 10892,
+        10908, 10928, 11005, 11025, 11047, 11099, 11122, 11149, 11158, 11171, 11176, 11221, 11234,
+        11239, 11247, 11252, 11296, 11308, 11312, 11333, 11358, 11440, 11465, 11482, 11509, 11539,
+        11596, 11624, 11656, 11719, 11750, 11768, 11790, 11869, 11891, 11915, 11969, 11994, 12023,
+        12043, 12052, 12065, 12090, 12098, 12104, 12152, 12220, 12279, 12306, 12323, 12344, 12414,
+        12427, 12439, 12455, 12475, 12526, 12545, 12556, 12567, 12582, 12654, 12669, 12676, 12694,
+        12716, 12795, 12817, 12841, 12895, 12916, 12941, 13023, 13048, 13075, 13132, 13142, 13156,
+        13234, 13255, 13268, 13282, 13300, 13375, 13393, 13413, 13463, 13473, 13487, 13506, 13512,
+        13583, 13597, 13613, 13659, 13682, 13708, 13720, 13737, 13758, 13762, 13774, 13791, 13812,
+        13883, 13897, 13914, 13935, 13941, 13968, 13999, 14016, 14037, 14083, 14097, 14112, 14131,
+        14200, 14212, 14216, 14237, 14261, 14305, 14312, 14323, 14391, 14402, 14415, 14458, 14472,
+        14490, 14565, 14583, 14593, 14613, 14636, 14686, 14696, 14710, 14781, 14795, 14801, 14818,
+        14839, 14848, 14909, 14938, 14944, 14967, 14993, 15011, 15033, 15040, 15064, 15091, 15107,
+        15119, 15136, 15153, 15170, 15189, 15198, 15232, 15268, 15272, 15296, 15323, 15332, 15359,
+        15389, 15414, 15441, 15456, 15486, 15518, 15538, 15561, 15584, 15610, 15634, 15646, 15673,
+        15702, 15719, 15739, 15759, 15782, 15802, 15812, 15821, 15840, 15961, 16048, 16065, 16151,
+        16180, 16193, 16221, 16251, 16269, 16290, 16311, 16335, 16352, 16384, 16418, 16440, 16465,
+        16490, 16518, 16537, 16557, 16580, 16591, 16612, 16635, 16647, 16694, 16711, 16731, 16742,
+        16761, 16783, 16798, 16813, 16831, 16881, 16899, 16909, 16920, 16938, 16959, 16971, 17003,
+        17037, 17070, 17106, 17201, 17243, 17262, 17284, 17304, 17327, 17335, 17356, 17387, 17408,
+        17435, 17459, 17491, 17514, 17533, 17555, 17576, 17598, 17620, 17650, 17683, 17688, 17711,
+        17735, 17752, 17771, 17794, 17851, 17876, 17896, 17917, 17939, 17965, 17984, 18004, 18033,
+        18049, 18066, 18091, 18109, 18131, 18158, 18186, 18218, 18242, 18266, 18293, 18309, 18318,
+        18335, 18348, 18364, 18584, 18606, 18801, 18810, 18863, 18889, 18970, 18988, 19061, 19263,
+        19293, 19524, 19677, 19687, 19746, 19813, 19830, 20204, 20419, 20444, 20537, 20939, 20954,
+        21010, 21572, 21585, 21655, 21668, 21781, 21795, 21863, 22014, 22136, 22329, 22360, 22674,
+        22686, 22737, 23096, 23243, 23508, 23754, 24242, 24258, 24322, 24522, 25044, 25067, 25264,
+        26021, 26232, 26256, 26337, 26438, 26443, 26942, 26954, 27020, 27037, 27107, 27259, 27744,
+        27955, 29181, 29188, 29394, 29622, 29743, 29820, 29927, 30162, 30839, 30853, 30944, 30967,
+        31061, 31321, 31475, 31583, 32189, 32257, 32284, 32391, 32575, 32680, 32697, 32788, 32867,
+        32973, 33140, 33151, 33381, 33584, 34100, 34743, 34857, 34872, 34987, 35004, 35495, 36301,
+        36652, 36664, 36874, 36891, 37032, 37500, 37519, 37568, 38859, 39152, 39169, 40042, 40101,
+        40113, 40186, 40211, 40333, 40352, 40438, 40453, 40546, 40565, 40628, 40637, 40690, 40697,
+        40813, 40897, 41110, 41122, 41199, 41232, 41421, 41747, 41760, 41883, 41946, 42876, 43083,
+        43247, 43466, 43473, 43537, 43550, 43604, 43626, 43801, 44009, 45836, 45847, 45933, 46077,
+        46301, 46323, 46395, 46403, 46491, 46667, 46678, 46735, 46861, 46885, 47012, 47026, 47182,
+        47206, 47487, 47499, 47616, 48025, 49328, 49352, 49593, 49609, 49688, 49703, 49848, 49859,
+        49916, 49929, 49996, 50948, 51306, 51378, 51602, 51622, 51775, 51796, 51859, 51887, 51991,
+        52329, 52343, 52458, 52471, 52557, 52572, 52655, 52983,
+    ],
+    names: &[
+        2, 82, 83, 84, 85, 104, 105, 132, 133, 134, 135, 136, 137, 148, 153, 154, 155, 156, 157,
+        158, 159, 219, 220, 221, 222, 2, 223, 224, 225, 226, 227, 228, 229, 230, 277, 278, 154,
+        279, 156, 280, 281, 287, 281, 294, 295, 296, 297, 158, 159, 303, 304, 148, 317, 318, 319,
+        320, 156, 321, 132, 133, 322, 135, 136, 137, 319, 320, 156, 280, 281, 333, 319, 320, 156,
+        132, 133, 136, 137, 395, 132, 133, 136, 137, 406, 317, 420, 421, 280, 281, 406, 281, 148,
+        447, 320, 156, 479, 321, 132, 133, 480, 322, 135, 136, 137, 481, 278, 320, 156, 281, 318,
+        280, 281, 280, 281, 526, 527, 526, 537, 154, 279, 156, 581, 132, 133, 136, 137, 279, 156,
+        581, 132, 133, 136, 137, 598, 601, 604, 626, 695, 279, 722,
+    ],
+    parameters: &[
+        [2, 0, 1, 3, 0, 0],
+        [82, 1, 0, 86, 3, 1],
+        [83, 1, 0, 86, 3, 1],
+        [84, 1, 0, 87, 3, 1],
+        [85, 1, 0, 86, 3, 1],
+        [82, 1, 0, 86, 3, 1],
+        [83, 1, 0, 86, 3, 1],
+        [2, 0, 1, 3, 0, 0],
+        [84, 1, 0, 87, 3, 1],
+        [85, 1, 0, 86, 3, 1],
+        [104, 1, 0, 86, 3, 1],
+        [105, 1, 0, 86, 3, 1],
+        [2, 0, 1, 3, 0, 0],
+        [132, 1, 0, 138, 3, 1],
+        [133, 1, 0, 139, 3, 1],
+        [134, 1, 0, 140, 3, 1],
+        [135, 1, 0, 141, 3, 1],
+        [136, 1, 0, 142, 3, 1],
+        [137, 1, 0, 143, 3, 1],
+        [148, 0, 1, 149, 0, 0],
+        [153, 1, 0, 160, 3, 1],
+        [154, 1, 0, 86, 3, 1],
+        [155, 1, 0, 86, 3, 1],
+        [156, 1, 0, 86, 3, 1],
+        [157, 1, 0, 160, 3, 1],
+        [158, 1, 0, 161, 3, 1],
+        [159, 1, 0, 86, 3, 1],
+        [219, 1, 0, 143, 3, 1],
+        [220, 1, 0, 3, 3, 1],
+        [221, 1, 0, 143, 3, 1],
+        [222, 1, 0, 143, 3, 1],
+        [2, 1, 0, 3, 3, 1],
+        [223, 1, 0, 3, 3, 1],
+        [224, 1, 0, 231, 3, 1],
+        [225, 1, 0, 231, 3, 1],
+        [226, 1, 0, 143, 3, 1],
+        [227, 1, 0, 143, 3, 1],
+        [228, 1, 0, 143, 3, 1],
+        [229, 1, 0, 143, 3, 1],
+        [230, 1, 0, 143, 3, 1],
+        [148, 0, 1, 241, 0, 0],
+        [277, 1, 0, 3, 3, 1],
+        [278, 1, 0, 141, 3, 1],
+        [154, 1, 0, 86, 3, 1],
+        [279, 1, 0, 86, 3, 1],
+        [156, 1, 0, 86, 3, 1],
+        [280, 1, 0, 3, 3, 1],
+        [281, 1, 0, 3, 3, 1],
+        [287, 1, 0, 141, 3, 1],
+        [281, 1, 0, 3, 3, 1],
+        [294, 1, 0, 86, 3, 1],
+        [295, 1, 0, 298, 3, 1],
+        [296, 1, 0, 299, 3, 1],
+        [297, 1, 0, 86, 3, 1],
+        [158, 1, 0, 161, 3, 1],
+        [159, 1, 0, 86, 3, 1],
+        [303, 1, 0, 86, 3, 1],
+        [304, 1, 0, 86, 3, 1],
+        [148, 1, 0, 143, 3, 1],
+        [148, 1, 0, 143, 3, 1],
+        [317, 1, 0, 143, 3, 1],
+        [318, 1, 0, 3, 3, 1],
+        [319, 1, 0, 141, 3, 1],
+        [320, 1, 0, 231, 3, 1],
+        [156, 1, 0, 231, 3, 1],
+        [321, 1, 0, 141, 3, 1],
+        [132, 1, 0, 138, 3, 1],
+        [133, 1, 0, 139, 3, 1],
+        [322, 1, 0, 141, 3, 1],
+        [135, 1, 0, 141, 3, 1],
+        [136, 1, 0, 142, 3, 1],
+        [137, 1, 0, 143, 3, 1],
+        [319, 1, 0, 328, 3, 1],
+        [320, 1, 0, 86, 3, 1],
+        [156, 1, 0, 86, 3, 1],
+        [280, 1, 0, 3, 3, 1],
+        [281, 1, 0, 3, 3, 1],
+        [333, 1, 0, 160, 3, 1],
+        [319, 1, 0, 328, 3, 1],
+        [320, 1, 0, 86, 3, 1],
+        [156, 1, 0, 86, 3, 1],
+        [132, 1, 0, 138, 3, 1],
+        [133, 1, 0, 139, 3, 1],
+        [136, 1, 0, 142, 3, 1],
+        [137, 1, 0, 143, 3, 1],
+        [395, 1, 0, 143, 3, 1],
+        [132, 1, 0, 138, 3, 1],
+        [133, 1, 0, 139, 3, 1],
+        [136, 1, 0, 142, 3, 1],
+        [137, 1, 0, 143, 3, 1],
+        [406, 0, 1, 407, 0, 0],
+        [317, 1, 0, 143, 3, 1],
+        [420, 1, 0, 87, 3, 1],
+        [421, 1, 0, 143, 3, 1],
+        [280, 1, 0, 3, 3, 1],
+        [281, 1, 0, 3, 3, 1],
+        [406, 0, 1, 427, 0, 0],
+        [281, 0, 1, 3, 0, 0],
+        [148, 1, 0, 143, 3, 1],
+        [447, 1, 0, 143, 3, 1],
+        [320, 1, 0, 86, 3, 1],
+        [156, 1, 0, 86, 3, 1],
+        [479, 1, 0, 86, 3, 1],
+        [321, 1, 0, 141, 3, 1],
+        [132, 1, 0, 138, 3, 1],
+        [133, 1, 0, 139, 3, 1],
+        [480, 1, 0, 482, 3, 1],
+        [322, 1, 0, 141, 3, 1],
+        [135, 1, 0, 141, 3, 1],
+        [136, 1, 0, 142, 3, 1],
+        [137, 1, 0, 143, 3, 1],
+        [481, 1, 0, 483, 3, 1],
+        [278, 1, 0, 141, 3, 1],
+        [320, 1, 0, 86, 3, 1],
+        [156, 1, 0, 86, 3, 1],
+        [281, 1, 0, 3, 3, 1],
+        [318, 1, 0, 3, 3, 1],
+        [280, 1, 0, 3, 3, 1],
+        [281, 1, 0, 3, 3, 1],
+        [280, 1, 0, 3, 3, 1],
+        [281, 1, 0, 3, 3, 1],
+        [526, 1, 0, 86, 3, 1],
+        [527, 1, 0, 3, 3, 1],
+        [2, 0, 1, 3, 0, 0],
+        [526, 1, 0, 86, 3, 1],
+        [537, 1, 0, 143, 3, 1],
+        [154, 1, 0, 86, 3, 1],
+        [279, 1, 0, 86, 3, 1],
+        [156, 1, 0, 86, 3, 1],
+        [581, 1, 0, 87, 3, 1],
+        [132, 1, 0, 138, 3, 1],
+        [133, 1, 0, 139, 3, 1],
+        [136, 1, 0, 142, 3, 1],
+        [137, 1, 0, 143, 3, 1],
+        [279, 1, 0, 86, 3, 1],
+        [156, 1, 0, 86, 3, 1],
+        [581, 1, 0, 87, 3, 1],
+        [132, 1, 0, 138, 3, 1],
+        [133, 1, 0, 139, 3, 1],
+        [136, 1, 0, 142, 3, 1],
+        [137, 1, 0, 143, 3, 1],
+        [598, 1, 0, 86, 3, 1],
+        [601, 0, 1, 143, 0, 0],
+        [604, 1, 0, 86, 3, 1],
+        [626, 1, 0, 143, 3, 1],
+        [2, 0, 1, 143, 0, 0],
+        [695, 1, 0, 3, 3, 1],
+        [2, 0, 1, 3, 0, 0],
+        [598, 1, 0, 86, 3, 1],
+        [2, 0, 1, 3, 0, 0],
+        [279, 1, 0, 86, 3, 1],
+        [2, 0, 1, 143, 0, 0],
+        [722, 1, 0, 86, 3, 1],
+    ],
+    representations: &[
+        [0, 8, 0, 9, 10],
+        [0, 11, 0, 9, 10],
+        [0, 12, 0, 9, 10],
+        [0, 11, 0, 25, 10],
+        [0, 11, 0, 35, 10],
+        [0, 11, 0, 42, 10],
+        [0, 11, 0, 49, 10],
+        [0, 8, 0, 56, 10],
+        [0, 11, 0, 56, 10],
+        [0, 12, 0, 56, 10],
+        [0, 11, 0, 63, 10],
+        [0, 8, 0, 88, 10],
+        [0, 11, 0, 88, 10],
+        [0, 12, 0, 88, 10],
+        [0, 8, 0, 109, 10],
+        [0, 11, 0, 109, 10],
+        [0, 12, 0, 109, 10],
+        [124, 11, 0, 124, 10],
+        [124, 11, 0, 127, 10],
+        [124, 11, 0, 144, 10],
+        [124, 11, 0, 162, 10],
+        [124, 11, 0, 167, 10],
+        [124, 11, 0, 170, 10],
+        [124, 11, 0, 173, 10],
+        [124, 11, 0, 176, 10],
+        [124, 11, 0, 183, 10],
+        [124, 12, 0, 183, 10],
+        [124, 184, 3, 183, 10],
+        [124, 11, 0, 183, 10],
+        [124, 11, 0, 191, 10],
+        [124, 11, 0, 198, 10],
+        [124, 11, 0, 205, 10],
+        [124, 11, 0, 212, 10],
+        [124, 12, 0, 212, 10],
+        [124, 184, 3, 212, 10],
+        [124, 11, 0, 212, 10],
+        [124, 11, 0, 234, 10],
+        [124, 11, 0, 244, 10],
+        [124, 11, 0, 247, 10],
+        [124, 11, 0, 250, 10],
+        [124, 11, 0, 253, 10],
+        [124, 11, 0, 258, 10],
+        [124, 11, 0, 261, 10],
+        [124, 11, 0, 264, 10],
+        [124, 11, 0, 269, 10],
+        [124, 11, 0, 272, 10],
+        [124, 11, 0, 288, 10],
+        [124, 11, 0, 291, 10],
+        [124, 11, 0, 312, 10],
+        [124, 11, 0, 323, 10],
+        [124, 11, 0, 329, 10],
+        [124, 11, 0, 336, 10],
+        [124, 11, 0, 339, 10],
+        [124, 11, 0, 344, 10],
+        [124, 11, 0, 347, 10],
+        [124, 11, 0, 350, 10],
+        [124, 11, 0, 354, 10],
+        [124, 11, 0, 357, 10],
+        [124, 11, 0, 362, 10],
+        [124, 12, 0, 362, 10],
+        [124, 184, 3, 362, 10],
+        [124, 11, 0, 367, 10],
+        [124, 12, 0, 367, 10],
+        [124, 184, 3, 367, 10],
+        [124, 11, 0, 372, 10],
+        [124, 11, 0, 375, 10],
+        [124, 11, 0, 378, 10],
+        [124, 11, 0, 384, 10],
+        [124, 11, 0, 391, 10],
+        [124, 11, 0, 396, 10],
+        [124, 11, 0, 401, 10],
+        [124, 11, 0, 422, 10],
+        [124, 11, 0, 431, 10],
+        [124, 11, 0, 434, 10],
+        [124, 11, 0, 439, 10],
+        [124, 11, 0, 442, 10],
+        [124, 11, 0, 448, 10],
+        [124, 11, 0, 453, 10],
+        [124, 11, 0, 458, 10],
+        [124, 12, 0, 458, 10],
+        [124, 184, 3, 458, 10],
+        [124, 11, 0, 463, 10],
+        [124, 11, 0, 466, 10],
+        [124, 12, 0, 466, 10],
+        [124, 184, 3, 466, 10],
+        [124, 11, 0, 470, 10],
+        [124, 11, 0, 473, 10],
+        [124, 11, 0, 473, 10],
+        [124, 12, 0, 473, 10],
+        [124, 184, 3, 473, 10],
+        [124, 11, 0, 484, 10],
+        [124, 11, 0, 488, 10],
+        [124, 11, 0, 493, 10],
+        [124, 11, 0, 498, 10],
+        [124, 11, 0, 503, 10],
+        [124, 12, 0, 503, 10],
+        [124, 184, 3, 503, 10],
+        [124, 11, 0, 506, 10],
+        [124, 11, 0, 509, 10],
+        [124, 11, 0, 512, 10],
+        [124, 11, 0, 515, 10],
+        [124, 11, 0, 520, 10],
+        [124, 11, 0, 523, 10],
+        [124, 11, 0, 528, 10],
+        [124, 11, 0, 531, 10],
+        [124, 11, 0, 528, 10],
+        [124, 12, 0, 528, 10],
+        [124, 184, 3, 528, 10],
+        [124, 11, 0, 541, 10],
+        [124, 12, 0, 541, 10],
+        [124, 184, 3, 541, 10],
+        [124, 11, 0, 550, 10],
+        [124, 11, 0, 554, 10],
+        [124, 12, 0, 554, 10],
+        [124, 184, 3, 554, 10],
+        [124, 11, 0, 559, 10],
+        [124, 11, 0, 562, 10],
+        [124, 11, 0, 565, 10],
+        [124, 11, 0, 568, 10],
+        [124, 11, 0, 573, 10],
+        [124, 11, 0, 576, 10],
+        [124, 11, 0, 582, 10],
+        [0, 11, 0, 127, 10],
+        [124, 11, 0, 127, 10],
+        [124, 12, 0, 127, 10],
+        [124, 184, 3, 127, 10],
+        [0, 11, 0, 173, 10],
+        [0, 11, 0, 247, 10],
+        [124, 11, 0, 247, 10],
+        [124, 12, 0, 247, 10],
+        [124, 184, 3, 247, 10],
+        [0, 11, 0, 253, 10],
+        [124, 11, 0, 253, 10],
+        [124, 12, 0, 253, 10],
+        [124, 184, 3, 253, 10],
+        [0, 11, 0, 261, 10],
+        [124, 11, 0, 261, 10],
+        [124, 12, 0, 261, 10],
+        [124, 184, 3, 261, 10],
+        [0, 11, 0, 272, 10],
+        [0, 11, 0, 339, 10],
+        [0, 11, 0, 347, 10],
+        [124, 11, 0, 347, 10],
+        [124, 12, 0, 347, 10],
+        [124, 184, 3, 347, 10],
+        [0, 11, 0, 357, 10],
+        [0, 11, 0, 378, 10],
+        [0, 627, 2, 628, 629],
+        [0, 11, 0, 631, 10],
+        [0, 11, 0, 434, 10],
+        [0, 11, 0, 442, 10],
+        [0, 11, 0, 473, 10],
+        [0, 11, 0, 88, 10],
+        [0, 11, 0, 654, 10],
+        [124, 11, 0, 498, 10],
+        [124, 12, 0, 498, 10],
+        [124, 184, 3, 498, 10],
+        [0, 8, 0, 506, 10],
+        [0, 11, 0, 506, 10],
+        [0, 12, 0, 506, 10],
+        [124, 11, 0, 506, 10],
+        [124, 12, 0, 506, 10],
+        [124, 184, 3, 506, 10],
+        [0, 11, 0, 512, 10],
+        [124, 11, 0, 512, 10],
+        [124, 12, 0, 512, 10],
+        [124, 184, 3, 512, 10],
+        [0, 11, 0, 523, 10],
+        [124, 11, 0, 523, 10],
+        [124, 12, 0, 523, 10],
+        [124, 184, 3, 523, 10],
+        [0, 11, 0, 663, 10],
+        [0, 11, 0, 531, 10],
+        [0, 8, 0, 528, 10],
+        [0, 11, 0, 528, 10],
+        [0, 12, 0, 528, 10],
+        [0, 627, 2, 674, 675],
+        [0, 11, 0, 565, 10],
+        [124, 11, 0, 565, 10],
+        [124, 12, 0, 565, 10],
+        [124, 184, 3, 565, 10],
+        [0, 11, 0, 176, 10],
+        [124, 11, 0, 176, 10],
+        [124, 12, 0, 176, 10],
+        [124, 184, 3, 176, 10],
+        [0, 8, 0, 183, 10],
+        [0, 11, 0, 183, 10],
+        [0, 12, 0, 183, 10],
+        [0, 11, 0, 191, 10],
+        [124, 11, 0, 191, 10],
+        [124, 12, 0, 191, 10],
+        [124, 184, 3, 191, 10],
+        [0, 11, 0, 198, 10],
+        [124, 11, 0, 198, 10],
+        [124, 12, 0, 198, 10],
+        [124, 184, 3, 198, 10],
+        [0, 11, 0, 205, 10],
+        [124, 11, 0, 205, 10],
+        [124, 12, 0, 205, 10],
+        [124, 184, 3, 205, 10],
+        [0, 8, 0, 212, 10],
+        [0, 11, 0, 212, 10],
+        [0, 12, 0, 212, 10],
+        [0, 11, 0, 234, 10],
+        [124, 11, 0, 234, 10],
+        [124, 12, 0, 234, 10],
+        [124, 184, 3, 234, 10],
+        [124, 11, 0, 258, 10],
+        [124, 12, 0, 258, 10],
+        [124, 184, 3, 258, 10],
+        [0, 11, 0, 167, 10],
+        [124, 11, 0, 167, 10],
+        [124, 12, 0, 167, 10],
+        [124, 184, 3, 167, 10],
+        [0, 11, 0, 701, 10],
+        [0, 11, 0, 288, 10],
+        [0, 11, 0, 291, 10],
+        [124, 11, 0, 291, 10],
+        [124, 12, 0, 291, 10],
+        [124, 184, 3, 291, 10],
+        [0, 8, 0, 463, 10],
+        [0, 11, 0, 463, 10],
+        [0, 12, 0, 463, 10],
+        [124, 11, 0, 463, 10],
+        [124, 12, 0, 463, 10],
+        [124, 184, 3, 463, 10],
+        [0, 8, 0, 458, 10],
+        [0, 11, 0, 458, 10],
+        [0, 12, 0, 458, 10],
+        [0, 8, 0, 512, 10],
+        [0, 11, 0, 512, 10],
+        [0, 12, 0, 512, 10],
+    ],
+    operations: &[
+        [0, 3, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 4, 5],
+        [6, 3, 7, 0, 0, 0, 0, 0, 0, 1, 0, 3, 0, 0, 14, 0, 14, 5],
+        [15, 3, 16, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 14, 5],
+        [17, 3, 18, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 19, 5],
+        [20, 3, 21, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 22, 5],
+        [23, 3, 24, 0, 0, 0, 0, 0, 0, 1, 3, 1, 0, 0, 27, 0, 27, 5],
+        [28, 3, 29, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 27, 5],
+        [30, 3, 31, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 32, 5],
+        [33, 3, 34, 0, 0, 0, 0, 0, 0, 1, 4, 1, 0, 0, 37, 0, 37, 5],
+        [38, 3, 39, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 37, 5],
+        [40, 3, 41, 0, 0, 0, 0, 0, 0, 1, 5, 1, 0, 0, 44, 0, 44, 5],
+        [45, 3, 46, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 44, 5],
+        [47, 3, 48, 0, 0, 0, 0, 0, 0, 1, 6, 1, 0, 0, 51, 0, 51, 5],
+        [52, 3, 53, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 51, 5],
+        [54, 3, 55, 0, 0, 0, 0, 0, 0, 1, 7, 3, 0, 0, 58, 0, 58, 5],
+        [59, 3, 60, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 58, 5],
+        [61, 3, 62, 0, 0, 0, 0, 0, 0, 1, 10, 1, 0, 0, 65, 0, 65, 5],
+        [66, 3, 67, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 65, 5],
+        [68, 3, 69, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 70, 5],
+        [71, 3, 72, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 73, 5],
+        [74, 3, 75, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 76, 5],
+        [77, 3, 78, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 79, 5],
+        [80, 3, 81, 0, 0, 1, 4, 1, 4, 1, 11, 3, 0, 0, 90, 0, 90, 5],
+        [91, 3, 92, 0, 1, 1, 4, 5, 5, 0, 0, 0, 0, 0, 0, 0, 90, 5],
+        [93, 3, 94, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 95, 5],
+        [96, 3, 97, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 98, 5],
+        [99, 3, 100, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 101, 5],
+        [102, 3, 103, 0, 1, 5, 2, 10, 3, 0, 0, 0, 0, 0, 0, 0, 106, 5],
+        [
+            107, 3, 108, 0, 0, 0, 0, 0, 0, 1, 14, 3, 0, 0, 111, 0, 111, 5,
+        ],
+        [112, 3, 113, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 114, 5],
+        [115, 3, 116, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 117, 5],
+        [118, 0, 119, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 120, 5],
+        [121, 0, 122, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17, 1, 0, 126, 4, 5],
+        [126, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 18, 1, 0, 126, 4, 5],
+        [128, 0, 129, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 5],
+        [
+            130, 0, 131, 0, 0, 7, 6, 13, 6, 0, 0, 0, 19, 1, 0, 146, 14, 5,
+        ],
+        [146, 0, 147, 13, 1, 0, 0, 19, 1, 0, 0, 0, 0, 0, 0, 0, 150, 5],
+        [
+            151, 0, 152, 0, 0, 14, 7, 20, 7, 0, 0, 0, 20, 1, 0, 164, 164, 5,
+        ],
+        [
+            165, 0, 166, 0, 1, 0, 0, 0, 1, 0, 0, 0, 21, 1, 0, 164, 164, 5,
+        ],
+        [168, 0, 169, 0, 0, 0, 0, 0, 0, 0, 0, 0, 22, 1, 0, 172, 19, 5],
+        [172, 0, 18, 0, 1, 0, 0, 0, 1, 0, 0, 0, 23, 1, 0, 172, 19, 5],
+        [
+            174, 0, 175, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 1, 0, 178, 178, 5,
+        ],
+        [
+            179, 0, 180, 0, 1, 0, 0, 0, 1, 0, 0, 0, 24, 1, 0, 178, 178, 5,
+        ],
+        [
+            181, 0, 182, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25, 3, 0, 186, 186, 5,
+        ],
+        [
+            187, 0, 188, 0, 1, 0, 0, 0, 1, 0, 0, 0, 28, 1, 0, 186, 186, 5,
+        ],
+        [
+            189, 0, 190, 0, 0, 0, 0, 0, 0, 0, 0, 0, 29, 1, 0, 193, 193, 5,
+        ],
+        [
+            194, 0, 195, 0, 1, 0, 0, 0, 1, 0, 0, 0, 29, 1, 0, 193, 193, 5,
+        ],
+        [
+            196, 0, 197, 0, 0, 0, 0, 0, 0, 0, 0, 0, 30, 1, 0, 200, 200, 5,
+        ],
+        [
+            201, 0, 202, 0, 1, 0, 0, 0, 1, 0, 0, 0, 30, 1, 0, 200, 200, 5,
+        ],
+        [
+            203, 0, 204, 0, 0, 0, 0, 0, 0, 0, 0, 0, 31, 1, 0, 207, 207, 5,
+        ],
+        [
+            208, 0, 209, 0, 1, 0, 0, 0, 1, 0, 0, 0, 31, 1, 0, 207, 207, 5,
+        ],
+        [
+            210, 0, 211, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 3, 0, 214, 214, 5,
+        ],
+        [
+            215, 0, 216, 0, 1, 0, 0, 0, 1, 0, 0, 0, 35, 1, 0, 214, 214, 5,
+        ],
+        [
+            217, 0, 218, 0, 0, 21, 13, 27, 13, 0, 0, 0, 0, 0, 0, 0, 214, 5,
+        ],
+        [
+            232, 0, 233, 0, 0, 0, 0, 0, 0, 0, 0, 0, 36, 1, 0, 236, 236, 5,
+        ],
+        [
+            237, 0, 238, 0, 1, 0, 0, 0, 1, 0, 0, 0, 36, 1, 0, 236, 236, 5,
+        ],
+        [239, 0, 240, 13, 1, 0, 0, 40, 1, 0, 0, 0, 0, 0, 0, 0, 150, 5],
+        [242, 0, 243, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 1, 0, 246, 22, 5],
+        [246, 0, 21, 0, 1, 0, 0, 0, 1, 0, 0, 0, 38, 1, 0, 246, 22, 5],
+        [248, 0, 249, 0, 0, 0, 0, 0, 0, 0, 0, 0, 39, 1, 0, 252, 27, 5],
+        [252, 0, 29, 0, 1, 0, 0, 0, 1, 0, 0, 0, 40, 1, 0, 252, 27, 5],
+        [254, 0, 255, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 27, 5],
+        [256, 0, 257, 0, 0, 0, 0, 0, 0, 0, 0, 0, 41, 1, 0, 260, 32, 5],
+        [260, 0, 31, 0, 1, 0, 0, 0, 1, 0, 0, 0, 42, 1, 0, 260, 32, 5],
+        [
+            262, 0, 263, 0, 0, 0, 0, 0, 0, 0, 0, 0, 43, 1, 0, 266, 266, 5,
+        ],
+        [267, 0, 268, 0, 0, 0, 0, 0, 0, 0, 0, 0, 44, 1, 0, 271, 37, 5],
+        [271, 0, 39, 0, 1, 0, 0, 0, 1, 0, 0, 0, 45, 1, 0, 271, 37, 5],
+        [273, 0, 274, 0, 0, 0, 0, 0, 0, 0, 0, 0, 44, 1, 0, 271, 37, 5],
+        [
+            275, 0, 276, 0, 0, 34, 7, 41, 7, 0, 0, 0, 20, 1, 0, 164, 282, 5,
+        ],
+        [
+            283, 0, 284, 0, 1, 0, 0, 0, 1, 0, 0, 0, 21, 1, 0, 164, 282, 5,
+        ],
+        [
+            285, 0, 286, 0, 0, 41, 2, 48, 2, 0, 0, 0, 46, 1, 0, 290, 44, 5,
+        ],
+        [290, 0, 46, 0, 1, 0, 0, 0, 1, 0, 0, 0, 47, 1, 0, 290, 44, 5],
+        [292, 0, 293, 0, 0, 43, 6, 50, 6, 0, 0, 0, 0, 0, 0, 0, 300, 5],
+        [301, 0, 302, 0, 0, 49, 3, 56, 3, 0, 0, 0, 0, 0, 0, 0, 305, 5],
+        [306, 0, 307, 0, 0, 13, 1, 59, 1, 0, 0, 0, 0, 0, 0, 0, 305, 5],
+        [308, 0, 309, 0, 0, 13, 1, 59, 1, 0, 0, 0, 0, 0, 0, 0, 305, 5],
+        [
+            310, 0, 311, 0, 0, 0, 0, 0, 0, 0, 0, 0, 48, 1, 0, 314, 314, 5,
+        ],
+        [
+            315, 0, 316, 0, 0, 52, 12, 60, 12, 0, 0, 0, 49, 1, 0, 325, 325, 5,
+        ],
+        [
+            326, 0, 327, 0, 0, 64, 5, 72, 5, 0, 0, 0, 50, 1, 0, 331, 325, 5,
+        ],
+        [
+            331, 0, 332, 0, 0, 69, 4, 77, 4, 0, 0, 0, 50, 1, 0, 331, 325, 5,
+        ],
+        [334, 0, 335, 0, 0, 0, 0, 0, 0, 0, 0, 0, 51, 1, 0, 338, 51, 5],
+        [338, 0, 53, 0, 1, 0, 0, 0, 1, 0, 0, 0, 52, 1, 0, 338, 51, 5],
+        [340, 0, 341, 0, 0, 0, 0, 0, 0, 0, 0, 0, 51, 1, 0, 338, 51, 5],
+        [342, 0, 343, 0, 0, 0, 0, 0, 0, 0, 0, 0, 53, 1, 0, 346, 58, 5],
+        [346, 0, 60, 0, 1, 0, 0, 0, 1, 0, 0, 0, 54, 1, 0, 346, 58, 5],
+        [
+            348, 0, 349, 0, 0, 73, 4, 81, 4, 0, 0, 0, 55, 1, 0, 352, 58, 5,
+        ],
+        [352, 0, 353, 0, 0, 0, 0, 0, 0, 0, 0, 0, 56, 1, 0, 356, 65, 5],
+        [356, 0, 67, 0, 1, 0, 0, 0, 1, 0, 0, 0, 57, 1, 0, 356, 65, 5],
+        [358, 0, 359, 0, 0, 0, 0, 0, 0, 0, 0, 0, 56, 1, 0, 356, 65, 5],
+        [
+            360, 0, 361, 0, 0, 0, 0, 0, 0, 0, 0, 0, 58, 3, 0, 364, 364, 5,
+        ],
+        [
+            365, 0, 366, 0, 0, 0, 0, 0, 0, 0, 0, 0, 61, 3, 0, 369, 369, 5,
+        ],
+        [
+            370, 0, 371, 0, 1, 0, 0, 0, 1, 0, 0, 0, 64, 1, 0, 369, 369, 5,
+        ],
+        [373, 0, 374, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 1, 0, 377, 70, 5],
+        [377, 0, 69, 0, 1, 0, 0, 0, 1, 0, 0, 0, 66, 1, 0, 377, 70, 5],
+        [
+            379, 0, 380, 0, 0, 0, 0, 0, 0, 0, 0, 0, 66, 1, 0, 377, 381, 5,
+        ],
+        [
+            382, 0, 383, 0, 0, 0, 0, 0, 0, 0, 0, 0, 67, 1, 0, 386, 386, 5,
+        ],
+        [
+            387, 0, 388, 0, 1, 0, 0, 0, 1, 0, 0, 0, 67, 1, 0, 386, 386, 5,
+        ],
+        [
+            389, 0, 390, 0, 0, 0, 0, 0, 0, 0, 0, 0, 68, 1, 0, 393, 386, 5,
+        ],
+        [
+            393, 0, 394, 0, 0, 77, 5, 85, 5, 0, 0, 0, 69, 1, 0, 398, 398, 5,
+        ],
+        [
+            399, 0, 400, 0, 0, 0, 0, 0, 0, 0, 0, 0, 70, 1, 0, 403, 403, 5,
+        ],
+        [404, 0, 405, 82, 1, 0, 0, 90, 1, 0, 0, 0, 0, 0, 0, 0, 403, 5],
+        [
+            408, 0, 409, 0, 0, 0, 0, 0, 0, 0, 0, 0, 70, 1, 0, 403, 410, 5,
+        ],
+        [411, 0, 412, 82, 1, 0, 0, 90, 1, 0, 0, 0, 0, 0, 0, 0, 410, 5],
+        [413, 0, 414, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 150, 5],
+        [415, 0, 416, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 417, 5],
+        [
+            418, 0, 419, 0, 0, 83, 5, 91, 5, 0, 0, 0, 71, 1, 0, 424, 424, 5,
+        ],
+        [425, 0, 426, 88, 2, 0, 0, 96, 2, 0, 0, 0, 0, 0, 0, 0, 428, 5],
+        [429, 0, 430, 0, 0, 0, 0, 0, 0, 0, 0, 0, 72, 1, 0, 433, 73, 5],
+        [433, 0, 72, 0, 1, 0, 0, 0, 1, 0, 0, 0, 73, 1, 0, 433, 73, 5],
+        [435, 0, 436, 0, 0, 0, 0, 0, 0, 0, 0, 0, 72, 1, 0, 433, 73, 5],
+        [437, 0, 438, 0, 0, 0, 0, 0, 0, 0, 0, 0, 74, 1, 0, 441, 76, 5],
+        [441, 0, 75, 0, 1, 0, 0, 0, 1, 0, 0, 0, 75, 1, 0, 441, 76, 5],
+        [443, 0, 444, 0, 0, 0, 0, 0, 0, 0, 0, 0, 74, 1, 0, 441, 76, 5],
+        [
+            445, 0, 446, 0, 0, 90, 2, 98, 2, 0, 0, 0, 76, 1, 0, 450, 450, 5,
+        ],
+        [
+            451, 0, 452, 0, 0, 0, 0, 0, 0, 0, 0, 0, 77, 1, 0, 455, 455, 5,
+        ],
+        [
+            456, 0, 457, 0, 0, 0, 0, 0, 0, 0, 0, 0, 78, 3, 0, 460, 460, 5,
+        ],
+        [
+            461, 0, 462, 0, 1, 0, 0, 0, 1, 0, 0, 0, 81, 1, 0, 460, 460, 5,
+        ],
+        [
+            464, 0, 465, 0, 0, 0, 0, 0, 0, 0, 0, 0, 82, 3, 0, 468, 460, 5,
+        ],
+        [468, 0, 469, 0, 0, 0, 0, 0, 0, 0, 0, 0, 85, 1, 0, 472, 79, 5],
+        [472, 0, 78, 0, 1, 0, 0, 0, 1, 0, 0, 0, 86, 1, 0, 472, 79, 5],
+        [
+            474, 0, 475, 0, 0, 0, 0, 0, 0, 0, 0, 0, 87, 3, 0, 472, 476, 5,
+        ],
+        [
+            477, 0, 478, 0, 0, 92, 12, 100, 12, 0, 0, 0, 90, 1, 0, 486, 90, 5,
+        ],
+        [
+            486, 0, 487, 0, 0, 104, 4, 112, 4, 0, 0, 0, 91, 1, 0, 490, 490, 5,
+        ],
+        [
+            491, 0, 492, 0, 0, 0, 0, 0, 0, 0, 0, 0, 92, 1, 0, 495, 495, 5,
+        ],
+        [
+            496, 0, 497, 0, 0, 108, 3, 116, 3, 0, 0, 0, 93, 1, 0, 500, 500, 5,
+        ],
+        [501, 0, 502, 0, 0, 0, 0, 0, 0, 0, 0, 0, 94, 3, 0, 505, 95, 5],
+        [505, 0, 94, 0, 1, 0, 0, 0, 1, 0, 0, 0, 97, 1, 0, 505, 95, 5],
+        [507, 0, 508, 0, 0, 0, 0, 0, 0, 0, 0, 0, 98, 1, 0, 511, 98, 5],
+        [511, 0, 97, 0, 1, 0, 0, 0, 1, 0, 0, 0, 99, 1, 0, 511, 98, 5],
+        [
+            513, 0, 514, 0, 0, 111, 2, 119, 2, 0, 0, 0, 100, 1, 0, 517, 517, 5,
+        ],
+        [
+            518, 0, 519, 0, 0, 0, 0, 0, 0, 0, 0, 0, 101, 1, 0, 522, 101, 5,
+        ],
+        [
+            522, 0, 100, 0, 1, 0, 0, 0, 1, 0, 0, 0, 102, 1, 0, 522, 101, 5,
+        ],
+        [
+            524, 0, 525, 0, 0, 113, 2, 121, 2, 0, 0, 0, 103, 1, 0, 530, 106, 5,
+        ],
+        [
+            530, 0, 103, 0, 1, 115, 1, 123, 2, 0, 0, 0, 104, 1, 0, 530, 106, 5,
+        ],
+        [532, 0, 533, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 534, 5],
+        [
+            535, 0, 536, 0, 0, 116, 1, 125, 1, 0, 0, 0, 105, 3, 0, 530, 538, 5,
+        ],
+        [
+            539, 0, 540, 0, 0, 0, 0, 0, 0, 0, 0, 0, 108, 3, 0, 543, 114, 5,
+        ],
+        [543, 0, 544, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 545, 5],
+        [546, 0, 547, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 545, 5],
+        [
+            548, 0, 549, 0, 0, 0, 0, 0, 0, 0, 0, 0, 111, 1, 0, 552, 545, 5,
+        ],
+        [
+            552, 0, 553, 0, 0, 0, 0, 0, 0, 0, 0, 0, 112, 3, 0, 556, 556, 5,
+        ],
+        [
+            557, 0, 558, 0, 1, 0, 0, 0, 1, 0, 0, 0, 115, 1, 0, 556, 556, 5,
+        ],
+        [
+            560, 0, 561, 0, 0, 0, 0, 0, 0, 0, 0, 0, 116, 1, 0, 564, 117, 5,
+        ],
+        [
+            564, 0, 116, 0, 1, 0, 0, 0, 1, 0, 0, 0, 117, 1, 0, 564, 117, 5,
+        ],
+        [
+            566, 0, 567, 0, 0, 0, 0, 0, 0, 0, 0, 0, 118, 1, 0, 570, 570, 5,
+        ],
+        [
+            571, 0, 572, 0, 1, 0, 0, 0, 1, 0, 0, 0, 119, 1, 0, 570, 570, 5,
+        ],
+        [
+            574, 0, 575, 0, 0, 0, 0, 0, 0, 0, 0, 0, 120, 1, 0, 578, 578, 5,
+        ],
+        [
+            579, 0, 580, 0, 0, 117, 8, 126, 8, 0, 0, 0, 121, 1, 0, 584, 584, 5,
+        ],
+        [
+            585, 0, 586, 0, 1, 0, 0, 0, 1, 0, 0, 0, 21, 1, 0, 164, 584, 5,
+        ],
+        [
+            587, 0, 588, 0, 0, 125, 7, 134, 7, 0, 0, 0, 121, 1, 0, 584, 589, 5,
+        ],
+        [
+            590, 0, 591, 0, 1, 0, 0, 0, 1, 0, 0, 0, 21, 1, 0, 164, 589, 5,
+        ],
+        [
+            592, 1, 122, 0, 0, 0, 0, 0, 0, 1, 122, 1, 123, 3, 126, 126, 4, 5,
+        ],
+        [
+            593, 1, 169, 0, 0, 0, 0, 0, 0, 1, 126, 1, 23, 1, 172, 172, 19, 5,
+        ],
+        [
+            594, 1, 243, 0, 0, 0, 0, 0, 0, 1, 127, 1, 128, 3, 246, 246, 22, 5,
+        ],
+        [
+            595, 1, 249, 0, 0, 0, 0, 0, 0, 1, 131, 1, 132, 3, 252, 252, 27, 5,
+        ],
+        [
+            596, 1, 257, 0, 0, 0, 0, 0, 0, 1, 135, 1, 136, 3, 260, 260, 32, 5,
+        ],
+        [
+            597, 1, 268, 0, 0, 132, 1, 141, 1, 1, 139, 1, 45, 1, 271, 271, 37, 5,
+        ],
+        [
+            599, 1, 600, 133, 1, 0, 0, 142, 1, 1, 139, 1, 0, 0, 271, 0, 37, 5,
+        ],
+        [
+            602, 1, 603, 0, 0, 134, 1, 143, 1, 1, 139, 1, 0, 0, 271, 0, 37, 5,
+        ],
+        [605, 1, 606, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 5],
+        [607, 1, 608, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 325, 5],
+        [
+            609, 1, 335, 0, 0, 132, 1, 141, 1, 1, 140, 1, 52, 1, 338, 338, 51, 5,
+        ],
+        [
+            610, 1, 611, 133, 1, 0, 0, 142, 1, 1, 140, 1, 0, 0, 338, 0, 51, 5,
+        ],
+        [
+            612, 1, 613, 0, 0, 134, 1, 143, 1, 1, 140, 1, 0, 0, 338, 0, 51, 5,
+        ],
+        [614, 1, 615, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 51, 5],
+        [
+            616, 1, 343, 0, 0, 0, 0, 0, 0, 1, 141, 1, 142, 3, 346, 346, 58, 5,
+        ],
+        [
+            617, 1, 353, 0, 0, 132, 1, 141, 1, 1, 145, 1, 57, 1, 356, 356, 65, 5,
+        ],
+        [
+            618, 1, 619, 133, 1, 0, 0, 142, 1, 1, 145, 1, 0, 0, 356, 0, 65, 5,
+        ],
+        [
+            620, 1, 621, 0, 0, 134, 1, 143, 1, 1, 145, 1, 0, 0, 356, 0, 65, 5,
+        ],
+        [622, 1, 623, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 5],
+        [
+            624, 1, 374, 0, 0, 0, 0, 0, 0, 1, 146, 1, 66, 1, 377, 377, 70, 5,
+        ],
+        [
+            625, 1, 414, 0, 0, 135, 1, 144, 1, 1, 147, 1, 0, 0, 0, 0, 417, 5,
+        ],
+        [
+            630, 1, 419, 0, 0, 0, 0, 0, 0, 1, 148, 1, 0, 0, 633, 0, 424, 5,
+        ],
+        [
+            633, 1, 430, 0, 0, 132, 1, 141, 1, 1, 149, 1, 73, 1, 433, 433, 73, 5,
+        ],
+        [
+            634, 1, 635, 133, 1, 0, 0, 142, 1, 1, 149, 1, 0, 0, 433, 0, 73, 5,
+        ],
+        [
+            636, 1, 637, 0, 0, 134, 1, 143, 1, 1, 149, 1, 0, 0, 433, 0, 73, 5,
+        ],
+        [638, 1, 639, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 73, 5],
+        [
+            640, 1, 438, 0, 0, 132, 1, 141, 1, 1, 150, 1, 75, 1, 441, 441, 76, 5,
+        ],
+        [
+            641, 1, 642, 133, 1, 0, 0, 142, 1, 1, 150, 1, 0, 0, 441, 0, 76, 5,
+        ],
+        [
+            643, 1, 644, 0, 0, 134, 1, 143, 1, 1, 150, 1, 0, 0, 441, 0, 76, 5,
+        ],
+        [645, 1, 646, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 76, 5],
+        [
+            647, 1, 469, 0, 0, 0, 0, 0, 0, 1, 151, 1, 87, 3, 472, 472, 79, 5,
+        ],
+        [
+            648, 1, 649, 0, 0, 0, 0, 0, 0, 1, 152, 1, 0, 0, 90, 0, 650, 5,
+        ],
+        [651, 1, 652, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 650, 5],
+        [
+            653, 1, 497, 0, 0, 0, 0, 0, 0, 1, 153, 1, 0, 0, 500, 0, 500, 5,
+        ],
+        [
+            655, 1, 656, 0, 0, 0, 0, 0, 0, 1, 153, 1, 154, 3, 500, 500, 657, 5,
+        ],
+        [
+            658, 1, 502, 0, 0, 0, 0, 0, 0, 1, 157, 3, 160, 3, 505, 505, 95, 5,
+        ],
+        [
+            659, 1, 508, 0, 0, 0, 0, 0, 0, 1, 163, 1, 164, 3, 511, 511, 98, 5,
+        ],
+        [
+            660, 1, 519, 0, 0, 0, 0, 0, 0, 1, 167, 1, 168, 3, 522, 522, 101, 5,
+        ],
+        [
+            661, 1, 662, 0, 0, 0, 0, 0, 0, 1, 171, 1, 0, 0, 665, 0, 665, 5,
+        ],
+        [
+            666, 1, 525, 0, 0, 0, 0, 0, 0, 1, 172, 1, 104, 1, 530, 530, 106, 5,
+        ],
+        [
+            667, 1, 668, 0, 0, 0, 0, 0, 0, 1, 173, 3, 0, 0, 530, 0, 669, 5,
+        ],
+        [670, 1, 671, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 114, 5],
+        [672, 1, 673, 0, 0, 0, 0, 0, 0, 2, 176, 1, 0, 0, 0, 0, 114, 5],
+        [676, 1, 677, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 545, 5],
+        [678, 1, 679, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 545, 5],
+        [
+            680, 1, 561, 0, 0, 0, 0, 0, 0, 1, 177, 1, 178, 3, 564, 564, 117, 5,
+        ],
+        [
+            681, 2, 1, 0, 1, 0, 0, 145, 1, 1, 122, 1, 123, 3, 126, 126, 4, 5,
+        ],
+        [
+            682, 2, 180, 0, 1, 0, 0, 145, 1, 1, 181, 1, 182, 3, 178, 178, 178, 5,
+        ],
+        [
+            683, 2, 188, 0, 1, 0, 0, 145, 1, 1, 185, 3, 25, 3, 186, 186, 186, 5,
+        ],
+        [
+            684, 2, 195, 0, 1, 0, 0, 145, 1, 1, 188, 1, 189, 3, 193, 193, 193, 5,
+        ],
+        [
+            685, 2, 202, 0, 1, 0, 0, 145, 1, 1, 192, 1, 193, 3, 200, 200, 200, 5,
+        ],
+        [
+            686, 2, 209, 0, 1, 0, 0, 145, 1, 1, 196, 1, 197, 3, 207, 207, 207, 5,
+        ],
+        [
+            687, 2, 216, 0, 1, 0, 0, 145, 1, 1, 200, 3, 32, 3, 214, 214, 214, 5,
+        ],
+        [
+            688, 2, 238, 0, 1, 0, 0, 145, 1, 1, 203, 1, 204, 3, 236, 236, 236, 5,
+        ],
+        [
+            689, 2, 21, 0, 1, 0, 0, 145, 1, 1, 127, 1, 128, 3, 246, 246, 22, 5,
+        ],
+        [690, 2, 24, 0, 0, 0, 0, 0, 0, 1, 3, 1, 40, 1, 27, 252, 27, 5],
+        [
+            691, 2, 29, 0, 1, 0, 0, 145, 1, 1, 131, 1, 132, 3, 252, 252, 27, 5,
+        ],
+        [
+            692, 2, 31, 0, 1, 0, 0, 145, 1, 1, 135, 1, 136, 3, 260, 260, 32, 5,
+        ],
+        [
+            693, 2, 694, 0, 1, 136, 1, 146, 2, 0, 0, 0, 207, 3, 0, 260, 32, 5,
+        ],
+        [696, 2, 34, 0, 0, 0, 0, 0, 0, 1, 4, 1, 45, 1, 37, 271, 37, 5],
+        [
+            697, 2, 39, 0, 1, 132, 1, 148, 2, 1, 139, 1, 45, 1, 271, 271, 37, 5,
+        ],
+        [
+            698, 2, 284, 0, 1, 0, 0, 0, 1, 1, 210, 1, 211, 3, 164, 164, 282, 5,
+        ],
+        [
+            699, 2, 700, 0, 0, 137, 1, 150, 1, 1, 214, 1, 0, 0, 703, 0, 282, 5,
+        ],
+        [703, 2, 41, 0, 0, 0, 0, 0, 0, 1, 215, 1, 0, 0, 290, 0, 44, 5],
+        [
+            704, 2, 46, 0, 1, 0, 0, 145, 1, 1, 216, 1, 217, 3, 290, 290, 44, 5,
+        ],
+        [705, 2, 706, 0, 0, 0, 0, 0, 0, 1, 5, 1, 0, 0, 44, 0, 44, 5],
+        [707, 2, 48, 0, 0, 0, 0, 0, 0, 1, 6, 1, 52, 1, 51, 338, 51, 5],
+        [
+            708, 2, 53, 0, 1, 132, 1, 148, 2, 1, 140, 1, 52, 1, 338, 338, 51, 5,
+        ],
+        [
+            709, 2, 60, 0, 1, 0, 0, 145, 1, 1, 141, 1, 142, 3, 346, 346, 58, 5,
+        ],
+        [
+            710, 2, 62, 0, 0, 0, 0, 0, 0, 1, 10, 1, 57, 1, 65, 356, 65, 5,
+        ],
+        [
+            711, 2, 67, 0, 1, 132, 1, 148, 2, 1, 145, 1, 57, 1, 356, 356, 65, 5,
+        ],
+        [
+            712, 2, 69, 0, 1, 0, 0, 145, 1, 1, 146, 1, 66, 1, 377, 377, 70, 5,
+        ],
+        [
+            713, 2, 72, 0, 1, 132, 1, 148, 2, 1, 149, 1, 73, 1, 433, 433, 73, 5,
+        ],
+        [
+            714, 2, 75, 0, 1, 132, 1, 148, 2, 1, 150, 1, 75, 1, 441, 441, 76, 5,
+        ],
+        [
+            715, 2, 462, 0, 1, 0, 0, 145, 1, 1, 220, 3, 223, 3, 460, 460, 460, 5,
+        ],
+        [
+            716, 2, 717, 0, 0, 0, 0, 0, 0, 1, 226, 3, 0, 0, 460, 0, 460, 5,
+        ],
+        [
+            718, 2, 78, 0, 1, 0, 0, 145, 1, 1, 151, 1, 87, 3, 472, 472, 79, 5,
+        ],
+        [
+            719, 2, 94, 0, 1, 0, 0, 145, 1, 1, 157, 3, 160, 3, 505, 505, 95, 5,
+        ],
+        [
+            720, 2, 97, 0, 1, 0, 0, 145, 1, 1, 229, 3, 164, 3, 511, 511, 98, 5,
+        ],
+        [
+            721, 2, 103, 0, 1, 138, 1, 151, 2, 1, 172, 1, 104, 1, 530, 530, 106, 5,
+        ],
+        [
+            723, 2, 108, 0, 0, 0, 0, 0, 0, 1, 14, 3, 0, 0, 111, 0, 111, 5,
+        ],
+        [
+            724, 2, 116, 0, 1, 0, 0, 145, 1, 1, 177, 1, 178, 3, 564, 564, 117, 5,
+        ],
+    ],
+    types: &[
+        [725, 726],
+        [727, 728],
+        [729, 730],
+        [731, 732],
+        [733, 734],
+        [125, 735],
+        [736, 737],
+        [542, 738],
+        [739, 740],
+        [13, 741],
+        [742, 743],
+        [145, 744],
+        [745, 746],
+        [19, 747],
+        [748, 749],
+        [171, 750],
+        [751, 752],
+        [753, 754],
+        [755, 756],
+        [245, 757],
+        [26, 758],
+        [251, 759],
+        [760, 761],
+        [762, 763],
+        [259, 764],
+        [265, 765],
+        [36, 766],
+        [177, 767],
+        [270, 768],
+        [769, 770],
+        [43, 771],
+        [289, 772],
+        [773, 774],
+        [163, 775],
+        [583, 776],
+        [777, 778],
+        [702, 779],
+        [780, 781],
+        [782, 783],
+        [784, 785],
+        [313, 786],
+        [330, 787],
+        [324, 788],
+        [185, 789],
+        [790, 791],
+        [50, 792],
+        [192, 793],
+        [57, 794],
+        [345, 795],
+        [351, 796],
+        [337, 797],
+        [798, 799],
+        [800, 801],
+        [64, 802],
+        [199, 803],
+        [363, 804],
+        [355, 805],
+        [369, 806],
+        [807, 808],
+        [376, 809],
+        [368, 810],
+        [811, 812],
+        [392, 813],
+        [385, 814],
+        [402, 815],
+        [816, 817],
+        [397, 818],
+        [632, 819],
+        [423, 820],
+        [428, 821],
+        [822, 823],
+        [824, 825],
+        [206, 826],
+        [432, 827],
+        [828, 829],
+        [830, 831],
+        [213, 832],
+        [833, 834],
+        [440, 835],
+        [449, 836],
+        [837, 838],
+        [454, 839],
+        [840, 841],
+        [842, 843],
+        [844, 845],
+        [846, 847],
+        [848, 849],
+        [850, 851],
+        [852, 853],
+        [467, 854],
+        [459, 855],
+        [856, 857],
+        [858, 859],
+        [471, 860],
+        [861, 862],
+        [89, 863],
+        [489, 864],
+        [485, 865],
+        [495, 866],
+        [494, 867],
+        [868, 869],
+        [870, 871],
+        [872, 873],
+        [504, 874],
+        [499, 875],
+        [876, 877],
+        [510, 878],
+        [516, 879],
+        [880, 881],
+        [882, 883],
+        [521, 884],
+        [885, 886],
+        [664, 887],
+        [888, 889],
+        [890, 891],
+        [892, 893],
+        [894, 895],
+        [110, 896],
+        [529, 897],
+        [898, 899],
+        [900, 901],
+        [902, 903],
+        [904, 905],
+        [906, 907],
+        [551, 908],
+        [569, 909],
+        [563, 910],
+        [555, 911],
+        [912, 913],
+        [914, 915],
+        [916, 917],
+        [235, 918],
+        [919, 920],
+        [921, 922],
+        [923, 924],
+        [577, 925],
+    ],
+};
 
 pub static OMITTED_OPERATIONS: &[OmittedOperationSpec] = &[OmittedOperationSpec {
     name: "get_by_path",
@@ -8071,550 +2052,3 @@ pub static OMITTED_OPERATIONS: &[OmittedOperationSpec] = &[OmittedOperationSpec
     path: "/",
     reason: "path parameter `path` has no matching placeholder",
 }];
-
-pub static TYPES: &[TypeDef] = &[
-    TypeDef {
-        name: "AddSeriesOptions",
-        ts: "export interface AddSeriesOptions {\n  ignoreEpisodesWithFiles?: boolean;\n  ignoreEpisodesWithoutFiles?: boolean;\n  monitor?: MonitorTypes;\n  searchForCutoffUnmetEpisodes?: boolean;\n  searchForMissingEpisodes?: boolean;\n}",
-    },
-    TypeDef {
-        name: "AlternateTitleResource",
-        ts: "export interface AlternateTitleResource {\n  comment?: string | null;\n  sceneOrigin?: string | null;\n  sceneSeasonNumber?: number | null;\n  seasonNumber?: number | null;\n  title?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ApplyTags",
-        ts: "export type ApplyTags = \"add\" | \"remove\" | \"replace\";",
-    },
-    TypeDef {
-        name: "AuthenticationRequiredType",
-        ts: "export type AuthenticationRequiredType = \"enabled\" | \"disabledForLocalAddresses\";",
-    },
-    TypeDef {
-        name: "AuthenticationType",
-        ts: "export type AuthenticationType = \"none\" | \"basic\" | \"forms\" | \"external\";",
-    },
-    TypeDef {
-        name: "AutoTaggingResource",
-        ts: "export interface AutoTaggingResource {\n  id?: number;\n  name?: string | null;\n  removeTagsAutomatically?: boolean;\n  specifications?: AutoTaggingSpecificationSchema[] | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "AutoTaggingSpecificationSchema",
-        ts: "export interface AutoTaggingSpecificationSchema {\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  name?: string | null;\n  negate?: boolean;\n  required?: boolean;\n}",
-    },
-    TypeDef {
-        name: "BackupResource",
-        ts: "export interface BackupResource {\n  id?: number;\n  name?: string | null;\n  path?: string | null;\n  size?: number;\n  time?: string;\n  type?: BackupType;\n}",
-    },
-    TypeDef {
-        name: "BackupType",
-        ts: "export type BackupType = \"scheduled\" | \"manual\" | \"update\";",
-    },
-    TypeDef {
-        name: "BlocklistBulkResource",
-        ts: "export interface BlocklistBulkResource {\n  ids?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "BlocklistResource",
-        ts: "export interface BlocklistResource {\n  customFormats?: CustomFormatResource[] | null;\n  date?: string;\n  episodeIds?: number[] | null;\n  id?: number;\n  indexer?: string | null;\n  languages?: Language[] | null;\n  message?: string | null;\n  protocol?: DownloadProtocol;\n  quality?: QualityModel;\n  series?: SeriesResource;\n  seriesId?: number;\n  sourceTitle?: string | null;\n}",
-    },
-    TypeDef {
-        name: "BlocklistResourcePagingResource",
-        ts: "export interface BlocklistResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: BlocklistResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "CertificateValidationType",
-        ts: "export type CertificateValidationType = \"enabled\" | \"disabledForLocalAddresses\" | \"disabled\";",
-    },
-    TypeDef {
-        name: "Command",
-        ts: "export interface Command {\n  clientUserAgent?: string | null;\n  completionMessage?: string | null;\n  isExclusive?: boolean;\n  isLongRunning?: boolean;\n  lastExecutionTime?: string | null;\n  lastStartTime?: string | null;\n  name?: string | null;\n  requiresDiskAccess?: boolean;\n  sendUpdatesToClient?: boolean;\n  suppressMessages?: boolean;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
-    },
-    TypeDef {
-        name: "CommandPriority",
-        ts: "export type CommandPriority = \"normal\" | \"high\" | \"low\";",
-    },
-    TypeDef {
-        name: "CommandResource",
-        ts: "export interface CommandResource {\n  body?: Command;\n  clientUserAgent?: string | null;\n  commandName?: string | null;\n  duration?: string | null;\n  ended?: string | null;\n  exception?: string | null;\n  id?: number;\n  lastExecutionTime?: string | null;\n  message?: string | null;\n  name?: string | null;\n  priority?: CommandPriority;\n  queued?: string;\n  result?: CommandResult;\n  sendUpdatesToClient?: boolean;\n  started?: string | null;\n  stateChangeTime?: string | null;\n  status?: CommandStatus;\n  trigger?: CommandTrigger;\n  updateScheduledTask?: boolean;\n}",
-    },
-    TypeDef {
-        name: "CommandResult",
-        ts: "export type CommandResult = \"unknown\" | \"successful\" | \"unsuccessful\";",
-    },
-    TypeDef {
-        name: "CommandStatus",
-        ts: "export type CommandStatus = \"queued\" | \"started\" | \"completed\" | \"failed\" | \"aborted\" | \"cancelled\" | \"orphaned\";",
-    },
-    TypeDef {
-        name: "CommandTrigger",
-        ts: "export type CommandTrigger = \"unspecified\" | \"manual\" | \"scheduled\";",
-    },
-    TypeDef {
-        name: "CustomFilterResource",
-        ts: "export interface CustomFilterResource {\n  filters?: Record<string, unknown>[] | null;\n  id?: number;\n  label?: string | null;\n  type?: string | null;\n}",
-    },
-    TypeDef {
-        name: "CustomFormatBulkResource",
-        ts: "export interface CustomFormatBulkResource {\n  ids?: number[] | null;\n  includeCustomFormatWhenRenaming?: boolean | null;\n}",
-    },
-    TypeDef {
-        name: "CustomFormatResource",
-        ts: "export interface CustomFormatResource {\n  id?: number;\n  includeCustomFormatWhenRenaming?: boolean | null;\n  name?: string | null;\n  specifications?: CustomFormatSpecificationSchema[] | null;\n}",
-    },
-    TypeDef {
-        name: "CustomFormatSpecificationSchema",
-        ts: "export interface CustomFormatSpecificationSchema {\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  name?: string | null;\n  negate?: boolean;\n  presets?: CustomFormatSpecificationSchema[] | null;\n  required?: boolean;\n}",
-    },
-    TypeDef {
-        name: "DatabaseType",
-        ts: "export type DatabaseType = \"sqLite\" | \"postgreSQL\";",
-    },
-    TypeDef {
-        name: "DelayProfileResource",
-        ts: "export interface DelayProfileResource {\n  bypassIfAboveCustomFormatScore?: boolean;\n  bypassIfHighestQuality?: boolean;\n  enableTorrent?: boolean;\n  enableUsenet?: boolean;\n  id?: number;\n  minimumCustomFormatScore?: number;\n  order?: number;\n  preferredProtocol?: DownloadProtocol;\n  tags?: number[] | null;\n  torrentDelay?: number;\n  usenetDelay?: number;\n}",
-    },
-    TypeDef {
-        name: "DiskSpaceResource",
-        ts: "export interface DiskSpaceResource {\n  freeSpace?: number;\n  id?: number;\n  label?: string | null;\n  path?: string | null;\n  totalSpace?: number;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientBulkResource",
-        ts: "export interface DownloadClientBulkResource {\n  applyTags?: ApplyTags;\n  enable?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  removeCompletedDownloads?: boolean | null;\n  removeFailedDownloads?: boolean | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientConfigResource",
-        ts: "export interface DownloadClientConfigResource {\n  autoRedownloadFailed?: boolean;\n  autoRedownloadFailedFromInteractiveSearch?: boolean;\n  downloadClientWorkingFolders?: string | null;\n  enableCompletedDownloadHandling?: boolean;\n  id?: number;\n}",
-    },
-    TypeDef {
-        name: "DownloadClientResource",
-        ts: "export interface DownloadClientResource {\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: DownloadClientResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  removeCompletedDownloads?: boolean;\n  removeFailedDownloads?: boolean;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "DownloadProtocol",
-        ts: "export type DownloadProtocol = \"unknown\" | \"usenet\" | \"torrent\";",
-    },
-    TypeDef {
-        name: "EpisodeFileListResource",
-        ts: "export interface EpisodeFileListResource {\n  episodeFileIds?: number[] | null;\n  languages?: Language[] | null;\n  quality?: QualityModel;\n  releaseGroup?: string | null;\n  sceneName?: string | null;\n}",
-    },
-    TypeDef {
-        name: "EpisodeFileResource",
-        ts: "export interface EpisodeFileResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  dateAdded?: string;\n  id?: number;\n  indexerFlags?: number | null;\n  languages?: Language[] | null;\n  mediaInfo?: MediaInfoResource;\n  path?: string | null;\n  quality?: QualityModel;\n  qualityCutoffNotMet?: boolean;\n  relativePath?: string | null;\n  releaseGroup?: string | null;\n  releaseType?: ReleaseType;\n  sceneName?: string | null;\n  seasonNumber?: number;\n  seriesId?: number;\n  size?: number;\n}",
-    },
-    TypeDef {
-        name: "EpisodeHistoryEventType",
-        ts: "export type EpisodeHistoryEventType = \"unknown\" | \"grabbed\" | \"seriesFolderImported\" | \"downloadFolderImported\" | \"downloadFailed\" | \"episodeFileDeleted\" | \"episodeFileRenamed\" | \"downloadIgnored\";",
-    },
-    TypeDef {
-        name: "EpisodeResource",
-        ts: "export interface EpisodeResource {\n  absoluteEpisodeNumber?: number | null;\n  airDate?: string | null;\n  airDateUtc?: string | null;\n  endTime?: string | null;\n  episodeFile?: EpisodeFileResource;\n  episodeFileId?: number;\n  episodeNumber?: number;\n  finaleType?: string | null;\n  grabDate?: string | null;\n  hasFile?: boolean;\n  id?: number;\n  images?: MediaCover[] | null;\n  lastSearchTime?: string | null;\n  monitored?: boolean;\n  overview?: string | null;\n  runtime?: number;\n  sceneAbsoluteEpisodeNumber?: number | null;\n  sceneEpisodeNumber?: number | null;\n  sceneSeasonNumber?: number | null;\n  seasonNumber?: number;\n  series?: SeriesResource;\n  seriesId?: number;\n  title?: string | null;\n  tvdbId?: number;\n  unverifiedSceneNumbering?: boolean;\n}",
-    },
-    TypeDef {
-        name: "EpisodeResourcePagingResource",
-        ts: "export interface EpisodeResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: EpisodeResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "EpisodeTitleRequiredType",
-        ts: "export type EpisodeTitleRequiredType = \"always\" | \"bulkSeasonReleases\" | \"never\";",
-    },
-    TypeDef {
-        name: "EpisodesMonitoredResource",
-        ts: "export interface EpisodesMonitoredResource {\n  episodeIds?: number[] | null;\n  monitored?: boolean;\n}",
-    },
-    TypeDef {
-        name: "Field",
-        ts: "export interface Field {\n  advanced?: boolean;\n  helpLink?: string | null;\n  helpText?: string | null;\n  helpTextWarning?: string | null;\n  hidden?: string | null;\n  isFloat?: boolean;\n  label?: string | null;\n  name?: string | null;\n  order?: number;\n  placeholder?: string | null;\n  privacy?: PrivacyLevel;\n  section?: string | null;\n  selectOptions?: SelectOption[] | null;\n  selectOptionsProviderAction?: string | null;\n  type?: string | null;\n  unit?: string | null;\n  value?: unknown | null;\n}",
-    },
-    TypeDef {
-        name: "FileDateType",
-        ts: "export type FileDateType = \"none\" | \"localAirDate\" | \"utcAirDate\";",
-    },
-    TypeDef {
-        name: "HealthCheckResult",
-        ts: "export type HealthCheckResult = \"ok\" | \"notice\" | \"warning\" | \"error\";",
-    },
-    TypeDef {
-        name: "HealthResource",
-        ts: "export interface HealthResource {\n  id?: number;\n  message?: string | null;\n  source?: string | null;\n  type?: HealthCheckResult;\n  wikiUrl?: HttpUri;\n}",
-    },
-    TypeDef {
-        name: "HistoryResource",
-        ts: "export interface HistoryResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  data?: Record<string, string | null> | null;\n  date?: string;\n  downloadId?: string | null;\n  episode?: EpisodeResource;\n  episodeId?: number;\n  eventType?: EpisodeHistoryEventType;\n  id?: number;\n  languages?: Language[] | null;\n  quality?: QualityModel;\n  qualityCutoffNotMet?: boolean;\n  series?: SeriesResource;\n  seriesId?: number;\n  sourceTitle?: string | null;\n}",
-    },
-    TypeDef {
-        name: "HistoryResourcePagingResource",
-        ts: "export interface HistoryResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: HistoryResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "HostConfigResource",
-        ts: "export interface HostConfigResource {\n  analyticsEnabled?: boolean;\n  apiKey?: string | null;\n  applicationUrl?: string | null;\n  authenticationMethod?: AuthenticationType;\n  authenticationRequired?: AuthenticationRequiredType;\n  backupFolder?: string | null;\n  backupInterval?: number;\n  backupRetention?: number;\n  bindAddress?: string | null;\n  branch?: string | null;\n  certificateValidation?: CertificateValidationType;\n  consoleLogLevel?: string | null;\n  enableSsl?: boolean;\n  id?: number;\n  instanceName?: string | null;\n  launchBrowser?: boolean;\n  logLevel?: string | null;\n  logSizeLimit?: number;\n  password?: string | null;\n  passwordConfirmation?: string | null;\n  port?: number;\n  proxyBypassFilter?: string | null;\n  proxyBypassLocalAddresses?: boolean;\n  proxyEnabled?: boolean;\n  proxyHostname?: string | null;\n  proxyPassword?: string | null;\n  proxyPort?: number;\n  proxyType?: ProxyType;\n  proxyUsername?: string | null;\n  sslCertPassword?: string | null;\n  sslCertPath?: string | null;\n  sslPort?: number;\n  trustCgnatIpAddresses?: boolean;\n  updateAutomatically?: boolean;\n  updateMechanism?: UpdateMechanism;\n  updateScriptPath?: string | null;\n  urlBase?: string | null;\n  username?: string | null;\n}",
-    },
-    TypeDef {
-        name: "HttpUri",
-        ts: "export interface HttpUri {\n  fragment?: string | null;\n  fullUri?: string | null;\n  host?: string | null;\n  path?: string | null;\n  port?: number | null;\n  query?: string | null;\n  scheme?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ImportListBulkResource",
-        ts: "export interface ImportListBulkResource {\n  applyTags?: ApplyTags;\n  enableAutomaticAdd?: boolean | null;\n  ids?: number[] | null;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "ImportListConfigResource",
-        ts: "export interface ImportListConfigResource {\n  id?: number;\n  listSyncLevel?: ListSyncLevelType;\n  listSyncTag?: number;\n}",
-    },
-    TypeDef {
-        name: "ImportListExclusionBulkResource",
-        ts: "export interface ImportListExclusionBulkResource {\n  ids?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "ImportListExclusionResource",
-        ts: "export interface ImportListExclusionResource {\n  id?: number;\n  title?: string | null;\n  tvdbId?: number;\n}",
-    },
-    TypeDef {
-        name: "ImportListExclusionResourcePagingResource",
-        ts: "export interface ImportListExclusionResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: ImportListExclusionResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "ImportListResource",
-        ts: "export interface ImportListResource {\n  configContract?: string | null;\n  enableAutomaticAdd?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  listOrder?: number;\n  listType?: ImportListType;\n  message?: ProviderMessage;\n  minRefreshInterval?: string;\n  monitorNewItems?: NewItemMonitorTypes;\n  name?: string | null;\n  presets?: ImportListResource[] | null;\n  qualityProfileId?: number;\n  rootFolderPath?: string | null;\n  searchForMissingEpisodes?: boolean;\n  seasonFolder?: boolean;\n  seriesType?: SeriesTypes;\n  shouldMonitor?: MonitorTypes;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "ImportListType",
-        ts: "export type ImportListType = \"program\" | \"plex\" | \"trakt\" | \"simkl\" | \"other\" | \"advanced\";",
-    },
-    TypeDef {
-        name: "ImportRejectionResource",
-        ts: "export interface ImportRejectionResource {\n  reason?: string | null;\n  type?: RejectionType;\n}",
-    },
-    TypeDef {
-        name: "IndexerBulkResource",
-        ts: "export interface IndexerBulkResource {\n  applyTags?: ApplyTags;\n  enableAutomaticSearch?: boolean | null;\n  enableInteractiveSearch?: boolean | null;\n  enableRss?: boolean | null;\n  ids?: number[] | null;\n  priority?: number | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerConfigResource",
-        ts: "export interface IndexerConfigResource {\n  id?: number;\n  maximumSize?: number;\n  minimumAge?: number;\n  retention?: number;\n  rssSyncInterval?: number;\n}",
-    },
-    TypeDef {
-        name: "IndexerFlagResource",
-        ts: "export interface IndexerFlagResource {\n  id?: number;\n  name?: string | null;\n  nameLower?: string | null;\n}",
-    },
-    TypeDef {
-        name: "IndexerResource",
-        ts: "export interface IndexerResource {\n  configContract?: string | null;\n  downloadClientId?: number;\n  enableAutomaticSearch?: boolean;\n  enableInteractiveSearch?: boolean;\n  enableRss?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: IndexerResource[] | null;\n  priority?: number;\n  protocol?: DownloadProtocol;\n  seasonSearchMaximumSingleEpisodeAge?: number;\n  supportsRss?: boolean;\n  supportsSearch?: boolean;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "Language",
-        ts: "export interface Language {\n  id?: number;\n  name?: string | null;\n}",
-    },
-    TypeDef {
-        name: "LanguageProfileItemResource",
-        ts: "export interface LanguageProfileItemResource {\n  allowed?: boolean;\n  id?: number;\n  language?: Language;\n}",
-    },
-    TypeDef {
-        name: "LanguageProfileResource",
-        ts: "export interface LanguageProfileResource {\n  cutoff?: Language;\n  id?: number;\n  languages?: LanguageProfileItemResource[] | null;\n  name?: string | null;\n  upgradeAllowed?: boolean;\n}",
-    },
-    TypeDef {
-        name: "LanguageResource",
-        ts: "export interface LanguageResource {\n  id?: number;\n  name?: string | null;\n  nameLower?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ListSyncLevelType",
-        ts: "export type ListSyncLevelType = \"disabled\" | \"logOnly\" | \"keepAndUnmonitor\" | \"keepAndTag\";",
-    },
-    TypeDef {
-        name: "LocalizationLanguageResource",
-        ts: "export interface LocalizationLanguageResource {\n  identifier?: string | null;\n}",
-    },
-    TypeDef {
-        name: "LocalizationResource",
-        ts: "export interface LocalizationResource {\n  id?: number;\n  strings?: Record<string, string | null> | null;\n}",
-    },
-    TypeDef {
-        name: "LogFileResource",
-        ts: "export interface LogFileResource {\n  contentsUrl?: string | null;\n  downloadUrl?: string | null;\n  filename?: string | null;\n  id?: number;\n  lastWriteTime?: string;\n}",
-    },
-    TypeDef {
-        name: "LogResource",
-        ts: "export interface LogResource {\n  exception?: string | null;\n  exceptionType?: string | null;\n  id?: number;\n  level?: string | null;\n  logger?: string | null;\n  message?: string | null;\n  method?: string | null;\n  time?: string;\n}",
-    },
-    TypeDef {
-        name: "LogResourcePagingResource",
-        ts: "export interface LogResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: LogResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "ManualImportReprocessResource",
-        ts: "export interface ManualImportReprocessResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadId?: string | null;\n  episodeIds?: number[] | null;\n  episodes?: EpisodeResource[] | null;\n  id?: number;\n  indexerFlags?: number;\n  languages?: Language[] | null;\n  path?: string | null;\n  quality?: QualityModel;\n  rejections?: ImportRejectionResource[] | null;\n  releaseGroup?: string | null;\n  releaseType?: ReleaseType;\n  seasonNumber?: number | null;\n  seriesId?: number;\n}",
-    },
-    TypeDef {
-        name: "ManualImportResource",
-        ts: "export interface ManualImportResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadId?: string | null;\n  episodeFileId?: number | null;\n  episodes?: EpisodeResource[] | null;\n  folderName?: string | null;\n  id?: number;\n  indexerFlags?: number;\n  languages?: Language[] | null;\n  name?: string | null;\n  path?: string | null;\n  quality?: QualityModel;\n  qualityWeight?: number;\n  rejections?: ImportRejectionResource[] | null;\n  relativePath?: string | null;\n  releaseGroup?: string | null;\n  releaseType?: ReleaseType;\n  seasonNumber?: number | null;\n  series?: SeriesResource;\n  size?: number;\n}",
-    },
-    TypeDef {
-        name: "MediaCover",
-        ts: "export interface MediaCover {\n  coverType?: MediaCoverTypes;\n  remoteUrl?: string | null;\n  url?: string | null;\n}",
-    },
-    TypeDef {
-        name: "MediaCoverTypes",
-        ts: "export type MediaCoverTypes = \"unknown\" | \"poster\" | \"banner\" | \"fanart\" | \"screenshot\" | \"headshot\" | \"clearlogo\";",
-    },
-    TypeDef {
-        name: "MediaInfoResource",
-        ts: "export interface MediaInfoResource {\n  audioBitrate?: number;\n  audioChannels?: number;\n  audioCodec?: string | null;\n  audioLanguages?: string | null;\n  audioStreamCount?: number;\n  id?: number;\n  resolution?: string | null;\n  runTime?: string | null;\n  scanType?: string | null;\n  subtitles?: string | null;\n  videoBitDepth?: number;\n  videoBitrate?: number;\n  videoCodec?: string | null;\n  videoDynamicRange?: string | null;\n  videoDynamicRangeType?: string | null;\n  videoFps?: number;\n}",
-    },
-    TypeDef {
-        name: "MediaManagementConfigResource",
-        ts: "export interface MediaManagementConfigResource {\n  autoUnmonitorPreviouslyDownloadedEpisodes?: boolean;\n  chmodFolder?: string | null;\n  chownGroup?: string | null;\n  copyUsingHardlinks?: boolean;\n  createEmptySeriesFolders?: boolean;\n  deleteEmptyFolders?: boolean;\n  downloadPropersAndRepacks?: ProperDownloadTypes;\n  enableMediaInfo?: boolean;\n  episodeTitleRequired?: EpisodeTitleRequiredType;\n  extraFileExtensions?: string | null;\n  fileDate?: FileDateType;\n  id?: number;\n  importExtraFiles?: boolean;\n  minimumFreeSpaceWhenImporting?: number;\n  recycleBin?: string | null;\n  recycleBinCleanupDays?: number;\n  rescanAfterRefresh?: RescanAfterRefreshType;\n  scriptImportPath?: string | null;\n  setPermissionsLinux?: boolean;\n  skipFreeSpaceCheckWhenImporting?: boolean;\n  useScriptImport?: boolean;\n}",
-    },
-    TypeDef {
-        name: "MetadataResource",
-        ts: "export interface MetadataResource {\n  configContract?: string | null;\n  enable?: boolean;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  infoLink?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  presets?: MetadataResource[] | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "MonitorTypes",
-        ts: "export type MonitorTypes = \"unknown\" | \"all\" | \"future\" | \"missing\" | \"existing\" | \"firstSeason\" | \"lastSeason\" | \"latestSeason\" | \"pilot\" | \"recent\" | \"monitorSpecials\" | \"unmonitorSpecials\" | \"none\" | \"skip\";",
-    },
-    TypeDef {
-        name: "MonitoringOptions",
-        ts: "export interface MonitoringOptions {\n  ignoreEpisodesWithFiles?: boolean;\n  ignoreEpisodesWithoutFiles?: boolean;\n  monitor?: MonitorTypes;\n}",
-    },
-    TypeDef {
-        name: "NamingConfigResource",
-        ts: "export interface NamingConfigResource {\n  animeEpisodeFormat?: string | null;\n  colonReplacementFormat?: number;\n  customColonReplacementFormat?: string | null;\n  dailyEpisodeFormat?: string | null;\n  id?: number;\n  multiEpisodeStyle?: number;\n  renameEpisodes?: boolean;\n  replaceIllegalCharacters?: boolean;\n  seasonFolderFormat?: string | null;\n  seriesFolderFormat?: string | null;\n  specialsFolderFormat?: string | null;\n  standardEpisodeFormat?: string | null;\n}",
-    },
-    TypeDef {
-        name: "NewItemMonitorTypes",
-        ts: "export type NewItemMonitorTypes = \"all\" | \"none\";",
-    },
-    TypeDef {
-        name: "NotificationResource",
-        ts: "export interface NotificationResource {\n  configContract?: string | null;\n  fields?: Field[] | null;\n  id?: number;\n  implementation?: string | null;\n  implementationName?: string | null;\n  includeHealthWarnings?: boolean;\n  infoLink?: string | null;\n  link?: string | null;\n  message?: ProviderMessage;\n  name?: string | null;\n  onApplicationUpdate?: boolean;\n  onDownload?: boolean;\n  onEpisodeFileDelete?: boolean;\n  onEpisodeFileDeleteForUpgrade?: boolean;\n  onGrab?: boolean;\n  onHealthIssue?: boolean;\n  onHealthRestored?: boolean;\n  onImportComplete?: boolean;\n  onManualInteractionRequired?: boolean;\n  onRename?: boolean;\n  onSeriesAdd?: boolean;\n  onSeriesDelete?: boolean;\n  onUpgrade?: boolean;\n  presets?: NotificationResource[] | null;\n  supportsOnApplicationUpdate?: boolean;\n  supportsOnDownload?: boolean;\n  supportsOnEpisodeFileDelete?: boolean;\n  supportsOnEpisodeFileDeleteForUpgrade?: boolean;\n  supportsOnGrab?: boolean;\n  supportsOnHealthIssue?: boolean;\n  supportsOnHealthRestored?: boolean;\n  supportsOnImportComplete?: boolean;\n  supportsOnManualInteractionRequired?: boolean;\n  supportsOnRename?: boolean;\n  supportsOnSeriesAdd?: boolean;\n  supportsOnSeriesDelete?: boolean;\n  supportsOnUpgrade?: boolean;\n  tags?: number[] | null;\n  testCommand?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ParseResource",
-        ts: "export interface ParseResource {\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  episodes?: EpisodeResource[] | null;\n  id?: number;\n  languages?: Language[] | null;\n  parsedEpisodeInfo?: ParsedEpisodeInfo;\n  series?: SeriesResource;\n  title?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ParsedEpisodeInfo",
-        ts: "export interface ParsedEpisodeInfo {\n  absoluteEpisodeNumbers?: number[] | null;\n  airDate?: string | null;\n  dailyPart?: number | null;\n  episodeNumbers?: number[] | null;\n  fullSeason?: boolean;\n  isAbsoluteNumbering?: boolean;\n  isDaily?: boolean;\n  isMiniSeries?: boolean;\n  isMultiSeason?: boolean;\n  isPartialSeason?: boolean;\n  isPossibleSceneSeasonSpecial?: boolean;\n  isPossibleSpecialEpisode?: boolean;\n  isSeasonExtra?: boolean;\n  isSplitEpisode?: boolean;\n  languages?: Language[] | null;\n  quality?: QualityModel;\n  releaseGroup?: string | null;\n  releaseHash?: string | null;\n  releaseTitle?: string | null;\n  releaseTokens?: string | null;\n  releaseType?: ReleaseType;\n  seasonNumber?: number;\n  seasonPart?: number;\n  seriesTitle?: string | null;\n  seriesTitleInfo?: SeriesTitleInfo;\n  special?: boolean;\n  specialAbsoluteEpisodeNumbers?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "PingResource",
-        ts: "export interface PingResource {\n  status?: string | null;\n}",
-    },
-    TypeDef {
-        name: "PrivacyLevel",
-        ts: "export type PrivacyLevel = \"normal\" | \"password\" | \"apiKey\" | \"userName\";",
-    },
-    TypeDef {
-        name: "ProfileFormatItemResource",
-        ts: "export interface ProfileFormatItemResource {\n  format?: number;\n  id?: number;\n  name?: string | null;\n  score?: number;\n}",
-    },
-    TypeDef {
-        name: "ProperDownloadTypes",
-        ts: "export type ProperDownloadTypes = \"preferAndUpgrade\" | \"doNotUpgrade\" | \"doNotPrefer\";",
-    },
-    TypeDef {
-        name: "ProviderMessage",
-        ts: "export interface ProviderMessage {\n  message?: string | null;\n  type?: ProviderMessageType;\n}",
-    },
-    TypeDef {
-        name: "ProviderMessageType",
-        ts: "export type ProviderMessageType = \"info\" | \"warning\" | \"error\";",
-    },
-    TypeDef {
-        name: "ProxyType",
-        ts: "export type ProxyType = \"http\" | \"socks4\" | \"socks5\";",
-    },
-    TypeDef {
-        name: "Quality",
-        ts: "export interface Quality {\n  id?: number;\n  name?: string | null;\n  resolution?: number;\n  source?: QualitySource;\n}",
-    },
-    TypeDef {
-        name: "QualityDefinitionLimitsResource",
-        ts: "export interface QualityDefinitionLimitsResource {\n  max?: number;\n  min?: number;\n}",
-    },
-    TypeDef {
-        name: "QualityDefinitionResource",
-        ts: "export interface QualityDefinitionResource {\n  id?: number;\n  maxSize?: number | null;\n  minSize?: number | null;\n  preferredSize?: number | null;\n  quality?: Quality;\n  title?: string | null;\n  weight?: number;\n}",
-    },
-    TypeDef {
-        name: "QualityModel",
-        ts: "export interface QualityModel {\n  quality?: Quality;\n  revision?: Revision;\n}",
-    },
-    TypeDef {
-        name: "QualityProfileQualityItemResource",
-        ts: "export interface QualityProfileQualityItemResource {\n  allowed?: boolean;\n  id?: number;\n  items?: QualityProfileQualityItemResource[] | null;\n  name?: string | null;\n  quality?: Quality;\n}",
-    },
-    TypeDef {
-        name: "QualityProfileResource",
-        ts: "export interface QualityProfileResource {\n  cutoff?: number;\n  cutoffFormatScore?: number;\n  formatItems?: ProfileFormatItemResource[] | null;\n  id?: number;\n  items?: QualityProfileQualityItemResource[] | null;\n  minFormatScore?: number;\n  minUpgradeFormatScore?: number;\n  name?: string | null;\n  upgradeAllowed?: boolean;\n}",
-    },
-    TypeDef {
-        name: "QualitySource",
-        ts: "export type QualitySource = \"unknown\" | \"television\" | \"televisionRaw\" | \"web\" | \"webRip\" | \"dvd\" | \"bluray\" | \"blurayRaw\";",
-    },
-    TypeDef {
-        name: "QueueBulkResource",
-        ts: "export interface QueueBulkResource {\n  ids?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "QueueResource",
-        ts: "export interface QueueResource {\n  added?: string | null;\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadClient?: string | null;\n  downloadClientHasPostImportCategory?: boolean;\n  downloadId?: string | null;\n  episode?: EpisodeResource;\n  episodeHasFile?: boolean;\n  episodeId?: number | null;\n  errorMessage?: string | null;\n  estimatedCompletionTime?: string | null;\n  id?: number;\n  indexer?: string | null;\n  languages?: Language[] | null;\n  outputPath?: string | null;\n  protocol?: DownloadProtocol;\n  quality?: QualityModel;\n  seasonNumber?: number | null;\n  series?: SeriesResource;\n  seriesId?: number | null;\n  size?: number;\n  sizeleft?: number;\n  status?: QueueStatus;\n  statusMessages?: TrackedDownloadStatusMessage[] | null;\n  timeleft?: string | null;\n  title?: string | null;\n  trackedDownloadState?: TrackedDownloadState;\n  trackedDownloadStatus?: TrackedDownloadStatus;\n}",
-    },
-    TypeDef {
-        name: "QueueResourcePagingResource",
-        ts: "export interface QueueResourcePagingResource {\n  page?: number;\n  pageSize?: number;\n  records?: QueueResource[] | null;\n  sortDirection?: SortDirection;\n  sortKey?: string | null;\n  totalRecords?: number;\n}",
-    },
-    TypeDef {
-        name: "QueueStatus",
-        ts: "export type QueueStatus = \"unknown\" | \"queued\" | \"paused\" | \"downloading\" | \"completed\" | \"failed\" | \"warning\" | \"delay\" | \"downloadClientUnavailable\" | \"fallback\";",
-    },
-    TypeDef {
-        name: "QueueStatusResource",
-        ts: "export interface QueueStatusResource {\n  count?: number;\n  errors?: boolean;\n  id?: number;\n  totalCount?: number;\n  unknownCount?: number;\n  unknownErrors?: boolean;\n  unknownWarnings?: boolean;\n  warnings?: boolean;\n}",
-    },
-    TypeDef {
-        name: "Ratings",
-        ts: "export interface Ratings {\n  value?: number;\n  votes?: number;\n}",
-    },
-    TypeDef {
-        name: "RejectionType",
-        ts: "export type RejectionType = \"permanent\" | \"temporary\";",
-    },
-    TypeDef {
-        name: "ReleaseEpisodeResource",
-        ts: "export interface ReleaseEpisodeResource {\n  absoluteEpisodeNumber?: number | null;\n  episodeNumber?: number;\n  id?: number;\n  seasonNumber?: number;\n  title?: string | null;\n}",
-    },
-    TypeDef {
-        name: "ReleaseProfileResource",
-        ts: "export interface ReleaseProfileResource {\n  enabled?: boolean;\n  id?: number;\n  ignored?: unknown | null;\n  indexerId?: number;\n  name?: string | null;\n  required?: unknown | null;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "ReleaseResource",
-        ts: "export interface ReleaseResource {\n  absoluteEpisodeNumbers?: number[] | null;\n  age?: number;\n  ageHours?: number;\n  ageMinutes?: number;\n  airDate?: string | null;\n  approved?: boolean;\n  commentUrl?: string | null;\n  customFormatScore?: number;\n  customFormats?: CustomFormatResource[] | null;\n  downloadAllowed?: boolean;\n  downloadClient?: string | null;\n  downloadClientId?: number | null;\n  downloadUrl?: string | null;\n  episodeId?: number | null;\n  episodeIds?: number[] | null;\n  episodeNumbers?: number[] | null;\n  episodeRequested?: boolean;\n  fullSeason?: boolean;\n  guid?: string | null;\n  id?: number;\n  imdbId?: string | null;\n  indexer?: string | null;\n  indexerFlags?: number;\n  indexerId?: number;\n  infoHash?: string | null;\n  infoUrl?: string | null;\n  isAbsoluteNumbering?: boolean;\n  isDaily?: boolean;\n  isPossibleSpecialEpisode?: boolean;\n  languageWeight?: number;\n  languages?: Language[] | null;\n  leechers?: number | null;\n  magnetUrl?: string | null;\n  mappedAbsoluteEpisodeNumbers?: number[] | null;\n  mappedEpisodeInfo?: ReleaseEpisodeResource[] | null;\n  mappedEpisodeNumbers?: number[] | null;\n  mappedSeasonNumber?: number | null;\n  mappedSeriesId?: number | null;\n  protocol?: DownloadProtocol;\n  publishDate?: string;\n  quality?: QualityModel;\n  qualityWeight?: number;\n  rejected?: boolean;\n  rejections?: string[] | null;\n  releaseGroup?: string | null;\n  releaseHash?: string | null;\n  releaseWeight?: number;\n  sceneMapping?: AlternateTitleResource;\n  sceneSource?: boolean;\n  seasonNumber?: number;\n  seeders?: number | null;\n  seriesId?: number | null;\n  seriesTitle?: string | null;\n  shouldOverride?: boolean | null;\n  size?: number;\n  special?: boolean;\n  subGroup?: string | null;\n  temporarilyRejected?: boolean;\n  title?: string | null;\n  tvRageId?: number;\n  tvdbId?: number;\n}",
-    },
-    TypeDef {
-        name: "ReleaseType",
-        ts: "export type ReleaseType = \"unknown\" | \"singleEpisode\" | \"multiEpisode\" | \"seasonPack\";",
-    },
-    TypeDef {
-        name: "RemotePathMappingResource",
-        ts: "export interface RemotePathMappingResource {\n  host?: string | null;\n  id?: number;\n  localPath?: string | null;\n  remotePath?: string | null;\n}",
-    },
-    TypeDef {
-        name: "RenameEpisodeResource",
-        ts: "export interface RenameEpisodeResource {\n  episodeFileId?: number;\n  episodeNumbers?: number[] | null;\n  existingPath?: string | null;\n  id?: number;\n  newPath?: string | null;\n  seasonNumber?: number;\n  seriesId?: number;\n}",
-    },
-    TypeDef {
-        name: "RescanAfterRefreshType",
-        ts: "export type RescanAfterRefreshType = \"always\" | \"afterManual\" | \"never\";",
-    },
-    TypeDef {
-        name: "Revision",
-        ts: "export interface Revision {\n  isRepack?: boolean;\n  real?: number;\n  version?: number;\n}",
-    },
-    TypeDef {
-        name: "RootFolderResource",
-        ts: "export interface RootFolderResource {\n  accessible?: boolean;\n  freeSpace?: number | null;\n  id?: number;\n  path?: string | null;\n  unmappedFolders?: UnmappedFolder[] | null;\n}",
-    },
-    TypeDef {
-        name: "RuntimeMode",
-        ts: "export type RuntimeMode = \"console\" | \"service\" | \"tray\";",
-    },
-    TypeDef {
-        name: "SeasonPassResource",
-        ts: "export interface SeasonPassResource {\n  monitoringOptions?: MonitoringOptions;\n  series?: SeasonPassSeriesResource[] | null;\n}",
-    },
-    TypeDef {
-        name: "SeasonPassSeriesResource",
-        ts: "export interface SeasonPassSeriesResource {\n  id?: number;\n  monitored?: boolean | null;\n  seasons?: SeasonResource[] | null;\n}",
-    },
-    TypeDef {
-        name: "SeasonResource",
-        ts: "export interface SeasonResource {\n  images?: MediaCover[] | null;\n  monitored?: boolean;\n  seasonNumber?: number;\n  statistics?: SeasonStatisticsResource;\n}",
-    },
-    TypeDef {
-        name: "SeasonStatisticsResource",
-        ts: "export interface SeasonStatisticsResource {\n  episodeCount?: number;\n  episodeFileCount?: number;\n  nextAiring?: string | null;\n  percentOfEpisodes?: number;\n  previousAiring?: string | null;\n  releaseGroups?: string[] | null;\n  sizeOnDisk?: number;\n  totalEpisodeCount?: number;\n}",
-    },
-    TypeDef {
-        name: "SelectOption",
-        ts: "export interface SelectOption {\n  hint?: string | null;\n  name?: string | null;\n  order?: number;\n  value?: number;\n}",
-    },
-    TypeDef {
-        name: "SeriesEditorResource",
-        ts: "export interface SeriesEditorResource {\n  addImportListExclusion?: boolean;\n  applyTags?: ApplyTags;\n  deleteFiles?: boolean;\n  monitorNewItems?: NewItemMonitorTypes;\n  monitored?: boolean | null;\n  moveFiles?: boolean;\n  qualityProfileId?: number | null;\n  rootFolderPath?: string | null;\n  seasonFolder?: boolean | null;\n  seriesIds?: number[] | null;\n  seriesType?: SeriesTypes;\n  tags?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "SeriesResource",
-        ts: "export interface SeriesResource {\n  addOptions?: AddSeriesOptions;\n  added?: string;\n  airTime?: string | null;\n  alternateTitles?: AlternateTitleResource[] | null;\n  certification?: string | null;\n  cleanTitle?: string | null;\n  ended?: boolean;\n  episodesChanged?: boolean | null;\n  firstAired?: string | null;\n  folder?: string | null;\n  genres?: string[] | null;\n  id?: number;\n  images?: MediaCover[] | null;\n  imdbId?: string | null;\n  languageProfileId?: number;\n  lastAired?: string | null;\n  monitorNewItems?: NewItemMonitorTypes;\n  monitored?: boolean;\n  network?: string | null;\n  nextAiring?: string | null;\n  originalLanguage?: Language;\n  overview?: string | null;\n  path?: string | null;\n  previousAiring?: string | null;\n  profileName?: string | null;\n  qualityProfileId?: number;\n  ratings?: Ratings;\n  remotePoster?: string | null;\n  rootFolderPath?: string | null;\n  runtime?: number;\n  seasonFolder?: boolean;\n  seasons?: SeasonResource[] | null;\n  seriesType?: SeriesTypes;\n  sortTitle?: string | null;\n  statistics?: SeriesStatisticsResource;\n  status?: SeriesStatusType;\n  tags?: number[] | null;\n  title?: string | null;\n  titleSlug?: string | null;\n  tmdbId?: number;\n  tvMazeId?: number;\n  tvRageId?: number;\n  tvdbId?: number;\n  useSceneNumbering?: boolean;\n  year?: number;\n}",
-    },
-    TypeDef {
-        name: "SeriesStatisticsResource",
-        ts: "export interface SeriesStatisticsResource {\n  episodeCount?: number;\n  episodeFileCount?: number;\n  percentOfEpisodes?: number;\n  releaseGroups?: string[] | null;\n  seasonCount?: number;\n  sizeOnDisk?: number;\n  totalEpisodeCount?: number;\n}",
-    },
-    TypeDef {
-        name: "SeriesStatusType",
-        ts: "export type SeriesStatusType = \"continuing\" | \"ended\" | \"upcoming\" | \"deleted\";",
-    },
-    TypeDef {
-        name: "SeriesTitleInfo",
-        ts: "export interface SeriesTitleInfo {\n  allTitles?: string[] | null;\n  title?: string | null;\n  titleWithoutYear?: string | null;\n  year?: number;\n}",
-    },
-    TypeDef {
-        name: "SeriesTypes",
-        ts: "export type SeriesTypes = \"standard\" | \"daily\" | \"anime\";",
-    },
-    TypeDef {
-        name: "SortDirection",
-        ts: "export type SortDirection = \"default\" | \"ascending\" | \"descending\";",
-    },
-    TypeDef {
-        name: "SystemResource",
-        ts: "export interface SystemResource {\n  appData?: string | null;\n  appName?: string | null;\n  authentication?: AuthenticationType;\n  branch?: string | null;\n  buildTime?: string;\n  databaseType?: DatabaseType;\n  databaseVersion?: string | null;\n  instanceName?: string | null;\n  isAdmin?: boolean;\n  isDebug?: boolean;\n  isDocker?: boolean;\n  isLinux?: boolean;\n  isNetCore?: boolean;\n  isOsx?: boolean;\n  isProduction?: boolean;\n  isUserInteractive?: boolean;\n  isWindows?: boolean;\n  migrationVersion?: number;\n  mode?: RuntimeMode;\n  osName?: string | null;\n  osVersion?: string | null;\n  packageAuthor?: string | null;\n  packageUpdateMechanism?: UpdateMechanism;\n  packageUpdateMechanismMessage?: string | null;\n  packageVersion?: string | null;\n  runtimeName?: string | null;\n  runtimeVersion?: string | null;\n  sqliteVersion?: string | null;\n  startTime?: string;\n  startupPath?: string | null;\n  urlBase?: string | null;\n  version?: string | null;\n}",
-    },
-    TypeDef {
-        name: "TagDetailsResource",
-        ts: "export interface TagDetailsResource {\n  autoTagIds?: number[] | null;\n  delayProfileIds?: number[] | null;\n  downloadClientIds?: number[] | null;\n  id?: number;\n  importListIds?: number[] | null;\n  indexerIds?: number[] | null;\n  label?: string | null;\n  notificationIds?: number[] | null;\n  restrictionIds?: number[] | null;\n  seriesIds?: number[] | null;\n}",
-    },
-    TypeDef {
-        name: "TagResource",
-        ts: "export interface TagResource {\n  id?: number;\n  label?: string | null;\n}",
-    },
-    TypeDef {
-        name: "TaskResource",
-        ts: "export interface TaskResource {\n  id?: number;\n  interval?: number;\n  lastDuration?: string;\n  lastExecution?: string;\n  lastStartTime?: string;\n  name?: string | null;\n  nextExecution?: string;\n  taskName?: string | null;\n}",
-    },
-    TypeDef {
-        name: "TrackedDownloadState",
-        ts: "export type TrackedDownloadState = \"downloading\" | \"importBlocked\" | \"importPending\" | \"importing\" | \"imported\" | \"failedPending\" | \"failed\" | \"ignored\";",
-    },
-    TypeDef {
-        name: "TrackedDownloadStatus",
-        ts: "export type TrackedDownloadStatus = \"ok\" | \"warning\" | \"error\";",
-    },
-    TypeDef {
-        name: "TrackedDownloadStatusMessage",
-        ts: "export interface TrackedDownloadStatusMessage {\n  messages?: string[] | null;\n  title?: string | null;\n}",
-    },
-    TypeDef {
-        name: "UiConfigResource",
-        ts: "export interface UiConfigResource {\n  calendarWeekColumnHeader?: string | null;\n  enableColorImpairedMode?: boolean;\n  firstDayOfWeek?: number;\n  id?: number;\n  longDateFormat?: string | null;\n  shortDateFormat?: string | null;\n  showRelativeDates?: boolean;\n  theme?: string | null;\n  timeFormat?: string | null;\n  uiLanguage?: number;\n}",
-    },
-    TypeDef {
-        name: "UnmappedFolder",
-        ts: "export interface UnmappedFolder {\n  name?: string | null;\n  path?: string | null;\n  relativePath?: string | null;\n}",
-    },
-    TypeDef {
-        name: "UpdateChanges",
-        ts: "export interface UpdateChanges {\n  fixed?: string[] | null;\n  new?: string[] | null;\n}",
-    },
-    TypeDef {
-        name: "UpdateMechanism",
-        ts: "export type UpdateMechanism = \"builtIn\" | \"script\" | \"external\" | \"apt\" | \"docker\";",
-    },
-    TypeDef {
-        name: "UpdateResource",
-        ts: "export interface UpdateResource {\n  branch?: string | null;\n  changes?: UpdateChanges;\n  fileName?: string | null;\n  hash?: string | null;\n  id?: number;\n  installable?: boolean;\n  installed?: boolean;\n  installedOn?: string | null;\n  latest?: boolean;\n  releaseDate?: string;\n  url?: string | null;\n  version?: string | null;\n}",
-    },
-];
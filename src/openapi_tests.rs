@@ -147,3 +147,39 @@ fn every_generated_operation_is_well_formed() {
         }
     }
 }
+
+#[test]
+fn generated_tables_are_sorted_for_binary_search() {
+    for kind in [
+        ServiceKind::Sonarr,
+        ServiceKind::Radarr,
+        ServiceKind::Prowlarr,
+        ServiceKind::Overseerr,
+        ServiceKind::Jellyfin,
+        ServiceKind::Plex,
+    ] {
+        let operations = operations_for_kind(kind);
+        assert!(
+            operations
+                .windows(2)
+                .all(|pair| pair[0].name < pair[1].name),
+            "{kind:?} OPERATIONS must be strictly sorted by name"
+        );
+        for op in operations {
+            assert!(std::ptr::eq(find_operation(kind, op.name).unwrap(), op));
+        }
+    }
+}
+
+#[test]
+fn schema_columns_parse_once_and_share_the_value() {
+    let op = find_operation(ServiceKind::Sonarr, "delete_autotagging_by_id").unwrap();
+    let parameter = &op.parameters[0];
+    let first = parameter.schema_json();
+    assert_eq!(first["type"], "integer");
+    assert!(std::ptr::eq(first, parameter.schema_json()));
+
+    // Equal schemas are one pool string, so they share one parsed value too.
+    let other = find_operation(ServiceKind::Sonarr, "delete_blocklist_by_id").unwrap();
+    assert!(std::ptr::eq(first, other.parameters[0].schema_json()));
+}
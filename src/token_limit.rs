@@ -69,12 +69,15 @@ pub const MAX_RESPONSE_BYTES: usize = 40_000;
 ///   can `JSON.parse` the result, branch on `truncated`, and re-query with
 ///   `limit`/`fields` rather than choke on a mid-string cut (AN-6).
 ///
+/// Serialization stops as soon as the cap is crossed, so an oversized upstream
+/// result costs ~[`MAX_RESPONSE_BYTES`] of output work, not its full size.
+///
 /// Returns the JSON text and a flag indicating whether truncation occurred.
 pub fn serialize_with_limit(value: &serde_json::Value) -> (String, bool) {
-    let full = serde_json::to_string(value).unwrap_or_else(|_| "null".to_owned());
-    if full.len() <= MAX_RESPONSE_BYTES {
-        return (full, false);
-    }
+    let head = match serialize_within(value, MAX_RESPONSE_BYTES) {
+        Ok(full) => return (full, false),
+        Err(head) => head,
+    };
 
     let reason = format!(
         "response exceeded {MAX_RESPONSE_BYTES} bytes (~10K tokens); \
@@ -85,16 +88,16 @@ pub fn serialize_with_limit(value: &serde_json::Value) -> (String, bool) {
     // `"` / `\` in `partial` becomes two bytes once re-serialized). Iteratively
     // shrink the boundary until the serialized marker actually fits, so the hard
     // cap holds regardless of escape density.
-    let mut boundary = MAX_RESPONSE_BYTES.min(full.len());
+    let mut boundary = head.len();
     loop {
         // Snap to a char boundary so we never slice mid-codepoint.
-        while boundary > 0 && !full.is_char_boundary(boundary) {
+        while boundary > 0 && !head.is_char_boundary(boundary) {
             boundary -= 1;
         }
         let marker = serde_json::json!({
             "truncated": true,
             "reason": reason,
-            "partial": &full[..boundary],
+            "partial": &head[..boundary],
         });
         let text = serde_json::to_string(&marker)
             .unwrap_or_else(|_| r#"{"truncated":true,"reason":"response too large"}"#.to_owned());
@@ -106,6 +109,81 @@ pub fn serialize_with_limit(value: &serde_json::Value) -> (String, bool) {
     }
 }
 
+/// Compact serialization of `value` if it fits in `budget` bytes; otherwise the
+/// char-boundary-safe head of it (at most `budget` bytes) as the error. Stops
+/// serializing once the budget is crossed.
+pub(crate) fn serialize_within(value: &serde_json::Value, budget: usize) -> Result<String, String> {
+    let mut sink = BudgetWriter::new(budget, budget);
+    let complete = serde_json::to_writer(&mut sink, value).is_ok();
+    let head = sink.into_head();
+    if complete { Ok(head) } else { Err(head) }
+}
+
+/// Compact serialized length of `value` if it is at most `budget` bytes, `None`
+/// once it is larger. Counts without buffering and stops at the budget.
+pub(crate) fn serialized_len_within(value: &serde_json::Value, budget: usize) -> Option<usize> {
+    let mut sink = BudgetWriter::new(0, budget);
+    serde_json::to_writer(&mut sink, value)
+        .ok()
+        .map(|()| sink.written)
+}
+
+/// Compact serialized length of `value`, counted without building the string.
+pub(crate) fn serialized_len(value: &serde_json::Value) -> usize {
+    serialized_len_within(value, usize::MAX).unwrap_or(usize::MAX)
+}
+
+/// Serializer sink behind the bounded helpers: counts every byte, keeps the
+/// first `keep`, and fails the write once the count passes `limit` so serde
+/// stops walking the value. Serializing a `Value` can only fail through this
+/// sink, so a failed write always means "over the limit".
+struct BudgetWriter {
+    head: Vec<u8>,
+    keep: usize,
+    written: usize,
+    limit: usize,
+}
+
+impl BudgetWriter {
+    fn new(keep: usize, limit: usize) -> Self {
+        Self {
+            head: Vec::with_capacity(keep.min(64 * 1024)),
+            keep,
+            written: 0,
+            limit,
+        }
+    }
+
+    /// The kept bytes, trimmed back to the last complete UTF-8 sequence.
+    fn into_head(self) -> String {
+        match String::from_utf8(self.head) {
+            Ok(head) => head,
+            Err(error) => {
+                let valid = error.utf8_error().valid_up_to();
+                let mut bytes = error.into_bytes();
+                bytes.truncate(valid);
+                String::from_utf8(bytes).unwrap_or_default()
+            }
+        }
+    }
+}
+
+impl std::io::Write for BudgetWriter {
+    fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
+        let room = self.keep.saturating_sub(self.head.len());
+        self.head.extend_from_slice(&buf[..buf.len().min(room)]);
+        self.written = self.written.saturating_add(buf.len());
+        if self.written > self.limit {
+            return Err(std::io::Error::other("serialization budget exceeded"));
+        }
+        Ok(buf.len())
+    }
+
+    fn flush(&mut self) -> std::io::Result<()> {
+        Ok(())
+    }
+}
+
 #[cfg(test)]
 #[path = "token_limit_tests.rs"]
 mod tests;
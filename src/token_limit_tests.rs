@@ -42,3 +42,15 @@ fn serialize_with_limit_holds_cap_for_escape_heavy_payload() {
         serde_json::from_str(&text).expect("truncated output is valid JSON");
     assert_eq!(parsed["truncated"], true);
 }
+
+#[test]
+fn bounded_serializers_stop_at_the_budget() {
+    let value = serde_json::json!({ "items": (0..1_000).collect::<Vec<_>>() });
+    let full = serde_json::to_string(&value).unwrap();
+
+    assert_eq!(serialized_len(&value), full.len());
+    assert_eq!(serialized_len_within(&value, full.len()), Some(full.len()));
+    assert_eq!(serialized_len_within(&value, full.len() - 1), None);
+    assert_eq!(serialize_within(&value, full.len()), Ok(full.clone()));
+    assert_eq!(serialize_within(&value, 64), Err(full[..64].to_owned()));
+}
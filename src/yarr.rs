@@ -3,6 +3,13 @@
 //! This module is split into:
 //!   * `yarr.rs` (this file) — `YarrClient` + the `request_json` core
 //!   * [`auth`] — per-kind header auth + qBittorrent cookie session
+//!   * `cache` — opt-in TTL/LRU read cache with single-flight GET coalescing
+//!   * `conditional` — `If-None-Match`/`If-Modified-Since` GETs for pollers
+//!   * `exchange` — limiter admission, the send, and bounded body collection
+//!   * `limiter` — per-service adaptive concurrency limit and circuit breaker
+//!   * `phases` — per-phase latency and response-size metrics
+//!   * `projection` — field projection applied while a JSON body streams in
+//!   * `response` — retry, read-cache routing, and representation decoding
 //!   * [`helpers`] — URL building, query-string assembly, path validation,
 //!     response slimming, log redaction
 //!
@@ -22,17 +29,37 @@ pub(crate) const MAX_UPSTREAM_RESPONSE_BYTES: usize = 16 * 1024 * 1024;
 
 #[path = "yarr/auth.rs"]
 pub mod auth;
+#[path = "yarr/cache.rs"]
+mod cache;
+#[path = "yarr/conditional.rs"]
+mod conditional;
+#[path = "yarr/encoding.rs"]
+mod encoding;
+#[path = "yarr/exchange.rs"]
+mod exchange;
 #[path = "yarr/helpers.rs"]
 pub mod helpers;
+#[path = "yarr/limiter.rs"]
+mod limiter;
 #[path = "yarr/openapi_transport.rs"]
 mod openapi_transport;
+#[path = "yarr/phases.rs"]
+mod phases;
+#[path = "yarr/projection.rs"]
+mod projection;
+#[path = "yarr/qbit_sync.rs"]
+mod qbit_sync;
 #[path = "yarr/response.rs"]
 mod response;
 
+pub use conditional::{Conditional, Validators};
 pub use helpers::{build_url, query_get, slim, validate_safe_path};
 pub(crate) use openapi_transport::{EncodedRequestBody, MultipartField, OpenApiRequest};
+pub use projection::Projection;
 #[cfg(test)]
 use response::allows_text_response;
+#[cfg(any(test, feature = "test-support"))]
+pub(crate) use response::decode_json_success;
 
 #[cfg(test)]
 #[path = "yarr_tests.rs"]
@@ -45,9 +72,13 @@ pub struct YarrClient {
     /// One cookie jar + login state per configured qBittorrent identity. Cookie
     /// scope ignores ports, so sharing one jar across instances is unsafe.
     qbit_sessions: std::sync::Arc<HashMap<String, std::sync::Arc<auth::QbittorrentSession>>>,
+    /// Shared read cache; only consulted for services with `read_cache = true`.
+    read_cache: std::sync::Arc<cache::ReadCache>,
+    /// Per-service admission control every upstream request passes through.
+    limiter: std::sync::Arc<limiter::UpstreamLimiter>,
 }
 
-#[derive(Debug, thiserror::Error)]
+#[derive(Debug, Clone, thiserror::Error)]
 #[non_exhaustive]
 pub enum UpstreamError {
     #[error(
@@ -83,6 +114,21 @@ pub enum UpstreamError {
     },
     #[error("{service} login rejected username/password")]
     QbittorrentLoginRejected { service: String },
+    #[error(
+        "{service} circuit breaker is open after repeated failures; retry in {retry_after_secs}s"
+    )]
+    CircuitOpen {
+        service: String,
+        retry_after_secs: u64,
+    },
+    #[error(
+        "{service} is saturated: no request slot freed within {waited_ms} ms (current limit {limit})"
+    )]
+    Saturated {
+        service: String,
+        limit: usize,
+        waited_ms: u64,
+    },
 }
 
 /// Per-request upstream timeout. Defaults to 30s; override with
@@ -136,6 +182,8 @@ impl YarrClient {
         Ok(Self {
             client,
             qbit_sessions: std::sync::Arc::new(qbit_sessions),
+            read_cache: std::sync::Arc::new(cache::ReadCache::new(cache::max_bytes())),
+            limiter: std::sync::Arc::default(),
         })
     }
 
@@ -151,6 +199,18 @@ impl YarrClient {
             })
     }
 
+    /// The client to send `service` requests on: qBittorrent's per-identity
+    /// cookie client (logged in on demand), otherwise the shared one.
+    async fn http_for(&self, service: &ServiceConfig) -> Result<&Client> {
+        if service.kind == ServiceKind::Qbittorrent {
+            let session = self.qbit_session(service)?;
+            session.ensure(service).await?;
+            Ok(session.client())
+        } else {
+            Ok(&self.client)
+        }
+    }
+
     #[cfg(test)]
     async fn expire_qbit_session_for_test(&self, service: &ServiceConfig) {
         self.qbit_session(service)
@@ -164,6 +224,19 @@ impl YarrClient {
             .await
     }
 
+    /// GET `path`, keeping only the fields `projection` selects. The projection
+    /// runs while the body streams in, so large listings are never buffered
+    /// whole; see [`Projection`].
+    pub async fn get_json_projected(
+        &self,
+        service: &ServiceConfig,
+        path: &str,
+        projection: &Projection,
+    ) -> Result<Value> {
+        self.send_get_projected(service, build_url(service, path)?, projection)
+            .await
+    }
+
     pub async fn post_json(
         &self,
         service: &ServiceConfig,
@@ -205,13 +278,7 @@ impl YarrClient {
         body: Option<Value>,
         accept_mime: Option<&str>,
     ) -> Result<Value> {
-        let http = if service.kind == ServiceKind::Qbittorrent {
-            let session = self.qbit_session(service)?;
-            session.ensure(service).await?;
-            session.client()
-        } else {
-            &self.client
-        };
+        let http = self.http_for(service).await?;
         let url = build_url(service, path)?;
         let mut request = http.request(method, url);
         request = auth::apply_auth(request, service);
@@ -239,13 +306,7 @@ impl YarrClient {
         body: Option<Value>,
         accept_mime: Option<&str>,
     ) -> Result<Value> {
-        let http = if service.kind == ServiceKind::Qbittorrent {
-            let session = self.qbit_session(service)?;
-            session.ensure(service).await?;
-            session.client()
-        } else {
-            &self.client
-        };
+        let http = self.http_for(service).await?;
         let mut request = http.request(method, url);
         request = auth::apply_auth(request, service);
         if let Some(accept) = accept_mime {
@@ -266,13 +327,7 @@ impl YarrClient {
         file_name: &str,
         bytes: Vec<u8>,
     ) -> Result<Value> {
-        let http = if service.kind == ServiceKind::Qbittorrent {
-            let session = self.qbit_session(service)?;
-            session.ensure(service).await?;
-            session.client()
-        } else {
-            &self.client
-        };
+        let http = self.http_for(service).await?;
         let part = reqwest::multipart::Part::bytes(bytes)
             .file_name(file_name.to_string())
             .mime_str("application/zip")?;
@@ -290,13 +345,7 @@ impl YarrClient {
         url: reqwest::Url,
         accept_mime: Option<&str>,
     ) -> Result<Value> {
-        let http = if service.kind == ServiceKind::Qbittorrent {
-            let session = self.qbit_session(service)?;
-            session.ensure(service).await?;
-            session.client()
-        } else {
-            &self.client
-        };
+        let http = self.http_for(service).await?;
         let mut request = http.get(url);
         request = auth::apply_auth(request, service);
         if let Some(accept) = accept_mime {
@@ -305,6 +354,23 @@ impl YarrClient {
         self.finish_with_retry(service, request).await
     }
 
+    /// [`send_get`](Self::send_get) with a streaming field projection.
+    pub async fn send_get_projected(
+        &self,
+        service: &ServiceConfig,
+        url: reqwest::Url,
+        projection: &Projection,
+    ) -> Result<Value> {
+        let http = self.http_for(service).await?;
+        let request = auth::apply_auth(http.get(url), service);
+        self.finish_with_retry_mode(
+            service,
+            request,
+            response::ResponseMode::Projected(projection.clone()),
+        )
+        .await
+    }
+
     /// Send a `application/x-www-form-urlencoded` POST to a pre-built URL.
     ///
     /// qBittorrent's WebUI API (`/api/v2/torrents/{add,start,stop,delete}`)
@@ -319,13 +385,7 @@ impl YarrClient {
         url: reqwest::Url,
         form: &[(&str, &str)],
     ) -> Result<Value> {
-        let http = if service.kind == ServiceKind::Qbittorrent {
-            let session = self.qbit_session(service)?;
-            session.ensure(service).await?;
-            session.client()
-        } else {
-            &self.client
-        };
+        let http = self.http_for(service).await?;
         let mut request = http.post(url).form(form);
         request = auth::apply_auth(request, service);
         self.finish_with_retry(service, request).await
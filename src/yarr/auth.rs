@@ -25,6 +25,8 @@ const QBIT_LOGIN_BODY_LIMIT: usize = 8 * 1024;
 pub struct QbittorrentSession {
     client: Client,
     last_login: Mutex<Option<Instant>>,
+    /// Torrent list synced through `/sync/maindata`; see [`super::qbit_sync`].
+    pub(super) torrents: Mutex<super::qbit_sync::TorrentTable>,
 }
 
 impl QbittorrentSession {
@@ -41,6 +43,7 @@ impl QbittorrentSession {
         Ok(Self {
             client,
             last_login: Mutex::new(None),
+            torrents: Mutex::default(),
         })
     }
 
@@ -0,0 +1,406 @@
+//! Opt-in read cache for upstream GETs.
+//!
+//! Services with `read_cache = true` route cacheable GETs through
+//! [`ReadCache::get_or_fetch`]: a TTL + LRU map bounded by a byte budget, with
+//! single-flight coalescing so concurrent identical reads share one upstream
+//! request. Any non-GET request to the same service drops that service's
+//! entries and bumps its generation, so a read that raced a write is never
+//! stored. Only paths listed in [`CACHE_RULES`] are cached; queues, history,
+//! sessions, and query-command APIs (SABnzbd, Tautulli) always go upstream.
+
+use std::collections::{BTreeMap, HashMap};
+use std::future::Future;
+use std::sync::{Arc, Mutex, PoisonError};
+use std::time::{Duration, Instant};
+
+use anyhow::Result;
+use serde_json::Value;
+use tokio::sync::watch;
+
+use super::UpstreamError;
+use super::response::ResponseMode;
+use crate::config::{ServiceConfig, ServiceKind};
+
+/// Default byte budget when `YARR_READ_CACHE_MAX_BYTES` is unset.
+const DEFAULT_MAX_BYTES: usize = 32 * 1024 * 1024;
+
+/// One cacheable path prefix for a kind. Prefixes match whole path segments
+/// relative to the service `base_url`; the first matching row wins.
+struct CacheRule {
+    kind: ServiceKind,
+    prefix: &'static str,
+    ttl_secs: u64,
+}
+
+static CACHE_RULES: &[CacheRule] = &[
+    rule(ServiceKind::Sonarr, "/api/v3/series", 30),
+    rule(ServiceKind::Sonarr, "/api/v3/episode", 30),
+    rule(ServiceKind::Sonarr, "/api/v3/calendar", 60),
+    rule(ServiceKind::Sonarr, "/api/v3/qualityprofile", 300),
+    rule(ServiceKind::Sonarr, "/api/v3/languageprofile", 300),
+    rule(ServiceKind::Sonarr, "/api/v3/rootfolder", 60),
+    rule(ServiceKind::Sonarr, "/api/v3/tag", 300),
+    rule(ServiceKind::Sonarr, "/api/v3/system/status", 15),
+    rule(ServiceKind::Radarr, "/api/v3/movie", 30),
+    rule(ServiceKind::Radarr, "/api/v3/calendar", 60),
+    rule(ServiceKind::Radarr, "/api/v3/qualityprofile", 300),
+    rule(ServiceKind::Radarr, "/api/v3/rootfolder", 60),
+    rule(ServiceKind::Radarr, "/api/v3/tag", 300),
+    rule(ServiceKind::Radarr, "/api/v3/system/status", 15),
+    rule(ServiceKind::Prowlarr, "/api/v1/indexer", 60),
+    rule(ServiceKind::Prowlarr, "/api/v1/tag", 300),
+    rule(ServiceKind::Prowlarr, "/api/v1/system/status", 15),
+    rule(ServiceKind::Overseerr, "/api/v1/status", 15),
+    rule(ServiceKind::Overseerr, "/api/v1/user", 60),
+    rule(ServiceKind::Bazarr, "/api/system/status", 15),
+    rule(ServiceKind::Tracearr, "/health", 15),
+    rule(ServiceKind::Qbittorrent, "/api/v2/app/version", 300),
+    rule(ServiceKind::Qbittorrent, "/api/v2/app/preferences", 60),
+    rule(ServiceKind::Plex, "/identity", 300),
+    rule(ServiceKind::Plex, "/library/sections", 60),
+    rule(ServiceKind::Plex, "/library/metadata", 30),
+    rule(ServiceKind::Jellyfin, "/System/Info", 15),
+    rule(ServiceKind::Jellyfin, "/Users", 60),
+    rule(ServiceKind::Jellyfin, "/Library/VirtualFolders", 60),
+    rule(ServiceKind::Jellyfin, "/Items", 30),
+];
+
+const fn rule(kind: ServiceKind, prefix: &'static str, ttl_secs: u64) -> CacheRule {
+    CacheRule {
+        kind,
+        prefix,
+        ttl_secs,
+    }
+}
+
+/// TTL for a GET to `url`, or `None` when the path must never be cached.
+pub(super) fn ttl_for(service: &ServiceConfig, url: &reqwest::Url) -> Option<Duration> {
+    let base_path = reqwest::Url::parse(service.base_url.trim_end_matches('/'))
+        .map(|base| base.path().trim_end_matches('/').to_owned())
+        .unwrap_or_default();
+    let path = url.path().strip_prefix(&base_path).unwrap_or(url.path());
+    CACHE_RULES
+        .iter()
+        .filter(|rule| rule.kind == service.kind)
+        .find(|rule| {
+            path.strip_prefix(rule.prefix)
+                .is_some_and(|rest| rest.is_empty() || rest.starts_with('/'))
+        })
+        .map(|rule| Duration::from_secs(rule.ttl_secs))
+}
+
+/// Cache key: service identity, full URL (query included), negotiated
+/// `Accept`, and the decode mode, since one URL can decode differently.
+pub(super) fn cache_key(
+    service: &ServiceConfig,
+    request: &reqwest::Request,
+    mode: &ResponseMode,
+) -> String {
+    let accept = request
+        .headers()
+        .get(reqwest::header::ACCEPT)
+        .and_then(|value| value.to_str().ok())
+        .unwrap_or("");
+    let mode = match mode {
+        ResponseMode::JsonCompatible => String::new(),
+        ResponseMode::Projected(projection) => format!("projected:{}", projection.cache_tag()),
+        ResponseMode::OpenApi {
+            expected_encoding,
+            expected_media_type,
+        } => format!("{expected_encoding:?}:{expected_media_type}"),
+    };
+    format!(
+        "{}\n{}\n{accept}\n{mode}",
+        service.name.trim().to_ascii_lowercase(),
+        request.url()
+    )
+}
+
+/// Byte budget for the shared cache. `YARR_READ_CACHE_MAX_BYTES` overrides
+/// the 32 MiB default; 0 or an unparseable value falls back to the default.
+pub(super) fn max_bytes() -> usize {
+    std::env::var("YARR_READ_CACHE_MAX_BYTES")
+        .ok()
+        .and_then(|raw| raw.trim().parse::<usize>().ok())
+        .filter(|bytes| *bytes > 0)
+        .unwrap_or(DEFAULT_MAX_BYTES)
+}
+
+/// A completed fetch as seen by coalesced followers. Typed upstream errors are
+/// preserved so MCP error classification is identical for every waiter.
+#[derive(Clone)]
+enum Shared {
+    Value(Arc<Value>),
+    Upstream(UpstreamError),
+    Other(Arc<str>),
+}
+
+struct Entry {
+    value: Arc<Value>,
+    bytes: usize,
+    expires_at: Instant,
+    tick: u64,
+    service: String,
+}
+
+#[derive(Default)]
+struct CacheState {
+    entries: HashMap<String, Entry>,
+    /// Recency order: oldest tick first.
+    lru: BTreeMap<u64, String>,
+    tick: u64,
+    bytes: usize,
+    inflight: HashMap<String, watch::Receiver<Option<Shared>>>,
+    generations: HashMap<String, u64>,
+}
+
+enum Role {
+    Hit(Arc<Value>),
+    Follower(watch::Receiver<Option<Shared>>),
+    Leader(watch::Sender<Option<Shared>>, u64),
+}
+
+pub(super) struct ReadCache {
+    max_bytes: usize,
+    state: Mutex<CacheState>,
+}
+
+impl ReadCache {
+    pub(super) fn new(max_bytes: usize) -> Self {
+        Self {
+            max_bytes,
+            state: Mutex::new(CacheState::default()),
+        }
+    }
+
+    fn lock(&self) -> std::sync::MutexGuard<'_, CacheState> {
+        self.state.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    /// Serve `key` from cache, join an in-flight fetch for it, or run `fetch`
+    /// as the single leader and store a successful result for `ttl`.
+    pub(super) async fn get_or_fetch<F, Fut>(
+        &self,
+        service: &ServiceConfig,
+        key: String,
+        ttl: Duration,
+        fetch: F,
+    ) -> Result<Value>
+    where
+        F: FnOnce() -> Fut,
+        Fut: Future<Output = Result<Value>>,
+    {
+        let role = {
+            let mut state = self.lock();
+            if let Some(value) = state.lookup(&key, Instant::now()) {
+                Role::Hit(value)
+            } else if let Some(receiver) = state.inflight.get(&key) {
+                Role::Follower(receiver.clone())
+            } else {
+                let (sender, receiver) = watch::channel(None);
+                state.inflight.insert(key.clone(), receiver);
+                let generation = state.generation(&service.name);
+                Role::Leader(sender, generation)
+            }
+        };
+        match role {
+            Role::Hit(value) => {
+                record_cache(service, "hit");
+                Ok(Value::clone(&value))
+            }
+            Role::Follower(mut receiver) => {
+                record_cache(service, "coalesced");
+                let shared = receiver
+                    .wait_for(Option::is_some)
+                    .await
+                    .map(|done| done.clone());
+                match shared {
+                    Ok(Some(Shared::Value(value))) => Ok(Value::clone(&value)),
+                    Ok(Some(Shared::Upstream(error))) => Err(error.into()),
+                    Ok(Some(Shared::Other(message))) => Err(anyhow::anyhow!("{message}")),
+                    // The leader was cancelled before finishing; fetch directly
+                    // rather than failing a request that never reached upstream.
+                    Ok(None) | Err(_) => fetch().await,
+                }
+            }
+            Role::Leader(sender, generation) => {
+                record_cache(service, "miss");
+                let guard = InflightGuard {
+                    cache: self,
+                    key: &key,
+                };
+                let result = fetch().await;
+                let shared = match &result {
+                    Ok(value) => Shared::Value(Arc::new(value.clone())),
+                    Err(error) => match error.downcast_ref::<UpstreamError>() {
+                        Some(upstream) => Shared::Upstream(upstream.clone()),
+                        None => Shared::Other(Arc::from(format!("{error:#}"))),
+                    },
+                };
+                if let Shared::Value(value) = &shared {
+                    let evicted = self.store(service, &key, Arc::clone(value), ttl, generation);
+                    record_cache_n(service, "evicted", evicted);
+                }
+                drop(guard);
+                let _ = sender.send(Some(shared));
+                result
+            }
+        }
+    }
+
+    /// Drop every entry for `service` and bump its generation so reads that
+    /// started before this call are not stored afterwards.
+    pub(super) fn invalidate(&self, service: &ServiceConfig) {
+        let name = service.name.trim().to_ascii_lowercase();
+        let dropped = {
+            let mut state = self.lock();
+            *state.generations.entry(name.clone()).or_default() += 1;
+            let keys: Vec<String> = state
+                .entries
+                .iter()
+                .filter(|(_, entry)| entry.service == name)
+                .map(|(key, _)| key.clone())
+                .collect();
+            for key in &keys {
+                state.remove(key);
+            }
+            keys.len()
+        };
+        record_cache_n(service, "invalidated", dropped);
+    }
+
+    /// Insert a fresh value, evicting least-recently-used entries until it
+    /// fits. Returns the number of evictions. Values larger than the whole
+    /// budget, or reads overtaken by an invalidation, are not stored.
+    fn store(
+        &self,
+        service: &ServiceConfig,
+        key: &str,
+        value: Arc<Value>,
+        ttl: Duration,
+        generation: u64,
+    ) -> usize {
+        let bytes = encoded_len(&value);
+        if bytes > self.max_bytes {
+            return 0;
+        }
+        let mut state = self.lock();
+        if state.generation(&service.name) != generation {
+            return 0;
+        }
+        state.remove(key);
+        let mut evicted = 0;
+        while state.bytes + bytes > self.max_bytes {
+            let Some((_, oldest)) = state.lru.pop_first() else {
+                break;
+            };
+            state.remove(&oldest);
+            evicted += 1;
+        }
+        state.tick += 1;
+        let tick = state.tick;
+        state.lru.insert(tick, key.to_owned());
+        state.bytes += bytes;
+        state.entries.insert(
+            key.to_owned(),
+            Entry {
+                value,
+                bytes,
+                expires_at: Instant::now() + ttl,
+                tick,
+                service: service.name.trim().to_ascii_lowercase(),
+            },
+        );
+        evicted
+    }
+
+    #[cfg(test)]
+    pub(super) fn stored_bytes(&self) -> usize {
+        self.lock().bytes
+    }
+}
+
+impl CacheState {
+    fn generation(&self, service: &str) -> u64 {
+        self.generations
+            .get(&service.trim().to_ascii_lowercase())
+            .copied()
+            .unwrap_or(0)
+    }
+
+    /// Return a live entry and mark it most recently used; expired entries are
+    /// removed on the way.
+    fn lookup(&mut self, key: &str, now: Instant) -> Option<Arc<Value>> {
+        let expired = self.entries.get(key)?.expires_at <= now;
+        if expired {
+            self.remove(key);
+            return None;
+        }
+        self.tick += 1;
+        let tick = self.tick;
+        let entry = self.entries.get_mut(key)?;
+        let previous = std::mem::replace(&mut entry.tick, tick);
+        let value = Arc::clone(&entry.value);
+        self.lru.remove(&previous);
+        self.lru.insert(tick, key.to_owned());
+        Some(value)
+    }
+
+    fn remove(&mut self, key: &str) {
+        if let Some(entry) = self.entries.remove(key) {
+            self.lru.remove(&entry.tick);
+            self.bytes -= entry.bytes;
+        }
+    }
+}
+
+/// Clears the in-flight slot even if the leader future is dropped mid-fetch;
+/// waiting followers then observe the closed channel and fetch themselves.
+struct InflightGuard<'a> {
+    cache: &'a ReadCache,
+    key: &'a str,
+}
+
+impl Drop for InflightGuard<'_> {
+    fn drop(&mut self) {
+        self.cache.lock().inflight.remove(self.key);
+    }
+}
+
+/// Serialized size of a decoded value, counted without allocating a buffer.
+pub(super) fn encoded_len(value: &Value) -> usize {
+    struct Counter(usize);
+    impl std::io::Write for Counter {
+        fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
+            self.0 += buf.len();
+            Ok(buf.len())
+        }
+        fn flush(&mut self) -> std::io::Result<()> {
+            Ok(())
+        }
+    }
+    let mut counter = Counter(0);
+    let _ = serde_json::to_writer(&mut counter, value);
+    counter.0
+}
+
+fn record_cache(service: &ServiceConfig, outcome: &'static str) {
+    record_cache_n(service, outcome, 1);
+}
+
+fn record_cache_n(service: &ServiceConfig, outcome: &'static str, count: usize) {
+    if count == 0 {
+        return;
+    }
+    axum_prometheus::metrics::counter!(
+        "yarr_upstream_cache_total",
+        "service" => service.name.clone(),
+        "kind" => service.kind.as_str(),
+        "outcome" => outcome
+    )
+    .increment(count as u64);
+}
+
+#[cfg(test)]
+#[path = "cache_tests.rs"]
+mod tests;
@@ -0,0 +1,154 @@
+use std::sync::Arc;
+use std::sync::atomic::{AtomicUsize, Ordering};
+
+use serde_json::json;
+
+use super::*;
+use crate::config::YarrConfig;
+use crate::yarr::YarrClient;
+
+fn svc(kind: ServiceKind, base_url: &str) -> ServiceConfig {
+    ServiceConfig {
+        name: kind.as_str().into(),
+        kind,
+        base_url: base_url.into(),
+        read_cache: true,
+        ..ServiceConfig::default()
+    }
+}
+
+fn url(raw: &str) -> reqwest::Url {
+    reqwest::Url::parse(raw).unwrap()
+}
+
+#[test]
+fn ttl_rules_match_whole_segments_relative_to_base_url() {
+    let sonarr = svc(ServiceKind::Sonarr, "http://host/sonarr/");
+    assert_eq!(
+        ttl_for(&sonarr, &url("http://host/sonarr/api/v3/series")),
+        Some(Duration::from_secs(30))
+    );
+    assert!(ttl_for(&sonarr, &url("http://host/sonarr/api/v3/series/12")).is_some());
+    assert!(ttl_for(&sonarr, &url("http://host/sonarr/api/v3/seriesfile")).is_none());
+    assert!(ttl_for(&sonarr, &url("http://host/sonarr/api/v3/queue")).is_none());
+    assert!(ttl_for(&sonarr, &url("http://host/sonarr/api/v3/movie")).is_none());
+}
+
+#[test]
+fn query_command_services_are_never_cached() {
+    let sab = svc(ServiceKind::Sabnzbd, "http://host:8080");
+    assert!(ttl_for(&sab, &url("http://host:8080/api?mode=version")).is_none());
+    let tautulli = svc(ServiceKind::Tautulli, "http://host:8181");
+    assert!(
+        ttl_for(
+            &tautulli,
+            &url("http://host:8181/api/v2?cmd=get_server_info")
+        )
+        .is_none()
+    );
+}
+
+#[tokio::test]
+async fn lru_eviction_keeps_the_store_within_budget() {
+    let service = svc(ServiceKind::Sonarr, "http://host");
+    let value = json!({"payload": "x".repeat(100)});
+    let entry_bytes = encoded_len(&value);
+    let cache = ReadCache::new(entry_bytes * 2);
+    for key in ["a", "b", "a", "c"] {
+        let value = value.clone();
+        cache
+            .get_or_fetch(
+                &service,
+                key.into(),
+                Duration::from_secs(60),
+                || async move { Ok(value) },
+            )
+            .await
+            .unwrap();
+    }
+    assert_eq!(cache.stored_bytes(), entry_bytes * 2);
+    // `a` was touched after `b`, so `b` is the one evicted for `c`.
+    let fetched = AtomicUsize::new(0);
+    let fetched_ref = &fetched;
+    for key in ["a", "c", "b"] {
+        cache
+            .get_or_fetch(
+                &service,
+                key.into(),
+                Duration::from_secs(60),
+                || async move {
+                    fetched_ref.fetch_add(1, Ordering::SeqCst);
+                    Ok(json!(null))
+                },
+            )
+            .await
+            .unwrap();
+    }
+    assert_eq!(fetched.load(Ordering::SeqCst), 1);
+}
+
+async fn counting_upstream() -> (String, Arc<AtomicUsize>) {
+    let hits = Arc::new(AtomicUsize::new(0));
+    let counter = Arc::clone(&hits);
+    let app = axum::Router::new().route(
+        "/api/v3/series",
+        axum::routing::get(move || {
+            let counter = Arc::clone(&counter);
+            async move {
+                counter.fetch_add(1, Ordering::SeqCst);
+                tokio::time::sleep(std::time::Duration::from_millis(50)).await;
+                axum::Json(json!([{"id": 1}]))
+            }
+        })
+        .post(|| async { axum::Json(json!({"id": 2})) }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    (format!("http://{address}"), hits)
+}
+
+#[tokio::test]
+async fn concurrent_identical_gets_share_one_upstream_request() {
+    let (base_url, hits) = counting_upstream().await;
+    let service = svc(ServiceKind::Sonarr, &base_url);
+    let client = YarrClient::new(&YarrConfig {
+        services: vec![service.clone()],
+    })
+    .unwrap();
+
+    let (first, second) = tokio::join!(
+        client.get_json(&service, "/api/v3/series"),
+        client.get_json(&service, "/api/v3/series"),
+    );
+    assert_eq!(first.unwrap(), second.unwrap());
+    client.get_json(&service, "/api/v3/series").await.unwrap();
+    assert_eq!(hits.load(Ordering::SeqCst), 1);
+}
+
+#[tokio::test]
+async fn writes_invalidate_the_service_and_opt_out_bypasses() {
+    let (base_url, hits) = counting_upstream().await;
+    let service = svc(ServiceKind::Sonarr, &base_url);
+    let uncached = ServiceConfig {
+        name: "sonarr-direct".into(),
+        read_cache: false,
+        ..service.clone()
+    };
+    let client = YarrClient::new(&YarrConfig {
+        services: vec![service.clone(), uncached.clone()],
+    })
+    .unwrap();
+
+    client.get_json(&service, "/api/v3/series").await.unwrap();
+    client
+        .post_json(&service, "/api/v3/series", json!({}))
+        .await
+        .unwrap();
+    client.get_json(&service, "/api/v3/series").await.unwrap();
+    assert_eq!(hits.load(Ordering::SeqCst), 2);
+
+    client.get_json(&uncached, "/api/v3/series").await.unwrap();
+    client.get_json(&uncached, "/api/v3/series").await.unwrap();
+    assert_eq!(hits.load(Ordering::SeqCst), 4);
+}
@@ -0,0 +1,81 @@
+//! Conditional GETs for pollers.
+//!
+//! A poller that re-reads the same listing keeps the `ETag`/`Last-Modified`
+//! validators of its last response and sends them back as `If-None-Match`/
+//! `If-Modified-Since`. An upstream that honours them answers `304 Not
+//! Modified` without a body; one that ignores them answers as usual, so
+//! callers must still cope with an unchanged body. Conditional reads bypass
+//! the read cache: a poller wants the upstream's answer, not a cached one.
+
+use anyhow::Result;
+use reqwest::header::{ETAG, HeaderMap, IF_MODIFIED_SINCE, IF_NONE_MATCH, LAST_MODIFIED};
+use serde_json::Value;
+
+use super::{YarrClient, auth, exchange};
+use crate::config::ServiceConfig;
+
+/// Validators from the last successful response; empty until one arrives or
+/// when the upstream sends none.
+#[derive(Debug, Clone, Default, PartialEq, Eq)]
+pub struct Validators {
+    etag: Option<String>,
+    last_modified: Option<String>,
+}
+
+impl Validators {
+    pub(super) fn of(headers: &HeaderMap) -> Self {
+        let get = |name| {
+            headers
+                .get(name)
+                .and_then(|value| value.to_str().ok())
+                .map(str::to_owned)
+        };
+        Self {
+            etag: get(ETAG),
+            last_modified: get(LAST_MODIFIED),
+        }
+    }
+}
+
+/// The answer to a conditional GET.
+#[derive(Debug)]
+pub enum Conditional {
+    /// `304`: nothing changed since the validators were issued.
+    NotModified,
+    Modified {
+        value: Value,
+        validators: Validators,
+    },
+}
+
+impl YarrClient {
+    /// GET `url`, sending `validators` as `If-None-Match`/`If-Modified-Since`.
+    /// Goes through the service's limiter like every other request.
+    pub async fn send_get_if_modified(
+        &self,
+        service: &ServiceConfig,
+        url: reqwest::Url,
+        validators: &Validators,
+        accept_mime: Option<&str>,
+    ) -> Result<Conditional> {
+        let http = self.http_for(service).await?;
+        let mut request = auth::apply_auth(http.get(url), service);
+        if let Some(accept) = accept_mime {
+            request = request.header(reqwest::header::ACCEPT, accept);
+        }
+        if let Some(etag) = &validators.etag {
+            request = request.header(IF_NONE_MATCH, etag);
+        }
+        if let Some(last_modified) = &validators.last_modified {
+            request = request.header(IF_MODIFIED_SINCE, last_modified);
+        }
+        exchange::send_through_gate(service, self, request, |http, request, _| async move {
+            exchange::exchange_conditional(service, &http, request).await
+        })
+        .await
+    }
+}
+
+#[cfg(test)]
+#[path = "conditional_tests.rs"]
+mod tests;
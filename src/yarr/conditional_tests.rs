@@ -0,0 +1,72 @@
+use std::sync::{Arc, Mutex};
+
+use axum::http::{HeaderMap, StatusCode, header};
+use axum::response::IntoResponse;
+use serde_json::json;
+
+use super::{Conditional, Validators};
+use crate::config::{ServiceConfig, ServiceKind, YarrConfig};
+use crate::yarr::{YarrClient, build_url};
+
+/// A Sonarr-shaped upstream serving `/api/v3/queue` with an `ETag`, answering
+/// 304 when it is sent back. Records the `If-None-Match` of every request.
+async fn upstream(seen: Arc<Mutex<Vec<Option<String>>>>) -> ServiceConfig {
+    let app = axum::Router::new().route(
+        "/api/v3/queue",
+        axum::routing::get(move |headers: HeaderMap| {
+            let seen = seen.clone();
+            async move {
+                let tag = headers
+                    .get(header::IF_NONE_MATCH)
+                    .and_then(|value| value.to_str().ok())
+                    .map(str::to_owned);
+                seen.lock().unwrap().push(tag.clone());
+                if tag.as_deref() == Some("\"v1\"") {
+                    return StatusCode::NOT_MODIFIED.into_response();
+                }
+                (
+                    [(header::ETAG, "\"v1\"")],
+                    axum::Json(json!({"records": [{"id": 1}]})),
+                )
+                    .into_response()
+            }
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    ServiceConfig {
+        name: "sonarr".into(),
+        kind: ServiceKind::Sonarr,
+        base_url: format!("http://{address}"),
+        api_key: Some("secret".into()),
+        ..ServiceConfig::default()
+    }
+}
+
+#[tokio::test]
+async fn validators_are_sent_back_and_a_304_carries_no_body() {
+    let seen = Arc::new(Mutex::new(Vec::new()));
+    let service = upstream(seen.clone()).await;
+    let client = YarrClient::new(&YarrConfig {
+        services: vec![service.clone()],
+    })
+    .unwrap();
+    let url = || build_url(&service, "/api/v3/queue").unwrap();
+
+    let first = client
+        .send_get_if_modified(&service, url(), &Validators::default(), None)
+        .await
+        .unwrap();
+    let Conditional::Modified { value, validators } = first else {
+        panic!("the first read has no validators to send");
+    };
+    assert_eq!(value["records"][0]["id"], 1);
+
+    let second = client
+        .send_get_if_modified(&service, url(), &validators, None)
+        .await
+        .unwrap();
+    assert!(matches!(second, Conditional::NotModified));
+    assert_eq!(*seen.lock().unwrap(), [None, Some("\"v1\"".to_owned())]);
+}
@@ -0,0 +1,176 @@
+//! Negotiated compression for upstream response bodies.
+//!
+//! Every request `finish` sends asks for [`ACCEPT_ENCODING`], and [`Body`]
+//! undoes whichever of those encodings the upstream picked while the body
+//! streams in. Readers only ever see decoded chunks, so the response caps apply
+//! to decoded bytes. A small compressed body that inflates past a cap fails as
+//! oversized one bounded chunk later; it is never inflated whole.
+//!
+//! Wire and decoded byte totals are exported per service as
+//! `yarr_upstream_body_bytes_total`.
+
+use std::io;
+use std::pin::Pin;
+use std::sync::Arc;
+use std::sync::atomic::{AtomicU64, Ordering};
+
+use anyhow::Result;
+use async_compression::tokio::bufread::{GzipDecoder, ZlibDecoder};
+use bytes::{Bytes, BytesMut};
+use futures_util::stream;
+use tokio::io::{AsyncBufRead, AsyncRead, AsyncReadExt};
+use tokio_util::io::StreamReader;
+
+use crate::config::ServiceConfig;
+
+/// `Accept-Encoding` sent upstream: exactly the encodings [`Body`] decodes.
+pub(super) const ACCEPT_ENCODING: &str = "gzip, deflate";
+
+/// Most decoded bytes produced per [`Body::chunk`] call. Inflation happens in
+/// steps of this size, so a cap check runs between every step.
+const DECODED_CHUNK_BYTES: usize = 64 * 1024;
+
+/// A response body read chunk by chunk, decoded according to its
+/// `Content-Encoding`. Records its byte totals when dropped, so bodies
+/// abandoned early (oversized, parse error) are still counted.
+pub(super) struct Body {
+    source: Source,
+    encoding: &'static str,
+    size_hint: usize,
+    wire: Arc<AtomicU64>,
+    decoded: u64,
+    service: String,
+    kind: &'static str,
+}
+
+enum Source {
+    Identity(reqwest::Response),
+    Decoded(Pin<Box<dyn AsyncRead + Send>>),
+}
+
+impl Body {
+    pub(super) fn new(service: &ServiceConfig, response: reqwest::Response) -> Self {
+        let wire = Arc::new(AtomicU64::new(0));
+        let content_length = response.content_length().unwrap_or(0);
+        let content_encoding = response
+            .headers()
+            .get(reqwest::header::CONTENT_ENCODING)
+            .and_then(|value| value.to_str().ok())
+            .map(|value| value.trim().to_ascii_lowercase());
+        let (encoding, source) = match content_encoding.as_deref() {
+            Some("gzip" | "x-gzip") => (
+                "gzip",
+                Source::Decoded(Box::pin(GzipDecoder::new(raw(response, &wire)))),
+            ),
+            // HTTP `deflate` is the zlib format, not raw DEFLATE.
+            Some("deflate") => (
+                "deflate",
+                Source::Decoded(Box::pin(ZlibDecoder::new(raw(response, &wire)))),
+            ),
+            // Identity, or an encoding that was never offered: passed through
+            // untouched, as before negotiation existed.
+            _ => ("identity", Source::Identity(response)),
+        };
+        // A declared length is only the decoded size when nothing is decoded.
+        let size_hint = match &source {
+            Source::Identity(_) => usize::try_from(content_length).unwrap_or(usize::MAX),
+            Source::Decoded(_) => 0,
+        };
+        Self {
+            source,
+            encoding,
+            size_hint,
+            wire,
+            decoded: 0,
+            service: service.name.clone(),
+            kind: service.kind.as_str(),
+        }
+    }
+
+    /// Expected decoded size in bytes, for preallocation; `0` when unknown.
+    pub(super) fn size_hint(&self) -> usize {
+        self.size_hint
+    }
+
+    /// The next decoded chunk, or `None` at the end of the body.
+    pub(super) async fn chunk(&mut self) -> Result<Option<Bytes>> {
+        let chunk = match &mut self.source {
+            Source::Identity(response) => {
+                let chunk = response.chunk().await?;
+                if let Some(chunk) = &chunk {
+                    self.wire.fetch_add(chunk.len() as u64, Ordering::Relaxed);
+                }
+                chunk
+            }
+            Source::Decoded(reader) => {
+                let mut buf = BytesMut::with_capacity(DECODED_CHUNK_BYTES);
+                match reader.read_buf(&mut buf).await.map_err(body_error)? {
+                    0 => None,
+                    _ => Some(buf.freeze()),
+                }
+            }
+        };
+        if let Some(chunk) = &chunk {
+            self.decoded += chunk.len() as u64;
+        }
+        Ok(chunk)
+    }
+}
+
+impl Drop for Body {
+    fn drop(&mut self) {
+        let wire = self.wire.load(Ordering::Relaxed);
+        for (stage, bytes) in [("wire", wire), ("decoded", self.decoded)] {
+            axum_prometheus::metrics::counter!(
+                "yarr_upstream_body_bytes_total",
+                "service" => self.service.clone(),
+                "kind" => self.kind,
+                "encoding" => self.encoding,
+                "stage" => stage
+            )
+            .increment(bytes);
+        }
+    }
+}
+
+/// The raw (still encoded) body as a buffered reader for a decoder, counting
+/// every byte received into `wire`.
+fn raw(response: reqwest::Response, wire: &Arc<AtomicU64>) -> impl AsyncBufRead + Send + 'static {
+    let wire = Arc::clone(wire);
+    StreamReader::new(stream::unfold(response, move |mut response| {
+        let wire = Arc::clone(&wire);
+        async move {
+            match response.chunk().await {
+                Ok(Some(chunk)) => {
+                    wire.fetch_add(chunk.len() as u64, Ordering::Relaxed);
+                    Some((Ok::<_, io::Error>(chunk), response))
+                }
+                Ok(None) => None,
+                Err(error) => Some((Err(io::Error::other(error)), response)),
+            }
+        }
+    }))
+}
+
+/// Unwrap a transport failure the decoder passed through back into the
+/// `reqwest::Error` it was, so the limiter still counts it as an upstream
+/// failure. Corrupt compressed data stays an I/O error.
+fn body_error(error: io::Error) -> anyhow::Error {
+    if !error
+        .get_ref()
+        .is_some_and(|inner| inner.is::<reqwest::Error>())
+    {
+        return error.into();
+    }
+    match error
+        .into_inner()
+        .map(|inner| inner.downcast::<reqwest::Error>())
+    {
+        Some(Ok(transport)) => (*transport).into(),
+        _ => anyhow::anyhow!("upstream body read failed"),
+    }
+}
+
+#[cfg(test)]
+#[path = "encoding_tests.rs"]
+mod tests;
@@ -0,0 +1,121 @@
+use std::sync::{Arc, Mutex};
+
+use async_compression::tokio::bufread::{GzipEncoder, ZlibEncoder};
+use axum::http::HeaderMap;
+use serde_json::{Value, json};
+use tokio::io::AsyncReadExt;
+
+use super::{ACCEPT_ENCODING, body_error};
+use crate::config::{ServiceConfig, ServiceKind, YarrConfig};
+use crate::yarr::{MAX_UPSTREAM_RESPONSE_BYTES, UpstreamError, YarrClient};
+
+async fn gzip(body: &[u8]) -> Vec<u8> {
+    let mut out = Vec::new();
+    GzipEncoder::new(body).read_to_end(&mut out).await.unwrap();
+    out
+}
+
+async fn zlib(body: &[u8]) -> Vec<u8> {
+    let mut out = Vec::new();
+    ZlibEncoder::new(body).read_to_end(&mut out).await.unwrap();
+    out
+}
+
+/// A Sonarr-shaped upstream answering `/api/v3/series` with `body` sent as
+/// `Content-Encoding: encoding`. Returns the service and the `Accept-Encoding`
+/// of the last request it saw.
+async fn upstream(
+    encoding: &'static str,
+    body: Vec<u8>,
+) -> (ServiceConfig, Arc<Mutex<Option<String>>>) {
+    let accepted = Arc::new(Mutex::new(None));
+    let seen = accepted.clone();
+    let app = axum::Router::new().route(
+        "/api/v3/series",
+        axum::routing::get(move |headers: HeaderMap| {
+            let body = body.clone();
+            let seen = seen.clone();
+            async move {
+                *seen.lock().unwrap() = headers
+                    .get(axum::http::header::ACCEPT_ENCODING)
+                    .and_then(|value| value.to_str().ok())
+                    .map(str::to_owned);
+                (
+                    [
+                        (axum::http::header::CONTENT_TYPE, "application/json"),
+                        (axum::http::header::CONTENT_ENCODING, encoding),
+                    ],
+                    body,
+                )
+            }
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    let service = ServiceConfig {
+        name: "sonarr".into(),
+        kind: ServiceKind::Sonarr,
+        base_url: format!("http://{address}"),
+        api_key: Some("secret".into()),
+        ..ServiceConfig::default()
+    };
+    (service, accepted)
+}
+
+async fn get(service: &ServiceConfig) -> anyhow::Result<Value> {
+    let client = YarrClient::new(&YarrConfig {
+        services: vec![service.clone()],
+    })
+    .unwrap();
+    client.get_json(service, "/api/v3/series").await
+}
+
+#[tokio::test]
+async fn negotiated_encodings_are_decoded() {
+    let rows = json!([{"id": 1, "title": "Series"}, {"id": 2, "title": "Other"}]);
+    let plain = serde_json::to_vec(&rows).unwrap();
+
+    let (service, accepted) = upstream("gzip", gzip(&plain).await).await;
+    assert_eq!(get(&service).await.unwrap(), rows);
+    assert_eq!(accepted.lock().unwrap().as_deref(), Some(ACCEPT_ENCODING));
+
+    let (service, _) = upstream("deflate", zlib(&plain).await).await;
+    assert_eq!(get(&service).await.unwrap(), rows);
+
+    let (service, _) = upstream("identity", plain).await;
+    assert_eq!(get(&service).await.unwrap(), rows);
+}
+
+#[tokio::test]
+async fn the_size_cap_applies_to_decoded_bytes() {
+    // Tens of KiB on the wire, one byte over the cap once inflated.
+    let bomb = gzip(&vec![b' '; MAX_UPSTREAM_RESPONSE_BYTES + 1]).await;
+    assert!(bomb.len() < MAX_UPSTREAM_RESPONSE_BYTES / 100);
+    let (service, _) = upstream("gzip", bomb).await;
+
+    let error = get(&service).await.unwrap_err();
+
+    assert!(matches!(
+        error.downcast_ref::<UpstreamError>(),
+        Some(UpstreamError::ResponseTooLarge { .. })
+    ));
+}
+
+#[tokio::test]
+async fn corrupt_compressed_bodies_fail_the_read() {
+    let (service, _) = upstream("gzip", b"not gzip at all".to_vec()).await;
+
+    let error = get(&service).await.unwrap_err();
+
+    assert!(
+        format!("{error:#}").contains("response body read failed"),
+        "{error:#}"
+    );
+}
+
+#[test]
+fn decoder_errors_stay_io_errors() {
+    let error = body_error(std::io::Error::other("invalid gzip header"));
+    assert!(error.downcast_ref::<std::io::Error>().is_some());
+}
@@ -0,0 +1,240 @@
+//! The admission and exchange path shared by every upstream request: build
+//! the request, pass it through the service's [limiter](super::limiter) gate,
+//! send it, and collect the response body under the size caps before handing
+//! it to [`response`](super::response) for decoding.
+
+use std::future::Future;
+
+use anyhow::{Context, Result};
+use reqwest::StatusCode;
+use serde_json::Value;
+use tracing::Instrument;
+
+use super::conditional::{Conditional, Validators};
+use super::encoding::{self, Body};
+use super::phases::{PhaseClock, method_label};
+use super::projection::{self, MAX_PROJECTED_RESPONSE_BYTES};
+use super::response::{ResponseMode, decode_success, record_outcome, too_large};
+use super::{MAX_UPSTREAM_RESPONSE_BYTES, UpstreamError, YarrClient, helpers, limiter};
+use crate::config::ServiceConfig;
+
+/// Build `request` and send it through `client`'s limiter for `service`,
+/// offering compressed encodings, inside an `upstream.request` span. `send`
+/// performs the exchange given the built request and its method label.
+pub(super) async fn send_through_gate<T, F, Fut>(
+    service: &ServiceConfig,
+    client: &YarrClient,
+    request: reqwest::RequestBuilder,
+    send: F,
+) -> Result<T>
+where
+    F: FnOnce(reqwest::Client, reqwest::Request, &'static str) -> Fut,
+    Fut: Future<Output = Result<T>>,
+{
+    let (http, request) = request.build_split();
+    let mut request = match request {
+        Ok(request) => request,
+        Err(error) => {
+            record_outcome(service, "transport_error");
+            return Err(error).with_context(|| format!("{} request failed", service.name));
+        }
+    };
+    request
+        .headers_mut()
+        .entry(reqwest::header::ACCEPT_ENCODING)
+        .or_insert(reqwest::header::HeaderValue::from_static(
+            encoding::ACCEPT_ENCODING,
+        ));
+    let method = method_label(request.method());
+    let route = limiter::route(request.method(), request.url());
+    let span = tracing::debug_span!(
+        "upstream.request",
+        service = %service.name,
+        kind = service.kind.as_str(),
+        method,
+        status = tracing::field::Empty,
+    );
+    async {
+        let permit = client.limiter.acquire(service, route).await?;
+        let result = send(http, request, method).await;
+        permit.complete(&result);
+        result
+    }
+    .instrument(span)
+    .await
+}
+
+/// Send `request` and decode the response, timing each phase into
+/// `yarr_upstream_phase_seconds`: `headers` (send until the status line and
+/// headers arrive), `body` (reading the body; for projected responses this
+/// includes the streaming decode), and `decode`.
+pub(super) async fn exchange(
+    service: &ServiceConfig,
+    client: &reqwest::Client,
+    request: reqwest::Request,
+    method: &'static str,
+    mode: ResponseMode,
+) -> Result<Value> {
+    let mut phases = PhaseClock::start(service, method);
+    let sent = client
+        .execute(request)
+        .instrument(tracing::debug_span!("upstream.headers"))
+        .await;
+    phases.lap("headers");
+    let response = match sent {
+        Ok(response) => response,
+        Err(error) => {
+            record_outcome(service, "transport_error");
+            return Err(error).with_context(|| format!("{} request failed", service.name));
+        }
+    };
+    collect(service, response, mode, phases).await
+}
+
+/// [`exchange`] for a GET carrying [`Validators`]: a `304 Not Modified` ends
+/// the exchange without a body; anything else is collected as usual, along
+/// with the validators to send next time.
+pub(super) async fn exchange_conditional(
+    service: &ServiceConfig,
+    client: &reqwest::Client,
+    request: reqwest::Request,
+) -> Result<Conditional> {
+    let mut phases = PhaseClock::start(service, "GET");
+    let sent = client
+        .execute(request)
+        .instrument(tracing::debug_span!("upstream.headers"))
+        .await;
+    phases.lap("headers");
+    let response = match sent {
+        Ok(response) => response,
+        Err(error) => {
+            record_outcome(service, "transport_error");
+            return Err(error).with_context(|| format!("{} request failed", service.name));
+        }
+    };
+    if response.status() == StatusCode::NOT_MODIFIED {
+        tracing::Span::current().record("status", StatusCode::NOT_MODIFIED.as_u16());
+        record_outcome(service, "not_modified");
+        return Ok(Conditional::NotModified);
+    }
+    let validators = Validators::of(response.headers());
+    let value = collect(service, response, ResponseMode::JsonCompatible, phases).await?;
+    Ok(Conditional::Modified { value, validators })
+}
+
+/// Read and decode a response whose headers have arrived.
+async fn collect(
+    service: &ServiceConfig,
+    response: reqwest::Response,
+    mode: ResponseMode,
+    mut phases: PhaseClock<'_>,
+) -> Result<Value> {
+    let status = response.status();
+    tracing::Span::current().record("status", status.as_u16());
+    let content_type = header(&response, reqwest::header::CONTENT_TYPE);
+    let location = header(&response, reqwest::header::LOCATION)
+        .as_deref()
+        .map(helpers::body_preview);
+    let content_disposition = header(&response, reqwest::header::CONTENT_DISPOSITION);
+    let streamed = match &mode {
+        ResponseMode::Projected(projection)
+            if status.is_success() && is_json(content_type.as_deref()) =>
+        {
+            Some(projection.clone())
+        }
+        _ => None,
+    };
+    let limit = if streamed.is_some() {
+        MAX_PROJECTED_RESPONSE_BYTES
+    } else {
+        MAX_UPSTREAM_RESPONSE_BYTES
+    };
+    if let Some(content_length) = response.content_length()
+        && content_length > limit as u64
+    {
+        record_outcome(service, "oversized");
+        return Err(too_large(service, content_length, limit));
+    }
+    if let Some(projection) = streamed {
+        if let Some(content_length) = response.content_length() {
+            phases.size(content_length as usize);
+        }
+        let body = Body::new(service, response);
+        let result = projection::finish(
+            service,
+            status,
+            content_type,
+            content_disposition,
+            body,
+            projection,
+        )
+        .instrument(tracing::debug_span!("upstream.body"))
+        .await;
+        phases.lap("body");
+        return result;
+    }
+    let bytes = read_body(service, Body::new(service, response))
+        .instrument(tracing::debug_span!("upstream.body"))
+        .await;
+    phases.lap("body");
+    let bytes = bytes?;
+    phases.size(bytes.len());
+    if !status.is_success() {
+        record_outcome(service, "http_error");
+        let text = std::str::from_utf8(&bytes).unwrap_or("<non-utf8 body>");
+        return Err(UpstreamError::Http {
+            service: service.name.clone(),
+            status,
+            body_preview: helpers::body_preview(text),
+            location,
+        }
+        .into());
+    }
+    record_outcome(service, "success");
+    let decoded = tracing::debug_span!("upstream.decode").in_scope(|| {
+        decode_success(
+            service,
+            status,
+            content_type,
+            content_disposition,
+            bytes,
+            mode,
+        )
+    });
+    phases.lap("decode");
+    decoded
+}
+
+/// Buffer the whole decoded body, failing as oversized once it passes
+/// [`MAX_UPSTREAM_RESPONSE_BYTES`].
+async fn read_body(service: &ServiceConfig, mut body: Body) -> Result<Vec<u8>> {
+    let mut bytes = Vec::with_capacity(body.size_hint().min(MAX_UPSTREAM_RESPONSE_BYTES));
+    while let Some(chunk) = body
+        .chunk()
+        .await
+        .with_context(|| format!("{} response body read failed", service.name))?
+    {
+        if bytes.len().saturating_add(chunk.len()) > MAX_UPSTREAM_RESPONSE_BYTES {
+            record_outcome(service, "oversized");
+            return Err(too_large(
+                service,
+                bytes.len().saturating_add(chunk.len()) as u64,
+                MAX_UPSTREAM_RESPONSE_BYTES,
+            ));
+        }
+        bytes.extend_from_slice(&chunk);
+    }
+    Ok(bytes)
+}
+
+fn header(response: &reqwest::Response, name: reqwest::header::HeaderName) -> Option<String> {
+    response
+        .headers()
+        .get(name)
+        .and_then(|value| value.to_str().ok())
+        .map(str::to_owned)
+}
+
+fn is_json(content_type: Option<&str>) -> bool {
+    content_type.is_some_and(|value| value.to_ascii_lowercase().contains("json"))
+}
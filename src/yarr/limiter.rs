@@ -0,0 +1,363 @@
+//! Per-service admission control for upstream requests.
+//!
+//! Every request a service sends first takes a slot from that service's
+//! [`Gate`]:
+//!
+//! * **Adaptive concurrency (AIMD).** The number of slots starts at the
+//!   service's `max_concurrency`. A success that ran at the limit adds
+//!   `1/limit`, so the limit grows by about one per round of requests. A
+//!   failure, or a success slower than [`LATENCY_TOLERANCE`] × the baseline
+//!   latency of its route, multiplies it by [`BACKOFF`]. Baselines are kept
+//!   per route (method and path, with id segments collapsed) because latency
+//!   is measured over the whole exchange, body included: a 5 MB series list
+//!   is not congestion next to a status call. The limit stays between 1
+//!   and `max_concurrency`. A request that cannot get a slot within
+//!   [`QUEUE_TIMEOUT`] fails as [`UpstreamError::Saturated`]. Without this
+//!   wait, a burst against a slow upstream would pile up until every call hit
+//!   the HTTP timeout.
+//! * **Circuit breaker.** After `breaker_threshold` consecutive failures
+//!   (transport errors and HTTP 5xx — the `transport_error`/`http_error` side of
+//!   `record_outcome`), requests fail fast with [`UpstreamError::CircuitOpen`]
+//!   for `breaker_cooldown_secs`. When the cooldown ends, a single probe
+//!   request is let through. If it succeeds the breaker closes; if it fails the
+//!   breaker opens for another cooldown.
+//!
+//! Queue wait, rejections, breaker trips, and the current limit are exported as
+//! `yarr_upstream_*` metrics.
+
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex, PoisonError};
+use std::time::{Duration, Instant};
+
+use tokio::sync::Notify;
+
+use super::UpstreamError;
+use crate::config::ServiceConfig;
+
+/// Longest a request waits for a free slot before failing as saturated.
+const QUEUE_TIMEOUT: Duration = Duration::from_secs(10);
+
+/// A success slower than this multiple of the baseline latency counts as
+/// congestion.
+const LATENCY_TOLERANCE: f64 = 2.0;
+
+/// Multiplicative decrease applied to the limit on congestion or failure.
+const BACKOFF: f64 = 0.9;
+
+/// How far one slower success moves the baseline toward it (1/64). The baseline
+/// therefore follows a lasting change in an upstream's speed instead of staying
+/// pinned to its fastest response.
+const BASELINE_DRIFT: f64 = 1.0 / 64.0;
+
+/// Routes a gate keeps a baseline for. Requests to further routes still count
+/// toward the limit and the breaker but give no latency signal.
+const MAX_ROUTES: usize = 256;
+
+/// How a finished request counts toward the limit and the breaker.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(super) enum Outcome {
+    /// The upstream answered (2xx, or a 4xx it chose to send).
+    Success,
+    /// Transport error (connect, timeout, body read) or HTTP 5xx.
+    Failure,
+    /// Rejected locally after a response arrived (oversized, undecodable):
+    /// says nothing about upstream health.
+    Neutral,
+}
+
+impl Outcome {
+    pub(super) fn of<T>(result: &anyhow::Result<T>) -> Self {
+        let Err(error) = result else {
+            return Self::Success;
+        };
+        match error.downcast_ref::<UpstreamError>() {
+            Some(UpstreamError::Http { status, .. }) if status.is_server_error() => Self::Failure,
+            Some(UpstreamError::Http { .. }) => Self::Success,
+            Some(_) => Self::Neutral,
+            None if error.downcast_ref::<reqwest::Error>().is_some() => Self::Failure,
+            None => Self::Neutral,
+        }
+    }
+}
+
+/// The gates of every service that has sent a request, keyed by service name.
+#[derive(Default)]
+pub(super) struct UpstreamLimiter {
+    gates: Mutex<HashMap<String, Arc<Gate>>>,
+}
+
+impl UpstreamLimiter {
+    /// Wait for a slot on `service`'s gate for a request to `route` (see
+    /// [`route`]). Errors without sending anything when the breaker is open or
+    /// no slot frees up within [`QUEUE_TIMEOUT`].
+    pub(super) async fn acquire(
+        &self,
+        service: &ServiceConfig,
+        route: String,
+    ) -> Result<Permit, UpstreamError> {
+        self.gate(service).acquire(route, QUEUE_TIMEOUT).await
+    }
+
+    fn gate(&self, service: &ServiceConfig) -> Arc<Gate> {
+        self.gates
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .entry(service.name.clone())
+            .or_insert_with(|| Arc::new(Gate::new(service)))
+            .clone()
+    }
+}
+
+struct Gate {
+    service: String,
+    max: usize,
+    threshold: u32,
+    cooldown: Duration,
+    state: Mutex<GateState>,
+    released: Notify,
+}
+
+struct GateState {
+    limit: f64,
+    in_flight: usize,
+    /// Baseline latency per route.
+    baselines: HashMap<String, Duration>,
+    failures: u32,
+    /// Set while the breaker is open; a time in the past means half-open.
+    open_until: Option<Instant>,
+    /// A half-open probe is in flight.
+    probing: bool,
+}
+
+enum Admission {
+    Admitted { probe: bool },
+    Open { retry_after: Duration },
+    Full,
+}
+
+impl Gate {
+    fn new(service: &ServiceConfig) -> Self {
+        let max = service.max_concurrency.max(1);
+        Self {
+            service: service.name.clone(),
+            max,
+            threshold: service.breaker_threshold,
+            cooldown: Duration::from_secs(service.breaker_cooldown_secs),
+            state: Mutex::new(GateState {
+                limit: max as f64,
+                in_flight: 0,
+                baselines: HashMap::new(),
+                failures: 0,
+                open_until: None,
+                probing: false,
+            }),
+            released: Notify::new(),
+        }
+    }
+
+    fn lock(&self) -> std::sync::MutexGuard<'_, GateState> {
+        self.state.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    async fn acquire(
+        self: Arc<Self>,
+        route: String,
+        queue_timeout: Duration,
+    ) -> Result<Permit, UpstreamError> {
+        let queued = Instant::now();
+        loop {
+            // Register for the wake-up before checking, so a release between
+            // the check and the wait is not missed.
+            let released = self.released.notified();
+            tokio::pin!(released);
+            released.as_mut().enable();
+            match self.admit(Instant::now()) {
+                Admission::Admitted { probe } => {
+                    axum_prometheus::metrics::histogram!(
+                        "yarr_upstream_queue_wait_seconds",
+                        "service" => self.service.clone()
+                    )
+                    .record(queued.elapsed().as_secs_f64());
+                    return Ok(Permit {
+                        gate: Arc::clone(&self),
+                        route,
+                        started: Instant::now(),
+                        probe,
+                    });
+                }
+                Admission::Open { retry_after } => {
+                    self.rejected("circuit_open");
+                    return Err(UpstreamError::CircuitOpen {
+                        service: self.service.clone(),
+                        retry_after_secs: retry_after.as_secs_f64().ceil().max(1.0) as u64,
+                    });
+                }
+                Admission::Full => {}
+            }
+            let remaining = queue_timeout.saturating_sub(queued.elapsed());
+            if tokio::time::timeout(remaining, released).await.is_err() {
+                self.rejected("saturated");
+                return Err(UpstreamError::Saturated {
+                    service: self.service.clone(),
+                    limit: self.lock().limit as usize,
+                    waited_ms: queued.elapsed().as_millis() as u64,
+                });
+            }
+        }
+    }
+
+    fn admit(&self, now: Instant) -> Admission {
+        let mut state = self.lock();
+        if let Some(until) = state.open_until {
+            if now < until {
+                return Admission::Open {
+                    retry_after: until - now,
+                };
+            }
+            // Half-open: one probe at a time decides whether to close.
+            if state.probing {
+                return Admission::Open {
+                    retry_after: Duration::from_secs(1),
+                };
+            }
+            state.probing = true;
+            state.in_flight += 1;
+            return Admission::Admitted { probe: true };
+        }
+        if state.in_flight < (state.limit as usize).max(1) {
+            state.in_flight += 1;
+            return Admission::Admitted { probe: false };
+        }
+        Admission::Full
+    }
+
+    fn record(&self, outcome: Outcome, route: &str, latency: Duration, probe: bool) {
+        let mut state = self.lock();
+        match outcome {
+            Outcome::Success => {
+                state.failures = 0;
+                if probe {
+                    state.open_until = None;
+                    tracing::info!(service = %self.service, "upstream circuit breaker closed");
+                }
+                if state.congested(route, latency) {
+                    state.limit = (state.limit * BACKOFF).max(1.0);
+                } else if state.in_flight >= state.limit as usize {
+                    state.limit = (state.limit + 1.0 / state.limit).min(self.max as f64);
+                }
+            }
+            Outcome::Failure => {
+                state.limit = (state.limit * BACKOFF).max(1.0);
+                state.failures = state.failures.saturating_add(1);
+                if self.threshold > 0 && (probe || state.failures >= self.threshold) {
+                    state.open_until = Some(Instant::now() + self.cooldown);
+                    axum_prometheus::metrics::counter!(
+                        "yarr_upstream_circuit_opened_total",
+                        "service" => self.service.clone()
+                    )
+                    .increment(1);
+                    tracing::warn!(
+                        service = %self.service,
+                        failures = state.failures,
+                        cooldown_secs = self.cooldown.as_secs(),
+                        "upstream circuit breaker opened"
+                    );
+                }
+            }
+            Outcome::Neutral => {}
+        }
+        axum_prometheus::metrics::gauge!(
+            "yarr_upstream_concurrency_limit",
+            "service" => self.service.clone()
+        )
+        .set(state.limit);
+    }
+
+    fn release(&self, probe: bool) {
+        {
+            let mut state = self.lock();
+            state.in_flight = state.in_flight.saturating_sub(1);
+            if probe {
+                state.probing = false;
+            }
+        }
+        self.released.notify_waiters();
+    }
+
+    fn rejected(&self, reason: &'static str) {
+        axum_prometheus::metrics::counter!(
+            "yarr_upstream_rejections_total",
+            "service" => self.service.clone(),
+            "reason" => reason
+        )
+        .increment(1);
+    }
+}
+
+impl GateState {
+    /// Whether `latency` is slow for `route`, moving the route's baseline
+    /// toward it. The first request to a route only sets its baseline.
+    fn congested(&mut self, route: &str, latency: Duration) -> bool {
+        let Some(baseline) = self.baselines.get_mut(route) else {
+            if self.baselines.len() < MAX_ROUTES {
+                self.baselines.insert(route.to_owned(), latency);
+            }
+            return false;
+        };
+        let slow = latency.as_secs_f64() > baseline.as_secs_f64() * LATENCY_TOLERANCE;
+        *baseline = if latency < *baseline {
+            latency
+        } else {
+            baseline.mul_f64(1.0 - BASELINE_DRIFT) + latency.mul_f64(BASELINE_DRIFT)
+        };
+        slow
+    }
+}
+
+/// The route a request's latency is compared within: its method and URL path,
+/// with numeric and hash-like segments collapsed so per-item paths share one
+/// baseline.
+pub(super) fn route(method: &reqwest::Method, url: &reqwest::Url) -> String {
+    let mut route = method.as_str().to_owned();
+    route.push(' ');
+    for segment in url.path().split('/').filter(|segment| !segment.is_empty()) {
+        route.push('/');
+        let id = segment.bytes().all(|byte| byte.is_ascii_digit())
+            || (segment.len() >= 16
+                && segment
+                    .bytes()
+                    .all(|byte| byte.is_ascii_hexdigit() || byte == b'-'));
+        route.push_str(if id { "{id}" } else { segment });
+    }
+    route
+}
+
+/// One admitted request. Report how it went with [`Permit::complete`]; the slot
+/// is released on drop either way, so a cancelled request never leaks it.
+pub(super) struct Permit {
+    gate: Arc<Gate>,
+    route: String,
+    started: Instant,
+    probe: bool,
+}
+
+impl Permit {
+    pub(super) fn complete<T>(self, result: &anyhow::Result<T>) {
+        self.gate.record(
+            Outcome::of(result),
+            &self.route,
+            self.started.elapsed(),
+            self.probe,
+        );
+    }
+}
+
+impl Drop for Permit {
+    fn drop(&mut self) {
+        self.gate.release(self.probe);
+    }
+}
+
+#[cfg(test)]
+#[path = "limiter_tests.rs"]
+mod tests;
@@ -0,0 +1,206 @@
+use std::sync::Arc;
+use std::time::{Duration, Instant};
+
+use reqwest::StatusCode;
+
+use super::{Gate, Outcome, route};
+use crate::config::ServiceConfig;
+use crate::yarr::UpstreamError;
+
+const ROUTE: &str = "GET /api/v1/indexer";
+
+fn gate(max_concurrency: usize, breaker_threshold: u32) -> Arc<Gate> {
+    Arc::new(Gate::new(&ServiceConfig {
+        name: "prowlarr".into(),
+        max_concurrency,
+        breaker_threshold,
+        breaker_cooldown_secs: 30,
+        ..ServiceConfig::default()
+    }))
+}
+
+fn http(status: StatusCode) -> anyhow::Result<()> {
+    Err(UpstreamError::Http {
+        service: "prowlarr".into(),
+        status,
+        body_preview: String::new(),
+        location: None,
+    }
+    .into())
+}
+
+#[test]
+fn outcomes_follow_upstream_health() {
+    assert_eq!(Outcome::of(&Ok::<_, anyhow::Error>(())), Outcome::Success);
+    assert_eq!(
+        Outcome::of(&http(StatusCode::BAD_GATEWAY)),
+        Outcome::Failure
+    );
+    assert_eq!(Outcome::of(&http(StatusCode::NOT_FOUND)), Outcome::Success);
+    let oversized: anyhow::Result<()> = Err(UpstreamError::ResponseTooLarge {
+        service: "prowlarr".into(),
+        observed: 1,
+        limit: 0,
+    }
+    .into());
+    assert_eq!(Outcome::of(&oversized), Outcome::Neutral);
+}
+
+#[tokio::test]
+async fn in_flight_requests_never_exceed_the_limit() {
+    let gate = gate(2, 0);
+    let first = Arc::clone(&gate)
+        .acquire(ROUTE.into(), Duration::ZERO)
+        .await
+        .unwrap();
+    let _second = Arc::clone(&gate)
+        .acquire(ROUTE.into(), Duration::ZERO)
+        .await
+        .unwrap();
+
+    let error = Arc::clone(&gate)
+        .acquire(ROUTE.into(), Duration::from_millis(20))
+        .await
+        .err()
+        .unwrap();
+    assert!(matches!(error, UpstreamError::Saturated { limit: 2, .. }));
+
+    // A waiter is admitted as soon as a slot is released.
+    let waiter = tokio::spawn(Arc::clone(&gate).acquire(ROUTE.into(), Duration::from_secs(5)));
+    tokio::time::sleep(Duration::from_millis(20)).await;
+    drop(first);
+    assert!(waiter.await.unwrap().is_ok());
+}
+
+#[test]
+fn slow_responses_shrink_the_limit_and_fast_ones_restore_it() {
+    let gate = gate(8, 0);
+    gate.record(Outcome::Success, ROUTE, Duration::from_millis(10), false);
+    for _ in 0..10 {
+        gate.record(Outcome::Success, ROUTE, Duration::from_millis(500), false);
+    }
+    let shrunk = gate.lock().limit;
+    assert!(shrunk < 4.0, "{shrunk}");
+
+    // Growth only happens while the limit is actually in use.
+    gate.lock().in_flight = 8;
+    for _ in 0..200 {
+        gate.record(Outcome::Success, ROUTE, Duration::from_millis(10), false);
+    }
+    assert_eq!(gate.lock().limit, 8.0);
+}
+
+#[test]
+fn a_slow_route_next_to_a_fast_one_is_not_congestion() {
+    let gate = gate(8, 0);
+    gate.lock().in_flight = 8;
+    for _ in 0..200 {
+        gate.record(
+            Outcome::Success,
+            "GET /api/v3/system/status",
+            Duration::from_millis(3),
+            false,
+        );
+        gate.record(
+            Outcome::Success,
+            "GET /api/v3/series",
+            Duration::from_millis(800),
+            false,
+        );
+    }
+    assert_eq!(gate.lock().limit, 8.0);
+}
+
+#[test]
+fn routes_collapse_id_segments_and_drop_the_query() {
+    let url = |path: &str| reqwest::Url::parse(&format!("http://sonarr:8989{path}")).unwrap();
+    let get = reqwest::Method::GET;
+    assert_eq!(
+        route(&get, &url("/api/v3/series/42?includeSeasonImages=true")),
+        "GET /api/v3/series/{id}"
+    );
+    assert_eq!(
+        route(
+            &reqwest::Method::DELETE,
+            &url("/api/v2/torrents/8c212779b4abde7b8e5d6e3f0f1a2b3c4d5e6f70")
+        ),
+        "DELETE /api/v2/torrents/{id}"
+    );
+    assert_eq!(route(&get, &url("/api/v3/queue")), "GET /api/v3/queue");
+}
+
+#[tokio::test]
+async fn repeated_failures_open_the_breaker_until_a_probe_succeeds() {
+    let gate = gate(4, 3);
+    for _ in 0..3 {
+        Arc::clone(&gate)
+            .acquire(ROUTE.into(), Duration::ZERO)
+            .await
+            .unwrap()
+            .complete(&http(StatusCode::SERVICE_UNAVAILABLE));
+    }
+
+    let error = Arc::clone(&gate)
+        .acquire(ROUTE.into(), Duration::ZERO)
+        .await
+        .err()
+        .unwrap();
+    assert!(matches!(
+        error,
+        UpstreamError::CircuitOpen {
+            retry_after_secs: 30,
+            ..
+        }
+    ));
+
+    // Cooldown over: exactly one probe goes through.
+    gate.lock().open_until = Some(Instant::now());
+    let probe = Arc::clone(&gate)
+        .acquire(ROUTE.into(), Duration::ZERO)
+        .await
+        .unwrap();
+    assert!(probe.probe);
+    assert!(
+        Arc::clone(&gate)
+            .acquire(ROUTE.into(), Duration::ZERO)
+            .await
+            .is_err()
+    );
+
+    probe.complete(&Ok::<_, anyhow::Error>(()));
+    assert!(gate.lock().open_until.is_none());
+    assert!(
+        Arc::clone(&gate)
+            .acquire(ROUTE.into(), Duration::ZERO)
+            .await
+            .is_ok()
+    );
+}
+
+#[tokio::test]
+async fn a_failed_probe_reopens_the_breaker() {
+    let gate = gate(4, 3);
+    gate.lock().open_until = Some(Instant::now());
+
+    Arc::clone(&gate)
+        .acquire(ROUTE.into(), Duration::ZERO)
+        .await
+        .unwrap()
+        .complete(&http(StatusCode::BAD_GATEWAY));
+
+    assert!(gate.lock().open_until.unwrap() > Instant::now());
+    assert!(!gate.lock().probing);
+}
+
+#[tokio::test]
+async fn a_zero_threshold_disables_the_breaker() {
+    let gate = gate(1, 0);
+    for _ in 0..20 {
+        Arc::clone(&gate)
+            .acquire(ROUTE.into(), Duration::ZERO)
+            .await
+            .unwrap()
+            .complete(&http(StatusCode::INTERNAL_SERVER_ERROR));
+    }
+    assert!(gate.lock().open_until.is_none());
+}
@@ -4,9 +4,10 @@ use anyhow::Result;
 use reqwest::Method;
 use serde_json::Value;
 
+use super::projection::Projection;
 use super::response::ResponseMode;
 use super::{YarrClient, auth};
-use crate::config::{ServiceConfig, ServiceKind};
+use crate::config::ServiceConfig;
 
 /// Fully encoded request payload used by generated OpenAPI operations.
 pub(crate) enum EncodedRequestBody {
@@ -40,6 +41,8 @@ pub(crate) struct OpenApiRequest<'a> {
     pub(crate) accept: Option<&'a str>,
     pub(crate) expected_encoding: crate::openapi::BodyEncoding,
     pub(crate) expected_media_type: &'a str,
+    /// Field projection for JSON responses; ignored for other encodings.
+    pub(crate) projection: Option<&'a Projection>,
 }
 
 impl YarrClient {
@@ -56,14 +59,9 @@ impl YarrClient {
             accept,
             expected_encoding,
             expected_media_type,
+            projection,
         } = input;
-        let http = if service.kind == ServiceKind::Qbittorrent {
-            let session = self.qbit_session(service)?;
-            session.ensure(service).await?;
-            session.client()
-        } else {
-            &self.client
-        };
+        let http = self.http_for(service).await?;
         let mut request = http.request(method, url);
         for (name, value) in headers {
             request = request.header(name, value);
@@ -90,15 +88,16 @@ impl YarrClient {
                 request.multipart(build_multipart_form(fields)?)
             }
         };
-        self.finish_with_retry_mode(
-            service,
-            request,
-            ResponseMode::OpenApi {
+        let mode = match projection {
+            Some(projection) if expected_encoding == crate::openapi::BodyEncoding::Json => {
+                ResponseMode::Projected(projection.clone())
+            }
+            _ => ResponseMode::OpenApi {
                 expected_encoding,
                 expected_media_type: expected_media_type.to_string(),
             },
-        )
-        .await
+        };
+        self.finish_with_retry_mode(service, request, mode).await
     }
 }
 
@@ -0,0 +1,65 @@
+//! Per-phase timing and size metrics for upstream exchanges.
+
+use std::time::Instant;
+
+use crate::config::ServiceConfig;
+
+/// Back-to-back phase timer for one exchange. Each [`lap`](Self::lap) records
+/// the time since the previous one, so an exchange's phases sum to its total.
+pub(super) struct PhaseClock<'a> {
+    service: &'a ServiceConfig,
+    method: &'static str,
+    mark: Instant,
+}
+
+impl<'a> PhaseClock<'a> {
+    pub(super) fn start(service: &'a ServiceConfig, method: &'static str) -> Self {
+        Self {
+            service,
+            method,
+            mark: Instant::now(),
+        }
+    }
+
+    pub(super) fn lap(&mut self, phase: &'static str) {
+        let now = Instant::now();
+        axum_prometheus::metrics::histogram!(
+            "yarr_upstream_phase_seconds",
+            "service" => self.service.name.clone(),
+            "kind" => self.service.kind.as_str(),
+            "method" => self.method,
+            "phase" => phase
+        )
+        .record(now.duration_since(self.mark).as_secs_f64());
+        self.mark = now;
+    }
+
+    pub(super) fn size(&self, bytes: usize) {
+        axum_prometheus::metrics::histogram!(
+            "yarr_upstream_response_bytes",
+            "service" => self.service.name.clone(),
+            "kind" => self.service.kind.as_str(),
+            "method" => self.method
+        )
+        .record(bytes as f64);
+    }
+}
+
+/// The request method as a bounded metric label. Generated operations only use
+/// the standard methods; anything else collapses into `OTHER`.
+pub(super) fn method_label(method: &reqwest::Method) -> &'static str {
+    match *method {
+        reqwest::Method::GET => "GET",
+        reqwest::Method::POST => "POST",
+        reqwest::Method::PUT => "PUT",
+        reqwest::Method::DELETE => "DELETE",
+        reqwest::Method::PATCH => "PATCH",
+        reqwest::Method::HEAD => "HEAD",
+        reqwest::Method::OPTIONS => "OPTIONS",
+        _ => "OTHER",
+    }
+}
+
+#[cfg(test)]
+#[path = "phases_tests.rs"]
+mod tests;
@@ -0,0 +1,9 @@
+use super::method_label;
+
+#[test]
+fn method_labels_collapse_nonstandard_methods() {
+    assert_eq!(method_label(&reqwest::Method::GET), "GET");
+    assert_eq!(method_label(&reqwest::Method::DELETE), "DELETE");
+    let custom = reqwest::Method::from_bytes(b"PROPFIND").unwrap();
+    assert_eq!(method_label(&custom), "OTHER");
+}
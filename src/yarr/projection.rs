@@ -0,0 +1,402 @@
+//! Field projection applied while an upstream JSON body is parsed.
+//!
+//! Curated commands and the `api_get`/`op` actions usually want a handful of
+//! fields out of a very large payload (a whole Sonarr library, a Tautulli
+//! history page). A [`Projection`] names the kept fields and, optionally, the
+//! envelope path the rows live under. The response path feeds the body chunk
+//! by chunk into a blocking parser that drops every other member as it goes
+//! past, so peak memory tracks the kept fields rather than the raw body.
+//! [`Projection::apply`] gives the same result for an already-decoded value.
+//!
+//! Services that may answer a JSON media type with plain text
+//! (`allows_text_response`) keep their text fallback for short replies: a
+//! body the parser rejects that fits in the preview head was read whole, and
+//! goes through the buffered decode exactly as it would without a projection.
+//! A longer non-JSON body is reported as invalid JSON with a preview, so the
+//! raw body is never held.
+
+use std::fmt;
+use std::io::Read;
+use std::sync::Arc;
+
+use anyhow::{Context, Result};
+use reqwest::StatusCode;
+use serde::de::{DeserializeSeed, Deserializer, IgnoredAny, MapAccess, SeqAccess, Visitor};
+use serde_json::{Map, Value};
+
+use super::encoding::Body;
+use super::response::{
+    ResponseMode, allows_text_response, decode_success, record_outcome, too_large,
+};
+use super::{MAX_UPSTREAM_RESPONSE_BYTES, UpstreamError, cache, helpers};
+use crate::config::ServiceConfig;
+
+/// Wire cap for a projected stream. The raw body is never held, so this only
+/// bounds how long a runaway upstream can keep the parser busy; the projected
+/// value itself is still held to `MAX_UPSTREAM_RESPONSE_BYTES`.
+pub(crate) const MAX_PROJECTED_RESPONSE_BYTES: usize = 256 * 1024 * 1024;
+
+/// Raw bytes kept from the head of the body: the invalid-JSON preview, and
+/// the whole body of a short text reply.
+const PREVIEW_BYTES: usize = 1024;
+
+/// Chunks buffered between the network reader and the parser thread.
+const CHANNEL_CHUNKS: usize = 8;
+
+/// Keep-list of fields, applied at the root or under an envelope path.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct Projection {
+    at: Arc<[String]>,
+    fields: Arc<[String]>,
+    /// Envelope members kept beside the path; all of them when `None`.
+    envelope: Option<Arc<[String]>>,
+}
+
+impl Projection {
+    /// Keep only `fields` of the top-level object, or of each element when the
+    /// body is an array — the same shape rule as [`slim`](super::slim).
+    pub fn fields<I, S>(fields: I) -> Self
+    where
+        I: IntoIterator<Item = S>,
+        S: Into<String>,
+    {
+        Self {
+            at: Arc::from([]),
+            fields: fields.into_iter().map(Into::into).collect(),
+            envelope: None,
+        }
+    }
+
+    /// Apply the field rule under `path` instead of at the root, e.g.
+    /// `["queue", "slots"]` for SABnzbd. Envelope members off the path (paging
+    /// totals and the like) are kept whole. A `*` segment descends into every
+    /// member of an object, e.g. `["torrents", "*"]` for rows keyed by id.
+    pub fn at(mut self, path: &[&str]) -> Self {
+        self.at = path.iter().map(|segment| (*segment).to_string()).collect();
+        self
+    }
+
+    /// Keep only the `keep` members of the envelope off the path, dropping the
+    /// rest as they are read.
+    pub fn envelope(mut self, keep: &[&str]) -> Self {
+        self.envelope = Some(keep.iter().map(|member| (*member).to_string()).collect());
+        self
+    }
+
+    fn descends(&self, segment: &str, key: &str) -> bool {
+        segment == "*" || segment == key
+    }
+
+    fn keeps_envelope(&self, key: &str) -> bool {
+        self.envelope
+            .as_ref()
+            .is_none_or(|keep| keep.iter().any(|member| member == key))
+    }
+
+    /// Project an already-decoded value.
+    pub fn apply(&self, value: Value) -> Value {
+        self.apply_at(value, 0)
+    }
+
+    fn apply_at(&self, value: Value, depth: usize) -> Value {
+        match (self.at.get(depth), value) {
+            (Some(segment), Value::Object(map)) => Value::Object(
+                map.into_iter()
+                    .filter_map(|(key, value)| {
+                        if self.descends(segment, &key) {
+                            let value = self.apply_at(value, depth + 1);
+                            Some((key, value))
+                        } else {
+                            self.keeps_envelope(&key).then_some((key, value))
+                        }
+                    })
+                    .collect(),
+            ),
+            (None, Value::Array(items)) => Value::Array(
+                items
+                    .into_iter()
+                    .map(|item| self.apply_at(item, depth))
+                    .collect(),
+            ),
+            (None, Value::Object(mut map)) => Value::Object(
+                self.fields
+                    .iter()
+                    .filter_map(|field| map.remove(field).map(|value| (field.clone(), value)))
+                    .collect(),
+            ),
+            (_, other) => other,
+        }
+    }
+
+    /// Suffix that keeps projected cache entries apart from full ones.
+    pub(super) fn cache_tag(&self) -> String {
+        let mut tag = format!("{}|{}", self.at.join("."), self.fields.join(","));
+        if let Some(keep) = &self.envelope {
+            tag.push('|');
+            tag.push_str(&keep.join(","));
+        }
+        tag
+    }
+
+    /// Parse one JSON document from `reader`, dropping unprojected members as
+    /// they are read. Trailing non-whitespace is an error, as with
+    /// `serde_json::from_reader`.
+    pub(super) fn decode<R: Read>(&self, reader: R) -> serde_json::Result<Value> {
+        let mut deserializer = serde_json::Deserializer::from_reader(reader);
+        let value = Seed {
+            projection: self,
+            depth: 0,
+        }
+        .deserialize(&mut deserializer)?;
+        deserializer.end()?;
+        Ok(value)
+    }
+}
+
+#[derive(Clone, Copy)]
+struct Seed<'a> {
+    projection: &'a Projection,
+    depth: usize,
+}
+
+impl<'de> DeserializeSeed<'de> for Seed<'_> {
+    type Value = Value;
+
+    fn deserialize<D: Deserializer<'de>>(self, deserializer: D) -> Result<Value, D::Error> {
+        deserializer.deserialize_any(self)
+    }
+}
+
+impl<'de> Visitor<'de> for Seed<'_> {
+    type Value = Value;
+
+    fn expecting(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
+        formatter.write_str("a JSON value")
+    }
+
+    fn visit_bool<E>(self, value: bool) -> Result<Value, E> {
+        Ok(Value::Bool(value))
+    }
+
+    fn visit_i64<E>(self, value: i64) -> Result<Value, E> {
+        Ok(value.into())
+    }
+
+    fn visit_u64<E>(self, value: u64) -> Result<Value, E> {
+        Ok(value.into())
+    }
+
+    fn visit_f64<E>(self, value: f64) -> Result<Value, E> {
+        Ok(value.into())
+    }
+
+    fn visit_str<E>(self, value: &str) -> Result<Value, E> {
+        Ok(Value::String(value.to_owned()))
+    }
+
+    fn visit_string<E>(self, value: String) -> Result<Value, E> {
+        Ok(Value::String(value))
+    }
+
+    fn visit_unit<E>(self) -> Result<Value, E> {
+        Ok(Value::Null)
+    }
+
+    fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Value, A::Error> {
+        let mut items = Vec::new();
+        if self.depth < self.projection.at.len() {
+            // An array where the envelope expected an object: keep it whole,
+            // exactly as `apply` leaves it.
+            while let Some(item) = seq.next_element::<Value>()? {
+                items.push(item);
+            }
+        } else {
+            while let Some(item) = seq.next_element_seed(self)? {
+                items.push(item);
+            }
+        }
+        Ok(Value::Array(items))
+    }
+
+    fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Value, A::Error> {
+        let mut out = Map::new();
+        let segment = self.projection.at.get(self.depth);
+        while let Some(key) = map.next_key::<String>()? {
+            match segment {
+                Some(segment) if self.projection.descends(segment, &key) => {
+                    let value = map.next_value_seed(Seed {
+                        depth: self.depth + 1,
+                        ..self
+                    })?;
+                    out.insert(key, value);
+                }
+                Some(_) if self.projection.keeps_envelope(&key) => {
+                    out.insert(key, map.next_value()?);
+                }
+                Some(_) => {
+                    map.next_value::<IgnoredAny>()?;
+                }
+                None if self.projection.fields.contains(&key) => {
+                    out.insert(key, map.next_value()?);
+                }
+                None => {
+                    map.next_value::<IgnoredAny>()?;
+                }
+            }
+        }
+        Ok(Value::Object(out))
+    }
+}
+
+/// Success path for a projected JSON body: parse while reading, never buffer.
+/// Records the same request outcomes as the buffered path.
+pub(super) async fn finish(
+    service: &ServiceConfig,
+    status: StatusCode,
+    content_type: Option<String>,
+    content_disposition: Option<String>,
+    body: Body,
+    projection: Projection,
+) -> Result<Value> {
+    let streamed = stream(body, projection.clone())
+        .await
+        .with_context(|| format!("{} response body read failed", service.name))?;
+    let value = match streamed {
+        Streamed::TooLarge { observed, limit } => {
+            record_outcome(service, "oversized");
+            return Err(too_large(service, observed, limit));
+        }
+        Streamed::Value(value) => Ok(value),
+        Streamed::Empty => Ok(serde_json::json!({ "ok": true, "status": status.as_u16() })),
+        // A short reply was read whole: decode it as the buffered path would.
+        Streamed::Invalid { head, whole: true } if allows_text_response(service.kind) => {
+            record_outcome(service, "success");
+            return decode_success(
+                service,
+                status,
+                content_type,
+                content_disposition,
+                head,
+                ResponseMode::Projected(projection),
+            );
+        }
+        Streamed::Invalid { head, .. } => Err(UpstreamError::InvalidJson {
+            service: service.name.clone(),
+            content_type,
+            body_preview: helpers::body_preview(&String::from_utf8_lossy(&head)),
+        }
+        .into()),
+    };
+    record_outcome(service, "success");
+    value
+}
+
+/// Outcome of [`stream`], mapped onto metrics and `UpstreamError` by [`finish`].
+enum Streamed {
+    Value(Value),
+    /// Zero-byte body, reported like any other empty success.
+    Empty,
+    TooLarge {
+        observed: u64,
+        limit: usize,
+    },
+    /// Not JSON. `head` is the start of the body, and all of it when `whole`.
+    Invalid {
+        head: Vec<u8>,
+        whole: bool,
+    },
+}
+
+/// Read `body` to the end while a blocking task parses it through
+/// `projection`. Only the in-flight chunks, the preview head and the
+/// projected value are held.
+async fn stream(mut body: Body, projection: Projection) -> Result<Streamed> {
+    let (sender, receiver) = tokio::sync::mpsc::channel(CHANNEL_CHUNKS);
+    let parser = tokio::task::spawn_blocking(move || {
+        projection.decode(std::io::BufReader::new(ChunkReader {
+            receiver,
+            current: None,
+            offset: 0,
+        }))
+    });
+    let mut seen = 0usize;
+    let mut head = Vec::new();
+    let mut parsing = true;
+    while let Some(chunk) = body.chunk().await? {
+        seen = seen.saturating_add(chunk.len());
+        if seen > MAX_PROJECTED_RESPONSE_BYTES {
+            // Dropping the sender ends the parser at a premature EOF.
+            return Ok(Streamed::TooLarge {
+                observed: seen as u64,
+                limit: MAX_PROJECTED_RESPONSE_BYTES,
+            });
+        }
+        if head.len() < PREVIEW_BYTES {
+            let take = (PREVIEW_BYTES - head.len()).min(chunk.len());
+            head.extend_from_slice(&chunk[..take]);
+        }
+        if parsing && sender.send(chunk).await.is_err() {
+            // The parser already stopped on a syntax error.
+            parsing = false;
+        }
+        if !parsing && seen > PREVIEW_BYTES {
+            // Too long for the text fallback: the head is all that is needed.
+            break;
+        }
+    }
+    drop(sender);
+    if seen == 0 {
+        return Ok(Streamed::Empty);
+    }
+    match parser.await? {
+        Ok(value) => {
+            let projected = cache::encoded_len(&value);
+            if projected > MAX_UPSTREAM_RESPONSE_BYTES {
+                return Ok(Streamed::TooLarge {
+                    observed: projected as u64,
+                    limit: MAX_UPSTREAM_RESPONSE_BYTES,
+                });
+            }
+            Ok(Streamed::Value(value))
+        }
+        Err(_) => Ok(Streamed::Invalid {
+            whole: seen <= PREVIEW_BYTES,
+            head,
+        }),
+    }
+}
+
+/// Blocking [`Read`] over the chunks the async side forwards; a closed
+/// channel reads as end of input.
+struct ChunkReader<T> {
+    receiver: tokio::sync::mpsc::Receiver<T>,
+    current: Option<T>,
+    offset: usize,
+}
+
+impl<T: AsRef<[u8]>> Read for ChunkReader<T> {
+    fn read(&mut self, buf: &mut [u8]) -> std::io::Result<usize> {
+        loop {
+            if let Some(chunk) = &self.current {
+                let rest = &chunk.as_ref()[self.offset..];
+                if !rest.is_empty() {
+                    let len = rest.len().min(buf.len());
+                    buf[..len].copy_from_slice(&rest[..len]);
+                    self.offset += len;
+                    return Ok(len);
+                }
+            }
+            match self.receiver.blocking_recv() {
+                Some(chunk) => {
+                    self.current = Some(chunk);
+                    self.offset = 0;
+                }
+                None => return Ok(0),
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+#[path = "projection_tests.rs"]
+mod tests;
@@ -0,0 +1,181 @@
+use serde_json::json;
+
+use super::*;
+use crate::config::{ServiceConfig, ServiceKind, YarrConfig};
+use crate::yarr::YarrClient;
+
+fn decode(projection: &Projection, body: &str) -> Value {
+    projection.decode(body.as_bytes()).unwrap()
+}
+
+#[test]
+fn decode_matches_apply_at_the_root() {
+    let projection = Projection::fields(["id", "title"]);
+    let body = r#"[{"id":1,"title":"A","images":[{"url":"x"}],"path":"/tv/a"},
+                   {"id":2,"title":"B","seasons":{"1":{"monitored":true}}}, 7]"#;
+    let full: Value = serde_json::from_str(body).unwrap();
+    assert_eq!(decode(&projection, body), projection.apply(full));
+    assert_eq!(
+        decode(&projection, body),
+        json!([{"id": 1, "title": "A"}, {"id": 2, "title": "B"}, 7])
+    );
+}
+
+#[test]
+fn decode_projects_rows_under_an_envelope_path() {
+    let projection = Projection::fields(["user"]).at(&["response", "data", "data"]);
+    let body = r#"{"response":{"result":"success","data":{
+        "recordsTotal":2,"data":[{"user":"a","full_title":"x"},{"user":"b"}]}}}"#;
+    let full: Value = serde_json::from_str(body).unwrap();
+    let expected = json!({"response": {"result": "success", "data": {
+        "recordsTotal": 2, "data": [{"user": "a"}, {"user": "b"}]}}});
+    assert_eq!(decode(&projection, body), expected);
+    assert_eq!(projection.apply(full), expected);
+}
+
+#[test]
+fn a_wildcard_segment_projects_every_member_and_the_envelope_is_narrowed() {
+    let projection = Projection::fields(["name"])
+        .at(&["torrents", "*"])
+        .envelope(&["rid", "torrents_removed"]);
+    let body = r#"{"rid":3,"categories":{"tv":{}},"server_state":{"dl_info_speed":1},
+        "torrents":{"aaa":{"name":"A","tracker":"t"},"bbb":{"name":"B"}},
+        "torrents_removed":["ccc"]}"#;
+    let full: Value = serde_json::from_str(body).unwrap();
+    let expected = json!({"rid": 3, "torrents_removed": ["ccc"],
+        "torrents": {"aaa": {"name": "A"}, "bbb": {"name": "B"}}});
+    assert_eq!(decode(&projection, body), expected);
+    assert_eq!(projection.apply(full), expected);
+}
+
+#[test]
+fn decode_rejects_trailing_garbage() {
+    let projection = Projection::fields(["id"]);
+    assert!(projection.decode(&br#"{"id":1} {"id":2}"#[..]).is_err());
+}
+
+async fn large_upstream(rows: usize) -> String {
+    let rows: Vec<Value> = (0..rows)
+        .map(|id| json!({"id": id, "title": format!("title {id}"), "overview": "o".repeat(512)}))
+        .collect();
+    upstream("/api/v3/series", serde_json::to_vec(&rows).unwrap()).await
+}
+
+/// Serves `body` as `application/json` at `path`.
+async fn upstream(path: &str, body: Vec<u8>) -> String {
+    let app = axum::Router::new().route(
+        path,
+        axum::routing::get(move || {
+            let body = body.clone();
+            async move {
+                (
+                    [(axum::http::header::CONTENT_TYPE, "application/json")],
+                    body,
+                )
+            }
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    format!("http://{address}")
+}
+
+#[tokio::test]
+async fn projected_get_streams_past_the_buffered_cap() {
+    // ~20 MiB of rows: over the 16 MiB buffered cap, tiny once projected.
+    let base_url = large_upstream(40_000).await;
+    let service = ServiceConfig {
+        name: "sonarr".into(),
+        kind: ServiceKind::Sonarr,
+        base_url,
+        ..ServiceConfig::default()
+    };
+    let client = YarrClient::new(&YarrConfig {
+        services: vec![service.clone()],
+    })
+    .unwrap();
+
+    let full = client.get_json(&service, "/api/v3/series").await;
+    assert!(
+        full.is_err(),
+        "unprojected body should trip the buffered cap"
+    );
+
+    let projection = Projection::fields(["id", "title"]);
+    let projected = client
+        .get_json_projected(&service, "/api/v3/series", &projection)
+        .await
+        .unwrap();
+    let rows = projected.as_array().unwrap();
+    assert_eq!(rows.len(), 40_000);
+    assert_eq!(rows[7], json!({"id": 7, "title": "title 7"}));
+}
+
+#[tokio::test]
+async fn projected_non_json_keeps_the_text_fallback_of_its_kind() {
+    let projection = Projection::fields(["id"]);
+    // A generated kind, which accepts text, and one that does not.
+    for (kind, path) in [
+        (ServiceKind::Radarr, "/api/v3/movie"),
+        (ServiceKind::Tautulli, "/api/v2"),
+    ] {
+        let base_url = upstream(path, b"Ok.".to_vec()).await;
+        let service = ServiceConfig {
+            name: kind.as_str().into(),
+            kind,
+            base_url,
+            ..ServiceConfig::default()
+        };
+        let client = YarrClient::new(&YarrConfig {
+            services: vec![service.clone()],
+        })
+        .unwrap();
+
+        let buffered = client.get_json(&service, path).await;
+        let projected = client.get_json_projected(&service, path, &projection).await;
+        if crate::openapi::is_generated(kind) {
+            assert_eq!(buffered.unwrap(), json!("Ok."));
+            assert_eq!(projected.unwrap(), json!("Ok."));
+        } else {
+            for result in [buffered, projected] {
+                let error = result.unwrap_err();
+                assert!(
+                    matches!(
+                        error.downcast_ref::<UpstreamError>(),
+                        Some(UpstreamError::InvalidJson { .. })
+                    ),
+                    "{error:#}"
+                );
+            }
+        }
+    }
+}
+
+#[tokio::test]
+async fn projected_long_non_json_is_invalid_with_a_preview() {
+    // Longer than the preview head, so it is not held for the text fallback.
+    let body = "not json ".repeat(1_000).into_bytes();
+    let base_url = upstream("/api/v3/movie", body).await;
+    let service = ServiceConfig {
+        name: "radarr".into(),
+        kind: ServiceKind::Radarr,
+        base_url,
+        ..ServiceConfig::default()
+    };
+    let client = YarrClient::new(&YarrConfig {
+        services: vec![service.clone()],
+    })
+    .unwrap();
+
+    let error = client
+        .get_json_projected(&service, "/api/v3/movie", &Projection::fields(["id"]))
+        .await
+        .unwrap_err();
+    match error.downcast_ref::<UpstreamError>() {
+        Some(UpstreamError::InvalidJson { body_preview, .. }) => {
+            assert!(body_preview.starts_with("not json"), "{body_preview}");
+        }
+        _ => panic!("{error:#}"),
+    }
+}
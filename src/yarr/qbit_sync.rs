@@ -0,0 +1,166 @@
+//! Incremental qBittorrent torrent list over `/api/v2/sync/maindata`.
+//!
+//! Each qBittorrent session keeps a [`TorrentTable`]: the last `rid` plus the
+//! tracked fields of every torrent. A read asks for changes since that `rid`
+//! and merges them in, so a poll against a large seedbox transfers only the
+//! rows that changed. Nothing needs to be detected explicitly when a `rid`
+//! goes stale: qBittorrent then answers with `full_update: true`, which
+//! replaces the table. If the delta request itself is refused (4xx, or a body
+//! that is not maindata), the table is dropped and rebuilt from `rid=0` in the
+//! same call.
+//!
+//! Maindata is streamed through a [`Projection`] that keeps only the tracked
+//! fields of each torrent and the sync bookkeeping (`rid`, `full_update`,
+//! `torrents_removed`). Categories, tags and `server_state` are dropped while
+//! parsing, so a full update of a large seedbox costs about the table it
+//! fills, and it is held to the projected stream's wire cap rather than the
+//! buffered one.
+
+use std::collections::BTreeMap;
+
+use anyhow::{Context, Result};
+use serde_json::{Map, Value};
+
+use super::{Projection, UpstreamError, YarrClient, build_url};
+use crate::config::ServiceConfig;
+use crate::models::qbittorrent::SyncMainData;
+
+/// The synced torrent rows of one qBittorrent session.
+#[derive(Default)]
+pub(super) struct TorrentTable {
+    /// `rid` of the last merged response; `0` means nothing is synced.
+    rid: i64,
+    /// Fields kept per row. A read asking for a different set starts over.
+    fields: Vec<String>,
+    /// Rows keyed by torrent hash.
+    rows: BTreeMap<String, Map<String, Value>>,
+}
+
+impl TorrentTable {
+    fn reset(&mut self, fields: &[&str]) {
+        self.rid = 0;
+        self.fields = fields.iter().map(|field| (*field).to_owned()).collect();
+        self.rows.clear();
+    }
+
+    /// Merge one maindata response. Only tracked fields are stored; `hash` is
+    /// filled from the row's key when tracked.
+    fn apply(&mut self, data: SyncMainData) {
+        if data.full_update.unwrap_or(false) {
+            self.rows.clear();
+        }
+        let keep_hash = self.fields.iter().any(|field| field == "hash");
+        for (hash, changes) in data.torrents.unwrap_or_default() {
+            let row = self.rows.entry(hash.clone()).or_default();
+            for (key, value) in changes {
+                if self.fields.contains(&key) {
+                    row.insert(key, value);
+                }
+            }
+            if keep_hash {
+                row.insert("hash".to_owned(), Value::String(hash));
+            }
+        }
+        for hash in data.torrents_removed.unwrap_or_default() {
+            self.rows.remove(&hash);
+        }
+        self.rid = data.rid.unwrap_or(0);
+    }
+
+    /// Every row, ordered by hash.
+    fn to_value(&self) -> Value {
+        Value::Array(self.rows.values().cloned().map(Value::Object).collect())
+    }
+}
+
+impl YarrClient {
+    /// Every torrent on the qBittorrent `service`, each row holding only
+    /// `fields`. After the first call, each call fetches only the changes since
+    /// the previous one. Concurrent calls for one service wait for each other,
+    /// so they never race on the `rid`.
+    pub async fn qbit_torrents(&self, service: &ServiceConfig, fields: &[&str]) -> Result<Value> {
+        let session = self.qbit_session(service)?;
+        let mut table = session.torrents.lock().await;
+        if table
+            .fields
+            .iter()
+            .map(String::as_str)
+            .ne(fields.iter().copied())
+        {
+            table.reset(fields);
+        }
+        let projection = Projection::fields(fields.iter().copied())
+            .at(&["torrents", "*"])
+            .envelope(&["rid", "full_update", "torrents_removed"]);
+        let mut outcome = "full";
+        if table.rid != 0 {
+            match self.maindata(service, table.rid, &projection).await {
+                Ok(data) => {
+                    let outcome = if data.full_update.unwrap_or(false) {
+                        "full"
+                    } else {
+                        "delta"
+                    };
+                    record_sync(service, outcome);
+                    table.apply(data);
+                    return Ok(table.to_value());
+                }
+                Err(error) if is_rejection(&error) => {
+                    tracing::debug!(
+                        service = %service.name,
+                        error = %format!("{error:#}"),
+                        "qBittorrent rejected the sync rid; resyncing from scratch"
+                    );
+                    outcome = "resync";
+                    table.reset(fields);
+                }
+                Err(error) => return Err(error),
+            }
+        }
+        let data = self.maindata(service, 0, &projection).await?;
+        record_sync(service, outcome);
+        table.apply(data);
+        Ok(table.to_value())
+    }
+
+    async fn maindata(
+        &self,
+        service: &ServiceConfig,
+        rid: i64,
+        projection: &Projection,
+    ) -> Result<SyncMainData> {
+        let path = format!(
+            "{}/sync/maindata?rid={rid}",
+            service.kind.descriptor().api_prefix
+        );
+        let url = build_url(service, &path)?;
+        let value = self.send_get_projected(service, url, projection).await?;
+        serde_json::from_value(value)
+            .with_context(|| format!("{} sync/maindata response is not maindata", service.name))
+    }
+}
+
+/// A refusal of the delta request itself (4xx, or an unrecognisable body), as
+/// opposed to the upstream being unreachable. A full resync may still succeed
+/// after a refusal; it is pointless when the upstream is down.
+fn is_rejection(error: &anyhow::Error) -> bool {
+    match error.downcast_ref::<UpstreamError>() {
+        Some(UpstreamError::Http { status, .. }) => status.is_client_error(),
+        Some(UpstreamError::InvalidJson { .. }) => true,
+        Some(_) => false,
+        None => error.downcast_ref::<serde_json::Error>().is_some(),
+    }
+}
+
+fn record_sync(service: &ServiceConfig, outcome: &'static str) {
+    axum_prometheus::metrics::counter!(
+        "yarr_qbittorrent_sync_total",
+        "service" => service.name.clone(),
+        "outcome" => outcome
+    )
+    .increment(1);
+}
+
+#[cfg(test)]
+#[path = "qbit_sync_tests.rs"]
+mod tests;
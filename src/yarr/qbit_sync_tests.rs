@@ -0,0 +1,195 @@
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
+
+use axum::extract::Query;
+use axum::http::StatusCode;
+use serde_json::{Value, json};
+
+use super::TorrentTable;
+use crate::config::{ServiceConfig, ServiceKind, YarrConfig};
+use crate::models::qbittorrent::SyncMainData;
+use crate::yarr::YarrClient;
+
+const FIELDS: &[&str] = &["hash", "name", "progress"];
+
+fn maindata(value: Value) -> SyncMainData {
+    serde_json::from_value(value).unwrap()
+}
+
+fn table() -> TorrentTable {
+    let mut table = TorrentTable::default();
+    table.reset(FIELDS);
+    table.apply(maindata(json!({
+        "rid": 1,
+        "full_update": true,
+        "torrents": {
+            "aaa": {"name": "First", "progress": 0.1, "tracker": "dropped"},
+            "bbb": {"name": "Second", "progress": 1.0},
+        },
+    })));
+    table
+}
+
+#[test]
+fn a_full_update_keeps_only_tracked_fields_and_fills_the_hash() {
+    let table = table();
+    assert_eq!(table.rid, 1);
+    assert_eq!(
+        table.to_value(),
+        json!([
+            {"hash": "aaa", "name": "First", "progress": 0.1},
+            {"hash": "bbb", "name": "Second", "progress": 1.0},
+        ])
+    );
+}
+
+#[test]
+fn deltas_merge_changed_fields_and_drop_removed_torrents() {
+    let mut table = table();
+    table.apply(maindata(json!({
+        "rid": 2,
+        "torrents": {
+            "aaa": {"progress": 0.6},
+            "ccc": {"name": "Third", "progress": 0.0},
+        },
+        "torrents_removed": ["bbb"],
+    })));
+
+    assert_eq!(table.rid, 2);
+    assert_eq!(
+        table.to_value(),
+        json!([
+            {"hash": "aaa", "name": "First", "progress": 0.6},
+            {"hash": "ccc", "name": "Third", "progress": 0.0},
+        ])
+    );
+}
+
+#[test]
+fn a_later_full_update_replaces_the_table() {
+    let mut table = table();
+    table.apply(maindata(json!({
+        "rid": 9,
+        "full_update": true,
+        "torrents": {"ddd": {"name": "Only", "progress": 0.2}},
+    })));
+    assert_eq!(
+        table.to_value(),
+        json!([{"hash": "ddd", "name": "Only", "progress": 0.2}])
+    );
+}
+
+/// A qBittorrent stand-in for `/sync/maindata`: `rid=0` gets a full snapshot,
+/// `rid=1` a delta, and any other rid a 400. Records every rid it is sent.
+async fn upstream(rids: Arc<Mutex<Vec<String>>>) -> ServiceConfig {
+    let app = axum::Router::new().route(
+        "/api/v2/sync/maindata",
+        axum::routing::get(move |Query(query): Query<HashMap<String, String>>| {
+            let rids = rids.clone();
+            async move {
+                let rid = query.get("rid").cloned().unwrap_or_default();
+                rids.lock().unwrap().push(rid.clone());
+                match rid.as_str() {
+                    "0" => Ok(axum::Json(json!({
+                        "rid": 1,
+                        "full_update": true,
+                        "torrents": {"aaa": {"name": "First", "progress": 0.1}},
+                    }))),
+                    "1" => Ok(axum::Json(json!({
+                        "rid": 7,
+                        "torrents": {"aaa": {"progress": 0.5}},
+                    }))),
+                    _ => Err(StatusCode::BAD_REQUEST),
+                }
+            }
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    ServiceConfig {
+        name: "qbittorrent".into(),
+        kind: ServiceKind::Qbittorrent,
+        base_url: format!("http://{address}"),
+        ..ServiceConfig::default()
+    }
+}
+
+#[tokio::test]
+async fn reads_sync_incrementally_and_resync_when_the_rid_is_refused() {
+    let rids = Arc::new(Mutex::new(Vec::new()));
+    let service = upstream(rids.clone()).await;
+    let client = YarrClient::new(&YarrConfig {
+        services: vec![service.clone()],
+    })
+    .unwrap();
+
+    let first = client.qbit_torrents(&service, FIELDS).await.unwrap();
+    assert_eq!(first[0]["progress"], 0.1);
+
+    let second = client.qbit_torrents(&service, FIELDS).await.unwrap();
+    assert_eq!(
+        second,
+        json!([{"hash": "aaa", "name": "First", "progress": 0.5}])
+    );
+
+    // rid 7 is refused: the same call falls back to a full snapshot.
+    let third = client.qbit_torrents(&service, FIELDS).await.unwrap();
+    assert_eq!(third[0]["progress"], 0.1);
+
+    assert_eq!(*rids.lock().unwrap(), ["0", "1", "7", "0"]);
+}
+
+#[tokio::test]
+async fn a_full_update_past_the_buffered_cap_is_streamed_to_the_tracked_fields() {
+    // ~20 MiB of maindata: over the 16 MiB buffered cap, small once projected.
+    let torrents: serde_json::Map<String, Value> = (0..20_000)
+        .map(|n| {
+            let row =
+                json!({"name": format!("t{n}"), "progress": 1.0, "comment": "c".repeat(1000)});
+            (format!("{n:040x}"), row)
+        })
+        .collect();
+    let body = serde_json::to_vec(&json!({
+        "rid": 1,
+        "full_update": true,
+        "torrents": torrents,
+        "categories": {"tv": {"name": "tv", "savePath": "/tv"}},
+        "server_state": {"dl_info_speed": 0},
+    }))
+    .unwrap();
+    assert!(body.len() > crate::yarr::MAX_UPSTREAM_RESPONSE_BYTES);
+    let app = axum::Router::new().route(
+        "/api/v2/sync/maindata",
+        axum::routing::get(move || {
+            let body = body.clone();
+            async move {
+                (
+                    [(axum::http::header::CONTENT_TYPE, "application/json")],
+                    body,
+                )
+            }
+        }),
+    );
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let address = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+    let service = ServiceConfig {
+        name: "qbittorrent".into(),
+        kind: ServiceKind::Qbittorrent,
+        base_url: format!("http://{address}"),
+        ..ServiceConfig::default()
+    };
+    let client = YarrClient::new(&YarrConfig {
+        services: vec![service.clone()],
+    })
+    .unwrap();
+
+    let rows = client.qbit_torrents(&service, FIELDS).await.unwrap();
+    let rows = rows.as_array().unwrap();
+    assert_eq!(rows.len(), 20_000);
+    assert_eq!(
+        rows[0],
+        json!({"hash": format!("{:040x}", 0), "name": "t0", "progress": 1.0})
+    );
+}
@@ -1,16 +1,22 @@
-//! Bounded response collection, retry, metrics, and representation decoding.
+//! Retry, read caching, and representation decoding for upstream responses.
+//! The gate and the exchange itself live in [`exchange`](super::exchange).
 
-use anyhow::{Context, Result};
+use anyhow::Result;
 use base64::Engine as _;
 use reqwest::StatusCode;
 use serde_json::Value;
 
-use super::{MAX_UPSTREAM_RESPONSE_BYTES, UpstreamError, YarrClient, helpers};
+use super::exchange::{exchange, send_through_gate};
+use super::projection::Projection;
+use super::{UpstreamError, YarrClient, cache, helpers};
 use crate::config::{ServiceConfig, ServiceKind};
 
 #[derive(Clone)]
 pub(super) enum ResponseMode {
     JsonCompatible,
+    /// JSON-compatible decoding through a field projection. Successful JSON
+    /// bodies are streamed through it instead of being buffered.
+    Projected(Projection),
     OpenApi {
         expected_encoding: crate::openapi::BodyEncoding,
         expected_media_type: String,
@@ -35,11 +41,44 @@ impl YarrClient {
             .await
     }
 
+    /// Route a request through the per-service read cache when the service
+    /// opted in: cacheable GETs are served or coalesced by [`ReadCache`], and
+    /// anything else invalidates the service's entries before and after it is
+    /// sent. Requests whose body cannot be cloned are treated as writes.
+    ///
+    /// [`ReadCache`]: super::cache::ReadCache
     pub(super) async fn finish_with_retry_mode(
         &self,
         service: &ServiceConfig,
         request: reqwest::RequestBuilder,
         mode: ResponseMode,
+    ) -> Result<Value> {
+        if !service.read_cache {
+            return self.send_with_retry(service, request, mode).await;
+        }
+        let probe = request.try_clone().and_then(|probe| probe.build().ok());
+        let Some(probe) = probe.filter(|probe| probe.method() == reqwest::Method::GET) else {
+            self.read_cache.invalidate(service);
+            let result = self.send_with_retry(service, request, mode).await;
+            self.read_cache.invalidate(service);
+            return result;
+        };
+        let Some(ttl) = cache::ttl_for(service, probe.url()) else {
+            return self.send_with_retry(service, request, mode).await;
+        };
+        let key = cache::cache_key(service, &probe, &mode);
+        self.read_cache
+            .get_or_fetch(service, key, ttl, || {
+                self.send_with_retry(service, request, mode)
+            })
+            .await
+    }
+
+    async fn send_with_retry(
+        &self,
+        service: &ServiceConfig,
+        request: reqwest::RequestBuilder,
+        mode: ResponseMode,
     ) -> Result<Value> {
         if service.kind == ServiceKind::Qbittorrent {
             match request.try_clone() {
@@ -69,83 +108,23 @@ impl YarrClient {
         self.finish(service, request, mode).await
     }
 
+    /// Send one request through `service`'s [limiter](super::limiter) gate and
+    /// report its outcome back to it. The whole exchange, queue wait included,
+    /// runs inside an `upstream.request` span.
     async fn finish(
         &self,
         service: &ServiceConfig,
         request: reqwest::RequestBuilder,
         mode: ResponseMode,
     ) -> Result<Value> {
-        let mut response = match request.send().await {
-            Ok(response) => response,
-            Err(error) => {
-                record_outcome(service, "transport_error");
-                return Err(error).with_context(|| format!("{} request failed", service.name));
-            }
-        };
-        let status = response.status();
-        let content_type = header(&response, reqwest::header::CONTENT_TYPE);
-        let location = header(&response, reqwest::header::LOCATION)
-            .as_deref()
-            .map(helpers::body_preview);
-        let content_disposition = header(&response, reqwest::header::CONTENT_DISPOSITION);
-        if let Some(content_length) = response.content_length()
-            && content_length > MAX_UPSTREAM_RESPONSE_BYTES as u64
-        {
-            record_outcome(service, "oversized");
-            return Err(too_large(service, content_length));
-        }
-        let mut bytes = Vec::with_capacity(
-            response
-                .content_length()
-                .unwrap_or(0)
-                .min(MAX_UPSTREAM_RESPONSE_BYTES as u64) as usize,
-        );
-        while let Some(chunk) = response
-            .chunk()
-            .await
-            .with_context(|| format!("{} response body read failed", service.name))?
-        {
-            if bytes.len().saturating_add(chunk.len()) > MAX_UPSTREAM_RESPONSE_BYTES {
-                record_outcome(service, "oversized");
-                return Err(too_large(
-                    service,
-                    bytes.len().saturating_add(chunk.len()) as u64,
-                ));
-            }
-            bytes.extend_from_slice(&chunk);
-        }
-        if !status.is_success() {
-            record_outcome(service, "http_error");
-            let text = std::str::from_utf8(&bytes).unwrap_or("<non-utf8 body>");
-            return Err(UpstreamError::Http {
-                service: service.name.clone(),
-                status,
-                body_preview: helpers::body_preview(text),
-                location,
-            }
-            .into());
-        }
-        record_outcome(service, "success");
-        decode_success(
-            service,
-            status,
-            content_type,
-            content_disposition,
-            bytes,
-            mode,
-        )
+        send_through_gate(service, self, request, |http, request, method| async move {
+            exchange(service, &http, request, method, mode).await
+        })
+        .await
     }
 }
 
-fn header(response: &reqwest::Response, name: reqwest::header::HeaderName) -> Option<String> {
-    response
-        .headers()
-        .get(name)
-        .and_then(|value| value.to_str().ok())
-        .map(str::to_owned)
-}
-
-fn record_outcome(service: &ServiceConfig, outcome: &'static str) {
+pub(super) fn record_outcome(service: &ServiceConfig, outcome: &'static str) {
     axum_prometheus::metrics::counter!(
         "yarr_upstream_requests_total",
         "service" => service.name.clone(),
@@ -155,16 +134,34 @@ fn record_outcome(service: &ServiceConfig, outcome: &'static str) {
     .increment(1);
 }
 
-fn too_large(service: &ServiceConfig, observed: u64) -> anyhow::Error {
+pub(super) fn too_large(service: &ServiceConfig, observed: u64, limit: usize) -> anyhow::Error {
     UpstreamError::ResponseTooLarge {
         service: service.name.clone(),
         observed,
-        limit: MAX_UPSTREAM_RESPONSE_BYTES,
+        limit,
     }
     .into()
 }
 
-fn decode_success(
+/// The buffered `get_json` success decode for a 200 JSON body, exposed for the
+/// `benches/` suite through `crate::bench`.
+#[cfg(any(test, feature = "test-support"))]
+pub(crate) fn decode_json_success(
+    service: &ServiceConfig,
+    content_type: Option<String>,
+    bytes: Vec<u8>,
+) -> Result<Value> {
+    decode_success(
+        service,
+        StatusCode::OK,
+        content_type,
+        None,
+        bytes,
+        ResponseMode::JsonCompatible,
+    )
+}
+
+pub(super) fn decode_success(
     service: &ServiceConfig,
     status: StatusCode,
     content_type: Option<String>,
@@ -185,6 +182,20 @@ fn decode_success(
             &bytes,
             text,
         ),
+        // Buffered fallback (error statuses, non-JSON media types): project the
+        // decoded value, leaving the binary envelope alone.
+        ResponseMode::Projected(projection) => decode_compatible(
+            service,
+            status,
+            content_type,
+            content_disposition,
+            &bytes,
+            text,
+        )
+        .map(|value| match text {
+            Some(_) => projection.apply(value),
+            None => value,
+        }),
         ResponseMode::OpenApi {
             expected_encoding,
             expected_media_type,
@@ -16,6 +16,7 @@ fn op_verb_parses_name_and_args() {
             service: "sonarr".into(),
             op: "get_series".into(),
             args: json!({}),
+            all_pages: false,
         })
     );
     assert_eq!(
@@ -31,6 +32,16 @@ fn op_verb_parses_name_and_args() {
             service: "radarr".into(),
             op: "post_movie".into(),
             args: json!({ "body": { "tmdbId": 1 } }),
+            all_pages: false,
+        })
+    );
+    assert_eq!(
+        parse_args_from(["sonarr", "op", "get_history", "--all-pages"]).unwrap(),
+        Some(Command::Op {
+            service: "sonarr".into(),
+            op: "get_history".into(),
+            args: json!({}),
+            all_pages: true,
         })
     );
     // op requires a name.
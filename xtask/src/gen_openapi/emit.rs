@@ -1,6 +1,17 @@
 //! Rust data-table emission.
+//!
+//! Each service is emitted as one `CompactTable`: a pool holding every
+//! distinct string once, plus integer rows that index into it. Each distinct
+//! parameter-name, parameter and representation list is laid out once and
+//! shared by every operation that uses it. Integer rows need no load-time
+//! relocations; the runtime decodes a table into the public row types the
+//! first time that service is used.
 
+use std::collections::HashMap;
 use std::fmt::Write as _;
+use std::hash::Hash;
+
+use yarr::openapi::{BodyEncoding, HttpMethod, ParameterLocation, ParameterStyle};
 
 use super::{OperationOut, RepresentationOut, TypeOut};
 
@@ -10,20 +21,68 @@ pub(super) fn emit_rust(service: &str, operations: &[OperationOut], types: &[Typ
         .filter(|operation| operation.omission_reason.is_none())
         .count();
     let omitted = operations.len() - supported;
+    // `find_operation` binary-searches the decoded operations, so the table must
+    // be strictly sorted by name (extraction sorts and de-duplicates names).
+    assert!(
+        operations
+            .windows(2)
+            .all(|pair| pair[0].name < pair[1].name),
+        "{service}: operations must be strictly sorted by name"
+    );
+    let mut table = Table::default();
+    let rows: Vec<[u32; 18]> = operations
+        .iter()
+        .filter(|operation| operation.omission_reason.is_none())
+        .map(|operation| table.operation(operation))
+        .collect();
+    let type_rows: Vec<[u32; 2]> = types
+        .iter()
+        .map(|output_type| {
+            [
+                table.string(&output_type.name),
+                table.string(&output_type.ts),
+            ]
+        })
+        .collect();
+
     let mut output = String::with_capacity(128 * 1024);
+    let imports = if omitted == 0 {
+        "CompactTable, OmittedOperationSpec"
+    } else {
+        "CompactTable, HttpMethod, OmittedOperationSpec"
+    };
     let _ = writeln!(
         output,
-        "//! GENERATED by `cargo xtask gen-openapi` from specs/{service}.openapi.* -- DO NOT EDIT.\n//!\n//! {supported} supported operations, {omitted} omitted operations, {} component types.\n#![allow(clippy::all)]\nuse crate::openapi::{{BodyEncoding, HttpMethod, OmittedOperationSpec, OperationSpec, ParameterLocation, ParameterSpec, ParameterStyle, RepresentationSpec, RequestBodySpec, TypeDef}};\n",
-        types.len()
+        "//! GENERATED by `cargo xtask gen-openapi` from specs/{service}.openapi.* -- DO NOT EDIT.\n//!\n//! {supported} supported operations, {omitted} omitted operations, {} component types,\n//! {} distinct strings. `TABLE.operations` is sorted by name; `find_operation`\n//! binary-searches the decoded slice.\n#![allow(clippy::all)]\nuse crate::openapi::{{{imports}}};\n",
+        types.len(),
+        table.strings.len()
     );
-    let _ = writeln!(output, "pub static OPERATIONS: &[OperationSpec] = &[");
-    for operation in operations
-        .iter()
-        .filter(|operation| operation.omission_reason.is_none())
-    {
-        emit_operation(&mut output, operation);
+    let _ = writeln!(output, "pub static TABLE: CompactTable = CompactTable {{");
+    let _ = writeln!(output, "    strings: concat!(");
+    for string in &table.strings {
+        let _ = writeln!(output, "        \"{}\",", esc(string));
     }
-    let _ = writeln!(output, "];\n");
+    let _ = writeln!(output, "    ),");
+    let mut end = 0;
+    let ends: Vec<usize> = table
+        .strings
+        .iter()
+        .map(|string| {
+            end += string.len();
+            end
+        })
+        .collect();
+    let _ = writeln!(output, "    string_ends: &{ends:?},");
+    let _ = writeln!(output, "    names: &{:?},", table.names.items);
+    let _ = writeln!(output, "    parameters: &{:?},", table.parameters.items);
+    let _ = writeln!(
+        output,
+        "    representations: &{:?},",
+        table.representations.items
+    );
+    let _ = writeln!(output, "    operations: &{rows:?},");
+    let _ = writeln!(output, "    types: &{type_rows:?},");
+    let _ = writeln!(output, "}};\n");
 
     let _ = writeln!(
         output,
@@ -42,96 +101,154 @@ pub(super) fn emit_rust(service: &str, operations: &[OperationOut], types: &[Typ
             esc(operation.omission_reason.as_deref().unwrap_or_default())
         );
     }
-    let _ = writeln!(output, "];\n");
-
-    let _ = writeln!(output, "pub static TYPES: &[TypeDef] = &[");
-    for output_type in types {
-        let _ = writeln!(
-            output,
-            "    TypeDef {{ name: \"{}\", ts: \"{}\" }},",
-            esc(&output_type.name),
-            esc(&output_type.ts)
-        );
-    }
     let _ = writeln!(output, "];");
     output
 }
 
-fn emit_operation(output: &mut String, operation: &OperationOut) {
-    let path_params = operation
-        .parameters
-        .iter()
-        .filter(|parameter| parameter.location == "path")
-        .map(|parameter| format!("\"{}\"", esc(&parameter.name)))
-        .collect::<Vec<_>>()
-        .join(", ");
-    let query_params = operation
-        .parameters
-        .iter()
-        .filter(|parameter| parameter.location == "query")
-        .map(|parameter| format!("\"{}\"", esc(&parameter.name)))
-        .collect::<Vec<_>>()
-        .join(", ");
-    let _ = writeln!(
-        output,
-        "    OperationSpec {{ name: \"{}\", method: {}, path: \"{}\", path_params: &[{}], query_params: &[{}], has_body: {}, parameters: &[",
-        esc(&operation.name),
-        method_variant(&operation.method),
-        esc(&operation.path),
-        path_params,
-        query_params,
-        operation.request_body.is_some()
-    );
-    for parameter in &operation.parameters {
-        let _ = writeln!(
-            output,
-            "        ParameterSpec {{ name: \"{}\", location: {}, required: {}, schema: \"{}\", style: {}, explode: {} }},",
-            esc(&parameter.name),
-            location_variant(&parameter.location),
-            parameter.required,
-            esc(&parameter.schema),
-            style_variant(&parameter.style),
-            parameter.explode
-        );
+/// The string pool and list arenas behind one `CompactTable`.
+#[derive(Default)]
+struct Table {
+    strings: Vec<String>,
+    string_ids: HashMap<String, u32>,
+    names: Arena<u32>,
+    parameters: Arena<[u32; 6]>,
+    representations: Arena<[u32; 5]>,
+}
+
+/// Rows laid out contiguously, one run per distinct list.
+struct Arena<T> {
+    items: Vec<T>,
+    starts: HashMap<Vec<T>, u32>,
+}
+
+impl<T> Default for Arena<T> {
+    fn default() -> Self {
+        Self {
+            items: Vec::new(),
+            starts: HashMap::new(),
+        }
     }
-    let _ = write!(output, "    ], request_body: ");
-    if let Some(body) = &operation.request_body {
-        let _ = write!(
-            output,
-            "Some(RequestBodySpec {{ required: {}, representations: &[",
-            body.required
-        );
-        for representation in &body.representations {
-            emit_representation(output, representation);
+}
+
+impl<T: Clone + Eq + Hash> Arena<T> {
+    /// `(start, len)` of `list`, laying it out on first sight.
+    fn list(&mut self, list: Vec<T>) -> [u32; 2] {
+        let len = list.len() as u32;
+        if list.is_empty() {
+            return [0, 0];
         }
-        let _ = write!(output, "] }})");
-    } else {
-        let _ = write!(output, "None");
+        if let Some(&start) = self.starts.get(&list) {
+            return [start, len];
+        }
+        let start = self.items.len() as u32;
+        self.items.extend_from_slice(&list);
+        self.starts.insert(list, start);
+        [start, len]
     }
-    let _ = write!(output, ", responses: &[");
-    for representation in &operation.responses {
-        emit_representation(output, representation);
+}
+
+impl Table {
+    fn string(&mut self, value: &str) -> u32 {
+        if let Some(&id) = self.string_ids.get(value) {
+            return id;
+        }
+        let id = self.strings.len() as u32;
+        self.strings.push(value.to_string());
+        self.string_ids.insert(value.to_string(), id);
+        id
+    }
+
+    /// `id + 1`, or `0` for `None`.
+    fn optional(&mut self, value: &Option<String>) -> u32 {
+        value.as_deref().map_or(0, |value| self.string(value) + 1)
+    }
+
+    fn name_list(&mut self, operation: &OperationOut, location: &str) -> [u32; 2] {
+        let ids = operation
+            .parameters
+            .iter()
+            .filter(|parameter| parameter.location == location)
+            .map(|parameter| self.string(&parameter.name))
+            .collect();
+        self.names.list(ids)
+    }
+
+    fn representation_list(&mut self, representations: &[RepresentationOut]) -> [u32; 2] {
+        let rows = representations
+            .iter()
+            .map(|representation| {
+                [
+                    self.optional(&representation.status),
+                    self.string(&representation.media_type),
+                    encoding_code(&representation.encoding),
+                    self.string(&representation.schema),
+                    self.string(&representation.encoding_metadata),
+                ]
+            })
+            .collect();
+        self.representations.list(rows)
+    }
+
+    fn operation(&mut self, operation: &OperationOut) -> [u32; 18] {
+        let name = self.string(&operation.name);
+        let path = self.string(&operation.path);
+        let [path_start, path_len] = self.name_list(operation, "path");
+        let [query_start, query_len] = self.name_list(operation, "query");
+        let parameter_rows = operation
+            .parameters
+            .iter()
+            .map(|parameter| {
+                [
+                    self.string(&parameter.name),
+                    location_code(&parameter.location),
+                    u32::from(parameter.required),
+                    self.string(&parameter.schema),
+                    style_code(&parameter.style),
+                    u32::from(parameter.explode),
+                ]
+            })
+            .collect();
+        let [parameters_start, parameters_len] = self.parameters.list(parameter_rows);
+        let (body, [body_start, body_len]) = match &operation.request_body {
+            Some(body) => (
+                1 + u32::from(body.required),
+                self.representation_list(&body.representations),
+            ),
+            None => (0, [0, 0]),
+        };
+        let [responses_start, responses_len] = self.representation_list(&operation.responses);
+        [
+            name,
+            method_code(&operation.method),
+            path,
+            path_start,
+            path_len,
+            query_start,
+            query_len,
+            parameters_start,
+            parameters_len,
+            body,
+            body_start,
+            body_len,
+            responses_start,
+            responses_len,
+            self.optional(&operation.request_type),
+            self.optional(&operation.response_type),
+            self.string(&operation.tag),
+            self.string(&operation.summary),
+        ]
     }
-    let _ = writeln!(
-        output,
-        "], request_type: {}, response_type: {}, tag: \"{}\", summary: \"{}\" }},",
-        opt_str(&operation.request_type),
-        opt_str(&operation.response_type),
-        esc(&operation.tag),
-        esc(&operation.summary)
-    );
 }
 
-fn emit_representation(output: &mut String, representation: &RepresentationOut) {
-    let _ = write!(
-        output,
-        "RepresentationSpec {{ status: {}, media_type: \"{}\", encoding: {}, schema: \"{}\", encoding_metadata: \"{}\" }},",
-        opt_str(&representation.status),
-        esc(&representation.media_type),
-        encoding_variant(&representation.encoding),
-        esc(&representation.schema),
-        esc(&representation.encoding_metadata)
-    );
+fn method_code(method: &str) -> u32 {
+    (match method {
+        "GET" => HttpMethod::Get,
+        "POST" => HttpMethod::Post,
+        "PUT" => HttpMethod::Put,
+        "DELETE" => HttpMethod::Delete,
+        "PATCH" => HttpMethod::Patch,
+        other => panic!("unsupported generated HTTP method `{other}`"),
+    }) as u32
 }
 
 fn method_variant(method: &str) -> &'static str {
@@ -145,38 +262,38 @@ fn method_variant(method: &str) -> &'static str {
     }
 }
 
-fn location_variant(location: &str) -> &'static str {
-    match location {
-        "path" => "ParameterLocation::Path",
-        "query" => "ParameterLocation::Query",
-        "header" => "ParameterLocation::Header",
-        "cookie" => "ParameterLocation::Cookie",
+fn location_code(location: &str) -> u32 {
+    (match location {
+        "path" => ParameterLocation::Path,
+        "query" => ParameterLocation::Query,
+        "header" => ParameterLocation::Header,
+        "cookie" => ParameterLocation::Cookie,
         other => panic!("unsupported generated parameter location `{other}`"),
-    }
+    }) as u32
 }
 
-fn style_variant(style: &str) -> &'static str {
-    match style {
-        "simple" => "ParameterStyle::Simple",
-        "label" => "ParameterStyle::Label",
-        "matrix" => "ParameterStyle::Matrix",
-        "form" => "ParameterStyle::Form",
-        "spaceDelimited" => "ParameterStyle::SpaceDelimited",
-        "pipeDelimited" => "ParameterStyle::PipeDelimited",
-        "deepObject" => "ParameterStyle::DeepObject",
+fn style_code(style: &str) -> u32 {
+    (match style {
+        "simple" => ParameterStyle::Simple,
+        "label" => ParameterStyle::Label,
+        "matrix" => ParameterStyle::Matrix,
+        "form" => ParameterStyle::Form,
+        "spaceDelimited" => ParameterStyle::SpaceDelimited,
+        "pipeDelimited" => ParameterStyle::PipeDelimited,
+        "deepObject" => ParameterStyle::DeepObject,
         other => panic!("unsupported generated parameter style `{other}`"),
-    }
+    }) as u32
 }
 
-fn encoding_variant(encoding: &str) -> &'static str {
-    match encoding {
-        "json" => "BodyEncoding::Json",
-        "form" => "BodyEncoding::FormUrlEncoded",
-        "multipart" => "BodyEncoding::Multipart",
-        "text" => "BodyEncoding::Text",
-        "binary" => "BodyEncoding::Binary",
+fn encoding_code(encoding: &str) -> u32 {
+    (match encoding {
+        "json" => BodyEncoding::Json,
+        "form" => BodyEncoding::FormUrlEncoded,
+        "multipart" => BodyEncoding::Multipart,
+        "text" => BodyEncoding::Text,
+        "binary" => BodyEncoding::Binary,
         other => panic!("unsupported generated body encoding `{other}`"),
-    }
+    }) as u32
 }
 
 fn esc(value: &str) -> String {
@@ -192,10 +309,3 @@ fn esc(value: &str) -> String {
         output
     })
 }
-
-fn opt_str(value: &Option<String>) -> String {
-    value
-        .as_ref()
-        .map(|value| format!("Some(\"{}\")", esc(value)))
-        .unwrap_or_else(|| "None".to_string())
-}
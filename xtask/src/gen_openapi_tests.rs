@@ -204,10 +204,46 @@ fn extract_operations_marks_unsafe_representations_omitted() {
         .split("pub static OMITTED_OPERATIONS")
         .next()
         .unwrap();
-    assert!(!supported_table.contains("name: \"wild_upload\""));
+    assert!(!supported_table.contains("\"wild_upload\""));
     assert!(emitted.contains("OmittedOperationSpec { name: \"wild_upload\""));
 }
 
+#[test]
+fn emit_rust_lays_out_each_distinct_string_and_list_once() {
+    let body = json!({ "content": {
+        "application/json": { "schema": { "$ref": "#/components/schemas/Tag" } },
+        "text/json": { "schema": { "$ref": "#/components/schemas/Tag" } }
+    } });
+    let id =
+        json!([{ "name": "id", "in": "path", "required": true, "schema": { "type": "integer" } }]);
+    let spec = json!({
+        "paths": { "/tag/{id}": {
+            "put": { "operationId": "update_tag", "parameters": id, "requestBody": body, "responses": { "200": {} } },
+            "post": { "operationId": "replace_tag", "parameters": id, "requestBody": body, "responses": { "200": {} } }
+        } }
+    });
+    let ops = extract_operations(&spec).unwrap();
+    let emitted = emit_rust("inline", &ops, &[]);
+
+    let schema = "\"{\\\"$ref\\\":\\\"#/components/schemas/Tag\\\"}\",";
+    assert_eq!(emitted.matches(schema).count(), 1, "{emitted}");
+    assert_eq!(emitted.matches("\"id\",").count(), 1, "{emitted}");
+    // One name list, one parameter row and one two-row body list, shared by
+    // both operations.
+    let rows = |column: &str| {
+        let line = emitted
+            .lines()
+            .find(|line| line.trim_start().starts_with(column))
+            .unwrap();
+        line.matches('[').count() - 1
+    };
+    assert!(emitted.contains("names: &[2],"), "{emitted}");
+    assert_eq!(rows("parameters:"), 1, "{emitted}");
+    assert_eq!(rows("representations:"), 2, "{emitted}");
+    assert_eq!(rows("operations:"), 2, "{emitted}");
+    assert!(!emitted.contains("HttpMethod"), "{emitted}");
+}
+
 #[test]
 fn extract_operations_skips_phantom_path_params() {
     // Declared `in:path` param `path` with no `{path}` placeholder (the Servarr SPA
@@ -27,6 +27,12 @@ pub(super) const STATS_ENDPOINTS: &[EndpointRow] = &[
         endpoint: "`GET /api/v2?cmd=get_history[&start=&length=&user=]`",
         notes: "",
     },
+    EndpointRow {
+        action: "stats_history_summary",
+        tools: "tautulli",
+        endpoint: "`GET /api/v2?cmd=get_history&grouping=0&order_dir=desc&start=&length=1000` (new plays only)",
+        notes: "Aggregates from the local index `{data_dir}/history/{service}.jsonl`; `local=true` skips the sync. Needs a data dir.",
+    },
     EndpointRow {
         action: "stats_users",
         tools: "tautulli",
@@ -64,7 +70,7 @@ pub(super) const DOWNLOAD_ENDPOINTS: &[EndpointRow] = &[
         action: "download_queue",
         tools: "sabnzbd",
         endpoint: "`GET /api?mode=queue&output=json`",
-        notes: "qBittorrent uses `GET /api/v2/torrents/info`.",
+        notes: "qBittorrent uses `GET /api/v2/sync/maindata?rid=<n>`: the first read is a full snapshot, later reads merge only changed rows.",
     },
     EndpointRow {
         action: "download_add",
@@ -186,6 +192,12 @@ pub(super) const TRACE_ENDPOINTS: &[EndpointRow] = &[
         endpoint: "`GET /api/v1/public/history[?page=&pageSize=]`",
         notes: "",
     },
+    EndpointRow {
+        action: "trace_history_summary",
+        tools: "tracearr",
+        endpoint: "`GET /api/v1/public/history?page=&pageSize=100` (new sessions only)",
+        notes: "Aggregates from the local index `{data_dir}/history/{service}.jsonl`; `local=true` skips the sync. Needs a data dir.",
+    },
     EndpointRow {
         action: "trace_terminate_stream",
         tools: "tracearr",